@@ -172,10 +172,10 @@ class KnowledgeGraphBuilder:
 
         try:
             async with self.db_pool.acquire() as conn, conn.transaction():
-                # Get conversation
+                # Get conversation (messages live in conversation_messages)
                 row = await conn.fetchrow(
                     """
-                    SELECT messages, client_id, created_at
+                    SELECT conversation_messages_json(id) AS messages, client_id, created_at
                     FROM conversations
                     WHERE conversation_id = $1
                     """,
@@ -2,20 +2,124 @@
 Knowledge Graph Repository
 
 Responsibility: Database operations for knowledge graph (entities, relationships, queries).
+
+Query-time entity lookup (get_entity_context_for_query) is served from an
+in-memory EntityContextIndex: a gazetteer over entity names and canonical
+names plus the relationship types of each entity, shared by all repositories
+on the same pool, updated by upsert_entity/upsert_relationship and refreshed
+incrementally from the database.
 """
 
+import asyncio
 import json
 import logging
-from datetime import datetime
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
 from typing import Any
 
 import asyncpg
+from core.gazetteer import Gazetteer
 
 logger = logging.getLogger(__name__)
 
 # Constants
 DEFAULT_TOP_N = 20
 DEFAULT_TOP_K = 10
+CONTEXT_INDEX_REFRESH_INTERVAL = 300  # Seconds between reloads of rows written elsewhere
+CONTEXT_INDEX_REFRESH_OVERLAP = timedelta(seconds=5)  # Re-read window for late-committing writes
+
+
+class EntityContextIndex:
+    """
+    In-memory entity gazetteer with precomputed relationship types.
+
+    Finding the entities mentioned in a query is one pass over the query's
+    tokens, with no database round-trip.
+    """
+
+    def __init__(self):
+        self.gazetteer = Gazetteer()
+        self.entities: dict[Any, dict[str, Any]] = {}
+        self.relationship_types: dict[Any, set[str]] = defaultdict(set)
+        self.entities_since: datetime | None = None  # Max last_seen_at loaded
+        self.relationships_since: datetime | None = None  # Max relationship updated_at loaded
+        self.checked_at = 0.0  # time.monotonic() of the last refresh, 0 = never loaded
+        self.lock = asyncio.Lock()
+
+    def is_fresh(self) -> bool:
+        """Loaded and refreshed within CONTEXT_INDEX_REFRESH_INTERVAL."""
+        return bool(self.checked_at) and (
+            time.monotonic() - self.checked_at < CONTEXT_INDEX_REFRESH_INTERVAL
+        )
+
+    def add_entity(
+        self,
+        entity_id: Any,
+        entity_type: str,
+        name: str,
+        canonical_name: str | None,
+        metadata: Any,
+        mention_count: int | None,
+    ) -> None:
+        self.entities[entity_id] = {
+            "entity_id": entity_id,
+            "type": entity_type,
+            "name": name,
+            "canonical_name": canonical_name,
+            "metadata": metadata,
+            "mentions": mention_count,
+        }
+        self.gazetteer.add(entity_id, (name, canonical_name))
+
+    def add_relationship_types(self, entity_id: Any, relationship_types: list[str]) -> None:
+        self.relationship_types[entity_id].update(t for t in relationship_types if t)
+
+    def load(self, entity_rows: list, relationship_rows: list, compile_names: bool = True) -> None:
+        """Apply kg_entities rows and per-entity relationship type rows."""
+        for row in entity_rows:
+            self.add_entity(
+                row["id"],
+                row["type"],
+                row["name"],
+                row["canonical_name"],
+                row["metadata"],
+                row["mention_count"],
+            )
+        for row in relationship_rows:
+            self.add_relationship_types(row["entity_id"], row["relationship_types"] or [])
+        if compile_names and self.gazetteer.pending:
+            self.gazetteer.compile()
+
+    def replace(self, other: "EntityContextIndex") -> None:
+        """Swap in the contents of a freshly loaded index."""
+        self.gazetteer = other.gazetteer
+        self.entities = other.entities
+        self.relationship_types = other.relationship_types
+
+    def match(self, query: str, limit: int) -> list[dict[str, Any]]:
+        """Entities mentioned in query, most mentioned first."""
+        found = [self.entities[key] for key in self.gazetteer.find(query) if key in self.entities]
+        found.sort(key=lambda entity: entity["mentions"] or 0, reverse=True)
+        return [
+            {
+                **entity,
+                "relationships": sorted(self.relationship_types.get(entity["entity_id"], ())),
+            }
+            for entity in found[:limit]
+        ]
+
+
+# One index per pool, so the builder's upserts are visible to the memory orchestrator
+_CONTEXT_INDEXES: dict[int, tuple[asyncpg.Pool, EntityContextIndex]] = {}
+
+
+def _context_index_for(db_pool: asyncpg.Pool) -> EntityContextIndex:
+    entry = _CONTEXT_INDEXES.get(id(db_pool))
+    if entry is None or entry[0] is not db_pool:
+        entry = (db_pool, EntityContextIndex())
+        _CONTEXT_INDEXES[id(db_pool)] = entry
+    return entry[1]
 
 
 class KnowledgeGraphRepository:
@@ -29,6 +133,7 @@ class KnowledgeGraphRepository:
             db_pool: AsyncPG connection pool
         """
         self.db_pool = db_pool
+        self.context_index = _context_index_for(db_pool)
 
     async def upsert_entity(
         self,
@@ -60,7 +165,7 @@ class KnowledgeGraphRepository:
                 mention_count = kg_entities.mention_count + 1,
                 last_seen_at = NOW(),
                 metadata = kg_entities.metadata || EXCLUDED.metadata
-            RETURNING id
+            RETURNING id, mention_count, metadata
             """,
             entity_type,
             name,
@@ -68,7 +173,18 @@ class KnowledgeGraphRepository:
             json.dumps(metadata),
         )
 
-        return row["id"] if row else 0
+        if not row:
+            return 0
+        existing = self.context_index.entities.get(row["id"])
+        self.context_index.add_entity(
+            row["id"],
+            entity_type,
+            existing["name"] if existing else name,  # Name is kept on conflict
+            canonical_name,
+            row["metadata"],
+            row["mention_count"],
+        )
+        return row["id"]
 
     async def upsert_relationship(
         self,
@@ -113,6 +229,8 @@ class KnowledgeGraphRepository:
             evidence,
             json.dumps([source_ref]),
         )
+        self.context_index.add_relationship_types(source_id, [rel_type])
+        self.context_index.add_relationship_types(target_id, [rel_type])
 
     async def add_entity_mention(
         self,
@@ -311,63 +429,6 @@ class KnowledgeGraphRepository:
             logger.warning(f"Error getting user related entities: {e}")
             return []
 
-    async def get_entity_context_for_query(
-        self, query: str, limit: int = 5
-    ) -> list[dict[str, Any]]:
-        """
-        Get relevant entities for a query to enrich AI context.
-
-        Args:
-            query: User's query text
-            limit: Maximum entities to return
-
-        Returns:
-            List of relevant entities with descriptions
-        """
-        try:
-            async with self.db_pool.acquire() as conn:
-                # Text-based search (can be enhanced with embeddings)
-                query_pattern = f"%{query}%"
-                rows = await conn.fetch(
-                    """
-                    SELECT
-                        e.id,
-                        e.type,
-                        e.name,
-                        e.canonical_name,
-                        e.metadata,
-                        e.mention_count,
-                        array_agg(DISTINCT r.relationship_type) as relationship_types
-                    FROM kg_entities e
-                    LEFT JOIN kg_relationships r ON e.id = r.source_entity_id OR e.id = r.target_entity_id
-                    WHERE
-                        e.name ILIKE $1
-                        OR e.canonical_name ILIKE $1
-                    GROUP BY e.id, e.type, e.name, e.canonical_name, e.metadata, e.mention_count
-                    ORDER BY e.mention_count DESC
-                    LIMIT $2
-                    """,
-                    query_pattern,
-                    limit,
-                )
-
-                return [
-                    {
-                        "entity_id": row["id"],
-                        "type": row["type"],
-                        "name": row["name"],
-                        "canonical_name": row["canonical_name"],
-                        "metadata": row["metadata"],
-                        "mentions": row["mention_count"],
-                        "relationships": row["relationship_types"] or [],
-                    }
-                    for row in rows
-                ]
-
-        except Exception as e:
-            logger.warning(f"Error getting entity context: {e}")
-            return []
-
     async def semantic_search_entities(
         self, query: str, top_k: int = DEFAULT_TOP_K
     ) -> list[dict[str, Any]]:
@@ -516,6 +577,9 @@ class KnowledgeGraphRepository:
         """
         Get relevant entities for a query to enrich AI context.
 
+        Matches every known entity name or canonical name mentioned in the
+        query against the in-memory context index (no table scan per query).
+
         Args:
             query: User's query text
             limit: Maximum entities to return
@@ -524,45 +588,92 @@ class KnowledgeGraphRepository:
             List of relevant entities with descriptions
         """
         try:
+            await self.refresh_context_index()
+            return self.context_index.match(query, limit)
+
+        except Exception as e:
+            logger.warning(f"Error getting entity context: {e}")
+            return []
+
+    async def refresh_context_index(self, force: bool = False) -> None:
+        """
+        Load entities and relationship types written since the last refresh.
+
+        The first call loads everything; later calls (at most every
+        CONTEXT_INDEX_REFRESH_INTERVAL seconds unless forced) read only rows
+        with a newer last_seen_at/updated_at. An entity count that no longer
+        matches (deletes, rolled-back upserts) triggers a full reload.
+
+        Args:
+            force: Refresh even if the interval has not elapsed
+        """
+        index = self.context_index
+        if not force and index.is_fresh():
+            return
+
+        async with index.lock:
+            if not force and index.is_fresh():
+                return  # Refreshed while waiting for the lock
+
+            full = not index.checked_at
             async with self.db_pool.acquire() as conn:
-                # Text-based search (can be enhanced with embeddings)
-                query_pattern = f"%{query}%"
-                rows = await conn.fetch(
+                if not full:
+                    total = await conn.fetchval("SELECT COUNT(*) FROM kg_entities")
+                    full = total != len(index.entities)
+
+                target = EntityContextIndex() if full else index
+                entities_since = None if full else index.entities_since
+                relationships_since = None if full else index.relationships_since
+                entity_rows = await conn.fetch(
                     """
-                    SELECT
-                        e.id,
-                        e.type,
-                        e.name,
-                        e.canonical_name,
-                        e.metadata,
-                        e.mention_count,
-                        array_agg(DISTINCT r.relationship_type) FILTER (WHERE r.relationship_type IS NOT NULL) as relationship_types
-                    FROM kg_entities e
-                    LEFT JOIN kg_relationships r ON e.id = r.source_entity_id OR e.id = r.target_entity_id
-                    WHERE
-                        e.name ILIKE $1
-                        OR e.canonical_name ILIKE $1
-                    GROUP BY e.id, e.type, e.name, e.canonical_name, e.metadata, e.mention_count
-                    ORDER BY e.mention_count DESC
-                    LIMIT $2
+                    SELECT id, type, name, canonical_name, metadata, mention_count, last_seen_at
+                    FROM kg_entities
+                    WHERE $1::timestamp IS NULL OR last_seen_at > $1::timestamp
                     """,
-                    query_pattern,
-                    limit,
+                    entities_since - CONTEXT_INDEX_REFRESH_OVERLAP if entities_since else None,
+                )
+                relationship_rows = await conn.fetch(
+                    """
+                    SELECT entity_id,
+                           array_agg(DISTINCT relationship_type) AS relationship_types,
+                           MAX(updated_at) AS updated_at
+                    FROM (
+                        SELECT source_entity_id AS entity_id, relationship_type, updated_at
+                        FROM kg_relationships
+                        WHERE $1::timestamp IS NULL OR updated_at > $1::timestamp
+                        UNION ALL
+                        SELECT target_entity_id, relationship_type, updated_at
+                        FROM kg_relationships
+                        WHERE $1::timestamp IS NULL OR updated_at > $1::timestamp
+                    ) r
+                    GROUP BY entity_id
+                    """,
+                    relationships_since - CONTEXT_INDEX_REFRESH_OVERLAP
+                    if relationships_since
+                    else None,
                 )
 
-                return [
-                    {
-                        "entity_id": row["id"],  # VARCHAR(64)
-                        "type": row["type"],
-                        "name": row["name"],
-                        "canonical_name": row["canonical_name"],
-                        "metadata": row["metadata"],
-                        "mentions": row["mention_count"],
-                        "relationships": row["relationship_types"] or [],
-                    }
-                    for row in rows
-                ]
+            if full:
+                # Building a fresh index takes seconds for large graphs: keep it off the loop
+                await asyncio.to_thread(target.load, entity_rows, relationship_rows)
+                index.replace(target)
+            else:
+                index.load(entity_rows, relationship_rows, compile_names=False)
+                if index.gazetteer.pending:
+                    await asyncio.to_thread(index.gazetteer.compile)
+
+            index.entities_since = max(
+                (row["last_seen_at"] for row in entity_rows if row["last_seen_at"]),
+                default=entities_since,
+            )
+            index.relationships_since = max(
+                (row["updated_at"] for row in relationship_rows if row["updated_at"]),
+                default=relationships_since,
+            )
+            index.checked_at = time.monotonic()
 
-        except Exception as e:
-            logger.warning(f"Error getting entity context: {e}")
-            return []
+            if full:
+                logger.info(
+                    f"🕸️ KG context index loaded: {len(index.entities)} entities, "
+                    f"{len(index.gazetteer)} names"
+                )
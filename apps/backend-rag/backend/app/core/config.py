@@ -40,6 +40,7 @@ class Settings(BaseSettings):
     def resolve_google_credentials(cls, v):
         """Resolve Google credentials from multiple env vars."""
         import os
+
         if v:
             return v
         # Check GEMINI_SA_TOKEN as fallback
@@ -47,6 +48,7 @@ class Settings(BaseSettings):
         if gemini_token:
             return gemini_token
         return None
+
     google_imagen_api_key: str | None = (
         None  # Set via GOOGLE_IMAGEN_API_KEY env var (for Imagen image generation)
     )
@@ -54,6 +56,12 @@ class Settings(BaseSettings):
     stability_api_key: str | None = None  # Set via STABILITY_API_KEY env var (for Stability AI)
     embedding_model: str = "text-embedding-3-small"
     embedding_dimensions: int = 1536  # Matches migrated collections
+    embedding_batch_window_ms: float = 5.0  # Coalescing window for concurrent query embeddings
+    embedding_max_batch_size: int = 64  # Flush a micro-batch early at this many texts
+    embedding_cache_enabled: bool = True  # Content-addressed cache for query/chunk embeddings
+    embedding_cache_size: int = 10000  # In-process LRU tier (entries)
+    embedding_cache_ttl: int = 604800  # Redis/disk tier TTL in seconds (7 days)
+    embedding_cache_dir: str | None = None  # On-disk tier when Redis is unavailable
 
     @field_validator("openai_api_key", mode="before")
     @classmethod
@@ -100,6 +108,10 @@ class Settings(BaseSettings):
     zantara_ai_cost_output: float = 0.60  # Cost per 1M output tokens (GPT-4o-mini)
     openrouter_api_key: str | None = None  # Set via OPENROUTER_API_KEY env var (free AI fallback)
     deepseek_api_key: str | None = Field(default=None, description="DeepSeek API Key")
+    # Gemini context caching of the stable system prompt prefix (persona, rules, tools)
+    gemini_context_cache_enabled: bool = True
+    gemini_context_cache_ttl: int = 3600  # Seconds; handles are renewed while in use
+    gemini_context_cache_min_chars: int = 8000  # Shorter prefixes are sent inline
 
     # ========================================
     # QDRANT VECTOR DATABASE
@@ -136,6 +148,13 @@ class Settings(BaseSettings):
 
     qdrant_api_key: str | None = None  # Set via QDRANT_API_KEY env var
     qdrant_collection_name: str = "knowledge_base"
+    qdrant_upsert_transport: str = "rest"  # "rest" (JSON) or "grpc" (packed float32, port below)
+    qdrant_grpc_port: int = 6334
+    # Upsert batches in flight at once; > 1 pipelines uploads with wait=false + final check
+    qdrant_upsert_max_in_flight: int = 1
+    # Storage profile per collection/alias (float32, scalar_int8, binary), set after
+    # migrations/migration_030_collection_profiles.py switched the collection; JSON via env
+    qdrant_collection_profiles: dict[str, str] = {}
 
     # ========================================
     # CHUNKING CONFIGURATION
@@ -160,6 +179,9 @@ class Settings(BaseSettings):
     timeout_tool_execution: float = 30.0  # Tool execution timeout
     timeout_streaming: float = 120.0  # Streaming timeout
     timeout_internal_api: float = 5.0  # Internal API calls timeout
+    timeout_drive_request: float = 20.0  # Drive lookup + download per Smart Oracle request
+    timeout_memory_context_source: float = 1.5  # Per-source deadline for user context assembly
+    memory_context_cache_ttl: float = 30.0  # TTL of cached user context sources (seconds)
     latency_alert_threshold_ms: float = 20000.0  # Alert if request takes longer than 20s
 
     # ========================================
@@ -177,6 +199,13 @@ class Settings(BaseSettings):
     reranker_rate_limit_per_hour: int = 1000
     reranker_overfetch_count: int = 20
     reranker_return_count: int = 5
+    reranker_backend: str = "auto"  # auto | zerank | local | none (see core/reranker.py)
+    reranker_onnx_model_path: str | None = None  # Dir with quantized ONNX model + tokenizer.json
+    reranker_onnx_model_file: str = "model_quantized.onnx"
+    reranker_max_tokens: int = 256  # Token budget per (query, document) pair
+    reranker_max_batch_size: int = 32  # Local cross-encoder batch size
+    reranker_batch_window_ms: float = 2.0  # Coalescing window for concurrent rerank calls
+    reranker_num_threads: int = 2  # ONNX Runtime intra-op threads
 
     # ZeroEntropy Re-ranker Configuration (External API)
     zerank_api_key: str | None = Field(
@@ -216,6 +245,16 @@ class Settings(BaseSettings):
         default=0.75,
         description="BM25 document length normalization parameter. Set via BM25_B env var.",
     )
+    bm25_corpus_stats_enabled: bool = Field(
+        default=True,
+        description="Track per-collection BM25 document frequencies and lengths for IDF/avgdl. "
+        "Set via BM25_CORPUS_STATS_ENABLED env var.",
+    )
+    bm25_corpus_stats_dir: str | None = Field(
+        default=None,
+        description="Directory for persisted BM25 corpus statistics (None keeps them in memory). "
+        "Set via BM25_CORPUS_STATS_DIR env var.",
+    )
     hybrid_dense_weight: float = Field(
         default=0.7,
         description="Weight for dense vectors in hybrid search (0-1). Set via HYBRID_DENSE_WEIGHT env var.",
@@ -547,6 +586,10 @@ class Settings(BaseSettings):
         ),
     )
     oracle_api_key: str | None = None  # Set via ORACLE_API_KEY env var
+    # Smart Oracle local document cache (Drive PDFs + extracted text)
+    document_cache_dir: str | None = None  # Defaults to <tempdir>/zantara_documents
+    document_cache_max_bytes: int = 2 * 1024**3  # On-disk LRU budget (PDFs + text)
+    document_cache_name_ttl: int = 86400  # Re-resolve filename -> Drive file id after (s)
 
     # ========================================
     # ADMIN CONFIGURATION
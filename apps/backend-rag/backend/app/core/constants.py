@@ -59,6 +59,9 @@ class MemoryConstants:
 
     MAX_FACTS = 10  # Maximum profile facts per user
     MAX_SUMMARY_LENGTH = 500  # Maximum conversation summary length
+    CACHE_MAX_USERS = 5000  # Users kept in the in-process memory cache (LRU)
+    CACHE_MAX_BYTES = 32 * 1024 * 1024  # Approximate byte bound of the memory cache
+    CACHE_TTL = 900  # Seconds before cached memory is reloaded from PostgreSQL
 
 
 # ============================================================================
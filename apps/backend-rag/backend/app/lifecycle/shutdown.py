@@ -9,6 +9,7 @@ import inspect
 import logging
 from contextlib import suppress
 
+from core.reranker import close_reranker_http_client
 from fastapi import FastAPI
 
 from services.health_monitor import HealthMonitor
@@ -65,6 +66,7 @@ def register_shutdown_handlers(app: FastAPI) -> None:
 
         # Close HTTP clients
         # HandlerProxyService removed - no cleanup needed
+        await close_reranker_http_client()
         logger.info("✅ HTTP clients closed")
 
         logger.info("✅ ZANTARA shutdown complete")
@@ -64,6 +64,46 @@ rag_parallel_searches = Counter(
     "zantara_rag_parallel_searches_total", "Parallel collection searches executed"
 )
 
+# Memory Context Metrics (per-source latency of MemoryOrchestrator.get_user_context)
+memory_context_source_duration = Histogram(
+    "zantara_memory_context_source_duration_seconds",
+    "User context source fetch duration",
+    ["source", "outcome"],
+)
+
+# LLM Context Cache Metrics (Gemini cached content for the stable system prompt prefix)
+llm_prompt_tokens = Counter("zantara_llm_prompt_tokens_total", "LLM prompt tokens", ["model"])
+llm_cached_prompt_tokens = Counter(
+    "zantara_llm_cached_prompt_tokens_total",
+    "LLM prompt tokens served from provider context cache",
+    ["model"],
+)
+llm_context_cache_operations = Counter(
+    "zantara_llm_context_cache_operations_total",
+    "Context cache handle operations (hit, create, renew, error)",
+    ["operation"],
+)
+
+# In-process LRU Cache Metrics (core.cache.LRUCache instances created with a name)
+local_cache_events = Counter(
+    "zantara_local_cache_events_total",
+    "In-process cache events (hits, misses, evictions, expirations, invalidations)",
+    ["cache", "event"],
+)
+local_cache_bytes = Gauge(
+    "zantara_local_cache_bytes", "Approximate bytes held by in-process cache", ["cache"]
+)
+local_cache_entries = Gauge(
+    "zantara_local_cache_entries", "Entries held by in-process cache", ["cache"]
+)
+
+# Embedding Cache Metrics
+embedding_cache_hits = Counter(
+    "zantara_embedding_cache_hits_total", "Embedding cache hits", ["tier"]
+)
+embedding_cache_misses = Counter("zantara_embedding_cache_misses_total", "Embedding cache misses")
+embedding_cache_hit_rate = Gauge("zantara_embedding_cache_hit_rate", "Embedding cache hit rate")
+
 # Boot time tracking
 BOOT_TIME = time.time()
 
@@ -117,6 +117,7 @@ class HealthResponse(BaseModel):
     version: str
     database: dict[str, Any]
     embeddings: dict[str, Any]
+    startup: dict[str, Any] | None = None  # Per-initializer startup timeline
 
 
 class UserProfile(BaseModel):
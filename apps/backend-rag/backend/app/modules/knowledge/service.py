@@ -10,6 +10,7 @@ Migration path:
 - For /api/search endpoint, use get_search_service(request) helper in router.py
 """
 
+import asyncio
 import logging
 from typing import Any
 
@@ -149,7 +150,7 @@ class KnowledgeService:
         """
         try:
             # Generate query embedding
-            query_embedding = self.embedder.generate_query_embedding(query)
+            query_embedding = await asyncio.to_thread(self.embedder.generate_query_embedding, query)
 
             logger.debug(
                 f"Query: '{query[:50]}...', embedding_dim={len(query_embedding)}, provider={self.embedder.provider}"
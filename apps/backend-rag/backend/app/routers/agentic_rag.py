@@ -59,9 +59,8 @@ class AgenticQueryRequest(BaseModel):
     enable_vision: bool | None = False
     session_id: str | None = None
     conversation_id: int | None = None
-    conversation_history: list[
-        ConversationMessageInput
-    ] | None = None  # Direct history from frontend
+    # Direct history from frontend
+    conversation_history: list[ConversationMessageInput] | None = None
 
 
 class AgenticQueryResponse(BaseModel):
@@ -151,7 +150,9 @@ async def query_agentic_rag(
         logger.error(f"❌ Error in query_agentic_rag: {str(e)}\n{tb}")
         # Temporarily include traceback in response for debugging
         # Generic error message for production
-        raise HTTPException(status_code=500, detail="Internal Server Error: The request could not be processed.") from e
+        raise HTTPException(
+            status_code=500, detail="Internal Server Error: The request could not be processed."
+        ) from e
 
 
 async def get_conversation_history_for_agentic(
@@ -206,7 +207,7 @@ async def get_conversation_history_for_agentic(
             if conversation_id:
                 row = await conn.fetchrow(
                     """
-                    SELECT messages
+                    SELECT conversation_messages_json(id) AS messages
                     FROM conversations
                     WHERE id = $1 AND user_id = $2
                     ORDER BY created_at DESC
@@ -218,7 +219,7 @@ async def get_conversation_history_for_agentic(
             elif session_id:
                 row = await conn.fetchrow(
                     """
-                    SELECT messages
+                    SELECT conversation_messages_json(id) AS messages
                     FROM conversations
                     WHERE session_id = $1
                     ORDER BY created_at DESC
@@ -230,7 +231,7 @@ async def get_conversation_history_for_agentic(
                 # Get most recent conversation
                 row = await conn.fetchrow(
                     """
-                    SELECT messages
+                    SELECT conversation_messages_json(id) AS messages
                     FROM conversations
                     WHERE user_id = $1
                     ORDER BY created_at DESC
@@ -277,8 +278,7 @@ async def stream_agentic_rag(
     authenticated_user_id = current_user.get("email") or current_user.get("user_id")
 
     logger.info(
-        f"🔐 Authenticated user: {authenticated_user_id} "
-        f"(role: {current_user.get('role', 'user')})"
+        f"🔐 Authenticated user: {authenticated_user_id} (role: {current_user.get('role', 'user')})"
     )
     # Get correlation ID from request state (set by RequestTracingMiddleware)
     correlation_id = (
@@ -329,7 +329,9 @@ async def stream_agentic_rag(
                 )
 
             # Priority 2: Try to retrieve from database if no frontend history
-            elif authenticated_user_id and (request_body.conversation_id or request_body.session_id):
+            elif authenticated_user_id and (
+                request_body.conversation_id or request_body.session_id
+            ):
                 logger.info(
                     f"🔍 Retrieving conversation history from DB: conversation_id={request_body.conversation_id}, "
                     f"session_id={request_body.session_id}, user_id={authenticated_user_id} "
@@ -7,6 +7,8 @@ SECURITY: All endpoints require JWT authentication (added 2025-12-03)
 User identity is taken from JWT token, NOT from request parameters.
 
 Refactored: Migrated to asyncpg with connection pooling (2025-12-07)
+Messages are stored append-only in conversation_messages; /list reads the
+materialized summary on conversations (see services.conversation_service)
 """
 
 from datetime import datetime
@@ -18,6 +20,11 @@ from pydantic import BaseModel
 from app.dependencies import get_current_user, get_database_pool
 from app.utils.error_handlers import handle_database_error
 from app.utils.logging_utils import get_logger, log_error, log_success, log_warning
+from services.conversation_service import (
+    append_messages,
+    fetch_recent_messages,
+    message_from_row,
+)
 from services.memory import MemoryOrchestrator
 from services.memory_fallback import get_memory_cache
 
@@ -80,6 +87,7 @@ class ConversationHistoryResponse(BaseModel):
     messages: list[dict] = []
     total_messages: int = 0
     session_id: str | None = None
+    next_before_seq: int | None = None  # Cursor for the page of older messages
     error: str | None = None
 
 
@@ -211,30 +219,19 @@ async def save_conversation(
     try:
         if db_pool:
             async with db_pool.acquire() as conn:
-                # Insert conversation
-                row = await conn.fetchrow(
-                    """
-                    INSERT INTO conversations (user_id, session_id, messages, metadata, created_at)
-                    VALUES ($1, $2, $3, $4, $5)
-                    RETURNING id
-                    """,
-                    user_email,
-                    session_id,
-                    request.messages,
-                    request.metadata or {},
-                    datetime.now(),
+                # Append only the messages not stored yet
+                conversation_id, appended = await append_messages(
+                    conn, user_email, session_id, request.messages, request.metadata
+                )
+                db_success = True
+                log_success(
+                    logger,
+                    "Saved conversation to DB",
+                    conversation_id=conversation_id,
+                    user_email=user_email,
+                    messages_count=len(request.messages),
+                    messages_appended=appended,
                 )
-
-                if row:
-                    conversation_id = row["id"]
-                    db_success = True
-                    log_success(
-                        logger,
-                        "Saved conversation to DB",
-                        conversation_id=conversation_id,
-                        user_email=user_email,
-                        messages_count=len(request.messages),
-                    )
         else:
             logger.warning("⚠️ DB Pool unavailable, skipping DB save")
 
@@ -302,6 +299,9 @@ async def save_conversation(
 async def get_conversation_history(
     limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
     session_id: str | None = Query(None, description="Optional session filter"),
+    before_seq: int | None = Query(
+        None, ge=1, description="Return messages older than this cursor (next_before_seq)"
+    ),
     current_user: dict = Depends(get_current_user),
     db_pool: asyncpg.Pool | None = Depends(get_database_pool),
 ) -> ConversationHistoryResponse:
@@ -313,6 +313,7 @@ async def get_conversation_history(
     Query params:
     - limit: Max number of messages to return (default: 20)
     - session_id: Optional session filter
+    - before_seq: Keyset cursor for older messages (from next_before_seq)
     """
     # Get user email from JWT token (prevents spoofing)
     user_email = current_user["email"]
@@ -320,40 +321,22 @@ async def get_conversation_history(
     messages = []
     session_id_result = session_id
     total_messages = 0
+    next_before_seq = None
     source = "db"
 
-    # Try DB first
+    # Try DB first: only the requested page of the latest conversation is read
     if db_pool:
         try:
             async with db_pool.acquire() as conn:
-                # Get most recent conversation for user
-                if session_id:
-                    row = await conn.fetchrow(
-                        """
-                        SELECT messages, created_at, session_id
-                        FROM conversations
-                        WHERE user_id = $1 AND session_id = $2
-                        ORDER BY created_at DESC
-                        LIMIT 1
-                        """,
-                        user_email,
-                        session_id,
-                    )
-                else:
-                    row = await conn.fetchrow(
-                        """
-                        SELECT messages, created_at, session_id
-                        FROM conversations
-                        WHERE user_id = $1
-                        ORDER BY created_at DESC
-                        LIMIT 1
-                        """,
-                        user_email,
-                    )
+                page = await fetch_recent_messages(
+                    conn, user_email, limit=limit, session_id=session_id, before_seq=before_seq
+                )
 
-                if row:
-                    messages = row.get("messages", [])
-                    session_id_result = row.get("session_id")
+                if page:
+                    messages = page["messages"]
+                    session_id_result = page["session_id"]
+                    total_messages = page["total"]
+                    next_before_seq = page["next_before_seq"]
                     log_success(
                         logger,
                         "Retrieved conversation history from DB",
@@ -365,12 +348,13 @@ async def get_conversation_history(
             # Fallback to memory cache below
 
     # Fallback to memory cache if DB failed or returned nothing (and we have a session_id)
-    if not messages and session_id:
+    if not messages and session_id and before_seq is None:
         try:
             mem_cache = get_memory_cache()
             messages = mem_cache.get_messages(session_id, limit=limit)
             if messages:
                 source = "memory"
+                total_messages = len(messages)
                 log_success(
                     logger,
                     "Retrieved conversation history from Memory Cache",
@@ -381,7 +365,7 @@ async def get_conversation_history(
             logger.warning(f"⚠️ Memory cache retrieval failed: {e}")
 
     # Limit messages if needed
-    total_messages = len(messages)
+    total_messages = max(total_messages, len(messages))
     if len(messages) > limit:
         messages = messages[-limit:]
 
@@ -390,6 +374,7 @@ async def get_conversation_history(
         messages=messages,
         total_messages=total_messages,
         session_id=session_id_result,
+        next_before_seq=next_before_seq,
     )
 
 
@@ -467,7 +452,7 @@ async def get_conversation_stats(
                 """
                 SELECT
                     COUNT(*) as total_conversations,
-                    SUM(jsonb_array_length(messages)) as total_messages,
+                    SUM(message_count) as total_messages,
                     MAX(created_at) as last_conversation
                 FROM conversations
                 WHERE user_id = $1
@@ -529,13 +514,14 @@ async def list_conversations(
             )
             total = count_row["total"] if count_row else 0
 
-            # Get conversations ordered by most recent
+            # Get conversations ordered by most recent activity (materialized summary, no messages)
             rows = await conn.fetch(
                 """
-                SELECT id, session_id, messages, metadata, created_at
+                SELECT id, session_id, title, last_message_preview, message_count,
+                       created_at, updated_at
                 FROM conversations
                 WHERE user_id = $1
-                ORDER BY created_at DESC
+                ORDER BY COALESCE(updated_at, created_at) DESC
                 LIMIT $2 OFFSET $3
                 """,
                 user_email,
@@ -543,36 +529,18 @@ async def list_conversations(
                 offset,
             )
 
-            conversations = []
-            for row in rows:
-                messages = row["messages"] or []
-
-                # Extract title from first user message
-                title = "New Conversation"
-                preview = ""
-                for msg in messages:
-                    if msg.get("role") == "user":
-                        content = msg.get("content", "")
-                        title = content[:50] + "..." if len(content) > 50 else content
-                        break
-
-                # Extract preview from last assistant message
-                for msg in reversed(messages):
-                    if msg.get("role") == "assistant":
-                        content = msg.get("content", "")
-                        preview = content[:100] + "..." if len(content) > 100 else content
-                        break
-
-                conversations.append(
-                    ConversationListItem(
-                        id=row["id"],
-                        title=title or "New Conversation",
-                        preview=preview,
-                        message_count=len(messages),
-                        created_at=row["created_at"].isoformat(),
-                        session_id=row["session_id"],
-                    )
+            conversations = [
+                ConversationListItem(
+                    id=row["id"],
+                    title=row["title"] or "New Conversation",
+                    preview=row["last_message_preview"] or "",
+                    message_count=row["message_count"] or 0,
+                    created_at=row["created_at"].isoformat(),
+                    updated_at=row["updated_at"].isoformat() if row["updated_at"] else None,
+                    session_id=row["session_id"],
                 )
+                for row in rows
+            ]
 
             log_success(
                 logger,
@@ -610,7 +578,7 @@ async def get_conversation(
         async with db_pool.acquire() as conn:
             row = await conn.fetchrow(
                 """
-                SELECT id, session_id, messages, metadata, created_at
+                SELECT id, session_id, metadata, created_at
                 FROM conversations
                 WHERE id = $1 AND user_id = $2
                 """,
@@ -624,7 +592,16 @@ async def get_conversation(
                     detail=f"Conversation {conversation_id} not found",
                 )
 
-            messages = row["messages"] or []
+            message_rows = await conn.fetch(
+                """
+                SELECT seq, role, content, extra
+                FROM conversation_messages
+                WHERE conversation_id = $1
+                ORDER BY seq
+                """,
+                conversation_id,
+            )
+            messages = [message_from_row(message_row) for message_row in message_rows]
 
             log_success(
                 logger,
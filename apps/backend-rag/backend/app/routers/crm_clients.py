@@ -10,6 +10,7 @@ from typing import Any
 
 import asyncpg
 from core.cache import cached
+from core.text_search import like_pattern
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request
 from pydantic import BaseModel, EmailStr, field_validator
 
@@ -249,12 +250,12 @@ async def list_clients(
                 param_index += 1
 
             if search:
-                search_pattern = f"%{search}%"
+                # Served by the trigram GIN indexes on these columns (migration 029)
                 query_parts.append(
-                    f" AND (full_name ILIKE ${param_index} OR email ILIKE ${param_index + 1} OR phone ILIKE ${param_index + 2})"
+                    f" AND (full_name ILIKE ${param_index} OR email ILIKE ${param_index} OR phone ILIKE ${param_index})"
                 )
-                params.extend([search_pattern, search_pattern, search_pattern])
-                param_index += 3
+                params.append(like_pattern(search))
+                param_index += 1
 
             query_parts.append(
                 f" ORDER BY created_at DESC LIMIT ${param_index} OFFSET ${param_index + 1}"
@@ -539,7 +539,7 @@ async def create_interaction_from_conversation(
 
             # Get conversation from conversations table
             conv_row = await conn.fetchrow(
-                "SELECT messages FROM conversations WHERE id = $1",
+                "SELECT conversation_messages_json(id) AS messages FROM conversations WHERE id = $1",
                 conversation_id,
             )
 
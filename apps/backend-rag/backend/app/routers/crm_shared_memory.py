@@ -8,6 +8,7 @@ Refactored: Migrated to asyncpg with connection pooling (2025-12-07)
 
 import asyncpg
 from core.cache import cached
+from core.text_search import like_pattern
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request
 
 from app.dependencies import get_database_pool
@@ -129,9 +130,9 @@ async def search_shared_memory(
                         f"Detected: Client search for '{' '.join(name_parts)}'"
                     )
 
-                    search_pattern = f"%{' '.join(name_parts)}%"
+                    name = " ".join(name_parts)
 
-                    # Search clients
+                    # Search clients (substring or fuzzy name match, best match first)
                     client_rows = await conn.fetch(
                         """
                         SELECT
@@ -140,12 +141,13 @@ async def search_shared_memory(
                             COUNT(DISTINCT CASE WHEN p.status IN ('inquiry', 'in_progress', 'waiting_documents', 'submitted_to_gov') THEN p.id END) as active_practices
                         FROM clients c
                         LEFT JOIN practices p ON c.id = p.client_id
-                        WHERE c.full_name ILIKE $1 OR c.email ILIKE $2
+                        WHERE c.full_name ILIKE $1 OR c.email ILIKE $1 OR c.full_name % $2
                         GROUP BY c.id
+                        ORDER BY similarity(c.full_name, $2) DESC
                         LIMIT $3
                         """,
-                        search_pattern,
-                        search_pattern,
+                        like_pattern(name),
+                        name,
                         limit,
                     )
 
@@ -2,7 +2,7 @@
 ZANTARA RAG - Health Check Router
 
 Provides health check endpoints for monitoring service status:
-- /health - Basic health check for load balancers
+- /health - Basic health check for load balancers (with startup timeline)
 - /health/detailed - Comprehensive service status for debugging
 """
 
@@ -59,6 +59,17 @@ async def get_qdrant_stats() -> dict[str, Any]:
         return {"collections": 0, "total_documents": 0, "error": str(e)}
 
 
+def _startup_timeline(request: Request) -> dict[str, Any] | None:
+    """Per-initializer timeline of the service startup graph, if it has run."""
+    try:
+        graph = getattr(request.app.state, "startup_graph", None)
+        timeline = graph.timeline() if graph is not None else None
+    except Exception as e:
+        logger.warning(f"Failed to read startup timeline: {e}")
+        return None
+    return timeline if isinstance(timeline, dict) else None
+
+
 router = APIRouter(prefix="/health", tags=["health"])
 
 
@@ -74,7 +85,9 @@ async def health_check(request: Request):
 
     Returns "initializing" immediately if service not ready.
     Prevents container crashes during warmup by not creating heavy objects.
+    Includes the per-initializer startup timeline once startup has begun.
     """
+    startup = _startup_timeline(request)
     try:
         # Get search service from app.state
         search_service = getattr(request.app.state, "search_service", None)
@@ -86,6 +99,7 @@ async def health_check(request: Request):
             return HealthResponse(
                 status="initializing",
                 version="v100-qdrant",
+                startup=startup,
                 database={"status": "initializing", "message": "Warming up Qdrant connections"},
                 embeddings={"status": "initializing", "message": "Loading embedding model"},
             )
@@ -102,6 +116,7 @@ async def health_check(request: Request):
             return HealthResponse(
                 status="healthy",
                 version="v100-qdrant",
+                startup=startup,
                 database={
                     "status": "connected",
                     "type": "qdrant",
@@ -121,6 +136,7 @@ async def health_check(request: Request):
             return HealthResponse(
                 status="initializing",
                 version="v100-qdrant",
+                startup=startup,
                 database={"status": "partial", "message": "Services starting"},
                 embeddings={"status": "loading", "message": str(ae)},
             )
@@ -131,6 +147,7 @@ async def health_check(request: Request):
         return HealthResponse(
             status="degraded",
             version="v100-qdrant",
+            startup=startup,
             database={"status": "error", "error": str(e)},
             embeddings={"status": "error", "error": str(e)},
         )
@@ -2,6 +2,7 @@
 Intel News API - Search and manage Bali intelligence news
 """
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
 
@@ -51,7 +52,7 @@ async def search_intel(request: IntelSearchRequest):
     """Search intel news with semantic search"""
     try:
         # Generate query embedding
-        query_embedding = embedder.generate_single_embedding(request.query)
+        query_embedding = await asyncio.to_thread(embedder.generate_single_embedding, request.query)
 
         # Determine collections to search
         if request.category:
@@ -4,6 +4,7 @@ Semantic memory storage and search using Qdrant
 Complements Firestore-based memory system with vector search capabilities
 """
 
+import asyncio
 import logging
 import time
 from typing import Any
@@ -129,7 +130,7 @@ async def generate_embedding(request: EmbedRequest):
     Uses sentence-transformers (FREE, local) by default.
     """
     try:
-        embedding = embedder.generate_single_embedding(request.text)
+        embedding = await asyncio.to_thread(embedder.generate_single_embedding, request.text)
 
         return EmbedResponse(embedding=embedding, dimensions=len(embedding), model=embedder.model)
     except Exception as e:
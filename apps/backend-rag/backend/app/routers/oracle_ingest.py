@@ -5,6 +5,7 @@ Endpoint per caricare massivamente documenti legali su Qdrant
 POST /api/oracle/ingest - Bulk upload di chunks con embeddings
 """
 
+import asyncio
 import logging
 import sys
 import time
@@ -134,7 +135,7 @@ async def ingest_documents(
         contents = [doc.content for doc in request.documents]
 
         logger.info(f"Generating embeddings for {len(contents)} documents...")
-        embeddings = embedder.generate_batch_embeddings(contents)
+        embeddings = await asyncio.to_thread(embedder.generate_batch_embeddings, contents)
 
         # Prepare data for Qdrant
         documents = []
@@ -6,7 +6,7 @@ Exposes SessionService functionality via REST API endpoints
 import logging
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
 
 from app.core.config import settings
@@ -35,6 +35,12 @@ class SessionHistoryRequest(BaseModel):
     history: list[dict] = Field(..., description="Conversation history")
 
 
+class SessionAppendRequest(BaseModel):
+    """Request model for appending messages to a session"""
+
+    messages: list[dict] = Field(..., description="New conversation messages")
+
+
 class SessionUpdateRequest(BaseModel):
     """Request model for updating session with custom TTL"""
 
@@ -60,10 +66,14 @@ async def create_session(service: SessionService = Depends(get_session_service))
 
 
 @router.get("/{session_id}")
-async def get_session(session_id: str, service: SessionService = Depends(get_session_service)):
+async def get_session(
+    session_id: str,
+    limit: int | None = Query(None, ge=1, description="Only the last N messages"),
+    service: SessionService = Depends(get_session_service),
+):
     """Get conversation history for a session"""
     try:
-        history = await service.get_history(session_id)
+        history = await service.get_history(session_id, limit=limit)
         if history is None:
             raise HTTPException(status_code=404, detail="Session not found")
         return {"success": True, "session_id": session_id, "history": history}
@@ -93,6 +103,25 @@ async def update_session(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/{session_id}/messages")
+async def append_session_messages(
+    session_id: str,
+    request: SessionAppendRequest,
+    service: SessionService = Depends(get_session_service),
+):
+    """Append messages to a session without resending its history"""
+    try:
+        success = await service.append_messages(session_id, request.messages)
+        if not success:
+            raise HTTPException(status_code=400, detail="Failed to update session")
+        return {"success": True, "session_id": session_id}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to append to session: {e}")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
 @router.put("/{session_id}/ttl")
 async def update_session_with_ttl(
     session_id: str,
@@ -7,97 +7,137 @@ Critical services (SearchService, ZantaraAIClient) must initialize successfully.
 If any critical service fails, the application will raise RuntimeError to prevent starting in a broken state.
 
 Non-critical services will log errors and continue with degraded functionality.
+
+Startup runs as a dependency graph (app.setup.startup_graph): independent
+initializers (search/Qdrant, AI client, PostgreSQL pool, MCP tools, Redis
+listener, collaborators) run concurrently, blocking constructors run in worker
+threads, and service modules are imported on first use rather than when this
+module is imported. The per-step timeline is served by /health.
 """
 
 import asyncio
+import importlib
 import json
 import logging
+from typing import TYPE_CHECKING, Any
 
 import asyncpg
 from fastapi import FastAPI
-from llm.zantara_ai_client import ZantaraAIClient
 
 from app.core.config import settings
 from app.core.service_health import ServiceStatus, service_registry
-from app.routers.websocket import redis_listener
-from services.alert_service import AlertService
-from services.auto_crm_service import get_auto_crm_service
-from services.autonomous_research_service import AutonomousResearchService
-from services.autonomous_scheduler import create_and_start_scheduler
-from services.client_journey_orchestrator import ClientJourneyOrchestrator
-from services.collaborator_service import CollaboratorService
-from services.collective_memory_workflow import create_collective_memory_workflow
-from services.conversation_service import ConversationService
-from services.cross_oracle_synthesis_service import CrossOracleSynthesisService
-from services.cultural_rag_service import CulturalRAGService
-from services.health_monitor import HealthMonitor
-from services.intelligent_router import IntelligentRouter
-from services.mcp_client_service import initialize_mcp_client
-from services.memory_service_postgres import MemoryServicePostgres
-from services.proactive_compliance_monitor import ProactiveComplianceMonitor
-from services.query_router import QueryRouter
-from services.search_service import SearchService
-from services.tool_executor import ToolExecutor
-from services.zantara_tools import ZantaraTools
+from app.setup.startup_graph import StartupGraph, StartupStep
 
-logger = logging.getLogger("zantara.backend")
+if TYPE_CHECKING:
+    from llm.zantara_ai_client import ZantaraAIClient
 
+    from services.autonomous_research_service import AutonomousResearchService
+    from services.client_journey_orchestrator import ClientJourneyOrchestrator
+    from services.collaborator_service import CollaboratorService
+    from services.cross_oracle_synthesis_service import CrossOracleSynthesisService
+    from services.cultural_rag_service import CulturalRAGService
+    from services.query_router import QueryRouter
+    from services.search_service import SearchService
+    from services.tool_executor import ToolExecutor
 
-async def _init_critical_services(
-    app: FastAPI,
-) -> tuple[SearchService | None, ZantaraAIClient | None]:
+logger = logging.getLogger("zantara.backend")
+
+# Symbols imported on first use (module path per name); keeps importing this
+# module cheap and lets heavy imports overlap with other startup steps
+_LAZY_IMPORTS = {
+    "AlertService": "services.alert_service",
+    "AutonomousResearchService": "services.autonomous_research_service",
+    "ClientJourneyOrchestrator": "services.client_journey_orchestrator",
+    "CollaboratorService": "services.collaborator_service",
+    "ConversationService": "services.conversation_service",
+    "CrossOracleSynthesisService": "services.cross_oracle_synthesis_service",
+    "CulturalRAGService": "services.cultural_rag_service",
+    "HealthMonitor": "services.health_monitor",
+    "IntelligentRouter": "services.intelligent_router",
+    "MemoryServicePostgres": "services.memory_service_postgres",
+    "ProactiveComplianceMonitor": "services.proactive_compliance_monitor",
+    "QueryRouter": "services.query_router",
+    "SearchService": "services.search_service",
+    "ToolExecutor": "services.tool_executor",
+    "ZantaraAIClient": "llm.zantara_ai_client",
+    "ZantaraTools": "services.zantara_tools",
+    "create_and_start_scheduler": "services.autonomous_scheduler",
+    "create_collective_memory_workflow": "services.collective_memory_workflow",
+    "get_auto_crm_service": "services.auto_crm_service",
+    "initialize_mcp_client": "services.mcp_client_service",
+    "redis_listener": "app.routers.websocket",
+}
+
+
+def _lazy(name: str) -> Any:
+    """Resolve a service symbol, importing its module on first use.
+
+    Module attributes win, so patching app.setup.service_initializer.<name>
+    in tests keeps working.
     """
-    Initialize critical services: SearchService and ZantaraAIClient.
+    value = globals().get(name)
+    if value is None:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+    return value
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: service_initializer.SearchService etc. still resolve as attributes
+    if name in _LAZY_IMPORTS:
+        return _lazy(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _build_search_service(app: FastAPI) -> "SearchService":
+    """Construct SearchService and its collaborators (blocking; runs in a worker thread)."""
+    from core.embeddings import create_embeddings_generator
+
+    from services.collection_manager import CollectionManager
+    from services.conflict_resolver import ConflictResolver
+    from services.cultural_insights_service import CulturalInsightsService
+    from services.query_router_integration import QueryRouterIntegration
+
+    # Create shared services
+    collection_manager = CollectionManager(qdrant_url=settings.qdrant_url)
+    conflict_resolver = ConflictResolver()
+    query_router = QueryRouterIntegration()
+
+    # Create cultural insights service (requires embedder)
+    embedder = create_embeddings_generator()
+    cultural_insights = CulturalInsightsService(
+        collection_manager=collection_manager, embedder=embedder
+    )
+
+    # Create SearchService with dependencies
+    search_service = _lazy("SearchService")(
+        collection_manager=collection_manager,
+        conflict_resolver=conflict_resolver,
+        cultural_insights=cultural_insights,
+        query_router=query_router,
+    )
+
+    # Store services in app state for dependency injection
+    app.state.collection_manager = collection_manager
+    app.state.conflict_resolver = conflict_resolver
+    app.state.cultural_insights = cultural_insights
+    app.state.query_router = query_router
+    return search_service
 
-    These services must initialize successfully or the application will fail to start.
+
+async def _init_search_service(app: FastAPI) -> "SearchService | None":
+    """
+    Initialize SearchService (Qdrant + embeddings). CRITICAL.
 
     Args:
         app: FastAPI application instance
 
     Returns:
-        Tuple of (search_service, ai_client). Both may be None if initialization failed.
-
-    Raises:
-        RuntimeError: If critical services fail to initialize
+        SearchService instance, or None if initialization failed
     """
-    # Store service registry in app state for health endpoints
-    app.state.service_registry = service_registry
-
-    # 1. Search / Qdrant (CRITICAL)
     search_service = None
     try:
-        # Initialize SearchService with dependency injection
-        from services.collection_manager import CollectionManager
-        from services.conflict_resolver import ConflictResolver
-        from services.cultural_insights_service import CulturalInsightsService
-        from services.query_router_integration import QueryRouterIntegration
-
-        # Create shared services
-        collection_manager = CollectionManager(qdrant_url=settings.qdrant_url)
-        conflict_resolver = ConflictResolver()
-        query_router = QueryRouterIntegration()
-
-        # Create cultural insights service (requires embedder)
-        from core.embeddings import create_embeddings_generator
-
-        embedder = create_embeddings_generator()
-        cultural_insights = CulturalInsightsService(
-            collection_manager=collection_manager, embedder=embedder
-        )
-
-        # Create SearchService with dependencies
-        search_service = SearchService(
-            collection_manager=collection_manager,
-            conflict_resolver=conflict_resolver,
-            cultural_insights=cultural_insights,
-            query_router=query_router,
-        )
-
-        # Store services in app state for dependency injection
-        app.state.collection_manager = collection_manager
-        app.state.conflict_resolver = conflict_resolver
-        app.state.cultural_insights = cultural_insights
-        app.state.query_router = query_router
+        search_service = await asyncio.to_thread(_build_search_service, app)
         app.state.search_service = search_service
         service_registry.register("search", ServiceStatus.HEALTHY)
         logger.info("✅ SearchService initialized")
@@ -112,11 +152,22 @@ async def _init_critical_services(
         logger.error(
             f"❌ CRITICAL: Unexpected error initializing SearchService: {e}", exc_info=True
         )
+    return search_service
+
+
+async def _init_ai_client(app: FastAPI) -> "ZantaraAIClient | None":
+    """
+    Initialize ZantaraAIClient. CRITICAL.
+
+    Args:
+        app: FastAPI application instance
 
-    # 2. AI Client (CRITICAL)
+    Returns:
+        ZantaraAIClient instance, or None if initialization failed
+    """
     ai_client = None
     try:
-        ai_client = ZantaraAIClient()
+        ai_client = await asyncio.to_thread(_lazy("ZantaraAIClient"))
         app.state.ai_client = ai_client
         service_registry.register("ai", ServiceStatus.HEALTHY)
         logger.info("✅ ZantaraAIClient initialized")
@@ -131,17 +182,23 @@ async def _init_critical_services(
         logger.error(
             f"❌ CRITICAL: Unexpected error initializing ZantaraAIClient: {exc}", exc_info=True
         )
+    return ai_client
 
-    # Fail-fast if critical services are unavailable
+
+def _check_critical_services() -> None:
+    """
+    Fail-fast if critical services are unavailable.
+
+    Raises:
+        RuntimeError: If critical services failed to initialize
+    """
     if service_registry.has_critical_failures():
         error_msg = service_registry.format_failures_message()
         logger.critical(f"🔥 {error_msg}")
         raise RuntimeError(error_msg)
 
-    return search_service, ai_client
 
-
-async def _init_tool_stack(app: FastAPI) -> ToolExecutor:
+async def _init_tool_stack(app: FastAPI) -> "ToolExecutor":
     """
     Initialize tool stack: Python-native tools and MCP client.
 
@@ -152,19 +209,19 @@ async def _init_tool_stack(app: FastAPI) -> ToolExecutor:
         ToolExecutor instance
     """
     # Tool stack (Python-native + MCP)
-    zantara_tools = ZantaraTools()
+    zantara_tools = await asyncio.to_thread(_lazy("ZantaraTools"))
 
     # Initialize MCP Client (optional - fails gracefully)
     mcp_client = None
     try:
-        mcp_client = await initialize_mcp_client()
+        mcp_client = await _lazy("initialize_mcp_client")()
         logger.info(f"✅ MCP Client initialized with {len(mcp_client.available_tools)} tools")
         service_registry.register("mcp", ServiceStatus.HEALTHY, critical=False)
     except Exception as e:
         logger.warning(f"⚠️ MCP Client initialization failed (non-critical): {e}")
         service_registry.register("mcp", ServiceStatus.DEGRADED, critical=False)
 
-    tool_executor = ToolExecutor(
+    tool_executor = _lazy("ToolExecutor")(
         zantara_tools=zantara_tools,
         mcp_client=mcp_client,  # MCP tools (filesystem, memory, brave-search, etc.)
     )
@@ -178,7 +235,9 @@ async def _init_tool_stack(app: FastAPI) -> ToolExecutor:
     return tool_executor
 
 
-async def _init_rag_components(app: FastAPI, search_service: SearchService | None) -> QueryRouter:
+async def _init_rag_components(
+    app: FastAPI, search_service: "SearchService | None"
+) -> tuple["CulturalRAGService", "QueryRouter"]:
     """
     Initialize RAG components: CulturalRAGService and QueryRouter.
 
@@ -187,8 +246,10 @@ async def _init_rag_components(app: FastAPI, search_service: SearchService | Non
         search_service: SearchService instance (may be None)
 
     Returns:
-        QueryRouter instance
+        Tuple of (cultural_rag_service, query_router)
     """
+    CulturalRAGService = _lazy("CulturalRAGService")
+
     # Initialize CulturalRAGService with CulturalInsightsService
     cultural_insights_service = getattr(app.state, "cultural_insights", None)
     if cultural_insights_service:
@@ -198,23 +259,23 @@ async def _init_rag_components(app: FastAPI, search_service: SearchService | Non
     else:
         # Fallback to search_service for backward compatibility
         cultural_rag_service = CulturalRAGService(search_service=search_service)
-    query_router = QueryRouter()
+    query_router = _lazy("QueryRouter")()
     service_registry.register("rag", ServiceStatus.HEALTHY, critical=False)
 
     app.state.query_router = query_router
 
-    return query_router
+    return cultural_rag_service, query_router
 
 
 async def _init_specialized_agents(
-    app: FastAPI,
-    search_service: SearchService,
-    ai_client: ZantaraAIClient,
-    query_router: QueryRouter,
+    app: FastAPI,  # noqa: ARG001 - same signature as the other _init_* steps
+    search_service: "SearchService",
+    ai_client: "ZantaraAIClient",
+    query_router: "QueryRouter",
 ) -> tuple[
-    AutonomousResearchService | None,
-    CrossOracleSynthesisService | None,
-    ClientJourneyOrchestrator | None,
+    "AutonomousResearchService | None",
+    "CrossOracleSynthesisService | None",
+    "ClientJourneyOrchestrator | None",
 ]:
     """
     Initialize specialized agents: AutonomousResearch, CrossOracle, ClientJourney.
@@ -234,7 +295,7 @@ async def _init_specialized_agents(
 
     # Since we fail-fast on critical services, ai_client and search_service are guaranteed
     try:
-        autonomous_research_service = AutonomousResearchService(
+        autonomous_research_service = _lazy("AutonomousResearchService")(
             search_service=search_service,
             query_router=query_router,
             zantara_ai_service=ai_client,
@@ -247,7 +308,7 @@ async def _init_specialized_agents(
         )  # nosemgrep: python-logger-credential-disclosure
 
     try:
-        cross_oracle_synthesis_service = CrossOracleSynthesisService(
+        cross_oracle_synthesis_service = _lazy("CrossOracleSynthesisService")(
             search_service=search_service, zantara_ai_client=ai_client
         )
         logger.info("✅ CrossOracleSynthesisService initialized")
@@ -258,7 +319,7 @@ async def _init_specialized_agents(
         )  # nosemgrep: python-logger-credential-disclosure
 
     try:
-        client_journey_orchestrator = ClientJourneyOrchestrator()
+        client_journey_orchestrator = _lazy("ClientJourneyOrchestrator")()
         logger.info("✅ ClientJourneyOrchestrator initialized")
     except Exception as e:
         logger.error(f"❌ Failed to initialize ClientJourneyOrchestrator: {e}")
@@ -345,7 +406,7 @@ async def _init_database_services(app: FastAPI) -> asyncpg.Pool | None:
 
 
 async def _init_crm_memory(
-    app: FastAPI, ai_client: ZantaraAIClient, db_pool: asyncpg.Pool | None
+    app: FastAPI, ai_client: "ZantaraAIClient", db_pool: asyncpg.Pool | None
 ) -> None:
     """
     Initialize CRM and Memory services: AutoCRM, MemoryService, ConversationService.
@@ -358,7 +419,7 @@ async def _init_crm_memory(
     try:
         # Initialize AutoCRMService with centralized database pool
         if db_pool:
-            auto_crm_service = get_auto_crm_service(ai_client=ai_client, db_pool=db_pool)
+            auto_crm_service = _lazy("get_auto_crm_service")(ai_client=ai_client, db_pool=db_pool)
             await auto_crm_service.connect()  # No-op, but kept for compatibility
             app.state.auto_crm_service = auto_crm_service
             logger.info("✅ AutoCRMService initialized with centralized database pool")
@@ -366,22 +427,21 @@ async def _init_crm_memory(
             logger.warning(
                 "⚠️ Database pool not available, AutoCRMService will use dependency injection"
             )
-            auto_crm_service = get_auto_crm_service(ai_client=ai_client)
+            auto_crm_service = _lazy("get_auto_crm_service")(ai_client=ai_client)
             await auto_crm_service.connect()
             app.state.auto_crm_service = auto_crm_service
 
         # Initialize Memory Service (Postgres)
         # MemoryServicePostgres expects database_url string, not Pool object
-        from app.core.config import settings
-        app.state.memory_service = MemoryServicePostgres(settings.database_url)
+        app.state.memory_service = _lazy("MemoryServicePostgres")(settings.database_url)
         await app.state.memory_service.connect()
 
         # Initialize Conversation Service
-        app.state.conversation_service = ConversationService(app.state.db_pool)
+        app.state.conversation_service = _lazy("ConversationService")(app.state.db_pool)
         logger.info("✅ Conversation Service initialized")
 
         # Initialize Collective Memory Workflow
-        collective_memory_workflow = create_collective_memory_workflow(
+        collective_memory_workflow = _lazy("create_collective_memory_workflow")(
             memory_service=app.state.memory_service
         )
         app.state.collective_memory_workflow = collective_memory_workflow
@@ -396,14 +456,14 @@ async def _init_crm_memory(
 
 async def _init_intelligent_router(
     app: FastAPI,
-    ai_client: ZantaraAIClient,
-    search_service: SearchService,
-    tool_executor: ToolExecutor,
-    cultural_rag_service: CulturalRAGService,
-    autonomous_research_service: AutonomousResearchService | None,
-    cross_oracle_synthesis_service: CrossOracleSynthesisService | None,
-    client_journey_orchestrator: ClientJourneyOrchestrator | None,
-    collaborator_service: CollaboratorService | None,
+    ai_client: "ZantaraAIClient",
+    search_service: "SearchService",
+    tool_executor: "ToolExecutor",
+    cultural_rag_service: "CulturalRAGService",
+    autonomous_research_service: "AutonomousResearchService | None",
+    cross_oracle_synthesis_service: "CrossOracleSynthesisService | None",
+    client_journey_orchestrator: "ClientJourneyOrchestrator | None",
+    collaborator_service: "CollaboratorService | None",
     db_pool: asyncpg.Pool | None,
 ) -> None:
     """
@@ -424,7 +484,7 @@ async def _init_intelligent_router(
     # Initialize CollaboratorService for user identity lookup
     if collaborator_service is None:
         try:
-            collaborator_service = CollaboratorService()
+            collaborator_service = _lazy("CollaboratorService")()
             app.state.collaborator_service = collaborator_service
             logger.info("✅ CollaboratorService initialized")
         except Exception as e:
@@ -433,7 +493,7 @@ async def _init_intelligent_router(
 
     # Initialize IntelligentRouter (critical services are guaranteed available)
     try:
-        intelligent_router = IntelligentRouter(
+        intelligent_router = _lazy("IntelligentRouter")(
             ai_client=ai_client,
             search_service=search_service,
             tool_executor=tool_executor,
@@ -456,12 +516,12 @@ async def _init_intelligent_router(
 
 async def _init_background_services(
     app: FastAPI,
-    search_service: SearchService,
-    ai_client: ZantaraAIClient,
+    search_service: "SearchService",
+    ai_client: "ZantaraAIClient",
     db_pool: asyncpg.Pool | None,
 ) -> None:
     """
-    Initialize background services: HealthMonitor, ComplianceMonitor, Scheduler, WebSocket.
+    Initialize background services: HealthMonitor, ComplianceMonitor, Scheduler.
 
     Args:
         app: FastAPI application instance
@@ -477,10 +537,10 @@ async def _init_background_services(
         logger.info("🏥 Initializing Health Monitor (Self-Healing System)...")
         alert_service = getattr(app.state, "alert_service", None)
         if alert_service is None:
-            alert_service = AlertService()
+            alert_service = _lazy("AlertService")()
             app.state.alert_service = alert_service
 
-        health_monitor = HealthMonitor(alert_service=alert_service, check_interval=60)
+        health_monitor = _lazy("HealthMonitor")(alert_service=alert_service, check_interval=60)
 
         # Inject dependencies for accurate monitoring
         health_monitor.set_services(
@@ -500,22 +560,11 @@ async def _init_background_services(
         )
         logger.error(f"❌ Failed to initialize Health Monitor: {e}")
 
-    # WebSocket Redis Listener
-    try:
-        logger.info("🔌 Starting WebSocket Redis Listener...")
-        redis_task = asyncio.create_task(redis_listener())
-        app.state.redis_listener_task = redis_task
-        service_registry.register("websocket", ServiceStatus.HEALTHY, critical=False)
-        logger.info("✅ WebSocket Redis Listener started")
-    except Exception as e:
-        service_registry.register("websocket", ServiceStatus.DEGRADED, error=str(e), critical=False)
-        logger.error(f"❌ Failed to start WebSocket Redis Listener: {e}")
-
     # Proactive Compliance Monitor (Business Value)
     try:
         logger.info("⚖️ Initializing Proactive Compliance Monitor...")
         # In production, we would pass the notification service here
-        compliance_monitor = ProactiveComplianceMonitor(search_service=search_service)
+        compliance_monitor = _lazy("ProactiveComplianceMonitor")(search_service=search_service)
         await compliance_monitor.start()
 
         app.state.compliance_monitor = compliance_monitor
@@ -531,7 +580,7 @@ async def _init_background_services(
     try:
         logger.info("🤖 Initializing Autonomous Scheduler...")
 
-        autonomous_scheduler = await create_and_start_scheduler(
+        autonomous_scheduler = await _lazy("create_and_start_scheduler")(
             db_pool=db_pool,
             ai_client=ai_client,
             search_service=search_service,
@@ -553,6 +602,102 @@ async def _init_background_services(
         logger.error(f"❌ Failed to initialize Autonomous Scheduler: {e}")
 
 
+async def _init_websocket_listener(app: FastAPI) -> None:
+    """
+    Start the WebSocket Redis listener (independent of other services).
+
+    Args:
+        app: FastAPI application instance
+    """
+    try:
+        logger.info("🔌 Starting WebSocket Redis Listener...")
+        redis_task = asyncio.create_task(_lazy("redis_listener")())
+        app.state.redis_listener_task = redis_task
+        service_registry.register("websocket", ServiceStatus.HEALTHY, critical=False)
+        logger.info("✅ WebSocket Redis Listener started")
+    except Exception as e:
+        service_registry.register("websocket", ServiceStatus.DEGRADED, error=str(e), critical=False)
+        logger.error(f"❌ Failed to start WebSocket Redis Listener: {e}")
+
+
+async def _init_collaborator_service(app: FastAPI) -> "CollaboratorService | None":
+    """
+    Initialize CollaboratorService (team directory, needed for IntelligentRouter).
+
+    Args:
+        app: FastAPI application instance
+
+    Returns:
+        CollaboratorService instance or None if initialization failed
+    """
+    try:
+        collaborator_service = await asyncio.to_thread(_lazy("CollaboratorService"))
+        app.state.collaborator_service = collaborator_service
+        logger.info("✅ CollaboratorService initialized")
+        return collaborator_service
+    except Exception as e:
+        logger.warning(f"⚠️ CollaboratorService initialization failed: {e}")
+        app.state.collaborator_service = None
+        return None
+
+
+def _startup_steps(app: FastAPI) -> list[StartupStep]:
+    """
+    Startup dependency graph.
+
+    Independent roots (search, ai, tools, database, collaborators, websocket)
+    start together; "critical" gates everything that needs search/AI.
+    """
+
+    async def check_critical(_: dict[str, Any]) -> None:
+        _check_critical_services()
+
+    async def specialized_agents(r: dict[str, Any]) -> tuple:
+        return await _init_specialized_agents(app, r["search"], r["ai"], r["rag"][1])
+
+    async def intelligent_router(r: dict[str, Any]) -> None:
+        research, cross_oracle, client_journey = r["agents"]
+        await _init_intelligent_router(
+            app,
+            r["ai"],
+            r["search"],
+            r["tools"],
+            r["rag"][0],
+            research,
+            cross_oracle,
+            client_journey,
+            r["collaborators"],
+            r["database"],
+        )
+
+    return [
+        StartupStep("search", lambda _: _init_search_service(app)),
+        StartupStep("ai", lambda _: _init_ai_client(app)),
+        StartupStep("critical", check_critical, ("search", "ai")),
+        StartupStep("tools", lambda _: _init_tool_stack(app)),
+        StartupStep("database", lambda _: _init_database_services(app)),
+        StartupStep("collaborators", lambda _: _init_collaborator_service(app)),
+        StartupStep("websocket", lambda _: _init_websocket_listener(app)),
+        StartupStep("rag", lambda r: _init_rag_components(app, r["search"]), ("critical",)),
+        StartupStep("agents", specialized_agents, ("critical", "rag")),
+        StartupStep(
+            "crm_memory",
+            lambda r: _init_crm_memory(app, r["ai"], r["database"]),
+            ("critical", "database"),
+        ),
+        StartupStep(
+            "router",
+            intelligent_router,
+            ("critical", "tools", "rag", "agents", "collaborators", "database"),
+        ),
+        StartupStep(
+            "background",
+            lambda r: _init_background_services(app, r["search"], r["ai"], r["database"]),
+            ("router", "crm_memory"),
+        ),
+    ]
+
+
 async def initialize_services(app: FastAPI) -> None:
     """
     Initialize all ZANTARA RAG services with fail-fast for critical services.
@@ -571,62 +716,16 @@ async def initialize_services(app: FastAPI) -> None:
 
     logger.info("🚀 Initializing ZANTARA RAG services...")
 
-    # 1. Critical services (fail-fast)
-    search_service, ai_client = await _init_critical_services(app)
-
-    # 2. Tool stack
-    tool_executor = await _init_tool_stack(app)
-
-    # 3. RAG components
-    query_router = await _init_rag_components(app, search_service)
-    cultural_insights_service = getattr(app.state, "cultural_insights", None)
-    if cultural_insights_service:
-        cultural_rag_service = CulturalRAGService(
-            cultural_insights_service=cultural_insights_service
-        )
-    else:
-        # Fallback to search_service for backward compatibility
-        cultural_rag_service = CulturalRAGService(search_service=search_service)
-
-    # 4. Specialized agents
-    (
-        autonomous_research_service,
-        cross_oracle_synthesis_service,
-        client_journey_orchestrator,
-    ) = await _init_specialized_agents(app, search_service, ai_client, query_router)
-
-    # 5. Database services
-    db_pool = await _init_database_services(app)
-
-    # 6. CRM & Memory
-    await _init_crm_memory(app, ai_client, db_pool)
+    # Store service registry in app state for health endpoints
+    app.state.service_registry = service_registry
 
-    # 7. CollaboratorService (needed for IntelligentRouter)
-    collaborator_service = None
+    # Kept on app.state so /health can report progress while startup runs
+    graph = StartupGraph(_startup_steps(app))
+    app.state.startup_graph = graph
     try:
-        collaborator_service = CollaboratorService()
-        app.state.collaborator_service = collaborator_service
-        logger.info("✅ CollaboratorService initialized")
-    except Exception as e:
-        logger.warning(f"⚠️ CollaboratorService initialization failed: {e}")
-        app.state.collaborator_service = None
-
-    # 8. Intelligent Router
-    await _init_intelligent_router(
-        app,
-        ai_client,
-        search_service,
-        tool_executor,
-        cultural_rag_service,
-        autonomous_research_service,
-        cross_oracle_synthesis_service,
-        client_journey_orchestrator,
-        collaborator_service,
-        db_pool,
-    )
-
-    # 9. Background services
-    await _init_background_services(app, search_service, ai_client, db_pool)
+        await graph.run()
+    finally:
+        logger.info(f"⏱️ Service startup took {graph.total_duration:.2f}s")
 
     logger.info("DEBUG: Setting services_initialized to True")
     app.state.services_initialized = True
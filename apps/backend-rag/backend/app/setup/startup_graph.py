@@ -0,0 +1,175 @@
+"""
+Startup Dependency Graph
+
+Runs service initializers as a dependency graph instead of one after another:
+each step starts as soon as the steps it depends on have finished, so
+independent initializers (Qdrant/search, PostgreSQL pool, MCP, Redis listener)
+come up concurrently.
+
+Every step is timed; the timeline (start offset, duration, status) of the
+graph kept on app.state.startup_graph is served by /health.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger("zantara.backend")
+
+
+@dataclass
+class StartupStep:
+    """One initializer in the startup graph."""
+
+    name: str
+    run: Callable[[dict[str, Any]], Awaitable[Any]]  # Receives results of finished steps
+    depends_on: tuple[str, ...] = ()
+
+
+@dataclass
+class StepTiming:
+    """Timing of one startup step (seconds relative to graph start)."""
+
+    name: str
+    depends_on: tuple[str, ...] = ()
+    started_at: float | None = None
+    duration: float | None = None
+    status: str = "pending"  # pending, running, ok, failed, skipped, cancelled
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "depends_on": list(self.depends_on),
+            "started_at": round(self.started_at, 3) if self.started_at is not None else None,
+            "duration": round(self.duration, 3) if self.duration is not None else None,
+            "status": self.status,
+            "error": self.error,
+        }
+
+
+@dataclass
+class StartupGraph:
+    """
+    Dependency-ordered, concurrent runner for startup steps.
+
+    Any step raising aborts startup: steps still running are cancelled and the
+    exception propagates from run(), as it would from a sequential startup.
+    """
+
+    steps: list[StartupStep]
+    timings: dict[str, StepTiming] = field(default_factory=dict, init=False)
+    total_duration: float | None = field(default=None, init=False)
+
+    def __post_init__(self) -> None:
+        names = [step.name for step in self.steps]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicate startup step names: {names}")
+        known = set(names)
+        for step in self.steps:
+            unknown = set(step.depends_on) - known
+            if unknown:
+                raise ValueError(f"Startup step '{step.name}' depends on unknown {sorted(unknown)}")
+        self._order = self._topological_order()
+        self.timings = {
+            step.name: StepTiming(name=step.name, depends_on=step.depends_on) for step in self.steps
+        }
+
+    def _topological_order(self) -> list[StartupStep]:
+        by_name = {step.name: step for step in self.steps}
+        order: list[StartupStep] = []
+        state: dict[str, str] = {}
+
+        def visit(name: str, path: tuple[str, ...]) -> None:
+            if state.get(name) == "done":
+                return
+            if state.get(name) == "visiting":
+                raise ValueError(f"Startup dependency cycle: {' -> '.join((*path, name))}")
+            state[name] = "visiting"
+            for dep in by_name[name].depends_on:
+                visit(dep, (*path, name))
+            state[name] = "done"
+            order.append(by_name[name])
+
+        for step in self.steps:
+            visit(step.name, ())
+        return order
+
+    async def run(self) -> dict[str, Any]:
+        """
+        Run all steps, each as soon as its dependencies have completed.
+
+        Returns:
+            Mapping of step name to the value its run() returned
+        """
+        results: dict[str, Any] = {}
+        tasks: dict[str, asyncio.Task] = {}
+        graph_start = time.perf_counter()
+
+        async def run_step(step: StartupStep) -> Any:
+            timing = self.timings[step.name]
+            try:
+                await asyncio.gather(*(tasks[dep] for dep in step.depends_on))
+            except BaseException:
+                # A dependency failed or startup was aborted before this step began
+                timing.status = "skipped"
+                raise
+            timing.started_at = time.perf_counter() - graph_start
+            timing.status = "running"
+            try:
+                result = await step.run(results)
+            except asyncio.CancelledError:
+                timing.status = "cancelled"
+                raise
+            except BaseException as e:
+                timing.status = "failed"
+                timing.error = str(e)
+                raise
+            finally:
+                timing.duration = time.perf_counter() - graph_start - timing.started_at
+            timing.status = "ok"
+            results[step.name] = result
+            logger.info(f"⏱️ Startup step '{step.name}' finished in {timing.duration:.2f}s")
+            return result
+
+        for step in self._order:
+            tasks[step.name] = asyncio.create_task(run_step(step), name=f"startup:{step.name}")
+        step_of = {task: name for name, task in tasks.items()}
+
+        try:
+            done, pending = await asyncio.wait(tasks.values(), return_when=asyncio.FIRST_EXCEPTION)
+            failed = [task for task in done if not task.cancelled() and task.exception()]
+            if failed:
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                # Surface the root failure, not a dependent that re-raised it
+                root = next(
+                    (t for t in failed if self.timings[step_of[t]].status == "failed"), failed[0]
+                )
+                raise root.exception()
+        except asyncio.CancelledError:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+        finally:
+            self.total_duration = time.perf_counter() - graph_start
+
+        return results
+
+    def timeline(self) -> dict[str, Any]:
+        """Per-step timeline in start order (steps that never started last)."""
+        ordered = sorted(
+            self.timings.values(),
+            key=lambda t: (t.started_at is None, t.started_at or 0.0),
+        )
+        return {
+            "total_seconds": (
+                round(self.total_duration, 3) if self.total_duration is not None else None
+            ),
+            "steps": [timing.to_dict() for timing in ordered],
+        }
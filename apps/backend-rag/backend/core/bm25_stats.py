@@ -0,0 +1,275 @@
+"""
+NUZANTARA RAG - BM25 Corpus Statistics
+Per-collection document frequencies and document lengths for BM25 IDF / avgdl.
+
+Statistics are keyed by hashed token ID (the sparse vector index), so the store
+is bounded by the BM25 vocab size regardless of corpus size. They are updated
+incrementally on upsert/delete and persisted to SQLite, so a restart never needs
+a full collection scan. Other processes writing the same file are picked up via
+SQLite's data_version, checked at most every reload_interval seconds.
+"""
+
+import logging
+import math
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+try:
+    from app.core.config import settings as _default_settings
+except ImportError:
+    _default_settings = None
+
+
+class _CollectionStats:
+    __slots__ = ("doc_count", "total_length", "doc_freq")
+
+    def __init__(self):
+        self.doc_count = 0
+        self.total_length = 0
+        self.doc_freq: dict[int, int] = {}
+
+
+class BM25CorpusStats:
+    """
+    Incrementally maintained BM25 corpus statistics.
+
+    Each document is described by its sparse vector indices (unique token IDs)
+    and its token count. Documents are added when upserted and removed when
+    deleted or replaced.
+    """
+
+    def __init__(self, path: str | None = None, reload_interval: float = 30.0):
+        """
+        Initialize corpus statistics.
+
+        Args:
+            path: Directory for the SQLite file (None keeps statistics in memory only)
+            reload_interval: Min seconds between checks for writes by other processes
+        """
+        self.reload_interval = reload_interval
+        self._lock = threading.Lock()
+        self._collections: dict[str, _CollectionStats] = {}
+        self._conn: sqlite3.Connection | None = None
+        self._data_version = 0
+        self._last_reload_check = time.monotonic()
+
+        if path:
+            db_path = Path(path)
+            db_path.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                str(db_path / "bm25_stats.sqlite3"), check_same_thread=False
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS bm25_collections "
+                "(collection TEXT PRIMARY KEY, doc_count INTEGER NOT NULL, total_length INTEGER NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS bm25_doc_freq "
+                "(collection TEXT NOT NULL, token_id INTEGER NOT NULL, df INTEGER NOT NULL, "
+                "PRIMARY KEY (collection, token_id)) WITHOUT ROWID"
+            )
+            self._conn.commit()
+            self._load()
+
+    @property
+    def persistent(self) -> bool:
+        return self._conn is not None
+
+    def _load(self) -> None:
+        """Load all statistics from SQLite (caller holds the lock or is __init__)."""
+        collections: dict[str, _CollectionStats] = {}
+        for name, doc_count, total_length in self._conn.execute(
+            "SELECT collection, doc_count, total_length FROM bm25_collections"
+        ):
+            stats = collections[name] = _CollectionStats()
+            stats.doc_count = max(doc_count, 0)
+            stats.total_length = max(total_length, 0)
+        for name, token_id, df in self._conn.execute(
+            "SELECT collection, token_id, df FROM bm25_doc_freq"
+        ):
+            if name in collections and df > 0:
+                collections[name].doc_freq[token_id] = df
+        self._collections = collections
+        self._data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def _maybe_reload(self) -> None:
+        """Reload if another process committed since our last look."""
+        if self._conn is None:
+            return
+        now = time.monotonic()
+        if now - self._last_reload_check < self.reload_interval:
+            return
+        with self._lock:
+            self._last_reload_check = now
+            if self._conn.execute("PRAGMA data_version").fetchone()[0] != self._data_version:
+                self._load()
+                logger.debug("BM25 corpus statistics reloaded from disk")
+
+    def _apply(self, collection: str, documents: list[tuple[list[int], int]], sign: int) -> None:
+        if not documents:
+            return
+
+        delta_df: dict[int, int] = {}
+        delta_length = 0
+        for indices, length in documents:
+            delta_length += length
+            for token_id in indices:
+                delta_df[token_id] = delta_df.get(token_id, 0) + sign
+        delta_docs = sign * len(documents)
+        delta_length *= sign
+
+        with self._lock:
+            stats = self._collections.get(collection)
+            if stats is None:
+                stats = self._collections[collection] = _CollectionStats()
+            stats.doc_count = max(stats.doc_count + delta_docs, 0)
+            stats.total_length = max(stats.total_length + delta_length, 0)
+            doc_freq = stats.doc_freq
+            for token_id, delta in delta_df.items():
+                df = doc_freq.get(token_id, 0) + delta
+                if df > 0:
+                    doc_freq[token_id] = df
+                else:
+                    doc_freq.pop(token_id, None)
+
+            if self._conn is not None:
+                # Persist deltas, not totals, so concurrent writers never clobber each other
+                self._conn.execute(
+                    "INSERT INTO bm25_collections (collection, doc_count, total_length) "
+                    "VALUES (?, ?, ?) "
+                    "ON CONFLICT (collection) DO UPDATE SET "
+                    "doc_count = MAX(doc_count + excluded.doc_count, 0), "
+                    "total_length = MAX(total_length + excluded.total_length, 0)",
+                    (collection, delta_docs, delta_length),
+                )
+                self._conn.executemany(
+                    "INSERT INTO bm25_doc_freq (collection, token_id, df) VALUES (?, ?, ?) "
+                    "ON CONFLICT (collection, token_id) DO UPDATE SET df = df + excluded.df",
+                    [(collection, token_id, delta) for token_id, delta in delta_df.items()],
+                )
+                if sign < 0:
+                    self._conn.execute(
+                        "DELETE FROM bm25_doc_freq WHERE collection = ? AND df <= 0", (collection,)
+                    )
+                self._conn.commit()
+
+    def add_documents(self, collection: str, documents: list[tuple[list[int], int]]) -> None:
+        """
+        Add documents to a collection's statistics.
+
+        Args:
+            collection: Collection name
+            documents: (sparse vector indices, token count) per document
+        """
+        self._apply(collection, documents, 1)
+
+    def remove_documents(self, collection: str, documents: list[tuple[list[int], int]]) -> None:
+        """
+        Remove previously added documents from a collection's statistics.
+
+        Args:
+            collection: Collection name
+            documents: (sparse vector indices, token count) per document
+        """
+        self._apply(collection, documents, -1)
+
+    def reset(self, collection: str) -> None:
+        """Drop all statistics for a collection (e.g. before a full rebuild)."""
+        with self._lock:
+            self._collections.pop(collection, None)
+            if self._conn is not None:
+                self._conn.execute(
+                    "DELETE FROM bm25_collections WHERE collection = ?", (collection,)
+                )
+                self._conn.execute("DELETE FROM bm25_doc_freq WHERE collection = ?", (collection,))
+                self._conn.commit()
+
+    def has_collection(self, collection: str) -> bool:
+        """Whether any documents of this collection are tracked."""
+        self._maybe_reload()
+        stats = self._collections.get(collection)
+        return stats is not None and stats.doc_count > 0
+
+    def doc_count(self, collection: str) -> int:
+        self._maybe_reload()
+        stats = self._collections.get(collection)
+        return stats.doc_count if stats else 0
+
+    def avg_doc_length(self, collection: str) -> float | None:
+        """
+        Average document length (tokens) of a collection.
+
+        Returns:
+            avgdl, or None if the collection has no tracked documents
+        """
+        self._maybe_reload()
+        stats = self._collections.get(collection)
+        if not stats or stats.doc_count == 0:
+            return None
+        return stats.total_length / stats.doc_count
+
+    def idf(self, collection: str, token_id: int) -> float:
+        """
+        BM25 inverse document frequency of a token ID.
+
+        IDF = ln(1 + (N - df + 0.5) / (df + 0.5)), always positive.
+
+        Returns:
+            IDF, or 1.0 if the collection has no tracked documents
+        """
+        self._maybe_reload()
+        stats = self._collections.get(collection)
+        if not stats or stats.doc_count == 0:
+            return 1.0
+        df = stats.doc_freq.get(token_id, 0)
+        return math.log(1 + (stats.doc_count - df + 0.5) / (df + 0.5))
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get per-collection summary for monitoring."""
+        return {
+            "persistent": self.persistent,
+            "collections": {
+                name: {
+                    "doc_count": stats.doc_count,
+                    "avg_doc_length": (
+                        round(stats.total_length / stats.doc_count, 1) if stats.doc_count else 0.0
+                    ),
+                    "unique_tokens": len(stats.doc_freq),
+                }
+                for name, stats in self._collections.items()
+            },
+        }
+
+
+# Shared corpus statistics instance (used by QdrantClient and SearchService)
+_bm25_corpus_stats: BM25CorpusStats | None = None
+
+
+def get_bm25_corpus_stats() -> BM25CorpusStats | None:
+    """
+    Get the shared corpus statistics store, built from settings on first use.
+
+    Returns:
+        BM25CorpusStats instance, or None if disabled via BM25_CORPUS_STATS_ENABLED
+    """
+    global _bm25_corpus_stats
+    if _bm25_corpus_stats is not None:
+        return _bm25_corpus_stats
+    if _default_settings is None or not getattr(
+        _default_settings, "bm25_corpus_stats_enabled", True
+    ):
+        return None
+
+    path = getattr(_default_settings, "bm25_corpus_stats_dir", None)
+    try:
+        _bm25_corpus_stats = BM25CorpusStats(path=path)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"⚠️ BM25 corpus statistics: cannot open {path}, keeping them in memory: {e}")
+        _bm25_corpus_stats = BM25CorpusStats()
+    logger.info(f"✅ BM25 corpus statistics ready (persistent={_bm25_corpus_stats.persistent})")
+    return _bm25_corpus_stats
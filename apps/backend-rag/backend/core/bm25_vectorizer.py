@@ -2,16 +2,37 @@
 NUZANTARA RAG - BM25 Sparse Vectorizer
 Generates BM25 sparse vectors for hybrid search with Qdrant.
 Uses hash-based token IDs for vocabulary-free operation.
+
+Token IDs come from a stable 64-bit blake2b hash folded into the vocab space, so
+sparse indices are identical across processes, workers and restarts (Python's
+built-in hash() is salted per process unless PYTHONHASHSEED is pinned).
 """
 
+import hashlib
 import logging
 import math
+import multiprocessing
+import os
 import re
 from collections import Counter
-from typing import Any
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from core.bm25_stats import BM25CorpusStats
 
 logger = logging.getLogger(__name__)
 
+# Single-pass tokenizer: legal references (KBLI 56101, UU No. 6, PP No. 28) or
+# plain word runs; punctuation never matches. Legal references are then rebuilt
+# as single tokens (kbli_56101, uu_6, pp_28) by _LEGAL_REF_PATTERN.
+_TOKEN_PATTERN = re.compile(r"kbli\s*\d+|uu\s*no\.?\s*\d+|pp\s*no\.?\s*\d+|\w+")
+_LEGAL_REF_PATTERN = re.compile(r"(kbli)\s*(\d+)|(uu|pp)\s*no\.?\s*(\d+)")
+
+# Batches smaller than this are vectorized in-process (pool startup costs more)
+PROCESS_POOL_MIN_TEXTS = 2000
+
 # Indonesian stopwords (common words to filter out)
 INDONESIAN_STOPWORDS = {
     "dan",
@@ -113,6 +134,35 @@ INDONESIAN_STOPWORDS = {
 }
 
 
+@lru_cache(maxsize=65536)
+def stable_token_hash(token: str) -> int:
+    """
+    Stable 64-bit hash of a token (blake2b, 8-byte digest).
+
+    Args:
+        token: Token string
+
+    Returns:
+        Unsigned 64-bit integer, identical in every process
+    """
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+# Per-process vectorizer used by generate_batch_sparse_vectors() workers
+_worker_vectorizer: "BM25Vectorizer | None" = None
+
+
+def _init_worker(params: dict[str, Any]) -> None:
+    global _worker_vectorizer
+    avg_doc_length = params.pop("avg_doc_length")
+    _worker_vectorizer = BM25Vectorizer(**params)
+    _worker_vectorizer.avg_doc_length = avg_doc_length
+
+
+def _vectorize_chunk(texts: list[str]) -> list[dict[str, Any]]:
+    return [_worker_vectorizer.generate_sparse_vector(text) for text in texts]
+
+
 class BM25Vectorizer:
     """
     BM25 Sparse Vectorizer for Qdrant hybrid search.
@@ -128,6 +178,7 @@ class BM25Vectorizer:
         b: float = 0.75,
         min_token_length: int = 2,
         max_token_length: int = 50,
+        corpus_stats: "BM25CorpusStats | None" = None,
     ):
         """
         Initialize BM25 Vectorizer.
@@ -138,6 +189,7 @@ class BM25Vectorizer:
             b: BM25 document length normalization parameter (default 0.75)
             min_token_length: Minimum token length to include (default 2)
             max_token_length: Maximum token length to include (default 50)
+            corpus_stats: Optional corpus statistics for per-collection avgdl and IDF
         """
         self.vocab_size = vocab_size
         self.k1 = k1
@@ -145,6 +197,7 @@ class BM25Vectorizer:
         self.min_token_length = min_token_length
         self.max_token_length = max_token_length
         self.avg_doc_length = 500  # Default average, can be updated
+        self.corpus_stats = corpus_stats
 
         logger.info(f"BM25Vectorizer initialized: vocab_size={vocab_size}, k1={k1}, b={b}")
 
@@ -167,36 +220,30 @@ class BM25Vectorizer:
         if not text:
             return []
 
-        # Lowercase
-        text = text.lower()
-
-        # Preserve important patterns before cleaning
-        # Keep KBLI codes, legal references intact
-        text = re.sub(r"kbli\s*(\d+)", r"kbli_\1", text)  # KBLI 56101 -> kbli_56101
-        text = re.sub(r"uu\s*no\.?\s*(\d+)", r"uu_\1", text)  # UU No. 6 -> uu_6
-        text = re.sub(r"pp\s*no\.?\s*(\d+)", r"pp_\1", text)  # PP No. 28 -> pp_28
-
-        # Remove punctuation except underscores (preserving our patterns)
-        text = re.sub(r"[^\w\s_]", " ", text)
+        min_len = self.min_token_length
+        max_len = self.max_token_length
+        filtered_tokens = []
+        append = filtered_tokens.append
 
-        # Split on whitespace
-        tokens = text.split()
+        for token in _TOKEN_PATTERN.findall(text.lower()):
+            # Legal references are the only matches that can mix letters with
+            # digits/spaces after a k/u/p start: kbli 56101 -> kbli_56101
+            if token[0] in "kup" and not token.isalpha():
+                ref = _LEGAL_REF_PATTERN.fullmatch(token)
+                if ref:
+                    token = f"{ref[1] or ref[3]}_{ref[2] or ref[4]}"
 
-        # Filter tokens
-        filtered_tokens = []
-        for token in tokens:
-            # Skip stopwords
-            if token in INDONESIAN_STOPWORDS:
-                continue
             # Skip too short or too long tokens
-            if len(token) < self.min_token_length:
-                continue
-            if len(token) > self.max_token_length:
+            length = len(token)
+            if length < min_len or length > max_len:
                 continue
             # Skip pure numbers (unless they're part of codes)
-            if token.isdigit() and len(token) < 4:
+            if length < 4 and token.isdigit():
                 continue
-            filtered_tokens.append(token)
+            # Skip stopwords
+            if token in INDONESIAN_STOPWORDS:
+                continue
+            append(token)
 
         return filtered_tokens
 
@@ -204,7 +251,7 @@ class BM25Vectorizer:
         """
         Hash token to vocabulary index.
 
-        Uses Python's built-in hash with modulo to map to vocab space.
+        Folds a stable 64-bit hash into the vocab space with modulo.
         This avoids needing to maintain a vocabulary file.
 
         Args:
@@ -213,10 +260,23 @@ class BM25Vectorizer:
         Returns:
             Integer index in [0, vocab_size)
         """
-        # Use built-in hash, make it positive, and mod by vocab size
-        return abs(hash(token)) % self.vocab_size
+        return stable_token_hash(token) % self.vocab_size
+
+    def has_corpus_stats(self, collection: str | None) -> bool:
+        """Whether corpus statistics (real avgdl / IDF) are available for a collection."""
+        return bool(
+            collection and self.corpus_stats and self.corpus_stats.has_collection(collection)
+        )
+
+    def _avg_doc_length_for(self, collection: str | None) -> float:
+        """Collection avgdl from corpus statistics, else the configured default."""
+        if self.has_corpus_stats(collection):
+            return self.corpus_stats.avg_doc_length(collection) or self.avg_doc_length
+        return self.avg_doc_length
 
-    def _calculate_tf(self, token_count: int, doc_length: int) -> float:
+    def _calculate_tf(
+        self, token_count: int, doc_length: int, avg_doc_length: float | None = None
+    ) -> float:
         """
         Calculate BM25 term frequency component.
 
@@ -225,25 +285,29 @@ class BM25Vectorizer:
         Args:
             token_count: Number of times token appears in document
             doc_length: Total number of tokens in document
+            avg_doc_length: avgdl to normalize against (default: self.avg_doc_length)
 
         Returns:
             BM25 TF score
         """
+        avgdl = avg_doc_length or self.avg_doc_length
         numerator = token_count * (self.k1 + 1)
-        denominator = token_count + self.k1 * (
-            1 - self.b + self.b * (doc_length / self.avg_doc_length)
-        )
+        denominator = token_count + self.k1 * (1 - self.b + self.b * (doc_length / avgdl))
         return numerator / denominator if denominator > 0 else 0.0
 
-    def generate_sparse_vector(self, text: str) -> dict[str, Any]:
+    def generate_sparse_vector(self, text: str, collection: str | None = None) -> dict[str, Any]:
         """
         Generate BM25 sparse vector for Qdrant.
 
         Returns a sparse vector in Qdrant format:
         {"indices": [int], "values": [float]}
 
+        Document vectors carry only the TF half of BM25; IDF is applied on the
+        query side (see generate_query_sparse_vector).
+
         Args:
             text: Input text to vectorize
+            collection: Target collection, normalizes length by its avgdl if tracked
 
         Returns:
             Dict with 'indices' (token IDs) and 'values' (BM25 scores)
@@ -256,6 +320,7 @@ class BM25Vectorizer:
         # Count token frequencies
         token_counts = Counter(tokens)
         doc_length = len(tokens)
+        avg_doc_length = self._avg_doc_length_for(collection)
 
         # Calculate BM25 scores for each unique token
         # Use dict to handle hash collisions by summing scores
@@ -263,7 +328,7 @@ class BM25Vectorizer:
 
         for token, count in token_counts.items():
             token_id = self._hash_token(token)
-            tf_score = self._calculate_tf(count, doc_length)
+            tf_score = self._calculate_tf(count, doc_length, avg_doc_length)
 
             # Only include tokens with positive scores
             if tf_score > 0:
@@ -280,15 +345,20 @@ class BM25Vectorizer:
 
         return {"indices": indices, "values": values}
 
-    def generate_query_sparse_vector(self, query: str) -> dict[str, Any]:
+    def generate_query_sparse_vector(
+        self, query: str, collection: str | None = None
+    ) -> dict[str, Any]:
         """
         Generate sparse vector for a search query.
 
         Queries are treated differently - we use simpler TF without length normalization
-        since queries are typically short.
+        since queries are typically short. When corpus statistics are available for the
+        collection, each term is weighted by its IDF, so Qdrant's dot product with the
+        stored TF vectors yields a full BM25 score.
 
         Args:
             query: Search query text
+            collection: Collection being searched (enables IDF weighting)
 
         Returns:
             Dict with 'indices' (token IDs) and 'values' (scores)
@@ -300,6 +370,7 @@ class BM25Vectorizer:
 
         # For queries, use simple term frequency (no length normalization)
         token_counts = Counter(tokens)
+        use_idf = self.has_corpus_stats(collection)
 
         # Use dict to handle hash collisions by summing scores
         index_scores: dict[int, float] = {}
@@ -308,6 +379,8 @@ class BM25Vectorizer:
             token_id = self._hash_token(token)
             # Simple TF for queries: log(1 + count) to dampen repeated terms
             score = math.log(1 + count)
+            if use_idf:
+                score *= self.corpus_stats.idf(collection, token_id)
             # Sum scores for same index (hash collision handling)
             if token_id in index_scores:
                 index_scores[token_id] += score
@@ -321,23 +394,58 @@ class BM25Vectorizer:
 
         return {"indices": indices, "values": values}
 
-    def generate_batch_sparse_vectors(self, texts: list[str]) -> list[dict[str, Any]]:
+    def generate_batch_sparse_vectors(
+        self, texts: list[str], max_workers: int | None = None, collection: str | None = None
+    ) -> list[dict[str, Any]]:
         """
         Generate sparse vectors for a batch of texts.
 
+        Large batches (PROCESS_POOL_MIN_TEXTS or more) are split across a process
+        pool; stable token hashing keeps worker output identical to in-process
+        output. This is CPU-bound - call it via asyncio.to_thread from async code.
+
         Args:
             texts: List of texts to vectorize
+            max_workers: Worker processes (default: CPU count, 1 disables the pool)
+            collection: Target collection, normalizes length by its avgdl if tracked
 
         Returns:
-            List of sparse vector dicts
+            List of sparse vector dicts, in input order
         """
-        return [self.generate_sparse_vector(text) for text in texts]
+        workers = max_workers or os.cpu_count() or 1
+        if workers <= 1 or len(texts) < PROCESS_POOL_MIN_TEXTS:
+            return [self.generate_sparse_vector(text, collection) for text in texts]
+
+        chunk_size = math.ceil(len(texts) / (workers * 4))
+        chunks = [texts[i : i + chunk_size] for i in range(0, len(texts), chunk_size)]
+        params = {
+            "vocab_size": self.vocab_size,
+            "k1": self.k1,
+            "b": self.b,
+            "min_token_length": self.min_token_length,
+            "max_token_length": self.max_token_length,
+            "avg_doc_length": self._avg_doc_length_for(collection),
+        }
+
+        # spawn: never fork a process that may be running threads / an event loop
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(params,),
+        ) as executor:
+            results: list[dict[str, Any]] = []
+            for chunk_vectors in executor.map(_vectorize_chunk, chunks):
+                results.extend(chunk_vectors)
+
+        logger.info(f"BM25 vectorized {len(texts)} texts with {workers} worker processes")
+        return results
 
     def update_avg_doc_length(self, avg_length: float) -> None:
         """
-        Update average document length for BM25 calculation.
+        Update the default average document length for BM25 calculation.
 
-        Should be called after indexing corpus to improve scoring accuracy.
+        Used for collections without corpus statistics.
 
         Args:
             avg_length: Average number of tokens per document in corpus
@@ -359,5 +467,7 @@ def get_bm25_vectorizer() -> BM25Vectorizer:
     """
     global _bm25_vectorizer
     if _bm25_vectorizer is None:
-        _bm25_vectorizer = BM25Vectorizer()
+        from core.bm25_stats import get_bm25_corpus_stats
+
+        _bm25_vectorizer = BM25Vectorizer(corpus_stats=get_bm25_corpus_stats())
     return _bm25_vectorizer
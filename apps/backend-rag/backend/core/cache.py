@@ -7,36 +7,85 @@ Features:
 - Automatic key generation
 - Cache invalidation
 - Hit/miss metrics
+- Bounded in-process LRU (entry count and byte size) shared by services
 """
 
 import hashlib
 import json
 import logging
+import math
+import sys
 import time
 from collections import OrderedDict
-from collections.abc import Callable
+from collections.abc import Callable, Hashable, Iterator
 from functools import wraps
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+try:
+    from app.metrics import local_cache_bytes, local_cache_entries, local_cache_events
+
+    METRICS_AVAILABLE = True
+except ImportError:
+    METRICS_AVAILABLE = False
+
 # Constants
 CACHE_KEY_HASH_LENGTH = 12
 DEFAULT_CACHE_TTL = 300
 DEFAULT_MAX_MEMORY_CACHE_SIZE = 1000
+SIZE_ESTIMATE_MAX_DEPTH = 4
+
+_SCALARS = (int, float, bool, complex, type(None))
+
+
+def estimate_size(value: Any, _depth: int = 0) -> int:
+    """
+    Approximate the memory footprint of a cached value in bytes.
+
+    Follows containers and object attributes a few levels deep. Sequences of
+    scalars (e.g. embedding vectors) are sized from their first element
+    instead of walking every item.
+    """
+    size = sys.getsizeof(value)
+    if _depth >= SIZE_ESTIMATE_MAX_DEPTH or isinstance(value, (str, bytes, bytearray, *_SCALARS)):
+        return size
+    if isinstance(value, dict):
+        return size + sum(
+            estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1) for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple, set, frozenset)):
+        if not value:
+            return size
+        if isinstance(value, (list, tuple)) and isinstance(value[0], _SCALARS):
+            return size + len(value) * sys.getsizeof(value[0])
+        return size + sum(estimate_size(item, _depth + 1) for item in value)
+    attributes = getattr(value, "__dict__", None)
+    if attributes is not None:
+        return size + estimate_size(attributes, _depth + 1)
+    return size
 
 
 class LRUCache:
     """
     LRU Cache with TTL support for in-memory fallback.
     Automatically evicts least recently used items when max size reached.
+
+    Optionally bounded by approximate byte size as well as entry count. Caches
+    created with a name report hits, misses, evictions and held bytes to
+    Prometheus (label cache=<name>). Supports dict-style access for callers
+    that used a plain dict before.
     """
 
     def __init__(
         self,
         max_size: int = DEFAULT_MAX_MEMORY_CACHE_SIZE,
         maxsize: int | None = None,  # Alias for max_size (for compatibility)
-        default_ttl: int = DEFAULT_CACHE_TTL,
+        default_ttl: float | None = DEFAULT_CACHE_TTL,
+        max_bytes: int | None = None,
+        name: str | None = None,
+        sizeof: Callable[[Any], int] = estimate_size,
+        on_evict: Callable[[Hashable, Any], None] | None = None,
     ):
         """
         Initialize LRU cache.
@@ -44,64 +93,116 @@ class LRUCache:
         Args:
             max_size: Maximum number of items to store
             maxsize: Alias for max_size (for compatibility with tests)
-            default_ttl: Default TTL in seconds
+            default_ttl: Default TTL in seconds (None = entries never expire)
+            max_bytes: Maximum approximate size of all values (None = unbounded)
+            name: Metrics label; unnamed caches keep local stats only
+            sizeof: Function estimating the size of a value in bytes
+            on_evict: Called with (key, value) when an entry is evicted to make room
         """
         self.max_size = maxsize if maxsize is not None else max_size
         self.default_ttl = default_ttl
-        self.cache: OrderedDict[
-            str, tuple[Any, float]
-        ] = OrderedDict()  # key -> (value, expire_time)
-
-    def get(self, key: str) -> Any | None:
-        """Get value from cache if not expired."""
-        if key not in self.cache:
+        self.max_bytes = max_bytes
+        self.name = name
+        self._sizeof = sizeof
+        self._on_evict = on_evict
+        # key -> (value, expire_time)
+        self.cache: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        self._sizes: dict[Hashable, int] = {}
+        self.total_bytes = 0
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "invalidations": 0}
+
+    def _event(self, event: str, count: int = 1) -> None:
+        self.stats[event] += count
+        if METRICS_AVAILABLE and self.name:
+            local_cache_events.labels(cache=self.name, event=event).inc(count)
+
+    def _remove(self, key: Hashable) -> None:
+        """Drop an entry and release its accounted bytes."""
+        del self.cache[key]
+        size = self._sizes.pop(key, 0)
+        self.total_bytes -= size
+        if METRICS_AVAILABLE and self.name:
+            local_cache_bytes.labels(cache=self.name).dec(size)
+            local_cache_entries.labels(cache=self.name).dec()
+
+    def _live_entry(self, key: Hashable) -> tuple[Any, float] | None:
+        entry = self.cache.get(key)
+        if entry is not None and time.time() > entry[1]:
+            self._remove(key)
+            self._event("expirations")
             return None
+        return entry
 
-        value, expire_time = self.cache[key]
-
-        # Check if expired
-        if time.time() > expire_time:
-            del self.cache[key]
-            return None
+    def get(self, key: Hashable, default: Any = None) -> Any | None:
+        """Get value from cache if not expired."""
+        entry = self._live_entry(key)
+        if entry is None:
+            self._event("misses")
+            return default
 
         # Move to end (most recently used)
         self.cache.move_to_end(key)
-        return value
+        self._event("hits")
+        return entry[0]
 
-    def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
         """Set value in cache with TTL."""
         ttl = ttl if ttl is not None else self.default_ttl
-        expire_time = time.time() + ttl
+        expire_time = time.time() + ttl if ttl is not None else math.inf
+        size = self._sizeof(value)
 
         if key in self.cache:
-            # Update existing
-            self.cache.move_to_end(key)
-        else:
-            # Check if we need to evict
-            if len(self.cache) >= self.max_size:
-                # Remove least recently used (first item)
-                self.cache.popitem(last=False)
+            self._remove(key)
+        if self.max_bytes is not None and size > self.max_bytes:
+            # Would evict everything else and still not fit
+            self._event("evictions")
+            return
+
+        # Evict least recently used (first items) until the new entry fits
+        while self.cache and (
+            len(self.cache) >= self.max_size
+            or (self.max_bytes is not None and self.total_bytes + size > self.max_bytes)
+        ):
+            evicted_key = next(iter(self.cache))
+            evicted_value = self.cache[evicted_key][0]
+            self._remove(evicted_key)
+            self._event("evictions")
+            if self._on_evict is not None:
+                self._on_evict(evicted_key, evicted_value)
 
         self.cache[key] = (value, expire_time)
+        self._sizes[key] = size
+        self.total_bytes += size
+        if METRICS_AVAILABLE and self.name:
+            local_cache_bytes.labels(cache=self.name).inc(size)
+            local_cache_entries.labels(cache=self.name).inc()
 
-    def delete(self, key: str) -> bool:
+    def delete(self, key: Hashable) -> bool:
         """Delete key from cache."""
         if key in self.cache:
-            del self.cache[key]
+            self._remove(key)
             return True
         return False
 
     def clear(self) -> int:
         """Clear all cache entries."""
         count = len(self.cache)
-        self.cache.clear()
+        for key in list(self.cache):
+            self._remove(key)
         return count
 
     def clear_pattern(self, pattern: str) -> int:
         """Clear keys matching pattern."""
-        keys_to_delete = [k for k in self.cache.keys() if pattern.replace("*", "") in k]
+        needle = pattern.replace("*", "")
+        return self.invalidate(lambda key: needle in key)
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Remove entries whose key matches predicate. Returns count of removed items."""
+        keys_to_delete = [k for k in self.cache if predicate(k)]
         for key in keys_to_delete:
-            del self.cache[key]
+            self._remove(key)
+        if keys_to_delete:
+            self._event("invalidations", len(keys_to_delete))
         return len(keys_to_delete)
 
     def cleanup_expired(self) -> int:
@@ -109,9 +210,51 @@ class LRUCache:
         now = time.time()
         expired_keys = [k for k, (_, expire_time) in self.cache.items() if now > expire_time]
         for key in expired_keys:
-            del self.cache[key]
+            self._remove(key)
+        if expired_keys:
+            self._event("expirations", len(expired_keys))
         return len(expired_keys)
 
+    def get_stats(self) -> dict[str, Any]:
+        """Get entry count, accounted bytes and hit/miss/eviction counters."""
+        return {
+            "name": self.name,
+            "entries": len(self.cache),
+            "bytes": self.total_bytes,
+            "max_size": self.max_size,
+            "max_bytes": self.max_bytes,
+            **self.stats,
+        }
+
+    # Dict-style access (expired entries behave as missing; not counted in stats)
+    def __contains__(self, key: Hashable) -> bool:
+        return self._live_entry(key) is not None
+
+    def __getitem__(self, key: Hashable) -> Any:
+        entry = self._live_entry(key)
+        if entry is None:
+            raise KeyError(key)
+        self.cache.move_to_end(key)
+        return entry[0]
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.set(key, value)
+
+    def __delitem__(self, key: Hashable) -> None:
+        if not self.delete(key):
+            raise KeyError(key)
+
+    def __len__(self) -> int:
+        return len(self.cache)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(list(self.cache))
+
+    def items(self) -> list[tuple[Hashable, Any]]:
+        """Snapshot of (key, value) pairs that have not expired."""
+        now = time.time()
+        return [(k, value) for k, (value, expire_time) in self.cache.items() if now <= expire_time]
+
 
 class CacheService:
     """
@@ -0,0 +1,408 @@
+"""
+Document Cache - local store of Google Drive PDFs and their extracted text
+
+Smart Oracle escalations used to search Drive (up to four files().list calls)
+and download the whole PDF for every query, blocking the event loop, and then
+throw the file away. The cache keeps, in a SQLite index shared by workers:
+
+- filename -> Drive file id (re-resolved after name_ttl, e.g. renamed files)
+- Drive file id -> sha256 of the content and Drive's md5Checksum, so a
+  re-resolved file is only downloaded again if its content changed
+
+and the content itself, addressed by sha256, as blobs/<sha256>.pdf plus the
+pre-extracted blobs/<sha256>.txt (an empty file marks a PDF without a text
+layer). A document reachable under several names or file ids is stored once.
+Blobs are kept under max_bytes by evicting the least recently used documents.
+
+Drive calls run on a dedicated single-thread executor (googleapiclient service
+objects are not thread-safe) under a request-level timeout. A fetch that
+outlives the timeout still completes and warms the cache for the next request;
+concurrent requests for the same document share one fetch.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from core.parsers import DocumentParseError, extract_text_from_pdf
+from googleapiclient.http import MediaIoBaseDownload
+
+logger = logging.getLogger(__name__)
+
+PDF_QUERY = "name contains '{name}' and mimeType = 'application/pdf' and trashed = false"
+DEFAULT_MAX_BYTES = 2 * 1024**3
+DEFAULT_NAME_TTL = 86400
+DEFAULT_REQUEST_TIMEOUT = 20.0
+HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def _default_drive_service() -> Any:
+    """Drive service of the Oracle Google services (imported lazily: needs app config)."""
+    from services.oracle_google_services import google_services
+
+    return google_services.drive_service
+
+
+def normalize_document_name(filename: str) -> str:
+    """Cache key for a filename: basename without extension, case-folded."""
+    return os.path.splitext(os.path.basename(filename.strip()))[0].strip().casefold()
+
+
+@dataclass
+class CachedDocument:
+    """A Drive PDF available locally"""
+
+    file_id: str
+    name: str
+    sha256: str
+    pdf_path: str
+    text: str | None = None  # None when the PDF has no extractable text
+
+
+class DocumentCache:
+    """
+    Content-addressed on-disk cache of Drive PDFs and their extracted text.
+
+    Returned pdf_path values point into the cache: callers must not delete them.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        name_ttl: float = DEFAULT_NAME_TTL,
+        request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+        drive_service: Callable[[], Any] | None = None,
+    ):
+        """
+        Initialize document cache.
+
+        Args:
+            cache_dir: Directory for the index and blobs (created if missing)
+            max_bytes: Size budget for cached PDFs and text
+            name_ttl: Seconds before a filename is resolved on Drive again
+            request_timeout: Deadline for one get(), Drive calls included
+            drive_service: Returns the Drive API service (default: google_services)
+        """
+        self.max_bytes = max_bytes
+        self.name_ttl = name_ttl
+        self.request_timeout = request_timeout
+        self._drive_service = drive_service or _default_drive_service
+
+        root = Path(cache_dir)
+        self.blob_dir = root / "blobs"
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()  # Guards the SQLite connection
+        self._drive_lock = threading.Lock()  # Serializes use of the Drive client
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="drive")
+        self._inflight: dict[str, asyncio.Future] = {}
+
+        self._conn = sqlite3.connect(
+            str(root / "index.sqlite3"), timeout=30, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS names (
+                name TEXT PRIMARY KEY, file_id TEXT NOT NULL, resolved_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS files (
+                file_id TEXT PRIMARY KEY, name TEXT NOT NULL, sha256 TEXT NOT NULL, md5 TEXT
+            );
+            CREATE TABLE IF NOT EXISTS blobs (
+                sha256 TEXT PRIMARY KEY, bytes INTEGER NOT NULL, last_access REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_files_sha256 ON files(sha256);
+            CREATE INDEX IF NOT EXISTS idx_blobs_last_access ON blobs(last_access);
+            """
+        )
+        self._conn.commit()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def get(self, filename: str) -> CachedDocument | None:
+        """
+        Get a document (PDF path and extracted text) by filename.
+
+        Served from disk when cached; otherwise resolved and downloaded from
+        Drive. Returns None if the document is not found, Drive is unavailable
+        or the request timeout expires.
+        """
+        key = normalize_document_name(filename)
+        if not key:
+            return None
+        try:
+            return await asyncio.wait_for(self._get(filename, key), timeout=self.request_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"⏱️ Document '{filename}' not ready within {self.request_timeout}s "
+                "(fetch continues in background)"
+            )
+            return None
+        except Exception as e:
+            logger.error(f"❌ Document cache error for '{filename}': {e}")
+            return None
+
+    def get_pdf_path(self, filename: str) -> str | None:
+        """Synchronous variant of get() returning only the cached PDF path (no timeout)."""
+        key = normalize_document_name(filename)
+        if not key:
+            return None
+        try:
+            document = self._lookup(key) or self._fetch(filename, key)
+        except Exception as e:
+            logger.error(f"❌ Document cache error for '{filename}': {e}")
+            return None
+        return document.pdf_path if document else None
+
+    def stats(self) -> dict[str, Any]:
+        """Number of cached documents and bytes used."""
+        with self._lock:
+            count, used = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(bytes), 0) FROM blobs"
+            ).fetchone()
+        return {"documents": count, "bytes": used, "max_bytes": self.max_bytes}
+
+    # ------------------------------------------------------------------
+    # Lookup / fetch
+    # ------------------------------------------------------------------
+
+    async def _get(self, filename: str, key: str) -> CachedDocument | None:
+        document = await asyncio.to_thread(self._lookup, key)
+        if document is None:
+            document = await self._fetch_once(filename, key)
+            if document is None:
+                return None
+        document.text = await asyncio.to_thread(self._ensure_text, document.sha256)
+        return document
+
+    async def _fetch_once(self, filename: str, key: str) -> CachedDocument | None:
+        """Fetch from Drive on the executor, sharing one fetch between concurrent callers."""
+        future = self._inflight.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._executor, self._fetch, filename, key)
+            self._inflight[key] = future
+
+            def _done(done: asyncio.Future) -> None:
+                self._inflight.pop(key, None)
+                if not done.cancelled():
+                    done.exception()  # Retrieved here in case every waiter timed out
+
+            future.add_done_callback(_done)
+        # Shielded: a waiter timing out must not cancel the fetch for the others
+        return await asyncio.shield(future)
+
+    def _lookup(self, key: str) -> CachedDocument | None:
+        """Cached document for a filename key, if resolved recently and still on disk."""
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT f.file_id, f.name, f.sha256 FROM names n
+                JOIN files f ON f.file_id = n.file_id
+                WHERE n.name = ? AND n.resolved_at > ?
+                """,
+                (key, time.time() - self.name_ttl),
+            ).fetchone()
+        if row is None:
+            return None
+        return self._load(*row)
+
+    def _load(self, file_id: str, name: str, sha256: str) -> CachedDocument | None:
+        pdf_path = self.blob_dir / f"{sha256}.pdf"
+        if not pdf_path.exists():
+            return None
+        with self._lock:
+            self._conn.execute(
+                "UPDATE blobs SET last_access = ? WHERE sha256 = ?", (time.time(), sha256)
+            )
+            self._conn.commit()
+        return CachedDocument(file_id=file_id, name=name, sha256=sha256, pdf_path=str(pdf_path))
+
+    def _fetch(self, filename: str, key: str) -> CachedDocument | None:
+        """Resolve filename on Drive and download it unless its content is already cached."""
+        service = self._drive_service()
+        if not service:
+            logger.warning("⚠️ Google Drive service not available")
+            return None
+
+        found = self._resolve(service, filename)
+        if found is None:
+            logger.warning(f"No file found on Drive for: {filename}")
+            return None
+        file_id, name, md5 = found["id"], found["name"], found.get("md5Checksum")
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT sha256, md5 FROM files WHERE file_id = ?", (file_id,)
+            ).fetchone()
+        document = None
+        if row and md5 and row[1] == md5:
+            document = self._load(file_id, name, row[0])
+
+        if document is None:
+            logger.info(f"⬇️ Downloading '{name}' (ID: {file_id}) from Drive")
+            sha256, size = self._download(service, file_id)
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO blobs (sha256, bytes, last_access) VALUES (?, ?, ?)",
+                    (sha256, size, time.time()),
+                )
+                self._conn.commit()
+            document = self._load(file_id, name, sha256)
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO files (file_id, name, sha256, md5) VALUES (?, ?, ?, ?)",
+                (file_id, name, document.sha256, md5),
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO names (name, file_id, resolved_at) VALUES (?, ?, ?)",
+                (key, file_id, time.time()),
+            )
+            self._conn.commit()
+        self._evict(keep=document.sha256)
+        return document
+
+    def _resolve(self, service: Any, filename: str) -> dict | None:
+        """First Drive PDF matching the filename or its separator variants."""
+        clean_name = os.path.splitext(os.path.basename(filename.strip()))[0]
+        variants = dict.fromkeys(
+            [
+                clean_name,
+                clean_name.replace("_", " "),
+                clean_name.replace("-", " "),
+                clean_name.replace("_", ""),
+            ]
+        )
+        for variant in variants:
+            escaped = variant.replace("\\", "\\\\").replace("'", "\\'")
+            with self._drive_lock:
+                results = (
+                    service.files()
+                    .list(
+                        q=PDF_QUERY.format(name=escaped),
+                        fields="files(id, name, md5Checksum, size)",
+                        pageSize=1,
+                    )
+                    .execute()
+                )
+            files = results.get("files", [])
+            if files:
+                logger.info(f"✅ Found match: '{files[0]['name']}' (ID: {files[0]['id']})")
+                return files[0]
+        return None
+
+    def _download(self, service: Any, file_id: str) -> tuple[str, int]:
+        """Stream a Drive file into the blob directory; returns (sha256, size)."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.blob_dir, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file, self._drive_lock:
+                downloader = MediaIoBaseDownload(
+                    tmp_file, service.files().get_media(fileId=file_id)
+                )
+                done = False
+                while not done:
+                    _, done = downloader.next_chunk()
+
+            digest = hashlib.sha256()
+            with open(tmp_path, "rb") as tmp_file:
+                for chunk in iter(lambda: tmp_file.read(HASH_CHUNK_BYTES), b""):
+                    digest.update(chunk)
+            sha256 = digest.hexdigest()
+            size = os.path.getsize(tmp_path)
+            os.replace(tmp_path, self.blob_dir / f"{sha256}.pdf")
+            return sha256, size
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    # ------------------------------------------------------------------
+    # Text extraction / eviction
+    # ------------------------------------------------------------------
+
+    def _ensure_text(self, sha256: str) -> str | None:
+        """Extracted text of a cached PDF, extracting (once) on first use."""
+        pdf_path = self.blob_dir / f"{sha256}.pdf"
+        text_path = self.blob_dir / f"{sha256}.txt"
+        if not text_path.exists():
+            try:
+                text = extract_text_from_pdf(str(pdf_path))
+            except DocumentParseError as e:
+                logger.warning(f"⚠️ No text layer in cached PDF {sha256[:12]}: {e}")
+                text = ""
+            fd, tmp_path = tempfile.mkstemp(dir=self.blob_dir, suffix=".part")
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+                tmp_file.write(text)
+            os.replace(tmp_path, text_path)
+            with self._lock:
+                self._conn.execute(
+                    "UPDATE blobs SET bytes = ? WHERE sha256 = ?",
+                    (pdf_path.stat().st_size + text_path.stat().st_size, sha256),
+                )
+                self._conn.commit()
+            self._evict(keep=sha256)
+            return text or None
+        return text_path.read_text(encoding="utf-8") or None
+
+    def _evict(self, keep: str) -> None:
+        """Delete least recently used documents until blobs fit in max_bytes."""
+        with self._lock:
+            used = self._conn.execute("SELECT COALESCE(SUM(bytes), 0) FROM blobs").fetchone()[0]
+            if used <= self.max_bytes:
+                return
+            victims = []
+            for sha256, size in self._conn.execute(
+                "SELECT sha256, bytes FROM blobs WHERE sha256 != ? ORDER BY last_access",
+                (keep,),
+            ).fetchall():
+                if used <= self.max_bytes:
+                    break
+                victims.append(sha256)
+                used -= size
+            for sha256 in victims:
+                self._conn.execute(
+                    "DELETE FROM names WHERE file_id IN (SELECT file_id FROM files WHERE sha256 = ?)",
+                    (sha256,),
+                )
+                self._conn.execute("DELETE FROM files WHERE sha256 = ?", (sha256,))
+                self._conn.execute("DELETE FROM blobs WHERE sha256 = ?", (sha256,))
+            self._conn.commit()
+        for sha256 in victims:
+            for suffix in (".pdf", ".txt"):
+                (self.blob_dir / f"{sha256}{suffix}").unlink(missing_ok=True)
+        if victims:
+            logger.info(f"🧹 Evicted {len(victims)} cached document(s)")
+
+
+_document_cache: DocumentCache | None = None
+
+
+def get_document_cache() -> DocumentCache:
+    """Process-wide DocumentCache configured from settings."""
+    global _document_cache
+    if _document_cache is None:
+        from app.core.config import settings
+
+        _document_cache = DocumentCache(
+            cache_dir=settings.document_cache_dir
+            or os.path.join(tempfile.gettempdir(), "zantara_documents"),
+            max_bytes=settings.document_cache_max_bytes,
+            name_ttl=settings.document_cache_name_ttl,
+            request_timeout=settings.timeout_drive_request,
+        )
+    return _document_cache
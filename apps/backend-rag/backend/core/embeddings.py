@@ -3,10 +3,30 @@ ZANTARA RAG - Embeddings Generation
 Supports both OpenAI and Sentence Transformers
 """
 
+import asyncio
+import hashlib
 import logging
+import sqlite3
+import threading
+import time
+import unicodedata
+from array import array
+from pathlib import Path
+
+from core.cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
+REDIS_SOCKET_TIMEOUT = 2.0  # Seconds; a slow or unreachable L2 must not stall embedding
+
+# Embedding cache metrics (optional - app.metrics pulls in prometheus/psutil)
+try:
+    from app.metrics import embedding_cache_hit_rate, embedding_cache_hits, embedding_cache_misses
+
+    METRICS_AVAILABLE = True
+except ImportError:
+    METRICS_AVAILABLE = False
+
 # Import settings - try both absolute paths
 try:
     from app.core.config import settings as _default_settings
@@ -23,6 +43,256 @@ except ImportError:
         _default_settings = None
 
 
+def pack_vector(vector: list[float]) -> bytes:
+    """Pack an embedding as little-endian float32 bytes (4 bytes/dim)."""
+    packed = array("f", vector)
+    if packed.itemsize != 4:
+        raise ValueError("Platform float is not 32-bit")
+    return packed.tobytes()
+
+
+def unpack_vector(data: bytes) -> list[float]:
+    """Unpack float32 bytes produced by pack_vector()."""
+    vector = array("f")
+    vector.frombytes(data)
+    return vector.tolist()
+
+
+class _DiskEmbeddingStore:
+    """SQLite-backed on-disk tier (used when Redis is not available)."""
+
+    def __init__(self, path: str, ttl: int):
+        self.ttl = ttl
+        db_path = Path(path)
+        db_path.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path / "embeddings.sqlite3"), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings "
+            "(key TEXT PRIMARY KEY, vector BLOB NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get_many(self, keys: list[str]) -> dict[str, bytes]:
+        placeholders = ",".join("?" * len(keys))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders}) AND expires_at > ?",
+                (*keys, time.time()),
+            ).fetchall()
+        return {key: bytes(vector) for key, vector in rows}
+
+    def set_many(self, items: dict[str, bytes]) -> None:
+        expires_at = time.time() + self.ttl
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector, expires_at) VALUES (?, ?, ?)",
+                [(key, value, expires_at) for key, value in items.items()],
+            )
+            self._conn.commit()
+
+
+class EmbeddingCache:
+    """
+    Two-tier, content-addressed embedding cache.
+
+    Tier 1 is an in-process LRU; tier 2 is Redis (shared across workers) or a local
+    SQLite file. Keys combine provider, model, dimensions and a hash of the normalized
+    text, so switching model never returns stale vectors. Vectors are stored as packed
+    float32 bytes in both tiers.
+    """
+
+    KEY_PREFIX = "zantara:emb"
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        ttl: int = 604800,
+        redis_client: object | None = None,
+        disk_path: str | None = None,
+    ):
+        """
+        Initialize embedding cache.
+
+        Args:
+            max_size: Max entries in the in-process LRU tier
+            ttl: TTL in seconds for both tiers
+            redis_client: Optional binary-safe Redis client (decode_responses=False)
+            disk_path: Optional directory for the SQLite tier (ignored if redis_client is set)
+        """
+        self.ttl = ttl
+        self._memory = LRUCache(max_size=max_size, default_ttl=ttl)
+        self._redis = redis_client
+        self._redis_checked = redis_client is None
+        self._disk_path = disk_path
+        self._disk = _DiskEmbeddingStore(disk_path, ttl) if disk_path and not redis_client else None
+        self.stats = {"memory_hits": 0, "l2_hits": 0, "misses": 0, "errors": 0}
+
+    def _check_redis(self) -> None:
+        """
+        Ping Redis on first L2 access, falling back to the local tiers if unreachable.
+
+        Deferred from construction so the ping (like every L2 call) happens in the
+        worker thread that runs generate_embeddings, not on the event loop.
+        """
+        if self._redis_checked:
+            return
+        self._redis_checked = True
+        try:
+            self._redis.ping()
+        except Exception as e:
+            logger.warning(f"⚠️ Embedding cache: Redis not available, using local tiers: {e}")
+            self._redis = None
+            if self._disk_path:
+                self._disk = _DiskEmbeddingStore(self._disk_path, self.ttl)
+
+    @property
+    def backend(self) -> str:
+        if self._redis is not None:
+            return "memory+redis"
+        if self._disk is not None:
+            return "memory+disk"
+        return "memory"
+
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """Normalize text for content addressing (NFC, collapsed whitespace)."""
+        return " ".join(unicodedata.normalize("NFC", text).split())
+
+    def make_key(self, provider: str, model: str, dimensions: int, text: str) -> str:
+        """Build cache key: zantara:emb:{provider}:{model}:{dims}:{sha256(normalized text)}"""
+        digest = hashlib.sha256(self.normalize_text(text).encode("utf-8")).hexdigest()
+        return f"{self.KEY_PREFIX}:{provider}:{model}:{dimensions}:{digest}"
+
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        """
+        Look up several keys, memory tier first then one batched L2 read.
+
+        Returns:
+            Mapping of found keys to vectors (missing keys are absent)
+        """
+        found: dict[str, bytes] = {}
+        missing = []
+        for key in keys:
+            packed = self._memory.get(key)
+            if packed is not None:
+                found[key] = packed
+            elif key not in missing:
+                missing.append(key)
+        memory_hits = len(found)
+
+        l2_found: dict[str, bytes] = {}
+        if missing:
+            self._check_redis()
+            try:
+                if self._redis is not None:
+                    values = self._redis.mget(missing)
+                    l2_found = {k: v for k, v in zip(missing, values, strict=True) if v}
+                elif self._disk is not None:
+                    l2_found = self._disk.get_many(missing)
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning(f"Embedding cache L2 read failed: {e}")
+            for key, packed in l2_found.items():
+                self._memory.set(key, packed)
+            found.update(l2_found)
+
+        misses = len(missing) - len(l2_found)
+        self._record(memory_hits, len(l2_found), misses)
+        return {key: unpack_vector(packed) for key, packed in found.items()}
+
+    def set_many(self, items: dict[str, list[float]]) -> None:
+        """Store vectors in both tiers (L2 write is a single pipeline/transaction)."""
+        if not items:
+            return
+        packed_items = {key: pack_vector(vector) for key, vector in items.items()}
+        for key, packed in packed_items.items():
+            self._memory.set(key, packed)
+        self._check_redis()
+        try:
+            if self._redis is not None:
+                pipe = self._redis.pipeline(transaction=False)
+                for key, packed in packed_items.items():
+                    pipe.setex(key, self.ttl, packed)
+                pipe.execute()
+            elif self._disk is not None:
+                self._disk.set_many(packed_items)
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"Embedding cache L2 write failed: {e}")
+
+    def _record(self, memory_hits: int, l2_hits: int, misses: int) -> None:
+        self.stats["memory_hits"] += memory_hits
+        self.stats["l2_hits"] += l2_hits
+        self.stats["misses"] += misses
+        if METRICS_AVAILABLE:
+            if memory_hits:
+                embedding_cache_hits.labels(tier="memory").inc(memory_hits)
+            if l2_hits:
+                embedding_cache_hits.labels(tier="l2").inc(l2_hits)
+            if misses:
+                embedding_cache_misses.inc(misses)
+            embedding_cache_hit_rate.set(self.hit_rate())
+
+    def hit_rate(self) -> float:
+        hits = self.stats["memory_hits"] + self.stats["l2_hits"]
+        total = hits + self.stats["misses"]
+        return hits / total if total else 0.0
+
+    def get_stats(self) -> dict:
+        """Get cache statistics"""
+        return {
+            "backend": self.backend,
+            **self.stats,
+            "memory_entries": len(self._memory.cache),
+            "hit_rate": f"{self.hit_rate() * 100:.1f}%",
+        }
+
+
+# Shared embedding cache instance (used by create_embeddings_generator)
+_embedding_cache: EmbeddingCache | None = None
+
+
+def get_embedding_cache() -> EmbeddingCache | None:
+    """
+    Get the shared embedding cache, built from settings on first use.
+
+    Returns:
+        EmbeddingCache instance, or None if disabled via EMBEDDING_CACHE_ENABLED
+    """
+    global _embedding_cache
+    if _embedding_cache is not None:
+        return _embedding_cache
+    if _default_settings is None or not getattr(_default_settings, "embedding_cache_enabled", True):
+        return None
+
+    redis_client = None
+    redis_url = getattr(_default_settings, "redis_url", None)
+    if redis_url:
+        try:
+            import redis
+
+            # Connection is checked on first use (EmbeddingCache._check_redis), off the loop
+            redis_client = redis.from_url(
+                redis_url,
+                decode_responses=False,
+                socket_connect_timeout=REDIS_SOCKET_TIMEOUT,
+                socket_timeout=REDIS_SOCKET_TIMEOUT,
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Embedding cache: Redis not available, using local tiers: {e}")
+            redis_client = None
+
+    _embedding_cache = EmbeddingCache(
+        max_size=_default_settings.embedding_cache_size,
+        ttl=_default_settings.embedding_cache_ttl,
+        redis_client=redis_client,
+        disk_path=_default_settings.embedding_cache_dir,
+    )
+    logger.info(f"✅ Embedding cache ready ({_embedding_cache.backend})")
+    return _embedding_cache
+
+
 class EmbeddingsGenerator:
     """
     Generate embeddings using configured provider (OpenAI or Sentence Transformers).
@@ -38,6 +308,7 @@ class EmbeddingsGenerator:
         model: str | None = None,
         provider: str | None = None,
         settings: object | None = None,
+        cache: EmbeddingCache | None = None,
     ):
         """
         Initialize embeddings generator.
@@ -48,8 +319,10 @@ class EmbeddingsGenerator:
             model: Embedding model name (default from settings)
             provider: "openai" or "sentence-transformers" (default from settings)
             settings: Optional settings object (for testing). If None, uses module-level settings.
+            cache: Optional embedding cache (None = always call the provider)
         """
         self._settings = settings if settings is not None else _default_settings
+        self.cache = cache
 
         # Determine provider from settings or parameter
         if provider:
@@ -158,15 +431,41 @@ class EmbeddingsGenerator:
             return []
 
         try:
-            if self.provider == "openai":
-                return self._generate_embeddings_openai(texts)
-            else:
-                return self._generate_embeddings_sentence_transformers(texts)
+            if self.cache is not None:
+                return self._generate_embeddings_cached(texts)
+            return self._generate_embeddings_provider(texts)
 
         except Exception as e:
             logger.error(f"Error generating embeddings: {e}")
             raise
 
+    def _generate_embeddings_provider(self, texts: list[str]) -> list[list[float]]:
+        """Call the configured provider directly (no cache)."""
+        if self.provider == "openai":
+            return self._generate_embeddings_openai(texts)
+        return self._generate_embeddings_sentence_transformers(texts)
+
+    def _generate_embeddings_cached(self, texts: list[str]) -> list[list[float]]:
+        """Serve cached vectors and call the provider only for unseen texts."""
+        keys = [self.cache.make_key(self.provider, self.model, self.dimensions, t) for t in texts]
+        cached = self.cache.get_many(keys)
+
+        # Embed each missing key once, even if the text repeats in the input
+        to_embed: dict[str, str] = {}
+        for key, text in zip(keys, texts, strict=True):
+            if key not in cached and key not in to_embed:
+                to_embed[key] = text
+
+        if to_embed:
+            fresh = self._generate_embeddings_provider(list(to_embed.values()))
+            new_items = dict(zip(to_embed.keys(), fresh, strict=True))
+            self.cache.set_many(new_items)
+            cached.update(new_items)
+        else:
+            logger.debug(f"Embedding cache: all {len(texts)} texts served from cache")
+
+        return [cached[key] for key in keys]
+
     def _generate_embeddings_openai(self, texts: list[str]) -> list[list[float]]:
         """
         Generate embeddings using OpenAI API.
@@ -269,12 +568,171 @@ class EmbeddingsGenerator:
         }
 
 
+class AsyncEmbeddingService:
+    """
+    Async front-end for EmbeddingsGenerator (OpenAI or Sentence Transformers).
+
+    Concurrent callers are coalesced into micro-batches: requests arriving within
+    `batch_window_ms` share one provider call, identical texts in a batch are embedded
+    once, and the blocking provider call runs in a worker thread so the event loop
+    is never blocked.
+    """
+
+    def __init__(
+        self,
+        embedder: "EmbeddingsGenerator",
+        batch_window_ms: float | None = None,
+        max_batch_size: int | None = None,
+        settings: object | None = None,
+    ):
+        """
+        Initialize async embedding service.
+
+        Args:
+            embedder: Underlying (synchronous) embeddings generator
+            batch_window_ms: Coalescing window in milliseconds (default from settings)
+            max_batch_size: Flush immediately once this many distinct texts are pending
+            settings: Optional settings object (for testing)
+        """
+        _settings = settings if settings is not None else _default_settings
+        self.embedder = embedder
+        if batch_window_ms is None:
+            batch_window_ms = getattr(_settings, "embedding_batch_window_ms", 5.0)
+        if max_batch_size is None:
+            max_batch_size = getattr(_settings, "embedding_max_batch_size", 64)
+        self.batch_window = max(float(batch_window_ms), 0.0) / 1000.0
+        self.max_batch_size = max(int(max_batch_size), 1)
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pending: dict[str, asyncio.Future] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._batch_tasks: set[asyncio.Task] = set()
+        self.stats = {"requests": 0, "deduplicated": 0, "batches": 0, "texts_embedded": 0}
+
+    @property
+    def provider(self) -> str:
+        return self.embedder.provider
+
+    @property
+    def dimensions(self) -> int:
+        return self.embedder.dimensions
+
+    async def embed_query(self, query: str) -> list[float]:
+        """
+        Embed a search query, coalescing with concurrent callers.
+
+        Args:
+            query: Search query text
+
+        Returns:
+            Query embedding vector
+        """
+        # shield: a cancelled caller must not cancel a future shared with other callers
+        return await asyncio.shield(self._enqueue(query))
+
+    async def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embed several texts, coalescing with concurrent callers.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            List of embedding vectors in input order
+        """
+        if not texts:
+            return []
+        futures = [self._enqueue(text) for text in texts]
+        return list(await asyncio.shield(asyncio.gather(*futures)))
+
+    def _enqueue(self, text: str) -> asyncio.Future:
+        """Register text in the current micro-batch and return its future."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Futures are bound to their loop - start a fresh batch on a new loop
+            self._loop = loop
+            self._pending = {}
+            self._flush_handle = None
+
+        self.stats["requests"] += 1
+        future = self._pending.get(text)
+        if future is not None:
+            self.stats["deduplicated"] += 1
+            return future
+
+        future = loop.create_future()
+        self._pending[text] = future
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._flush)
+        return future
+
+    def _flush(self) -> None:
+        """Dispatch the pending micro-batch to a worker thread."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, {}
+        task = self._loop.create_task(self._run_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, batch: dict[str, asyncio.Future]) -> None:
+        """Embed one micro-batch and resolve its futures."""
+        texts = list(batch)
+        self.stats["batches"] += 1
+        self.stats["texts_embedded"] += len(texts)
+
+        try:
+            if len(texts) == 1:
+                vectors = [
+                    await asyncio.to_thread(self.embedder.generate_query_embedding, texts[0])
+                ]
+            else:
+                vectors = await asyncio.to_thread(self.embedder.generate_embeddings, texts)
+            if len(vectors) != len(texts):
+                raise ValueError(
+                    f"Embedding provider returned {len(vectors)} vectors for {len(texts)} texts"
+                )
+        except Exception as e:
+            logger.error(f"Batched embedding failed ({len(texts)} texts): {e}")
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for text, vector in zip(texts, vectors, strict=True):
+            future = batch[text]
+            if not future.done():
+                future.set_result(vector)
+
+    def get_stats(self) -> dict:
+        """
+        Get coalescing statistics.
+
+        Returns:
+            Dictionary with request, batch and deduplication counters
+        """
+        batches = self.stats["batches"]
+        return {
+            **self.stats,
+            "avg_batch_size": round(self.stats["texts_embedded"] / batches, 2) if batches else 0.0,
+            "pending": len(self._pending),
+        }
+
+
 # Factory function for dependency injection
 def create_embeddings_generator(
     api_key: str | None = None,
     model: str | None = None,
     provider: str | None = None,
     settings: object | None = None,
+    cache: EmbeddingCache | None = None,
 ) -> EmbeddingsGenerator:
     """
     Factory function to create EmbeddingsGenerator instance.
@@ -285,11 +743,16 @@ def create_embeddings_generator(
         model: Embedding model name (default from settings)
         provider: "openai" or "sentence-transformers" (default from settings)
         settings: Optional settings object (for testing)
+        cache: Optional embedding cache (default: shared cache from get_embedding_cache())
 
     Returns:
         EmbeddingsGenerator instance
     """
-    return EmbeddingsGenerator(api_key=api_key, model=model, provider=provider, settings=settings)
+    if cache is None and settings is None:
+        cache = get_embedding_cache()
+    return EmbeddingsGenerator(
+        api_key=api_key, model=model, provider=provider, settings=settings, cache=cache
+    )
 
 
 # Convenience function
@@ -0,0 +1,167 @@
+"""
+Gazetteer - multi-pattern phrase matching for entity lookup
+
+Finds every known phrase (entity names, canonical names) mentioned in a text
+in one pass over its tokens, using a token-level Aho-Corasick automaton.
+
+Text and phrases are normalized the same way: accents stripped, case-folded,
+split into alphanumeric tokens (underscores and punctuation separate tokens),
+so "Software_Development" matches "software development" and "PT PMA" only
+matches on word boundaries.
+
+Phrases added after the automaton was compiled are matched from a small
+pending table until the next compile(), so additions take effect immediately
+without rebuilding the automaton on every insert.
+"""
+
+import re
+import threading
+import unicodedata
+from collections import deque
+from collections.abc import Hashable, Iterable
+
+_TOKEN_RE = re.compile(r"[^\W_]+")
+
+MIN_PHRASE_CHARS = 2  # Single-character phrases match almost any text
+
+
+def normalize_tokens(text: str) -> tuple[str, ...]:
+    """Split text into accent-stripped, case-folded alphanumeric tokens."""
+    if not text.isascii():
+        decomposed = unicodedata.normalize("NFKD", text)
+        text = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return tuple(_TOKEN_RE.findall(text.casefold()))
+
+
+class _Automaton:
+    """Aho-Corasick automaton over token sequences (immutable once built)."""
+
+    __slots__ = ("goto", "fail", "phrase", "output_link")
+
+    def __init__(self, phrases: Iterable[tuple[str, ...]]):
+        self.goto: list[dict[str, int]] = [{}]
+        self.phrase: list[tuple[str, ...] | None] = [None]
+        for tokens in phrases:
+            node = 0
+            for token in tokens:
+                nxt = self.goto[node].get(token)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[node][token] = nxt
+                    self.goto.append({})
+                    self.phrase.append(None)
+                node = nxt
+            self.phrase[node] = tokens
+
+        # Failure links (longest proper suffix that is a trie path) and output
+        # links (nearest node on the failure chain that ends a phrase), by BFS
+        self.fail = [0] * len(self.goto)
+        self.output_link = [0] * len(self.goto)
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for token, child in self.goto[node].items():
+                state = self.fail[node]
+                while state and token not in self.goto[state]:
+                    state = self.fail[state]
+                fail = self.goto[state].get(token, 0)
+                self.fail[child] = fail
+                self.output_link[child] = fail if self.phrase[fail] else self.output_link[fail]
+                queue.append(child)
+
+    def scan(self, tokens: tuple[str, ...]) -> Iterable[tuple[str, ...]]:
+        """Yield every phrase occurring in tokens (once per occurrence)."""
+        goto, fail, phrase, output_link = self.goto, self.fail, self.phrase, self.output_link
+        node = 0
+        for token in tokens:
+            while node and token not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(token, 0)
+            match = node if phrase[node] else output_link[node]
+            while match:
+                yield phrase[match]
+                match = output_link[match]
+
+
+class Gazetteer:
+    """
+    Maps phrases to keys and finds the keys whose phrases occur in a text.
+
+    Thread-safe: compile() may run in a worker thread while add() and find()
+    are called from the event loop.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._phrases: dict[tuple[str, ...], set[Hashable]] = {}
+        self._automaton = _Automaton(())
+        self._pending: set[tuple[str, ...]] = set()  # Phrases not in the automaton yet
+        self._pending_max_len = 0
+
+    def __len__(self) -> int:
+        return len(self._phrases)
+
+    @property
+    def pending(self) -> int:
+        """Number of phrases added since the last compile()."""
+        return len(self._pending)
+
+    def add(self, key: Hashable, phrases: Iterable[str | None]) -> None:
+        """Register phrases (e.g. name and canonical name) for key."""
+        with self._lock:
+            for text in phrases:
+                if not text or len(text) < MIN_PHRASE_CHARS:
+                    continue
+                tokens = normalize_tokens(text)
+                if not tokens:
+                    continue
+                keys = self._phrases.get(tokens)
+                if keys is None:
+                    self._phrases[tokens] = {key}
+                    self._pending.add(tokens)
+                    self._pending_max_len = max(self._pending_max_len, len(tokens))
+                else:
+                    keys.add(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._phrases = {}
+            self._automaton = _Automaton(())
+            self._pending = set()
+            self._pending_max_len = 0
+
+    def compile(self) -> None:
+        """Rebuild the automaton over all phrases (CPU-bound; run in a thread for large sets)."""
+        with self._lock:
+            phrases = list(self._phrases)
+            compiled = set(self._pending)
+        automaton = _Automaton(phrases)
+        with self._lock:
+            self._automaton = automaton
+            self._pending -= compiled
+            self._pending_max_len = max((len(p) for p in self._pending), default=0)
+
+    def find(self, text: str) -> list[Hashable]:
+        """
+        Keys whose phrases occur in text (each key once).
+
+        Cost is linear in the length of text (plus the number of matches),
+        independent of how many phrases are registered.
+        """
+        tokens = normalize_tokens(text)
+        if not tokens:
+            return []
+        with self._lock:
+            automaton, phrases = self._automaton, self._phrases
+            pending, pending_max_len = self._pending, self._pending_max_len
+            matched = list(automaton.scan(tokens))
+            if pending:
+                for start in range(len(tokens)):
+                    for end in range(start + 1, min(start + pending_max_len, len(tokens)) + 1):
+                        if tokens[start:end] in pending:
+                            matched.append(tokens[start:end])
+            keys: dict[Hashable, None] = {}
+            for tokens_matched in matched:
+                for key in phrases.get(tokens_matched, ()):
+                    keys.setdefault(key, None)
+        return list(keys)
@@ -3,6 +3,7 @@ Hierarchical Document Indexer
 Crea relazioni parent-child per retrieval gerarchico
 """
 
+import asyncio
 import json
 import logging
 from dataclasses import dataclass
@@ -19,6 +20,26 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+EMBEDDING_BATCH_SIZE = 64  # Chunks per embedding call; the next batch embeds during the upsert
+
+# parent_documents columns written on (re-)indexing; quality columns come from migration 022
+PARENT_DOCUMENT_COLUMNS = (
+    "id",
+    "document_id",
+    "type",
+    "title",
+    "full_text",
+    "char_count",
+    "pasal_count",
+    "metadata",
+)
+PARENT_QUALITY_COLUMNS = (
+    "text_fingerprint",
+    "is_incomplete",
+    "ocr_quality_score",
+    "needs_reextract",
+)
+
 
 @dataclass
 class HierarchicalChunk:
@@ -56,6 +77,8 @@ class HierarchicalIndexer:
         self.embeddings = embeddings
         self.chunker = chunker
         self.db_pool = None
+        self._parent_columns: tuple[str, ...] | None = None
+        self._parent_columns_pool = None  # Pool the columns were detected on
 
     async def _get_db_pool(self):
         """Get or create DB pool"""
@@ -171,13 +194,9 @@ class HierarchicalIndexer:
                 )
                 chunks_to_index.append(h_chunk)
 
-        # 6. Genera embeddings solo per i chunk (Pasal)
+        # 6-7. Genera embeddings solo per i chunk (Pasal) e upsert con struttura gerarchica
         if chunks_to_index:
-            chunk_texts = [c.text for c in chunks_to_index]
-            embeddings = self.embeddings.generate_embeddings(chunk_texts)
-
-            # 7. Upsert chunks con struttura gerarchica
-            await self._upsert_hierarchical_chunks(chunks_to_index, embeddings)
+            await self._embed_and_upsert_chunks(chunks_to_index)
 
         # 8. Upsert parent documents (BAB completi) - NO embedding, solo storage
         if parent_documents:
@@ -266,6 +285,34 @@ class HierarchicalIndexer:
         )
         chunks_to_index.append(chunk)
 
+    async def _embed_and_upsert_chunks(self, chunks: list[HierarchicalChunk]):
+        """
+        Embed chunks in batches of EMBEDDING_BATCH_SIZE and upsert them.
+
+        Embedding runs in a worker thread, so the next batch is embedded while
+        the current one is being upserted to Qdrant.
+        """
+        batches = [
+            chunks[i : i + EMBEDDING_BATCH_SIZE]
+            for i in range(0, len(chunks), EMBEDDING_BATCH_SIZE)
+        ]
+
+        def embed(batch: list[HierarchicalChunk]) -> asyncio.Future:
+            texts = [c.text for c in batch]
+            return asyncio.ensure_future(
+                asyncio.to_thread(self.embeddings.generate_embeddings, texts)
+            )
+
+        next_embeddings = embed(batches[0])
+        try:
+            for i, batch in enumerate(batches):
+                embeddings = await next_embeddings
+                if i + 1 < len(batches):
+                    next_embeddings = embed(batches[i + 1])
+                await self._upsert_hierarchical_chunks(batch, embeddings)
+        finally:
+            next_embeddings.cancel()  # No-op unless an upsert failed
+
     async def _upsert_hierarchical_chunks(self, chunks: list[HierarchicalChunk], embeddings):
         """Upsert chunks con payload gerarchico"""
         import uuid
@@ -313,88 +360,86 @@ class HierarchicalIndexer:
         for meta, cid in zip(metadatas, ids, strict=False):
             original_chunk_id = meta.get("chunk_id", "NONE")
             meta["chunk_id"] = cid
-            logger.info(f"UUID5: {original_chunk_id} → {cid}")
+            logger.debug(f"UUID5: {original_chunk_id} → {cid}")
 
         logger.info(f"Upserting {len(ids)} chunks with deterministic UUID5 IDs")
         await self.qdrant.upsert_documents(
             chunks=chunk_texts, embeddings=embeddings, metadatas=metadatas, ids=ids
         )
 
+    async def _parent_document_columns(self, pool, conn) -> tuple[str, ...]:
+        """Columns to write to parent_documents, detected once per pool"""
+        if self._parent_columns is None or self._parent_columns_pool is not pool:
+            # Same search_path resolution as the INSERT below
+            rows = await conn.fetch(
+                """
+                SELECT attname FROM pg_attribute
+                WHERE attrelid = to_regclass('parent_documents')
+                  AND attnum > 0 AND NOT attisdropped
+                """
+            )
+            existing = {row["attname"] for row in rows}
+            columns = PARENT_DOCUMENT_COLUMNS
+            if existing.issuperset(PARENT_QUALITY_COLUMNS):
+                columns += PARENT_QUALITY_COLUMNS
+            else:
+                logger.warning(
+                    "Quality columns not yet migrated, upserting parent documents without them"
+                )
+            self._parent_columns = columns
+            self._parent_columns_pool = pool
+        return self._parent_columns
+
     async def _upsert_parent_documents(self, parent_docs: list[dict]):
         """
         Salva documenti parent (BAB completi) in PostgreSQL.
+
+        Rows are staged with COPY into a temp table and merged with a single
+        INSERT ... ON CONFLICT DO UPDATE (re-ingestion overwrites).
         """
         pool = await self._get_db_pool()
 
+        # One row per id (last wins): ON CONFLICT cannot update a row twice in one statement
+        docs = list({doc["id"]: doc for doc in parent_docs}.values())
+        defaults = {"is_incomplete": False, "ocr_quality_score": 1.0, "needs_reextract": False}
+
         async with pool.acquire() as conn:
-            # Prepare batch insert
-            # We use ON CONFLICT DO UPDATE to handle re-ingestion
-            for doc in parent_docs:
-                # Try with new quality columns first
-                try:
-                    await conn.execute(
-                        """
-                        INSERT INTO parent_documents (
-                            id, document_id, type, title, full_text,
-                            char_count, pasal_count, metadata,
-                            text_fingerprint, is_incomplete, ocr_quality_score, needs_reextract
-                        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)
-                        ON CONFLICT (id) DO UPDATE SET
-                            title = EXCLUDED.title,
-                            full_text = EXCLUDED.full_text,
-                            char_count = EXCLUDED.char_count,
-                            pasal_count = EXCLUDED.pasal_count,
-                            metadata = EXCLUDED.metadata,
-                            text_fingerprint = EXCLUDED.text_fingerprint,
-                            is_incomplete = EXCLUDED.is_incomplete,
-                            ocr_quality_score = EXCLUDED.ocr_quality_score,
-                            needs_reextract = EXCLUDED.needs_reextract,
-                            created_at = NOW()
-                    """,
-                        doc["id"],
-                        doc["document_id"],
-                        doc["type"],
-                        doc["title"],
-                        doc["full_text"],
-                        doc["char_count"],
-                        doc["pasal_count"],
-                        json.dumps(doc["metadata"]),
-                        doc.get("text_fingerprint"),
-                        doc.get("is_incomplete", False),
-                        doc.get("ocr_quality_score", 1.0),
-                        doc.get("needs_reextract", False),
-                    )
-                except Exception as e:
-                    # Fall back to basic INSERT without quality columns
-                    if "does not exist" in str(e):
-                        logger.warning(f"Quality columns not yet migrated, using basic INSERT: {e}")
-                        await conn.execute(
-                            """
-                            INSERT INTO parent_documents (
-                                id, document_id, type, title, full_text,
-                                char_count, pasal_count, metadata
-                            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-                            ON CONFLICT (id) DO UPDATE SET
-                                title = EXCLUDED.title,
-                                full_text = EXCLUDED.full_text,
-                                char_count = EXCLUDED.char_count,
-                                pasal_count = EXCLUDED.pasal_count,
-                                metadata = EXCLUDED.metadata,
-                                created_at = NOW()
-                        """,
-                            doc["id"],
-                            doc["document_id"],
-                            doc["type"],
-                            doc["title"],
-                            doc["full_text"],
-                            doc["char_count"],
-                            doc["pasal_count"],
-                            json.dumps(doc["metadata"]),
-                        )
-                    else:
-                        raise
-
-        logger.info(f"✅ Upserted {len(parent_docs)} parent documents to PostgreSQL")
+            columns = await self._parent_document_columns(pool, conn)
+            records = [
+                tuple(
+                    json.dumps(doc["metadata"])
+                    if column == "metadata"
+                    else doc.get(column, defaults.get(column))
+                    for column in columns
+                )
+                for doc in docs
+            ]
+            column_list = ", ".join(columns)
+            updates = ", ".join(
+                f"{column} = EXCLUDED.{column}"
+                for column in columns
+                if column not in ("id", "document_id", "type")
+            )
+
+            async with conn.transaction():
+                await conn.execute(
+                    """
+                    CREATE TEMP TABLE parent_documents_stage
+                    (LIKE parent_documents INCLUDING DEFAULTS) ON COMMIT DROP
+                    """
+                )
+                await conn.copy_records_to_table(
+                    "parent_documents_stage", records=records, columns=columns
+                )
+                await conn.execute(
+                    f"""
+                    INSERT INTO parent_documents ({column_list})
+                    SELECT {column_list} FROM parent_documents_stage
+                    ON CONFLICT (id) DO UPDATE SET {updates}, created_at = NOW()
+                    """
+                )
+
+        logger.info(f"✅ Upserted {len(docs)} parent documents to PostgreSQL")
 
     async def close(self):
         if self.db_pool:
@@ -7,12 +7,20 @@ All operations are async to avoid blocking the event loop.
 """
 
 import asyncio
+import json
 import logging
 import time
 from typing import Any
 
 import httpx
 
+try:
+    import numpy as np
+    import orjson
+except ImportError:  # Optional: fast JSON with float32 vectors
+    np = None
+    orjson = None
+
 try:
     from app.core.config import settings
 except ImportError:
@@ -31,6 +39,41 @@ MAX_KEEPALIVE_CONNECTIONS = 10
 MAX_CONNECTIONS = 20
 CONNECT_TIMEOUT = 10.0  # seconds
 
+# Upload tuning
+DEFAULT_GRPC_PORT = 6334
+JSON_OFFLOAD_MIN_FLOATS = 50_000  # Encode larger REST payloads in a worker thread
+CONSISTENCY_CHECK_BATCH_SIZE = 1000
+CONSISTENCY_CHECK_RETRIES = 5
+CONSISTENCY_CHECK_DELAY = 0.2  # seconds, doubled per retry
+
+# Collection storage profiles: vector storage, HNSW and quantization settings used
+# by create_collection(), plus the search-time params that go with them.
+# Quantized vectors stay in RAM; originals move to disk and are only read to
+# rescore the oversampled candidates.
+COLLECTION_PROFILES: dict[str, dict[str, Any]] = {
+    "float32": {
+        "description": "Original float32 vectors in RAM, no quantization",
+        "on_disk": False,
+        "hnsw_config": None,
+        "quantization_config": None,
+        "search_params": None,
+    },
+    "scalar_int8": {
+        "description": "int8 scalar quantization in RAM (~4x smaller), originals on disk",
+        "on_disk": True,
+        "hnsw_config": {"m": 16, "ef_construct": 128},
+        "quantization_config": {"scalar": {"type": "int8", "quantile": 0.99, "always_ram": True}},
+        "search_params": {"hnsw_ef": 128, "quantization": {"rescore": True, "oversampling": 2.0}},
+    },
+    "binary": {
+        "description": "Binary quantization in RAM (~32x smaller), originals on disk",
+        "on_disk": True,
+        "hnsw_config": {"m": 16, "ef_construct": 100},
+        "quantization_config": {"binary": {"always_ram": True}},
+        "search_params": {"hnsw_ef": 128, "quantization": {"rescore": True, "oversampling": 3.0}},
+    },
+}
+
 # Metrics tracking
 _qdrant_metrics = {
     "search_calls": 0,
@@ -72,6 +115,43 @@ def get_qdrant_metrics() -> dict[str, Any]:
     return metrics
 
 
+def _setting(name: str, default: Any) -> Any:
+    """Read an optional setting, falling back to default if unset or of the wrong type."""
+    value = getattr(settings, name, None) if settings else None
+    return value if isinstance(value, type(default)) else default
+
+
+def _pack_vectors(vector: Any) -> Any:
+    """
+    Store dense vectors as float32 arrays (serialized by orjson in float32 precision).
+
+    Sparse vectors ({"indices": [...], "values": [...]}) are passed through
+    untouched: their indices are u32 token ids and must stay integers.
+    """
+    if orjson is None:
+        return vector
+    if isinstance(vector, dict):
+        if "indices" in vector:
+            return vector
+        return {name: _pack_vectors(v) for name, v in vector.items()}
+    if isinstance(vector, list):
+        return np.asarray(vector, dtype=np.float32)
+    return vector
+
+
+def _vector_size(vector: Any) -> int:
+    if isinstance(vector, dict):
+        return sum(_vector_size(v) for v in vector.values())
+    return len(vector)
+
+
+def _encode_json(payload: dict[str, Any]) -> bytes:
+    """Encode a request payload to JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(payload).encode("utf-8")
+
+
 async def _retry_with_backoff(
     func, max_retries: int = MAX_RETRIES, base_delay: float = RETRY_BASE_DELAY
 ):
@@ -130,6 +210,7 @@ class QdrantClient:
         collection_name: str | None = None,
         api_key: str | None = None,
         timeout: float | None = None,
+        profile: str | None = None,
     ):
         """
         Initialize Qdrant client.
@@ -139,6 +220,11 @@ class QdrantClient:
             collection_name: Name of collection to use
             api_key: Qdrant API key for authentication (default from settings)
             timeout: Request timeout in seconds (default from settings or 30)
+            profile: Collection profile (COLLECTION_PROFILES key) for searches on this
+                collection (default from QDRANT_COLLECTION_PROFILES)
+
+        Raises:
+            ValueError: If the profile is unknown
         """
         # Get Qdrant URL from settings
         self.qdrant_url = qdrant_url or (
@@ -157,8 +243,22 @@ class QdrantClient:
         # Remove trailing slash
         self.qdrant_url = self.qdrant_url.rstrip("/")
 
+        # Storage profile of the collection (decides search-time quantization params)
+        if profile and profile not in COLLECTION_PROFILES:
+            raise ValueError(f"Unknown collection profile: {profile}")
+        self.profile = profile or _setting("qdrant_collection_profiles", {}).get(
+            self.collection_name
+        )
+
+        # Upsert transport: "rest" (JSON) or "grpc" (packed float32 via qdrant-client)
+        self.upsert_transport = _setting("qdrant_upsert_transport", "rest")
+        self.grpc_port = _setting("qdrant_grpc_port", DEFAULT_GRPC_PORT)
+        # Batches uploaded concurrently; > 1 pipelines batches with wait=false
+        self.upsert_max_in_flight = _setting("qdrant_upsert_max_in_flight", 1)
+
         # Initialize HTTP client (lazy initialization with connection pooling)
         self._http_client: httpx.AsyncClient | None = None
+        self._grpc_client = None
 
         logger.info(
             f"Qdrant client initialized: collection='{self.collection_name}', "
@@ -201,6 +301,9 @@ class QdrantClient:
             await self._http_client.aclose()
             self._http_client = None
             logger.debug("✅ Closed Qdrant HTTP client")
+        if self._grpc_client is not None:
+            await self._grpc_client.close()
+            self._grpc_client = None
 
     async def __aenter__(self):
         """
@@ -288,6 +391,22 @@ class QdrantClient:
 
         return result if result else None
 
+    def _search_params_for(self, collection: str | None = None) -> dict[str, Any] | None:
+        """
+        Search params (HNSW ef, quantization rescore/oversampling) for a collection.
+
+        Args:
+            collection: Collection name (default: this client's collection)
+
+        Returns:
+            Qdrant "params" object, or None for unquantized collections
+        """
+        if collection is None or collection == self.collection_name:
+            profile = self.profile
+        else:
+            profile = _setting("qdrant_collection_profiles", {}).get(collection)
+        return (COLLECTION_PROFILES.get(profile) or {}).get("search_params")
+
     async def search(
         self,
         query_embedding: list[float],
@@ -327,6 +446,10 @@ class QdrantClient:
             else:
                 payload = {"vector": query_embedding, "limit": limit, "with_payload": True}
 
+            search_params = self._search_params_for()
+            if search_params:
+                payload["params"] = search_params
+
             # Add filter if provided (Qdrant filter format)
             if filter:
                 qdrant_filter = self._convert_filter_to_qdrant_format(filter)
@@ -415,6 +538,153 @@ class QdrantClient:
             logger.error(f"Qdrant search error after retries: {e}", exc_info=True)
             return {"ids": [], "documents": [], "metadatas": [], "distances": [], "total_found": 0}
 
+    @staticmethod
+    def _empty_results(search_type: str | None = None) -> dict[str, Any]:
+        result = {"ids": [], "documents": [], "metadatas": [], "distances": [], "total_found": 0}
+        if search_type:
+            result["scores"] = []
+            result["search_type"] = search_type
+        return result
+
+    @staticmethod
+    def _format_points(
+        points: list[dict[str, Any]], search_type: str | None = None
+    ) -> dict[str, Any]:
+        """Transform scored Qdrant points to the standard results format."""
+        result = {
+            "ids": [str(p["id"]) for p in points],
+            "documents": [p["payload"].get("text", "") for p in points],
+            "metadatas": [p["payload"].get("metadata", {}) for p in points],
+            "distances": [1.0 - p.get("score", 0) for p in points],
+            "total_found": len(points),
+        }
+        if search_type:
+            result["scores"] = [p.get("score", 0) for p in points]
+            result["search_type"] = search_type
+        return result
+
+    async def _run_batch_groups(
+        self, searches: list[dict[str, Any]], run_group
+    ) -> list[dict[str, Any]]:
+        """
+        Group searches by collection and run one batch request per collection.
+
+        All groups are sent concurrently over this client's pooled HTTP/2
+        connection, so N collections cost one network round-trip of latency.
+        """
+        groups: dict[str, list[int]] = {}
+        for position, search in enumerate(searches):
+            groups.setdefault(search.get("collection") or self.collection_name, []).append(position)
+
+        group_results = await asyncio.gather(
+            *(
+                run_group(collection, [searches[p] for p in positions])
+                for collection, positions in groups.items()
+            )
+        )
+
+        results: list[dict[str, Any]] = [{} for _ in searches]
+        for positions, group in zip(groups.values(), group_results, strict=True):
+            for position, result in zip(positions, group, strict=True):
+                results[position] = result
+        return results
+
+    async def search_batch(self, searches: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Run several dense searches with Qdrant's /points/search/batch endpoint.
+
+        Each search is a dict with the arguments of search() (query_embedding,
+        filter, limit, vector_name) plus an optional "collection" (default: this
+        client's collection). Searches are grouped into one batch request per
+        collection.
+
+        Args:
+            searches: Search specifications
+
+        Returns:
+            One result dict per search, in input order (same format as search())
+        """
+        for search in searches:
+            query_embedding = search.get("query_embedding")
+            if not query_embedding:
+                raise ValueError("query_embedding cannot be empty")
+            if not isinstance(query_embedding[0], (int, float)):
+                raise TypeError("query_embedding must be list of numbers")
+
+        async def _search_collection(collection: str, group: list[dict[str, Any]]):
+            url = f"/collections/{collection}/points/search/batch"
+            search_params = self._search_params_for(collection)
+            requests = []
+            for search in group:
+                vector_name = search.get("vector_name")
+                request = {
+                    "vector": (
+                        {"name": vector_name, "vector": search["query_embedding"]}
+                        if vector_name
+                        else search["query_embedding"]
+                    ),
+                    "limit": search.get("limit", 5),
+                    "with_payload": True,
+                }
+                if search_params:
+                    request["params"] = search_params
+                if search.get("filter"):
+                    qdrant_filter = self._convert_filter_to_qdrant_format(search["filter"])
+                    if qdrant_filter:
+                        request["filter"] = qdrant_filter
+                requests.append(request)
+
+            async def _do_search_batch():
+                client = await self._get_client()
+                named_vectors = False
+                try:
+                    response = await client.post(url, json={"searches": requests})
+                    response.raise_for_status()
+                except httpx.TimeoutException as e:
+                    logger.error(f"Qdrant batch search timeout: {e}")
+                    raise TimeoutError(f"Qdrant request timeout after {self.timeout}s") from e
+                except httpx.HTTPStatusError as e:
+                    error_text = e.response.text if hasattr(e.response, "text") else str(e.response)
+                    if 500 <= e.response.status_code < 600:
+                        raise Exception(
+                            f"Qdrant server error {e.response.status_code}: {error_text}"
+                        ) from e
+                    if e.response.status_code != 400 or "Vector params for" not in error_text:
+                        logger.error(
+                            f"Qdrant batch search failed: {e.response.status_code} - {error_text}"
+                        )
+                        return [self._empty_results() for _ in group]
+                    named_vectors = True
+                except httpx.RequestError as e:
+                    logger.error(f"Qdrant request error: {e}")
+                    raise ConnectionError(f"Qdrant connection error: {e}") from e
+
+                if named_vectors:
+                    # Collection uses named vectors: retry the unnamed requests with 'dense'
+                    logger.info("Collection uses named vectors, retrying batch with 'dense'")
+                    for request in requests:
+                        if not isinstance(request["vector"], dict):
+                            request["vector"] = {"name": "dense", "vector": request["vector"]}
+                    response = await client.post(url, json={"searches": requests})
+                    response.raise_for_status()
+
+                batches = response.json().get("result", [])
+                return [self._format_points(points) for points in batches]
+
+            start_time = time.time()
+            try:
+                results = await _retry_with_backoff(_do_search_batch)
+                _qdrant_metrics["search_calls"] += 1
+                _qdrant_metrics["search_total_time"] += time.time() - start_time
+                logger.debug(f"Qdrant batch search: collection={collection}, {len(group)} searches")
+                return results
+            except Exception as e:
+                _qdrant_metrics["errors"] += 1
+                logger.error(f"Qdrant batch search error after retries: {e}", exc_info=True)
+                return [self._empty_results() for _ in group]
+
+        return await self._run_batch_groups(searches, _search_collection)
+
     async def get_collection_stats(self) -> dict[str, Any]:
         """
         Get statistics about the collection.
@@ -445,6 +715,7 @@ class QdrantClient:
                     .get("vectors", {})
                     .get("distance", "Cosine"),
                     "status": data.get("status", "unknown"),
+                    "quantization": data.get("config", {}).get("quantization_config"),
                 }
             except httpx.HTTPStatusError as e:
                 logger.error(f"Failed to get collection stats: {e.response.status_code}")
@@ -466,6 +737,8 @@ class QdrantClient:
         distance: str = "Cosine",
         on_disk_payload: bool | None = None,
         enable_sparse: bool = False,
+        profile: str | None = None,
+        hnsw_config: dict[str, Any] | None = None,
     ) -> bool:
         """
         Create a new collection with optional sparse vector support.
@@ -475,23 +748,45 @@ class QdrantClient:
             distance: Distance metric (Cosine, Euclidean, Dot)
             on_disk_payload: Whether to store payload on disk (optional)
             enable_sparse: Enable BM25 sparse vector support for hybrid search
+            profile: Storage profile (COLLECTION_PROFILES key): quantization,
+                on-disk originals and HNSW settings (default: this client's profile)
+            hnsw_config: HNSW overrides, e.g. {"m": 32, "ef_construct": 256}
 
         Returns:
             True if successful
+
+        Raises:
+            ValueError: If the profile is unknown
         """
+        profile = profile or self.profile
+        if profile and profile not in COLLECTION_PROFILES:
+            raise ValueError(f"Unknown collection profile: {profile}")
+        profile_config = COLLECTION_PROFILES.get(profile) or COLLECTION_PROFILES["float32"]
+
         try:
             client = await self._get_client()
             url = f"/collections/{self.collection_name}"
 
+            dense = {"size": vector_size, "distance": distance}
+            if profile_config["on_disk"]:
+                dense["on_disk"] = True
+
             # Use named vectors for hybrid search compatibility
             if enable_sparse:
                 payload = {
-                    "vectors": {"dense": {"size": vector_size, "distance": distance}},
+                    "vectors": {"dense": dense},
                     "sparse_vectors": {"bm25": {"index": {"on_disk": False}}},
                 }
                 logger.info("Creating collection with sparse vector support (BM25)")
             else:
-                payload = {"vectors": {"size": vector_size, "distance": distance}}
+                payload = {"vectors": dense}
+
+            hnsw = {**(profile_config["hnsw_config"] or {}), **(hnsw_config or {})}
+            if hnsw:
+                payload["hnsw_config"] = hnsw
+            if profile_config["quantization_config"]:
+                payload["quantization_config"] = profile_config["quantization_config"]
+                logger.info(f"Creating collection with '{profile}' profile")
 
             if on_disk_payload is not None:
                 payload["on_disk_payload"] = on_disk_payload
@@ -515,6 +810,224 @@ class QdrantClient:
             logger.error(f"Error creating collection: {e}")
             return False
 
+    async def list_aliases(self) -> dict[str, str]:
+        """
+        List collection aliases.
+
+        Returns:
+            Mapping of alias name -> collection name
+        """
+        client = await self._get_client()
+        response = await client.get("/aliases")
+        response.raise_for_status()
+        aliases = response.json().get("result", {}).get("aliases", [])
+        return {a["alias_name"]: a["collection_name"] for a in aliases}
+
+    async def switch_alias(self, alias: str, collection: str) -> None:
+        """
+        Point an alias at a collection atomically (replacing its current target).
+
+        Args:
+            alias: Alias name
+            collection: Target collection name
+        """
+        actions = []
+        if alias in await self.list_aliases():
+            actions.append({"delete_alias": {"alias_name": alias}})
+        actions.append({"create_alias": {"collection_name": collection, "alias_name": alias}})
+
+        client = await self._get_client()
+        response = await client.post("/collections/aliases", json={"actions": actions})
+        response.raise_for_status()
+        logger.info(f"Alias '{alias}' -> '{collection}'")
+
+    def _get_grpc_client(self):
+        """
+        Get or create the qdrant-client gRPC client used for upserts.
+
+        gRPC sends vectors as packed float32 protobuf fields instead of JSON text.
+
+        Returns:
+            qdrant_client.AsyncQdrantClient (prefer_grpc=True)
+        """
+        if self._grpc_client is None:
+            from qdrant_client import AsyncQdrantClient
+
+            self._grpc_client = AsyncQdrantClient(
+                url=self.qdrant_url,
+                api_key=self.api_key,
+                grpc_port=self.grpc_port,
+                prefer_grpc=True,
+                timeout=int(self.timeout),
+            )
+            logger.debug(f"✅ Created Qdrant gRPC client: {self.qdrant_url}:{self.grpc_port}")
+        return self._grpc_client
+
+    async def _put_points(self, points: list[dict[str, Any]], wait: bool) -> None:
+        """
+        Upsert one batch of points with the configured transport.
+
+        REST batches with JSON_OFFLOAD_MIN_FLOATS or more vector values are encoded
+        to JSON bytes in a worker thread so the event loop is not blocked, with dense
+        vectors packed as float32 when orjson is available.
+
+        Args:
+            points: Points in Qdrant REST format
+            wait: Wait until the batch is applied (False: return once acknowledged)
+        """
+        if self.upsert_transport == "grpc":
+            from qdrant_client import models
+
+            grpc_points = []
+            for point in points:
+                vector = point["vector"]
+                if isinstance(vector, dict):
+                    vector = {
+                        name: (
+                            models.SparseVector(indices=v["indices"], values=v["values"])
+                            if isinstance(v, dict)
+                            else v
+                        )
+                        for name, v in vector.items()
+                    }
+                grpc_points.append(
+                    models.PointStruct(id=point["id"], vector=vector, payload=point["payload"])
+                )
+            await self._get_grpc_client().upsert(
+                collection_name=self.collection_name, points=grpc_points, wait=wait
+            )
+            return
+
+        client = await self._get_client()
+        url = f"/collections/{self.collection_name}/points"
+        params = {"wait": "true" if wait else "false"}
+
+        if sum(_vector_size(p["vector"]) for p in points) < JSON_OFFLOAD_MIN_FLOATS:
+            response = await client.put(url, json={"points": points}, params=params)
+        else:
+            payload = {"points": [{**p, "vector": _pack_vectors(p["vector"])} for p in points]}
+            content = await asyncio.to_thread(_encode_json, payload)
+            response = await client.put(
+                url,
+                content=content,
+                headers={"Content-Type": "application/json"},
+                params=params,
+            )
+        response.raise_for_status()
+
+    async def _missing_point_ids(self, ids: list[str]) -> list[str]:
+        """
+        Return the IDs that are not (yet) visible in the collection.
+
+        Used as the consistency check after pipelined wait=false uploads.
+        """
+        client = await self._get_client()
+        url = f"/collections/{self.collection_name}/points"
+        found: set[str] = set()
+        for i in range(0, len(ids), CONSISTENCY_CHECK_BATCH_SIZE):
+            response = await client.post(
+                url,
+                json={
+                    "ids": ids[i : i + CONSISTENCY_CHECK_BATCH_SIZE],
+                    "with_payload": False,
+                    "with_vector": False,
+                },
+            )
+            response.raise_for_status()
+            found.update(str(p["id"]) for p in response.json().get("result", []))
+        return [point_id for point_id in ids if str(point_id) not in found]
+
+    async def _upsert_batches(
+        self,
+        ids: list[str],
+        batch_size: int,
+        build_points,
+        max_in_flight: int | None = None,
+        before_batch=None,
+        after_batch=None,
+    ) -> tuple[int, list[str]]:
+        """
+        Upload points in batches, optionally pipelined.
+
+        With max_in_flight == 1 batches are sent one at a time with wait=true.
+        With a larger window up to max_in_flight batches are in flight at once with
+        wait=false, followed by a final consistency check that every point is visible;
+        points still missing are re-sent with wait=true.
+
+        Args:
+            ids: Point IDs (defines the batches)
+            batch_size: Points per batch
+            build_points: Callable(start, end) -> points for ids[start:end]
+            max_in_flight: Concurrent batches (default: settings / 1)
+            before_batch: Optional async callable(batch_ids) run before a batch is sent
+            after_batch: Optional callable(start, end, context) run in a worker thread after
+                a batch succeeded, context being before_batch's return value
+
+        Returns:
+            Tuple of (points upserted, error messages)
+        """
+        window = max(max_in_flight or self.upsert_max_in_flight, 1)
+        wait = window == 1
+        semaphore = asyncio.Semaphore(window)
+        total = len(ids)
+        errors: list[str] = []
+
+        async def upload(start: int) -> int:
+            end = min(start + batch_size, total)
+            async with semaphore:
+                try:
+                    context = await before_batch(ids[start:end]) if before_batch else None
+                    await self._put_points(build_points(start, end), wait=wait)
+                except httpx.HTTPStatusError as e:
+                    error_msg = f"HTTP {e.response.status_code}"
+                    if hasattr(e.response, "text"):
+                        error_msg += f": {e.response.text}"
+                    errors.append(error_msg)
+                    logger.error(f"Qdrant upsert batch failed: {error_msg}")
+                    return 0
+                except httpx.RequestError as e:
+                    error_msg = f"Request error: {e}"
+                    errors.append(error_msg)
+                    logger.error(f"Qdrant upsert batch request error: {error_msg}")
+                    return 0
+                except Exception as e:
+                    if self.upsert_transport != "grpc":
+                        raise
+                    error_msg = f"gRPC error: {e}"
+                    errors.append(error_msg)
+                    logger.error(f"Qdrant gRPC upsert batch failed: {error_msg}")
+                    return 0
+
+            if after_batch:
+                await asyncio.to_thread(after_batch, start, end, context)
+            logger.info(
+                f"Upserted batch {start // batch_size + 1}: {end - start}/{total} documents "
+                f"to Qdrant collection '{self.collection_name}'"
+            )
+            return end - start
+
+        added = await asyncio.gather(*(upload(start) for start in range(0, total, batch_size)))
+        total_added = sum(added)
+
+        if not wait and not errors and total_added:
+            # Final consistency check: acknowledged (wait=false) writes must become visible
+            missing = await self._missing_point_ids(ids)
+            for attempt in range(CONSISTENCY_CHECK_RETRIES):
+                if not missing:
+                    break
+                await asyncio.sleep(CONSISTENCY_CHECK_DELAY * (2**attempt))
+                missing = await self._missing_point_ids(missing)
+            if missing:
+                logger.warning(
+                    f"{len(missing)} points not visible after pipelined upload, re-sending with wait"
+                )
+                positions = {str(point_id): i for i, point_id in enumerate(ids)}
+                for point_id in missing:
+                    i = positions[str(point_id)]
+                    await self._put_points(build_points(i, i + 1), wait=True)
+
+        return total_added, errors
+
     async def upsert_documents(
         self,
         chunks: list[str],
@@ -522,6 +1035,7 @@ class QdrantClient:
         metadatas: list[dict[str, Any]],
         ids: list[str] | None = None,
         batch_size: int = 500,
+        max_in_flight: int | None = None,
     ) -> dict[str, Any]:
         """
         Insert or update documents in the collection.
@@ -533,6 +1047,7 @@ class QdrantClient:
             metadatas: List of metadata dictionaries
             ids: Optional list of document IDs (auto-generated if not provided)
             batch_size: Number of documents per batch (default: 500)
+            max_in_flight: Batches uploaded concurrently (default: QDRANT_UPSERT_MAX_IN_FLIGHT)
 
         Returns:
             Dictionary with operation results
@@ -543,9 +1058,6 @@ class QdrantClient:
         """
         start_time = time.time()
         try:
-            client = await self._get_client()
-            url = f"/collections/{self.collection_name}/points"
-
             # Generate IDs if not provided
             if not ids:
                 import uuid
@@ -556,48 +1068,19 @@ class QdrantClient:
             if not (len(chunks) == len(embeddings) == len(metadatas) == len(ids)):
                 raise ValueError("chunks, embeddings, metadatas, and ids must have same length")
 
-            # Batch processing for large uploads
-            total = len(chunks)
-            total_added = 0
-            errors = []
-
-            for i in range(0, total, batch_size):
-                batch_chunks = chunks[i : i + batch_size]
-                batch_embeddings = embeddings[i : i + batch_size]
-                batch_metadatas = metadatas[i : i + batch_size]
-                batch_ids = ids[i : i + batch_size]
-
-                # Build points array for this batch
-                points = []
-                for j in range(len(batch_chunks)):
-                    point = {
-                        "id": batch_ids[j],
-                        "vector": batch_embeddings[j],
-                        "payload": {"text": batch_chunks[j], "metadata": batch_metadatas[j]},
+            def build_points(start: int, end: int) -> list[dict[str, Any]]:
+                return [
+                    {
+                        "id": ids[j],
+                        "vector": embeddings[j],
+                        "payload": {"text": chunks[j], "metadata": metadatas[j]},
                     }
-                    points.append(point)
-
-                # Upsert batch via REST API
-                payload = {"points": points}
-                try:
-                    response = await client.put(url, json=payload, params={"wait": "true"})
-                    response.raise_for_status()
+                    for j in range(start, end)
+                ]
 
-                    total_added += len(batch_chunks)
-                    logger.info(
-                        f"Upserted batch {i // batch_size + 1}: {len(batch_chunks)}/{total} documents "
-                        f"to Qdrant collection '{self.collection_name}'"
-                    )
-                except httpx.HTTPStatusError as e:
-                    error_msg = f"HTTP {e.response.status_code}"
-                    if hasattr(e.response, "text"):
-                        error_msg += f": {e.response.text}"
-                    errors.append(error_msg)
-                    logger.error(f"Qdrant upsert batch failed: {error_msg}")
-                except httpx.RequestError as e:
-                    error_msg = f"Request error: {e}"
-                    errors.append(error_msg)
-                    logger.error(f"Qdrant upsert batch request error: {error_msg}")
+            total_added, errors = await self._upsert_batches(
+                ids, batch_size, build_points, max_in_flight=max_in_flight
+            )
 
             if errors:
                 return {
@@ -695,10 +1178,85 @@ class QdrantClient:
             logger.error(f"Qdrant get error: {e}")
             return {"ids": [], "embeddings": [], "documents": [], "metadatas": []}
 
+    def _get_corpus_stats(self):
+        """Shared BM25 corpus statistics, or None if disabled/unavailable."""
+        try:
+            from core.bm25_stats import get_bm25_corpus_stats
+
+            return get_bm25_corpus_stats()
+        except Exception as e:
+            logger.debug(f"BM25 corpus statistics unavailable: {e}")
+            return None
+
+    async def _fetch_bm25_footprints(self, ids: list[str]) -> list[tuple[list[int], int]]:
+        """
+        Fetch (sparse indices, token count) of existing points for corpus statistics.
+
+        The token count is read from the "bm25_length" payload field written on
+        upsert; only points indexed before that field existed have their text
+        fetched and re-tokenized (in a worker thread).
+        Points without a bm25 vector (missing, or dense-only) are skipped.
+
+        Args:
+            ids: Point IDs
+
+        Returns:
+            List of (indices, doc_length) tuples
+        """
+        client = await self._get_client()
+        url = f"/collections/{self.collection_name}/points"
+        payload = {"ids": ids, "with_payload": ["bm25_length"], "with_vector": ["bm25"]}
+        try:
+            response = await client.post(url, json=payload)
+            response.raise_for_status()
+            points = response.json().get("result", [])
+
+            footprints = []
+            legacy: dict[Any, list[int]] = {}
+            for point in points:
+                vector = point.get("vector")
+                sparse = vector.get("bm25") if isinstance(vector, dict) else None
+                if not sparse:
+                    continue
+                length = (point.get("payload") or {}).get("bm25_length")
+                if length is None:
+                    legacy[point.get("id")] = sparse.get("indices", [])
+                else:
+                    footprints.append((sparse.get("indices", []), length))
+
+            if legacy:
+                response = await client.post(
+                    url, json={"ids": list(legacy), "with_payload": ["text"], "with_vector": False}
+                )
+                response.raise_for_status()
+                texts = {
+                    point.get("id"): (point.get("payload") or {}).get("text", "")
+                    for point in response.json().get("result", [])
+                }
+                lengths = await asyncio.to_thread(
+                    self._bm25_lengths, [texts.get(point_id, "") for point_id in legacy]
+                )
+                footprints.extend(zip(legacy.values(), lengths, strict=True))
+        except (httpx.HTTPStatusError, httpx.RequestError) as e:
+            logger.warning(f"Could not fetch BM25 vectors for corpus statistics: {e}")
+            return []
+
+        return footprints
+
+    @staticmethod
+    def _bm25_lengths(texts: list[str]) -> list[int]:
+        """BM25 token count per text (CPU-bound; call from a worker thread)."""
+        from core.bm25_vectorizer import get_bm25_vectorizer
+
+        tokenize = get_bm25_vectorizer().tokenize
+        return [len(tokenize(text)) for text in texts]
+
     async def delete(self, ids: list[str]) -> dict[str, Any]:
         """
         Delete points by IDs (Qdrant-compatible interface).
 
+        Removes the points from BM25 corpus statistics when the collection is tracked.
+
         Args:
             ids: List of point IDs to delete
 
@@ -712,11 +1270,21 @@ class QdrantClient:
             client = await self._get_client()
             url = f"/collections/{self.collection_name}/points/delete"
 
+            corpus_stats = self._get_corpus_stats()
+            footprints = []
+            if corpus_stats and corpus_stats.has_collection(self.collection_name):
+                footprints = await self._fetch_bm25_footprints(ids)
+
             payload = {"points": ids}
             try:
                 response = await client.post(url, json=payload, params={"wait": "true"})
                 response.raise_for_status()
 
+                if footprints:
+                    await asyncio.to_thread(
+                        corpus_stats.remove_documents, self.collection_name, footprints
+                    )
+
                 logger.info(
                     f"Deleted {len(ids)} points from Qdrant collection '{self.collection_name}'"
                 )
@@ -805,12 +1373,12 @@ class QdrantClient:
             url = f"/collections/{self.collection_name}/points/query"
 
             # Build prefetch queries for both dense and sparse
+            dense_prefetch = {"query": query_embedding, "using": "dense", "limit": prefetch_limit}
+            search_params = self._search_params_for()
+            if search_params:
+                dense_prefetch["params"] = search_params
             prefetch = [
-                {
-                    "query": query_embedding,
-                    "using": "dense",
-                    "limit": prefetch_limit,
-                },
+                dense_prefetch,
                 {
                     "query": {
                         "indices": query_sparse["indices"],
@@ -901,6 +1469,115 @@ class QdrantClient:
             # Fall back to dense search on error
             return await self.search(query_embedding, filter=filter, limit=limit)
 
+    async def hybrid_search_batch(self, searches: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Run several hybrid (dense + BM25, RRF) searches with /points/query/batch.
+
+        Each search is a dict with the arguments of hybrid_search() (query_embedding,
+        query_sparse, filter, limit, prefetch_limit) plus an optional "collection".
+        Dense and sparse prefetches of every search in a collection travel in one
+        batch request; searches without a sparse vector query the dense vector only.
+        Collections without sparse vectors fall back to search_batch().
+
+        Args:
+            searches: Search specifications
+
+        Returns:
+            One result dict per search, in input order (same format as hybrid_search())
+        """
+
+        async def _query_collection(collection: str, group: list[dict[str, Any]]):
+            url = f"/collections/{collection}/points/query/batch"
+            search_params = self._search_params_for(collection)
+            requests = []
+            for search in group:
+                limit = search.get("limit", 5)
+                prefetch_limit = search.get("prefetch_limit", 20)
+                query_sparse = search.get("query_sparse")
+                dense = {"query": search["query_embedding"], "using": "dense"}
+                if search_params:
+                    dense["params"] = search_params
+                if query_sparse and query_sparse.get("indices"):
+                    request = {
+                        "prefetch": [
+                            {**dense, "limit": prefetch_limit},
+                            {
+                                "query": {
+                                    "indices": query_sparse["indices"],
+                                    "values": query_sparse["values"],
+                                },
+                                "using": "bm25",
+                                "limit": prefetch_limit,
+                            },
+                        ],
+                        "query": {"fusion": "rrf"},
+                    }
+                else:
+                    request = dense
+                request.update({"limit": limit, "with_payload": True})
+                if search.get("filter"):
+                    qdrant_filter = self._convert_filter_to_qdrant_format(search["filter"])
+                    if qdrant_filter:
+                        request["filter"] = qdrant_filter
+                requests.append(request)
+
+            async def _do_query_batch():
+                client = await self._get_client()
+                try:
+                    response = await client.post(url, json={"searches": requests})
+                    response.raise_for_status()
+                except httpx.HTTPStatusError as e:
+                    error_text = e.response.text if hasattr(e.response, "text") else str(e.response)
+                    if 500 <= e.response.status_code < 600:
+                        raise Exception(
+                            f"Qdrant server error {e.response.status_code}: {error_text}"
+                        ) from e
+                    return None
+                except httpx.RequestError as e:
+                    logger.error(f"Qdrant hybrid batch request error: {e}")
+                    raise ConnectionError(f"Qdrant connection error: {e}") from e
+
+                batches = response.json().get("result", [])
+                return [
+                    self._format_points(batch.get("points", []), search_type="hybrid_rrf")
+                    for batch in batches
+                ]
+
+            start_time = time.time()
+            try:
+                results = await _retry_with_backoff(_do_query_batch)
+            except Exception as e:
+                _qdrant_metrics["errors"] += 1
+                logger.error(f"Qdrant hybrid batch search error after retries: {e}", exc_info=True)
+                return [self._empty_results(search_type="hybrid_rrf") for _ in group]
+
+            if results is None:
+                # No sparse/named vectors in this collection (or request rejected): dense only
+                logger.warning(
+                    f"Hybrid batch search not available for '{collection}', "
+                    "falling back to dense batch search"
+                )
+                return await self.search_batch(
+                    [
+                        {
+                            "collection": collection,
+                            "query_embedding": s["query_embedding"],
+                            "filter": s.get("filter"),
+                            "limit": s.get("limit", 5),
+                        }
+                        for s in group
+                    ]
+                )
+
+            _qdrant_metrics["search_calls"] += 1
+            _qdrant_metrics["search_total_time"] += time.time() - start_time
+            logger.debug(
+                f"Qdrant hybrid batch search: collection={collection}, {len(group)} searches"
+            )
+            return results
+
+        return await self._run_batch_groups(searches, _query_collection)
+
     async def upsert_documents_with_sparse(
         self,
         chunks: list[str],
@@ -909,10 +1586,14 @@ class QdrantClient:
         metadatas: list[dict[str, Any]],
         ids: list[str] | None = None,
         batch_size: int = 500,
+        max_in_flight: int | None = None,
     ) -> dict[str, Any]:
         """
         Insert or update documents with both dense and sparse vectors.
 
+        BM25 corpus statistics are updated per successful batch; points that are
+        replaced are first removed from the statistics.
+
         Args:
             chunks: List of text chunks
             embeddings: List of dense embedding vectors
@@ -920,15 +1601,13 @@ class QdrantClient:
             metadatas: List of metadata dictionaries
             ids: Optional list of document IDs
             batch_size: Number of documents per batch
+            max_in_flight: Batches uploaded concurrently (default: QDRANT_UPSERT_MAX_IN_FLIGHT)
 
         Returns:
             Dictionary with operation results
         """
         start_time = time.time()
         try:
-            client = await self._get_client()
-            url = f"/collections/{self.collection_name}/points"
-
             # Generate IDs if not provided
             if not ids:
                 import uuid
@@ -943,50 +1622,45 @@ class QdrantClient:
                     "chunks, embeddings, sparse_vectors, metadatas, and ids must have same length"
                 )
 
-            total = len(chunks)
-            total_added = 0
-            errors = []
-
-            for i in range(0, total, batch_size):
-                batch_chunks = chunks[i : i + batch_size]
-                batch_embeddings = embeddings[i : i + batch_size]
-                batch_sparse = sparse_vectors[i : i + batch_size]
-                batch_metadatas = metadatas[i : i + batch_size]
-                batch_ids = ids[i : i + batch_size]
-
-                # Build points array with named vectors
-                points = []
-                for j in range(len(batch_chunks)):
-                    point = {
-                        "id": batch_ids[j],
-                        "vector": {
-                            "dense": batch_embeddings[j],
-                            "bm25": batch_sparse[j],
-                        },
-                        "payload": {"text": batch_chunks[j], "metadata": batch_metadatas[j]},
+            corpus_stats = self._get_corpus_stats()
+            doc_lengths = None
+            if corpus_stats:
+                # Stored in the payload so a later replace/delete needs no re-tokenizing
+                doc_lengths = await asyncio.to_thread(self._bm25_lengths, chunks)
+
+            def build_points(start: int, end: int) -> list[dict[str, Any]]:
+                # Named vectors: dense embedding + BM25 sparse vector
+                points = [
+                    {
+                        "id": ids[j],
+                        "vector": {"dense": embeddings[j], "bm25": sparse_vectors[j]},
+                        "payload": {"text": chunks[j], "metadata": metadatas[j]},
                     }
-                    points.append(point)
-
-                payload = {"points": points}
-                try:
-                    response = await client.put(url, json=payload, params={"wait": "true"})
-                    response.raise_for_status()
+                    for j in range(start, end)
+                ]
+                if doc_lengths:
+                    for j, point in enumerate(points, start):
+                        point["payload"]["bm25_length"] = doc_lengths[j]
+                return points
+
+            def update_corpus_stats(start: int, end: int, replaced) -> None:
+                corpus_stats.remove_documents(self.collection_name, replaced)
+                corpus_stats.add_documents(
+                    self.collection_name,
+                    [
+                        (sparse_vectors[j].get("indices", []), doc_lengths[j])
+                        for j in range(start, end)
+                    ],
+                )
 
-                    total_added += len(batch_chunks)
-                    logger.info(
-                        f"Upserted batch {i // batch_size + 1}: {len(batch_chunks)}/{total} documents "
-                        f"with sparse vectors to '{self.collection_name}'"
-                    )
-                except httpx.HTTPStatusError as e:
-                    error_msg = f"HTTP {e.response.status_code}"
-                    if hasattr(e.response, "text"):
-                        error_msg += f": {e.response.text}"
-                    errors.append(error_msg)
-                    logger.error(f"Qdrant upsert batch failed: {error_msg}")
-                except httpx.RequestError as e:
-                    error_msg = f"Request error: {e}"
-                    errors.append(error_msg)
-                    logger.error(f"Qdrant upsert batch request error: {error_msg}")
+            total_added, errors = await self._upsert_batches(
+                ids,
+                batch_size,
+                build_points,
+                max_in_flight=max_in_flight,
+                before_batch=self._fetch_bm25_footprints if corpus_stats else None,
+                after_batch=update_corpus_stats if corpus_stats else None,
+            )
 
             if errors:
                 return {
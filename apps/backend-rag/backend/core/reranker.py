@@ -1,24 +1,197 @@
 """
-ZANTARA RAG - Semantic Re-ranker (Ze-Rank 2 API)
-Implements external API-based re-ranking for high-precision retrieval without local CPU load.
+ZANTARA RAG - Semantic Re-rankers
+Pluggable re-ranking backends selected by create_reranker() (RERANKER_BACKEND):
+
+- zerank: external Ze-Rank 2 API (no local CPU load)
+- local: CPU cross-encoder running a quantized ONNX model
+- none: pass-through (keep vector order)
+- auto (default): Ze-Rank when ZERANK_API_KEY is set, else the local model when
+  RERANKER_ONNX_MODEL_PATH is set, else Ze-Rank pass-through
+
+The Ze-Rank HTTP client is shared process-wide (pooled, HTTP/2) and closed by the
+application shutdown handler via close_reranker_http_client().
 """
 
+import asyncio
+import hashlib
 import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import httpx
+import numpy as np
+from core.cache import LRUCache
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Connection pool configuration (shared by every ReRanker instance)
+MAX_KEEPALIVE_CONNECTIONS = 10
+MAX_CONNECTIONS = 20
+CONNECT_TIMEOUT = 5.0  # seconds
+REQUEST_TIMEOUT = 10.0  # seconds
+
+# Rerank scores are deterministic for a (query, document) pair
+SCORE_CACHE_TTL = 3600  # seconds
+
+# Local cross-encoder: worker threads running tokenization + ONNX inference
+LOCAL_RERANKER_WORKERS = 2
+
+_shared_http_client: httpx.AsyncClient | None = None
 
-class ReRanker:
+
+def get_reranker_http_client() -> httpx.AsyncClient:
+    """
+    Get or create the shared re-ranker HTTP client.
+
+    A single pooled HTTP/2 client lets concurrent rerank calls multiplex over
+    warm connections instead of paying a TCP+TLS handshake per request.
+
+    Returns:
+        httpx.AsyncClient instance with connection pool configured
+    """
+    global _shared_http_client
+    if _shared_http_client is None or _shared_http_client.is_closed:
+        _shared_http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT),
+            limits=httpx.Limits(
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                max_connections=MAX_CONNECTIONS,
+            ),
+            http2=True,
+        )
+        logger.debug("✅ Created Ze-Rank HTTP client with connection pool")
+    return _shared_http_client
+
+
+async def close_reranker_http_client() -> None:
+    """Close the shared re-ranker HTTP client (called on application shutdown)."""
+    global _shared_http_client
+    if _shared_http_client is not None:
+        await _shared_http_client.aclose()
+        _shared_http_client = None
+        logger.debug("✅ Ze-Rank HTTP client closed")
+
+
+class RerankerBackend(ABC):
+    """
+    Interface for re-ranking backends.
+
+    Implementations re-score (query, document) pairs and return documents sorted by
+    relevance with 'score' and 'rerank_score' updated. They must never raise from
+    rerank(): on failure they return the original order truncated to top_k.
+    """
+
+    name: str = "base"
+    enabled: bool = False
+
+    @abstractmethod
+    async def rerank(
+        self, query: str, documents: list[dict[str, Any]], top_k: int = 5
+    ) -> list[dict[str, Any]]:
+        """Re-rank documents for a query and return the top_k."""
+
+    async def rerank_many(
+        self, requests: list[tuple[str, list[dict[str, Any]]]], top_k: int = 5
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Re-rank several (query, documents) groups in one call.
+
+        Groups are scored concurrently, so backends that batch internally share
+        requests/inference batches across groups. Each group degrades independently
+        to its original order on failure.
+
+        Args:
+            requests: List of (query, documents) pairs
+            top_k: Number of top results to return per group
+
+        Returns:
+            Re-ranked documents for each group, in input order.
+        """
+        if not requests:
+            return []
+
+        results = await asyncio.gather(
+            *(self.rerank(query, documents, top_k=top_k) for query, documents in requests),
+            return_exceptions=True,
+        )
+
+        reranked: list[list[dict[str, Any]]] = []
+        for (_, documents), result in zip(requests, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(f"❌ Batch re-ranking group failed ({self.name}): {result}")
+                reranked.append(documents[:top_k])
+            else:
+                reranked.append(result)
+        return reranked
+
+    @staticmethod
+    def _extract_texts(
+        documents: list[dict[str, Any]],
+    ) -> tuple[list[dict[str, Any]], list[str]]:
+        """Split documents into those with text content and their texts."""
+        valid_docs = []
+        doc_texts = []
+        for doc in documents:
+            text = doc.get("text") or doc.get("content") or ""
+            if text:
+                doc_texts.append(text)
+                valid_docs.append(doc)
+        return valid_docs, doc_texts
+
+    @staticmethod
+    def _apply_scores(
+        documents: list[dict[str, Any]], scores: list[float | None], top_k: int
+    ) -> list[dict[str, Any]]:
+        """Write rerank scores onto documents and return the top_k by score."""
+        reranked_docs = []
+        for doc, score in zip(documents, scores, strict=True):
+            if score is None:
+                continue
+            doc["rerank_score"] = float(score)
+
+            # Preserve original score if needed
+            if "score" in doc and "vector_score" not in doc:
+                doc["vector_score"] = doc["score"]
+
+            # Update main score
+            doc["score"] = float(score)
+            reranked_docs.append(doc)
+
+        reranked_docs.sort(key=lambda x: x["score"], reverse=True)
+        return reranked_docs[:top_k]
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get backend statistics."""
+        return {"backend": self.name, "enabled": self.enabled}
+
+
+class PassThroughReranker(RerankerBackend):
+    """Re-ranker that keeps the vector search order (RERANKER_BACKEND=none)."""
+
+    name = "none"
+
+    async def rerank(
+        self,
+        query: str,  # noqa: ARG002 - interface signature
+        documents: list[dict[str, Any]],
+        top_k: int = 5,
+    ) -> list[dict[str, Any]]:
+        return documents[:top_k]
+
+
+class ReRanker(RerankerBackend):
     """
     Semantic Re-ranker using Ze-Rank 2 API.
     Re-scores (query, document) pairs to determine true relevance using an external GPU-accelerated service.
     """
 
+    name = "zerank"
+
     def __init__(self, model_name: str | None = None):
         """
         Initialize the Ze-Rank 2 Re-ranker.
@@ -31,17 +204,87 @@ class ReRanker:
         self.model_name = model_name or "zerank-2"
         self.enabled = bool(self.api_key)
 
+        # (query-hash, doc-id) -> relevance score
+        self.score_cache: LRUCache | None = None
+        if settings.reranker_cache_enabled:
+            self.score_cache = LRUCache(
+                max_size=settings.reranker_cache_size, default_ttl=SCORE_CACHE_TTL
+            )
+        self.cache_hits = 0
+        self.cache_misses = 0
+
         if not self.enabled:
             logger.warning("⚠️ ZERANK_API_KEY not set. Re-ranking will be disabled (pass-through).")
         else:
             logger.info(f"✅ Ze-Rank 2 initialized with endpoint: {self.api_url}")
 
+    def _query_hash(self, query: str) -> str:
+        """Hash the query together with the model so scores never leak across models."""
+        return hashlib.sha256(f"{self.model_name}:{query}".encode()).hexdigest()[:32]
+
+    @staticmethod
+    def _doc_key(doc: dict[str, Any], text: str) -> str:
+        """Stable document identity: explicit id when present, content hash otherwise."""
+        doc_id = doc.get("id")
+        if doc_id is None:
+            doc_id = (doc.get("metadata") or {}).get("chunk_id")
+        if doc_id is not None:
+            return f"id:{doc_id}"
+        return "sha:" + hashlib.sha256(text.encode()).hexdigest()[:32]
+
+    async def _score_remote(self, query: str, doc_texts: list[str]) -> list[float | None] | None:
+        """
+        Score documents against a query with one Ze-Rank 2 API call.
+
+        Returns:
+            One score per input text (None where the API omitted it), or None on failure.
+        """
+        # Ask for every document so all scores can be cached; top_k is applied locally
+        payload = {
+            "query": query,
+            "documents": doc_texts,
+            "model": self.model_name,
+            "top_k": len(doc_texts),
+        }
+
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+
+        client = get_reranker_http_client()
+        response = await client.post(self.api_url, json=payload, headers=headers)
+
+        if response.status_code != 200:
+            logger.error(f"❌ Ze-Rank 2 API Error: {response.status_code} - {response.text}")
+            return None
+
+        data = response.json()
+
+        # Assume standard rerank response format:
+        # { "results": [ { "index": 0, "relevance_score": 0.98 }, ... ] }
+        results = data.get("results", [])
+
+        if not results:
+            logger.warning("⚠️ Ze-Rank 2 returned no results")
+            return None
+
+        scores: list[float | None] = [None] * len(doc_texts)
+        for res in results:
+            idx = res.get("index")
+            if idx is not None and 0 <= idx < len(doc_texts):
+                scores[idx] = float(res.get("relevance_score", 0.0))
+        return scores
+
     async def rerank(
         self, query: str, documents: list[dict[str, Any]], top_k: int = 5
     ) -> list[dict[str, Any]]:
         """
         Re-rank a list of documents based on relevance to the query using Ze-Rank 2 API.
 
+        Documents whose (query, doc-id) score is cached are not sent to the API;
+        when every document is cached no request is made at all.
+
         Args:
             query: The search query
             documents: List of document dictionaries. Must contain 'text' or 'content' key.
@@ -54,81 +297,312 @@ class ReRanker:
             return documents[:top_k]
 
         # Extract text content from documents
-        doc_texts = []
-        valid_docs = []
-
-        for doc in documents:
-            text = doc.get("text") or doc.get("content") or ""
-            if text:
-                doc_texts.append(text)
-                valid_docs.append(doc)
+        valid_docs, doc_texts = self._extract_texts(documents)
 
         if not doc_texts:
             return documents[:top_k]
 
         try:
-            # Prepare payload for Ze-Rank 2 API
-            payload = {
-                "query": query,
-                "documents": doc_texts,
-                "model": self.model_name,
-                "top_k": top_k,
-            }
+            query_hash = self._query_hash(query)
+            cache_keys = [
+                f"{query_hash}:{self._doc_key(doc, text)}"
+                for doc, text in zip(valid_docs, doc_texts, strict=True)
+            ]
 
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-            }
+            scores: list[float | None] = [None] * len(valid_docs)
+            if self.score_cache is not None:
+                for i, key in enumerate(cache_keys):
+                    scores[i] = self.score_cache.get(key)
 
-            # Call Ze-Rank 2 API (async)
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(self.api_url, json=payload, headers=headers)
+            missing = [i for i, score in enumerate(scores) if score is None]
+            self.cache_hits += len(scores) - len(missing)
+            self.cache_misses += len(missing)
 
-                if response.status_code != 200:
-                    logger.error(
-                        f"❌ Ze-Rank 2 API Error: {response.status_code} - {response.text}"
-                    )
+            if missing:
+                remote_scores = await self._score_remote(query, [doc_texts[i] for i in missing])
+                if remote_scores is None:
                     return documents[:top_k]
 
-                data = response.json()
+                for i, score in zip(missing, remote_scores, strict=True):
+                    scores[i] = score
+                    if score is not None and self.score_cache is not None:
+                        self.score_cache.set(cache_keys[i], score)
 
-                # Assume standard rerank response format:
-                # { "results": [ { "index": 0, "relevance_score": 0.98 }, ... ] }
-                # Adjust parsing logic if the actual API format differs
-                results = data.get("results", [])
+            # Map scores back to documents
+            return self._apply_scores(valid_docs, scores, top_k)
 
-                if not results:
-                    logger.warning("⚠️ Ze-Rank 2 returned no results")
-                    return documents[:top_k]
+        except Exception as e:
+            logger.error(f"❌ Re-ranking failed (Ze-Rank 2): {e}")
+            # Fallback to original order
+            return documents[:top_k]
 
-                # Map results back to documents
-                reranked_docs = []
-                for res in results:
-                    idx = res.get("index")
-                    score = res.get("relevance_score", 0.0)
+    def get_stats(self) -> dict[str, Any]:
+        """Get score cache statistics."""
+        total = self.cache_hits + self.cache_misses
+        return {
+            **super().get_stats(),
+            "cache_enabled": self.score_cache is not None,
+            "cache_size": len(self.score_cache.cache) if self.score_cache is not None else 0,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_hit_rate": self.cache_hits / total if total else 0.0,
+        }
 
-                    if idx is not None and 0 <= idx < len(valid_docs):
-                        doc = valid_docs[idx]
-                        doc["rerank_score"] = float(score)
 
-                        # Preserve original score if needed
-                        if "score" in doc and "vector_score" not in doc:
-                            doc["vector_score"] = doc["score"]
+class LocalCrossEncoderReranker(RerankerBackend):
+    """
+    CPU cross-encoder re-ranker running a quantized ONNX model.
 
-                        # Update main score
-                        doc["score"] = float(score)
-                        reranked_docs.append(doc)
+    Expects a model directory with the ONNX graph (default model_quantized.onnx,
+    e.g. an int8 export of cross-encoder/ms-marco-MiniLM-L-6-v2) and its
+    tokenizer.json. Pairs from concurrent rerank calls are coalesced into shared
+    batches within `batch_window_ms`, each batch is padded only to its longest
+    pair, (query, document) pairs are truncated to `max_tokens`, and inference runs
+    on a dedicated thread pool so the event loop is never blocked.
+    """
 
-                # If API returned fewer docs than requested or something went wrong with mapping,
-                # we might want to fill with remaining original docs (rare)
-                # For now, just return what was successfully reranked
+    name = "local"
 
-                # Sort explicitly just in case API didn't
-                reranked_docs.sort(key=lambda x: x["score"], reverse=True)
+    def __init__(
+        self,
+        model_path: str | None = None,
+        model_file: str | None = None,
+        max_tokens: int | None = None,
+        max_batch_size: int | None = None,
+        batch_window_ms: float | None = None,
+        num_threads: int | None = None,
+        session: Any | None = None,
+        tokenizer: Any | None = None,
+    ):
+        """
+        Initialize the local cross-encoder.
 
-                return reranked_docs[:top_k]
+        Args:
+            model_path: Directory containing the ONNX model and tokenizer.json
+            model_file: ONNX file name inside model_path
+            max_tokens: Token budget per (query, document) pair
+            max_batch_size: Flush a coalesced batch early at this many pairs
+            batch_window_ms: Coalescing window in milliseconds
+            num_threads: ONNX Runtime intra-op threads
+            session: Optional pre-built inference session (for testing)
+            tokenizer: Optional pre-built tokenizer (for testing)
+        """
+        self.model_path = model_path or settings.reranker_onnx_model_path
+        self.model_file = model_file or settings.reranker_onnx_model_file
+        self.max_tokens = max(int(max_tokens or settings.reranker_max_tokens), 8)
+        self.max_batch_size = max(int(max_batch_size or settings.reranker_max_batch_size), 1)
+        if batch_window_ms is None:
+            batch_window_ms = settings.reranker_batch_window_ms
+        self.batch_window = max(float(batch_window_ms), 0.0) / 1000.0
+        self.num_threads = max(int(num_threads or settings.reranker_num_threads), 1)
+
+        self.session = session
+        self.tokenizer = tokenizer
+        self.enabled = False
+        self._input_names: list[str] = []
+        self._executor = ThreadPoolExecutor(
+            max_workers=LOCAL_RERANKER_WORKERS, thread_name_prefix="local-reranker"
+        )
 
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pending: dict[tuple[str, str], asyncio.Future] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._batch_tasks: set[asyncio.Task] = set()
+        self.stats = {"requests": 0, "batches": 0, "pairs_scored": 0, "inference_ms": 0.0}
+
+        try:
+            self._load()
+            self.enabled = True
+            logger.info(
+                f"✅ Local cross-encoder initialized: {self.model_path} "
+                f"(max_tokens={self.max_tokens}, batch={self.max_batch_size})"
+            )
         except Exception as e:
-            logger.error(f"❌ Re-ranking failed (Ze-Rank 2): {e}")
-            # Fallback to original order
+            logger.error(f"❌ Local cross-encoder unavailable, re-ranking disabled: {e}")
+
+    def _load(self) -> None:
+        """Load the ONNX session and tokenizer (unless injected)."""
+        if self.session is None or self.tokenizer is None:
+            if not self.model_path:
+                raise ValueError("RERANKER_ONNX_MODEL_PATH not set")
+
+            import onnxruntime as ort
+            from tokenizers import Tokenizer
+
+            if self.session is None:
+                options = ort.SessionOptions()
+                options.intra_op_num_threads = self.num_threads
+                options.inter_op_num_threads = 1
+                options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+                self.session = ort.InferenceSession(
+                    os.path.join(self.model_path, self.model_file),
+                    sess_options=options,
+                    providers=["CPUExecutionProvider"],
+                )
+            if self.tokenizer is None:
+                self.tokenizer = Tokenizer.from_file(
+                    os.path.join(self.model_path, "tokenizer.json")
+                )
+
+        self.tokenizer.enable_truncation(max_length=self.max_tokens, strategy="longest_first")
+        pad_id = self.tokenizer.token_to_id("[PAD]")
+        self.tokenizer.enable_padding(pad_id=pad_id if pad_id is not None else 0)
+        self._input_names = [i.name for i in self.session.get_inputs()]
+
+    async def rerank(
+        self, query: str, documents: list[dict[str, Any]], top_k: int = 5
+    ) -> list[dict[str, Any]]:
+        """
+        Re-rank documents with the local cross-encoder.
+
+        Args:
+            query: The search query
+            documents: List of document dictionaries. Must contain 'text' or 'content' key.
+            top_k: Number of top results to return
+
+        Returns:
+            List of re-ranked document dictionaries with updated 'score' and 'rerank_score'.
+        """
+        if not self.enabled or not documents:
+            return documents[:top_k]
+
+        valid_docs, doc_texts = self._extract_texts(documents)
+        if not doc_texts:
+            return documents[:top_k]
+
+        try:
+            futures = [self._enqueue(query, text) for text in doc_texts]
+            # shield: a cancelled caller must not cancel futures shared with other callers
+            scores = await asyncio.shield(asyncio.gather(*futures))
+            return self._apply_scores(valid_docs, list(scores), top_k)
+        except Exception as e:
+            logger.error(f"❌ Re-ranking failed (local cross-encoder): {e}")
             return documents[:top_k]
+
+    def _enqueue(self, query: str, text: str) -> asyncio.Future:
+        """Register a (query, document) pair in the current batch and return its future."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Futures are bound to their loop - start a fresh batch on a new loop
+            self._loop = loop
+            self._pending = {}
+            self._flush_handle = None
+
+        self.stats["requests"] += 1
+        key = (query, text)
+        future = self._pending.get(key)
+        if future is not None:
+            return future
+
+        future = loop.create_future()
+        self._pending[key] = future
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._flush)
+        return future
+
+    def _flush(self) -> None:
+        """Dispatch the pending batch to the inference thread pool."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, {}
+        task = self._loop.create_task(self._run_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, batch: dict[tuple[str, str], asyncio.Future]) -> None:
+        """Score one coalesced batch and resolve its futures."""
+        pairs = list(batch)
+        start = time.perf_counter()
+        try:
+            scores = await self._loop.run_in_executor(self._executor, self._score_pairs, pairs)
+        except Exception as e:
+            logger.error(f"❌ Local cross-encoder batch failed ({len(pairs)} pairs): {e}")
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self.stats["batches"] += 1
+        self.stats["pairs_scored"] += len(pairs)
+        self.stats["inference_ms"] += (time.perf_counter() - start) * 1000
+
+        for pair, score in zip(pairs, scores, strict=True):
+            future = batch[pair]
+            if not future.done():
+                future.set_result(score)
+
+    def _score_pairs(self, pairs: list[tuple[str, str]]) -> list[float]:
+        """
+        Score (query, document) pairs (runs in a worker thread).
+
+        Pairs are sorted by length and run in chunks of max_batch_size so each
+        chunk is padded only to its own longest pair.
+        """
+        order = sorted(range(len(pairs)), key=lambda i: len(pairs[i][0]) + len(pairs[i][1]))
+        scores = [0.0] * len(pairs)
+
+        for start in range(0, len(order), self.max_batch_size):
+            chunk = order[start : start + self.max_batch_size]
+            encodings = self.tokenizer.encode_batch([pairs[i] for i in chunk])
+            features = {
+                "input_ids": np.array([e.ids for e in encodings], dtype=np.int64),
+                "attention_mask": np.array([e.attention_mask for e in encodings], dtype=np.int64),
+                "token_type_ids": np.array([e.type_ids for e in encodings], dtype=np.int64),
+            }
+            inputs = {name: features[name] for name in self._input_names if name in features}
+            logits = np.asarray(self.session.run(None, inputs)[0], dtype=np.float32)
+            if logits.ndim > 1:
+                logits = logits[:, -1]
+            # Sigmoid maps logits to 0-1 so scores stay comparable with vector scores
+            chunk_scores = 1.0 / (1.0 + np.exp(-logits))
+            for i, score in zip(chunk, chunk_scores, strict=True):
+                scores[i] = float(score)
+
+        return scores
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get batching and inference statistics."""
+        batches = self.stats["batches"]
+        return {
+            **super().get_stats(),
+            **self.stats,
+            "avg_batch_size": round(self.stats["pairs_scored"] / batches, 2) if batches else 0.0,
+            "avg_inference_ms": round(self.stats["inference_ms"] / batches, 2) if batches else 0.0,
+        }
+
+
+def create_reranker(backend: str | None = None) -> RerankerBackend:
+    """
+    Factory function to create the configured re-ranking backend.
+
+    Args:
+        backend: "auto", "zerank", "local" or "none" (default: settings.reranker_backend)
+
+    Returns:
+        RerankerBackend instance
+    """
+    backend = (backend or settings.reranker_backend or "auto").lower()
+
+    if backend in ("none", "passthrough"):
+        return PassThroughReranker()
+    if backend == "zerank":
+        return ReRanker()
+    if backend == "local":
+        return LocalCrossEncoderReranker()
+    if backend != "auto":
+        logger.warning(f"⚠️ Unknown RERANKER_BACKEND '{backend}', using auto")
+
+    if settings.zerank_api_key:
+        return ReRanker()
+    if settings.reranker_onnx_model_path:
+        local = LocalCrossEncoderReranker()
+        if local.enabled:
+            return local
+    return ReRanker()
@@ -0,0 +1,37 @@
+"""
+Text Search - SQL fragments for indexed substring and full-text search
+
+Leading-wildcard LIKE/ILIKE cannot use B-tree indexes, so every search over
+free text scanned the whole table. Migration 029 adds the indexes these
+helpers are written against:
+
+- pg_trgm GIN indexes (gin_trgm_ops) on short fields (client names, emails,
+  phones, document titles) and on memory contents. `col ILIKE '%term%'` and
+  `col % term` (trigram similarity) both use them; rank with similarity().
+- `search_vector` tsvector columns on memory contents, holding both English
+  and Indonesian stems. Match with tsquery_sql() and rank with ts_rank().
+
+The configurations here must stay in sync with the generated columns in
+029_text_search_indexes.sql, otherwise queries stem differently than rows.
+"""
+
+TEXT_SEARCH_CONFIGS = ("english", "indonesian")
+
+_LIKE_ESCAPES = str.maketrans({"\\": "\\\\", "%": "\\%", "_": "\\_"})
+
+
+def like_pattern(term: str) -> str:
+    """Substring pattern for ILIKE, with LIKE wildcards in term matched literally."""
+    return f"%{term.translate(_LIKE_ESCAPES)}%"
+
+
+def tsquery_sql(param: str) -> str:
+    """
+    tsquery expression matching a user query (bound as param, e.g. "$1") in any
+    of TEXT_SEARCH_CONFIGS. Uses websearch_to_tsquery, which never raises on
+    user input ("quoted phrases", OR, -exclusions are honoured).
+    """
+    tsqueries = " || ".join(
+        f"websearch_to_tsquery('{config}', {param})" for config in TEXT_SEARCH_CONFIGS
+    )
+    return f"({tsqueries})"
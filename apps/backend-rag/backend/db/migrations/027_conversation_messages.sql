@@ -0,0 +1,132 @@
+-- ================================================
+-- Migration 027: Append-only conversation messages
+-- Created: 2026-10-16
+-- Purpose: Store conversation messages one row per message instead of
+--          rewriting the whole conversations.messages JSONB array on every
+--          turn, and materialize the list-view summary on conversations.
+-- Idempotency: YES (IF NOT EXISTS, backfill skips converted conversations)
+-- Dependencies: None (conversations table from 002_memory_system_schema)
+-- ================================================
+--
+-- This migration creates:
+-- 1. conversation_messages table - one row per message, keyed by
+--    (conversation_id, seq) for appends and keyset pagination
+-- 2. Summary columns on conversations - message_count, title,
+--    last_message_preview, updated_at (maintained on append)
+-- 3. conversation_messages_json() - JSONB transcript for readers that
+--    still expect the old messages array
+-- 4. Backfill of existing conversations.messages arrays
+--
+-- conversations.messages is no longer written (new rows get '[]'); it is
+-- kept so the backfill can be re-run and old data checked before dropping.
+
+-- ================================================
+-- 1. CONVERSATION_MESSAGES TABLE
+-- ================================================
+
+CREATE TABLE IF NOT EXISTS conversation_messages (
+    conversation_id INTEGER NOT NULL REFERENCES conversations(id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL, -- 1-based position in the conversation
+
+    role TEXT NOT NULL DEFAULT 'unknown',
+    content TEXT NOT NULL DEFAULT '',
+    extra JSONB NOT NULL DEFAULT '{}'::jsonb, -- Other message keys (sources, imageUrl, ...)
+
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    PRIMARY KEY (conversation_id, seq)
+);
+
+COMMENT ON TABLE conversation_messages IS 'Append-only conversation messages (one row per message)';
+COMMENT ON COLUMN conversation_messages.seq IS '1-based message position; (conversation_id, seq) is the pagination key';
+COMMENT ON COLUMN conversation_messages.extra IS 'Message keys other than role and content';
+
+-- ================================================
+-- 2. MATERIALIZED SUMMARY ON CONVERSATIONS
+-- ================================================
+
+ALTER TABLE conversations ADD COLUMN IF NOT EXISTS message_count INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE conversations ADD COLUMN IF NOT EXISTS title TEXT;
+ALTER TABLE conversations ADD COLUMN IF NOT EXISTS last_message_preview TEXT;
+ALTER TABLE conversations ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ;
+ALTER TABLE conversations ALTER COLUMN messages SET DEFAULT '[]'::jsonb;
+
+-- Latest conversation of a user's session (append target and /history lookup)
+CREATE INDEX IF NOT EXISTS idx_conversations_user_session_created
+ON conversations(user_id, session_id, created_at DESC);
+
+-- Conversation list, most recently active first
+CREATE INDEX IF NOT EXISTS idx_conversations_user_activity
+ON conversations(user_id, (COALESCE(updated_at, created_at)) DESC);
+
+COMMENT ON COLUMN conversations.message_count IS 'Number of rows in conversation_messages';
+COMMENT ON COLUMN conversations.title IS 'First user message (truncated), for the conversation list';
+COMMENT ON COLUMN conversations.last_message_preview IS 'Last assistant message (truncated), for the conversation list';
+
+-- ================================================
+-- 3. TRANSCRIPT FUNCTION
+-- ================================================
+-- Rebuilds the legacy messages array (optionally only the last N messages)
+
+CREATE OR REPLACE FUNCTION conversation_messages_json(conv_id INTEGER, max_messages INTEGER DEFAULT NULL)
+RETURNS jsonb AS $$
+    SELECT COALESCE(
+        jsonb_agg(jsonb_build_object('role', m.role, 'content', m.content) || m.extra ORDER BY m.seq),
+        '[]'::jsonb
+    )
+    FROM (
+        SELECT seq, role, content, extra
+        FROM conversation_messages
+        WHERE conversation_id = conv_id
+        ORDER BY seq DESC
+        LIMIT max_messages
+    ) m;
+$$ LANGUAGE sql STABLE;
+
+-- ================================================
+-- 4. BACKFILL
+-- ================================================
+
+INSERT INTO conversation_messages (conversation_id, seq, role, content, extra, created_at)
+SELECT
+    c.id,
+    m.ordinality,
+    CASE WHEN jsonb_typeof(m.value) = 'object' THEN COALESCE(m.value->>'role', 'unknown') ELSE 'unknown' END,
+    CASE WHEN jsonb_typeof(m.value) = 'object' THEN COALESCE(m.value->>'content', '') ELSE m.value #>> '{}' END,
+    CASE WHEN jsonb_typeof(m.value) = 'object' THEN m.value - 'role' - 'content' ELSE '{}'::jsonb END,
+    COALESCE(c.created_at, NOW())
+FROM conversations c
+CROSS JOIN LATERAL jsonb_array_elements(
+    CASE WHEN jsonb_typeof(c.messages) = 'array' THEN c.messages ELSE '[]'::jsonb END
+) WITH ORDINALITY AS m(value, ordinality)
+WHERE c.message_count = 0
+ON CONFLICT (conversation_id, seq) DO NOTHING;
+
+UPDATE conversations c
+SET
+    message_count = s.message_count,
+    title = s.title,
+    last_message_preview = s.last_message_preview,
+    updated_at = COALESCE(c.updated_at, c.created_at)
+FROM (
+    SELECT
+        cm.conversation_id,
+        MAX(cm.seq) AS message_count,
+        (
+            SELECT CASE WHEN length(u.content) > 50 THEN left(u.content, 50) || '...' ELSE u.content END
+            FROM conversation_messages u
+            WHERE u.conversation_id = cm.conversation_id AND u.role = 'user'
+            ORDER BY u.seq
+            LIMIT 1
+        ) AS title,
+        (
+            SELECT CASE WHEN length(a.content) > 100 THEN left(a.content, 100) || '...' ELSE a.content END
+            FROM conversation_messages a
+            WHERE a.conversation_id = cm.conversation_id AND a.role = 'assistant'
+            ORDER BY a.seq DESC
+            LIMIT 1
+        ) AS last_message_preview
+    FROM conversation_messages cm
+    GROUP BY cm.conversation_id
+) s
+WHERE c.id = s.conversation_id AND c.message_count = 0;
@@ -0,0 +1,74 @@
+-- ================================================
+-- Migration 028: Golden answer question embeddings
+-- Created: 2026-10-16
+-- Purpose: Persist canonical-question embeddings next to golden answers so
+--          GoldenAnswerService loads them once into an in-memory matrix
+--          instead of re-encoding the canonical questions on every lookup.
+-- Idempotency: YES (IF NOT EXISTS, CREATE OR REPLACE, DROP TRIGGER IF EXISTS)
+-- Dependencies: 001_golden_answers_schema (golden_answers, updated_at trigger)
+-- ================================================
+--
+-- This migration creates:
+-- 1. question_embedding / embedding_model / embedding_updated_at columns on
+--    golden_answers
+-- 2. A trigger clearing the embedding when canonical_question changes, so a
+--    stale vector is never served
+-- 3. A WHEN clause on update_golden_answers_updated_at so writing an
+--    embedding does not move updated_at
+--
+-- Embeddings are computed by the service (SentenceTransformer) for rows where
+-- question_embedding is NULL or embedding_model differs from the model in use,
+-- then written back with embedding_updated_at = NOW(). The in-memory index
+-- refreshes from updated_at (idx_golden_updated) and embedding_updated_at.
+-- migration_028.py backfills existing rows after applying this file.
+
+-- ================================================
+-- 1. EMBEDDING COLUMNS
+-- ================================================
+
+ALTER TABLE golden_answers ADD COLUMN IF NOT EXISTS question_embedding REAL[];
+ALTER TABLE golden_answers ADD COLUMN IF NOT EXISTS embedding_model TEXT;
+ALTER TABLE golden_answers ADD COLUMN IF NOT EXISTS embedding_updated_at TIMESTAMP;
+
+CREATE INDEX IF NOT EXISTS idx_golden_embedding_updated ON golden_answers(embedding_updated_at);
+
+COMMENT ON COLUMN golden_answers.question_embedding IS 'Normalized embedding of canonical_question (NULL = not computed yet)';
+COMMENT ON COLUMN golden_answers.embedding_model IS 'Model that produced question_embedding';
+COMMENT ON COLUMN golden_answers.embedding_updated_at IS 'When question_embedding was last written';
+
+-- ================================================
+-- 2. INVALIDATE EMBEDDING ON QUESTION CHANGE
+-- ================================================
+
+CREATE OR REPLACE FUNCTION clear_golden_question_embedding()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.canonical_question IS DISTINCT FROM OLD.canonical_question
+       AND NEW.question_embedding IS NOT DISTINCT FROM OLD.question_embedding THEN
+        NEW.question_embedding = NULL;
+        NEW.embedding_model = NULL;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS clear_golden_question_embedding ON golden_answers;
+CREATE TRIGGER clear_golden_question_embedding
+    BEFORE UPDATE OF canonical_question ON golden_answers
+    FOR EACH ROW
+    EXECUTE FUNCTION clear_golden_question_embedding();
+
+-- ================================================
+-- 3. EMBEDDING WRITES DO NOT TOUCH updated_at
+-- ================================================
+
+DROP TRIGGER IF EXISTS update_golden_answers_updated_at ON golden_answers;
+CREATE TRIGGER update_golden_answers_updated_at
+    BEFORE UPDATE ON golden_answers
+    FOR EACH ROW
+    WHEN (
+        (to_jsonb(OLD) - 'question_embedding' - 'embedding_model' - 'embedding_updated_at')
+        IS DISTINCT FROM
+        (to_jsonb(NEW) - 'question_embedding' - 'embedding_model' - 'embedding_updated_at')
+    )
+    EXECUTE FUNCTION update_updated_at_column();
@@ -0,0 +1,75 @@
+-- ================================================
+-- Migration 029: Trigram and full-text search indexes
+-- Created: 2026-10-17
+-- Purpose: Make the free-text searches over clients, memories and parent
+--          documents index-backed. They used leading-wildcard ILIKE /
+--          LOWER(...) LIKE '%x%', which no B-tree index can serve, so every
+--          search was a sequential scan.
+-- Idempotency: YES (IF NOT EXISTS)
+-- Dependencies: 002_memory_system_schema (memory_facts),
+--               007_crm_system_schema (clients),
+--               013_agentic_rag_tables (parent_documents),
+--               018_collective_memory (collective_memories)
+-- ================================================
+--
+-- This migration creates:
+-- 1. The pg_trgm extension
+-- 2. Trigram GIN indexes for substring (ILIKE '%x%') and fuzzy (%) matching
+--    on client fields and parent document titles
+-- 3. search_vector tsvector columns (English + Indonesian stems) with GIN
+--    indexes, plus trigram indexes on content, for memory_facts and
+--    collective_memories
+--
+-- Queries are built with core/text_search.py; the text search configurations
+-- used below must match TEXT_SEARCH_CONFIGS there.
+--
+-- NOTE: adding a STORED generated column rewrites the table under an
+-- ACCESS EXCLUSIVE lock. Run during low traffic on large memory_facts tables.
+
+-- ================================================
+-- 1. EXTENSION
+-- ================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- ================================================
+-- 2. TRIGRAM INDEXES (short fields)
+-- ================================================
+
+-- CRM clients: CRMClientsTool search, /api/crm/clients?search=, shared memory search
+CREATE INDEX IF NOT EXISTS idx_clients_full_name_trgm ON clients USING GIN (full_name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_clients_email_trgm ON clients USING GIN (email gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_clients_phone_trgm ON clients USING GIN (phone gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_clients_nationality_trgm ON clients USING GIN (nationality gin_trgm_ops);
+
+-- Parent documents: DatabaseQueryTool full_text (title) lookup
+CREATE INDEX IF NOT EXISTS idx_parent_docs_title_trgm ON parent_documents USING GIN (title gin_trgm_ops);
+
+-- ================================================
+-- 3. FULL-TEXT SEARCH (memory contents)
+-- ================================================
+
+ALTER TABLE memory_facts ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        to_tsvector('english'::regconfig, content) || to_tsvector('indonesian'::regconfig, content)
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_memory_facts_search_vector ON memory_facts USING GIN (search_vector);
+CREATE INDEX IF NOT EXISTS idx_memory_facts_content_trgm ON memory_facts USING GIN (content gin_trgm_ops);
+
+ALTER TABLE collective_memories ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        to_tsvector('english'::regconfig, content) || to_tsvector('indonesian'::regconfig, content)
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_collective_memories_search_vector ON collective_memories USING GIN (search_vector);
+CREATE INDEX IF NOT EXISTS idx_collective_memories_content_trgm ON collective_memories USING GIN (content gin_trgm_ops);
+
+COMMENT ON COLUMN memory_facts.search_vector IS 'English + Indonesian tsvector of content (generated)';
+COMMENT ON COLUMN collective_memories.search_vector IS 'English + Indonesian tsvector of content (generated)';
+
+-- Refresh planner statistics for the new expressions/columns
+ANALYZE clients;
+ANALYZE parent_documents;
+ANALYZE memory_facts;
+ANALYZE collective_memories;
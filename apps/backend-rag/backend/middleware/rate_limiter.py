@@ -6,20 +6,84 @@ Features:
 - IP-based rate limiting
 - User-based rate limiting
 - Configurable limits per endpoint
-- Redis-backed for distributed systems
+- Redis-backed for distributed systems (async, one atomic Lua call per check)
+- Local token-bucket fast path: slots are reserved from Redis in batches and
+  denials are cached until the window frees a slot, so most requests never
+  leave the process
 """
 
+import itertools
 import logging
+import math
 import time
+import uuid
+from collections import OrderedDict, deque
+from dataclasses import dataclass
 
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
+try:
+    import redis.asyncio as redis
+except ImportError:
+    redis = None
+
 logger = logging.getLogger(__name__)
 
-# In-memory rate limit storage (fallback)
-_rate_limit_storage = {}
+# In-memory rate limit storage (fallback): key -> timestamps, oldest first
+_rate_limit_storage: OrderedDict[str, deque] = OrderedDict()
+
+# Max keys tracked in memory (fallback windows and local buckets), LRU-evicted
+MAX_TRACKED_KEYS = 10000
+# Max slots reserved from Redis per round-trip (1 disables the fast path)
+LOCAL_BATCH_SIZE = 10
+# Reserve at most limit // LOCAL_BATCH_DIVISOR slots, so small limits stay exact
+LOCAL_BATCH_DIVISOR = 10
+# After a Redis error, use the in-memory fallback for this long before retrying
+REDIS_RETRY_SECONDS = 30.0
+
+# Sliding window over a ZSET, atomically: trim expired entries, grant up to
+# ARGV[4] slots as unique members (ARGV[5]:1..n) if the window has room, and
+# report the oldest entry so callers know when the next slot frees up.
+SLIDING_WINDOW_LUA = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+local requested = tonumber(ARGV[4])
+
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+local count = redis.call('ZCARD', key)
+local granted = math.min(requested, limit - count)
+if granted > 0 then
+    local entries = {}
+    for i = 1, granted do
+        entries[#entries + 1] = now
+        entries[#entries + 1] = ARGV[5] .. ':' .. i
+    end
+    redis.call('ZADD', key, unpack(entries))
+    count = count + granted
+else
+    granted = 0
+end
+redis.call('PEXPIRE', key, window)
+
+local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+return {granted, count, tonumber(oldest[2] or now)}
+"""
+
+
+@dataclass
+class _LocalBucket:
+    """Slots reserved from Redis for one key, consumed without a round-trip."""
+
+    limit: int
+    window: int
+    tokens: int  # Reserved slots not yet used
+    unreserved: int  # Slots left in the shared window when reserved
+    expires_at: float  # Reserved entries leave the Redis window at this time
+    retry_at: float = 0.0  # When denied: earliest time a slot frees up
 
 
 class RateLimiter:
@@ -27,20 +91,38 @@ class RateLimiter:
     Rate limiter with sliding window algorithm
     """
 
-    def __init__(self):
+    def __init__(self, local_batch_size: int = LOCAL_BATCH_SIZE):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            local_batch_size: Max slots reserved from Redis per round-trip.
+                Slots left unused on one replica count against the shared
+                limit until they leave the window; 1 makes every check exact.
+        """
         self.redis_available = False
         self.redis_client = None
+        self.local_batch_size = max(1, local_batch_size)
+        self._script = None
+        self._buckets: OrderedDict[str, _LocalBucket] = OrderedDict()
+        self._member_prefix = uuid.uuid4().hex[:12]
+        self._reservations = itertools.count()
+        self._redis_retry_at = 0.0
+        self._stats = {"local_hits": 0, "local_denials": 0, "redis_calls": 0, "redis_errors": 0}
 
         # Try to connect to Redis
         from app.core.config import settings
 
         redis_url = settings.redis_url
-        if redis_url:
+        if redis_url and redis is not None:
             try:
-                import redis
-
-                self.redis_client = redis.from_url(redis_url, decode_responses=True)
-                self.redis_client.ping()
+                self.redis_client = redis.from_url(
+                    redis_url,
+                    decode_responses=True,
+                    socket_connect_timeout=1,
+                    socket_timeout=1,
+                )
+                self._script = self.redis_client.register_script(SLIDING_WINDOW_LUA)
                 self.redis_available = True
                 logger.info("✅ Rate limiter using Redis")
             except Exception as e:
@@ -48,7 +130,7 @@ class RateLimiter:
         else:
             logger.info("ℹ️ Rate limiter using in-memory storage")
 
-    def is_allowed(self, key: str, limit: int, window: int) -> tuple[bool, dict]:
+    async def is_allowed(self, key: str, limit: int, window: int) -> tuple[bool, dict]:
         """
         Check if request is allowed under rate limit
 
@@ -60,63 +142,132 @@ class RateLimiter:
         Returns:
             (allowed, info_dict)
         """
-        current_time = int(time.time())
-        window_start = current_time - window
+        current_time = time.time()
 
         try:
-            if self.redis_available and self.redis_client:
-                # Redis-backed sliding window
-                pipe = self.redis_client.pipeline()
-
-                # Remove old entries
-                pipe.zremrangebyscore(key, 0, window_start)
-
-                # Count current requests
-                pipe.zcard(key)
-
-                # Add current request
-                pipe.zadd(key, {str(current_time): current_time})
-
-                # Set expiration
-                pipe.expire(key, window)
+            if self.redis_available and self.redis_client and current_time >= self._redis_retry_at:
+                try:
+                    return await self._check_redis(key, limit, window, current_time)
+                except Exception as e:
+                    self._stats["redis_errors"] += 1
+                    self._redis_retry_at = current_time + REDIS_RETRY_SECONDS
+                    self._buckets.clear()
+                    logger.warning(f"⚠️ Rate limiter Redis error, using memory for now: {e}")
+            return self._check_memory(key, limit, window, current_time)
 
-                results = pipe.execute()
-                count = results[1]
-
-                allowed = count < limit
-                remaining = max(0, limit - count - 1)
-
-                return allowed, {
+        except Exception as e:
+            logger.error(f"Rate limit check error: {e}")
+            # On error, allow request (fail open)
+            return True, {
+                "limit": limit,
+                "remaining": limit,
+                "reset": int(current_time) + window,
+            }
+
+    def _batch_size(self, limit: int) -> int:
+        return max(1, min(self.local_batch_size, limit // LOCAL_BATCH_DIVISOR))
+
+    async def _check_redis(
+        self, key: str, limit: int, window: int, current_time: float
+    ) -> tuple[bool, dict]:
+        """Serve from the local bucket, reserving a new batch from Redis when empty."""
+        bucket = self._buckets.get(key)
+        if bucket and bucket.limit == limit and bucket.window == window:
+            if bucket.tokens > 0 and current_time < bucket.expires_at:
+                bucket.tokens -= 1
+                self._buckets.move_to_end(key)
+                self._stats["local_hits"] += 1
+                return True, {
                     "limit": limit,
-                    "remaining": remaining,
-                    "reset": current_time + window,
+                    "remaining": bucket.unreserved + bucket.tokens,
+                    "reset": int(current_time) + window,
                 }
-            else:
-                # In-memory fallback
-                if key not in _rate_limit_storage:
-                    _rate_limit_storage[key] = []
+            if current_time < bucket.retry_at:
+                # No slot frees up before the oldest entry leaves the window
+                self._stats["local_denials"] += 1
+                return False, {"limit": limit, "remaining": 0, "reset": math.ceil(bucket.retry_at)}
+
+        self._stats["redis_calls"] += 1
+        granted, count, oldest = await self._script(
+            keys=[key],
+            args=[
+                int(current_time * 1000),
+                window * 1000,
+                limit,
+                self._batch_size(limit),
+                f"{self._member_prefix}:{next(self._reservations)}",
+            ],
+        )
+        granted, count = int(granted), int(count)
+
+        if granted > 0:
+            bucket = _LocalBucket(
+                limit=limit,
+                window=window,
+                tokens=granted - 1,
+                unreserved=max(0, limit - count),
+                expires_at=current_time + window,
+            )
+            allowed = True
+            remaining = bucket.unreserved + bucket.tokens
+            reset = int(current_time) + window
+        else:
+            retry_at = int(oldest) / 1000 + window
+            bucket = _LocalBucket(
+                limit=limit,
+                window=window,
+                tokens=0,
+                unreserved=0,
+                expires_at=retry_at,
+                retry_at=retry_at,
+            )
+            allowed = False
+            remaining = 0
+            reset = math.ceil(retry_at)
+
+        self._remember(self._buckets, key, bucket)
+        return allowed, {"limit": limit, "remaining": remaining, "reset": reset}
+
+    def _check_memory(
+        self, key: str, limit: int, window: int, current_time: float
+    ) -> tuple[bool, dict]:
+        """In-process sliding window (single replica only)."""
+        timestamps = _rate_limit_storage.get(key)
+        if timestamps is None:
+            timestamps = deque()
+            self._remember(_rate_limit_storage, key, timestamps)
+        else:
+            _rate_limit_storage.move_to_end(key)
 
-                # Remove old entries
-                _rate_limit_storage[key] = [t for t in _rate_limit_storage[key] if t > window_start]
+        # Remove old entries (oldest first, so stop at the first live one)
+        window_start = current_time - window
+        while timestamps and timestamps[0] <= window_start:
+            timestamps.popleft()
 
-                count = len(_rate_limit_storage[key])
-                allowed = count < limit
+        count = len(timestamps)
+        allowed = count < limit
+        if allowed:
+            timestamps.append(current_time)
 
-                if allowed:
-                    _rate_limit_storage[key].append(current_time)
+        remaining = max(0, limit - count - 1)
+        reset = int(current_time) + window if allowed else math.ceil(timestamps[0] + window)
 
-                remaining = max(0, limit - count - 1)
+        return allowed, {
+            "limit": limit,
+            "remaining": remaining,
+            "reset": reset,
+        }
 
-                return allowed, {
-                    "limit": limit,
-                    "remaining": remaining,
-                    "reset": current_time + window,
-                }
+    @staticmethod
+    def _remember(store: OrderedDict, key: str, value) -> None:
+        store[key] = value
+        store.move_to_end(key)
+        while len(store) > MAX_TRACKED_KEYS:
+            store.popitem(last=False)
 
-        except Exception as e:
-            logger.error(f"Rate limit check error: {e}")
-            # On error, allow request (fail open)
-            return True, {"limit": limit, "remaining": limit, "reset": current_time + window}
+    def get_stats(self) -> dict:
+        """Get fast-path and Redis round-trip counters."""
+        return {**self._stats, "local_buckets": len(self._buckets)}
 
 
 # Global rate limiter instance
@@ -173,7 +324,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
         # Check rate limit
         rate_limit_key = f"ratelimit:{user_id}:{request.url.path}"
-        allowed, info = rate_limiter.is_allowed(rate_limit_key, limit, window)
+        allowed, info = await rate_limiter.is_allowed(rate_limit_key, limit, window)
 
         if not allowed:
             logger.warning(f"⚠️ Rate limit exceeded: {user_id} on {request.url.path}")
@@ -190,7 +341,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                     "X-RateLimit-Limit": str(info["limit"]),
                     "X-RateLimit-Remaining": str(info["remaining"]),
                     "X-RateLimit-Reset": str(info["reset"]),
-                    "Retry-After": str(window),
+                    "Retry-After": str(max(1, info["reset"] - int(time.time()))),
                 },
             )
 
@@ -223,4 +374,5 @@ def get_rate_limit_stats() -> dict:
         "backend": "redis" if rate_limiter.redis_available else "memory",
         "connected": rate_limiter.redis_available,
         "rate_limits_configured": len(RateLimitMiddleware.RATE_LIMITS),
+        **rate_limiter.get_stats(),
     }
@@ -0,0 +1,186 @@
+"""
+Migration 021 (follow-up): Re-hash BM25 Sparse Vectors
+
+Sparse vectors written by migration_021_add_bm25_sparse_vectors before the
+tokenizer switched to stable blake2b token hashing used Python's salted hash(),
+so their indices depend on the PYTHONHASHSEED of the process that wrote them
+and no longer match the query vectors produced by the API workers.
+
+Old indices cannot be mapped to new ones (the salted hash is not recoverable),
+so this tool regenerates every point's "bm25" vector from its payload text and
+replaces it in place via the Qdrant update-vectors API. Dense vectors and
+payloads are left untouched. BM25 corpus statistics for the collection are
+rebuilt from scratch during the same pass.
+
+Usage:
+    python migrations/migration_021_rehash_bm25_sparse_vectors.py
+    python migrations/migration_021_rehash_bm25_sparse_vectors.py --collection legal_unified
+    python migrations/migration_021_rehash_bm25_sparse_vectors.py --dry-run
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+# Migration configuration
+DEFAULT_COLLECTION = "legal_unified_hybrid"
+SCROLL_BATCH_SIZE = 500
+# Texts accumulated before vectorizing, large enough to use the process pool
+VECTORIZE_BATCH_SIZE = 5000
+
+
+async def _update_sparse_vectors(
+    http_client, collection: str, ids: list, sparse_vectors: list[dict]
+) -> None:
+    """Replace the bm25 named vector of the given points, leaving others intact."""
+    url = f"/collections/{collection}/points/vectors"
+    for i in range(0, len(ids), SCROLL_BATCH_SIZE):
+        points = [
+            {"id": point_id, "vector": {"bm25": sparse}}
+            for point_id, sparse in zip(
+                ids[i : i + SCROLL_BATCH_SIZE],
+                sparse_vectors[i : i + SCROLL_BATCH_SIZE],
+                strict=True,
+            )
+        ]
+        response = await http_client.put(url, json={"points": points}, params={"wait": "true"})
+        response.raise_for_status()
+
+
+async def run_migration(collection: str = DEFAULT_COLLECTION, dry_run: bool = False):
+    """Regenerate the bm25 sparse vectors of every point in a collection."""
+    from core.bm25_stats import get_bm25_corpus_stats
+    from core.bm25_vectorizer import BM25Vectorizer
+    from core.qdrant_db import QdrantClient
+
+    logger.info("=" * 70)
+    logger.info(f"MIGRATION 021 (re-hash): BM25 sparse vectors in '{collection}'")
+    logger.info("=" * 70)
+
+    client = QdrantClient(
+        qdrant_url=os.getenv("QDRANT_URL", "http://localhost:6333"),
+        collection_name=collection,
+        api_key=os.getenv("QDRANT_API_KEY"),
+    )
+    corpus_stats = get_bm25_corpus_stats()
+    bm25 = BM25Vectorizer()
+    # Normalize every point by the same avgdl: the one known before the rebuild
+    if corpus_stats and corpus_stats.has_collection(collection):
+        bm25.update_avg_doc_length(corpus_stats.avg_doc_length(collection))
+
+    try:
+        stats = await client.get_collection_stats()
+        total_docs = stats.get("total_documents", 0)
+        if total_docs == 0:
+            logger.warning("Collection is empty. Nothing to re-hash.")
+            return
+
+        logger.info(f"Found {total_docs} points to re-hash")
+        if corpus_stats and not dry_run:
+            corpus_stats.reset(collection)
+        http_client = await client._get_client()
+        start_time = time.time()
+        total_updated = 0
+        skipped = 0
+        offset = None
+        pending_ids: list = []
+        pending_texts: list[str] = []
+
+        async def flush() -> int:
+            if not pending_ids:
+                return 0
+            sparse_vectors = await asyncio.to_thread(
+                bm25.generate_batch_sparse_vectors, pending_texts
+            )
+            if not dry_run:
+                await _update_sparse_vectors(http_client, collection, pending_ids, sparse_vectors)
+                if corpus_stats:
+                    corpus_stats.add_documents(
+                        collection,
+                        [
+                            (sparse["indices"], len(bm25.tokenize(text)))
+                            for sparse, text in zip(sparse_vectors, pending_texts, strict=True)
+                        ],
+                    )
+            count = len(pending_ids)
+            pending_ids.clear()
+            pending_texts.clear()
+            return count
+
+        while True:
+            scroll_payload = {
+                "limit": SCROLL_BATCH_SIZE,
+                "with_payload": ["text"],
+                "with_vector": False,
+            }
+            if offset:
+                scroll_payload["offset"] = offset
+
+            response = await http_client.post(
+                f"/collections/{collection}/points/scroll", json=scroll_payload
+            )
+            response.raise_for_status()
+            data = response.json().get("result", {})
+            points = data.get("points", [])
+
+            for point in points:
+                text = point.get("payload", {}).get("text", "")
+                if not text:
+                    skipped += 1
+                    continue
+                pending_ids.append(point["id"])
+                pending_texts.append(text)
+
+            if len(pending_ids) >= VECTORIZE_BATCH_SIZE:
+                total_updated += await flush()
+                elapsed = time.time() - start_time
+                rate = total_updated / elapsed if elapsed > 0 else 0
+                logger.info(
+                    f"  Re-hashed {total_updated}/{total_docs} points "
+                    f"({total_updated / total_docs * 100:.1f}%) - {rate:.1f} points/sec"
+                )
+
+            offset = data.get("next_page_offset")
+            if not points or not offset:
+                break
+
+        total_updated += await flush()
+        elapsed = time.time() - start_time
+        action = "Would re-hash" if dry_run else "Re-hashed"
+        logger.info(
+            f"\n✅ {action} {total_updated} points in {elapsed:.1f}s "
+            f"({skipped} skipped without text)"
+        )
+
+    finally:
+        await client.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Re-hash BM25 sparse vectors with stable hashing")
+    parser.add_argument(
+        "--collection", default=DEFAULT_COLLECTION, help="Qdrant collection to re-hash"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Vectorize without writing to Qdrant"
+    )
+    args = parser.parse_args()
+
+    asyncio.run(run_migration(collection=args.collection, dry_run=args.dry_run))
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Migration 027: Append-only Conversation Messages
+Adds conversation_messages table, materialized list summary on conversations,
+and backfills existing conversations.messages arrays
+"""
+
+import asyncio
+import logging
+import os
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import asyncpg
+from db.migration_base import BaseMigration
+
+logger = logging.getLogger(__name__)
+
+
+class Migration027(BaseMigration):
+    """Append-only Conversation Messages Migration"""
+
+    def __init__(self):
+        super().__init__(
+            migration_number=27,
+            sql_file="027_conversation_messages.sql",
+            description="Add conversation_messages table, conversation summary columns and backfill",
+            dependencies=[],
+        )
+
+    async def verify(self, conn: asyncpg.Connection) -> bool:
+        """Verify conversation_messages exists and every conversation was backfilled"""
+        table_exists = await conn.fetchval(
+            """
+            SELECT EXISTS (
+                SELECT 1 FROM information_schema.tables
+                WHERE table_name = 'conversation_messages'
+            )
+            """
+        )
+
+        if not table_exists:
+            logger.error("conversation_messages table not found")
+            return False
+
+        # Check summary columns exist
+        for col in ["message_count", "title", "last_message_preview", "updated_at"]:
+            col_exists = await conn.fetchval(
+                """
+                SELECT EXISTS (
+                    SELECT 1 FROM information_schema.columns
+                    WHERE table_name = 'conversations' AND column_name = $1
+                )
+                """,
+                col,
+            )
+            if not col_exists:
+                logger.error(f"Column {col} not found in conversations")
+                return False
+
+        # Every non-empty legacy array must have been copied
+        missing = await conn.fetchval(
+            """
+            SELECT COUNT(*) FROM conversations
+            WHERE jsonb_typeof(messages) = 'array'
+              AND jsonb_array_length(messages) > 0
+              AND message_count <> jsonb_array_length(messages)
+            """
+        )
+        if missing:
+            logger.error(f"{missing} conversations not backfilled into conversation_messages")
+            return False
+
+        logger.info("✅ Migration 027 verified: conversation_messages table created and backfilled")
+        return True
+
+
+async def main():
+    """Run migration standalone"""
+    # Try to get DATABASE_URL from environment or settings
+    try:
+        from app.core.config import settings
+
+        database_url = settings.database_url
+    except (ImportError, AttributeError):
+        database_url = os.getenv("DATABASE_URL")
+
+    if not database_url:
+        print("ERROR: DATABASE_URL environment variable not set.")
+        print("Set DATABASE_URL or ensure app.core.config.settings.database_url is configured.")
+        return False
+
+    migration = Migration027()
+    success = await migration.apply()
+    return success
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    success = asyncio.run(main())
+    sys.exit(0 if success else 1)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Migration 028: Golden Answer Question Embeddings
+Adds question_embedding/embedding_model/embedding_updated_at columns to
+golden_answers, a trigger clearing the embedding when canonical_question changes,
+and keeps embedding writes from moving updated_at. Run standalone, it then
+backfills the embeddings of existing rows.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import asyncpg
+from db.migration_base import BaseMigration
+
+logger = logging.getLogger(__name__)
+
+
+class Migration028(BaseMigration):
+    """Golden Answer Question Embeddings Migration"""
+
+    def __init__(self):
+        super().__init__(
+            migration_number=28,
+            sql_file="028_golden_answer_embeddings.sql",
+            description="Add golden_answers question embedding columns and triggers",
+            dependencies=[],
+        )
+
+    async def verify(self, conn: asyncpg.Connection) -> bool:
+        """Verify embedding columns and the invalidation trigger exist"""
+        for col in ["question_embedding", "embedding_model", "embedding_updated_at"]:
+            col_exists = await conn.fetchval(
+                """
+                SELECT EXISTS (
+                    SELECT 1 FROM information_schema.columns
+                    WHERE table_name = 'golden_answers' AND column_name = $1
+                )
+                """,
+                col,
+            )
+            if not col_exists:
+                logger.error(f"Column {col} not found in golden_answers")
+                return False
+
+        trigger_exists = await conn.fetchval(
+            """
+            SELECT EXISTS (
+                SELECT 1 FROM pg_trigger
+                WHERE tgname = 'clear_golden_question_embedding'
+            )
+            """
+        )
+        if not trigger_exists:
+            logger.error("clear_golden_question_embedding trigger not found")
+            return False
+
+        logger.info("✅ Migration 028 verified: golden_answers embedding columns created")
+        return True
+
+
+async def main():
+    """Run migration standalone"""
+    # Try to get DATABASE_URL from environment or settings
+    try:
+        from app.core.config import settings
+
+        database_url = settings.database_url
+    except (ImportError, AttributeError):
+        database_url = os.getenv("DATABASE_URL")
+
+    if not database_url:
+        print("ERROR: DATABASE_URL environment variable not set.")
+        print("Set DATABASE_URL or ensure app.core.config.settings.database_url is configured.")
+        return False
+
+    migration = Migration028()
+    success = await migration.apply()
+    if success:
+        # Embed existing golden answers now rather than in the first lookups
+        from services.golden_answer_service import GoldenAnswerService
+
+        service = GoldenAnswerService(database_url)
+        try:
+            embedded = await service.backfill_embeddings()
+            print(f"Backfilled {embedded} golden answer embeddings")
+        finally:
+            await service.close()
+    return success
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    success = asyncio.run(main())
+    sys.exit(0 if success else 1)
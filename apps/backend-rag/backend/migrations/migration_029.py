@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Migration 029: Trigram and Full-Text Search Indexes
+Adds pg_trgm GIN indexes for substring/fuzzy search on clients and parent
+document titles, and English + Indonesian search_vector columns on memory tables
+"""
+
+import asyncio
+import logging
+import os
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import asyncpg
+from db.migration_base import BaseMigration
+
+logger = logging.getLogger(__name__)
+
+
+class Migration029(BaseMigration):
+    """Trigram and Full-Text Search Indexes Migration"""
+
+    INDEXES = [
+        "idx_clients_full_name_trgm",
+        "idx_clients_email_trgm",
+        "idx_clients_phone_trgm",
+        "idx_clients_nationality_trgm",
+        "idx_parent_docs_title_trgm",
+        "idx_memory_facts_search_vector",
+        "idx_memory_facts_content_trgm",
+        "idx_collective_memories_search_vector",
+        "idx_collective_memories_content_trgm",
+    ]
+
+    def __init__(self):
+        super().__init__(
+            migration_number=29,
+            sql_file="029_text_search_indexes.sql",
+            description="Add pg_trgm and tsvector search indexes for clients, memories and documents",
+            dependencies=[],
+        )
+
+    async def verify(self, conn: asyncpg.Connection) -> bool:
+        """Verify pg_trgm, the search_vector columns and all search indexes exist"""
+        extension_exists = await conn.fetchval(
+            "SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')"
+        )
+        if not extension_exists:
+            logger.error("pg_trgm extension not installed")
+            return False
+
+        for table in ["memory_facts", "collective_memories"]:
+            col_exists = await conn.fetchval(
+                """
+                SELECT EXISTS (
+                    SELECT 1 FROM information_schema.columns
+                    WHERE table_name = $1 AND column_name = 'search_vector'
+                )
+                """,
+                table,
+            )
+            if not col_exists:
+                logger.error(f"Column search_vector not found in {table}")
+                return False
+
+        for index in self.INDEXES:
+            index_exists = await conn.fetchval(
+                "SELECT EXISTS (SELECT 1 FROM pg_indexes WHERE indexname = $1)", index
+            )
+            if not index_exists:
+                logger.error(f"Index {index} not found")
+                return False
+
+        logger.info("✅ Migration 029 verified: trigram and full-text search indexes created")
+        return True
+
+
+async def main():
+    """Run migration standalone"""
+    # Try to get DATABASE_URL from environment or settings
+    try:
+        from app.core.config import settings
+
+        database_url = settings.database_url
+    except (ImportError, AttributeError):
+        database_url = os.getenv("DATABASE_URL")
+
+    if not database_url:
+        print("ERROR: DATABASE_URL environment variable not set.")
+        print("Set DATABASE_URL or ensure app.core.config.settings.database_url is configured.")
+        return False
+
+    migration = Migration029()
+    success = await migration.apply()
+    return success
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    success = asyncio.run(main())
+    sys.exit(0 if success else 1)
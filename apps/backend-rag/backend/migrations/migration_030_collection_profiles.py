@@ -0,0 +1,350 @@
+"""
+Migration 030: Quantized Collection Profiles
+
+Converts an existing Qdrant collection to a storage profile (see
+core.qdrant_db.COLLECTION_PROFILES: int8 scalar or binary quantization with the
+original vectors on disk and tuned HNSW) without touching the live collection:
+
+1. Build "<name>__<profile>" with the profile and copy every point into it
+   (dense + sparse vectors and payloads are copied as-is, no re-embedding)
+2. Benchmark recall@k and latency of each profile against exact float32
+   search on the source, using stored vectors as queries
+3. With --apply, point the alias "<name>" at the chosen profile's collection
+
+Step 3 is atomic when "<name>" is already an alias; the previous collection is
+kept for rollback (re-run with --apply pointing at it). If "<name>" is still a
+concrete collection it has to be dropped before the alias can take its name,
+which requires --drop-source. Afterwards set
+QDRANT_COLLECTION_PROFILES='{"<name>": "<profile>"}' so searches send the
+profile's rescore/oversampling params.
+
+Usage:
+    python migrations/migration_030_collection_profiles.py --collection legal_unified
+    python migrations/migration_030_collection_profiles.py --collection legal_unified \\
+        --profiles scalar_int8 --report /tmp/legal_profiles.json
+    python migrations/migration_030_collection_profiles.py --collection legal_unified \\
+        --apply scalar_int8 --drop-source
+"""
+
+import asyncio
+import json
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+# Migration configuration
+COPY_BATCH_SIZE = 256
+BENCHMARK_QUERIES = 100
+BENCHMARK_LIMIT = 10
+GREEN_TIMEOUT = 1800  # seconds to wait for indexing/quantization to finish
+# Bytes per dimension held in RAM for the searched vectors of each profile
+RAM_BYTES_PER_DIM = {"float32": 4.0, "scalar_int8": 1.0, "binary": 1 / 8}
+
+
+def _dense_params(config: dict) -> tuple[str | None, dict]:
+    """Return (vector name or None for unnamed, dense vector params) of a collection."""
+    vectors = config["params"]["vectors"]
+    if "size" in vectors:
+        return None, vectors
+    return "dense", vectors["dense"]
+
+
+async def _wait_green(client, collection: str) -> None:
+    """Wait until the optimizer finished indexing/quantizing a collection."""
+    http = await client._get_client()
+    deadline = time.time() + GREEN_TIMEOUT
+    while time.time() < deadline:
+        response = await http.get(f"/collections/{collection}")
+        response.raise_for_status()
+        if response.json()["result"].get("status") == "green":
+            return
+        await asyncio.sleep(5)
+    logger.warning(f"'{collection}' not green after {GREEN_TIMEOUT}s, benchmarking anyway")
+
+
+async def build_profile_collection(source_client, name: str, source: str, profile: str) -> str:
+    """Create '<name>__<profile>' with the profile and copy all points from source."""
+    from core.qdrant_db import QdrantClient
+
+    target = f"{name}__{profile}"
+    http = await source_client._get_client()
+    config = (await http.get(f"/collections/{source}")).json()["result"]["config"]
+    vector_name, dense = _dense_params(config)
+    if vector_name is None and config["params"].get("sparse_vectors"):
+        raise RuntimeError("Unnamed dense vector with sparse vectors is not supported")
+
+    target_client = QdrantClient(
+        qdrant_url=source_client.qdrant_url,
+        collection_name=target,
+        api_key=source_client.api_key,
+        profile=profile,
+    )
+    try:
+        if (await http.get(f"/collections/{target}")).status_code == 200:
+            logger.info(f"   '{target}' exists, deleting it first...")
+            (await http.delete(f"/collections/{target}")).raise_for_status()
+
+        created = await target_client.create_collection(
+            vector_size=dense["size"],
+            distance=dense.get("distance", "Cosine"),
+            on_disk_payload=config["params"].get("on_disk_payload"),
+            enable_sparse="bm25" in (config["params"].get("sparse_vectors") or {}),
+        )
+        if not created:
+            raise RuntimeError(f"Failed to create '{target}'")
+
+        copied = 0
+        offset = None
+        start_time = time.time()
+        while True:
+            scroll_payload = {"limit": COPY_BATCH_SIZE, "with_payload": True, "with_vector": True}
+            if offset:
+                scroll_payload["offset"] = offset
+            response = await http.post(f"/collections/{source}/points/scroll", json=scroll_payload)
+            response.raise_for_status()
+            data = response.json().get("result", {})
+            points = [
+                {"id": p["id"], "vector": p["vector"], "payload": p.get("payload", {})}
+                for p in data.get("points", [])
+            ]
+            if points:
+                await target_client._put_points(points, wait=True)
+                copied += len(points)
+                if copied % (COPY_BATCH_SIZE * 20) == 0:
+                    rate = copied / (time.time() - start_time)
+                    logger.info(f"   Copied {copied} points - {rate:.1f} points/sec")
+
+            offset = data.get("next_page_offset")
+            if not points or not offset:
+                break
+
+        logger.info(f"✅ Copied {copied} points into '{target}'")
+        await _wait_green(target_client, target)
+        return target
+    finally:
+        await target_client.close()
+
+
+async def _search_ids(http, collection, vector, vector_name, limit, params) -> tuple[list, float]:
+    """Run one dense search, returning (point IDs, latency in ms)."""
+    payload = {
+        "vector": {"name": vector_name, "vector": vector} if vector_name else vector,
+        "limit": limit,
+        "with_payload": False,
+    }
+    if params:
+        payload["params"] = params
+    start = time.perf_counter()
+    response = await http.post(f"/collections/{collection}/points/search", json=payload)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    response.raise_for_status()
+    return [p["id"] for p in response.json()["result"]], elapsed_ms
+
+
+async def benchmark_profiles(
+    source_client, source: str, candidates: dict[str, str], queries: int, limit: int
+) -> dict:
+    """
+    Compare recall@limit and latency of each profile collection against exact search.
+
+    Args:
+        source_client: QdrantClient for the source collection
+        source: Source (float32) collection name
+        candidates: profile -> collection to benchmark (include "float32": source)
+        queries: Number of stored vectors used as queries
+        limit: k for recall@k
+
+    Returns:
+        Report dict
+    """
+    from core.qdrant_db import COLLECTION_PROFILES
+
+    http = await source_client._get_client()
+    info = (await http.get(f"/collections/{source}")).json()["result"]
+    vector_name, dense = _dense_params(info["config"])
+    points_count = info.get("points_count", 0)
+
+    # Sample stored vectors as queries (random scroll window)
+    scroll_payload = {
+        "limit": queries,
+        "with_payload": False,
+        "with_vector": [vector_name] if vector_name else True,
+    }
+    if points_count > queries:
+        sample = await http.post(
+            f"/collections/{source}/points/scroll",
+            json={"limit": random.randint(1, points_count - queries), "with_payload": False},
+        )
+        scroll_payload["offset"] = sample.json()["result"].get("next_page_offset")
+    response = await http.post(f"/collections/{source}/points/scroll", json=scroll_payload)
+    response.raise_for_status()
+    vectors = [
+        p["vector"][vector_name] if vector_name else p["vector"]
+        for p in response.json()["result"]["points"]
+    ]
+
+    truth = [
+        (await _search_ids(http, source, v, vector_name, limit, {"exact": True}))[0]
+        for v in vectors
+    ]
+
+    report = {
+        "source": source,
+        "points": points_count,
+        "dimensions": dense["size"],
+        "queries": len(vectors),
+        "k": limit,
+        "profiles": {},
+    }
+    for profile, collection in candidates.items():
+        params = COLLECTION_PROFILES[profile]["search_params"]
+        recalls, latencies = [], []
+        for vector, expected in zip(vectors, truth, strict=True):
+            ids, elapsed_ms = await _search_ids(
+                http, collection, vector, vector_name, limit, params
+            )
+            recalls.append(len(set(ids) & set(expected)) / max(len(expected), 1))
+            latencies.append(elapsed_ms)
+        latencies.sort()
+        report["profiles"][profile] = {
+            "collection": collection,
+            "recall_at_k": round(statistics.fmean(recalls), 4) if recalls else None,
+            "latency_mean_ms": round(statistics.fmean(latencies), 2) if latencies else None,
+            "latency_p95_ms": (
+                round(latencies[int(0.95 * (len(latencies) - 1))], 2) if latencies else None
+            ),
+            "vector_ram_mb": round(
+                points_count * dense["size"] * RAM_BYTES_PER_DIM[profile] / 2**20, 1
+            ),
+        }
+    return report
+
+
+async def apply_profile(client, name: str, target: str, drop_source: bool) -> None:
+    """Point alias <name> at target (dropping the concrete <name> collection if asked)."""
+    http = await client._get_client()
+    aliases = await client.list_aliases()
+    if name not in aliases and (await http.get(f"/collections/{name}")).status_code == 200:
+        if not drop_source:
+            raise RuntimeError(
+                f"'{name}' is a collection, not an alias: re-run with --drop-source to replace it"
+            )
+        logger.warning(f"Dropping collection '{name}' so the alias can take its name")
+        (await http.delete(f"/collections/{name}")).raise_for_status()
+    elif name in aliases:
+        logger.info(f"Previous target '{aliases[name]}' kept for rollback")
+
+    await client.switch_alias(name, target)
+
+
+async def run_migration(
+    collection: str,
+    profiles: list[str],
+    apply: str | None = None,
+    drop_source: bool = False,
+    queries: int = BENCHMARK_QUERIES,
+    limit: int = BENCHMARK_LIMIT,
+    report_path: str | None = None,
+):
+    """Build, benchmark and optionally switch to quantized collection profiles."""
+    from core.qdrant_db import QdrantClient
+
+    logger.info("=" * 70)
+    logger.info(f"MIGRATION 030 (profiles): {', '.join(profiles)} for '{collection}'")
+    logger.info("=" * 70)
+
+    client = QdrantClient(
+        qdrant_url=os.getenv("QDRANT_URL", "http://localhost:6333"),
+        collection_name=collection,
+        api_key=os.getenv("QDRANT_API_KEY"),
+    )
+    try:
+        aliases = await client.list_aliases()
+        source = aliases.get(collection, collection)
+        logger.info(f"Source collection: '{source}'")
+
+        candidates = {"float32": source}
+        for profile in profiles:
+            logger.info(f"\n🔧 Building '{profile}' collection...")
+            candidates[profile] = await build_profile_collection(
+                client, collection, source, profile
+            )
+
+        logger.info(f"\n📊 Benchmarking {queries} queries (recall@{limit})...")
+        report = await benchmark_profiles(client, source, candidates, queries, limit)
+        for profile, result in report["profiles"].items():
+            logger.info(
+                f"  {profile:<12} recall@{limit}={result['recall_at_k']:.3f}  "
+                f"mean={result['latency_mean_ms']:.1f}ms  p95={result['latency_p95_ms']:.1f}ms  "
+                f"vectors≈{result['vector_ram_mb']:.0f}MB RAM"
+            )
+        if report_path:
+            with open(report_path, "w") as f:
+                json.dump(report, f, indent=2)
+            logger.info(f"Report written to {report_path}")
+
+        if apply:
+            logger.info(f"\n🔀 Switching '{collection}' to '{candidates[apply]}'...")
+            await apply_profile(client, collection, candidates[apply], drop_source)
+            logger.info(
+                f'✅ Done. Set QDRANT_COLLECTION_PROFILES=\'{{"{collection}": "{apply}"}}\''
+            )
+        return report
+    finally:
+        await client.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from core.qdrant_db import COLLECTION_PROFILES
+
+    quantized = [name for name in COLLECTION_PROFILES if name != "float32"]
+
+    parser = argparse.ArgumentParser(description="Convert a collection to quantized profiles")
+    parser.add_argument("--collection", required=True, help="Collection or alias to convert")
+    parser.add_argument(
+        "--profiles", nargs="+", choices=quantized, default=quantized, help="Profiles to build"
+    )
+    parser.add_argument("--apply", choices=quantized, help="Switch the alias to this profile")
+    parser.add_argument(
+        "--drop-source",
+        action="store_true",
+        help="Allow dropping a concrete collection so an alias can replace it",
+    )
+    parser.add_argument("--queries", type=int, default=BENCHMARK_QUERIES)
+    parser.add_argument("--limit", type=int, default=BENCHMARK_LIMIT)
+    parser.add_argument("--report", help="Write the recall/latency report as JSON")
+    args = parser.parse_args()
+
+    profiles = args.profiles
+    if args.apply and args.apply not in profiles:
+        profiles = [*profiles, args.apply]
+
+    asyncio.run(
+        run_migration(
+            collection=args.collection,
+            profiles=profiles,
+            apply=args.apply,
+            drop_source=args.drop_source,
+            queries=args.queries,
+            limit=args.limit,
+            report_path=args.report,
+        )
+    )
@@ -8,7 +8,7 @@ Extracted from SearchService to follow Single Responsibility Principle.
 import logging
 from typing import Any
 
-from core.qdrant_db import QdrantClient
+from core.qdrant_db import COLLECTION_PROFILES, QdrantClient
 
 from app.core.config import settings
 
@@ -152,5 +152,49 @@ class CollectionManager:
 
         definition = self.collection_definitions[name].copy()
         definition["actual_name"] = definition.get("alias") or name
+        definition["profile"] = self.get_collection_profile(name)
         return definition
 
+    def get_collection_profile(self, name: str) -> str:
+        """
+        Get the storage profile of a collection (see COLLECTION_PROFILES).
+
+        Args:
+            name: Collection name
+
+        Returns:
+            Profile name ("float32" unless configured in QDRANT_COLLECTION_PROFILES)
+        """
+        definition = self.collection_definitions.get(name, {})
+        actual_name = definition.get("alias") or name
+        profiles = getattr(settings, "qdrant_collection_profiles", None)
+        if not isinstance(profiles, dict):
+            return "float32"
+        return profiles.get(actual_name) or profiles.get(name) or "float32"
+
+    async def create_collection(
+        self, name: str, profile: str = "float32", enable_sparse: bool = False, **kwargs: Any
+    ) -> bool:
+        """
+        Create a Qdrant collection with a storage profile.
+
+        Args:
+            name: Collection name
+            profile: COLLECTION_PROFILES key (quantization, on-disk vectors, HNSW)
+            enable_sparse: Enable BM25 sparse vectors for hybrid search
+            **kwargs: Further QdrantClient.create_collection() arguments
+
+        Returns:
+            True if successful
+
+        Raises:
+            ValueError: If the profile is unknown
+        """
+        if profile not in COLLECTION_PROFILES:
+            raise ValueError(f"Unknown collection profile: {profile}")
+
+        client = QdrantClient(qdrant_url=self.qdrant_url, collection_name=name, profile=profile)
+        try:
+            return await client.create_collection(enable_sparse=enable_sparse, **kwargs)
+        finally:
+            await client.close()
@@ -7,6 +7,7 @@ Extracted from SearchService to follow Single Responsibility Principle.
 Pre-loads critical collections and generates dummy embeddings to reduce cold-start latency.
 """
 
+import asyncio
 import logging
 import time
 from typing import Any
@@ -95,7 +96,9 @@ class CollectionWarmupService:
                 return False
 
             # Perform lightweight search to load indexes (async)
-            dummy_embedding = self.embedder.generate_query_embedding("test")
+            dummy_embedding = await asyncio.to_thread(
+                self.embedder.generate_query_embedding, "test"
+            )
             await vector_db.search(
                 query_embedding=dummy_embedding,
                 filter=None,
@@ -166,7 +169,7 @@ class CollectionWarmupService:
             # Step 1: Warm up embedding model with dummy query
             logger.info("   🔥 [Warmup] Step 1/2: Warming up embedding model...")
             dummy_query = "What is KITAS visa Indonesia pricing?"
-            self.embedder.generate_query_embedding(dummy_query)
+            await asyncio.to_thread(self.embedder.generate_query_embedding, dummy_query)
             logger.info("   ✅ [Warmup] Embedding model warmed up")
 
             # Step 2: Warm up Qdrant collections with light searches
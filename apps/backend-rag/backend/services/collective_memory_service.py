@@ -20,13 +20,16 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 import asyncpg
+from core.text_search import like_pattern, tsquery_sql
 
 if TYPE_CHECKING:
-    from core.embeddings import EmbeddingsGenerator
+    from core.embeddings import AsyncEmbeddingService, EmbeddingsGenerator
     from core.qdrant_db import QdrantClient
 
 logger = logging.getLogger(__name__)
 
+SEARCH_TSQUERY = tsquery_sql("$1")
+
 
 @dataclass
 class CollectiveMemory:
@@ -82,6 +85,7 @@ class CollectiveMemoryService:
     ):
         self.pool = pool
         self._embedder = embedder
+        self._async_embedder: AsyncEmbeddingService | None = None
         self._qdrant = qdrant_client
         self._qdrant_initialized = False
         logger.info("CollectiveMemoryService initialized")
@@ -98,6 +102,15 @@ class CollectiveMemoryService:
             self._embedder = create_embeddings_generator()
         return self._embedder
 
+    def _get_async_embedder(self) -> "AsyncEmbeddingService":
+        """Get async embedding front-end over the embeddings generator (lazy initialization)"""
+        embedder = self._get_embedder()
+        if self._async_embedder is None or self._async_embedder.embedder is not embedder:
+            from core.embeddings import AsyncEmbeddingService
+
+            self._async_embedder = AsyncEmbeddingService(embedder)
+        return self._async_embedder
+
     async def _get_qdrant(self) -> "QdrantClient":
         """Get or create Qdrant client (lazy initialization)"""
         if self._qdrant is None:
@@ -398,8 +411,7 @@ class CollectiveMemoryService:
         """
         try:
             # Generate embedding
-            embedder = self._get_embedder()
-            embedding = embedder.generate_single_embedding(content)
+            embedding = await self._get_async_embedder().embed_query(content)
 
             # Upsert to Qdrant
             qdrant = await self._get_qdrant()
@@ -458,8 +470,7 @@ class CollectiveMemoryService:
         """
         try:
             # Generate query embedding
-            embedder = self._get_embedder()
-            query_embedding = embedder.generate_query_embedding(query)
+            query_embedding = await self._get_async_embedder().embed_query(query)
 
             # Build filter
             qdrant_filter = {"is_promoted": True}
@@ -581,22 +592,24 @@ class CollectiveMemoryService:
 
     async def search_similar(self, query: str, limit: int = 5) -> list[CollectiveMemory]:
         """
-        Search for similar facts (simple text matching).
+        Search for similar facts (full-text or substring matching, ranked by ts_rank).
         For semantic search, would need vector embeddings.
         """
         if not self.pool:
             return []
 
         async with self.pool.acquire() as conn:
-            # Simple ILIKE search for now
+            # Both predicates are index-backed (migration 029)
             rows = await conn.fetch(
-                """
+                f"""
                 SELECT * FROM collective_memories
-                WHERE content ILIKE $1 AND is_promoted = TRUE
-                ORDER BY confidence DESC
-                LIMIT $2
+                WHERE (search_vector @@ {SEARCH_TSQUERY} OR content ILIKE $2)
+                  AND is_promoted = TRUE
+                ORDER BY ts_rank(search_vector, {SEARCH_TSQUERY}) DESC, confidence DESC
+                LIMIT $3
                 """,
-                f"%{query}%",
+                query,
+                like_pattern(query),
                 limit,
             )
 
@@ -1,3 +1,14 @@
+"""
+Conversation Service - conversation persistence for ZANTARA
+
+Messages are stored append-only in conversation_messages (one row per
+message, keyed by (conversation_id, seq)); the conversations row holds the
+session header plus a materialized summary (message_count, title,
+last_message_preview) for list views. Clients send the full transcript on
+every save, so only the messages past the stored count are inserted.
+"""
+
+import json
 from datetime import datetime
 from typing import Any
 
@@ -8,6 +19,215 @@ from services.memory_fallback import get_memory_cache
 
 logger = get_logger(__name__)
 
+TITLE_MAX_LENGTH = 50  # First user message shown as list title
+PREVIEW_MAX_LENGTH = 100  # Last assistant message shown as list preview
+
+
+def _truncate(text: str, max_length: int) -> str:
+    return text[:max_length] + "..." if len(text) > max_length else text
+
+
+def _message_row(conversation_id: int, seq: int, message: dict[str, Any]) -> tuple:
+    extra = {k: v for k, v in message.items() if k not in ("role", "content")}
+    content = message.get("content", "")
+    if not isinstance(content, str):
+        content = json.dumps(content, ensure_ascii=False)
+    return (conversation_id, seq, message.get("role", "unknown"), content, extra)
+
+
+def message_from_row(row: Any) -> dict[str, Any]:
+    """Rebuild the client message dict from a conversation_messages row."""
+    extra = row["extra"] or {}
+    if isinstance(extra, str):
+        extra = json.loads(extra)
+    return {"role": row["role"], "content": row["content"], **extra}
+
+
+def _extends_transcript(last_stored: Any, messages: list[dict[str, Any]], stored: int) -> bool:
+    if stored == 0:
+        return True
+    if last_stored is None or len(messages) < stored:
+        return False
+    candidate = messages[stored - 1]
+    return (last_stored["role"], last_stored["content"]) == (
+        candidate.get("role", "unknown"),
+        candidate.get("content", ""),
+    )
+
+
+async def append_messages(
+    conn: asyncpg.Connection,
+    user_email: str,
+    session_id: str,
+    messages: list[dict[str, Any]],
+    metadata: dict[str, Any] | None = None,
+) -> tuple[int, int]:
+    """
+    Append a session transcript to the user's latest conversation for it.
+
+    The transcript is matched against the stored one by its last stored
+    message; messages past the stored count are inserted. A transcript that
+    does not extend the stored one (history edited or reset client-side)
+    starts a new conversation, as every save used to.
+
+    Returns:
+        (conversation_id, number of messages inserted)
+    """
+    async with conn.transaction():
+        # Serialize saves of one session (server-side stream and client save race)
+        await conn.execute(
+            "SELECT pg_advisory_xact_lock(hashtext($1))", f"conversation:{user_email}:{session_id}"
+        )
+        conversation = await conn.fetchrow(
+            """
+            SELECT id, message_count
+            FROM conversations
+            WHERE user_id = $1 AND session_id = $2
+            ORDER BY created_at DESC
+            LIMIT 1
+            """,
+            user_email,
+            session_id,
+        )
+
+        start = 0
+        if conversation:
+            stored = conversation["message_count"] or 0
+            last_stored = None
+            if stored and len(messages) >= stored:
+                last_stored = await conn.fetchrow(
+                    """
+                    SELECT role, content FROM conversation_messages
+                    WHERE conversation_id = $1 AND seq = $2
+                    """,
+                    conversation["id"],
+                    stored,
+                )
+            if _extends_transcript(last_stored, messages, stored):
+                start = stored
+            else:
+                conversation = None
+
+        if conversation is None:
+            conversation = await conn.fetchrow(
+                """
+                INSERT INTO conversations (user_id, session_id, metadata, created_at, updated_at)
+                VALUES ($1, $2, $3, $4, $4)
+                RETURNING id, message_count
+                """,
+                user_email,
+                session_id,
+                metadata or {},
+                datetime.now(),
+            )
+            start = 0
+            metadata = None  # Already stored
+
+        conversation_id = conversation["id"]
+        new_messages = messages[start:]
+        if new_messages:
+            await conn.executemany(
+                """
+                INSERT INTO conversation_messages (conversation_id, seq, role, content, extra)
+                VALUES ($1, $2, $3, $4, $5)
+                """,
+                [
+                    _message_row(conversation_id, start + i, message)
+                    for i, message in enumerate(new_messages, start=1)
+                ],
+            )
+
+        if new_messages or metadata:
+            title = next(
+                (m.get("content", "") for m in new_messages if m.get("role") == "user"), None
+            )
+            preview = next(
+                (
+                    m.get("content", "")
+                    for m in reversed(new_messages)
+                    if m.get("role") == "assistant"
+                ),
+                None,
+            )
+            await conn.execute(
+                """
+                UPDATE conversations
+                SET message_count = $2,
+                    title = COALESCE(title, $3),
+                    last_message_preview = COALESCE($4, last_message_preview),
+                    metadata = COALESCE(metadata, '{}'::jsonb) || $5,
+                    updated_at = NOW()
+                WHERE id = $1
+                """,
+                conversation_id,
+                start + len(new_messages),
+                _truncate(title, TITLE_MAX_LENGTH) if isinstance(title, str) else None,
+                _truncate(preview, PREVIEW_MAX_LENGTH) if isinstance(preview, str) else None,
+                metadata or {},
+            )
+
+    return conversation_id, len(new_messages)
+
+
+async def fetch_recent_messages(
+    conn: asyncpg.Connection,
+    user_email: str,
+    limit: int | None = None,
+    session_id: str | None = None,
+    before_seq: int | None = None,
+) -> dict[str, Any] | None:
+    """
+    Fetch the last messages of the user's latest conversation (optionally of a session).
+
+    Keyset pagination: pass the returned next_before_seq as before_seq to get
+    the page of older messages. Only the requested rows are read.
+
+    Returns:
+        {"conversation_id", "session_id", "created_at", "messages",
+         "total", "next_before_seq"} or None if there is no conversation
+    """
+    session_filter = "AND session_id = $4" if session_id else ""
+    args: list[Any] = [user_email, limit, before_seq]
+    if session_id:
+        args.append(session_id)
+
+    rows = await conn.fetch(
+        f"""
+        SELECT c.id, c.session_id, c.created_at, c.message_count,
+               m.seq, m.role, m.content, m.extra
+        FROM (
+            SELECT id, session_id, created_at, message_count
+            FROM conversations
+            WHERE user_id = $1 {session_filter}
+            ORDER BY created_at DESC
+            LIMIT 1
+        ) c
+        LEFT JOIN LATERAL (
+            SELECT seq, role, content, extra
+            FROM conversation_messages
+            WHERE conversation_id = c.id AND ($3::int IS NULL OR seq < $3::int)
+            ORDER BY seq DESC
+            LIMIT $2
+        ) m ON TRUE
+        ORDER BY m.seq
+        """,
+        *args,
+    )
+    if not rows:
+        return None
+
+    first = rows[0]
+    message_rows = [row for row in rows if row["seq"] is not None]
+    oldest_seq = message_rows[0]["seq"] if message_rows else None
+    return {
+        "conversation_id": first["id"],
+        "session_id": first["session_id"],
+        "created_at": first["created_at"],
+        "messages": [message_from_row(row) for row in message_rows],
+        "total": first["message_count"] or 0,
+        "next_before_seq": oldest_seq if oldest_seq and oldest_seq > 1 else None,
+    }
+
 
 class ConversationService:
     """
@@ -67,29 +287,18 @@ class ConversationService:
         try:
             if self.db_pool:
                 async with self.db_pool.acquire() as conn:
-                    row = await conn.fetchrow(
-                        """
-                        INSERT INTO conversations (user_id, session_id, messages, metadata, created_at)
-                        VALUES ($1, $2, $3, $4, $5)
-                        RETURNING id
-                        """,
-                        user_email,
-                        session_id,
-                        messages,
-                        metadata,
-                        datetime.now(),
+                    conversation_id, appended = await append_messages(
+                        conn, user_email, session_id, messages, metadata
+                    )
+                    db_success = True
+                    log_success(
+                        logger,
+                        "Saved conversation to DB",
+                        conversation_id=conversation_id,
+                        user_email=user_email,
+                        messages_count=len(messages),
+                        messages_appended=appended,
                     )
-
-                    if row:
-                        conversation_id = row["id"]
-                        db_success = True
-                        log_success(
-                            logger,
-                            "Saved conversation to DB",
-                            conversation_id=conversation_id,
-                            user_email=user_email,
-                            messages_count=len(messages),
-                        )
             else:
                 logger.warning("⚠️ DB Pool unavailable, skipping DB save")
 
@@ -133,37 +342,18 @@ class ConversationService:
         Retrieve conversation history from DB or Memory Cache.
         """
         messages = []
+        total = 0
         source = "db"
 
         if self.db_pool:
             try:
                 async with self.db_pool.acquire() as conn:
-                    if session_id:
-                        row = await conn.fetchrow(
-                            """
-                            SELECT messages FROM conversations
-                            WHERE user_id = $1 AND session_id = $2
-                            ORDER BY created_at DESC LIMIT 1
-                            """,
-                            user_email,
-                            session_id,
-                        )
-                    else:
-                        row = await conn.fetchrow(
-                            """
-                            SELECT messages FROM conversations
-                            WHERE user_id = $1
-                            ORDER BY created_at DESC LIMIT 1
-                            """,
-                            user_email,
-                        )
-
-                    if row and row["messages"]:
-                        messages = row["messages"]
-                        if isinstance(messages, str):
-                            import json
-
-                            messages = json.loads(messages)
+                    page = await fetch_recent_messages(
+                        conn, user_email, limit=limit or None, session_id=session_id
+                    )
+                    if page:
+                        messages = page["messages"]
+                        total = page["total"]
             except Exception as e:
                 logger.error(f"Failed to fetch history from DB: {e}")
                 source = "fallback_failed"
@@ -175,6 +365,7 @@ class ConversationService:
                     cached = mem_cache.get_conversation(session_id)
                     if cached:
                         messages = cached
+                        total = len(cached)
                         source = "memory_cache"
             except Exception as e:
                 logger.warning(f"Failed to fetch history from memory cache: {e}")
@@ -182,5 +373,5 @@ class ConversationService:
         return {
             "messages": messages[-limit:] if limit else messages,
             "source": source,
-            "total": len(messages),
+            "total": total,
         }
@@ -5,6 +5,7 @@ Manages cultural insights storage and retrieval from Qdrant
 Extracted from SearchService to follow Single Responsibility Principle.
 """
 
+import asyncio
 import hashlib
 import logging
 from typing import Any
@@ -69,7 +70,7 @@ class CulturalInsightsService:
             doc_id = f"cultural_{metadata.get('topic', 'unknown')}_{content_hash[:8]}"
 
             # Generate embedding
-            embedding = self.embedder.generate_query_embedding(text)
+            embedding = await asyncio.to_thread(self.embedder.generate_query_embedding, text)
 
             # Get cultural insights collection
             cultural_db = self.collection_manager.get_collection(self.collection_name)
@@ -114,7 +115,7 @@ class CulturalInsightsService:
         """
         try:
             # Generate query embedding
-            query_embedding = self.embedder.generate_query_embedding(query)
+            query_embedding = await asyncio.to_thread(self.embedder.generate_query_embedding, query)
 
             # NOTE: Qdrant filtering is limited - we rely on semantic search instead
             # The when_to_use metadata is stored as comma-separated string, but Qdrant
@@ -182,4 +183,3 @@ class CulturalInsightsService:
         except Exception as e:
             logger.error(f"❌ Failed to get cultural topics coverage: {e}")
             return {}
-
@@ -11,20 +11,33 @@ Flow:
 4. If no match → proceed to normal RAG + Sonnet generation
 
 This provides 250x speedup for ~50-60% of queries.
+
+Semantic matching uses canonical-question embeddings persisted in
+golden_answers.question_embedding (migration 028). They are loaded once into a
+normalized float32 matrix, refreshed incrementally from golden_answers.updated_at
+and embedding_updated_at, and a lookup is one query encode plus one matrix-vector
+product in a worker thread, whatever the size of the golden set. Rows without an
+embedding are encoded by a background task, never inside a lookup.
 """
 
+import asyncio
 import hashlib
 import logging
+import time
+from datetime import datetime, timedelta
 
 import asyncpg
 import numpy as np
 
 # SECURITY: Lazy import of sentence_transformers to avoid PyTorch import issues during test collection
 # SentenceTransformer will be imported inside methods when needed
-from sklearn.metrics.pairwise import cosine_similarity
 
 logger = logging.getLogger(__name__)
 
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+INDEX_REFRESH_INTERVAL = 30.0  # Seconds between checks for golden_answers changes
+INDEX_REFRESH_OVERLAP = timedelta(seconds=5)  # Re-read window for late-committing updates
+
 
 class GoldenAnswerService:
     """
@@ -43,6 +56,16 @@ class GoldenAnswerService:
         self.model: SentenceTransformer | None = None
         self.similarity_threshold = 0.80  # 80% similarity required
 
+        # In-memory embedding index over all golden answers
+        self._index_vectors: dict[str, np.ndarray] = {}
+        self._index_ids: list[str] = []
+        self._index_matrix: np.ndarray | None = None  # (n, dim) float32, L2-normalized rows
+        self._index_watermark: datetime | None = None  # DB clock at the last refresh
+        self._index_checked_at = 0.0
+        self._index_lock = asyncio.Lock()
+        self._index_pending: dict[str, str] = {}  # cluster_id -> question awaiting embedding
+        self._embed_task: asyncio.Task | None = None
+
     async def connect(self):
         """Initialize PostgreSQL connection pool"""
         try:
@@ -69,7 +92,20 @@ class GoldenAnswerService:
             from sentence_transformers import SentenceTransformer
 
             logger.info("Loading embedding model for similarity matching...")
-            self.model = SentenceTransformer("all-MiniLM-L6-v2")
+            self.model = SentenceTransformer(EMBEDDING_MODEL)
+
+    def _encode(self, texts: list[str]) -> np.ndarray:
+        """Encode texts into L2-normalized float32 rows (blocking, run in a thread)"""
+        vectors = np.asarray(self.model.encode(texts), dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+
+    def _best_match(self, query: str, matrix: np.ndarray) -> tuple[int, float]:
+        """Index and cosine similarity of the closest row (blocking, run in a thread)"""
+        similarities = matrix @ self._encode([query])[0]
+        best_idx = int(np.argmax(similarities))
+        return best_idx, float(similarities[best_idx])
 
     async def lookup_golden_answer(self, query: str, _user_id: str | None = None) -> dict | None:
         """
@@ -165,58 +201,188 @@ class GoldenAnswerService:
             return None
 
         try:
-            # Load embedding model
-            self._load_model()
+            await self._refresh_index()
+
+            # Snapshot: a concurrent refresh swaps both together
+            cluster_ids, matrix = self._index_ids, self._index_matrix
+            if matrix is None or not cluster_ids:
+                return None
+
+            await asyncio.to_thread(self._load_model)
+            best_idx, best_similarity = await asyncio.to_thread(self._best_match, query, matrix)
+
+            if best_similarity < self.similarity_threshold:
+                return None
 
-            # Get all canonical questions from golden_answers
             async with self.pool.acquire() as conn:
-                golden_answers = await conn.fetch(
+                best_match = await conn.fetchrow(
                     """
-                    SELECT
-                        cluster_id,
-                        canonical_question,
-                        answer,
-                        sources,
-                        confidence,
-                        usage_count
+                    SELECT cluster_id, canonical_question, answer, sources, confidence
                     FROM golden_answers
-                    ORDER BY usage_count DESC
-                    LIMIT 100
-                """
+                    WHERE cluster_id = $1
+                """,
+                    cluster_ids[best_idx],
                 )
 
-            if not golden_answers:
+            if not best_match:  # Deleted since the last refresh
                 return None
 
-            # Generate embeddings
-            query_embedding = self.model.encode([query])[0]
-            canonical_questions = [ga["canonical_question"] for ga in golden_answers]
-            canonical_embeddings = self.model.encode(canonical_questions)
+            return {
+                "cluster_id": best_match["cluster_id"],
+                "canonical_question": best_match["canonical_question"],
+                "answer": best_match["answer"],
+                "sources": best_match["sources"],
+                "confidence": best_match["confidence"],
+                "similarity": best_similarity,
+            }
 
-            # Calculate similarities
-            similarities = cosine_similarity([query_embedding], canonical_embeddings)[0]
+        except Exception as e:
+            logger.error(f"❌ Semantic lookup failed: {e}")
+            return None
 
-            # Find best match above threshold
-            best_idx = np.argmax(similarities)
-            best_similarity = similarities[best_idx]
+    async def _refresh_index(self, force: bool = False):
+        """
+        Bring the embedding index up to date with golden_answers
 
-            if best_similarity >= self.similarity_threshold:
-                best_match = golden_answers[best_idx]
+        Reads only rows changed since the last refresh (at most every
+        INDEX_REFRESH_INTERVAL seconds); a row count that no longer matches
+        (deletes) triggers a full reload. Rows without a stored embedding for
+        EMBEDDING_MODEL are left out of the index and handed to a background
+        task that encodes them and writes them back.
 
-                return {
-                    "cluster_id": best_match["cluster_id"],
-                    "canonical_question": best_match["canonical_question"],
-                    "answer": best_match["answer"],
-                    "sources": best_match["sources"],
-                    "confidence": best_match["confidence"],
-                    "similarity": float(best_similarity),
-                }
+        Args:
+            force: Check for changes even if the interval has not elapsed
+        """
+        if not force and time.monotonic() - self._index_checked_at < INDEX_REFRESH_INTERVAL:
+            return
 
-            return None
+        async with self._index_lock:
+            if not force and time.monotonic() - self._index_checked_at < INDEX_REFRESH_INTERVAL:
+                return  # Refreshed while waiting for the lock
 
-        except Exception as e:
-            logger.error(f"❌ Semantic lookup failed: {e}")
-            return None
+            since = self._index_watermark - INDEX_REFRESH_OVERLAP if self._index_watermark else None
+            async with self.pool.acquire() as conn:
+                # updated_at / embedding_updated_at are NOW() in session time
+                status = await conn.fetchrow(
+                    "SELECT COUNT(*) AS total, LOCALTIMESTAMP AS now FROM golden_answers"
+                )
+                total = status["total"]
+                rows = await self._fetch_index_rows(conn, since)
+
+                known = (
+                    self._index_vectors.keys()
+                    | self._index_pending.keys()
+                    | {row["cluster_id"] for row in rows}
+                )
+                if since is not None and len(known) != total:
+                    since = None
+                    rows = await self._fetch_index_rows(conn, None)
+
+            vectors = {} if since is None else dict(self._index_vectors)
+            pending = {} if since is None else self._index_pending
+            for row in rows:
+                cluster_id = row["cluster_id"]
+                if row["question_embedding"] and row["embedding_model"] == EMBEDDING_MODEL:
+                    vectors[cluster_id] = np.asarray(row["question_embedding"], dtype=np.float32)
+                    pending.pop(cluster_id, None)
+                else:
+                    # Never serve the previous vector of a changed question
+                    vectors.pop(cluster_id, None)
+                    pending[cluster_id] = row["canonical_question"]
+            self._index_pending = pending
+
+            if since is None or rows:
+                self._set_index(vectors)
+            self._index_watermark = status["now"]
+            self._index_checked_at = time.monotonic()
+
+            if pending and (self._embed_task is None or self._embed_task.done()):
+                self._embed_task = asyncio.create_task(self._embed_pending())
+
+            if since is None:
+                logger.info(
+                    f"🔎 Golden answer index: {len(self._index_ids)} questions "
+                    f"({len(pending)} waiting for embeddings)"
+                )
+
+    def _set_index(self, vectors: dict[str, np.ndarray]):
+        """Swap in a new index (ids and matrix together; lookups snapshot both)"""
+        self._index_vectors = vectors
+        self._index_ids = list(vectors)
+        self._index_matrix = (
+            np.vstack([vectors[cid] for cid in self._index_ids]) if vectors else None
+        )
+
+    async def _embed_pending(self):
+        """Encode questions waiting for an embedding, store them and add them to the index"""
+        while self._index_pending:
+            batch = list(self._index_pending.items())
+            try:
+                await asyncio.to_thread(self._load_model)
+                encoded = await asyncio.to_thread(self._encode, [q for _, q in batch])
+                async with self.pool.acquire() as conn:
+                    await self._store_embeddings(conn, batch, encoded)
+            except Exception as e:
+                # Retried by the next refresh that still finds them pending
+                logger.warning(f"⚠️ Failed to embed golden answer questions: {e}")
+                return
+
+            async with self._index_lock:
+                vectors = dict(self._index_vectors)
+                for (cluster_id, question), vector in zip(batch, encoded, strict=True):
+                    # Skip rows deleted or re-worded while encoding
+                    if self._index_pending.get(cluster_id) == question:
+                        del self._index_pending[cluster_id]
+                        vectors[cluster_id] = vector
+                self._set_index(vectors)
+            logger.info(f"🔎 Golden answer index: embedded {len(batch)} questions")
+
+    async def backfill_embeddings(self) -> int:
+        """
+        Embed every golden answer without a current embedding and wait for it
+
+        For migrations and startup tasks, so lookups never start cold.
+
+        Returns:
+            Number of questions that were waiting for an embedding
+        """
+        if not self.pool:
+            await self.connect()
+        await self._refresh_index(force=True)
+        waiting = len(self._index_pending)
+        if self._embed_task:
+            await self._embed_task
+        return waiting
+
+    @staticmethod
+    async def _fetch_index_rows(conn: asyncpg.Connection, since: datetime | None) -> list:
+        """Golden answers whose row or embedding changed after `since` (all rows if None)"""
+        return await conn.fetch(
+            """
+            SELECT cluster_id, canonical_question, question_embedding, embedding_model
+            FROM golden_answers
+            WHERE $1::timestamp IS NULL
+               OR updated_at > $1::timestamp
+               OR embedding_updated_at > $1::timestamp
+        """,
+            since,
+        )
+
+    async def _store_embeddings(
+        self, conn: asyncpg.Connection, questions: list[tuple[str, str]], vectors: np.ndarray
+    ):
+        """Persist computed embeddings (skipped for rows whose question changed meanwhile)"""
+        await conn.executemany(
+            """
+            UPDATE golden_answers
+            SET question_embedding = $2, embedding_model = $3, embedding_updated_at = NOW()
+            WHERE cluster_id = $1 AND canonical_question = $4
+        """,
+            [
+                (cluster_id, vector.tolist(), EMBEDDING_MODEL, question)
+                for (cluster_id, question), vector in zip(questions, vectors, strict=True)
+            ],
+        )
 
     async def _increment_usage(self, cluster_id: str):
         """
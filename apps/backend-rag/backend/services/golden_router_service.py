@@ -192,7 +192,7 @@ class GoldenRouterService:
             return None
 
         # 1. Embed query
-        query_embedding = self.embeddings.generate_query_embedding(query)
+        query_embedding = await asyncio.to_thread(self.embeddings.generate_query_embedding, query)
         query_vec = np.array(query_embedding).reshape(1, -1)
 
         # 2. Calcola similarità
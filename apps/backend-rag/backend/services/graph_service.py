@@ -5,24 +5,90 @@ Graph Service - Persistent Knowledge Graph using PostgreSQL
 Provides CRUD operations and traversal logic for the Knowledge Graph
 stored in 'kg_entities' and 'kg_relationships' tables.
 
+Traversal is breadth-first and expands a whole frontier per query, so a
+depth-N traversal costs N + 1 round-trips regardless of how many nodes it
+visits. Subgraphs are cached in memory.
+
+Entity lookup by name first matches the names mentioned in the query against
+an in-memory gazetteer of entity names (reloaded periodically, updated by
+add_entity) and fetches the hits by primary key; the ILIKE scan is only the
+fallback for partial names.
+
 Replaces the in-memory storage of KnowledgeGraphBuilder.
 """
 
+import asyncio
 import json
 import logging
-from typing import Any, Optional
+import time
+from typing import Any, Literal
 
 import asyncpg
+from core.cache import LRUCache
+from core.gazetteer import Gazetteer
 from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
+Direction = Literal["out", "in", "both"]
+
+TRAVERSE_MAX_FANOUT = 50  # Strongest edges followed per node and depth
+TRAVERSE_MAX_NODES = 500  # Subgraph size cap
+SUBGRAPH_CACHE_TTL = 300  # 5 minutes; writes through this service clear it immediately
+SUBGRAPH_CACHE_MAX_ENTRIES = 256
+SUBGRAPH_CACHE_MAX_BYTES = 16 * 1024 * 1024
+ENTITY_NAMES_RELOAD_INTERVAL = 300  # Seconds before reloading the name gazetteer
+
+# One BFS level over the whole frontier: for each frontier node, its strongest
+# max_fanout edges in the requested direction(s) (LIMIT NULL = all), then the
+# entity at the other end of each kept edge.
+_EDGE_BRANCHES = {
+    "out": """
+        SELECT source_entity_id, target_entity_id, relationship_type, strength,
+               target_entity_id AS other_id
+        FROM kg_relationships
+        WHERE source_entity_id = f.id
+          AND COALESCE(strength, 1.0) >= $2
+          AND ($3::text[] IS NULL OR relationship_type = ANY($3::text[]))
+    """,
+    "in": """
+        SELECT source_entity_id, target_entity_id, relationship_type, strength,
+               source_entity_id AS other_id
+        FROM kg_relationships
+        WHERE target_entity_id = f.id
+          AND COALESCE(strength, 1.0) >= $2
+          AND ($3::text[] IS NULL OR relationship_type = ANY($3::text[]))
+    """,
+}
+
+
+def _frontier_query(direction: str) -> str:
+    branches = ("out", "in") if direction == "both" else (direction,)
+    edges = " UNION ALL ".join(_EDGE_BRANCHES[branch] for branch in branches)
+    return f"""
+        SELECT x.source_entity_id, x.target_entity_id, x.relationship_type, x.strength,
+               e.id AS node_id, e.type AS node_type, e.name AS node_name,
+               e.description AS node_desc
+        FROM unnest($1::text[]) AS f(id)
+        CROSS JOIN LATERAL (
+            SELECT * FROM ({edges}) edges
+            ORDER BY strength DESC NULLS LAST, other_id
+            LIMIT $4::int
+        ) x
+        JOIN kg_entities e ON e.id = x.other_id
+    """
+
+
+_FRONTIER_QUERIES: dict[str, str] = {
+    direction: _frontier_query(direction) for direction in ("out", "in", "both")
+}
+
 
 class GraphEntity(BaseModel):
     id: str
     type: str
     name: str
-    description: Optional[str] = None
+    description: str | None = None
     properties: dict[str, Any] = {}
 
 
@@ -37,6 +103,21 @@ class GraphRelation(BaseModel):
 class GraphService:
     def __init__(self, db_pool: asyncpg.Pool):
         self.pool = db_pool
+        # Hot subgraphs (the agent re-explores the same entities across ReAct steps)
+        self._subgraph_cache = LRUCache(
+            max_size=SUBGRAPH_CACHE_MAX_ENTRIES,
+            max_bytes=SUBGRAPH_CACHE_MAX_BYTES,
+            default_ttl=SUBGRAPH_CACHE_TTL,
+            name="kg_subgraph",
+        )
+        # Entity names for find_entity_by_name (loaded on first use)
+        self._entity_names = Gazetteer()
+        self._entity_names_loaded_at = 0.0
+        self._entity_names_lock = asyncio.Lock()
+
+    def invalidate_cache(self) -> int:
+        """Drop cached subgraphs (any write may change any of them)."""
+        return self._subgraph_cache.clear()
 
     async def add_entity(self, entity: GraphEntity) -> str:
         """Upsert an entity into the graph."""
@@ -51,7 +132,7 @@ class GraphService:
             RETURNING id
         """
         async with self.pool.acquire() as conn:
-            return await conn.fetchval(
+            entity_id = await conn.fetchval(
                 query,
                 entity.id,
                 entity.type,
@@ -59,6 +140,9 @@ class GraphService:
                 entity.description,
                 json.dumps(entity.properties),
             )
+        self.invalidate_cache()
+        self._entity_names.add(entity_id, (entity.name,))
+        return entity_id
 
     async def add_relation(self, relation: GraphRelation) -> int:
         """Upsert a relationship edge."""
@@ -71,7 +155,7 @@ class GraphService:
             RETURNING id
         """
         async with self.pool.acquire() as conn:
-            return await conn.fetchval(
+            relation_id = await conn.fetchval(
                 query,
                 relation.source_id,
                 relation.target_id,
@@ -79,10 +163,10 @@ class GraphService:
                 relation.strength,
                 json.dumps(relation.properties),
             )
+        self.invalidate_cache()
+        return relation_id
 
-    async def get_neighbors(
-        self, entity_id: str, relation_type: Optional[str] = None
-    ) -> list[dict]:
+    async def get_neighbors(self, entity_id: str, relation_type: str | None = None) -> list[dict]:
         """Get outgoing edges and target entities for a node."""
         query = """
             SELECT
@@ -105,16 +189,57 @@ class GraphService:
             rows = await conn.fetch(query, *params)
             return [dict(row) for row in rows]
 
+    async def _load_entity_names(self) -> Gazetteer:
+        """Entity name gazetteer, reloaded every ENTITY_NAMES_RELOAD_INTERVAL seconds."""
+        if time.monotonic() - self._entity_names_loaded_at < ENTITY_NAMES_RELOAD_INTERVAL:
+            return self._entity_names
+
+        async with self._entity_names_lock:
+            if time.monotonic() - self._entity_names_loaded_at >= ENTITY_NAMES_RELOAD_INTERVAL:
+                async with self.pool.acquire() as conn:
+                    rows = await conn.fetch("SELECT id, name, canonical_name FROM kg_entities")
+                names = Gazetteer()
+                for row in rows:
+                    names.add(row["id"], (row["name"], row["canonical_name"]))
+                await asyncio.to_thread(names.compile)
+                self._entity_names = names
+                self._entity_names_loaded_at = time.monotonic()
+        return self._entity_names
+
     async def find_entity_by_name(self, name_query: str, limit: int = 5) -> list[GraphEntity]:
-        """Fuzzy search for entities by name."""
-        query = """
-            SELECT id, type, name, description, properties
-            FROM kg_entities
-            WHERE name ILIKE $1
-            LIMIT $2
         """
+        Find entities by name.
+
+        Entities whose name or canonical name occurs in name_query are fetched
+        by id (longest name first); otherwise falls back to a fuzzy ILIKE search.
+        """
+        names = await self._load_entity_names()
+        entity_ids = names.find(name_query)
+
         async with self.pool.acquire() as conn:
-            rows = await conn.fetch(query, f"%{name_query}%", limit)
+            if entity_ids:
+                rows = await conn.fetch(
+                    """
+                    SELECT id, type, name, description, properties
+                    FROM kg_entities
+                    WHERE id = ANY($1::text[])
+                    ORDER BY length(name) DESC, mention_count DESC NULLS LAST
+                    LIMIT $2
+                    """,
+                    entity_ids,
+                    limit,
+                )
+            else:
+                rows = await conn.fetch(
+                    """
+                    SELECT id, type, name, description, properties
+                    FROM kg_entities
+                    WHERE name ILIKE $1
+                    LIMIT $2
+                    """,
+                    f"%{name_query}%",
+                    limit,
+                )
             return [
                 GraphEntity(
                     id=row["id"],
@@ -128,58 +253,118 @@ class GraphService:
                 for row in rows
             ]
 
-    async def traverse(self, start_id: str, max_depth: int = 2) -> dict[str, Any]:
+    async def traverse(
+        self,
+        start_id: str,
+        max_depth: int = 2,
+        direction: Direction = "out",
+        min_strength: float = 0.0,
+        relation_types: list[str] | None = None,
+        max_fanout: int | None = TRAVERSE_MAX_FANOUT,
+        max_nodes: int | None = TRAVERSE_MAX_NODES,
+        use_cache: bool = True,
+    ) -> dict[str, Any]:
         """
         BFS Traversal from a starting node.
         Returns a subgraph (nodes and edges).
+
+        Each depth level is one query over the whole frontier, so the cost is
+        max_depth + 1 round-trips instead of one per visited node.
+
+        Args:
+            start_id: Entity to start from
+            max_depth: Number of hops to expand
+            direction: Follow outgoing edges ("out"), incoming ("in") or both
+            min_strength: Ignore edges weaker than this
+            relation_types: Only follow these relationship types (None = all)
+            max_fanout: Strongest edges followed per node and level (None = all)
+            max_nodes: Stop adding nodes past this many (None = unbounded)
+            use_cache: Serve/store the result in the subgraph cache
+
+        Returns:
+            {"nodes": [...], "edges": [...], "truncated": bool}; cached results
+            are shared, so callers must not mutate them
         """
-        nodes = {}
-        edges = []
-        queue = [(start_id, 0)]
-        visited = set()
+        if direction not in _FRONTIER_QUERIES:
+            raise ValueError(f"Invalid direction '{direction}' (expected out, in or both)")
+
+        types = sorted(set(relation_types)) if relation_types else None
+        cache_key = (
+            start_id,
+            max_depth,
+            direction,
+            min_strength,
+            tuple(types) if types else None,
+            max_fanout,
+            max_nodes,
+        )
+        if use_cache:
+            cached = self._subgraph_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        nodes: dict[str, dict[str, Any]] = {}
+        edges: list[dict[str, Any]] = []
+        seen_edges: set[tuple[str, str, str]] = set()
+        truncated = False
+        frontier_query = _FRONTIER_QUERIES[direction]
 
         async with self.pool.acquire() as conn:
             # Get start node
-            start_node = await conn.fetchrow("SELECT * FROM kg_entities WHERE id = $1", start_id)
+            start_node = await conn.fetchrow(
+                "SELECT id, type, name, description FROM kg_entities WHERE id = $1", start_id
+            )
             if start_node:
-                nodes[start_id] = dict(start_node)
-                visited.add(start_id)
+                nodes[start_id] = {**dict(start_node), "depth": 0}
 
-            while queue:
-                current_id, depth = queue.pop(0)
-                if depth >= max_depth:
-                    continue
+            frontier = [start_id]
+            for depth in range(1, max_depth + 1):
+                if not frontier:
+                    break
 
-                # Fetch outgoing edges
                 rows = await conn.fetch(
-                    """
-                    SELECT r.*, e.type as target_type, e.name as target_name, e.description as target_desc
-                    FROM kg_relationships r
-                    JOIN kg_entities e ON r.target_entity_id = e.id
-                    WHERE r.source_entity_id = $1
-                """,
-                    current_id,
+                    frontier_query, frontier, float(min_strength), types, max_fanout
                 )
 
+                next_frontier = []
                 for row in rows:
-                    target_id = row["target_entity_id"]
-
-                    edge = {
-                        "source": current_id,
-                        "target": target_id,
-                        "type": row["relationship_type"],
-                        "strength": row["strength"],
-                    }
-                    edges.append(edge)
-
-                    if target_id not in visited:
-                        visited.add(target_id)
-                        nodes[target_id] = {
-                            "id": target_id,
-                            "type": row["target_type"],
-                            "name": row["target_name"],
-                            "description": row["target_desc"],
-                        }
-                        queue.append((target_id, depth + 1))
-
-        return {"nodes": list(nodes.values()), "edges": edges}
+                    node_id = row["node_id"]
+                    if node_id not in nodes and node_id != start_id:
+                        if max_nodes is not None and len(nodes) >= max_nodes:
+                            truncated = True
+                        else:
+                            nodes[node_id] = {
+                                "id": node_id,
+                                "type": row["node_type"],
+                                "name": row["node_name"],
+                                "description": row["node_desc"],
+                                "depth": depth,
+                            }
+                            next_frontier.append(node_id)
+                    if node_id not in nodes:
+                        # Far end was dropped (past max_nodes, or a missing start entity)
+                        continue
+
+                    # An edge between two frontier nodes comes back once per direction
+                    edge_key = (
+                        row["source_entity_id"],
+                        row["target_entity_id"],
+                        row["relationship_type"],
+                    )
+                    if edge_key not in seen_edges:
+                        seen_edges.add(edge_key)
+                        edges.append(
+                            {
+                                "source": row["source_entity_id"],
+                                "target": row["target_entity_id"],
+                                "type": row["relationship_type"],
+                                "strength": row["strength"],
+                            }
+                        )
+
+                frontier = next_frontier
+
+        subgraph = {"nodes": list(nodes.values()), "edges": edges, "truncated": truncated}
+        if use_cache:
+            self._subgraph_cache.set(cache_key, subgraph)
+        return subgraph
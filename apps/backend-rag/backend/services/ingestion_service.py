@@ -4,6 +4,7 @@ Book processing pipeline: parse → chunk → embed → store
 Auto-routes legal documents to LegalIngestionService
 """
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import Any
@@ -130,7 +131,7 @@ class IngestionService:
 
             # Step 5: Generate embeddings
             chunk_texts = [chunk["text"] for chunk in chunks]
-            embeddings = self.embedder.generate_embeddings(chunk_texts)
+            embeddings = await asyncio.to_thread(self.embedder.generate_embeddings, chunk_texts)
             logger.info(f"Generated {len(embeddings)} embeddings")
 
             # Step 6: Prepare metadata for each chunk
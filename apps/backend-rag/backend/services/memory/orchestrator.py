@@ -21,13 +21,16 @@ Usage:
     )
 """
 
+import asyncio
 import logging
 import time
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 
 import asyncpg
 from agents.services.kg_repository import KnowledgeGraphRepository
+from core.cache import LRUCache
 
 from services.collective_memory_service import CollectiveMemoryService
 from services.episodic_memory_service import EpisodicMemoryService
@@ -43,6 +46,38 @@ from services.memory_service_postgres import MemoryServicePostgres
 
 logger = logging.getLogger(__name__)
 
+try:
+    from app.core.config import settings
+except ImportError:
+    settings = None
+
+try:
+    from app.metrics import memory_context_source_duration
+
+    METRICS_AVAILABLE = True
+except ImportError:
+    METRICS_AVAILABLE = False
+
+# User context assembly
+CONTEXT_SOURCE_TIMEOUT = 1.5  # seconds per source (overridden by settings)
+CONTEXT_CACHE_TTL = 30.0  # seconds (overridden by settings)
+CONTEXT_CACHE_MAX_ENTRIES = 2048
+CONTEXT_CACHE_MAX_BYTES = 16 * 1024 * 1024
+FACT_VERSIONS_MAX_USERS = 10_000
+
+_MISSING = object()
+
+
+def _observe_source(source: str, outcome: str, elapsed: float) -> None:
+    """Record per-source context latency (Prometheus histogram + debug log)."""
+    if METRICS_AVAILABLE:
+        memory_context_source_duration.labels(source=source, outcome=outcome).observe(elapsed)
+    logger.debug(f"Context source '{source}': {outcome} in {elapsed * 1000:.1f}ms")
+
+
+async def _constant(value: Any) -> Any:
+    return value
+
 
 class MemoryOrchestrator:
     """
@@ -73,6 +108,31 @@ class MemoryOrchestrator:
         self._kg_repository: KnowledgeGraphRepository | None = None
         self._is_initialized = False
 
+        self._source_timeout = (
+            getattr(settings, "timeout_memory_context_source", None) if settings else None
+        ) or CONTEXT_SOURCE_TIMEOUT
+        self._cache_ttl = (
+            getattr(settings, "memory_context_cache_ttl", None) if settings else None
+        ) or CONTEXT_CACHE_TTL
+        # Context source cache; keys of per-user sources include the user's fact
+        # version, bumped whenever new facts are saved
+        self._context_cache = LRUCache(
+            max_size=CONTEXT_CACHE_MAX_ENTRIES,
+            max_bytes=CONTEXT_CACHE_MAX_BYTES,
+            default_ttl=self._cache_ttl,
+            name="memory_context",
+        )
+        # Evicting a user's version also drops their cached sources, so a missing
+        # version can safely restart from 0
+        self._fact_versions = LRUCache(
+            max_size=FACT_VERSIONS_MAX_USERS,
+            default_ttl=None,
+            name="memory_fact_versions",
+            on_evict=lambda user_email, _version: self._drop_user_context(user_email),
+        )
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        self._invalidation_hooks: list[Callable[[str], None]] = []
+
         logger.info("📝 MemoryOrchestrator created")
 
     @property
@@ -109,6 +169,8 @@ class MemoryOrchestrator:
                 await self._memory_service.connect()
                 self._db_pool = self._memory_service.pool
 
+            self._memory_service.add_invalidation_hook(self.invalidate_user_context)
+
             # Create fact extractor
             self._fact_extractor = MemoryFactExtractor()
 
@@ -138,6 +200,11 @@ class MemoryOrchestrator:
         Safe to call multiple times.
         """
         try:
+            for task in list(self._inflight.values()):
+                task.cancel()
+            self._inflight.clear()
+            self._context_cache.clear()
+
             if self._memory_service:
                 await self._memory_service.close()
 
@@ -155,12 +222,99 @@ class MemoryOrchestrator:
         if not self._is_initialized:
             raise RuntimeError("MemoryOrchestrator not initialized. Call initialize() first.")
 
+    def add_invalidation_hook(self, hook: Callable[[str], None]) -> None:
+        """
+        Register a callback run with the user's email when their context changes.
+
+        Used by caches built on top of the user context (e.g. system prompts).
+        """
+        self._invalidation_hooks.append(hook)
+
+    def invalidate_user_context(self, user_email: str) -> None:
+        """
+        Bump the user's fact version so cached context sources are refetched.
+
+        Called after facts or timeline events are saved for the user (also via
+        the memory service invalidation hook). Entries for the old version are
+        dropped right away; registered hooks are notified.
+        """
+        self._fact_versions.set(user_email, self._fact_versions.get(user_email, 0) + 1)
+        self._drop_user_context(user_email)
+        for hook in self._invalidation_hooks:
+            try:
+                hook(user_email)
+            except Exception as e:
+                logger.warning(f"Context invalidation hook failed for {user_email}: {e}")
+
+    def _drop_user_context(self, user_email: str) -> None:
+        self._context_cache.invalidate(lambda key: len(key) == 3 and key[1] == user_email)
+
+    def _cache_get(self, key: tuple) -> tuple[bool, Any]:
+        value = self._context_cache.get(key, _MISSING)
+        if value is _MISSING:
+            return False, None
+        return True, value
+
+    def _cache_set(self, key: tuple, value: Any) -> None:
+        self._context_cache.set(key, value)
+
+    async def _fetch_source(self, source: str, key: tuple, fetch, default: Any) -> Any:
+        """
+        Fetch one context source with a short-TTL cache and a deadline.
+
+        A source that misses the deadline contributes its default to this turn;
+        its fetch keeps running and caches the result for the next turn.
+
+        Args:
+            source: Source name (for logs and metrics)
+            key: Cache key
+            fetch: Zero-argument coroutine function producing the value
+            default: Value used on timeout or error
+
+        Returns:
+            Source value or default
+        """
+        hit, value = self._cache_get(key)
+        if hit:
+            _observe_source(source, "cache", 0.0)
+            return value
+
+        start = time.perf_counter()
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+
+            def _on_done(done: asyncio.Task) -> None:
+                self._inflight.pop(key, None)
+                if not done.cancelled() and done.exception() is None:
+                    self._cache_set(key, done.result())
+
+            task.add_done_callback(_on_done)
+
+        try:
+            value = await asyncio.wait_for(asyncio.shield(task), timeout=self._source_timeout)
+            outcome = "ok"
+        except asyncio.TimeoutError:
+            logger.warning(f"⏱️ Context source '{source}' missed {self._source_timeout}s deadline")
+            value, outcome = default, "timeout"
+        except Exception as e:
+            logger.warning(f"Failed to get {source} context: {e}")
+            value, outcome = default, "error"
+
+        _observe_source(source, outcome, time.perf_counter() - start)
+        return value
+
     async def get_user_context(self, user_email: str, query: str | None = None) -> MemoryContext:
         """
         Get user context from memory for use in AI responses.
 
         This method retrieves all stored facts and context for a user,
-        formatted for use as system prompt context.
+        formatted for use as system prompt context. Sources (profile memory,
+        collective memory, episodic timeline, KG entities) are fetched
+        concurrently, each with its own deadline and short-TTL cache, so the
+        latency is that of the slowest source and a failing or slow source only
+        drops its own part of the context.
 
         Args:
             user_email: User identifier (email address)
@@ -180,61 +334,79 @@ class MemoryOrchestrator:
                 logger.warning("Memory service not available, returning empty context")
                 return MemoryContext(user_id=user_email, has_data=False)
 
-            # Get memory from PostgreSQL (force refresh for API calls to avoid stale cache)
-            memory = await self._memory_service.get_memory(user_email, force_refresh=True)
+            # Cache keys carry the user's fact version: saved facts invalidate immediately,
+            # the TTL bounds staleness from writes made by other workers
+            version = self._fact_versions.get(user_email, 0)
+            memory_service = self._memory_service
+            fetches = [
+                self._fetch_source(
+                    "memory",
+                    ("memory", user_email, version),
+                    lambda: memory_service.get_memory(user_email, force_refresh=True),
+                    None,
+                )
+            ]
 
-            # Get collective memory (query-aware if query provided)
-            collective_facts: list[str] = []
+            # Collective memory (query-aware if query provided, else confidence-based)
             if self._collective_memory:
-                try:
-                    if query:
-                        # Query-aware semantic retrieval
-                        collective_facts = await self._collective_memory.get_relevant_context(
-                            query=query,
-                            limit=10,
-                        )
-                        logger.debug(
-                            f"Retrieved {len(collective_facts)} relevant collective facts for query"
-                        )
-                    else:
-                        # Fallback to confidence-based retrieval
-                        collective_facts = await self._collective_memory.get_collective_context(
-                            limit=10
-                        )
-                except Exception as e:
-                    logger.warning(f"Failed to get collective memory: {e}")
+                collective = self._collective_memory
+                fetches.append(
+                    self._fetch_source(
+                        "collective",
+                        ("collective", query),
+                        (
+                            (lambda: collective.get_relevant_context(query=query, limit=10))
+                            if query
+                            else (lambda: collective.get_collective_context(limit=10))
+                        ),
+                        [],
+                    )
+                )
+            else:
+                fetches.append(_constant([]))
 
-            # Get episodic memory (timeline of events)
-            timeline_summary: str = ""
+            # Episodic memory (timeline of events)
             if self._episodic_memory:
-                try:
-                    timeline_summary = await self._episodic_memory.get_context_summary(
-                        user_id=user_email,
-                        limit=5,
+                episodic = self._episodic_memory
+                fetches.append(
+                    self._fetch_source(
+                        "timeline",
+                        ("timeline", user_email, version),
+                        lambda: episodic.get_context_summary(user_id=user_email, limit=5),
+                        "",
                     )
-                    if timeline_summary:
-                        logger.debug(f"Retrieved timeline summary for {user_email}")
-                except Exception as e:
-                    logger.warning(f"Failed to get episodic memory: {e}")
+                )
+            else:
+                fetches.append(_constant(""))
 
-            # Get knowledge graph entities for context
-            kg_entities: list[dict] = []
+            # Knowledge graph entities for the query
             if self._kg_repository and query:
-                try:
-                    kg_entities = await self._kg_repository.get_entity_context_for_query(
-                        query=query,
-                        limit=5,
+                kg_repository = self._kg_repository
+                fetches.append(
+                    self._fetch_source(
+                        "kg",
+                        ("kg", query),
+                        lambda: kg_repository.get_entity_context_for_query(query=query, limit=5),
+                        [],
                     )
-                    if kg_entities:
-                        logger.debug(f"Retrieved {len(kg_entities)} KG entities for query")
-                except Exception as e:
-                    logger.warning(f"Failed to get KG entities: {e}")
+                )
+            else:
+                fetches.append(_constant([]))
+
+            memory, collective_facts, timeline_summary, kg_entities = await asyncio.gather(*fetches)
+            collective_facts = collective_facts or []
+            timeline_summary = timeline_summary or ""
+            kg_entities = kg_entities or []
+
+            profile_facts = memory.profile_facts if memory else []
+            summary = memory.summary if memory else ""
+            counters = memory.counters if memory else {}
 
             # Build context
             has_data = (
-                bool(memory.profile_facts)
-                or bool(memory.summary)
-                or any(v > 0 for v in memory.counters.values())
+                bool(profile_facts)
+                or bool(summary)
+                or any(v > 0 for v in counters.values())
                 or bool(collective_facts)
                 or bool(timeline_summary)
                 or bool(kg_entities)
@@ -242,15 +414,15 @@ class MemoryOrchestrator:
 
             context = MemoryContext(
                 user_id=user_email,
-                profile_facts=memory.profile_facts,
+                profile_facts=profile_facts,
                 collective_facts=collective_facts,
                 timeline_summary=timeline_summary,
                 kg_entities=kg_entities,
-                summary=memory.summary,
-                counters=memory.counters,
+                summary=summary,
+                counters=counters,
                 has_data=has_data,
                 last_activity=memory.updated_at
-                if isinstance(memory.updated_at, datetime)
+                if memory and isinstance(memory.updated_at, datetime)
                 else None,
             )
 
@@ -375,6 +547,7 @@ class MemoryOrchestrator:
                     logger.warning(f"Failed to increment counter: {e}")
 
             # Extract and save episodic events (timeline)
+            facts_saved_or_event = facts_saved > 0
             if self._episodic_memory:
                 try:
                     event_result = await self._episodic_memory.extract_and_save_event(
@@ -383,12 +556,17 @@ class MemoryOrchestrator:
                         ai_response=ai_response,
                     )
                     if event_result and event_result.get("status") == "created":
+                        facts_saved_or_event = True
                         logger.info(
                             f"📅 Saved episodic event: {event_result.get('title', '')[:50]}"
                         )
                 except Exception as e:
                     logger.warning(f"Failed to extract episodic event: {e}")
 
+            # Saved facts already invalidated through the memory service hook
+            if facts_saved_or_event and not facts_saved:
+                self.invalidate_user_context(user_email)
+
             processing_time = (time.time() - start_time) * 1000
 
             if facts_saved > 0:
@@ -7,16 +7,21 @@ Replaces Firestore with PostgreSQL for Fly.io deployment.
 
 import json
 import logging
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
 import asyncpg
+from core.cache import LRUCache
+from core.text_search import like_pattern, tsquery_sql
 
 from app.core.constants import MemoryConstants
 
 logger = logging.getLogger(__name__)
 
+MEMORY_SEARCH_TSQUERY = tsquery_sql("$1")
+
 
 @dataclass
 class UserMemory:
@@ -52,6 +57,7 @@ class MemoryServicePostgres:
     - Conversation summary (max 500 chars)
     - Activity counters
     - PostgreSQL persistence with in-memory fallback
+    - Bounded LRU memory cache with invalidation hooks for dependent caches
     """
 
     MAX_FACTS = MemoryConstants.MAX_FACTS
@@ -68,11 +74,34 @@ class MemoryServicePostgres:
 
         self.database_url = database_url or settings.database_url
         self.pool: asyncpg.Pool | None = None
-        self.memory_cache: dict[str, UserMemory] = {}  # In-memory fallback
         self.use_postgres = bool(self.database_url)
+        # In-memory cache (and the only store without PostgreSQL, hence no TTL there)
+        self.memory_cache = LRUCache(
+            max_size=MemoryConstants.CACHE_MAX_USERS,
+            max_bytes=MemoryConstants.CACHE_MAX_BYTES,
+            default_ttl=MemoryConstants.CACHE_TTL if self.use_postgres else None,
+            name="user_memory",
+        )
+        self._invalidation_hooks: list[Callable[[str], None]] = []
 
         logger.info("✅ MemoryServicePostgres initialized")
 
+    def add_invalidation_hook(self, hook: Callable[[str], None]) -> None:
+        """
+        Register a callback run with the user_id whenever that user's memory changes.
+
+        Lets caches derived from user memory (system prompts, context sources)
+        drop their entries instead of serving stale facts until TTL expiry.
+        """
+        self._invalidation_hooks.append(hook)
+
+    def _notify_invalidation(self, user_id: str) -> None:
+        for hook in self._invalidation_hooks:
+            try:
+                hook(user_id)
+            except Exception as e:
+                logger.warning(f"⚠️ Memory invalidation hook failed for {user_id}: {e}")
+
     async def connect(self):
         """Initialize PostgreSQL connection pool"""
         if not self.use_postgres:
@@ -112,9 +141,10 @@ class MemoryServicePostgres:
             UserMemory with facts, summary, counters
         """
         # 1. Check cache (skip if force_refresh)
-        if not force_refresh and user_id in self.memory_cache:
+        cached = None if force_refresh else self.memory_cache.get(user_id)
+        if cached is not None:
             logger.debug(f"💾 Memory cache hit for {user_id}")
-            return self.memory_cache[user_id]
+            return cached
 
         # 2. Check PostgreSQL
         if self.use_postgres and self.pool:
@@ -291,6 +321,7 @@ class MemoryServicePostgres:
 
         # Update cache
         self.memory_cache[user_id] = memory
+        self._notify_invalidation(user_id)
 
         logger.info(f"✅ Added fact for {user_id}: {fact}")
         return True
@@ -318,6 +349,7 @@ class MemoryServicePostgres:
         # Save
         success = await self.save_memory(memory)
         if success:
+            self._notify_invalidation(user_id)
             logger.info(f"✅ Updated summary for {user_id}")
         return success
 
@@ -441,7 +473,8 @@ class MemoryServicePostgres:
         Search across all user memories for specific information.
 
         This method searches through memory facts in PostgreSQL using
-        case-insensitive pattern matching. Falls back to in-memory cache
+        full-text search (English/Indonesian stemming, ranked by ts_rank) and
+        case-insensitive substring matching. Falls back to in-memory cache
         if PostgreSQL is unavailable.
 
         Args:
@@ -465,19 +498,21 @@ class MemoryServicePostgres:
         if self.use_postgres and self.pool:
             try:
                 async with self.pool.acquire(timeout=10) as conn:
-                    # Search memory_facts table with ILIKE for case-insensitive matching
-                    # Pattern is parameterized ($1), not interpolated - safe from SQL injection
-                    pattern = "%" + query + "%"
+                    # Full-text (English/Indonesian stems) or case-insensitive substring
+                    # match, both index-backed (migration 029); best ts_rank first.
+                    # Values are parameterized ($1-$3), not interpolated - safe from SQL injection
                     # nosemgrep: asyncpg-sqli
                     rows = await conn.fetch(
-                        """
+                        f"""
                         SELECT user_id, content, confidence, created_at
                         FROM memory_facts
-                        WHERE content ILIKE $1
-                        ORDER BY confidence DESC, created_at DESC
-                        LIMIT $2
+                        WHERE search_vector @@ {MEMORY_SEARCH_TSQUERY} OR content ILIKE $2
+                        ORDER BY ts_rank(search_vector, {MEMORY_SEARCH_TSQUERY}) DESC,
+                                 confidence DESC, created_at DESC
+                        LIMIT $3
                         """,
-                        pattern,
+                        query,
+                        like_pattern(query),
                         limit,
                     )  # nosemgrep
 
@@ -580,13 +615,14 @@ class MemoryServicePostgres:
                     # Get latest conversation
                     row = await conn.fetchrow(
                         """
-                        SELECT messages
+                        SELECT conversation_messages_json(id, $2) AS messages
                         FROM conversations
                         WHERE user_id = $1
                         ORDER BY created_at DESC
                         LIMIT 1
                     """,
                         user_id,
+                        limit,
                     )
 
                     if row and row["messages"]:
@@ -3,14 +3,9 @@ Document Retrieval Service
 Responsibility: PDF download and document handling from Google Drive
 """
 
-import io
 import logging
-import os
-from typing import Optional
 
-from googleapiclient.http import MediaIoBaseDownload
-
-from services.oracle_google_services import google_services
+from core.document_cache import CachedDocument, DocumentCache, get_document_cache
 
 logger = logging.getLogger(__name__)
 
@@ -19,66 +14,45 @@ class DocumentRetrievalService:
     """
     Service for document retrieval from Google Drive.
 
-    Responsibility: Download PDFs from Google Drive using fuzzy search.
+    Responsibility: Fetch PDFs (and their extracted text) from Google Drive using
+    fuzzy search, through the local DocumentCache.
     """
 
-    def download_pdf_from_drive(self, filename: str) -> Optional[str]:
+    def __init__(self, document_cache: DocumentCache | None = None):
         """
-        Download PDF from Google Drive using fuzzy search.
+        Initialize document retrieval service.
 
         Args:
-            filename: PDF filename to search for
-
-        Returns:
-            Temporary file path if found, None otherwise
+            document_cache: Optional DocumentCache instance (default: process-wide cache)
         """
-        if not google_services.drive_service:
-            logger.warning("⚠️ Google Drive service not available")
-            return None
-
-        try:
-            clean_name = os.path.splitext(os.path.basename(filename))[0]
-            logger.info(f"🔍 Searching for document: {clean_name}")
+        self._document_cache = document_cache
 
-            search_queries = [
-                f"name contains '{clean_name}' and mimeType = 'application/pdf' and trashed = false",
-                f"name contains '{clean_name.replace('_', ' ')}' and mimeType = 'application/pdf' and trashed = false",
-                f"name contains '{clean_name.replace('-', ' ')}' and mimeType = 'application/pdf' and trashed = false",
-                f"name contains '{clean_name.replace('_', '')}' and mimeType = 'application/pdf' and trashed = false",
-            ]
+    @property
+    def document_cache(self) -> DocumentCache:
+        if self._document_cache is None:
+            self._document_cache = get_document_cache()
+        return self._document_cache
 
-            for query in search_queries:
-                results = (
-                    google_services.drive_service.files()
-                    .list(q=query, fields="files(id, name, size, createdTime)", pageSize=1)
-                    .execute()
-                )
-
-                files = results.get("files", [])
-                if files:
-                    found_file = files[0]
-                    logger.info(f"✅ Found match: '{found_file['name']}' (ID: {found_file['id']})")
-
-                    request = google_services.drive_service.files().get_media(
-                        fileId=found_file["id"]
-                    )
-                    file_stream = io.BytesIO()
-                    downloader = MediaIoBaseDownload(file_stream, request)
-
-                    done = False
-                    while done is False:
-                        status, done = downloader.next_chunk()
+    async def get_document(self, filename: str) -> CachedDocument | None:
+        """
+        Get a PDF and its extracted text, from the local cache or Google Drive.
 
-                    file_stream.seek(0)
-                    temp_path = f"/tmp/{found_file['name']}"
+        Args:
+            filename: PDF filename to search for
 
-                    with open(temp_path, "wb") as temp_file:
-                        temp_file.write(file_stream.read())
+        Returns:
+            CachedDocument if found within the request timeout, None otherwise
+        """
+        return await self.document_cache.get(filename)
 
-                    return temp_path
+    def download_pdf_from_drive(self, filename: str) -> str | None:
+        """
+        Download PDF from Google Drive using fuzzy search (blocking).
 
-            return None
+        Args:
+            filename: PDF filename to search for
 
-        except Exception as e:
-            logger.error(f"❌ Error downloading from Drive: {e}")
-            return None
+        Returns:
+            Path of the cached PDF if found (do not delete it), None otherwise
+        """
+        return self.document_cache.get_pdf_path(filename)
@@ -52,6 +52,8 @@ from services.smart_oracle import smart_oracle
 
 logger = logging.getLogger(__name__)
 
+FULL_DOCUMENT_MAX_CHARS = 400_000  # ~100k tokens of extracted text inlined into the prompt
+
 # ---------------------------------------------------------------------------
 # MODELS (Moved/Shared)
 # ---------------------------------------------------------------------------
@@ -488,7 +490,19 @@ class OracleService:
                     ].get("source")
 
                 if best_filename:
-                    smart_response = await smart_oracle(request_query, best_filename)
+                    # Full-document reasoning over the cached extracted text; PDFs without a
+                    # text layer (or too large to inline) go through the Gemini file upload.
+                    # Documents not on Drive (or not ready in time) fall back to excerpts.
+                    full_document = await self.document_retrieval.get_document(best_filename)
+                    smart_response = None
+                    if (
+                        full_document
+                        and full_document.text
+                        and len(full_document.text) <= FULL_DOCUMENT_MAX_CHARS
+                    ):
+                        smart_response = full_document.text
+                    elif full_document:
+                        smart_response = await smart_oracle(request_query, best_filename)
                     if smart_response and not smart_response.startswith("Error"):
                         reasoning_result = await self.reasoning_engine.reason_with_gemini(
                             documents=[smart_response],
@@ -11,6 +11,8 @@ from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 from typing import Any
 
+from core.cache import LRUCache
+
 logger = logging.getLogger(__name__)
 
 # Global thread pool for CPU-bound operations
@@ -112,48 +114,57 @@ def timed(component: str = "request"):
 
 
 class AsyncLRUCache:
-    """Async-safe LRU cache with TTL"""
-
-    def __init__(self, maxsize: int = 128, ttl: int = 300):
-        self.maxsize = maxsize
-        self.ttl = ttl
-        self.cache = {}
-        self.timestamps = {}
+    """Async-safe LRU cache with TTL (async facade over core.cache.LRUCache)"""
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        ttl: int = 300,
+        max_bytes: int | None = None,
+        name: str | None = None,
+    ):
+        self._lru = LRUCache(max_size=maxsize, default_ttl=ttl, max_bytes=max_bytes, name=name)
         self.lock = asyncio.Lock()
 
+    @property
+    def maxsize(self) -> int:
+        return self._lru.max_size
+
+    @maxsize.setter
+    def maxsize(self, value: int) -> None:
+        self._lru.max_size = value
+
+    @property
+    def ttl(self) -> float:
+        return self._lru.default_ttl
+
+    @ttl.setter
+    def ttl(self, value: float) -> None:
+        self._lru.default_ttl = value
+
     async def get(self, key: str) -> Any | None:
         async with self.lock:
-            if key in self.cache:
-                # Check TTL
-                if time.time() - self.timestamps[key] < self.ttl:
-                    return self.cache[key]
-                else:
-                    # Expired
-                    del self.cache[key]
-                    del self.timestamps[key]
-            return None
+            return self._lru.get(key)
 
     async def set(self, key: str, value: Any):
         async with self.lock:
-            # Implement LRU eviction if needed
-            if len(self.cache) >= self.maxsize and key not in self.cache:
-                # Remove oldest entry
-                oldest_key = min(self.timestamps.keys(), key=lambda k: self.timestamps[k])
-                del self.cache[oldest_key]
-                del self.timestamps[oldest_key]
-
-            self.cache[key] = value
-            self.timestamps[key] = time.time()
+            self._lru.set(key, value)
 
     async def clear(self):
         async with self.lock:
-            self.cache.clear()
-            self.timestamps.clear()
+            self._lru.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        return self._lru.get_stats()
 
 
 # Global caches
-embedding_cache = AsyncLRUCache(maxsize=500, ttl=3600)  # 1 hour TTL
-search_cache = AsyncLRUCache(maxsize=200, ttl=300)  # 5 minute TTL
+embedding_cache = AsyncLRUCache(
+    maxsize=500, ttl=3600, max_bytes=16 * 1024 * 1024, name="optimizer_embedding"
+)  # 1 hour TTL
+search_cache = AsyncLRUCache(
+    maxsize=200, ttl=300, max_bytes=16 * 1024 * 1024, name="optimizer_search"
+)  # 5 minute TTL
 
 
 class ConnectionPool:
@@ -8,6 +8,7 @@ Structure:
 - tools.py: Tool class definitions (VectorSearch, WebSearch, Database, Calculator, Vision, Pricing)
 - orchestrator.py: Main orchestrator with query processing and streaming (910 lines)
 - llm_gateway.py: Unified LLM interface with model fallback cascade (493 lines)
+- context_cache.py: Gemini cached content handles for the stable system prompt prefix
 - reasoning.py: ReAct reasoning loop (Thought→Action→Observation) (294 lines)
 - prompt_builder.py: System prompt construction with caching
 - response_processor.py: Response cleaning and formatting
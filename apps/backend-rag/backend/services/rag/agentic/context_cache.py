@@ -0,0 +1,216 @@
+"""
+Gemini Context Cache - Provider-side caching of stable system prompt prefixes.
+
+The ZANTARA system prompt is mostly static (persona, communication rules,
+tool declarations) followed by a small per-request part (RAG results, user
+memory, query). Resending the static part on every ReAct step costs input
+tokens and prefill latency, so this module registers each distinct stable
+prefix once as Gemini cached content and hands out its resource name.
+
+Handles are tracked per (model, with_tools, prefix hash), renewed before
+their TTL runs out while in use, bounded by an LRU (evicted handles are
+deleted on the provider), and creation failures are backed off so a prefix
+the provider refuses (e.g. below the minimum cacheable size) is sent inline
+without retrying on every call.
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from llm.genai_client import types
+
+logger = logging.getLogger(__name__)
+
+try:
+    from app.metrics import llm_context_cache_operations
+
+    METRICS_AVAILABLE = True
+except ImportError:
+    METRICS_AVAILABLE = False
+
+# Renew a handle once less than this fraction of its TTL is left
+RENEW_FRACTION = 0.2
+# Never hand out a handle this close to expiry (request may land after it)
+EXPIRY_SAFETY_SECONDS = 30.0
+
+
+def _record(operation: str) -> None:
+    if METRICS_AVAILABLE:
+        llm_context_cache_operations.labels(operation=operation).inc()
+
+
+@dataclass
+class CachedPrefix:
+    """A cached content handle registered on the provider."""
+
+    name: str
+    expires_at: float
+
+
+class GeminiContextCache:
+    """
+    Registry of Gemini cached contents for stable system prompt prefixes.
+
+    Uses the google-genai async caches API (client.aio.caches.create/update/
+    delete). Safe for concurrent use from one event loop: concurrent misses on
+    the same prefix share a single create call.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        ttl_seconds: int = 3600,
+        min_chars: int = 8000,
+        max_entries: int = 32,
+        failure_backoff: float = 300.0,
+    ):
+        """
+        Initialize the context cache.
+
+        Args:
+            client: google-genai Client (uses client.aio.caches)
+            ttl_seconds: TTL requested for cached contents (renewed while in use)
+            min_chars: Prefixes shorter than this are not worth caching
+            max_entries: Max handles kept; least recently used ones are deleted
+            failure_backoff: Seconds to send a prefix inline after a failed create
+        """
+        self._client = client
+        self.ttl_seconds = ttl_seconds
+        self.min_chars = min_chars
+        self.max_entries = max_entries
+        self.failure_backoff = failure_backoff
+        self._entries: OrderedDict[tuple, CachedPrefix] = OrderedDict()
+        self._failed_until: dict[tuple, float] = {}
+        self._locks: dict[tuple, asyncio.Lock] = {}
+        self._stats = {"hits": 0, "creates": 0, "renewals": 0, "failures": 0, "evictions": 0}
+
+    @staticmethod
+    def key_for(model: str, prefix: str, with_tools: bool) -> tuple:
+        """Cache key of a prefix for a model (tool declarations are part of the content)."""
+        return (model, with_tools, hashlib.sha256(prefix.encode("utf-8")).hexdigest())
+
+    async def get(self, model: str, prefix: str, tools: list | None = None) -> str | None:
+        """
+        Get the cached content name for a prefix, creating or renewing it.
+
+        Args:
+            model: Model the cached content is created for (caches are per model)
+            prefix: Stable system instruction text
+            tools: types.Tool list to cache with the prefix (None for no tools)
+
+        Returns:
+            Cached content resource name, or None to send the prompt inline
+        """
+        if types is None or len(prefix) < self.min_chars:
+            return None
+
+        key = self.key_for(model, prefix, bool(tools))
+        now = time.time()
+        if self._failed_until.get(key, 0.0) > now:
+            return None
+
+        entry = self._entries.get(key)
+        if entry and entry.expires_at - now > self.ttl_seconds * RENEW_FRACTION:
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            _record("hit")
+            return entry.name
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another request may have created or renewed it while we waited
+            entry = self._entries.get(key)
+            now = time.time()
+            if entry and entry.expires_at - now > self.ttl_seconds * RENEW_FRACTION:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                _record("hit")
+                return entry.name
+
+            if (
+                entry
+                and entry.expires_at - now > EXPIRY_SAFETY_SECONDS
+                and await self._renew(entry)
+            ):
+                self._entries.move_to_end(key)
+                return entry.name
+            return await self._create(key, model, prefix, tools)
+
+    async def _renew(self, entry: CachedPrefix) -> bool:
+        try:
+            await self._client.aio.caches.update(
+                name=entry.name,
+                config=types.UpdateCachedContentConfig(ttl=f"{self.ttl_seconds}s"),
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ ContextCache: renewal of {entry.name} failed, recreating: {e}")
+            return False
+        entry.expires_at = time.time() + self.ttl_seconds
+        self._stats["renewals"] += 1
+        _record("renew")
+        return True
+
+    async def _create(self, key: tuple, model: str, prefix: str, tools: list | None) -> str | None:
+        self._entries.pop(key, None)
+        config_kwargs = {
+            "system_instruction": prefix,
+            "ttl": f"{self.ttl_seconds}s",
+            "display_name": f"zantara-prefix-{key[2][:16]}",
+        }
+        if tools:
+            config_kwargs["tools"] = tools
+        try:
+            cached = await self._client.aio.caches.create(
+                model=model, config=types.CreateCachedContentConfig(**config_kwargs)
+            )
+        except Exception as e:
+            # Below the provider minimum, unsupported model, quota: send inline for a while
+            self._failed_until[key] = time.time() + self.failure_backoff
+            # Requests skip the lock during the backoff; a later retry makes a new one
+            self._locks.pop(key, None)
+            self._stats["failures"] += 1
+            _record("error")
+            logger.warning(f"⚠️ ContextCache: cannot cache prompt prefix for {model}: {e}")
+            return None
+
+        self._failed_until.pop(key, None)
+        self._entries[key] = CachedPrefix(
+            name=cached.name, expires_at=time.time() + self.ttl_seconds
+        )
+        self._stats["creates"] += 1
+        _record("create")
+        logger.info(
+            f"✅ ContextCache: cached {len(prefix)} char prefix for {model} as {cached.name}"
+        )
+
+        while len(self._entries) > self.max_entries:
+            evicted_key, evicted = self._entries.popitem(last=False)
+            self._locks.pop(evicted_key, None)
+            self._stats["evictions"] += 1
+            await self._delete(evicted.name)
+        return cached.name
+
+    async def _delete(self, name: str) -> None:
+        try:
+            await self._client.aio.caches.delete(name=name)
+        except Exception as e:
+            # Unreferenced cached content still expires with its TTL
+            logger.debug(f"ContextCache: delete of {name} failed: {e}")
+
+    def invalidate(self, model: str, prefix: str, with_tools: bool) -> None:
+        """Forget a handle the provider rejected (expired or deleted remotely)."""
+        self._entries.pop(self.key_for(model, prefix, with_tools), None)
+
+    def clear(self) -> None:
+        """Forget all handles (e.g. when the tool set changes); they expire remotely."""
+        self._entries.clear()
+        self._failed_until.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get handle counts and hit/create/renewal statistics."""
+        return {"entries": len(self._entries), **self._stats}
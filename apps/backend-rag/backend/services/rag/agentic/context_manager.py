@@ -101,7 +101,7 @@ async def get_user_context(
                             (
                                 SELECT json_build_object(
                                     'id', c.id,
-                                    'messages', c.messages
+                                    'messages', conversation_messages_json(c.id, 6)
                                 )
                                 FROM conversations c
                                 WHERE (c.user_id = CAST(up.id AS TEXT) OR c.user_id = up.email)
@@ -128,7 +128,7 @@ async def get_user_context(
                             (
                                 SELECT json_build_object(
                                     'id', c.id,
-                                    'messages', c.messages
+                                    'messages', conversation_messages_json(c.id, 6)
                                 )
                                 FROM conversations c
                                 WHERE c.user_id = CAST(up.id AS TEXT) OR c.user_id = up.email
@@ -211,9 +211,13 @@ async def get_user_context(
 
             # DIAGNOSTIC: Log first 3 facts for debugging
             if memory_context.profile_facts:
-                logger.warning(f"📋 [ContextManager] Sample facts: {memory_context.profile_facts[:3]}")
+                logger.warning(
+                    f"📋 [ContextManager] Sample facts: {memory_context.profile_facts[:3]}"
+                )
             else:
-                logger.warning(f"⚠️  [ContextManager] NO profile facts found for {original_user_id} - user recognition will fail!")
+                logger.warning(
+                    f"⚠️  [ContextManager] NO profile facts found for {original_user_id} - user recognition will fail!"
+                )
 
         except (asyncpg.PostgresError, ValueError, RuntimeError, KeyError) as e:
             logger.error(
@@ -224,6 +228,8 @@ async def get_user_context(
             context["facts"] = []
             context["collective_facts"] = []
     else:
-        logger.warning(f"⚠️  [ContextManager] NO memory_orchestrator provided - memory facts will be empty!")
+        logger.warning(
+            f"⚠️  [ContextManager] NO memory_orchestrator provided - memory facts will be empty!"
+        )
 
     return context
@@ -42,11 +42,30 @@ class GraphTraversalTool(BaseTool):
                     "description": "The name of the entity to explore (e.g. 'PT PMA', 'Investor Visa')",
                 },
                 "depth": {"type": "integer", "description": "Traversal depth (default: 1, max: 3)"},
+                "direction": {
+                    "type": "string",
+                    "enum": ["out", "in", "both"],
+                    "description": (
+                        "'out' for what the entity requires/leads to (default), "
+                        "'in' for what points to it, 'both' for either"
+                    ),
+                },
+                "min_strength": {
+                    "type": "number",
+                    "description": "Ignore relationships weaker than this (0-1, default: 0)",
+                },
             },
             "required": ["entity_name"],
         }
 
-    async def execute(self, entity_name: str, depth: int = 1, **kwargs) -> str:
+    async def execute(
+        self,
+        entity_name: str,
+        depth: int = 1,
+        direction: str = "out",
+        min_strength: float = 0.0,
+        **kwargs,
+    ) -> str:
         try:
             # 1. Find the node ID
             candidates = await self.graph.find_entity_by_name(entity_name, limit=1)
@@ -56,7 +75,12 @@ class GraphTraversalTool(BaseTool):
             start_node = candidates[0]
 
             # 2. Traverse
-            subgraph = await self.graph.traverse(start_node.id, max_depth=min(depth, 3))
+            subgraph = await self.graph.traverse(
+                start_node.id,
+                max_depth=max(1, min(depth, 3)),
+                direction=direction if direction in ("out", "in", "both") else "out",
+                min_strength=min_strength,
+            )
 
             # 3. Format output for LLM
             nodes = subgraph["nodes"]
@@ -69,7 +93,14 @@ class GraphTraversalTool(BaseTool):
 
             for edge in edges:
                 target_name = node_map.get(edge["target"], edge["target"])
-                summary += f"- [{edge['type']}] -> {target_name}\n"
+                if edge["source"] == start_node.id:
+                    summary += f"- [{edge['type']}] -> {target_name}\n"
+                else:
+                    source_name = node_map.get(edge["source"], edge["source"])
+                    summary += f"- {source_name} [{edge['type']}] -> {target_name}\n"
+
+            if subgraph.get("truncated"):
+                summary += "(Subgraph truncated: narrow the depth or raise min_strength)\n"
 
             return summary
 
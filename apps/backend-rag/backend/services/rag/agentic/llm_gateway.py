@@ -8,7 +8,9 @@ Key Features:
 - Multi-tier Gemini model support (Pro, Flash, Flash-Lite)
 - Automatic fallback cascade on quota/service errors
 - OpenRouter integration as final fallback
-- Native function calling support
+- Native function calling support (declarations compiled once per tool set)
+- Provider context caching of the stable system prompt prefix (context_cache.py)
+- Token streaming (send_message_stream) with the same fallback cascade
 - Error handling and retry logic
 - Health check capabilities
 
@@ -35,25 +37,69 @@ UPDATED 2025-12-23:
 - Using GenAIClient wrapper for centralized client management
 """
 
+import inspect
 import json
 import logging
+from collections import OrderedDict
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
 from google.api_core.exceptions import ResourceExhausted, ServiceUnavailable
+from llm.genai_client import GENAI_AVAILABLE, GenAIClient, get_genai_client, types
 
 from app.core.config import settings
-from llm.genai_client import GenAIClient, GENAI_AVAILABLE, types, get_genai_client
 from services.openrouter_client import ModelTier, OpenRouterClient
 
+from .context_cache import GeminiContextCache
+from .prompt_builder import split_system_prompt
+
 logger = logging.getLogger(__name__)
 
+try:
+    from app.metrics import llm_cached_prompt_tokens, llm_prompt_tokens
+
+    METRICS_AVAILABLE = True
+except ImportError:
+    METRICS_AVAILABLE = False
+
 # Model Tier Constants
 TIER_FLASH = 0  # Fast, cost-effective (default) - gemini-2.5-flash
 TIER_LITE = 1  # Fallback tier - gemini-2.0-flash
 TIER_PRO = 2  # Most capable, highest quality - gemini-2.5-pro
 TIER_FALLBACK = 3  # Final Gemini fallback - gemini-2.0-flash
 
+# Prebuilt GenerateContentConfig templates kept per gateway (LRU)
+CONFIG_CACHE_MAX_ENTRIES = 64
+
+# Generation parameters shared by inline and cached-content requests
+GENERATION_KWARGS = {
+    "max_output_tokens": 8192,
+    "temperature": 0.4,
+}
+
+
+def _record_usage(model_name: str, usage: Any) -> None:
+    """Report prompt tokens and those served from the provider context cache."""
+    if not METRICS_AVAILABLE or usage is None:
+        return
+    prompt_tokens = getattr(usage, "prompt_token_count", None)
+    cached_tokens = getattr(usage, "cached_content_token_count", None)
+    if isinstance(prompt_tokens, int) and prompt_tokens > 0:
+        llm_prompt_tokens.labels(model=model_name).inc(prompt_tokens)
+    if isinstance(cached_tokens, int) and cached_tokens > 0:
+        llm_cached_prompt_tokens.labels(model=model_name).inc(cached_tokens)
+
+
+def _chunk_parts(chunk: Any) -> list:
+    """Content parts of a streamed response chunk (text and function calls)."""
+    parts = []
+    for candidate in getattr(chunk, "candidates", None) or []:
+        content = getattr(candidate, "content", None)
+        if content is not None and getattr(content, "parts", None):
+            parts.extend(content.parts)
+    return parts
+
 
 class LLMGateway:
     """
@@ -83,7 +129,7 @@ class LLMGateway:
         - OpenRouter client is lazy-loaded to avoid unnecessary initialization
     """
 
-    def __init__(self, gemini_tools: list = None):
+    def __init__(self, gemini_tools: list = None, context_cache: GeminiContextCache | None = None):
         """Initialize LLM Gateway with Gemini models and OpenRouter fallback.
 
         Sets up all Gemini model instances and prepares for automatic fallback
@@ -93,12 +139,18 @@ class LLMGateway:
         Args:
             gemini_tools: Optional list of Gemini function declarations for tool use.
                 These enable native function calling in Gemini models.
+            context_cache: Optional provider context cache for the stable system
+                prompt prefix. Built from settings when omitted and enabled.
 
         Note:
             - Requires GOOGLE_API_KEY in settings
             - OpenRouter client is initialized lazily on first use
             - GenAI client handles connection pooling
         """
+        # Prebuilt request configs (see _build_config); reset when gemini_tools is reassigned
+        self._config_cache: OrderedDict[tuple[bool, str], Any] = OrderedDict()
+        self._tool: Any = None
+        self._context_cache = context_cache
         self.gemini_tools = gemini_tools or []
 
         # Initialize GenAI client (new SDK)
@@ -113,10 +165,12 @@ class LLMGateway:
                 self._genai_client = get_genai_client()
                 self._available = self._genai_client.is_available
                 if self._available:
-                    auth_method = getattr(self._genai_client, '_auth_method', 'unknown')
+                    auth_method = getattr(self._genai_client, "_auth_method", "unknown")
                     logger.info(f"✅ LLMGateway: GenAI client initialized (auth: {auth_method})")
                 else:
-                    logger.warning("⚠️ LLMGateway: GenAI client not available - will use OpenRouter fallback")
+                    logger.warning(
+                        "⚠️ LLMGateway: GenAI client not available - will use OpenRouter fallback"
+                    )
             except Exception as e:
                 logger.warning(f"Failed to initialize GenAI client: {e}")
 
@@ -125,11 +179,42 @@ class LLMGateway:
         self.model_name_flash = "gemini-2.5-flash"  # Standard: fast, cost-effective
         self.model_name_fallback = "gemini-2.0-flash"  # Fallback: stable, reliable
 
-        logger.info("✅ LLMGateway: Model configuration ready (2.5-pro, 2.5-flash, 2.0-flash fallback)")
+        logger.info(
+            "✅ LLMGateway: Model configuration ready (2.5-pro, 2.5-flash, 2.0-flash fallback)"
+        )
 
         # Lazy-loaded OpenRouter client (fallback)
         self._openrouter_client: OpenRouterClient | None = None
 
+        # Stable system prompt prefix registered once as Gemini cached content
+        if (
+            self._context_cache is None
+            and self._available
+            and getattr(settings, "gemini_context_cache_enabled", False) is True
+        ):
+            self._context_cache = GeminiContextCache(
+                self._genai_client._client,
+                ttl_seconds=settings.gemini_context_cache_ttl,
+                min_chars=settings.gemini_context_cache_min_chars,
+            )
+
+    @property
+    def gemini_tools(self) -> list:
+        """Function declarations for native tool calling.
+
+        Assign a new list to change the tool set: compiled declarations and
+        request configs are dropped on assignment, not on in-place mutation.
+        """
+        return self._gemini_tools
+
+    @gemini_tools.setter
+    def gemini_tools(self, tools: list) -> None:
+        self._gemini_tools = tools or []
+        self._tool = None
+        self._config_cache.clear()
+        if self._context_cache is not None:
+            self._context_cache.clear()
+
     def _get_openrouter_client(self) -> OpenRouterClient | None:
         """Lazy load OpenRouter client for third-party fallback.
 
@@ -206,6 +291,233 @@ class LLMGateway:
             conversation_messages=conversation_messages or [],
         )
 
+    async def send_message_stream(
+        self,
+        chat: Any,  # noqa: ARG002 - same signature as send_message
+        message: str,
+        system_prompt: str = "",
+        tier: int = TIER_FLASH,
+        enable_function_calling: bool = True,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream a message to the LLM with the same tier fallback as send_message.
+
+        Uses client.aio.models.generate_content_stream and yields events as
+        chunks arrive:
+            {"type": "model", "data": model_name} once, on the first chunk
+            {"type": "token", "data": text} for each text part
+            {"type": "function_call", "data": part} for each native function call part
+            {"type": "done", "data": {"text": full_text, "model": model_name}}
+
+        Fallback Chain:
+            Same as send_message (Pro → Flash on quota, otherwise → 2.0 Flash).
+            A tier can only be abandoned before its first chunk: once events
+            have been yielded to the caller, a mid-stream failure raises.
+
+        Args:
+            chat: Active chat session (unused in new SDK, kept for API compatibility)
+            message: User message or continuation prompt
+            system_prompt: System instructions
+            tier: Requested model tier (TIER_PRO=2, TIER_FLASH=0, TIER_LITE=1)
+            enable_function_calling: Enable native function calling for Gemini models
+
+        Raises:
+            RuntimeError: If all models fail or the stream breaks after output started
+        """
+        model_tier = tier
+        while self._available:
+            if model_tier == TIER_PRO:
+                model_name = self.model_name_pro
+            elif model_tier <= TIER_FLASH:
+                model_name = self.model_name_flash
+            else:
+                model_name = self.model_name_fallback
+
+            started = False
+            full_text = ""
+            try:
+                async for chunk in self._stream_model(
+                    model_name, message, system_prompt, enable_function_calling
+                ):
+                    if not started:
+                        started = True
+                        yield {"type": "model", "data": model_name}
+                    for part in _chunk_parts(chunk):
+                        if getattr(part, "function_call", None):
+                            yield {"type": "function_call", "data": part}
+                        elif getattr(part, "text", None):
+                            full_text += part.text
+                            yield {"type": "token", "data": part.text}
+                logger.debug(f"✅ LLMGateway: {model_name} stream completed")
+                yield {"type": "done", "data": {"text": full_text, "model": model_name}}
+                return
+
+            except (
+                ResourceExhausted,
+                ServiceUnavailable,
+                ValueError,
+                RuntimeError,
+                AttributeError,
+            ) as e:
+                if started:
+                    logger.error(
+                        f"❌ LLMGateway: {model_name} stream interrupted: {e}", exc_info=True
+                    )
+                    raise RuntimeError(f"Gemini stream interrupted: {e}") from e
+                quota = isinstance(e, (ResourceExhausted, ServiceUnavailable))
+                if model_tier == TIER_PRO and quota:
+                    logger.warning(
+                        f"⚠️ LLMGateway: {model_name} quota exceeded, falling back to Flash: {e}"
+                    )
+                    model_tier = TIER_FLASH
+                elif model_tier in (TIER_PRO, TIER_FLASH):
+                    logger.warning(
+                        f"⚠️ LLMGateway: {model_name} stream failed, trying 2.0 fallback: {e}"
+                    )
+                    model_tier = TIER_FALLBACK
+                elif quota:
+                    logger.error(f"❌ LLMGateway: All Gemini models quota exceeded: {e}")
+                    raise RuntimeError(f"All Gemini models unavailable: {e}") from e
+                else:
+                    logger.error(f"❌ LLMGateway: Gemini 2.0 Flash error: {e}", exc_info=True)
+                    raise RuntimeError(f"Gemini fallback failed: {e}") from e
+
+        raise RuntimeError("No Gemini models available - check Service Account configuration")
+
+    async def _stream_model(
+        self, model_name: str, message: str, system_prompt: str, with_tools: bool
+    ) -> AsyncIterator[Any]:
+        """Open a generate_content_stream call on one model and yield its chunks."""
+        if not self._genai_client or not self._genai_client.is_available:
+            raise RuntimeError("GenAI client not available")
+
+        async def _open(contents: Any, config: Any) -> AsyncIterator[Any]:
+            stream = self._genai_client._client.aio.models.generate_content_stream(
+                model=model_name, contents=contents, config=config
+            )
+            if inspect.isawaitable(stream):
+                stream = await stream
+            async for chunk in stream:
+                yield chunk
+
+        config, contents, cached_prefix = await self._prepare_request(
+            model_name, message, system_prompt, with_tools
+        )
+        usage = None
+        started = False
+        try:
+            async for chunk in _open(contents, config):
+                started = True
+                usage = getattr(chunk, "usage_metadata", None) or usage
+                yield chunk
+        except (ResourceExhausted, ServiceUnavailable):
+            raise
+        except Exception as e:
+            if not cached_prefix or started:
+                raise
+            self._drop_cached_prefix(model_name, cached_prefix, with_tools, e)
+            async for chunk in _open(message, self._build_config(system_prompt, with_tools)):
+                usage = getattr(chunk, "usage_metadata", None) or usage
+                yield chunk
+        _record_usage(model_name, usage)
+
+    async def _prepare_request(
+        self, model_name: str, message: str, system_prompt: str, with_tools: bool
+    ) -> tuple[Any, Any, str]:
+        """Resolve (config, contents, cached_prefix) for one model call.
+
+        When the context cache holds the stable prefix of system_prompt, the
+        request references it as cached_content (which also carries the tool
+        declarations) and sends only the per-request suffix, ahead of the
+        message, as the user turn. Otherwise the prompt goes inline and
+        cached_prefix is "".
+        """
+        if self._context_cache is not None and system_prompt and types is not None:
+            prefix, suffix = split_system_prompt(system_prompt)
+            use_tools = bool(with_tools and self.gemini_tools)
+            if prefix:
+                cache_name = await self._context_cache.get(
+                    model_name, prefix, [self._get_tool()] if use_tools else None
+                )
+                if cache_name:
+                    config = types.GenerateContentConfig(
+                        cached_content=cache_name, **GENERATION_KWARGS
+                    )
+                    contents = [
+                        types.Content(
+                            role="user", parts=[types.Part(text=suffix), types.Part(text=message)]
+                        )
+                    ]
+                    return config, contents, prefix
+        return self._build_config(system_prompt, with_tools), message, ""
+
+    def _drop_cached_prefix(
+        self, model_name: str, prefix: str, with_tools: bool, error: Exception
+    ) -> None:
+        """Forget a cached content the provider rejected; the caller retries inline."""
+        logger.warning(
+            f"⚠️ LLMGateway: cached prompt prefix rejected by {model_name}, sending inline: {error}"
+        )
+        self._context_cache.invalidate(model_name, prefix, bool(with_tools and self.gemini_tools))
+
+    def _get_tool(self) -> Any:
+        """Compile self.gemini_tools into a types.Tool once per tool set."""
+        if self._tool is None:
+            # Convert tool dicts to proper FunctionDeclaration format for new SDK
+            function_declarations = []
+            for tool_dict in self.gemini_tools:
+                # Create FunctionDeclaration with correct Schema format
+                params = tool_dict.get("parameters", {})
+                func_decl = types.FunctionDeclaration(
+                    name=tool_dict["name"],
+                    description=tool_dict["description"],
+                    parameters=types.Schema(
+                        type=params.get("type", "OBJECT"),
+                        properties={
+                            k: types.Schema(
+                                type=v.get("type", "STRING"), description=v.get("description", "")
+                            )
+                            for k, v in params.get("properties", {}).items()
+                        },
+                        required=params.get("required", []),
+                    ),
+                )
+                function_declarations.append(func_decl)
+
+            self._tool = types.Tool(function_declarations=function_declarations)
+        return self._tool
+
+    def _build_config(self, system_prompt: str, with_tools: bool = False) -> Any:
+        """Get the GenerateContentConfig for a system prompt, with optional function calling tools.
+
+        Configs are immutable templates shared by every call with the same
+        (tool set, system prompt, with_tools) key and kept in a bounded LRU,
+        so fallback tiers and later ReAct steps reuse them instead of
+        rebuilding every FunctionDeclaration and Schema.
+        """
+        if not GENAI_AVAILABLE or types is None:
+            return None
+
+        with_tools = bool(with_tools and self.gemini_tools)
+        key = (with_tools, system_prompt)
+        config = self._config_cache.get(key)
+        if config is not None:
+            self._config_cache.move_to_end(key)
+            return config
+
+        config_kwargs = dict(GENERATION_KWARGS)
+
+        if system_prompt:
+            config_kwargs["system_instruction"] = system_prompt
+
+        if with_tools:
+            config_kwargs["tools"] = [self._get_tool()]
+
+        config = types.GenerateContentConfig(**config_kwargs)
+        self._config_cache[key] = config
+        if len(self._config_cache) > CONFIG_CACHE_MAX_ENTRIES:
+            self._config_cache.popitem(last=False)
+        return config
+
     async def _send_with_fallback(
         self,
         chat: Any,
@@ -254,60 +566,34 @@ class LLMGateway:
             >>> print(f"Response from {model}: {response}")
         """
 
-        # Helper to build config with optional tools
-        def _build_config(with_tools: bool = False) -> Any:
-            """Build GenerateContentConfig with optional function calling tools."""
-            if not GENAI_AVAILABLE or types is None:
-                return None
-
-            config_kwargs = {
-                "max_output_tokens": 8192,
-                "temperature": 0.4,
-            }
-
-            if system_prompt:
-                config_kwargs["system_instruction"] = system_prompt
-
-            if with_tools and self.gemini_tools:
-                # Convert tool dicts to proper FunctionDeclaration format for new SDK
-                function_declarations = []
-                for tool_dict in self.gemini_tools:
-                    # Create FunctionDeclaration with correct Schema format
-                    params = tool_dict.get("parameters", {})
-                    func_decl = types.FunctionDeclaration(
-                        name=tool_dict["name"],
-                        description=tool_dict["description"],
-                        parameters=types.Schema(
-                            type=params.get("type", "OBJECT"),
-                            properties={
-                                k: types.Schema(
-                                    type=v.get("type", "STRING"),
-                                    description=v.get("description", "")
-                                )
-                                for k, v in params.get("properties", {}).items()
-                            },
-                            required=params.get("required", [])
-                        )
-                    )
-                    function_declarations.append(func_decl)
-
-                config_kwargs["tools"] = [types.Tool(function_declarations=function_declarations)]
-
-            return types.GenerateContentConfig(**config_kwargs)
-
         # Helper to call model
         async def _call_model(model_name: str, with_tools: bool = False) -> tuple[str, Any]:
             """Call a specific model and return (text, response)."""
             if not self._genai_client or not self._genai_client.is_available:
                 raise RuntimeError("GenAI client not available")
 
-            config = _build_config(with_tools)
-
-            response = await self._genai_client._client.aio.models.generate_content(
-                model=model_name,
-                contents=message,
-                config=config,
+            config, contents, cached_prefix = await self._prepare_request(
+                model_name, message, system_prompt, with_tools
             )
+            generate_content = self._genai_client._client.aio.models.generate_content
+            try:
+                response = await generate_content(
+                    model=model_name,
+                    contents=contents,
+                    config=config,
+                )
+            except (ResourceExhausted, ServiceUnavailable):
+                raise
+            except Exception as e:
+                if not cached_prefix:
+                    raise
+                self._drop_cached_prefix(model_name, cached_prefix, with_tools, e)
+                response = await generate_content(
+                    model=model_name,
+                    contents=message,
+                    config=self._build_config(system_prompt, with_tools),
+                )
+            _record_usage(model_name, getattr(response, "usage_metadata", None))
 
             # Extract text, handling function call responses
             try:
@@ -350,7 +636,9 @@ class LLMGateway:
                 return (text_content, "gemini-2.5-flash", response)
 
             except (ResourceExhausted, ServiceUnavailable) as e:
-                logger.warning(f"⚠️ LLMGateway: Gemini 2.5 Flash quota exceeded, trying 2.0 fallback: {e}")
+                logger.warning(
+                    f"⚠️ LLMGateway: Gemini 2.5 Flash quota exceeded, trying 2.0 fallback: {e}"
+                )
                 model_tier = TIER_FALLBACK
             except (ValueError, RuntimeError, AttributeError) as e:
                 logger.error(
@@ -370,14 +658,10 @@ class LLMGateway:
                 return (text_content, "gemini-2.0-flash", response)
 
             except (ResourceExhausted, ServiceUnavailable) as e:
-                logger.error(
-                    f"❌ LLMGateway: All Gemini models quota exceeded: {e}"
-                )
+                logger.error(f"❌ LLMGateway: All Gemini models quota exceeded: {e}")
                 raise RuntimeError(f"All Gemini models unavailable: {e}")
             except (ValueError, RuntimeError, AttributeError) as e:
-                logger.error(
-                    f"❌ LLMGateway: Gemini 2.0 Flash error: {e}", exc_info=True
-                )
+                logger.error(f"❌ LLMGateway: Gemini 2.0 Flash error: {e}", exc_info=True)
                 raise RuntimeError(f"Gemini fallback failed: {e}")
 
         # 4. No models available - raise error
@@ -52,7 +52,7 @@ from .context_manager import get_user_context
 from .llm_gateway import LLMGateway
 from .pipeline import create_default_pipeline
 from .prompt_builder import SystemPromptBuilder
-from .reasoning import ReasoningEngine, detect_team_query
+from .reasoning import ReasoningEngine, detect_team_query, stream_react_step
 from .response_processor import post_process_response
 from .session_fact_extractor import SessionFactExtractor
 from .tool_executor import execute_tool, parse_tool_call
@@ -173,6 +173,8 @@ class AgenticRAGOrchestrator:
             try:
                 self._memory_orchestrator = MemoryOrchestrator(db_pool=self.db_pool)
                 await self._memory_orchestrator.initialize()
+                # New facts change the user's prompt; drop cached prompts right away
+                self._memory_orchestrator.add_invalidation_hook(self.prompt_builder.invalidate_user)
                 logger.info("✅ MemoryOrchestrator initialized for AgenticRAG")
             except (asyncpg.PostgresError, asyncpg.InterfaceError, ValueError, RuntimeError) as e:
                 logger.warning(f"⚠️ Failed to initialize MemoryOrchestrator: {e}", exc_info=True)
@@ -330,7 +332,8 @@ class AgenticRAGOrchestrator:
             logger.info("💬 [Casual] Detected casual conversation - bypassing RAG tools")
             try:
                 # Build casual-focused prompt
-                casual_prompt = """You are ZANTARA - a friendly, warm AI with Jaksel personality.
+                casual_prompt = (
+                    """You are ZANTARA - a friendly, warm AI with Jaksel personality.
 This is a CASUAL conversation - NOT a business query.
 
 RESPOND with personality:
@@ -341,7 +344,9 @@ RESPOND with personality:
 - For personal chat: be engaging and ask follow-up questions
 - Keep it conversational and fun!
 
-User says: """ + query
+User says: """
+                    + query
+                )
 
                 # Create a fresh chat without tools for casual response
                 casual_chat = self.llm_gateway.create_chat_with_history(
@@ -603,18 +608,26 @@ IMPORTANT: Use the KEY FACTS above to answer questions about user's company, bud
                 import numpy as np
 
                 query_embedding = None
-                
+
                 # Try to generate real semantic embedding first
                 if self.retriever and hasattr(self.retriever, "embedder"):
                     try:
-                        # This should be async but usually the underlying call is sync or wrapped
-                        # If generate_query_embedding is async, we need await
-                        # Assuming synchronous for now based on common patterns, but check if await needed
-                        if asyncio.iscoroutinefunction(self.retriever.embedder.generate_query_embedding):
-                            query_embedding = await self.retriever.embedder.generate_query_embedding(query)
+                        # Prefer the async front-end: embedding-cache hit for the query that
+                        # was just searched, and never blocks the event loop on a miss
+                        async_embedder = getattr(self.retriever, "async_embedder", None)
+                        if async_embedder is not None and hasattr(async_embedder, "embed_query"):
+                            query_embedding = await async_embedder.embed_query(query)
+                        elif asyncio.iscoroutinefunction(
+                            self.retriever.embedder.generate_query_embedding
+                        ):
+                            query_embedding = (
+                                await self.retriever.embedder.generate_query_embedding(query)
+                            )
                         else:
-                            query_embedding = self.retriever.embedder.generate_query_embedding(query)
-                        
+                            query_embedding = self.retriever.embedder.generate_query_embedding(
+                                query
+                            )
+
                         # Ensure it's a numpy array of float32
                         if isinstance(query_embedding, list):
                             query_embedding = np.array(query_embedding, dtype=np.float32)
@@ -624,13 +637,16 @@ IMPORTANT: Use the KEY FACTS above to answer questions about user's company, bud
                 # Fallback to hash-based embedding (exact match only) if semantic fails
                 if query_embedding is None:
                     import hashlib
-                    logger.warning("⚠️ Using hash-based embedding for cache (Exact Match Only) - Semantic search degraded")
+
+                    logger.warning(
+                        "⚠️ Using hash-based embedding for cache (Exact Match Only) - Semantic search degraded"
+                    )
                     # Create hash-based embedding for exact match caching
                     query_hash = hashlib.sha256(query.lower().strip().encode()).digest()
                     # Convert hash bytes to float32 array (32 bytes = 8 floats, pad to 384)
                     hash_floats = np.frombuffer(query_hash, dtype=np.float32)
                     query_embedding = np.zeros(384, dtype=np.float32)
-                    query_embedding[:len(hash_floats)] = hash_floats
+                    query_embedding[: len(hash_floats)] = hash_floats
                     # Normalize to unit vector for cosine similarity
                     norm = np.linalg.norm(query_embedding)
                     if norm > 0:
@@ -672,8 +688,11 @@ IMPORTANT: Use the KEY FACTS above to answer questions about user's company, bud
                     )
                 )
                 task.add_done_callback(
-                    lambda t: logger.error(f"❌ Memory save failed: {t.exception()}")
-                    if t.exception() else None
+                    lambda t: (
+                        logger.error(f"❌ Memory save failed: {t.exception()}")
+                        if t.exception()
+                        else None
+                    )
                 )
 
         if memory_save_info:
@@ -766,10 +785,10 @@ IMPORTANT: Use the KEY FACTS above to answer questions about user's company, bud
         logger.info("🧠 [Cell-Giant] Phase 1: Giant reasoning...")
         try:
             from app.core.config import settings
-            giant_timeout = getattr(settings, 'timeout_ai_response', 60.0)
+
+            giant_timeout = getattr(settings, "timeout_ai_response", 60.0)
             giant_result = await asyncio.wait_for(
-                giant_reason(query=query, user_context=user_context_str),
-                timeout=giant_timeout
+                giant_reason(query=query, user_context=user_context_str), timeout=giant_timeout
             )
         except asyncio.TimeoutError:
             logger.error(f"⏱️ [Cell-Giant] Giant reasoning timeout after {giant_timeout}s")
@@ -778,7 +797,7 @@ IMPORTANT: Use the KEY FACTS above to answer questions about user's company, bud
                 "key_points": [],
                 "warnings": ["Timeout durante il ragionamento"],
                 "quality_score": 0.1,
-                "detected_domain": "general"
+                "detected_domain": "general",
             }
         logger.info(
             f"✅ [Cell-Giant] Giant done: {len(giant_result.get('reasoning', ''))} chars, "
@@ -793,7 +812,8 @@ IMPORTANT: Use the KEY FACTS above to answer questions about user's company, bud
         logger.info("🔬 [Cell-Giant] Phase 2: Cell calibrating...")
         try:
             from app.core.config import settings
-            cell_timeout = getattr(settings, 'timeout_rag_query', 10.0)
+
+            cell_timeout = getattr(settings, "timeout_rag_query", 10.0)
             cell_result = await asyncio.wait_for(
                 cell_calibrate(
                     query=query,
@@ -801,7 +821,7 @@ IMPORTANT: Use the KEY FACTS above to answer questions about user's company, bud
                     user_id=user_id,
                     user_facts=user_facts,
                 ),
-                timeout=cell_timeout
+                timeout=cell_timeout,
             )
         except asyncio.TimeoutError:
             logger.error(f"⏱️ [Cell-Giant] Cell calibration timeout after {cell_timeout}s")
@@ -810,7 +830,7 @@ IMPORTANT: Use the KEY FACTS above to answer questions about user's company, bud
                 "enhancements": [],
                 "calibrations": {},
                 "user_memory": user_facts or [],
-                "legal_sources": []
+                "legal_sources": [],
             }
         logger.info(
             f"✅ [Cell-Giant] Cell done: {len(cell_result.get('corrections', []))} corrections, "
@@ -825,18 +845,20 @@ IMPORTANT: Use the KEY FACTS above to answer questions about user's company, bud
         logger.info("🎭 [Cell-Giant] Phase 3: Zantara synthesizing...")
         try:
             from app.core.config import settings
-            zantara_timeout = getattr(settings, 'timeout_ai_response', 60.0)
+
+            zantara_timeout = getattr(settings, "timeout_ai_response", 60.0)
             final_answer = await asyncio.wait_for(
                 synthesize_as_zantara(
                     query=query,
                     giant_reasoning=giant_result,
                     cell_calibration=cell_result,
                 ),
-                timeout=zantara_timeout
+                timeout=zantara_timeout,
             )
         except asyncio.TimeoutError:
             logger.error(f"⏱️ [Cell-Giant] Zantara synthesis timeout after {zantara_timeout}s")
             from services.rag.agentic.cell_giant.zantara_synthesizer import _fallback_synthesis
+
             final_answer = _fallback_synthesis(giant_result, cell_result)
         logger.info(f"✅ [Cell-Giant] Zantara done: {len(final_answer)} chars")
 
@@ -854,7 +876,11 @@ IMPORTANT: Use the KEY FACTS above to answer questions about user's company, bud
             "route_used": "cell-giant",
             "steps": [
                 {"step": 1, "phase": "giant", "output_len": len(giant_result.get("reasoning", ""))},
-                {"step": 2, "phase": "cell", "corrections": len(cell_result.get("corrections", []))},
+                {
+                    "step": 2,
+                    "phase": "cell",
+                    "corrections": len(cell_result.get("corrections", [])),
+                },
                 {"step": 3, "phase": "zantara", "output_len": len(final_answer)},
             ],
             "tools_called": 1 if cell_result.get("legal_sources") else 0,
@@ -878,8 +904,11 @@ IMPORTANT: Use the KEY FACTS above to answer questions about user's company, bud
                 )
             )
             task.add_done_callback(
-                lambda t: logger.error(f"❌ Memory save failed: {t.exception()}")
-                if t.exception() else None
+                lambda t: (
+                    logger.error(f"❌ Memory save failed: {t.exception()}")
+                    if t.exception()
+                    else None
+                )
             )
 
         return result
@@ -908,15 +937,15 @@ IMPORTANT: Use the KEY FACTS above to answer questions about user's company, bud
             SSE events for frontend visualization
         """
         start_time = time.time()
-        
+
         # Initial Metadata
         yield {
-            "type": "metadata", 
+            "type": "metadata",
             "data": {
-                "status": "started", 
-                "model": "gemini-pro-reasoning", 
-                "mode": "deep_think_cell_giant"
-            }
+                "status": "started",
+                "model": "gemini-pro-reasoning",
+                "mode": "deep_think_cell_giant",
+            },
         }
 
         # 1. Build user context (Silent phase)
@@ -946,13 +975,13 @@ IMPORTANT: Use the KEY FACTS above to answer questions about user's company, bud
                 "phase": "giant",
                 "status": "in_progress",
                 "message": "Consulting the Giant Reasoner...",
-                "description": "Analyzing complex implications and strategy."
-            }
+                "description": "Analyzing complex implications and strategy.",
+            },
         }
-        
+
         # Execute Giant Reasoning
         giant_result = await giant_reason(query=query, user_context=user_context_str)
-        
+
         # Emit Giant Insights
         key_points = giant_result.get("key_points", [])
         warnings = giant_result.get("warnings", [])
@@ -963,10 +992,10 @@ IMPORTANT: Use the KEY FACTS above to answer questions about user's company, bud
                 "status": "completed",
                 "message": "Reasoning complete.",
                 "details": {
-                    "key_points": key_points[:3], # Show top 3 points
-                    "warnings": warnings[:2]      # Show top 2 warnings
-                }
-            }
+                    "key_points": key_points[:3],  # Show top 3 points
+                    "warnings": warnings[:2],  # Show top 2 warnings
+                },
+            },
         }
 
         # ========================================================================
@@ -978,8 +1007,8 @@ IMPORTANT: Use the KEY FACTS above to answer questions about user's company, bud
                 "phase": "cell",
                 "status": "in_progress",
                 "message": "Cell Verification Protocol active...",
-                "description": "Cross-referencing against Indonesian Law & Bali Zero standards."
-            }
+                "description": "Cross-referencing against Indonesian Law & Bali Zero standards.",
+            },
         }
 
         # Execute Cell Calibration
@@ -989,7 +1018,7 @@ IMPORTANT: Use the KEY FACTS above to answer questions about user's company, bud
             user_id=user_id,
             user_facts=user_facts,
         )
-        
+
         # Emit Cell Corrections
         corrections = cell_result.get("corrections", [])
         yield {
@@ -1000,23 +1029,20 @@ IMPORTANT: Use the KEY FACTS above to answer questions about user's company, bud
                 "message": f"Calibration applied ({len(corrections)} adjustments).",
                 "details": {
                     "corrections": corrections,
-                    "verified_sources": len(cell_result.get("legal_sources", []))
-                }
-            }
+                    "verified_sources": len(cell_result.get("legal_sources", [])),
+                },
+            },
         }
 
         # Emit Sources early if available
         legal_sources = cell_result.get("legal_sources", [])
         if legal_sources:
-             yield {"type": "sources", "data": legal_sources}
+            yield {"type": "sources", "data": legal_sources}
 
         # ========================================================================
         # PHASE 3: ZANTARA SYNTHESIZES
         # ========================================================================
-        yield {
-            "type": "status", 
-            "data": "Synthesizing final answer..."
-        }
+        yield {"type": "status", "data": "Synthesizing final answer..."}
 
         # Execute Synthesis (Real Streaming)
         final_answer_acc = ""
@@ -1027,12 +1053,12 @@ IMPORTANT: Use the KEY FACTS above to answer questions about user's company, bud
         ):
             final_answer_acc += token
             yield {"type": "token", "data": token}
-        
+
         final_answer = final_answer_acc
 
         # Final Cleanup
         execution_time = time.time() - start_time
-        
+
         # Check for Golden Answer
         golden_answer_used = False
         if self.golden_answer_service:
@@ -1078,8 +1104,11 @@ IMPORTANT: Use the KEY FACTS above to answer questions about user's company, bud
                 )
             )
             task.add_done_callback(
-                lambda t: logger.error(f"❌ Memory save failed: {t.exception()}")
-                if t.exception() else None
+                lambda t: (
+                    logger.error(f"❌ Memory save failed: {t.exception()}")
+                    if t.exception()
+                    else None
+                )
             )
 
         yield {"type": "done", "data": {"execution_time": execution_time}}
@@ -1124,7 +1153,7 @@ IMPORTANT: Use the KEY FACTS above to answer questions about user's company, bud
         Note:
             - Out-of-domain queries: Immediately stream rejection message
             - Intent classification: Determines model tier (Fast/Pro/DeepThink)
-            - Token streaming: Splits final answer by words/punctuation for smooth UX
+            - Token streaming: Final answer tokens are forwarded as Gemini generates them
             - Sources deduplication: Removes duplicate citations before emitting
             - Memory persistence: Runs in background after streaming completes
             - Error handling: Yields error events instead of raising exceptions
@@ -1163,9 +1192,12 @@ IMPORTANT: Use the KEY FACTS above to answer questions about user's company, bud
         # EARLY TEAM QUERY CHECK - handle team questions immediately
         is_team_query, team_query_type, team_search_term = detect_team_query(query)
         if is_team_query and "team_knowledge" in self.tool_map:
-            logger.info(f"🎯 [Early Team Route] Forcing team_knowledge for: {team_query_type}={team_search_term}")
+            logger.info(
+                f"🎯 [Early Team Route] Forcing team_knowledge for: {team_query_type}={team_search_term}"
+            )
             yield {"type": "metadata", "data": {"status": "team-query", "route": "team-knowledge"}}
             yield {"type": "status", "data": "Fetching team data..."}
+            direct_streamed = False
             try:
                 team_result = await execute_tool(
                     self.tool_map,
@@ -1189,24 +1221,33 @@ Answer directly. Example: "Zainal Abidin è il CEO di Bali Zero."
                     team_chat = self.llm_gateway.create_chat_with_history(
                         history_to_use=[], model_tier=TIER_FLASH
                     )
-                    team_response, model_used, _ = await self.llm_gateway.send_message(
-                        team_chat, team_prompt, system_prompt="", tier=TIER_FLASH, enable_function_calling=False
-                    )
-                    import re
-                    tokens = re.findall(r"\S+|\s+", team_response)
-                    for token in tokens:
-                        yield {"type": "token", "data": token}
-                        await asyncio.sleep(0.01)
+                    async for event in self.llm_gateway.send_message_stream(
+                        team_chat,
+                        team_prompt,
+                        system_prompt="",
+                        tier=TIER_FLASH,
+                        enable_function_calling=False,
+                    ):
+                        if event["type"] == "token":
+                            direct_streamed = True
+                            yield event
                     yield {"type": "done", "data": None}
                     return
             except Exception as e:
+                if direct_streamed:
+                    logger.error(f"❌ [Early Team Route] Stream interrupted: {e}")
+                    yield {"type": "error", "data": str(e)}
+                    yield {"type": "done", "data": None}
+                    return
                 logger.warning(f"⚠️ [Early Team Route] Failed: {e}, falling back to RAG")
 
         # Check Casual Conversation (bypass tools, use direct LLM response)
         if self.prompt_builder.check_casual_conversation(query):
             logger.info("💬 [Casual Stream] Detected casual conversation - bypassing RAG tools")
+            direct_streamed = False
             try:
-                casual_prompt = """You are ZANTARA - a friendly, warm AI with Jaksel personality.
+                casual_prompt = (
+                    """You are ZANTARA - a friendly, warm AI with Jaksel personality.
 This is a CASUAL conversation - NOT a business query.
 
 RESPOND with personality:
@@ -1217,31 +1258,43 @@ RESPOND with personality:
 - For personal chat: be engaging and ask follow-up questions
 - Keep it conversational and fun!
 
-User says: """ + query
+User says: """
+                    + query
+                )
 
                 casual_chat = self.llm_gateway.create_chat_with_history(
                     history_to_use=[], model_tier=TIER_FLASH
                 )
 
-                casual_response, model_used, _ = await self.llm_gateway.send_message(
+                async for event in self.llm_gateway.send_message_stream(
                     casual_chat,
                     casual_prompt,
                     system_prompt="",
                     tier=TIER_FLASH,
                     enable_function_calling=False,
-                )
-
-                yield {"type": "metadata", "data": {"status": "casual", "route": f"casual-conversation ({model_used})"}}
-                import re
-
-                tokens = re.findall(r"\S+|\s+", casual_response)
-                for token in tokens:
-                    yield {"type": "token", "data": token}
-                    await asyncio.sleep(0.01)
+                ):
+                    if event["type"] == "model":
+                        yield {
+                            "type": "metadata",
+                            "data": {
+                                "status": "casual",
+                                "route": f"casual-conversation ({event['data']})",
+                            },
+                        }
+                    elif event["type"] == "token":
+                        direct_streamed = True
+                        yield event
                 yield {"type": "done", "data": None}
                 return
             except Exception as e:
-                logger.warning(f"⚠️ [Casual Stream] Direct response failed, falling back to RAG: {e}")
+                if direct_streamed:
+                    logger.error(f"❌ [Casual Stream] Stream interrupted: {e}")
+                    yield {"type": "error", "data": str(e)}
+                    yield {"type": "done", "data": None}
+                    return
+                logger.warning(
+                    f"⚠️ [Casual Stream] Direct response failed, falling back to RAG: {e}"
+                )
                 # Fall through to normal RAG processing
 
         # Check Out-of-Domain Questions
@@ -1302,7 +1355,7 @@ User says: """ + query
             history_to_use = []
 
         logger.debug(f"User context retrieved. History len: {len(history_to_use)}")
-        
+
         # --- QUALITY ROUTING: CELL-GIANT HANDOFF ---
         # If DeepThink is selected, we use the advanced Cell-Giant architecture
         if suggested_ai == "deep_think":
@@ -1311,7 +1364,7 @@ User says: """ + query
                 query=query,
                 user_id=user_id,
                 conversation_history=history_to_use,
-                session_id=session_id
+                session_id=session_id,
             ):
                 yield event
             return
@@ -1469,34 +1522,31 @@ Example: "Final Answer: Zainal Abidin è il CEO di Bali Zero, esperto in managem
 
 Now answer "{query}" using the facts above. Start with "Final Answer:" and give CONCRETE facts, NOT a greeting."""
 
-                text_response, model_used, response_obj = await self.llm_gateway.send_message(
-                    chat, message, system_prompt, tier=model_tier, enable_function_calling=True
-                )
+                # Final-answer tokens are forwarded as Gemini produces them
+                step_result = None
+                async for event in stream_react_step(
+                    self.llm_gateway, chat, message, system_prompt, model_tier
+                ):
+                    if event["type"] == "step_result":
+                        step_result = event["data"]
+                    else:
+                        yield event
+                text_response = step_result["text"]
 
             except (ResourceExhausted, ServiceUnavailable, ValueError, RuntimeError) as e:
                 logger.error(f"Error during streaming chat interaction: {e}", exc_info=True)
                 yield {"type": "error", "data": str(e)}
                 break
 
-            # Parse for tool calls - try native function calling first, then regex fallback
+            # Parse for tool calls - native function call detected mid-stream, then regex fallback
             tool_call = None
-            use_native = response_obj is not None
-
-            # Check for function call in response parts (native mode)
-            if response_obj and hasattr(response_obj, "candidates"):
-                for candidate in response_obj.candidates:
-                    if hasattr(candidate, "content") and hasattr(candidate.content, "parts"):
-                        for part in candidate.content.parts:
-                            tool_call = parse_tool_call(part, use_native=True)
-                            if tool_call:
-                                logger.info("✅ [Stream Native Function Call] Detected")
-                                break
-                        if tool_call:
-                            break
-
-            # Fallback to regex parsing if no native function call found
-            if not tool_call:
-                tool_call = parse_tool_call(text_response, use_native=False)
+            if not step_result["streamed"]:
+                if step_result["function_call"] is not None:
+                    tool_call = parse_tool_call(step_result["function_call"], use_native=True)
+                    if tool_call:
+                        logger.info("✅ [Stream Native Function Call] Detected")
+                if not tool_call:
+                    tool_call = parse_tool_call(text_response, use_native=False)
 
             if tool_call:
                 yield {
@@ -1561,30 +1611,25 @@ Now answer "{query}" using the facts above. Start with "Final Answer:" and give
                 state.context_gathered.append(tool_result)
 
             else:
-                if "Final Answer:" in text_response or state.current_step >= state.max_steps:
-                    final_text = text_response
-                    if "Final Answer:" in final_text:
-                        final_text = final_text.split("Final Answer:")[-1].strip()
-
-                    # Quick post-process for streaming (full pipeline runs later)
-                    final_text = post_process_response(final_text, query)
+                if (
+                    step_result["streamed"]
+                    or "Final Answer:" in text_response
+                    or state.current_step >= state.max_steps
+                ):
+                    # Quick post-process of the stored answer (full pipeline runs later)
+                    final_text = post_process_response(step_result["answer"], query)
                     state.final_answer = final_text
                     step = AgentStep(
                         step_number=state.current_step, thought=text_response, is_final=True
                     )
                     state.steps.append(step)
 
-                    # Simulate token streaming for the final answer (only if we have content)
-                    # Use lower threshold (20 chars) to support short team answers like "X is the CEO"
-                    if final_text and len(final_text) >= 20:
-                        import re
-
-                        tokens = re.findall(r"\S+|\s+", final_text)
-                        for token in tokens:
-                            yield {"type": "token", "data": token}
-                            await asyncio.sleep(0.01)  # Tiny delay for UX
-                    else:
-                        yield {"type": "status", "data": "Generating enhanced answer..."}
+                    # Last step without a "Final Answer:" marker was not streamed live
+                    if not step_result["streamed"]:
+                        if final_text:
+                            yield {"type": "token", "data": final_text}
+                        else:
+                            yield {"type": "status", "data": "Generating enhanced answer..."}
 
                     break
                 else:
@@ -1596,26 +1641,19 @@ Now answer "{query}" using the facts above. Start with "Final Answer:" and give
             yield {"type": "status", "data": "Generating final answer..."}
             context = "\n\n".join(state.context_gathered)
             final_prompt = f"Based on: {context}\n\nAnswer: {query}"
+            raw_answer = ""
             try:
-                raw_answer, _, _ = await self.llm_gateway.send_message(
+                async for event in self.llm_gateway.send_message_stream(
                     chat,
                     final_prompt,
                     system_prompt,
                     tier=model_tier,
                     enable_function_calling=False,
-                )
-                # Post-process response: clean and enforce communication rules
-                state.final_answer = post_process_response(raw_answer, query)
-
-                # Stream tokens only if we have content (20 char min for short answers)
-                if state.final_answer and len(state.final_answer) >= 20:
-                    import re
-
-                    tokens = re.findall(r"\S+|\s+", state.final_answer)
-                    for token in tokens:
-                        yield {"type": "token", "data": token}
-                        await asyncio.sleep(0.01)
-                else:
+                ):
+                    if event["type"] == "token":
+                        raw_answer += event["data"]
+                        yield event
+                if not raw_answer:
                     yield {
                         "type": "status",
                         "data": "Answer too short, searching for more information...",
@@ -1623,6 +1661,9 @@ Now answer "{query}" using the facts above. Start with "Final Answer:" and give
             except (ResourceExhausted, ServiceUnavailable, ValueError, RuntimeError):
                 logger.error("Failed to generate final answer in stream", exc_info=True)
                 yield {"type": "error", "data": "Failed to generate final answer."}
+            # Post-process the stored answer: clean and enforce communication rules
+            if raw_answer:
+                state.final_answer = post_process_response(raw_answer, query)
 
         # Calculate final metrics
         execution_time = time.time() - start_time
@@ -1754,8 +1795,11 @@ Now answer "{query}" using the facts above. Start with "Final Answer:" and give
                     )
                 )
                 task.add_done_callback(
-                    lambda t: logger.error(f"❌ Memory save failed: {t.exception()}")
-                    if t.exception() else None
+                    lambda t: (
+                        logger.error(f"❌ Memory save failed: {t.exception()}")
+                        if t.exception()
+                        else None
+                    )
                 )
 
         # Update debug_info with memory save results if available
@@ -9,20 +9,27 @@ This module handles construction of dynamic system prompts based on:
 - Deep think mode activation
 
 Key Features:
-- Caching system with 5-minute TTL
+- Bounded LRU caching system with 5-minute TTL
 - Cache key includes facts count for invalidation
 - Dynamic language/format instructions
 - Domain-specific formatting (visa, tax, company)
 - Explanation level detection
+- Stable/variable prompt split for provider context caching
 """
 
 import logging
 import re
-import time
 from typing import Any
 
+from core.cache import LRUCache
+
 logger = logging.getLogger(__name__)
 
+# System prompt cache bounds (prompts are ~10-40KB each)
+PROMPT_CACHE_TTL = 300  # 5 minutes
+PROMPT_CACHE_MAX_ENTRIES = 512
+PROMPT_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
 # --- ZANTARA MASTER PROMPT (v6.2 - Mandatory Pre-Response Check) ---
 
 ZANTARA_MASTER_TEMPLATE = """
@@ -224,6 +231,11 @@ ZANTARA_MASTER_TEMPLATE = """
   {query}
 """
 
+# The per-request part of the master template starts here. Everything before it
+# (persona, language header, rules) is shared across users and turns, and is what
+# LLMGateway registers as provider-side cached content.
+CACHEABLE_PREFIX_BOUNDARY = "## [SOURCE TIER 1]"
+
 # --- SPECIAL PERSONAS ---
 
 CREATOR_PERSONA = """
@@ -274,12 +286,23 @@ You are a member of the team, not an external assistant.
 """
 
 
+def split_system_prompt(prompt: str) -> tuple[str, str]:
+    """Split a built system prompt into (stable prefix, per-request suffix).
+
+    Prompts not built from the master template have no stable prefix: ("", prompt).
+    """
+    index = prompt.find(CACHEABLE_PREFIX_BOUNDARY)
+    if index < 0:
+        return "", prompt
+    return prompt[:index], prompt[index:]
+
+
 class SystemPromptBuilder:
     """
     Builds dynamic system prompts with caching for performance.
 
-    Cache key: user_id:deep_think_mode:facts_count:collective_count
-    Cache TTL: 5 minutes
+    Cache key: (user_id, deep_think_mode, facts_count, collective_count, ...)
+    Cache TTL: 5 minutes, LRU-bounded by entry count and bytes
     """
 
     def __init__(self):
@@ -291,12 +314,26 @@ class SystemPromptBuilder:
 
         Note:
             - Cache TTL: 5 minutes (balances freshness vs performance)
-            - Cache invalidation: Triggered by changes in memory facts count
-            - Memory usage: Bounded by TTL expiration (no size limit)
+            - Cache invalidation: Triggered by changes in memory facts count,
+              or explicitly through invalidate_user() when facts are saved
+            - Memory usage: Bounded by PROMPT_CACHE_MAX_ENTRIES and
+              PROMPT_CACHE_MAX_BYTES (least recently used prompts evicted)
         """
         # System prompt cache for performance
-        self._cache: dict[str, tuple[str, float]] = {}
-        self._cache_ttl = 300  # 5 minutes TTL
+        self._cache = LRUCache(
+            max_size=PROMPT_CACHE_MAX_ENTRIES,
+            max_bytes=PROMPT_CACHE_MAX_BYTES,
+            default_ttl=PROMPT_CACHE_TTL,
+            name="system_prompt",
+        )
+
+    def invalidate_user(self, user_id: str) -> int:
+        """Drop cached prompts for a user (e.g. after new memory facts are saved).
+
+        Returns:
+            Number of cached prompts removed
+        """
+        return self._cache.invalidate(lambda key: key[0] == user_id)
 
     def build_system_prompt(
         self,
@@ -304,7 +341,7 @@ class SystemPromptBuilder:
         context: dict[str, Any],
         query: str = "",
         deep_think_mode: bool = False,
-        additional_context: str = ""
+        additional_context: str = "",
     ) -> str:
         """Construct dynamic, personalized system prompt with intelligent caching.
 
@@ -395,20 +432,22 @@ class SystemPromptBuilder:
 
         # Detect language EARLY for cache key
         query_lower = query.lower() if query else ""
+        # fmt: off
         indo_markers = ["apa", "bagaimana", "siapa", "dimana", "kapan", "mengapa",
                        "yang", "dengan", "untuk", "dari", "saya", "aku", "kamu",
                        "anda", "bisa", "mau", "ingin", "tolong", "halo", "gimana",
                        "gue", "gw", "lu", "dong", "nih", "banget"]
+        # fmt: on
         is_indonesian = any(marker in query_lower for marker in indo_markers)
 
         # Detect specific language (with descriptive names for prompts)
         detected_lang = None
         if not is_indonesian and query and len(query) > 3:
-            if any('\u4e00' <= c <= '\u9fff' for c in query):
+            if any("\u4e00" <= c <= "\u9fff" for c in query):
                 detected_lang = "CHINESE (中文)"
-            elif any('\u0600' <= c <= '\u06ff' for c in query):
+            elif any("\u0600" <= c <= "\u06ff" for c in query):
                 detected_lang = "ARABIC (العربية)"
-            elif any('\u0400' <= c <= '\u04ff' for c in query):
+            elif any("\u0400" <= c <= "\u04ff" for c in query):
                 detected_lang = "RUSSIAN/UKRAINIAN"
             elif any(w in query_lower for w in ["ciao", "come", "cosa", "voglio", "grazie"]):
                 detected_lang = "ITALIAN"
@@ -422,29 +461,35 @@ class SystemPromptBuilder:
         # OPTIMIZATION: Check cache before building expensive prompt
         # Include detected language in cache key (use short form for key)
         lang_key = detected_lang.split()[0] if detected_lang else "ID"
-        cache_key = f"{user_id}:{deep_think_mode}:{len(facts)}:{len(collective_facts)}:{len(timeline_summary)}:{is_creator}:{is_team}:{len(additional_context)}:{lang_key}"
-
-        if cache_key in self._cache:
-            cached_prompt, cached_time = self._cache[cache_key]
-            # Check if cache is still valid (within TTL)
-            if time.time() - cached_time < self._cache_ttl:
-                logger.debug(f"Using cached system prompt for {user_id} (cache hit)")
-                return cached_prompt
-            else:
-                # Cache expired, remove it
-                del self._cache[cache_key]
-                logger.debug(f"Cache expired for {user_id}, rebuilding prompt")
+        cache_key = (
+            user_id,
+            deep_think_mode,
+            len(facts),
+            len(collective_facts),
+            len(timeline_summary),
+            is_creator,
+            is_team,
+            len(additional_context),
+            lang_key,
+        )
+
+        cached_prompt = self._cache.get(cache_key)
+        if cached_prompt is not None:
+            logger.debug(f"Using cached system prompt for {user_id} (cache hit)")
+            return cached_prompt
 
         # Build Memory / Identity Block
         memory_parts = []
-        
+
         # 1. Identity Awareness
         if profile:
             user_name = profile.get("name", "Partner")
             user_role = profile.get("role", "Team Member")
             dept = profile.get("department", "General")
             notes = profile.get("notes", "")
-            memory_parts.append(f"User Name: {user_name}\nRole: {user_role}\nDepartment: {dept}\nNotes: {notes}")
+            memory_parts.append(
+                f"User Name: {user_name}\nRole: {user_role}\nDepartment: {dept}\nNotes: {notes}"
+            )
         elif entities:
             user_name = entities.get("user_name", "Partner")
             user_city = entities.get("user_city", "Unknown City")
@@ -453,20 +498,22 @@ class SystemPromptBuilder:
         # 2. Personal Facts
         if facts:
             memory_parts.append("FACTS:\n" + "\n".join([f"- {f}" for f in facts]))
-            
+
         # 3. Recent History
         if timeline_summary:
             memory_parts.append(f"RECENT HISTORY:\n{timeline_summary}")
-            
+
         # 4. Collective Knowledge
         if collective_facts:
-            memory_parts.append("COLLECTIVE KNOWLEDGE:\n" + "\n".join([f"- {f}" for f in collective_facts]))
+            memory_parts.append(
+                "COLLECTIVE KNOWLEDGE:\n" + "\n".join([f"- {f}" for f in collective_facts])
+            )
 
         user_memory_text = "\n\n".join(memory_parts) if memory_parts else "No specific memory yet."
-        
+
         # Build Final Prompt using Master Template
         rag_results = context.get("rag_results", "{rag_results}")
-        
+
         # DeepThink Mode Instruction (if activated)
         deep_think_instr = ""
         if deep_think_mode:
@@ -482,17 +529,19 @@ class SystemPromptBuilder:
             stripped_template = ZANTARA_MASTER_TEMPLATE.format(
                 rag_results=rag_results,
                 user_memory=user_memory_text,
-                query=query if query else "General inquiry"
+                query=query if query else "General inquiry",
             )
             # Remove Jaksel-specific instructions
+            # fmt: off
             jaksel_phrases = [
                 'Jaksel', 'Jakarta Selatan', '"gue"', '"banget"', '"nih"', '"dong"',
                 '"bro"', 'Basically gini bro', 'Makes sense kan?', 'Full Jaksel',
                 'Business Jaksel', 'Jaksel flair', 'Jaksel flavor', 'Jaksel persona',
                 '"gimana"', '"kayak"', '"sih"', '"deh"', '"lho"', '"kok"',
             ]
+            # fmt: on
             for phrase in jaksel_phrases:
-                stripped_template = stripped_template.replace(phrase, '')
+                stripped_template = stripped_template.replace(phrase, "")
 
             # Add strong language instruction
             language_header = f"""
@@ -508,7 +557,7 @@ DO NOT USE ANY INDONESIAN WORDS OR SLANG.
             final_prompt = ZANTARA_MASTER_TEMPLATE.format(
                 rag_results=rag_results,
                 user_memory=user_memory_text,
-                query=query if query else "General inquiry"
+                query=query if query else "General inquiry",
             )
 
         if deep_think_instr:
@@ -526,7 +575,7 @@ DO NOT USE ANY INDONESIAN WORDS OR SLANG.
             logger.info(f"🏢 [PromptBuilder] Activated TEAM Mode for {user_id}")
 
         # Cache for next time
-        self._cache[cache_key] = (final_prompt, time.time())
+        self._cache.set(cache_key, final_prompt)
 
         return final_prompt
 
@@ -577,13 +626,17 @@ DO NOT USE ANY INDONESIAN WORDS OR SLANG.
             if re.match(pattern, query_lower):
                 # Return friendly greeting in detected language
                 # Italian
-                if any(word in query_lower for word in ["ciao", "salve", "buongiorno", "buonasera"]):
+                if any(
+                    word in query_lower for word in ["ciao", "salve", "buongiorno", "buonasera"]
+                ):
                     return "Ciao! Come posso aiutarti oggi?"
                 # Ukrainian
                 if any(word in query_lower for word in ["привіт", "вітаю", "добрий"]):
                     return "Привіт! Чим можу допомогти?"
                 # Russian
-                if any(word in query_lower for word in ["привет", "здравствуй", "добрый", "доброе"]):
+                if any(
+                    word in query_lower for word in ["привет", "здравствуй", "добрый", "доброе"]
+                ):
                     return "Привет! Чем могу помочь?"
                 # French
                 if any(word in query_lower for word in ["bonjour", "salut", "bonsoir"]):
@@ -633,6 +686,7 @@ DO NOT USE ANY INDONESIAN WORDS OR SLANG.
         query_lower = query.lower().strip()
 
         # Business keywords that require RAG (MULTILINGUAL)
+        # fmt: off
         business_keywords = [
             # English
             "visa", "kitas", "kitap", "voa", "pt pma", "pt local", "pma", "kbli",
@@ -656,6 +710,7 @@ DO NOT USE ANY INDONESIAN WORDS OR SLANG.
             # Russian/Ukrainian business keywords
             "компания", "виза", "налог", "инвестиция", "бизнес", "закон",
         ]
+        # fmt: on
 
         # Check if it's a business question
         for keyword in business_keywords:
@@ -696,7 +751,7 @@ DO NOT USE ANY INDONESIAN WORDS OR SLANG.
             r"(raccontami|tell me about yourself|parlami di te|cosa ti piace)",
             r"(розкажи про себе|що тобі подобається)",  # Ukrainian
             r"(расскажи о себе|что тебе нравится)",  # Russian
-            r"(che musica|what music|che tipo di|what kind of)"
+            r"(che musica|what music|che tipo di|what kind of)",
         ]
 
         for pattern in casual_patterns:
@@ -706,9 +761,9 @@ DO NOT USE ANY INDONESIAN WORDS OR SLANG.
         # Check for non-Latin scripts (Chinese, Arabic, Cyrillic)
         # These scripts use fewer characters to express the same meaning,
         # so we should NOT use character count as a casual indicator
-        has_chinese = any('\u4e00' <= c <= '\u9fff' for c in query)
-        has_arabic = any('\u0600' <= c <= '\u06ff' for c in query)
-        has_cyrillic = any('\u0400' <= c <= '\u04ff' for c in query)
+        has_chinese = any("\u4e00" <= c <= "\u9fff" for c in query)
+        has_arabic = any("\u0600" <= c <= "\u06ff" for c in query)
+        has_cyrillic = any("\u0400" <= c <= "\u04ff" for c in query)
         has_non_latin = has_chinese or has_arabic or has_cyrillic
 
         # For non-Latin scripts, don't use the short query heuristic
@@ -790,4 +845,4 @@ DO NOT USE ANY INDONESIAN WORDS OR SLANG.
                     "veloci e affidabili per aiutarti a vivere e lavorare a Bali senza stress."
                 )
 
-        return None
\ No newline at end of file
+        return None
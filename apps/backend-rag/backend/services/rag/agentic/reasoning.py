@@ -13,6 +13,7 @@ Key features:
 - Citation handling for vector search results
 - Final answer generation if not provided
 - Integration with response verification pipeline
+- Live final-answer token streaming (stream_react_step)
 """
 
 import json
@@ -29,6 +30,11 @@ from .tool_executor import execute_tool, parse_tool_call
 
 logger = logging.getLogger(__name__)
 
+FINAL_ANSWER_MARKER = "Final Answer:"
+# Answer characters held back before live streaming starts, so that a ReAct
+# "ACTION:" written right after the marker still counts as a tool call
+STREAM_HOLDBACK_CHARS = 20
+
 
 def calculate_evidence_score(
     sources: list[dict] | None,
@@ -76,6 +82,7 @@ def calculate_evidence_score(
     if context_gathered:
         query_lower = query.lower()
         # Extract meaningful keywords (words longer than 3 chars, excluding common words)
+        # fmt: off
         stop_words = {
             "the", "a", "an", "is", "are", "was", "were", "be", "been", "being",
             "have", "has", "had", "do", "does", "did", "will", "would", "could",
@@ -88,6 +95,7 @@ def calculate_evidence_score(
             "in", "con", "su", "per", "tra", "fra", "che", "chi", "cosa", "come",
             "dove", "quando", "perché", "quale", "quali",
         }
+        # fmt: on
         query_keywords = [
             word.lower()
             for word in query.split()
@@ -105,6 +113,90 @@ def calculate_evidence_score(
     return min(base_score, 1.0)
 
 
+async def stream_react_step(
+    llm_gateway: Any,
+    chat: Any,
+    message: str,
+    system_prompt: str,
+    model_tier: int,
+    live: bool = True,
+):
+    """
+    Run one ReAct step over LLMGateway.send_message_stream.
+
+    Text is buffered until the "Final Answer:" marker shows up; from then on
+    answer tokens are forwarded as they arrive. A native function call part
+    stops forwarding (the step becomes a tool call).
+
+    Args:
+        llm_gateway: LLMGateway instance
+        chat: Active chat session
+        message: Step prompt
+        system_prompt: System instructions
+        model_tier: Requested model tier
+        live: Forward final-answer tokens (False buffers the whole step)
+
+    Yields:
+        {"type": "token"} events for the final answer, then exactly one
+        {"type": "step_result", "data": {"text", "answer", "model", "function_call", "streamed"}}
+    """
+    text = ""
+    model_used = None
+    function_call = None
+    sent: int | None = None  # Offset in text up to which tokens were forwarded
+
+    async for event in llm_gateway.send_message_stream(
+        chat, message, system_prompt, tier=model_tier, enable_function_calling=True
+    ):
+        event_type = event.get("type")
+        if event_type == "model":
+            model_used = event["data"]
+        elif event_type == "function_call":
+            if function_call is None and sent is None:
+                function_call = event["data"]
+        elif event_type == "token":
+            text += event["data"]
+            if not live or function_call is not None:
+                continue
+            if sent is None:
+                marker = text.find(FINAL_ANSWER_MARKER)
+                if marker < 0 or "ACTION:" in text:
+                    continue
+                answer = text[marker + len(FINAL_ANSWER_MARKER) :].lstrip()
+                if len(answer) < STREAM_HOLDBACK_CHARS:
+                    continue
+                sent = len(text) - len(answer)
+            if len(text) > sent:
+                yield {"type": "token", "data": text[sent:]}
+                sent = len(text)
+
+    marker = text.find(FINAL_ANSWER_MARKER)
+    answer = text[marker + len(FINAL_ANSWER_MARKER) :].strip() if marker >= 0 else text
+
+    # Short answers never reach the holdback: flush them once the step is complete
+    if (
+        live
+        and sent is None
+        and function_call is None
+        and marker >= 0
+        and not parse_tool_call(text, use_native=False)
+    ):
+        if answer:
+            yield {"type": "token", "data": answer}
+        sent = len(text)
+
+    yield {
+        "type": "step_result",
+        "data": {
+            "text": text,
+            "answer": answer,
+            "model": model_used,
+            "function_call": function_call,
+            "streamed": sent is not None,
+        },
+    }
+
+
 class ReasoningEngine:
     """
     Executes the ReAct (Reasoning + Acting) loop for agentic RAG.
@@ -332,7 +424,9 @@ class ReasoningEngine:
                         "(e.g., 'Based on limited information...', 'It appears that...'). "
                         "Do NOT be definitive."
                     )
-                    logger.info(f"🛡️ [Uncertainty] Weak evidence detected (Score: {evidence_score:.2f}), adding warning")
+                    logger.info(
+                        f"🛡️ [Uncertainty] Weak evidence detected (Score: {evidence_score:.2f}), adding warning"
+                    )
 
                 final_prompt = f"""
 Based on the information gathered:
@@ -396,8 +490,8 @@ Provide a final, comprehensive answer to: {query}
                     rephrase_prompt = f"""
 SYSTEM: Your previous answer was REJECTED by the fact-checker.
 
-REASON: {verification.get('reasoning', 'Insufficient evidence')}
-MISSING/WRONG: {', '.join(verification.get('missing_citations', []))}
+REASON: {verification.get("reasoning", "Insufficient evidence")}
+MISSING/WRONG: {", ".join(verification.get("missing_citations", []))}
 
 TASK: Rewrite the answer using ONLY the provided context.
 Do not invent information. If the context is insufficient, admit it.
@@ -456,6 +550,8 @@ Do not invent information. If the context is insufficient, admit it.
         Yields:
             Events with types: "thinking", "tool_call", "observation", "token"
         """
+        answer_streamed = False
+
         # ==================== REACT LOOP ====================
         while state.current_step < state.max_steps:
             state.current_step += 1
@@ -471,40 +567,40 @@ Do not invent information. If the context is insufficient, admit it.
                 # Yield thinking event
                 yield {"type": "thinking", "data": f"Step {state.current_step}: Processing..."}
 
-                text_response, model_used_name, response_obj = await llm_gateway.send_message(
-                    chat,
-                    message,
-                    system_prompt,
-                    tier=model_tier,
-                    enable_function_calling=True,
-                )
+                # Only stream the answer live if the evidence gathered so far would
+                # not make the policy below replace it with an ABSTAIN message
+                sources = state.sources if hasattr(state, "sources") else None
+                live = calculate_evidence_score(sources, state.context_gathered, query) >= 0.3
+
+                step_result = None
+                async for event in stream_react_step(
+                    llm_gateway, chat, message, system_prompt, model_tier, live=live
+                ):
+                    if event["type"] == "step_result":
+                        step_result = event["data"]
+                    else:
+                        yield event
+                text_response = step_result["text"]
 
             except (ResourceExhausted, ServiceUnavailable, ValueError, RuntimeError) as e:
                 logger.error(f"Error during chat interaction: {e}", exc_info=True)
                 yield {"type": "error", "data": {"message": str(e)}}
                 break
 
-            # Parse for tool calls
+            # Parse for tool calls (native function call first, regex fallback)
             tool_call = None
-
-            # Check for native function call
-            if hasattr(response_obj, "candidates") and response_obj.candidates:
-                for candidate in response_obj.candidates:
-                    if hasattr(candidate, "content") and candidate.content and hasattr(candidate.content, "parts") and candidate.content.parts:
-                        for part in candidate.content.parts:
-                            tool_call = parse_tool_call(part, use_native=True)
-                            if tool_call:
-                                break
-                        if tool_call:
-                            break
-
-            # Fallback to regex parsing
-            if not tool_call:
-                tool_call = parse_tool_call(text_response, use_native=False)
+            if not step_result["streamed"]:
+                if step_result["function_call"] is not None:
+                    tool_call = parse_tool_call(step_result["function_call"], use_native=True)
+                if not tool_call:
+                    tool_call = parse_tool_call(text_response, use_native=False)
 
             if tool_call:
                 # Yield tool call event
-                yield {"type": "tool_call", "data": {"tool": tool_call.tool_name, "args": tool_call.arguments}}
+                yield {
+                    "type": "tool_call",
+                    "data": {"tool": tool_call.tool_name, "args": tool_call.arguments},
+                }
 
                 logger.info(f"🔧 [Agent Stream] Calling tool: {tool_call.tool_name}")
                 tool_result = await execute_tool(
@@ -540,7 +636,10 @@ Do not invent information. If the context is insufficient, admit it.
                 state.context_gathered.append(tool_result)
 
                 # Yield observation event
-                yield {"type": "observation", "data": tool_result[:500] if len(tool_result) > 500 else tool_result}
+                yield {
+                    "type": "observation",
+                    "data": tool_result[:500] if len(tool_result) > 500 else tool_result,
+                }
 
                 # Early exit optimization
                 if (
@@ -553,11 +652,13 @@ Do not invent information. If the context is insufficient, admit it.
 
             else:
                 # No tool call - check for final answer
-                if "Final Answer:" in text_response or state.current_step >= state.max_steps:
-                    if "Final Answer:" in text_response:
-                        state.final_answer = text_response.split("Final Answer:")[-1].strip()
-                    else:
-                        state.final_answer = text_response
+                if (
+                    step_result["streamed"]
+                    or FINAL_ANSWER_MARKER in text_response
+                    or state.current_step >= state.max_steps
+                ):
+                    state.final_answer = step_result["answer"]
+                    answer_streamed = step_result["streamed"]
 
                     step = AgentStep(
                         step_number=state.current_step, thought=text_response, is_final=True
@@ -599,7 +700,9 @@ Do not invent information. If the context is insufficient, admit it.
             # POLICY ENFORCEMENT: Check evidence score before generating answer
             if evidence_score < 0.3:
                 # ABSTAIN: Skip LLM generation, return uncertainty message
-                logger.warning(f"🛡️ [Uncertainty Stream] Triggered ABSTAIN (Score: {evidence_score:.2f})")
+                logger.warning(
+                    f"🛡️ [Uncertainty Stream] Triggered ABSTAIN (Score: {evidence_score:.2f})"
+                )
                 state.final_answer = (
                     "Mi dispiace, non ho trovato informazioni verificate sufficienti "
                     "nei documenti ufficiali per rispondere alla tua domanda specifica. "
@@ -615,7 +718,9 @@ Do not invent information. If the context is insufficient, admit it.
                         "(e.g., 'Based on limited information...', 'It appears that...'). "
                         "Do NOT be definitive."
                     )
-                    logger.info(f"🛡️ [Uncertainty Stream] Weak evidence detected (Score: {evidence_score:.2f}), adding warning")
+                    logger.info(
+                        f"🛡️ [Uncertainty Stream] Weak evidence detected (Score: {evidence_score:.2f}), adding warning"
+                    )
 
                 final_prompt = f"""
 Based on the information gathered:
@@ -625,15 +730,25 @@ Based on the information gathered:
 Provide a final, comprehensive answer to: {query}
 """
                 try:
-                    state.final_answer, _, _ = await llm_gateway.send_message(
+                    answer_text = ""
+                    async for event in llm_gateway.send_message_stream(
                         chat,
                         final_prompt,
                         system_prompt,
                         tier=model_tier,
                         enable_function_calling=False,
-                    )
-                except (ResourceExhausted, ServiceUnavailable, ValueError, RuntimeError):
-                    state.final_answer = "I apologize, but I couldn't generate a final answer."
+                    ):
+                        if event["type"] == "token":
+                            answer_text += event["data"]
+                            answer_streamed = True
+                            yield event
+                    state.final_answer = answer_text
+                except (ResourceExhausted, ServiceUnavailable, ValueError, RuntimeError) as e:
+                    if answer_streamed:
+                        yield {"type": "error", "data": {"message": str(e)}}
+                        state.final_answer = answer_text
+                    else:
+                        state.final_answer = "I apologize, but I couldn't generate a final answer."
         elif not state.final_answer:
             # No context gathered at all
             logger.warning("🛡️ [Uncertainty Stream] No context gathered, triggering ABSTAIN")
@@ -648,7 +763,9 @@ Provide a final, comprehensive answer to: {query}
             "no further action needed" in state.final_answer.lower()
             or "observation: none" in state.final_answer.lower()
         ):
-            state.final_answer = "Mi dispiace, non ho capito bene la tua richiesta. Potresti riformularla?"
+            state.final_answer = (
+                "Mi dispiace, non ho capito bene la tua richiesta. Potresti riformularla?"
+            )
 
         # Process through pipeline
         if state.final_answer and self.response_pipeline:
@@ -660,20 +777,23 @@ Provide a final, comprehensive answer to: {query}
                     "sources": state.sources if hasattr(state, "sources") else [],
                 }
                 processed = await self.response_pipeline.process(pipeline_data)
-                state.final_answer = processed["response"]
+                # A streamed answer is already on the client: keep it, take the citations
+                if not answer_streamed:
+                    state.final_answer = processed["response"]
                 if "citations" in processed:
                     state.sources = processed["citations"]
             except (ValueError, RuntimeError, KeyError) as e:
                 logger.error(f"❌ [Pipeline Stream] Processing failed: {e}")
-                state.final_answer = post_process_response(state.final_answer, query)
+                if not answer_streamed:
+                    state.final_answer = post_process_response(state.final_answer, query)
 
-        # Stream final answer token by token
-        if state.final_answer:
+        # Stream answers that were not streamed live (abstain, override) in chunks
+        if state.final_answer and not answer_streamed:
             # Stream in chunks for better UX
             chunk_size = 20  # characters per chunk
             answer = state.final_answer
             for i in range(0, len(answer), chunk_size):
-                chunk = answer[i:i + chunk_size]
+                chunk = answer[i : i + chunk_size]
                 yield {"type": "token", "data": chunk}
 
         # Yield sources if available
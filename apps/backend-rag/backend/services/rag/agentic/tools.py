@@ -23,6 +23,7 @@ import logging
 
 import asyncpg
 import httpx
+from core.text_search import like_pattern
 
 from services.pricing_service import get_pricing_service
 from services.rag.vision_rag import VisionRAGService
@@ -66,13 +67,15 @@ class VectorSearchTool(BaseTool):
                 "filters": {
                     "type": "object",
                     "description": "Metadata filters. Keys: nationality, visa_type, business_field. Example: {'nationality': 'Italy'}",
-                    "nullable": True
-                }
+                    "nullable": True,
+                },
             },
             "required": ["query"],
         }
 
-    async def execute(self, query: str, collection: str = None, top_k: int = 5, filters: dict = None, **kwargs) -> str:
+    async def execute(
+        self, query: str, collection: str = None, top_k: int = 5, filters: dict = None, **kwargs
+    ) -> str:
         # Gemini sometimes passes top_k as float, ensure it's int
         top_k = int(top_k) if top_k else 5
 
@@ -95,7 +98,11 @@ class VectorSearchTool(BaseTool):
         else:
             # Fallback to basic search
             result = await self.retriever.search(
-                query=query, user_level=1, limit=top_k, collection_override=collection, metadata_filter=filters
+                query=query,
+                user_level=1,
+                limit=top_k,
+                collection_override=collection,
+                metadata_filter=filters,
             )
             chunks = result.get("results", [])
 
@@ -248,16 +255,15 @@ class DatabaseQueryTool(BaseTool):
             async with self.db.acquire() as conn:
                 if query_type == "full_text":
                     # Deep Dive: Search in parent_documents
-                    # We search for title match first
+                    # Substring or fuzzy (trigram) title match, best match first
                     query = """
                         SELECT title, full_text
                         FROM parent_documents
-                        WHERE title ILIKE $1
+                        WHERE title ILIKE $1 OR title % $2
+                        ORDER BY similarity(title, $2) DESC
                         LIMIT 1
                     """
-                    # Add wildcards for fuzzy search
-                    search_pattern = f"%{search_term}%"
-                    row = await conn.fetchrow(query, search_pattern)
+                    row = await conn.fetchrow(query, like_pattern(search_term), search_term)
 
                     if row:
                         return f"Document Found: {row['title']}\n\nContent:\n{row['full_text']}"
@@ -508,6 +514,7 @@ class TeamKnowledgeTool(BaseTool):
         """Get path to team_members.json"""
         if self._data_file is None:
             from pathlib import Path
+
             # Try multiple possible locations
             possible_paths = [
                 Path(__file__).parent.parent.parent.parent / "data" / "team_members.json",
@@ -525,6 +532,7 @@ class TeamKnowledgeTool(BaseTool):
             data_file = self._get_data_file_path()
             if data_file and data_file.exists():
                 import json as json_module
+
                 with open(data_file) as f:
                     self._team_data = json_module.load(f)
             else:
@@ -572,13 +580,15 @@ class TeamKnowledgeTool(BaseTool):
 
             if query_type == "list_all":
                 members = [
-                    {"name": m["name"], "role": m["role"], "department": m["department"], "email": m["email"]}
+                    {
+                        "name": m["name"],
+                        "role": m["role"],
+                        "department": m["department"],
+                        "email": m["email"],
+                    }
                     for m in team_data
                 ]
-                return json.dumps({
-                    "total_members": len(members),
-                    "members": members
-                })
+                return json.dumps({"total_members": len(members), "members": members})
 
             elif query_type == "search_by_role":
                 # Role mapping for common variations
@@ -603,46 +613,64 @@ class TeamKnowledgeTool(BaseTool):
                     role_lower = m.get("role", "").lower()
                     dept_lower = m.get("department", "").lower()
                     if any(term in role_lower or term in dept_lower for term in search_terms):
-                        matches.append({
-                            "name": m["name"],
-                            "role": m["role"],
-                            "department": m["department"],
-                            "email": m["email"],
-                            "notes": m.get("notes", "")
-                        })
+                        matches.append(
+                            {
+                                "name": m["name"],
+                                "role": m["role"],
+                                "department": m["department"],
+                                "email": m["email"],
+                                "notes": m.get("notes", ""),
+                            }
+                        )
 
                 if matches:
                     return json.dumps({"matches": matches, "count": len(matches)})
-                return json.dumps({"matches": [], "count": 0, "message": f"No team members found with role: {search_term}"})
+                return json.dumps(
+                    {
+                        "matches": [],
+                        "count": 0,
+                        "message": f"No team members found with role: {search_term}",
+                    }
+                )
 
             elif query_type == "search_by_name":
                 matches = []
                 for m in team_data:
                     name_lower = m.get("name", "").lower()
                     if search_term_lower in name_lower or name_lower in search_term_lower:
-                        matches.append({
-                            "name": m["name"],
-                            "role": m["role"],
-                            "department": m["department"],
-                            "email": m["email"],
-                            "notes": m.get("notes", ""),
-                            "location": m.get("location", "")
-                        })
+                        matches.append(
+                            {
+                                "name": m["name"],
+                                "role": m["role"],
+                                "department": m["department"],
+                                "email": m["email"],
+                                "notes": m.get("notes", ""),
+                                "location": m.get("location", ""),
+                            }
+                        )
 
                 if matches:
                     return json.dumps({"matches": matches, "count": len(matches)})
-                return json.dumps({"matches": [], "count": 0, "message": f"No team member found with name: {search_term}"})
+                return json.dumps(
+                    {
+                        "matches": [],
+                        "count": 0,
+                        "message": f"No team member found with name: {search_term}",
+                    }
+                )
 
             elif query_type == "search_by_email":
                 for m in team_data:
                     if search_term_lower in m.get("email", "").lower():
-                        return json.dumps({
-                            "name": m["name"],
-                            "role": m["role"],
-                            "department": m["department"],
-                            "email": m["email"],
-                            "notes": m.get("notes", "")
-                        })
+                        return json.dumps(
+                            {
+                                "name": m["name"],
+                                "role": m["role"],
+                                "department": m["department"],
+                                "email": m["email"],
+                                "notes": m.get("notes", ""),
+                            }
+                        )
                 return json.dumps({"error": f"No team member found with email: {search_term}"})
 
             else:
@@ -699,7 +727,15 @@ class CRMClientsTool(BaseTool):
         }
         self.required_params = ["action"]
 
-    async def execute(self, action: str, query: str = None, client_id: int = None, status: str = None, limit: int = 20, **kwargs) -> str:
+    async def execute(
+        self,
+        action: str,
+        query: str = None,
+        client_id: int = None,
+        status: str = None,
+        limit: int = 20,
+        **kwargs,
+    ) -> str:
         """Execute CRM query based on action"""
         if not self.db_pool:
             return json.dumps({"error": "CRM database not available"})
@@ -716,7 +752,9 @@ class CRMClientsTool(BaseTool):
                     return await self._search_clients(conn, query, limit)
                 elif action == "get_details":
                     if not client_id:
-                        return json.dumps({"error": "client_id parameter required for get_details action"})
+                        return json.dumps(
+                            {"error": "client_id parameter required for get_details action"}
+                        )
                     return await self._get_client_details(conn, client_id)
                 else:
                     return json.dumps({"error": f"Unknown action: {action}"})
@@ -727,14 +765,18 @@ class CRMClientsTool(BaseTool):
 
     async def _list_clients(self, conn, status: str = None, limit: int = 20) -> str:
         """List clients with optional status filter"""
-        query_parts = ["SELECT id, uuid, full_name, email, phone, nationality, status, client_type, assigned_to, created_at, last_interaction_date FROM clients"]
+        query_parts = [
+            "SELECT id, uuid, full_name, email, phone, nationality, status, client_type, assigned_to, created_at, last_interaction_date FROM clients"
+        ]
         params = []
 
         if status:
             query_parts.append("WHERE status = $1")
             params.append(status)
 
-        query_parts.append(f"ORDER BY last_interaction_date DESC NULLS LAST, created_at DESC LIMIT ${len(params) + 1}")
+        query_parts.append(
+            f"ORDER BY last_interaction_date DESC NULLS LAST, created_at DESC LIMIT ${len(params) + 1}"
+        )
         params.append(limit)
 
         query = " ".join(query_parts)
@@ -752,42 +794,49 @@ class CRMClientsTool(BaseTool):
                 "client_type": row["client_type"],
                 "assigned_to": row["assigned_to"],
                 "created_at": row["created_at"].isoformat() if row["created_at"] else None,
-                "last_interaction_date": row["last_interaction_date"].isoformat() if row["last_interaction_date"] else None,
+                "last_interaction_date": (
+                    row["last_interaction_date"].isoformat()
+                    if row["last_interaction_date"]
+                    else None
+                ),
             }
             for row in rows
         ]
 
-        return json.dumps({
-            "success": True,
-            "action": "list",
-            "count": len(clients),
-            "clients": clients,
-            "filter_status": status,
-        })
+        return json.dumps(
+            {
+                "success": True,
+                "action": "list",
+                "count": len(clients),
+                "clients": clients,
+                "filter_status": status,
+            }
+        )
 
     async def _search_clients(self, conn, query: str, limit: int = 20) -> str:
-        """Search clients by name, email, or nationality"""
-        search_pattern = f"%{query.lower()}%"
-
+        """Search clients by name, email, or nationality (typo-tolerant on names)"""
+        # ILIKE and % (trigram similarity) are served by the trigram GIN indexes (migration 029)
         sql = """
             SELECT id, uuid, full_name, email, phone, nationality, status, client_type, assigned_to, created_at, last_interaction_date
             FROM clients
-            WHERE LOWER(full_name) LIKE $1
-               OR LOWER(email) LIKE $1
-               OR LOWER(nationality) LIKE $1
-               OR LOWER(phone) LIKE $1
+            WHERE full_name ILIKE $1
+               OR email ILIKE $1
+               OR nationality ILIKE $1
+               OR phone ILIKE $1
+               OR full_name % $2
             ORDER BY
                 CASE
                     WHEN LOWER(full_name) = LOWER($2) THEN 1
                     WHEN LOWER(email) = LOWER($2) THEN 2
-                    WHEN LOWER(full_name) LIKE $1 THEN 3
+                    WHEN full_name ILIKE $1 THEN 3
                     ELSE 4
                 END,
+                similarity(full_name, $2) DESC,
                 last_interaction_date DESC NULLS LAST
             LIMIT $3
         """
 
-        rows = await conn.fetch(sql, search_pattern, query.lower(), limit)
+        rows = await conn.fetch(sql, like_pattern(query), query, limit)
 
         clients = [
             {
@@ -801,18 +850,24 @@ class CRMClientsTool(BaseTool):
                 "client_type": row["client_type"],
                 "assigned_to": row["assigned_to"],
                 "created_at": row["created_at"].isoformat() if row["created_at"] else None,
-                "last_interaction_date": row["last_interaction_date"].isoformat() if row["last_interaction_date"] else None,
+                "last_interaction_date": (
+                    row["last_interaction_date"].isoformat()
+                    if row["last_interaction_date"]
+                    else None
+                ),
             }
             for row in rows
         ]
 
-        return json.dumps({
-            "success": True,
-            "action": "search",
-            "query": query,
-            "count": len(clients),
-            "clients": clients,
-        })
+        return json.dumps(
+            {
+                "success": True,
+                "action": "search",
+                "query": query,
+                "count": len(clients),
+                "clients": clients,
+            }
+        )
 
     async def _get_client_details(self, conn, client_id: int) -> str:
         """Get detailed information about a specific client including practices"""
@@ -825,7 +880,7 @@ class CRMClientsTool(BaseTool):
             FROM clients
             WHERE id = $1
             """,
-            client_id
+            client_id,
         )
 
         if not client_row:
@@ -843,7 +898,7 @@ class CRMClientsTool(BaseTool):
             ORDER BY p.start_date DESC
             LIMIT 20
             """,
-            client_id
+            client_id,
         )
 
         practices = [
@@ -855,7 +910,9 @@ class CRMClientsTool(BaseTool):
                 "category": row["category"],
                 "status": row["practice_status"],
                 "start_date": row["start_date"].isoformat() if row["start_date"] else None,
-                "completion_date": row["completion_date"].isoformat() if row["completion_date"] else None,
+                "completion_date": (
+                    row["completion_date"].isoformat() if row["completion_date"] else None
+                ),
                 "total_cost": float(row["total_cost"]) if row["total_cost"] else None,
                 "currency": row["currency"],
                 "notes": row["practice_notes"],
@@ -875,24 +932,38 @@ class CRMClientsTool(BaseTool):
             "status": client_row["status"],
             "client_type": client_row["client_type"],
             "assigned_to": client_row["assigned_to"],
-            "first_contact_date": client_row["first_contact_date"].isoformat() if client_row["first_contact_date"] else None,
-            "last_interaction_date": client_row["last_interaction_date"].isoformat() if client_row["last_interaction_date"] else None,
+            "first_contact_date": (
+                client_row["first_contact_date"].isoformat()
+                if client_row["first_contact_date"]
+                else None
+            ),
+            "last_interaction_date": (
+                client_row["last_interaction_date"].isoformat()
+                if client_row["last_interaction_date"]
+                else None
+            ),
             "address": client_row["address"],
             "notes": client_row["notes"],
             "tags": client_row["tags"] or [],
             "custom_fields": client_row["custom_fields"] or {},
-            "created_at": client_row["created_at"].isoformat() if client_row["created_at"] else None,
-            "updated_at": client_row["updated_at"].isoformat() if client_row["updated_at"] else None,
+            "created_at": (
+                client_row["created_at"].isoformat() if client_row["created_at"] else None
+            ),
+            "updated_at": (
+                client_row["updated_at"].isoformat() if client_row["updated_at"] else None
+            ),
             "created_by": client_row["created_by"],
             "practices_count": len(practices),
             "practices": practices,
         }
 
-        return json.dumps({
-            "success": True,
-            "action": "get_details",
-            "client": client_data,
-        })
+        return json.dumps(
+            {
+                "success": True,
+                "action": "get_details",
+                "client": client_data,
+            }
+        )
 
     def to_gemini_function_declaration(self) -> dict:
         """Convert to Gemini function calling format"""
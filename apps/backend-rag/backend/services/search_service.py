@@ -13,7 +13,6 @@ REFACTORED: Split into focused services following Single Responsibility Principl
 This service now handles ONLY core search logic with proper delegation.
 """
 
-import asyncio
 import logging
 import time
 from typing import Any
@@ -124,6 +123,7 @@ class SearchService:
         from core.embeddings import create_embeddings_generator
 
         self.embedder = create_embeddings_generator()
+        self._async_embedder = None
         logger.info(
             f"✅ EmbeddingsGenerator ready: {self.embedder.provider} ({self.embedder.dimensions} dims)"
         )
@@ -132,12 +132,14 @@ class SearchService:
         self._bm25_vectorizer = None
         if settings.enable_bm25:
             try:
+                from core.bm25_stats import get_bm25_corpus_stats
                 from core.bm25_vectorizer import BM25Vectorizer
 
                 self._bm25_vectorizer = BM25Vectorizer(
                     vocab_size=settings.bm25_vocab_size,
                     k1=settings.bm25_k1,
                     b=settings.bm25_b,
+                    corpus_stats=get_bm25_corpus_stats(),
                 )
                 logger.info("✅ BM25Vectorizer ready for hybrid search")
             except Exception as e:
@@ -189,7 +191,18 @@ class SearchService:
         """Access to CulturalInsightsService (public API)."""
         return self._cultural_insights
 
-    def _prepare_search_context(
+    @property
+    def async_embedder(self):
+        """Async, coalescing front-end over self.embedder (rebuilt if embedder is swapped)."""
+        from core.embeddings import AsyncEmbeddingService
+
+        async_embedder = getattr(self, "_async_embedder", None)
+        if async_embedder is None or async_embedder.embedder is not self.embedder:
+            async_embedder = AsyncEmbeddingService(self.embedder)
+            self._async_embedder = async_embedder
+        return async_embedder
+
+    async def _prepare_search_context(
         self,
         query: str,
         user_level: int,
@@ -226,8 +239,8 @@ class SearchService:
         if user_level < 0 or user_level > 3:
             raise ValueError(f"User level must be between 0 and 3, got {user_level}")
 
-        # Generate query embedding
-        query_embedding = self.embedder.generate_query_embedding(query)
+        # Generate query embedding (off the event loop, coalesced with concurrent queries)
+        query_embedding = await self.async_embedder.embed_query(query)
 
         # Validate embedding was generated
         if not query_embedding or len(query_embedding) == 0:
@@ -304,7 +317,7 @@ class SearchService:
                 vector_db,
                 chroma_filter,
                 tier_values,
-            ) = self._prepare_search_context(
+            ) = await self._prepare_search_context(
                 query, user_level, tier_filter, collection_override, apply_filters
             )
             if METRICS_AVAILABLE and embedding_start:
@@ -359,11 +372,11 @@ class SearchService:
     def _init_reranker(self):
         """Lazy load the re-ranker"""
         if not hasattr(self, "_reranker"):
-            from core.reranker import ReRanker
+            from core.reranker import create_reranker
 
-            self._reranker = ReRanker()
+            self._reranker = create_reranker()
             logger.info(
-                f"🔧 ReRanker initialized: enabled={self._reranker.enabled}, url={self._reranker.api_url}"
+                f"🔧 ReRanker initialized: backend={self._reranker.name}, enabled={self._reranker.enabled}"
             )
         return self._reranker
 
@@ -441,6 +454,36 @@ class SearchService:
 
         return results
 
+    def _sparse_query_for(
+        self, query: str, vector_db: Any, limit: int
+    ) -> tuple[dict[str, Any] | None, int]:
+        """
+        BM25 query vector and fusion prefetch size for one collection.
+
+        Args:
+            query: Search query
+            vector_db: Collection client the query will run against
+            limit: Max results
+
+        Returns:
+            (sparse vector or None if BM25 is disabled, prefetch limit)
+        """
+        if not self._bm25_vectorizer:
+            return None, limit * 3
+
+        # Corpus statistics are keyed by the physical Qdrant collection (aliases resolved)
+        stats_collection = vector_db.collection_name
+        query_sparse = self._bm25_vectorizer.generate_query_sparse_vector(
+            query, collection=stats_collection
+        )
+        idf_weighted = self._bm25_vectorizer.has_corpus_stats(stats_collection)
+        logger.debug(
+            f"Generated BM25 sparse vector: {len(query_sparse.get('indices', []))} tokens "
+            f"(idf={idf_weighted})"
+        )
+        # Get more candidates for fusion; IDF-weighted sparse ranking needs less
+        return query_sparse, limit * (2 if idf_weighted else 3)
+
     async def hybrid_search(
         self,
         query: str,
@@ -476,19 +519,14 @@ class SearchService:
                 vector_db,
                 chroma_filter,
                 tier_values,
-            ) = self._prepare_search_context(
+            ) = await self._prepare_search_context(
                 query, user_level, tier_filter, collection_override, apply_filters
             )
             if METRICS_AVAILABLE and embedding_start:
                 rag_embedding_duration.observe(time.time() - embedding_start)
 
             # Generate BM25 sparse vector
-            query_sparse = None
-            if self._bm25_vectorizer:
-                query_sparse = self._bm25_vectorizer.generate_query_sparse_vector(query)
-                logger.debug(
-                    f"Generated BM25 sparse vector: {len(query_sparse.get('indices', []))} tokens"
-                )
+            query_sparse, prefetch_limit = self._sparse_query_for(query, vector_db, limit)
 
             # Try hybrid search if available
             search_start = time.time() if METRICS_AVAILABLE else None
@@ -498,7 +536,7 @@ class SearchService:
                     query_sparse=query_sparse,
                     filter=chroma_filter,
                     limit=limit,
-                    prefetch_limit=limit * 3,  # Get more candidates for fusion
+                    prefetch_limit=prefetch_limit,
                 )
                 search_type = raw_results.get("search_type", "hybrid_rrf")
             else:
@@ -641,7 +679,7 @@ class SearchService:
         Implements the Supreme Knowledge Architecture's conflict resolution pipeline:
         1. Intelligent routing: Classify query and determine primary collection
         2. Fallback chains: Add secondary collections based on confidence
-        3. Parallel search: Query all relevant collections concurrently
+        3. Batched search: Query all relevant collections (dense + BM25) in one round-trip
         4. Conflict detection: Identify contradicting or outdated information
         5. Resolution: Apply timestamp-based and semantic deduplication
         6. Merge & rank: Combine results with score-based ordering
@@ -675,7 +713,7 @@ class SearchService:
             - Pricing queries: Single collection (bali_zero_pricing), no fallbacks
             - Health tracking: Records metrics for all collections searched
             - Error handling: Falls back to simple search on failure
-            - Performance: ~200-500ms for 3 collections (parallel execution)
+            - Performance: one batched Qdrant round-trip regardless of collection count
 
         Example:
             >>> results = await search_service.search_with_conflict_resolution(
@@ -693,7 +731,7 @@ class SearchService:
             self.conflict_stats["total_multi_collection_searches"] += 1
 
             # Generate query embedding once (reuse for all collections)
-            query_embedding = self.embedder.generate_query_embedding(query)
+            query_embedding = await self.async_embedder.embed_query(query)
 
             # Route query with fallbacks (using QueryRouterIntegration)
             routing_info = self.query_router.route_query(
@@ -712,22 +750,24 @@ class SearchService:
                     f"Total collections: {len(collections_to_search)}"
                 )
 
-            # Search all collections in parallel using asyncio.gather
-            async def search_single_collection(collection_name: str) -> tuple[str, list]:
-                """
-                Search a single collection and format results.
-
-                Applies tier filters, searches collection, and formats results.
-                """
+            # Determine allowed tiers (only used for zantara_books)
+            allowed_tiers = self.LEVEL_TO_TIERS.get(user_level, [])
+            if tier_filter:
+                allowed_tiers = [t for t in allowed_tiers if t in tier_filter]
+
+            # Build one search per collection; they are sent as batch requests
+            # (one per physical collection) multiplexed in a single round-trip
+            batch_client = None
+            searches = []
+            searched_collections = []
+            search_results = []
+            for collection_name in collections_to_search:
                 vector_db = self.collection_manager.get_collection(collection_name)
                 if not vector_db:
                     logger.warning(f"⚠️ Collection not found: {collection_name}, skipping")
-                    return collection_name, []
-
-                # Determine allowed tiers (only for zantara_books)
-                allowed_tiers = self.LEVEL_TO_TIERS.get(user_level, [])
-                if tier_filter:
-                    allowed_tiers = [t for t in allowed_tiers if t in tier_filter]
+                    search_results.append((collection_name, []))
+                    continue
+                batch_client = batch_client or vector_db
 
                 # Build filter (only for zantara_books)
                 tier_filter_dict = None
@@ -739,38 +779,45 @@ class SearchService:
                 chroma_filter = build_search_filter(
                     tier_filter=tier_filter_dict, exclude_repealed=True
                 )
-
-                # Search this collection (async) - track duration
+                search = {
+                    "collection": vector_db.collection_name,
+                    "query_embedding": query_embedding,
+                    "filter": chroma_filter,
+                    "limit": limit,
+                }
+                query_sparse, prefetch_limit = self._sparse_query_for(query, vector_db, limit)
+                if query_sparse:
+                    search.update(query_sparse=query_sparse, prefetch_limit=prefetch_limit)
+                searches.append(search)
+                searched_collections.append(collection_name)
+
+            # Execute all searches in one batched round-trip (track parallel execution)
+            if METRICS_AVAILABLE:
+                rag_parallel_searches.inc(len(searches))
+            if searches:
                 search_start = time.time() if METRICS_AVAILABLE else None
-                raw_results = await vector_db.search(
-                    query_embedding=query_embedding, filter=chroma_filter, limit=limit
-                )
+                if self._bm25_vectorizer:
+                    # Dense + BM25 prefetch of every collection in the same round-trip
+                    raw_batches = await batch_client.hybrid_search_batch(searches)
+                else:
+                    raw_batches = await batch_client.search_batch(searches)
                 if METRICS_AVAILABLE and search_start:
                     rag_vector_search_duration.observe(time.time() - search_start)
 
-                # Format results using helper method
-                formatted_results = format_search_results(
-                    raw_results, collection_name, primary_collection=primary_collection
-                )
-
-                return collection_name, formatted_results
-
-            # Execute all searches in parallel (track parallel execution)
-            if METRICS_AVAILABLE:
-                rag_parallel_searches.inc(len(collections_to_search))
-            search_tasks = [search_single_collection(coll) for coll in collections_to_search]
-            search_results = await asyncio.gather(*search_tasks, return_exceptions=True)
+                for collection_name, raw_results in zip(
+                    searched_collections, raw_batches, strict=True
+                ):
+                    # Format results using helper method
+                    formatted_results = format_search_results(
+                        raw_results, collection_name, primary_collection=primary_collection
+                    )
+                    search_results.append((collection_name, formatted_results))
 
             # Process results and collect health metrics for batch recording
             results_by_collection = {}
             health_metrics = []
 
-            for result in search_results:
-                if isinstance(result, Exception):
-                    logger.error(f"Search task failed: {result}")
-                    continue
-                collection_name, formatted_results = result
-
+            for collection_name, formatted_results in search_results:
                 if formatted_results:
                     results_by_collection[collection_name] = formatted_results
                     logger.info(
@@ -802,6 +849,20 @@ class SearchService:
             if health_metrics:
                 self.health_monitor.record_queries_batch(health_metrics)
 
+            # Re-rank every collection in one batched call so scores are comparable
+            # across collections before conflict resolution
+            reranker = self._init_reranker()
+            if reranker.enabled and results_by_collection:
+                rerank_start = time.time() if METRICS_AVAILABLE else None
+                collection_names = list(results_by_collection.keys())
+                reranked_groups = await reranker.rerank_many(
+                    [(query, results_by_collection[name]) for name in collection_names],
+                    top_k=limit,
+                )
+                if METRICS_AVAILABLE and rerank_start:
+                    rag_reranking_duration.observe(time.time() - rerank_start)
+                results_by_collection = dict(zip(collection_names, reranked_groups, strict=True))
+
             # Detect conflicts (delegate to ConflictResolver)
             conflicts = self.conflict_resolver.detect_conflicts(results_by_collection)
 
@@ -909,7 +970,7 @@ class SearchService:
         """
         try:
             # Generate embedding
-            query_embedding = self.embedder.generate_query_embedding(query)
+            query_embedding = await self.async_embedder.embed_query(query)
 
             # Get client (lazy loading)
             client = self.collection_manager.get_collection(collection_name)
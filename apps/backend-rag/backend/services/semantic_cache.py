@@ -7,6 +7,8 @@ Features:
 - Similarity-based cache lookup (cosine similarity)
 - TTL-based expiration
 - LRU eviction policy
+- In-process matrix of normalized embeddings (one matrix-vector product per lookup),
+  kept in sync with Redis through a version counter
 
 Performance Impact:
 - Latency: 800ms → 150ms (-81%)
@@ -51,6 +53,14 @@ class SemanticCache:
         self.max_cache_size = max_cache_size
         self.cache_prefix = "semantic_cache:"
         self.embedding_prefix = "embedding:"
+        self.index_key = f"{self.cache_prefix}index"
+        self.version_key = f"{self.cache_prefix}index_version"
+
+        # In-process ANN index: one pre-normalized float32 matrix per embedding dimension
+        # (hash-fallback and real embeddings may differ in size). _index_version mirrors the
+        # Redis counter that every write/eviction bumps; None means "never loaded".
+        self._index: dict[int, tuple[list[str], np.ndarray]] = {}
+        self._index_version: int | None = None
 
     async def get_cached_result(
         self, query: str, query_embedding: np.ndarray | None = None
@@ -127,13 +137,15 @@ class SemanticCache:
             await self.redis.setex(cache_key, ttl, json.dumps(result_data))
 
             # Store embedding (as binary for efficiency)
-            embedding_bytes = query_embedding.tobytes()
-            await self.redis.setex(embedding_key, ttl, embedding_bytes)
+            embedding = np.asarray(query_embedding, dtype=np.float32).ravel()
+            await self.redis.setex(embedding_key, ttl, embedding.tobytes())
 
             # Add to embeddings index (sorted set by timestamp for LRU)
-            await self.redis.zadd(
-                f"{self.cache_prefix}index", {embedding_key: datetime.now().timestamp()}
-            )
+            await self.redis.zadd(self.index_key, {embedding_key: datetime.now().timestamp()})
+
+            # Bump the index version; apply locally if no other writer got in between
+            new_version = await self.redis.incr(self.version_key)
+            self._apply_local_add(embedding_key, embedding, new_version)
 
             # Enforce max cache size (LRU eviction)
             await self._enforce_cache_size()
@@ -149,6 +161,11 @@ class SemanticCache:
         """
         Find cached query with similar embedding
 
+        Scores the query against the in-process matrix with a single matrix-vector
+        product. In steady state a lookup costs one Redis round-trip: a GET of the
+        index version on a miss, or an MGET of (version, cached data) on a hit. The
+        matrix is only reloaded when the version has moved.
+
         Args:
             query_embedding: Query embedding to compare
 
@@ -156,49 +173,151 @@ class SemanticCache:
             Dict with cached data and similarity score, or None
         """
         try:
-            # Get all embedding keys from index
-            embedding_keys = await self.redis.zrange(f"{self.cache_prefix}index", 0, -1)
-
-            if not embedding_keys:
+            query = self._normalize(query_embedding)
+            if query is None:
                 return None
 
-            best_match = None
-            best_similarity = 0.0
-
-            # Compare with cached embeddings
-            for embedding_key in embedding_keys:
-                # Get cached embedding
-                cached_embedding_bytes = await self.redis.get(embedding_key)
-                if not cached_embedding_bytes:
-                    continue
-
-                # Convert bytes back to numpy array
-                cached_embedding = np.frombuffer(cached_embedding_bytes, dtype=np.float32)
-
-                # Calculate cosine similarity
-                similarity = self._cosine_similarity(query_embedding, cached_embedding)
-
-                # Track best match
-                if similarity > best_similarity:
-                    best_similarity = similarity
-                    best_match = embedding_key
+            match = self._best_match(query) if self._index_version is not None else None
+            if match is None:
+                # Miss on local index - only reload if Redis has newer entries
+                remote_version = self._parse_version(await self.redis.get(self.version_key))
+                if remote_version == self._index_version:
+                    return None
+                await self._refresh_index(remote_version)
+                match = self._best_match(query)
+                if match is None:
+                    return None
+                cached_data = await self.redis.get(self._to_cache_key(match[0]))
+            else:
+                raw_version, cached_data = await self.redis.mget(
+                    [self.version_key, self._to_cache_key(match[0])]
+                )
+                remote_version = self._parse_version(raw_version)
+                if remote_version != self._index_version:
+                    # Index moved under us (eviction/new entries) - reload and re-score
+                    await self._refresh_index(remote_version)
+                    match = self._best_match(query)
+                    if match is None:
+                        return None
+                    cached_data = await self.redis.get(self._to_cache_key(match[0]))
+
+            if cached_data:
+                result = json.loads(cached_data)
+                return {"data": result, "similarity": match[1]}
+
+            # Matched entry expired by TTL - drop it on the next reload
+            self._index_version = None
+            return None
 
-            # If best match exceeds threshold, return cached result
-            if best_similarity >= self.similarity_threshold:
-                # Get cache key from embedding key
-                cache_key = best_match.decode() if isinstance(best_match, bytes) else best_match
-                cache_key = cache_key.replace(self.embedding_prefix, self.cache_prefix)
-                cached_data = await self.redis.get(cache_key)
+        except Exception as e:
+            logger.error(f"[Cache] Error finding similar query: {e}")
+            return None
 
-                if cached_data:
-                    result = json.loads(cached_data)
-                    return {"data": result, "similarity": best_similarity}
+    async def _refresh_index(self, version: int | None = None) -> None:
+        """
+        Rebuild the in-process matrix from Redis (ZRANGE + one MGET, never per-key GETs).
 
+        Args:
+            version: Index version read before the reload (read from Redis if None)
+        """
+        if version is None:
+            version = self._parse_version(await self.redis.get(self.version_key))
+
+        raw_keys = await self.redis.zrange(self.index_key, 0, -1)
+        keys = [k.decode() if isinstance(k, bytes) else k for k in raw_keys or []]
+        vectors = await self.redis.mget(keys) if keys else []
+
+        by_dim: dict[int, tuple[list[str], list[np.ndarray]]] = {}
+        for key, raw in zip(keys, vectors, strict=True):
+            if not raw:
+                continue  # Expired by TTL
+            vector = self._normalize(np.frombuffer(raw, dtype=np.float32))
+            if vector is None:
+                continue
+            dim_keys, dim_vectors = by_dim.setdefault(vector.shape[0], ([], []))
+            dim_keys.append(key)
+            dim_vectors.append(vector)
+
+        self._index = {
+            dim: (dim_keys, np.vstack(dim_vectors))
+            for dim, (dim_keys, dim_vectors) in by_dim.items()
+        }
+        self._index_version = version
+        logger.debug(
+            f"[Cache] Reloaded semantic index: {sum(len(k) for k, _ in self._index.values())} "
+            f"entries (version {version})"
+        )
+
+    def _best_match(self, query: np.ndarray) -> tuple[str, float] | None:
+        """Return (embedding_key, similarity) of the best entry above threshold, if any."""
+        entry = self._index.get(query.shape[0])
+        if entry is None:
             return None
+        keys, matrix = entry
+        similarities = matrix @ query
+        best = int(np.argmax(similarities))
+        best_similarity = float(similarities[best])
+        if best_similarity >= self.similarity_threshold:
+            return keys[best], best_similarity
+        return None
+
+    def _apply_local_add(self, embedding_key: str, embedding: np.ndarray, new_version: Any) -> None:
+        """Append a freshly written entry to the local matrix when versions line up."""
+        new_version = self._parse_version(new_version)
+        if self._index_version is None or new_version != self._index_version + 1:
+            self._index_version = None  # Another writer interleaved - reload on next lookup
+            return
+        vector = self._normalize(embedding)
+        if vector is not None:
+            keys, matrix = self._index.get(vector.shape[0], ([], None))
+            if embedding_key in keys:
+                row = keys.index(embedding_key)
+                matrix = matrix.copy()
+                matrix[row] = vector
+            else:
+                keys = [*keys, embedding_key]
+                matrix = vector[None, :] if matrix is None else np.vstack([matrix, vector])
+            self._index[vector.shape[0]] = (keys, matrix)
+        self._index_version = new_version
+
+    def _apply_local_remove(self, embedding_keys: list[str], new_version: Any) -> None:
+        """Drop evicted entries from the local matrix when versions line up."""
+        new_version = self._parse_version(new_version)
+        if self._index_version is None or new_version != self._index_version + 1:
+            self._index_version = None  # Another writer interleaved - reload on next lookup
+            return
+        evicted = set(embedding_keys)
+        for dim, (keys, matrix) in list(self._index.items()):
+            kept = [row for row, key in enumerate(keys) if key not in evicted]
+            if len(kept) == len(keys):
+                continue
+            if kept:
+                self._index[dim] = ([keys[row] for row in kept], matrix[kept])
+            else:
+                del self._index[dim]
+        self._index_version = new_version
 
-        except Exception as e:
-            logger.error(f"[Cache] Error finding similar query: {e}")
+    @staticmethod
+    def _normalize(vector: Any) -> np.ndarray | None:
+        """Convert to a unit-length float32 vector (None for empty/zero vectors)."""
+        vector = np.asarray(vector, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(vector)) if vector.size else 0.0
+        if norm == 0.0:
             return None
+        return vector / norm
+
+    @staticmethod
+    def _parse_version(raw: Any) -> int:
+        """Parse the Redis version counter (missing key = 0)."""
+        if raw is None:
+            return 0
+        if isinstance(raw, bytes):
+            raw = raw.decode()
+        return int(raw)
+
+    def _to_cache_key(self, embedding_key: str) -> str:
+        """Map an embedding key to its result key."""
+        return embedding_key.replace(self.embedding_prefix, self.cache_prefix, 1)
 
     @staticmethod
     def _cosine_similarity(vec1: np.ndarray, vec2: np.ndarray) -> float:
@@ -216,27 +335,31 @@ class SemanticCache:
         return f"{self.embedding_prefix}{query_hash}"
 
     async def _enforce_cache_size(self):
-        """Enforce max cache size using LRU eviction"""
+        """Enforce max cache size using LRU eviction (one pipelined batch)"""
         try:
             # Get cache size
-            cache_size = await self.redis.zcard(f"{self.cache_prefix}index")
+            cache_size = await self.redis.zcard(self.index_key)
 
             # If over limit, remove oldest entries
             if cache_size > self.max_cache_size:
                 num_to_remove = cache_size - self.max_cache_size
-                oldest_keys = await self.redis.zrange(
-                    f"{self.cache_prefix}index", 0, num_to_remove - 1
-                )
+                oldest_keys = await self.redis.zrange(self.index_key, 0, num_to_remove - 1)
+                if not oldest_keys:
+                    return
+
+                embedding_keys = [k.decode() if isinstance(k, bytes) else k for k in oldest_keys]
+                cache_keys = [self._to_cache_key(k) for k in embedding_keys]
+
+                pipe = self.redis.pipeline(transaction=False)
+                pipe.delete(*embedding_keys, *cache_keys)
+                pipe.zrem(self.index_key, *embedding_keys)
+                pipe.incr(self.version_key)
+                results = await pipe.execute()
 
-                # Remove oldest entries
-                for key in oldest_keys:
-                    key_str = key.decode() if isinstance(key, bytes) else key
-                    cache_key = key_str.replace(self.embedding_prefix, self.cache_prefix)
-                    await self.redis.delete(key)
-                    await self.redis.delete(cache_key)
-                    await self.redis.zrem(f"{self.cache_prefix}index", key)
+                # Drop evicted rows locally; reload only if another writer interleaved
+                self._apply_local_remove(embedding_keys, results[-1])
 
-                logger.info(f"🗑️ [Cache] Evicted {num_to_remove} oldest entries (LRU)")
+                logger.info(f"🗑️ [Cache] Evicted {len(embedding_keys)} oldest entries (LRU)")
 
         except Exception as e:
             logger.error(f"[Cache] Error enforcing cache size: {e}")
@@ -244,13 +367,14 @@ class SemanticCache:
     async def get_cache_stats(self) -> dict[str, Any]:
         """Get cache statistics"""
         try:
-            cache_size = await self.redis.zcard(f"{self.cache_prefix}index")
+            cache_size = await self.redis.zcard(self.index_key)
             return {
                 "cache_size": cache_size,
                 "max_cache_size": self.max_cache_size,
                 "utilization": f"{(cache_size / self.max_cache_size) * 100:.1f}%",
                 "similarity_threshold": self.similarity_threshold,
                 "default_ttl": self.default_ttl,
+                "local_index_entries": sum(len(keys) for keys, _ in self._index.values()),
             }
         except Exception as e:
             logger.error(f"[Cache] Error getting stats: {e}")
@@ -262,10 +386,17 @@ class SemanticCache:
             # Get all keys
             keys = await self.redis.keys(f"{self.cache_prefix}*")
             keys += await self.redis.keys(f"{self.embedding_prefix}*")
+            # Keep the version counter monotonic so other workers notice the clear
+            keys = [
+                k for k in keys if (k.decode() if isinstance(k, bytes) else k) != self.version_key
+            ]
 
             # Delete all
             if keys:
                 await self.redis.delete(*keys)
+                await self.redis.incr(self.version_key)
+            self._index = {}
+            self._index_version = None
 
             logger.info(f"🗑️ [Cache] Cleared {len(keys)} cached entries")
 
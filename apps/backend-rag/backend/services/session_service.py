@@ -11,12 +11,17 @@ Date: November 5, 2025
 import json
 import logging
 import uuid
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
 
 import redis.asyncio as redis
+from redis.exceptions import ResponseError
 
 logger = logging.getLogger(__name__)
 
+HISTORY_PREFIX = "session:"  # List of JSON-encoded messages
+META_PREFIX = "session_meta:"  # Hash: message_count, created_at, updated_at
+ANALYTICS_BATCH_SIZE = 500  # Counter reads per pipeline in get_analytics
+
 
 class SessionService:
     """
@@ -25,17 +30,20 @@ class SessionService:
     Features:
     - Create/Read/Update/Delete sessions
     - 24-hour TTL with auto-extension on activity
-    - JSON serialization of conversation history
+    - History stored as a Redis list (one JSON message per entry): turns are
+      appended with RPUSH + LTRIM instead of rewriting the whole history
+    - Per-session counters in a small hash, so analytics never decode histories
     - Automatic cleanup of expired sessions
     """
 
-    def __init__(self, redis_url: str, ttl_hours: int = 24):
+    def __init__(self, redis_url: str, ttl_hours: int = 24, max_messages: int = 500):
         """
         Initialize SessionService
 
         Args:
             redis_url: Redis connection URL (e.g., redis://host:port)
             ttl_hours: Session expiry time in hours (default: 24)
+            max_messages: Messages kept per session; older ones are trimmed (default: 500)
         """
         try:
             self.redis = redis.from_url(
@@ -46,11 +54,92 @@ class SessionService:
                 socket_timeout=5,
             )
             self.ttl = timedelta(hours=ttl_hours)
+            self.max_messages = max_messages
             logger.info(f"✅ SessionService initialized with {ttl_hours}h TTL")
         except Exception as e:
             logger.error(f"❌ Failed to initialize SessionService: {e}")
             raise
 
+    @staticmethod
+    def _history_key(session_id: str) -> str:
+        return f"{HISTORY_PREFIX}{session_id}"
+
+    @staticmethod
+    def _meta_key(session_id: str) -> str:
+        return f"{META_PREFIX}{session_id}"
+
+    def _queue_touch(self, pipe, session_id: str, ttl: timedelta) -> None:
+        """Queue the updated_at stamp and TTL refresh of both session keys."""
+        meta_key = self._meta_key(session_id)
+        now = datetime.now(timezone.utc).isoformat()
+        pipe.hsetnx(meta_key, "created_at", now)
+        pipe.hset(meta_key, "updated_at", now)
+        pipe.expire(self._history_key(session_id), ttl)
+        pipe.expire(meta_key, ttl)
+
+    async def _append(self, session_id: str, messages: list, ttl: timedelta) -> None:
+        """Append messages, trim to max_messages and refresh TTLs in one transaction."""
+        key = self._history_key(session_id)
+        pipe = self.redis.pipeline(transaction=True)
+        if messages:
+            pipe.rpush(key, *(json.dumps(msg, ensure_ascii=False) for msg in messages))
+            pipe.ltrim(key, -self.max_messages, -1)
+            pipe.hincrby(self._meta_key(session_id), "message_count", len(messages))
+        self._queue_touch(pipe, session_id, ttl)
+        await pipe.execute()
+
+    async def _replace(self, session_id: str, history: list, ttl: timedelta) -> None:
+        """Overwrite the stored history in one transaction."""
+        key = self._history_key(session_id)
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.delete(key)
+        kept = history[-self.max_messages :]
+        if kept:
+            pipe.rpush(key, *(json.dumps(msg, ensure_ascii=False) for msg in kept))
+        pipe.hset(self._meta_key(session_id), "message_count", len(history))
+        self._queue_touch(pipe, session_id, ttl)
+        await pipe.execute()
+
+    async def _store_history(self, session_id: str, history: list, ttl: timedelta) -> None:
+        """
+        Store a full history sent by the client.
+
+        When it extends the stored list (same length prefix ending in the stored
+        last message) only the new messages are appended; otherwise the list is
+        replaced.
+        """
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.llen(self._history_key(session_id))
+        pipe.lindex(self._history_key(session_id), -1)
+        try:
+            stored_len, last = await pipe.execute()
+        except ResponseError:
+            stored_len, last = 0, None  # Legacy JSON string value, rewritten below
+
+        if (
+            stored_len
+            and len(history) >= stored_len
+            and json.loads(last) == history[stored_len - 1]
+        ):
+            await self._append(session_id, history[stored_len:], ttl)
+        else:
+            await self._replace(session_id, history, ttl)
+
+    async def _migrate_legacy(self, session_id: str) -> list[dict] | None:
+        """Convert a session stored as one JSON string (pre-list format) in place."""
+        try:
+            data = await self.redis.get(self._history_key(session_id))
+        except ResponseError:
+            return None  # Already a list
+        if not data:
+            return None
+        history = json.loads(data)
+        if not isinstance(history, list):
+            return None
+        await self._replace(session_id, history, self.ttl)
+        logger.info(f"🔄 Migrated session {session_id} to list storage ({len(history)} messages)")
+        return history
+
     async def health_check(self) -> bool:
         """Check if Redis connection is healthy"""
         try:
@@ -69,31 +158,43 @@ class SessionService:
         """
         session_id = str(uuid.uuid4())
         try:
-            # Initialize with empty history
-            await self.redis.setex(f"session:{session_id}", self.ttl, json.dumps([]))
+            # An empty Redis list does not exist, so the counters hash marks the session
+            pipe = self.redis.pipeline(transaction=True)
+            pipe.hset(self._meta_key(session_id), "message_count", 0)
+            self._queue_touch(pipe, session_id, self.ttl)
+            await pipe.execute()
             logger.info(f"🆕 Created session: {session_id}")
             return session_id
         except Exception as e:
             logger.error(f"❌ Failed to create session: {e}")
             raise
 
-    async def get_history(self, session_id: str) -> list[dict] | None:
+    async def get_history(self, session_id: str, limit: int | None = None) -> list[dict] | None:
         """
         Get conversation history for a session
 
         Args:
             session_id: Session UUID
+            limit: Return only the last N messages (default: all)
 
         Returns:
             List[Dict] or None if session not found/expired
         """
         try:
-            data = await self.redis.get(f"session:{session_id}")
-            if not data:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.exists(self._meta_key(session_id))
+            pipe.lrange(self._history_key(session_id), -limit if limit else 0, -1)
+            try:
+                exists, raw = await pipe.execute()
+            except ResponseError:
+                history = await self._migrate_legacy(session_id)
+                return history[-limit:] if history and limit else history
+
+            if not exists and not raw:
                 logger.warning(f"⚠️ Session not found or expired: {session_id}")
                 return None
 
-            history = json.loads(data)
+            history = [json.loads(item) for item in raw]
             logger.info(f"📚 Retrieved {len(history)} messages from session {session_id}")
             return history
         except json.JSONDecodeError as e:
@@ -120,14 +221,46 @@ class SessionService:
                 logger.error(f"❌ Invalid history format: expected list, got {type(history)}")
                 return False
 
-            # Serialize and save
-            await self.redis.setex(f"session:{session_id}", self.ttl, json.dumps(history))
+            await self._store_history(session_id, history, self.ttl)
             logger.info(f"💾 Updated session {session_id} with {len(history)} messages")
             return True
         except Exception as e:
             logger.error(f"❌ Failed to update session: {e}")
             return False
 
+    async def append_messages(self, session_id: str, messages: list[dict]) -> bool:
+        """
+        Append messages to a session's history
+
+        Args:
+            session_id: Session UUID
+            messages: New conversation messages [{role, content}, ...]
+
+        Returns:
+            bool: True if successful
+        """
+        try:
+            if not isinstance(messages, list):
+                logger.error(f"❌ Invalid messages format: expected list, got {type(messages)}")
+                return False
+
+            await self._append(session_id, messages, self.ttl)
+            logger.info(f"💾 Appended {len(messages)} messages to session {session_id}")
+            return True
+        except ResponseError:
+            # Legacy JSON string value: convert it, then append
+            try:
+                if await self._migrate_legacy(session_id) is None:
+                    return False
+                await self._append(session_id, messages, self.ttl)
+                return True
+            except Exception as e:
+                logger.error(f"❌ Failed to append to session: {e}")
+                return False
+        except Exception as e:
+            logger.error(f"❌ Failed to append to session: {e}")
+            return False
+
     async def delete_session(self, session_id: str) -> bool:
         """
         Delete a session
@@ -139,7 +272,9 @@ class SessionService:
             bool: True if session existed and was deleted
         """
         try:
-            deleted = await self.redis.delete(f"session:{session_id}")
+            deleted = await self.redis.delete(
+                self._history_key(session_id), self._meta_key(session_id)
+            )
             if deleted > 0:
                 logger.info(f"🗑️ Deleted session: {session_id}")
                 return True
@@ -150,6 +285,13 @@ class SessionService:
             logger.error(f"❌ Failed to delete session: {e}")
             return False
 
+    async def _expire(self, session_id: str, ttl: timedelta) -> bool:
+        """Set the TTL of both session keys; True if the session exists."""
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.expire(self._history_key(session_id), ttl)
+        pipe.expire(self._meta_key(session_id), ttl)
+        return any(await pipe.execute())
+
     async def extend_ttl(self, session_id: str) -> bool:
         """
         Extend session TTL (reset to full TTL duration)
@@ -164,7 +306,7 @@ class SessionService:
             bool: True if TTL was extended
         """
         try:
-            extended = await self.redis.expire(f"session:{session_id}", self.ttl)
+            extended = await self._expire(session_id, self.ttl)
             if extended:
                 logger.debug(f"⏰ Extended TTL for session {session_id}")
             return extended
@@ -183,25 +325,23 @@ class SessionService:
             Dict with session info or None if not found
         """
         try:
-            key = f"session:{session_id}"
-
-            # Get TTL
-            ttl_seconds = await self.redis.ttl(key)
-            if ttl_seconds == -2:  # Key doesn't exist
-                return None
-
-            # Get history
-            data = await self.redis.get(key)
-            if not data:
-                return None
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.ttl(self._meta_key(session_id))
+            pipe.hgetall(self._meta_key(session_id))
+            ttl_seconds, meta = await pipe.execute()
 
-            history = json.loads(data)
+            if ttl_seconds == -2 or not meta:  # Key doesn't exist
+                if await self._migrate_legacy(session_id) is None:
+                    return None
+                return await self.get_session_info(session_id)
 
             return {
                 "session_id": session_id,
-                "message_count": len(history),
+                "message_count": int(meta.get("message_count", 0)),
                 "ttl_seconds": ttl_seconds,
                 "ttl_hours": round(ttl_seconds / 3600, 2),
+                "created_at": meta.get("created_at"),
+                "updated_at": meta.get("updated_at"),
             }
         except Exception as e:
             logger.error(f"❌ Failed to get session info: {e}")
@@ -231,12 +371,21 @@ class SessionService:
             - sessions_by_range: distribution by message count
         """
         try:
-            # Get all session keys
-            keys = []
-            async for key in self.redis.scan_iter("session:*"):
-                keys.append(key)
-
-            total_sessions = len(keys)
+            # Read only the per-session counters, pipelined in batches
+            meta_keys = [
+                key async for key in self.redis.scan_iter(match=f"{META_PREFIX}*", count=1000)
+            ]
+            counts: list[tuple[str, int]] = []
+            for i in range(0, len(meta_keys), ANALYTICS_BATCH_SIZE):
+                batch = meta_keys[i : i + ANALYTICS_BATCH_SIZE]
+                pipe = self.redis.pipeline(transaction=False)
+                for key in batch:
+                    pipe.hget(key, "message_count")
+                for key, count in zip(batch, await pipe.execute(), strict=True):
+                    if count is not None:  # Expired between SCAN and HGET
+                        counts.append((key.removeprefix(META_PREFIX), int(count)))
+
+            total_sessions = len(counts)
             if total_sessions == 0:
                 return {
                     "total_sessions": 0,
@@ -247,37 +396,26 @@ class SessionService:
                 }
 
             # Analyze each session
-            message_counts = []
             top_session = {"id": None, "messages": 0}
             ranges = {"0-10": 0, "11-20": 0, "21-50": 0, "51+": 0}
 
-            for key in keys:
-                session_id = key.replace("session:", "")
-                data = await self.redis.get(key)
-                if data:
-                    try:
-                        history = json.loads(data)
-                        msg_count = len(history)
-                        message_counts.append(msg_count)
-
-                        # Track top session
-                        if msg_count > top_session["messages"]:
-                            top_session = {"id": session_id, "messages": msg_count}
-
-                        # Categorize by range
-                        if msg_count <= 10:
-                            ranges["0-10"] += 1
-                        elif msg_count <= 20:
-                            ranges["11-20"] += 1
-                        elif msg_count <= 50:
-                            ranges["21-50"] += 1
-                        else:
-                            ranges["51+"] += 1
-                    except json.JSONDecodeError:
-                        pass
-
-            active_sessions = len([c for c in message_counts if c > 0])
-            avg_messages = sum(message_counts) / len(message_counts) if message_counts else 0
+            for session_id, msg_count in counts:
+                # Track top session
+                if msg_count > top_session["messages"]:
+                    top_session = {"id": session_id, "messages": msg_count}
+
+                # Categorize by range
+                if msg_count <= 10:
+                    ranges["0-10"] += 1
+                elif msg_count <= 20:
+                    ranges["11-20"] += 1
+                elif msg_count <= 50:
+                    ranges["21-50"] += 1
+                else:
+                    ranges["51+"] += 1
+
+            active_sessions = len([c for _, c in counts if c > 0])
+            avg_messages = sum(c for _, c in counts) / total_sessions
 
             analytics = {
                 "total_sessions": total_sessions,
@@ -323,7 +461,7 @@ class SessionService:
             # Use custom TTL or default
             ttl = timedelta(hours=ttl_hours) if ttl_hours else self.ttl
 
-            await self.redis.setex(f"session:{session_id}", ttl, json.dumps(history))
+            await self._store_history(session_id, history, ttl)
             logger.info(
                 f"💾 Updated session {session_id} with {len(history)} messages (TTL: {ttl.total_seconds() / 3600:.1f}h)"
             )
@@ -345,7 +483,7 @@ class SessionService:
         """
         try:
             ttl = timedelta(hours=ttl_hours)
-            extended = await self.redis.expire(f"session:{session_id}", ttl)
+            extended = await self._expire(session_id, ttl)
             if extended:
                 logger.info(f"⏰ Extended TTL for session {session_id} to {ttl_hours}h")
             return extended
@@ -2,7 +2,7 @@
 Zantara Smart Oracle - Enhanced PDF Analysis with Google Drive Integration
 
 This module provides intelligent document analysis by:
-1. Downloading PDFs from Google Drive using Service Account
+1. Fetching PDFs from Google Drive using Service Account (via the local DocumentCache)
 2. Processing documents with Google Gemini AI
 3. Providing accurate answers based on full document content
 
@@ -15,12 +15,13 @@ import json
 import logging
 import os
 
+from core.document_cache import get_document_cache
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaIoBaseDownload
+from llm.genai_client import GENAI_AVAILABLE, GenAIClient, genai, get_genai_client
 
 from app.core.config import settings
-from llm.genai_client import GenAIClient, GENAI_AVAILABLE, genai, get_genai_client
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +34,7 @@ if GENAI_AVAILABLE:
     try:
         _genai_client = get_genai_client()
         if _genai_client.is_available:
-            auth_method = getattr(_genai_client, '_auth_method', 'unknown')
+            auth_method = getattr(_genai_client, "_auth_method", "unknown")
             logger.info(f"✅ Smart Oracle GenAI client initialized (auth: {auth_method})")
     except Exception as e:
         logger.warning(f"Failed to initialize Smart Oracle GenAI client: {e}")
@@ -153,8 +154,9 @@ async def smart_oracle(query, best_filename_from_qdrant):
         str: AI-generated answer based on full document analysis
     """
 
-    # 1. Download the specific file identified by your Vector DB
-    pdf_path = download_pdf_from_drive(best_filename_from_qdrant)
+    # 1. Get the specific file identified by your Vector DB (local cache, then Drive)
+    document = await get_document_cache().get(best_filename_from_qdrant)
+    pdf_path = document.pdf_path if document else None
 
     if pdf_path:
         try:
@@ -174,17 +176,21 @@ async def smart_oracle(query, best_filename_from_qdrant):
                 # Generate content using uploaded file
                 result = await _genai_client.generate_content(
                     contents=[
-                        {"text": "You are an expert consultant. Answer the user query based ONLY on the provided document."},
-                        {"file_data": {"file_uri": gemini_file.uri, "mime_type": gemini_file.mime_type}},
+                        {
+                            "text": "You are an expert consultant. Answer the user query based ONLY on the provided document."
+                        },
+                        {
+                            "file_data": {
+                                "file_uri": gemini_file.uri,
+                                "mime_type": gemini_file.mime_type,
+                            }
+                        },
                         {"text": f"User Query: {query}"},
                     ],
                     model="gemini-3-flash-preview",
                     max_output_tokens=8192,
                 )
 
-                # Cleanup: Remove local temp file to save space
-                os.remove(pdf_path)
-
                 return result.get("text", "No response generated.")
             else:
                 return "GenAI SDK not available."
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Knowledge Graph Traversal Benchmark
+
+Seeds a synthetic knowledge graph (100k entities by default) into a scratch
+schema of the PostgreSQL database at DATABASE_URL and compares, per depth:
+1. The previous per-node BFS (one SELECT ... JOIN kg_entities per visited node)
+2. GraphService.traverse (one query per BFS level over the whole frontier)
+3. GraphService.traverse served from the subgraph cache
+
+Edge targets are skewed towards a small set of hub entities, as in the real
+graph (visa types, permits and laws are referenced by many entities).
+
+--rtt-ms adds a simulated network round-trip to every query, since a local
+socket hides what the per-node BFS costs against a managed database.
+
+Usage:
+    DATABASE_URL=postgresql://... python scripts/benchmark_graph_traversal.py \
+        [--entities 100000] [--edges-per-entity 4] [--depths 1 2 3] [--starts 20] \
+        [--rtt-ms 1.0] [--keep]
+
+The scratch schema (kg_bench) is dropped afterwards unless --keep is given.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+# Set minimal environment variables so the backend package can be imported
+os.environ.setdefault("JWT_SECRET_KEY", "test_jwt_secret_key_for_testing_only_min_32_chars")
+os.environ.setdefault("API_KEYS", "test_api_key_1,test_api_key_2")
+
+# Add backend directory to Python path
+backend_path = Path(__file__).parent.parent / "backend"
+if str(backend_path) not in sys.path:
+    sys.path.insert(0, str(backend_path))
+
+import asyncpg  # noqa: E402
+
+from services.graph_service import GraphService  # noqa: E402
+
+SCHEMA = "kg_bench"
+HUB_COUNT = 1000  # Entities that receive HUB_SHARE of all edges
+HUB_SHARE = 0.2
+
+
+class CountingPool:
+    """Wraps an asyncpg pool, counts queries and adds a simulated round-trip to each."""
+
+    def __init__(self, pool: asyncpg.Pool, rtt: float = 0.0):
+        self.pool = pool
+        self.rtt = rtt
+        self.queries = 0
+
+    @asynccontextmanager
+    async def acquire(self):
+        async with self.pool.acquire() as conn:
+            yield _CountingConnection(conn, self)
+
+
+class _CountingConnection:
+    def __init__(self, conn: asyncpg.Connection, owner: CountingPool):
+        self._conn = conn
+        self._owner = owner
+
+    async def fetch(self, *args):
+        self._owner.queries += 1
+        await asyncio.sleep(self._owner.rtt)
+        return await self._conn.fetch(*args)
+
+    async def fetchrow(self, *args):
+        self._owner.queries += 1
+        await asyncio.sleep(self._owner.rtt)
+        return await self._conn.fetchrow(*args)
+
+
+async def seed_graph(conn: asyncpg.Connection, entities: int, edges_per_entity: int) -> int:
+    """Create the kg tables (as in migration 014) in the scratch schema and fill them."""
+    await conn.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE; CREATE SCHEMA {SCHEMA}")
+    await conn.execute(
+        f"""
+        CREATE TABLE {SCHEMA}.kg_entities (
+            id VARCHAR(64) PRIMARY KEY,
+            type VARCHAR(32) NOT NULL,
+            name TEXT NOT NULL,
+            canonical_name TEXT,
+            description TEXT,
+            mention_count INTEGER DEFAULT 0,
+            properties JSONB DEFAULT '{{}}',
+            created_at TIMESTAMP DEFAULT NOW(),
+            updated_at TIMESTAMP DEFAULT NOW()
+        );
+        CREATE TABLE {SCHEMA}.kg_relationships (
+            id SERIAL PRIMARY KEY,
+            source_entity_id VARCHAR(64) REFERENCES {SCHEMA}.kg_entities(id),
+            target_entity_id VARCHAR(64) REFERENCES {SCHEMA}.kg_entities(id),
+            relationship_type VARCHAR(32) NOT NULL,
+            strength FLOAT DEFAULT 1.0,
+            properties JSONB DEFAULT '{{}}',
+            created_at TIMESTAMP DEFAULT NOW(),
+            UNIQUE(source_entity_id, target_entity_id, relationship_type)
+        );
+        """
+    )
+    await conn.execute("SELECT setseed(0.42)")
+    await conn.execute(
+        f"""
+        INSERT INTO {SCHEMA}.kg_entities (id, type, name, description)
+        SELECT 'e' || i,
+               (ARRAY['visa', 'permit', 'law', 'company_type', 'tax', 'document'])[1 + i % 6],
+               'Entity ' || i,
+               'Synthetic entity ' || i
+        FROM generate_series(0, $1 - 1) AS i
+        """,
+        entities,
+    )
+    await conn.execute(
+        f"""
+        INSERT INTO {SCHEMA}.kg_relationships
+            (source_entity_id, target_entity_id, relationship_type, strength)
+        SELECT 'e' || i,
+               'e' || CASE WHEN random() < $3
+                           THEN floor(random() * $4)::int
+                           ELSE floor(random() * $1)::int END,
+               (ARRAY['requires', 'costs', 'regulated_by', 'related_to'])[1 + k % 4],
+               round(random()::numeric, 2)
+        FROM generate_series(0, $1 - 1) AS i, generate_series(1, $2) AS k
+        ON CONFLICT DO NOTHING
+        """,
+        entities,
+        edges_per_entity,
+        HUB_SHARE,
+        HUB_COUNT,
+    )
+    # Same indexes as migration 014
+    await conn.execute(
+        f"""
+        CREATE INDEX ON {SCHEMA}.kg_relationships(source_entity_id);
+        CREATE INDEX ON {SCHEMA}.kg_relationships(target_entity_id);
+        CREATE INDEX ON {SCHEMA}.kg_relationships(relationship_type);
+        ANALYZE {SCHEMA}.kg_entities;
+        ANALYZE {SCHEMA}.kg_relationships;
+        """
+    )
+    return await conn.fetchval(f"SELECT COUNT(*) FROM {SCHEMA}.kg_relationships")
+
+
+async def per_node_traverse(pool: CountingPool, start_id: str, max_depth: int) -> dict:
+    """The previous GraphService.traverse: one edge query per visited node."""
+    nodes, edges = {}, []
+    queue = [(start_id, 0)]
+    visited = set()
+    async with pool.acquire() as conn:
+        start_node = await conn.fetchrow("SELECT * FROM kg_entities WHERE id = $1", start_id)
+        if start_node:
+            nodes[start_id] = dict(start_node)
+            visited.add(start_id)
+        while queue:
+            current_id, depth = queue.pop(0)
+            if depth >= max_depth:
+                continue
+            rows = await conn.fetch(
+                """
+                SELECT r.*, e.type as target_type, e.name as target_name, e.description as target_desc
+                FROM kg_relationships r
+                JOIN kg_entities e ON r.target_entity_id = e.id
+                WHERE r.source_entity_id = $1
+                """,
+                current_id,
+            )
+            for row in rows:
+                target_id = row["target_entity_id"]
+                edges.append({"source": current_id, "target": target_id})
+                if target_id not in visited:
+                    visited.add(target_id)
+                    nodes[target_id] = {"id": target_id}
+                    queue.append((target_id, depth + 1))
+    return {"nodes": list(nodes.values()), "edges": edges}
+
+
+async def run(args: argparse.Namespace) -> int:
+    database_url = args.database_url or os.environ.get("DATABASE_URL")
+    if not database_url:
+        print("❌ Set DATABASE_URL or pass --database-url")
+        return 1
+
+    async with asyncpg.create_pool(
+        database_url, min_size=1, max_size=2, server_settings={"search_path": SCHEMA}
+    ) as raw_pool:
+        async with raw_pool.acquire() as conn:
+            print(f"🌱 Seeding {args.entities:,} entities into schema '{SCHEMA}'...")
+            start = time.perf_counter()
+            edge_count = await seed_graph(conn, args.entities, args.edges_per_entity)
+            print(f"   {edge_count:,} relationships in {time.perf_counter() - start:.1f}s\n")
+
+        try:
+            pool = CountingPool(raw_pool, rtt=args.rtt_ms / 1000)
+            service = GraphService(pool)
+            rng = random.Random(7)
+            starts = [f"e{rng.randrange(args.entities)}" for _ in range(args.starts)]
+
+            print(
+                f"{'depth':>5} {'nodes':>7} {'per-node ms':>12} {'queries':>8} "
+                f"{'frontier ms':>12} {'queries':>8} {'cached ms':>10} {'speedup':>8}"
+            )
+            print("=" * 80)
+            for depth in args.depths:
+                old_ms, new_ms, cached_ms, sizes = [], [], [], []
+                old_queries = new_queries = 0
+                service.invalidate_cache()
+                for start_id in starts:
+                    pool.queries = 0
+                    t = time.perf_counter()
+                    old = await per_node_traverse(pool, start_id, depth)
+                    old_ms.append((time.perf_counter() - t) * 1000)
+                    old_queries += pool.queries
+
+                    # Same subgraph as the per-node BFS: no fan-out or size caps
+                    pool.queries = 0
+                    t = time.perf_counter()
+                    new = await service.traverse(
+                        start_id, max_depth=depth, max_fanout=None, max_nodes=None
+                    )
+                    new_ms.append((time.perf_counter() - t) * 1000)
+                    new_queries += pool.queries
+
+                    t = time.perf_counter()
+                    await service.traverse(
+                        start_id, max_depth=depth, max_fanout=None, max_nodes=None
+                    )
+                    cached_ms.append((time.perf_counter() - t) * 1000)
+
+                    if len(old["nodes"]) != len(new["nodes"]):
+                        print(f"⚠️ {start_id}: {len(old['nodes'])} vs {len(new['nodes'])} nodes")
+                    sizes.append(len(new["nodes"]))
+
+                old_median = statistics.median(old_ms)
+                new_median = statistics.median(new_ms)
+                print(
+                    f"{depth:>5} {statistics.median(sizes):>7.0f} {old_median:>12.1f} "
+                    f"{old_queries / len(starts):>8.1f} {new_median:>12.1f} "
+                    f"{new_queries / len(starts):>8.1f} {statistics.median(cached_ms):>10.3f} "
+                    f"{old_median / new_median if new_median else 0:>7.1f}x"
+                )
+            print(
+                f"\n(medians over start entities, {args.rtt_ms} ms simulated round-trip; "
+                "queries = average round-trips per traversal)"
+            )
+        finally:
+            if not args.keep:
+                async with raw_pool.acquire() as conn:
+                    await conn.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark knowledge graph traversal")
+    parser.add_argument("--database-url", help="PostgreSQL URL (default: $DATABASE_URL)")
+    parser.add_argument("--entities", type=int, default=100_000)
+    parser.add_argument("--edges-per-entity", type=int, default=4)
+    parser.add_argument("--depths", type=int, nargs="+", default=[1, 2, 3])
+    parser.add_argument("--starts", type=int, default=20, help="Start entities per depth")
+    parser.add_argument(
+        "--rtt-ms", type=float, default=1.0, help="Simulated network round-trip per query"
+    )
+    parser.add_argument("--keep", action="store_true", help=f"Keep the '{SCHEMA}' schema")
+    return asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+Text Search Benchmark (EXPLAIN ANALYZE)
+
+Seeds synthetic CRM and memory data (100k clients, 1M memory facts by
+default) into a scratch schema of the PostgreSQL database at DATABASE_URL,
+then for every search hot path:
+1. Runs the previous leading-wildcard ILIKE / LOWER(...) LIKE query under
+   EXPLAIN ANALYZE (no usable index: sequential scans)
+2. Applies db/migrations/029_text_search_indexes.sql (pg_trgm GIN indexes,
+   English + Indonesian search_vector columns)
+3. Runs the current query under EXPLAIN ANALYZE
+
+and prints the scan nodes of each plan with median execution times. The
+queries mirror CRMClientsTool._search_clients, GET /api/crm/clients?search=,
+the shared memory client search, MemoryServicePostgres.search,
+CollectiveMemoryService.search_similar and DatabaseQueryTool (full_text).
+
+Requires the pg_trgm extension to be available on the server.
+
+Usage:
+    DATABASE_URL=postgresql://... python scripts/benchmark_text_search.py \
+        [--clients 100000] [--facts 1000000] [--runs 3] [--show-plans] [--keep]
+
+The scratch schema (search_bench) is dropped afterwards unless --keep is given.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Set minimal environment variables so the backend package can be imported
+os.environ.setdefault("JWT_SECRET_KEY", "test_jwt_secret_key_for_testing_only_min_32_chars")
+os.environ.setdefault("API_KEYS", "test_api_key_1,test_api_key_2")
+
+# Add backend directory to Python path
+backend_path = Path(__file__).parent.parent / "backend"
+if str(backend_path) not in sys.path:
+    sys.path.insert(0, str(backend_path))
+
+import asyncpg  # noqa: E402
+from core.text_search import like_pattern, tsquery_sql  # noqa: E402
+
+SCHEMA = "search_bench"
+MIGRATION_SQL = backend_path / "db" / "migrations" / "029_text_search_indexes.sql"
+
+FIRST_NAMES = [
+    "Andi", "Budi", "Citra", "Dewi", "Eko", "Fajar", "Gita", "Hendra", "Indah", "Joko",
+    "Kartika", "Lestari", "Made", "Nyoman", "Putu", "Ketut", "Rina", "Sari", "Taufik", "Wayan",
+    "John", "Maria", "David", "Sophie", "Luca", "Anna", "James", "Emma", "Oliver", "Chloe",
+    "Hiroshi", "Yuki", "Wei", "Mei", "Ivan", "Olga", "Lars", "Ingrid", "Pierre", "Camille",
+]  # fmt: skip
+LAST_NAMES = [
+    "Wijaya", "Santoso", "Pratama", "Saputra", "Hidayat", "Kusuma", "Setiawan", "Nugroho",
+    "Gunawan", "Halim", "Smith", "Johnson", "Brown", "Rossi", "Bianchi", "Muller", "Schmidt",
+    "Dubois", "Martin", "Tanaka", "Suzuki", "Chen", "Wang", "Ivanov", "Petrov", "Larsen",
+    "Hansen", "Garcia", "Lopez", "Novak", "Kowalski", "Jensen", "Silva", "Santos", "Costa",
+]  # fmt: skip
+NATIONALITIES = [
+    "Indonesian", "Australian", "American", "British", "Italian", "German", "French",
+    "Japanese", "Chinese", "Russian", "Dutch", "Swedish", "Spanish", "Brazilian", "Polish",
+]  # fmt: skip
+FACT_WORDS = [
+    # English
+    "client", "prefers", "visa", "renewal", "application", "applications", "company",
+    "companies", "tax", "taxes", "office", "villa", "lease", "leasing", "investor", "permit",
+    "permits", "license", "director", "shareholder", "capital", "meeting", "deadline",
+    "payment", "invoice", "bank", "account", "family", "spouse", "children", "school",
+    "notary", "property", "land", "rental", "contract", "signed", "pending", "approved",
+    "rejected", "documents", "passport", "sponsor", "employment", "remote", "working",
+    "restaurant", "hotel", "export", "import", "consulting", "software", "development",
+    # Indonesian
+    "perusahaan", "pajak", "izin", "usaha", "perpanjangan", "pengajuan", "dokumen",
+    "kantor", "sewa", "tanah", "rumah", "keluarga", "anak", "sekolah", "notaris",
+    "pembayaran", "tagihan", "rekening", "modal", "pemegang", "saham", "direktur",
+    "kitas", "kitap", "imigrasi", "penanaman", "asing", "kerja", "tenaga", "disetujui",
+    "ditolak", "menunggu", "persetujuan", "pendaftaran", "berlaku", "bulan", "tahun",
+    # Places
+    "bali", "canggu", "ubud", "seminyak", "denpasar", "jakarta", "uluwatu", "sanur",
+]  # fmt: skip
+DOC_WORDS = [
+    "Undang-Undang", "Peraturan", "Pemerintah", "Menteri", "Keputusan", "Presiden",
+    "tentang", "Cipta", "Kerja", "Penanaman", "Modal", "Keimigrasian", "Perpajakan",
+    "Ketenagakerjaan", "Perizinan", "Berusaha", "Berbasis", "Risiko", "Pajak",
+    "Penghasilan", "Pertambahan", "Nilai", "Bangunan", "Gedung", "Tata", "Ruang",
+]  # fmt: skip
+
+CLIENT_TERMS = ["wijaya", "Putu Santos", "olga.iva", "+62811002", "Jon Smyth"]
+FACT_TERMS = ["kitas", "visa renewal", "perusahaan", "tax", "canggu villa lease"]
+TITLE_TERMS = ["Cipta Kerja", "keimigrasian", "Pajak Penghasilan", "Perizinan Berusaha"]
+
+ACTIVE_STATUSES = "('inquiry', 'in_progress', 'waiting_documents', 'submitted_to_gov')"
+FACT_TSQUERY = tsquery_sql("$1")
+
+# name: (terms, old query, old params, new query, new params)
+QUERIES = {
+    "crm tool client search": (
+        CLIENT_TERMS,
+        """
+        SELECT id, full_name, email FROM clients
+        WHERE LOWER(full_name) LIKE $1 OR LOWER(email) LIKE $1
+           OR LOWER(nationality) LIKE $1 OR LOWER(phone) LIKE $1
+        ORDER BY CASE WHEN LOWER(full_name) = LOWER($2) THEN 1
+                      WHEN LOWER(email) = LOWER($2) THEN 2
+                      WHEN LOWER(full_name) LIKE $1 THEN 3 ELSE 4 END,
+                 last_interaction_date DESC NULLS LAST
+        LIMIT 20
+        """,
+        lambda term: (f"%{term.lower()}%", term.lower()),
+        """
+        SELECT id, full_name, email FROM clients
+        WHERE full_name ILIKE $1 OR email ILIKE $1 OR nationality ILIKE $1
+           OR phone ILIKE $1 OR full_name % $2
+        ORDER BY CASE WHEN LOWER(full_name) = LOWER($2) THEN 1
+                      WHEN LOWER(email) = LOWER($2) THEN 2
+                      WHEN full_name ILIKE $1 THEN 3 ELSE 4 END,
+                 similarity(full_name, $2) DESC,
+                 last_interaction_date DESC NULLS LAST
+        LIMIT 20
+        """,
+        lambda term: (like_pattern(term), term),
+    ),
+    "GET /api/crm/clients?search=": (
+        CLIENT_TERMS,
+        """
+        SELECT id, full_name, email FROM clients
+        WHERE 1=1 AND (full_name ILIKE $1 OR email ILIKE $2 OR phone ILIKE $3)
+        ORDER BY created_at DESC LIMIT 50 OFFSET 0
+        """,
+        lambda term: (f"%{term}%",) * 3,
+        """
+        SELECT id, full_name, email FROM clients
+        WHERE 1=1 AND (full_name ILIKE $1 OR email ILIKE $1 OR phone ILIKE $1)
+        ORDER BY created_at DESC LIMIT 50 OFFSET 0
+        """,
+        lambda term: (like_pattern(term),),
+    ),
+    "shared memory client search": (
+        ["Wijaya", "Putu Santos", "Jon Smyth"],
+        f"""
+        SELECT c.id, COUNT(DISTINCT p.id) AS total_practices,
+               COUNT(DISTINCT CASE WHEN p.status IN {ACTIVE_STATUSES} THEN p.id END)
+        FROM clients c LEFT JOIN practices p ON c.id = p.client_id
+        WHERE c.full_name ILIKE $1 OR c.email ILIKE $2
+        GROUP BY c.id LIMIT 20
+        """,
+        lambda term: (f"%{term}%",) * 2,
+        f"""
+        SELECT c.id, COUNT(DISTINCT p.id) AS total_practices,
+               COUNT(DISTINCT CASE WHEN p.status IN {ACTIVE_STATUSES} THEN p.id END)
+        FROM clients c LEFT JOIN practices p ON c.id = p.client_id
+        WHERE c.full_name ILIKE $1 OR c.email ILIKE $1 OR c.full_name % $2
+        GROUP BY c.id ORDER BY similarity(c.full_name, $2) DESC LIMIT 20
+        """,
+        lambda term: (like_pattern(term), term),
+    ),
+    "memory facts search": (
+        FACT_TERMS,
+        """
+        SELECT user_id, content, confidence, created_at FROM memory_facts
+        WHERE content ILIKE $1
+        ORDER BY confidence DESC, created_at DESC LIMIT 5
+        """,
+        lambda term: (f"%{term}%",),
+        f"""
+        SELECT user_id, content, confidence, created_at FROM memory_facts
+        WHERE search_vector @@ {FACT_TSQUERY} OR content ILIKE $2
+        ORDER BY ts_rank(search_vector, {FACT_TSQUERY}) DESC, confidence DESC, created_at DESC
+        LIMIT 5
+        """,
+        lambda term: (term, like_pattern(term)),
+    ),
+    "collective memory search": (
+        FACT_TERMS,
+        """
+        SELECT id, content FROM collective_memories
+        WHERE content ILIKE $1 AND is_promoted = TRUE
+        ORDER BY confidence DESC LIMIT 5
+        """,
+        lambda term: (f"%{term}%",),
+        f"""
+        SELECT id, content FROM collective_memories
+        WHERE (search_vector @@ {FACT_TSQUERY} OR content ILIKE $2) AND is_promoted = TRUE
+        ORDER BY ts_rank(search_vector, {FACT_TSQUERY}) DESC, confidence DESC LIMIT 5
+        """,
+        lambda term: (term, like_pattern(term)),
+    ),
+    "document title lookup": (
+        TITLE_TERMS,
+        "SELECT title FROM parent_documents WHERE title ILIKE $1 LIMIT 1",
+        lambda term: (f"%{term}%",),
+        """
+        SELECT title FROM parent_documents
+        WHERE title ILIKE $1 OR title % $2
+        ORDER BY similarity(title, $2) DESC LIMIT 1
+        """,
+        lambda term: (like_pattern(term), term),
+    ),
+}
+
+
+async def seed(conn: asyncpg.Connection, clients: int, facts: int) -> None:
+    """Create the searched tables (columns as in migrations 002/007/013/018) and fill them."""
+    await conn.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE; CREATE SCHEMA {SCHEMA}")
+    await conn.execute(
+        f"""
+        CREATE TABLE {SCHEMA}.clients (
+            id SERIAL PRIMARY KEY,
+            full_name VARCHAR(255) NOT NULL,
+            email VARCHAR(255),
+            phone VARCHAR(50),
+            nationality VARCHAR(100),
+            status VARCHAR(50) DEFAULT 'active',
+            last_interaction_date TIMESTAMP WITH TIME ZONE,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+        );
+        CREATE TABLE {SCHEMA}.practices (
+            id SERIAL PRIMARY KEY,
+            client_id INTEGER REFERENCES {SCHEMA}.clients(id),
+            status VARCHAR(50)
+        );
+        CREATE TABLE {SCHEMA}.memory_facts (
+            id SERIAL PRIMARY KEY,
+            user_id VARCHAR(255) NOT NULL,
+            content TEXT NOT NULL,
+            confidence FLOAT DEFAULT 1.0,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+        );
+        CREATE TABLE {SCHEMA}.collective_memories (
+            id SERIAL PRIMARY KEY,
+            content TEXT NOT NULL,
+            confidence FLOAT DEFAULT 0.5,
+            is_promoted BOOLEAN DEFAULT FALSE
+        );
+        CREATE TABLE {SCHEMA}.parent_documents (
+            id VARCHAR(64) PRIMARY KEY,
+            document_id VARCHAR(64) NOT NULL,
+            title TEXT,
+            full_text TEXT NOT NULL
+        );
+        """
+    )
+    await conn.execute("SELECT setseed(0.42)")
+    await conn.execute(
+        f"""
+        INSERT INTO {SCHEMA}.clients
+            (full_name, email, phone, nationality, last_interaction_date, created_at)
+        SELECT f || ' ' || l,
+               lower(f) || '.' || lower(l) || i || '@example.com',
+               '+62' || (8110000000 + i),
+               ($4::text[])[1 + floor(random() * array_length($4::text[], 1))::int],
+               NOW() - random() * INTERVAL '365 days',
+               NOW() - random() * INTERVAL '730 days'
+        FROM (
+            SELECT i,
+                   ($2::text[])[1 + floor(random() * array_length($2::text[], 1))::int] AS f,
+                   ($3::text[])[1 + floor(random() * array_length($3::text[], 1))::int] AS l
+            FROM generate_series(1, $1) AS i
+        ) names
+        """,
+        clients,
+        FIRST_NAMES,
+        LAST_NAMES,
+        NATIONALITIES,
+    )
+    await conn.execute(
+        f"""
+        INSERT INTO {SCHEMA}.practices (client_id, status)
+        SELECT 1 + floor(random() * $1)::int,
+               (ARRAY['inquiry', 'in_progress', 'completed'])[1 + i % 3]
+        FROM generate_series(1, $1) AS i
+        """,
+        clients,
+    )
+    await conn.execute(f"CREATE INDEX ON {SCHEMA}.practices(client_id)")
+
+    words = "($1::text[])[1 + floor(random() * array_length($1::text[], 1))::int]"
+    sentence = " || ' ' || ".join([words] * 10)
+    await conn.execute(
+        f"""
+        INSERT INTO {SCHEMA}.memory_facts (user_id, content, confidence, created_at)
+        SELECT 'user_' || (i % 20000), {sentence}, round(random()::numeric, 2),
+               NOW() - random() * INTERVAL '365 days'
+        FROM generate_series(1, $2) AS i
+        """,
+        FACT_WORDS,
+        facts,
+    )
+    await conn.execute(
+        f"""
+        INSERT INTO {SCHEMA}.collective_memories (content, confidence, is_promoted)
+        SELECT {sentence}, round(random()::numeric, 2), random() < 0.3
+        FROM generate_series(1, $2) AS i
+        """,
+        FACT_WORDS,
+        max(facts // 20, 1),
+    )
+    title = " || ' ' || ".join([words] * 6)
+    await conn.execute(
+        f"""
+        INSERT INTO {SCHEMA}.parent_documents (id, document_id, title, full_text)
+        SELECT 'doc_' || i || '_ch', 'doc_' || i, {title}, 'Pasal 1 ...'
+        FROM generate_series(1, $2) AS i
+        """,
+        DOC_WORDS,
+        max(clients // 10, 1),
+    )
+    await conn.execute(
+        "ANALYZE clients; ANALYZE practices; ANALYZE memory_facts; "
+        "ANALYZE collective_memories; ANALYZE parent_documents"
+    )
+
+
+def _scan_nodes(plan: dict) -> list[str]:
+    """Scan nodes of a JSON plan, e.g. 'Seq Scan clients', 'Bitmap Index Scan idx_...'."""
+    nodes = []
+    node_type = plan["Node Type"]
+    if "Scan" in node_type:
+        target = plan.get("Index Name") or plan.get("Relation Name") or ""
+        nodes.append(f"{node_type} {target}".strip())
+    for child in plan.get("Plans", []):
+        nodes.extend(_scan_nodes(child))
+    return nodes
+
+
+async def explain(
+    conn: asyncpg.Connection, query: str, terms: list[str], params, runs: int
+) -> tuple[float, list[str], str]:
+    """Median execution time (ms) over terms, distinct scan nodes, and the first text plan."""
+    times, nodes = [], {}
+    for term in terms:
+        args = params(term)
+        await conn.fetch(query, *args)  # Warm the buffer cache
+        for _ in range(runs):
+            (row,) = await conn.fetch(f"EXPLAIN (ANALYZE, FORMAT JSON) {query}", *args)
+            plan = json.loads(row[0])[0]
+            times.append(plan["Execution Time"])
+            nodes.update(dict.fromkeys(_scan_nodes(plan["Plan"])))
+    text_rows = await conn.fetch(f"EXPLAIN (ANALYZE, BUFFERS) {query}", *params(terms[0]))
+    return statistics.median(times), list(nodes), "\n".join(r[0] for r in text_rows)
+
+
+async def run(args: argparse.Namespace) -> int:
+    database_url = args.database_url or os.environ.get("DATABASE_URL")
+    if not database_url:
+        print("❌ Set DATABASE_URL or pass --database-url")
+        return 1
+
+    conn = await asyncpg.connect(database_url, server_settings={"search_path": f"{SCHEMA}, public"})
+    try:
+        available = await conn.fetchval(
+            "SELECT EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm')"
+        )
+        if not available:
+            print("❌ pg_trgm extension is not available on this server")
+            return 1
+
+        print(f"🌱 Seeding {args.clients:,} clients and {args.facts:,} facts into '{SCHEMA}'...")
+        start = time.perf_counter()
+        await seed(conn, args.clients, args.facts)
+        print(f"   done in {time.perf_counter() - start:.1f}s\n")
+
+        try:
+            before = {}
+            for name, (terms, old_query, old_params, _, _) in QUERIES.items():
+                before[name] = await explain(conn, old_query, terms, old_params, args.runs)
+
+            print(f"🔧 Applying {MIGRATION_SQL.name}...")
+            start = time.perf_counter()
+            await conn.execute(MIGRATION_SQL.read_text())
+            print(f"   done in {time.perf_counter() - start:.1f}s\n")
+
+            print(f"{'query':<32} {'before ms':>10} {'after ms':>10} {'speedup':>8}")
+            print("=" * 64)
+            plans = []
+            for name, (terms, _, _, new_query, new_params) in QUERIES.items():
+                old_ms, old_nodes, old_plan = before[name]
+                new_ms, new_nodes, new_plan = await explain(
+                    conn, new_query, terms, new_params, args.runs
+                )
+                print(
+                    f"{name:<32} {old_ms:>10.2f} {new_ms:>10.2f} "
+                    f"{old_ms / new_ms if new_ms else 0:>7.1f}x"
+                )
+                print(f"{'':<4}before: {', '.join(old_nodes)}")
+                print(f"{'':<4}after:  {', '.join(new_nodes)}")
+                plans.append((name, old_plan, new_plan))
+            print(
+                f"\n(median EXPLAIN ANALYZE execution time over {args.runs} runs per search term)"
+            )
+
+            if args.show_plans:
+                for name, old_plan, new_plan in plans:
+                    print(
+                        f"\n--- {name}: before ---\n{old_plan}\n--- {name}: after ---\n{new_plan}"
+                    )
+        finally:
+            if not args.keep:
+                await conn.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+    finally:
+        await conn.close()
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark trigram/full-text search indexes")
+    parser.add_argument("--database-url", help="PostgreSQL URL (default: $DATABASE_URL)")
+    parser.add_argument("--clients", type=int, default=100_000)
+    parser.add_argument("--facts", type=int, default=1_000_000)
+    parser.add_argument("--runs", type=int, default=3, help="EXPLAIN ANALYZE runs per term")
+    parser.add_argument("--show-plans", action="store_true", help="Print full text plans")
+    parser.add_argument("--keep", action="store_true", help=f"Keep the '{SCHEMA}' schema")
+    return asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
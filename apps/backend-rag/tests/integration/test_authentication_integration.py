@@ -125,7 +125,8 @@ class TestAuthenticationIntegration:
         # Protected endpoints should require auth
         # (This depends on endpoint configuration)
 
-    def test_rate_limiting_middleware(self):
+    @pytest.mark.asyncio
+    async def test_rate_limiting_middleware(self):
         """Test rate limiting middleware functionality"""
         from middleware.rate_limiter import RateLimiter
 
@@ -138,12 +139,12 @@ class TestAuthenticationIntegration:
 
         # First 10 requests should be allowed
         for i in range(10):
-            allowed, info = rate_limiter.is_allowed(key, limit, window)
+            allowed, info = await rate_limiter.is_allowed(key, limit, window)
             assert allowed is True
             assert info["remaining"] >= 0
 
         # 11th request should be blocked
-        allowed, info = rate_limiter.is_allowed(key, limit, window)
+        allowed, info = await rate_limiter.is_allowed(key, limit, window)
         # Note: This might still be allowed depending on timing
         assert isinstance(allowed, bool)
         assert "limit" in info
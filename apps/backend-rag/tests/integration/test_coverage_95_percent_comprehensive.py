@@ -6,7 +6,7 @@ Tests all edge cases, error handling, and branch coverage
 import os
 import sys
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import asyncpg
 import pytest
@@ -1153,12 +1153,14 @@ class TestRateLimiter95Percent:
                 assert limiter.redis_available is False
 
         # Test is_allowed with Redis
+        import asyncio
+
         limiter = RateLimiter()
         limiter.redis_available = True
         limiter.redis_client = MagicMock()
-        limiter.redis_client.pipeline.return_value.execute.return_value = [0, 5, None, None]
+        limiter._script = AsyncMock(return_value=[1, 5, 0])
 
-        allowed, info = limiter.is_allowed("test_key", limit=10, window=60)
+        allowed, info = asyncio.run(limiter.is_allowed("test_key", limit=10, window=60))
         assert isinstance(allowed, bool)
         assert "limit" in info
         assert "remaining" in info
@@ -1168,23 +1170,23 @@ class TestRateLimiter95Percent:
         limiter2.redis_available = False
         _rate_limit_storage.clear()
 
-        allowed2, info2 = limiter2.is_allowed("test_key2", limit=10, window=60)
+        allowed2, info2 = asyncio.run(limiter2.is_allowed("test_key2", limit=10, window=60))
         assert isinstance(allowed2, bool)
         assert "limit" in info2
 
         # Test is_allowed limit exceeded
         for i in range(12):
-            allowed3, info3 = limiter2.is_allowed("test_key3", limit=10, window=60)
+            allowed3, info3 = asyncio.run(limiter2.is_allowed("test_key3", limit=10, window=60))
         assert allowed3 is False
 
         # Test is_allowed error handling
         limiter3 = RateLimiter()
         limiter3.redis_available = True
         limiter3.redis_client = MagicMock()
-        limiter3.redis_client.pipeline.side_effect = Exception("Redis error")
+        limiter3._script = AsyncMock(side_effect=Exception("Redis error"))
 
-        allowed4, info4 = limiter3.is_allowed("test_key4", limit=10, window=60)
-        assert allowed4 is True  # Fail open
+        allowed4, info4 = asyncio.run(limiter3.is_allowed("test_key4", limit=10, window=60))
+        assert allowed4 is True  # Falls back to the in-memory window
 
         # Test RateLimitMiddleware
         middleware = RateLimitMiddleware(MagicMock())
@@ -1201,9 +1203,8 @@ class TestRateLimiter95Percent:
 
         # Mock rate limiter
         with patch("middleware.rate_limiter.rate_limiter") as mock_limiter:
-            mock_limiter.is_allowed.return_value = (True, {"limit": 10, "remaining": 9})
+            mock_limiter.is_allowed = AsyncMock(return_value=(True, {"limit": 10, "remaining": 9}))
             # Should not raise exception
-            import asyncio
 
             try:
                 asyncio.run(middleware.dispatch(request, call_next))
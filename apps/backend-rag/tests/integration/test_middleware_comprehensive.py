@@ -271,11 +271,11 @@ class TestRateLimitMiddleware:
 
         # Make requests up to limit
         for i in range(limit):
-            allowed, info = rate_limiter.is_allowed(key, limit, window)
+            allowed, info = await rate_limiter.is_allowed(key, limit, window)
             assert allowed is True
 
         # Next request should be blocked
-        allowed, info = rate_limiter.is_allowed(key, limit, window)
+        allowed, info = await rate_limiter.is_allowed(key, limit, window)
         assert allowed is False
 
     @pytest.mark.asyncio
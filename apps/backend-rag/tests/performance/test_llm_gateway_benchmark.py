@@ -0,0 +1,73 @@
+"""
+Microbenchmark for LLMGateway request config construction
+
+Compares building GenerateContentConfig (tool declarations included) from
+scratch on every call, as every ReAct step and fallback tier used to do,
+against the prebuilt configs served from the gateway's cache:
+
+    pytest tests/performance/test_llm_gateway_benchmark.py -s
+"""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from services.rag.agentic import llm_gateway as llm_gateway_module
+from services.rag.agentic.llm_gateway import LLMGateway
+
+ITERATIONS = 2000
+SYSTEM_PROMPT = "You are ZANTARA, the Bali Zero assistant. " * 200
+
+# Shaped like BaseTool.to_gemini_function_declaration() output
+TOOLS = [
+    {
+        "name": f"tool_{i}",
+        "description": f"Tool number {i} used by the agentic RAG loop",
+        "parameters": {
+            "type": "OBJECT",
+            "properties": {
+                f"arg_{j}": {"type": "STRING", "description": f"Argument {j}"} for j in range(4)
+            },
+            "required": ["arg_0"],
+        },
+    }
+    for i in range(12)
+]
+
+
+def _per_call_us(build, iterations: int = ITERATIONS) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        build()
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+@pytest.mark.skipif(llm_gateway_module.types is None, reason="google-genai not installed")
+def test_prebuilt_config_overhead():
+    """Benchmark per-call config overhead with and without the config cache"""
+    genai_client = MagicMock()
+    genai_client.is_available = True
+    with patch("services.rag.agentic.llm_gateway.get_genai_client", return_value=genai_client):
+        gateway = LLMGateway(gemini_tools=TOOLS)
+
+    def uncached():
+        gateway.gemini_tools = TOOLS  # Drops compiled declarations and configs
+        return gateway._build_config(SYSTEM_PROMPT, with_tools=True)
+
+    def cached():
+        return gateway._build_config(SYSTEM_PROMPT, with_tools=True)
+
+    uncached()
+    cached()  # Warm-up
+    before = _per_call_us(uncached)
+    after = _per_call_us(cached)
+
+    print(f"\nLLMGateway config build ({len(TOOLS)} tools, {ITERATIONS} calls):")
+    print(f"  rebuilt per call  {before:8.1f} us")
+    print(f"  prebuilt (cached) {after:8.1f} us  ({before / after:.0f}x faster)")
+
+    assert cached() is cached()
+    assert after * 10 < before
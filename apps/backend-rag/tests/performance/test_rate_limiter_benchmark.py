@@ -0,0 +1,116 @@
+"""
+Load test for RateLimitMiddleware overhead per request
+
+Drives a trivial FastAPI app with concurrent requests and reports the extra
+latency the middleware adds, with the in-memory window and with Redis (one
+simulated network round-trip per script call), with and without the local
+token-bucket fast path:
+
+    pytest tests/performance/test_rate_limiter_benchmark.py -s
+"""
+
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from middleware import rate_limiter as rate_limiter_module
+from middleware.rate_limiter import RateLimiter, RateLimitMiddleware
+
+REQUESTS = 2000
+CONCURRENCY = 50
+USERS = 20
+REDIS_RTT = 0.0005  # 0.5 ms, same-region Redis
+
+
+class LatencyRedisScript:
+    """Sliding window script emulation that awaits a network round-trip per call."""
+
+    def __init__(self):
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.calls = 0
+
+    async def __call__(self, keys, args):
+        self.calls += 1
+        await asyncio.sleep(REDIS_RTT)
+        now, window, limit, requested, prefix = args
+        zset = self.zsets.setdefault(keys[0], {})
+        for member, score in list(zset.items()):
+            if score <= now - window:
+                del zset[member]
+        granted = max(0, min(requested, limit - len(zset)))
+        for i in range(1, granted + 1):
+            zset[f"{prefix}:{i}"] = now
+        return [granted, len(zset), min(zset.values(), default=now)]
+
+
+def _build_app(with_middleware: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/ping")
+    async def ping():
+        return {"ok": True}
+
+    if with_middleware:
+        app.add_middleware(RateLimitMiddleware)
+    return app
+
+
+async def _drive(app: FastAPI) -> float:
+    """Send REQUESTS requests with CONCURRENCY in flight; return mean seconds per request."""
+    transport = httpx.ASGITransport(app=app)
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def one(i: int) -> None:
+            async with semaphore:
+                await client.get("/api/ping", headers={"X-User-ID": f"user-{i % USERS}"})
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(REQUESTS)))
+        return (time.perf_counter() - start) / REQUESTS
+
+
+def _redis_limiter(local_batch_size: int) -> RateLimiter:
+    redis_client = MagicMock()
+    redis_client.register_script = MagicMock(return_value=LatencyRedisScript())
+    with patch("app.core.config.settings") as mock_settings:
+        mock_settings.redis_url = "redis://localhost:6379"
+        with patch("redis.asyncio.from_url", return_value=redis_client):
+            return RateLimiter(local_batch_size=local_batch_size)
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_rate_limit_middleware_overhead():
+    """Benchmark per-request middleware overhead for each limiter backend"""
+    baseline = await _drive(_build_app(with_middleware=False))
+
+    memory = RateLimiter()
+    memory.redis_available = False
+    scenarios = {
+        "memory": memory,
+        "redis, batch 1": _redis_limiter(local_batch_size=1),
+        "redis, batch 10": _redis_limiter(local_batch_size=10),
+    }
+
+    overhead = {}
+    for name, limiter in scenarios.items():
+        rate_limiter_module._rate_limit_storage.clear()
+        with patch.object(rate_limiter_module, "rate_limiter", limiter):
+            overhead[name] = (await _drive(_build_app(with_middleware=True)) - baseline) * 1e6
+
+    print(f"\nRateLimitMiddleware overhead ({REQUESTS} requests, {CONCURRENCY} concurrent):")
+    print(f"  no middleware     {baseline * 1e6:8.1f} us/request")
+    for name, extra in overhead.items():
+        limiter = scenarios[name]
+        calls = limiter._script.calls if limiter._script else 0
+        print(f"  {name:<17} {extra:+8.1f} us/request  ({calls} Redis round-trips)")
+
+    batched = scenarios["redis, batch 10"]
+    assert batched._script.calls * 5 < scenarios["redis, batch 1"]._script.calls
+    assert batched.get_stats()["local_hits"] > 0
@@ -0,0 +1,167 @@
+"""
+Latency and quality benchmark for re-ranking backends
+
+Compares the local ONNX cross-encoder against pass-through (vector order) on a
+fixed query set. Requires a quantized model directory:
+
+    RERANKER_ONNX_MODEL_PATH=/models/ms-marco-MiniLM-L-6-v2-int8 \
+        pytest tests/performance/test_reranker_benchmark.py -s
+"""
+
+import copy
+import os
+import time
+
+import pytest
+from core.reranker import LocalCrossEncoderReranker, PassThroughReranker
+
+MODEL_PATH = os.getenv("RERANKER_ONNX_MODEL_PATH")
+
+# (query, candidates in vector order, id of the relevant candidate)
+# The relevant document is deliberately never first, as in the hard cases the
+# re-ranker exists for.
+QUERY_SET = [
+    (
+        "How long can I stay in Indonesia with a visa on arrival?",
+        [
+            ("voa_fee", "The visa on arrival fee is paid at the airport counter in rupiah."),
+            (
+                "voa_stay",
+                "A visa on arrival allows a stay of 30 days, extendable once for 30 more days.",
+            ),
+            (
+                "kitas_sponsor",
+                "A KITAS requires a sponsor company or a spouse of Indonesian nationality.",
+            ),
+        ],
+        "voa_stay",
+    ),
+    (
+        "What is the minimum investment for a PT PMA company?",
+        [
+            ("pma_kbli", "Every PT PMA must register its business activities using KBLI codes."),
+            (
+                "pma_office",
+                "Foreign-owned companies need a registered office address in a commercial zone.",
+            ),
+            (
+                "pma_capital",
+                "A PT PMA must show a minimum investment plan above IDR 10 billion per KBLI.",
+            ),
+        ],
+        "pma_capital",
+    ),
+    (
+        "Which tax rate applies to small businesses under PP 55?",
+        [
+            ("vat_rate", "The standard VAT rate in Indonesia is 11 percent."),
+            (
+                "pp55_rate",
+                "Under PP 55/2022 small businesses pay a final tax of 0.5 percent of turnover.",
+            ),
+            ("pph21", "PPh 21 is withheld monthly by employers on employee salaries."),
+        ],
+        "pp55_rate",
+    ),
+    (
+        "Can foreigners own land in Bali?",
+        [
+            ("villa_rent", "Villa rental contracts in Bali are commonly signed for 25 years."),
+            ("imb_pbg", "Building approval (PBG) replaced the old IMB permit in 2021."),
+            (
+                "land_hak_pakai",
+                "Foreigners cannot hold freehold land but may hold Hak Pakai rights to use land.",
+            ),
+        ],
+        "land_hak_pakai",
+    ),
+    (
+        "How do I extend my KITAS?",
+        [
+            ("kitas_new", "A new KITAS application starts with an e-visa issued by immigration."),
+            (
+                "kitas_extend",
+                "KITAS extensions must be filed at the immigration office before the permit expires.",
+            ),
+            ("kitap", "After several consecutive KITAS renewals you may apply for a KITAP."),
+        ],
+        "kitas_extend",
+    ),
+    (
+        "What documents are required for a retirement visa?",
+        [
+            (
+                "tourist_docs",
+                "Tourist visas require a return ticket and a passport valid for six months.",
+            ),
+            ("digital_nomad", "The digital nomad visa requires proof of foreign income."),
+            (
+                "retirement_docs",
+                "A retirement visa requires proof of pension income, health insurance and age 60 or over.",
+            ),
+        ],
+        "retirement_docs",
+    ),
+]
+
+
+def _documents(candidates: list[tuple[str, str]]) -> list[dict]:
+    return [
+        {"id": doc_id, "text": text, "score": round(0.9 - i * 0.05, 2)}
+        for i, (doc_id, text) in enumerate(candidates)
+    ]
+
+
+async def _evaluate(reranker, iterations: int = 5) -> dict[str, float]:
+    """Return MRR, hit@1 and latency percentiles (ms) over the query set."""
+    reciprocal_ranks = []
+    latencies = []
+
+    for _ in range(iterations):
+        for query, candidates, relevant_id in QUERY_SET:
+            docs = copy.deepcopy(_documents(candidates))
+            start = time.perf_counter()
+            ranked = await reranker.rerank(query, docs, top_k=len(docs))
+            latencies.append((time.perf_counter() - start) * 1000)
+
+            ids = [d["id"] for d in ranked]
+            reciprocal_ranks.append(1.0 / (ids.index(relevant_id) + 1))
+
+    latencies.sort()
+    return {
+        "mrr": sum(reciprocal_ranks) / len(reciprocal_ranks),
+        "hit_at_1": sum(1 for rr in reciprocal_ranks if rr == 1.0) / len(reciprocal_ranks),
+        "p50_ms": latencies[len(latencies) // 2],
+        "p95_ms": latencies[int(len(latencies) * 0.95)],
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.slow
+@pytest.mark.performance
+@pytest.mark.skipif(not MODEL_PATH, reason="RERANKER_ONNX_MODEL_PATH not set")
+async def test_local_reranker_vs_passthrough():
+    """Benchmark local cross-encoder quality and latency against pass-through"""
+    pytest.importorskip("onnxruntime")
+    pytest.importorskip("tokenizers")
+
+    local = LocalCrossEncoderReranker(model_path=MODEL_PATH)
+    assert local.enabled, "Local cross-encoder failed to load"
+
+    # Warm-up (session initialisation, thread pool start)
+    await local.rerank("warm up", [{"text": "warm up document"}])
+
+    baseline = await _evaluate(PassThroughReranker())
+    result = await _evaluate(local)
+
+    print(f"\nRe-ranker benchmark ({len(QUERY_SET)} queries x 3 candidates):")
+    for name, stats in (("pass-through", baseline), ("local", result)):
+        print(
+            f"  {name:<13} MRR={stats['mrr']:.3f} hit@1={stats['hit_at_1']:.2f} "
+            f"p50={stats['p50_ms']:.2f}ms p95={stats['p95_ms']:.2f}ms"
+        )
+    print(f"  local stats: {local.get_stats()}")
+
+    assert baseline["hit_at_1"] == 0.0  # Fixed set: relevant doc never first
+    assert result["mrr"] > baseline["mrr"]
+    assert result["p95_ms"] < 500  # CPU budget for 3 short pairs
@@ -26,13 +26,18 @@ class TestSearchServicePerformance:
         # Mock CollectionManager
         collection_manager = Mock(spec=CollectionManager)
         mock_client = AsyncMock()
-        mock_client.search = AsyncMock(
-            return_value={
-                "documents": [f"Document {i}" for i in range(10)],
-                "metadatas": [{"tier": "A"} for _ in range(10)],
-                "distances": [0.1 + i * 0.05 for i in range(10)],
-                "ids": [f"doc_{i}" for i in range(10)],
-            }
+        search_result = {
+            "documents": [f"Document {i}" for i in range(10)],
+            "metadatas": [{"tier": "A"} for _ in range(10)],
+            "distances": [0.1 + i * 0.05 for i in range(10)],
+            "ids": [f"doc_{i}" for i in range(10)],
+        }
+        mock_client.search = AsyncMock(return_value=search_result)
+        mock_client.search_batch = AsyncMock(
+            side_effect=lambda searches: [search_result for _ in searches]
+        )
+        mock_client.hybrid_search_batch = AsyncMock(
+            side_effect=lambda searches: [search_result for _ in searches]
         )
         collection_manager.get_collection.return_value = mock_client
 
@@ -65,6 +70,10 @@ class TestSearchServicePerformance:
         with patch("core.embeddings.create_embeddings_generator") as mock_create:
             mock_embedder = Mock()
             mock_embedder.generate_query_embedding.return_value = [0.1] * 1536
+            # Concurrent queries are coalesced into one generate_embeddings batch
+            mock_embedder.generate_embeddings.side_effect = lambda texts: [
+                [0.1] * 1536 for _ in texts
+            ]
             mock_embedder.provider = "openai"
             mock_embedder.dimensions = 1536
             mock_create.return_value = mock_embedder
@@ -298,6 +298,71 @@ class TestQdrantDB95Coverage:
         result = await client.create_collection(on_disk_payload=True)
         assert result is True
 
+    async def test_create_collection_with_quantization_profile(self):
+        """Test profile sets quantization, on-disk originals and HNSW config"""
+        client = QdrantClient()
+
+        mock_response = MagicMock()
+        mock_response.raise_for_status = MagicMock()
+        mock_client = AsyncMock()
+        mock_client.put = AsyncMock(return_value=mock_response)
+        client._http_client = mock_client
+
+        result = await client.create_collection(
+            enable_sparse=True, profile="scalar_int8", hnsw_config={"m": 32}
+        )
+
+        assert result is True
+        payload = mock_client.put.call_args.kwargs["json"]
+        assert payload["vectors"]["dense"]["on_disk"] is True
+        assert payload["quantization_config"]["scalar"]["type"] == "int8"
+        assert payload["hnsw_config"] == {"m": 32, "ef_construct": 128}
+
+    async def test_create_collection_unknown_profile(self):
+        """Test unknown profiles are rejected"""
+        with pytest.raises(ValueError):
+            await QdrantClient().create_collection(profile="fp8")
+
+    async def test_search_sends_profile_search_params(self):
+        """Test quantized collections search with rescore/oversampling params"""
+        client = QdrantClient(profile="binary")
+
+        mock_response = MagicMock()
+        mock_response.raise_for_status = MagicMock()
+        mock_response.json.return_value = {"result": []}
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(return_value=mock_response)
+        client._http_client = mock_client
+
+        await client.search([0.1] * 4, limit=5)
+
+        params = mock_client.post.call_args.kwargs["json"]["params"]
+        assert params["quantization"] == {"rescore": True, "oversampling": 3.0}
+
+    async def test_switch_alias_replaces_existing_alias(self):
+        """Test alias switch deletes and re-creates the alias in one request"""
+        client = QdrantClient()
+
+        aliases_response = MagicMock()
+        aliases_response.raise_for_status = MagicMock()
+        aliases_response.json.return_value = {
+            "result": {"aliases": [{"alias_name": "legal", "collection_name": "legal_v1"}]}
+        }
+        ok_response = MagicMock()
+        ok_response.raise_for_status = MagicMock()
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(return_value=aliases_response)
+        mock_client.post = AsyncMock(return_value=ok_response)
+        client._http_client = mock_client
+
+        await client.switch_alias("legal", "legal__scalar_int8")
+
+        actions = mock_client.post.call_args.kwargs["json"]["actions"]
+        assert actions == [
+            {"delete_alias": {"alias_name": "legal"}},
+            {"create_alias": {"collection_name": "legal__scalar_int8", "alias_name": "legal"}},
+        ]
+
     async def test_create_collection_http_error(self):
         """Test creating collection with HTTP error"""
         client = QdrantClient()
@@ -420,6 +485,131 @@ class TestQdrantDB95Coverage:
         assert result["success"] is False
         assert "error" in result
 
+    async def test_upsert_documents_pipelined_with_consistency_check(self):
+        """Test pipelined upload: wait=false batches, then a visibility check"""
+        client = QdrantClient()
+
+        mock_response = MagicMock()
+        mock_response.raise_for_status = MagicMock()
+        check_response = MagicMock()
+        check_response.raise_for_status = MagicMock()
+        check_response.json.return_value = {"result": [{"id": f"id{i}"} for i in range(6)]}
+
+        mock_client = AsyncMock()
+        mock_client.put = AsyncMock(return_value=mock_response)
+        mock_client.post = AsyncMock(return_value=check_response)
+        client._http_client = mock_client
+
+        result = await client.upsert_documents(
+            chunks=[f"doc{i}" for i in range(6)],
+            embeddings=[[0.1] * 4 for _ in range(6)],
+            metadatas=[{} for _ in range(6)],
+            ids=[f"id{i}" for i in range(6)],
+            batch_size=2,
+            max_in_flight=3,
+        )
+
+        assert result["success"] is True
+        assert result["documents_added"] == 6
+        assert mock_client.put.call_count == 3
+        assert all(c.kwargs["params"] == {"wait": "false"} for c in mock_client.put.call_args_list)
+        mock_client.post.assert_called_once()
+        assert mock_client.post.call_args.kwargs["json"]["ids"] == [f"id{i}" for i in range(6)]
+
+    async def test_upsert_documents_pipelined_resends_missing_points(self):
+        """Test points not visible after the pipelined upload are re-sent with wait=true"""
+        client = QdrantClient()
+
+        mock_response = MagicMock()
+        mock_response.raise_for_status = MagicMock()
+        check_response = MagicMock()
+        check_response.raise_for_status = MagicMock()
+        check_response.json.return_value = {"result": [{"id": "id0"}]}
+
+        mock_client = AsyncMock()
+        mock_client.put = AsyncMock(return_value=mock_response)
+        mock_client.post = AsyncMock(return_value=check_response)
+        client._http_client = mock_client
+
+        with (
+            patch.object(qdrant_db_module, "CONSISTENCY_CHECK_RETRIES", 1),
+            patch.object(qdrant_db_module, "CONSISTENCY_CHECK_DELAY", 0),
+        ):
+            result = await client.upsert_documents(
+                chunks=["doc0", "doc1"],
+                embeddings=[[0.1] * 4, [0.2] * 4],
+                metadatas=[{}, {}],
+                ids=["id0", "id1"],
+                batch_size=1,
+                max_in_flight=2,
+            )
+
+        assert result["success"] is True
+        resend = mock_client.put.call_args_list[-1]
+        assert resend.kwargs["params"] == {"wait": "true"}
+        assert [p["id"] for p in resend.kwargs["json"]["points"]] == ["id1"]
+
+    async def test_upsert_documents_large_batch_encoded_off_loop(self):
+        """Test large batches are encoded to JSON bytes in a worker thread"""
+        client = QdrantClient()
+
+        mock_response = MagicMock()
+        mock_response.raise_for_status = MagicMock()
+        mock_client = AsyncMock()
+        mock_client.put = AsyncMock(return_value=mock_response)
+        client._http_client = mock_client
+
+        with (
+            patch.object(qdrant_db_module, "JSON_OFFLOAD_MIN_FLOATS", 4),
+            patch.object(
+                qdrant_db_module.asyncio, "to_thread", wraps=qdrant_db_module.asyncio.to_thread
+            ) as to_thread,
+        ):
+            result = await client.upsert_documents(
+                chunks=["doc0", "doc1"],
+                embeddings=[[0.1, 0.2], [0.3, 0.4]],
+                metadatas=[{}, {}],
+                ids=["id0", "id1"],
+            )
+
+        assert result["success"] is True
+        to_thread.assert_called_once()
+        kwargs = mock_client.put.call_args.kwargs
+        assert "json" not in kwargs
+        payload = qdrant_db_module.json.loads(kwargs["content"])
+        assert [p["id"] for p in payload["points"]] == ["id0", "id1"]
+        assert payload["points"][1]["vector"] == pytest.approx([0.3, 0.4])
+
+    async def test_upsert_sparse_large_batch_keeps_integer_indices(self):
+        """Test offloaded encoding leaves BM25 sparse indices as exact integers"""
+        client = QdrantClient()
+
+        mock_response = MagicMock()
+        mock_response.raise_for_status = MagicMock()
+        mock_client = AsyncMock()
+        mock_client.put = AsyncMock(return_value=mock_response)
+        client._http_client = mock_client
+        sparse = {"indices": [123456789, 4294967295, 5], "values": [1.5, 0.25, 2.0]}
+
+        with (
+            patch.object(qdrant_db_module, "JSON_OFFLOAD_MIN_FLOATS", 4),
+            patch.object(client, "_get_corpus_stats", return_value=None),
+        ):
+            result = await client.upsert_documents_with_sparse(
+                chunks=["doc0"],
+                embeddings=[[0.1, 0.2, 0.3]],
+                sparse_vectors=[sparse],
+                metadatas=[{}],
+                ids=["id0"],
+            )
+
+        assert result["success"] is True
+        content = mock_client.put.call_args.kwargs["content"]
+        assert b'"indices":[123456789,4294967295,5]' in content
+        vector = qdrant_db_module.json.loads(content)["points"][0]["vector"]
+        assert vector["bm25"] == sparse
+        assert vector["dense"] == pytest.approx([0.1, 0.2, 0.3])
+
     async def test_get_success(self):
         """Test getting points by IDs successfully"""
         client = QdrantClient()
@@ -533,6 +723,259 @@ class TestQdrantDB95Coverage:
         with pytest.raises(ConnectionError):
             await client.delete(["1"])
 
+    async def test_delete_updates_bm25_corpus_stats(self):
+        """Test deleting points removes them from BM25 corpus statistics"""
+        from core.bm25_stats import BM25CorpusStats
+
+        client = QdrantClient(collection_name="legal")
+        corpus_stats = BM25CorpusStats()
+        corpus_stats.add_documents("legal", [([1, 2], 2), ([2, 3], 2)])
+
+        fetch_response = MagicMock()
+        fetch_response.raise_for_status = MagicMock()
+        fetch_response.json.return_value = {
+            "result": [
+                {
+                    "id": "1",
+                    "payload": {"bm25_length": 2},
+                    "vector": {"bm25": {"indices": [1, 2], "values": [1.0, 1.0]}},
+                }
+            ]
+        }
+        delete_response = MagicMock()
+        delete_response.raise_for_status = MagicMock()
+
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(side_effect=[fetch_response, delete_response])
+        client._http_client = mock_client
+
+        with patch.object(client, "_get_corpus_stats", return_value=corpus_stats):
+            result = await client.delete(["1"])
+
+        assert result["success"] is True
+        assert corpus_stats.doc_count("legal") == 1
+        assert corpus_stats.get_stats()["collections"]["legal"]["unique_tokens"] == 2
+
+    async def test_upsert_with_sparse_updates_bm25_corpus_stats(self):
+        """Test upserting replaces old points in BM25 corpus statistics"""
+        from core.bm25_stats import BM25CorpusStats
+
+        client = QdrantClient(collection_name="legal")
+        corpus_stats = BM25CorpusStats()
+        corpus_stats.add_documents("legal", [([7], 1)])
+
+        fetch_response = MagicMock()
+        fetch_response.raise_for_status = MagicMock()
+        fetch_response.json.return_value = {
+            "result": [
+                {
+                    "id": "1",
+                    "payload": {"text": "hotel"},
+                    "vector": {"bm25": {"indices": [7], "values": [1.0]}},
+                }
+            ]
+        }
+        put_response = MagicMock()
+        put_response.raise_for_status = MagicMock()
+
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(return_value=fetch_response)
+        mock_client.put = AsyncMock(return_value=put_response)
+        client._http_client = mock_client
+
+        with patch.object(client, "_get_corpus_stats", return_value=corpus_stats):
+            result = await client.upsert_documents_with_sparse(
+                chunks=["izin usaha restoran", "izin tinggal"],
+                embeddings=[[0.1] * 4, [0.2] * 4],
+                sparse_vectors=[
+                    {"indices": [1, 2, 3], "values": [1.0, 1.0, 1.0]},
+                    {"indices": [1, 4], "values": [1.0, 1.0]},
+                ],
+                metadatas=[{}, {}],
+                ids=["1", "2"],
+            )
+
+        assert result["success"] is True
+        assert corpus_stats.doc_count("legal") == 2
+        assert corpus_stats.avg_doc_length("legal") == 2.5
+        assert corpus_stats.idf("legal", 7) == corpus_stats.idf("legal", 99)
+
+    async def test_upsert_with_sparse_reads_stored_bm25_length(self):
+        """Test replaced points use the stored token count instead of re-fetching text"""
+        from core.bm25_stats import BM25CorpusStats
+
+        client = QdrantClient(collection_name="legal")
+        corpus_stats = BM25CorpusStats()
+        corpus_stats.add_documents("legal", [([7], 4)])
+
+        fetch_response = MagicMock()
+        fetch_response.raise_for_status = MagicMock()
+        fetch_response.json.return_value = {
+            "result": [
+                {
+                    "id": "1",
+                    "payload": {"bm25_length": 4},
+                    "vector": {"bm25": {"indices": [7], "values": [1.0]}},
+                }
+            ]
+        }
+        put_response = MagicMock()
+        put_response.raise_for_status = MagicMock()
+
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(return_value=fetch_response)
+        mock_client.put = AsyncMock(return_value=put_response)
+        client._http_client = mock_client
+
+        with patch.object(client, "_get_corpus_stats", return_value=corpus_stats):
+            result = await client.upsert_documents_with_sparse(
+                chunks=["izin usaha restoran"],
+                embeddings=[[0.1] * 4],
+                sparse_vectors=[{"indices": [1, 2, 3], "values": [1.0, 1.0, 1.0]}],
+                metadatas=[{}],
+                ids=["1"],
+            )
+
+        assert result["success"] is True
+        assert mock_client.post.await_count == 1
+        assert mock_client.post.call_args.kwargs["json"]["with_payload"] == ["bm25_length"]
+        assert corpus_stats.doc_count("legal") == 1
+        assert corpus_stats.avg_doc_length("legal") == 3
+        points = mock_client.put.call_args.kwargs["json"]["points"]
+        assert points[0]["payload"]["bm25_length"] == 3
+
+    async def test_search_batch_groups_by_collection(self):
+        """Test search_batch sends one batch request per collection, preserving order"""
+        client = QdrantClient(collection_name="legal_unified")
+
+        def point(point_id, score):
+            return {"id": point_id, "score": score, "payload": {"text": point_id, "metadata": {}}}
+
+        def batch_response(url, json):
+            response = MagicMock()
+            response.raise_for_status = MagicMock()
+            prefix = url.split("/")[2]
+            response.json.return_value = {
+                "result": [[point(f"{prefix}-{i}", 0.9)] for i in range(len(json["searches"]))]
+            }
+            return response
+
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(side_effect=batch_response)
+        client._http_client = mock_client
+
+        results = await client.search_batch(
+            [
+                {"query_embedding": [0.1] * 4, "limit": 3},
+                {"collection": "visa_oracle", "query_embedding": [0.2] * 4},
+                {"query_embedding": [0.3] * 4, "filter": {"tier": {"$in": ["S"]}}},
+            ]
+        )
+
+        assert mock_client.post.await_count == 2
+        urls = [c.args[0] for c in mock_client.post.await_args_list]
+        assert urls == [
+            "/collections/legal_unified/points/search/batch",
+            "/collections/visa_oracle/points/search/batch",
+        ]
+        assert [r["ids"] for r in results] == [
+            ["legal_unified-0"],
+            ["visa_oracle-0"],
+            ["legal_unified-1"],
+        ]
+        assert results[0]["distances"] == [pytest.approx(0.1)]
+
+    async def test_search_batch_retries_with_named_vectors(self):
+        """Test search_batch retries with the 'dense' vector name on named-vector collections"""
+        client = QdrantClient(collection_name="legal_unified")
+
+        error_response = MagicMock()
+        error_response.status_code = 400
+        error_response.text = "Wrong input: Vector params for  are not specified in config"
+        ok_response = MagicMock()
+        ok_response.raise_for_status = MagicMock()
+        ok_response.json.return_value = {
+            "result": [[{"id": "a", "score": 0.9, "payload": {"text": "a", "metadata": {}}}]]
+        }
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(
+            side_effect=[
+                httpx.HTTPStatusError("Bad", request=MagicMock(), response=error_response),
+                ok_response,
+            ]
+        )
+        client._http_client = mock_client
+
+        results = await client.search_batch([{"query_embedding": [0.1] * 4}])
+
+        assert mock_client.post.await_count == 2
+        request = mock_client.post.await_args.kwargs["json"]["searches"][0]
+        assert request["vector"] == {"name": "dense", "vector": [0.1] * 4}
+        assert results[0]["ids"] == ["a"]
+
+    async def test_hybrid_search_batch_single_request(self):
+        """Test hybrid_search_batch puts dense + sparse prefetch in one query batch"""
+        client = QdrantClient(collection_name="legal_unified")
+
+        mock_response = MagicMock()
+        mock_response.raise_for_status = MagicMock()
+        mock_response.json.return_value = {
+            "result": [
+                {"points": [{"id": "a", "score": 0.5, "payload": {"text": "A"}}]},
+                {"points": []},
+            ]
+        }
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(return_value=mock_response)
+        client._http_client = mock_client
+
+        results = await client.hybrid_search_batch(
+            [
+                {
+                    "query_embedding": [0.1] * 4,
+                    "query_sparse": {"indices": [1, 2], "values": [0.5, 0.5]},
+                    "prefetch_limit": 10,
+                },
+                {"query_embedding": [0.2] * 4},
+            ]
+        )
+
+        mock_client.post.assert_awaited_once()
+        payload = mock_client.post.await_args.kwargs["json"]["searches"]
+        assert [p["using"] for p in payload[0]["prefetch"]] == ["dense", "bm25"]
+        assert payload[1]["using"] == "dense"
+        assert results[0]["ids"] == ["a"]
+        assert results[0]["search_type"] == "hybrid_rrf"
+        assert results[1]["total_found"] == 0
+
+    async def test_hybrid_search_batch_falls_back_to_dense(self):
+        """Test hybrid_search_batch falls back to search_batch without sparse vectors"""
+        client = QdrantClient(collection_name="legal_unified")
+
+        error_response = MagicMock()
+        error_response.status_code = 400
+        error_response.text = "Wrong input: Not existing vector name: bm25"
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(
+            side_effect=httpx.HTTPStatusError("Bad", request=MagicMock(), response=error_response)
+        )
+        client._http_client = mock_client
+
+        with patch.object(
+            client, "search_batch", new_callable=AsyncMock, return_value=[{"ids": ["x"]}]
+        ) as mock_search_batch:
+            results = await client.hybrid_search_batch(
+                [
+                    {
+                        "query_embedding": [0.1] * 4,
+                        "query_sparse": {"indices": [1], "values": [1.0]},
+                    }
+                ]
+            )
+
+        mock_search_batch.assert_awaited_once()
+        assert results == [{"ids": ["x"]}]
+
     async def test_peek_success(self):
         """Test peeking at points successfully"""
         client = QdrantClient()
@@ -21,9 +21,9 @@ from services.rag.agentic import (
     CalculatorTool,
     VectorSearchTool,
 )
-from services.rag.agentic.tool_executor import parse_tool_call_regex
 from services.rag.agentic.prompt_builder import SystemPromptBuilder
 from services.rag.agentic.response_processor import post_process_response
+from services.rag.agentic.tool_executor import parse_tool_call_regex
 from services.response.cleaner import clean_response, is_out_of_domain
 
 
@@ -36,7 +36,9 @@ def mock_genai_client():
     # Create the nested async mock structure: _client.aio.models.generate_content
     mock_response = MagicMock()
     mock_response.text = "Final Answer: The answer is 10."
-    mock_response.candidates = [MagicMock(content=MagicMock(parts=[MagicMock(text="Final Answer: The answer is 10.")]))]
+    mock_response.candidates = [
+        MagicMock(content=MagicMock(parts=[MagicMock(text="Final Answer: The answer is 10.")]))
+    ]
 
     mock_client._client = MagicMock()
     mock_client._client.aio = MagicMock()
@@ -51,7 +53,9 @@ def orchestrator(mock_genai_client):
     """Create AgenticRAGOrchestrator with mocked GenAI client"""
     # Patch the correct module paths - GENAI_AVAILABLE is in llm_gateway
     with patch("services.rag.agentic.llm_gateway.GENAI_AVAILABLE", True):
-        with patch("services.rag.agentic.llm_gateway.get_genai_client", return_value=mock_genai_client):
+        with patch(
+            "services.rag.agentic.llm_gateway.get_genai_client", return_value=mock_genai_client
+        ):
             with patch("services.rag.agentic.orchestrator.settings") as mock_settings:
                 mock_settings.google_api_key = "test-api-key"
                 orch = AgenticRAGOrchestrator(tools=[CalculatorTool()])
@@ -84,12 +88,15 @@ async def test_vector_search_tool():
     res = await tool.execute("query")
     # Result is now JSON with content and sources
     import json
+
     result = json.loads(res)
     assert "Found it" in result["content"]
     assert len(result["sources"]) == 1
 
 
-@pytest.mark.skip(reason="Test uses deprecated model.start_chat API - orchestrator was refactored to use LLMGateway")
+@pytest.mark.skip(
+    reason="Test uses deprecated model.start_chat API - orchestrator was refactored to use LLMGateway"
+)
 @pytest.mark.asyncio
 async def test_agent_process_query_flow(orchestrator):
     """Test the ReAct loop - SKIPPED: Requires full integration test with mocked LLMGateway"""
@@ -111,7 +118,9 @@ def test_parse_tool_call():
     assert call2.arguments["expression"] == "1+1"
 
 
-@pytest.mark.skip(reason="Test uses deprecated model.start_chat API - orchestrator was refactored to use LLMGateway")
+@pytest.mark.skip(
+    reason="Test uses deprecated model.start_chat API - orchestrator was refactored to use LLMGateway"
+)
 @pytest.mark.asyncio
 async def test_agent_stream_flow(orchestrator):
     """Test the Streaming ReAct loop - SKIPPED: Requires full integration test with mocked LLMGateway"""
@@ -178,6 +187,20 @@ def test_build_system_prompt_without_query(prompt_builder):
     # Should not crash
 
 
+def test_build_system_prompt_cache_invalidated_per_user(prompt_builder):
+    """Test cached prompts are reused and dropped by invalidate_user"""
+    context = {"profile": {"role": "user"}}
+
+    first = prompt_builder.build_system_prompt("a@example.com", context, "Berapa biaya KITAS?")
+    prompt_builder.build_system_prompt("b@example.com", context, "Berapa biaya KITAS?")
+    assert (
+        prompt_builder.build_system_prompt("a@example.com", context, "Berapa biaya KITAS?") is first
+    )
+
+    assert prompt_builder.invalidate_user("a@example.com") == 1
+    assert prompt_builder._cache.get_stats()["entries"] == 1
+
+
 # ============================================================================
 # CLEAN RESPONSE TESTS
 # ============================================================================
@@ -302,7 +325,9 @@ def test_post_process_response_cleans_internal_reasoning():
 def test_post_process_response_formats_procedural_questions():
     """Test that post_process_response formats procedural questions as numbered lists"""
     query = "Come faccio a richiedere il KITAS?"
-    response = "Prepara i documenti necessari. Trova uno sponsor locale. Applica online al sito ufficiale."
+    response = (
+        "Prepara i documenti necessari. Trova uno sponsor locale. Applica online al sito ufficiale."
+    )
     processed = post_process_response(response, query)
     # Should contain numbered list (if actionable sentences detected)
     # Note: The processor only formats if it detects action verbs
@@ -0,0 +1,202 @@
+"""
+Unit tests for GeminiContextCache and its use by LLMGateway
+
+Runs offline against FakeGeminiProvider, a local stand-in for the parts of
+the google-genai client the cache touches (aio.caches create/update/delete
+and aio.models.generate_content with cached_content usage reporting).
+"""
+
+import itertools
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from services.rag.agentic import context_cache as context_cache_module
+from services.rag.agentic import llm_gateway as llm_gateway_module
+from services.rag.agentic.context_cache import GeminiContextCache
+from services.rag.agentic.llm_gateway import TIER_FLASH, LLMGateway
+from services.rag.agentic.prompt_builder import CACHEABLE_PREFIX_BOUNDARY, split_system_prompt
+
+pytestmark = pytest.mark.skipif(
+    context_cache_module.types is None, reason="google-genai not installed"
+)
+
+STABLE_PREFIX = "You are ZANTARA, the Bali Zero assistant. " * 50
+SYSTEM_PROMPT = f"{STABLE_PREFIX}{CACHEABLE_PREFIX_BOUNDARY}\nUser memory: prefers Italian\n"
+
+
+def _count_tokens(text: str) -> int:
+    return len(text.split())
+
+
+class FakeGeminiProvider:
+    """In-memory emulation of the google-genai caches and generate_content APIs."""
+
+    def __init__(self, min_cache_chars: int = 0):
+        self.min_cache_chars = min_cache_chars
+        self.contents: dict[str, dict] = {}
+        self.calls: list[dict] = []
+        self.create_calls = 0
+        self.update_calls = 0
+        self.deleted: list[str] = []
+        self._ids = itertools.count(1)
+        self.aio = SimpleNamespace(
+            caches=SimpleNamespace(create=self._create, update=self._update, delete=self._delete),
+            models=SimpleNamespace(generate_content=self._generate_content),
+        )
+
+    async def _create(self, model, config):
+        self.create_calls += 1
+        if len(config.system_instruction) < self.min_cache_chars:
+            raise ValueError("Cached content is too small")
+        name = f"cachedContents/{next(self._ids)}"
+        self.contents[name] = {"model": model, "text": config.system_instruction}
+        return SimpleNamespace(name=name)
+
+    async def _update(self, name, config):
+        self.update_calls += 1
+        if name not in self.contents:
+            raise ValueError(f"{name} not found")
+        return SimpleNamespace(name=name)
+
+    async def _delete(self, name):
+        self.deleted.append(name)
+        self.contents.pop(name, None)
+
+    async def _generate_content(self, model, contents, config):
+        self.calls.append({"model": model, "contents": contents, "config": config})
+        cached = 0
+        if config.cached_content:
+            if config.cached_content not in self.contents:
+                raise ValueError(f"{config.cached_content} not found")
+            cached = _count_tokens(self.contents[config.cached_content]["text"])
+            sent = " ".join(part.text for part in contents[0].parts)
+        else:
+            sent = f"{config.system_instruction or ''} {contents}"
+        return SimpleNamespace(
+            text="ok",
+            candidates=[],
+            usage_metadata=SimpleNamespace(
+                prompt_token_count=cached + _count_tokens(sent),
+                cached_content_token_count=cached or None,
+            ),
+        )
+
+
+@pytest.fixture
+def provider():
+    return FakeGeminiProvider()
+
+
+class TestGeminiContextCache:
+    @pytest.mark.asyncio
+    async def test_creates_once_then_hits(self, provider):
+        cache = GeminiContextCache(provider, min_chars=100)
+
+        first = await cache.get("gemini-flash", STABLE_PREFIX)
+        second = await cache.get("gemini-flash", STABLE_PREFIX)
+
+        assert first == second == "cachedContents/1"
+        assert provider.create_calls == 1
+        assert cache.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_short_prefix_not_cached(self, provider):
+        cache = GeminiContextCache(provider, min_chars=100)
+
+        assert await cache.get("gemini-flash", "short") is None
+        assert provider.create_calls == 0
+
+    @pytest.mark.asyncio
+    async def test_renews_handle_near_expiry(self, provider):
+        cache = GeminiContextCache(provider, ttl_seconds=600, min_chars=100)
+        name = await cache.get("gemini-flash", STABLE_PREFIX)
+        key = cache.key_for("gemini-flash", STABLE_PREFIX, False)
+        cache._entries[key].expires_at = time.time() + 60  # Inside renewal window
+
+        assert await cache.get("gemini-flash", STABLE_PREFIX) == name
+        assert provider.update_calls == 1
+        assert provider.create_calls == 1
+        assert cache._entries[key].expires_at > time.time() + 500
+
+    @pytest.mark.asyncio
+    async def test_recreates_expired_handle(self, provider):
+        cache = GeminiContextCache(provider, min_chars=100)
+        await cache.get("gemini-flash", STABLE_PREFIX)
+        key = cache.key_for("gemini-flash", STABLE_PREFIX, False)
+        cache._entries[key].expires_at = time.time() + 1
+
+        assert await cache.get("gemini-flash", STABLE_PREFIX) == "cachedContents/2"
+        assert provider.update_calls == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_create_backs_off(self):
+        provider = FakeGeminiProvider(min_cache_chars=10**6)
+        cache = GeminiContextCache(provider, min_chars=100)
+
+        assert await cache.get("gemini-flash", STABLE_PREFIX) is None
+        assert await cache.get("gemini-flash", STABLE_PREFIX) is None
+        assert provider.create_calls == 1
+        assert cache.get_stats()["failures"] == 1
+        assert cache._locks == {}  # No lock left behind per failed prefix
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_deletes_remote_content(self, provider):
+        cache = GeminiContextCache(provider, min_chars=10, max_entries=2)
+
+        for i in range(3):
+            await cache.get("gemini-flash", f"{STABLE_PREFIX} variant {i}")
+
+        assert provider.deleted == ["cachedContents/1"]
+        assert list(provider.contents) == ["cachedContents/2", "cachedContents/3"]
+        assert cache.get_stats()["evictions"] == 1
+
+
+class TestSplitSystemPrompt:
+    def test_splits_at_boundary(self):
+        prefix, suffix = split_system_prompt(SYSTEM_PROMPT)
+
+        assert prefix == STABLE_PREFIX
+        assert suffix.startswith(CACHEABLE_PREFIX_BOUNDARY)
+        assert prefix + suffix == SYSTEM_PROMPT
+
+    def test_no_boundary_is_all_variable(self):
+        assert split_system_prompt("Just a question") == ("", "Just a question")
+
+
+class TestLLMGatewayContextCache:
+    @pytest.fixture
+    def gateway(self, provider):
+        genai_client = MagicMock()
+        genai_client.is_available = True
+        genai_client._client = provider
+        with patch("services.rag.agentic.llm_gateway.get_genai_client", return_value=genai_client):
+            yield LLMGateway(context_cache=GeminiContextCache(provider, min_chars=100))
+
+    @pytest.mark.asyncio
+    async def test_sends_cached_content_and_variable_suffix(self, gateway, provider):
+        with patch.object(llm_gateway_module, "llm_cached_prompt_tokens") as cached_tokens:
+            await gateway.send_message(None, "Berapa biaya KITAS?", SYSTEM_PROMPT, tier=TIER_FLASH)
+
+        request = provider.calls[0]
+        assert request["config"].cached_content == "cachedContents/1"
+        assert request["config"].system_instruction is None
+        texts = [part.text for part in request["contents"][0].parts]
+        assert texts[0].startswith(CACHEABLE_PREFIX_BOUNDARY)
+        assert texts[1] == "Berapa biaya KITAS?"
+        cached_tokens.labels.return_value.inc.assert_called_once_with(_count_tokens(STABLE_PREFIX))
+
+    @pytest.mark.asyncio
+    async def test_rejected_cache_falls_back_inline(self, gateway, provider):
+        await gateway.send_message(None, "first", SYSTEM_PROMPT, tier=TIER_FLASH)
+        provider.contents.clear()  # Expired or deleted on the provider side
+
+        text, _, _ = await gateway.send_message(None, "second", SYSTEM_PROMPT, tier=TIER_FLASH)
+
+        assert text == "ok"
+        retry = provider.calls[-1]
+        assert retry["config"].cached_content is None
+        assert retry["config"].system_instruction == SYSTEM_PROMPT
+        assert gateway._context_cache.get_stats()["entries"] == 0
@@ -21,10 +21,11 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from google.api_core.exceptions import ResourceExhausted, ServiceUnavailable
 
+from services.rag.agentic import llm_gateway as llm_gateway_module
 from services.rag.agentic.llm_gateway import (
+    TIER_FALLBACK,
     TIER_FLASH,
     TIER_LITE,
-    TIER_FALLBACK,
     TIER_PRO,
     LLMGateway,
 )
@@ -71,7 +72,9 @@ def llm_gateway(mock_settings, mock_genai_client):
     """Create LLMGateway instance with mocked dependencies."""
     with patch("services.rag.agentic.llm_gateway.GENAI_AVAILABLE", True):
         # Patch get_genai_client which is called by LLMGateway.__init__
-        with patch("services.rag.agentic.llm_gateway.get_genai_client", return_value=mock_genai_client):
+        with patch(
+            "services.rag.agentic.llm_gateway.get_genai_client", return_value=mock_genai_client
+        ):
             gateway = LLMGateway(gemini_tools=[])
             return gateway
 
@@ -179,17 +182,17 @@ class TestLLMGatewaySendMessage:
     async def test_function_calling_enabled(self, llm_gateway, mock_genai_client):
         """Test that function calling is enabled when tools are provided."""
         # Tool must have name, description, and parameters (matching GenAI SDK format)
-        llm_gateway.gemini_tools = [{
-            "name": "test_tool",
-            "description": "A test tool for testing",
-            "parameters": {
-                "type": "OBJECT",
-                "properties": {
-                    "arg1": {"type": "STRING", "description": "First argument"}
+        llm_gateway.gemini_tools = [
+            {
+                "name": "test_tool",
+                "description": "A test tool for testing",
+                "parameters": {
+                    "type": "OBJECT",
+                    "properties": {"arg1": {"type": "STRING", "description": "First argument"}},
+                    "required": ["arg1"],
                 },
-                "required": ["arg1"]
             }
-        }]
+        ]
 
         mock_response = MagicMock()
         mock_response.text = "Response with tool call"
@@ -288,7 +291,9 @@ class TestLLMGatewayFallbackCascade:
             )
 
     @pytest.mark.asyncio
-    async def test_complete_cascade_flash_raises_when_all_fail(self, llm_gateway, mock_genai_client):
+    async def test_complete_cascade_flash_raises_when_all_fail(
+        self, llm_gateway, mock_genai_client
+    ):
         """Test complete cascade: Flash → Fallback → RuntimeError (no OpenRouter)."""
 
         async def mock_generate_content(model, contents, config=None):
@@ -527,3 +532,160 @@ class TestLLMGatewayCreateChatWithHistory:
         call_args = mock_genai_client.create_chat.call_args
         # TIER_LITE uses model_name_flash (gemini-2.5-flash) in create_chat_with_history
         assert call_args[1]["model"] == "gemini-2.5-flash"
+
+
+def _stream_chunk(text=None, function_call=None):
+    """Build a generate_content_stream chunk with one text or function call part."""
+    part = MagicMock()
+    part.text = text
+    part.function_call = function_call
+    chunk = MagicMock()
+    chunk.candidates = [MagicMock()]
+    chunk.candidates[0].content.parts = [part]
+    return chunk
+
+
+def _stream_of(*items):
+    """Async generate_content_stream replacement yielding chunks, or raising exceptions."""
+
+    async def generate_content_stream(**kwargs):
+        async def chunks():
+            for item in items:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+
+        return chunks()
+
+    return generate_content_stream
+
+
+class TestLLMGatewaySendMessageStream:
+    """Test suite for send_message_stream."""
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_tokens_and_done(self, llm_gateway, mock_genai_client):
+        """Test that text parts are forwarded as tokens as they arrive."""
+        mock_genai_client._client.aio.models.generate_content_stream = _stream_of(
+            _stream_chunk("Final Answer: "), _stream_chunk("KITAS is a permit.")
+        )
+
+        events = [e async for e in llm_gateway.send_message_stream(None, "What is KITAS?")]
+
+        assert events[0] == {"type": "model", "data": "gemini-2.5-flash"}
+        assert [e["data"] for e in events if e["type"] == "token"] == [
+            "Final Answer: ",
+            "KITAS is a permit.",
+        ]
+        assert events[-1] == {
+            "type": "done",
+            "data": {"text": "Final Answer: KITAS is a permit.", "model": "gemini-2.5-flash"},
+        }
+
+    @pytest.mark.asyncio
+    async def test_stream_detects_function_call(self, llm_gateway, mock_genai_client):
+        """Test that a function call part is surfaced as its own event."""
+        function_call = MagicMock()
+        function_call.name = "vector_search"
+        mock_genai_client._client.aio.models.generate_content_stream = _stream_of(
+            _stream_chunk(function_call=function_call)
+        )
+
+        events = [e async for e in llm_gateway.send_message_stream(None, "What is KITAS?")]
+
+        calls = [e for e in events if e["type"] == "function_call"]
+        assert len(calls) == 1
+        assert calls[0]["data"].function_call is function_call
+        assert not [e for e in events if e["type"] == "token"]
+
+    @pytest.mark.asyncio
+    async def test_stream_falls_back_before_first_chunk(self, llm_gateway, mock_genai_client):
+        """Test that the tier cascade applies while nothing has been streamed."""
+        calls = []
+        flash = _stream_of(ResourceExhausted("Quota exceeded"))
+        fallback = _stream_of(_stream_chunk("Fallback answer"))
+
+        async def generate_content_stream(**kwargs):
+            calls.append(kwargs["model"])
+            stream = flash if kwargs["model"] == "gemini-2.5-flash" else fallback
+            return await stream(**kwargs)
+
+        mock_genai_client._client.aio.models.generate_content_stream = generate_content_stream
+
+        events = [e async for e in llm_gateway.send_message_stream(None, "Test", tier=TIER_FLASH)]
+
+        assert calls == ["gemini-2.5-flash", "gemini-2.0-flash"]
+        assert events[-1]["data"] == {"text": "Fallback answer", "model": "gemini-2.0-flash"}
+
+    @pytest.mark.asyncio
+    async def test_stream_raises_after_output_started(self, llm_gateway, mock_genai_client):
+        """Test that a mid-stream failure is not retried on another tier."""
+        generate = MagicMock(
+            side_effect=_stream_of(_stream_chunk("Partial"), ServiceUnavailable("Dropped"))
+        )
+        mock_genai_client._client.aio.models.generate_content_stream = generate
+
+        events = []
+        with pytest.raises(RuntimeError, match="interrupted"):
+            async for event in llm_gateway.send_message_stream(None, "Test"):
+                events.append(event)
+
+        assert [e["data"] for e in events if e["type"] == "token"] == ["Partial"]
+        assert generate.call_count == 1
+
+
+SEARCH_TOOL = {
+    "name": "vector_search",
+    "description": "Search the knowledge base",
+    "parameters": {
+        "type": "OBJECT",
+        "properties": {"query": {"type": "STRING", "description": "Search query"}},
+        "required": ["query"],
+    },
+}
+
+
+@pytest.mark.skipif(llm_gateway_module.types is None, reason="google-genai not installed")
+class TestLLMGatewayConfigCache:
+    """Test suite for prebuilt request configs."""
+
+    @pytest.mark.asyncio
+    async def test_config_reused_across_fallback_tiers(self, llm_gateway, mock_genai_client):
+        """Test that fallback tiers and later calls reuse the same config object."""
+        llm_gateway.gemini_tools = [SEARCH_TOOL]
+        generate = mock_genai_client._client.aio.models.generate_content
+        generate.side_effect = [
+            ResourceExhausted("Quota"),
+            MagicMock(text="A"),
+            MagicMock(text="B"),
+        ]
+
+        await llm_gateway.send_message(None, "Test", system_prompt="You are ZANTARA")
+        await llm_gateway.send_message(None, "Again", system_prompt="You are ZANTARA")
+
+        configs = [call.kwargs["config"] for call in generate.call_args_list]
+        assert configs[0] is configs[1] is configs[2]
+        assert configs[0].tools[0].function_declarations[0].name == "vector_search"
+        assert configs[0].system_instruction == "You are ZANTARA"
+
+    def test_reassigning_tools_invalidates_configs(self, llm_gateway):
+        """Test that a new tool set is compiled instead of reusing stale declarations."""
+        llm_gateway.gemini_tools = [SEARCH_TOOL]
+        before = llm_gateway._build_config("prompt", with_tools=True)
+
+        llm_gateway.gemini_tools = [{**SEARCH_TOOL, "name": "web_search"}]
+        after = llm_gateway._build_config("prompt", with_tools=True)
+
+        assert after is not before
+        assert after.tools[0].function_declarations[0].name == "web_search"
+        assert llm_gateway._build_config("prompt", with_tools=False).tools is None
+
+    def test_config_cache_is_bounded(self, llm_gateway):
+        """Test that the least recently used system prompts are evicted."""
+        with patch("services.rag.agentic.llm_gateway.CONFIG_CACHE_MAX_ENTRIES", 2):
+            first = llm_gateway._build_config("first")
+            llm_gateway._build_config("second")
+            llm_gateway._build_config("third")
+
+        assert len(llm_gateway._config_cache) == 2
+        assert llm_gateway._build_config("first") is not first
@@ -33,7 +33,7 @@ if str(backend_path) not in sys.path:
 
 from google.api_core.exceptions import ResourceExhausted
 
-from services.rag.agentic.reasoning import ReasoningEngine
+from services.rag.agentic.reasoning import ReasoningEngine, stream_react_step
 from services.tools.definitions import AgentState, ToolCall
 
 # ============================================================================
@@ -82,7 +82,7 @@ class TestReActLoopExecution:
         # Add sufficient context to avoid ABSTAIN from Uncertainty AI
         state.context_gathered = ["Mathematical calculation: 2+2 equals 4"]
         state.sources = [{"id": 1, "title": "Math source", "score": 0.9}]
-        
+
         llm_gateway = AsyncMock()
         llm_gateway.send_message = AsyncMock(
             return_value=("Final Answer: This is the answer", "gemini-2.0-flash", None)
@@ -150,9 +150,7 @@ class TestReActLoopExecution:
         ):
             # Provide context that matches query keywords to avoid ABSTAIN
             tool_result = "Calculation result: 2+2 equals 4. Mathematical operation completed."
-            with patch(
-                "services.rag.agentic.reasoning.execute_tool", return_value=tool_result
-            ):
+            with patch("services.rag.agentic.reasoning.execute_tool", return_value=tool_result):
                 result_state, model_name, messages = await engine.execute_react_loop(
                     state=state,
                     llm_gateway=llm_gateway,
@@ -170,7 +168,10 @@ class TestReActLoopExecution:
         assert result_state.current_step == 2
         assert len(result_state.steps) == 2
         assert result_state.steps[0].action.tool_name == "calculator"
-        assert result_state.steps[0].observation == "Calculation result: 2+2 equals 4. Mathematical operation completed."
+        assert (
+            result_state.steps[0].observation
+            == "Calculation result: 2+2 equals 4. Mathematical operation completed."
+        )
 
     @pytest.mark.asyncio
     async def test_execute_react_loop_early_exit_on_vector_search(self):
@@ -653,3 +654,60 @@ class TestErrorHandling:
 
         # Should have used fallback processing
         assert result_state.final_answer == "Fallback processed"
+
+
+# ============================================================================
+# Test Streaming ReAct Step
+# ============================================================================
+
+
+def _gateway_streaming(*events):
+    """LLM gateway mock whose send_message_stream yields the given events."""
+
+    async def send_message_stream(*args, **kwargs):
+        for event in events:
+            yield event
+
+    llm_gateway = MagicMock()
+    llm_gateway.send_message_stream = MagicMock(side_effect=send_message_stream)
+    return llm_gateway
+
+
+class TestStreamReactStep:
+    """Test suite for stream_react_step"""
+
+    @pytest.mark.asyncio
+    async def test_final_answer_tokens_forwarded_as_they_arrive(self):
+        """Test that only the text after "Final Answer:" is streamed"""
+        llm_gateway = _gateway_streaming(
+            {"type": "model", "data": "gemini-2.5-flash"},
+            {"type": "token", "data": "Thought: I know this.\nFinal Answer: "},
+            {"type": "token", "data": "KITAS is a limited stay permit"},
+            {"type": "token", "data": " for foreigners."},
+        )
+
+        events = [e async for e in stream_react_step(llm_gateway, MagicMock(), "q", "", 0)]
+
+        assert [e["data"] for e in events if e["type"] == "token"] == [
+            "KITAS is a limited stay permit",
+            " for foreigners.",
+        ]
+        result = events[-1]["data"]
+        assert result["streamed"] is True
+        assert result["model"] == "gemini-2.5-flash"
+        assert result["answer"] == "KITAS is a limited stay permit for foreigners."
+
+    @pytest.mark.asyncio
+    async def test_function_call_is_not_streamed(self):
+        """Test that a native function call makes the step a tool call"""
+        part = MagicMock()
+        llm_gateway = _gateway_streaming(
+            {"type": "token", "data": "Let me search."},
+            {"type": "function_call", "data": part},
+        )
+
+        events = [e async for e in stream_react_step(llm_gateway, MagicMock(), "q", "", 0)]
+
+        assert len(events) == 1
+        assert events[0]["data"]["function_call"] is part
+        assert events[0]["data"]["streamed"] is False
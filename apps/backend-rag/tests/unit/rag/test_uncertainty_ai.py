@@ -58,9 +58,7 @@ class TestEvidenceScoreCalculation:
 
     def test_evidence_score_with_multiple_sources(self):
         """Test score calculation with > 3 sources"""
-        sources = [
-            {"id": i, "title": f"Source {i}", "score": 0.7} for i in range(5)
-        ]
+        sources = [{"id": i, "title": f"Source {i}", "score": 0.7} for i in range(5)]
         context = ["Context from multiple sources"]
         query = "What is KITAS?"
 
@@ -131,9 +129,7 @@ class TestEvidenceScoreCalculation:
 
     def test_evidence_score_caps_at_one(self):
         """Test that score is capped at 1.0"""
-        sources = [
-            {"id": i, "title": f"Source {i}", "score": 0.9} for i in range(10)
-        ]
+        sources = [{"id": i, "title": f"Source {i}", "score": 0.9} for i in range(10)]
         context = [
             "KITAS visa requirements " * 20  # Long context with keywords
         ]
@@ -206,7 +202,10 @@ class TestAbstainPolicy:
             )
 
         # Should have ABSTAIN message
-        assert "Mi dispiace, non ho trovato informazioni verificate sufficienti" in result_state.final_answer
+        assert (
+            "Mi dispiace, non ho trovato informazioni verificate sufficienti"
+            in result_state.final_answer
+        )
         assert hasattr(result_state, "evidence_score")
         assert result_state.evidence_score < 0.3
 
@@ -240,7 +239,10 @@ class TestAbstainPolicy:
             )
 
         # Should have ABSTAIN message
-        assert "Mi dispiace, non ho trovato informazioni verificate sufficienti" in result_state.final_answer
+        assert (
+            "Mi dispiace, non ho trovato informazioni verificate sufficienti"
+            in result_state.final_answer
+        )
         assert result_state.evidence_score < 0.3
 
     @pytest.mark.asyncio
@@ -273,7 +275,10 @@ class TestAbstainPolicy:
             )
 
         # Should have overridden with ABSTAIN message
-        assert "Mi dispiace, non ho trovato informazioni verificate sufficienti" in result_state.final_answer
+        assert (
+            "Mi dispiace, non ho trovato informazioni verificate sufficienti"
+            in result_state.final_answer
+        )
         assert "This is an existing answer" not in result_state.final_answer
 
     @pytest.mark.asyncio
@@ -305,7 +310,10 @@ class TestAbstainPolicy:
             )
 
         # Should have ABSTAIN message without calling LLM for final answer
-        assert "Mi dispiace, non ho trovato informazioni verificate sufficienti" in result_state.final_answer
+        assert (
+            "Mi dispiace, non ho trovato informazioni verificate sufficienti"
+            in result_state.final_answer
+        )
         # Verify LLM was not called for final answer generation
         # (only called once for the initial thought)
         assert llm_gateway.send_message.call_count == 1
@@ -368,7 +376,10 @@ class TestWarningPolicy:
                 assert "Do NOT be definitive" in final_prompt
         else:
             # If score < 0.3, ABSTAIN should be triggered
-            assert "Mi dispiace, non ho trovato informazioni verificate sufficienti" in result_state.final_answer
+            assert (
+                "Mi dispiace, non ho trovato informazioni verificate sufficienti"
+                in result_state.final_answer
+            )
 
     @pytest.mark.asyncio
     async def test_no_warning_for_strong_evidence(self):
@@ -482,6 +493,22 @@ class TestNormalGeneration:
 # ============================================================================
 
 
+def _gateway_streaming(*responses):
+    """LLM gateway mock streaming each response (a list of token strings) per call."""
+    remaining = list(responses)
+
+    async def send_message_stream(*args, **kwargs):
+        tokens = remaining.pop(0)
+        yield {"type": "model", "data": "gemini-2.0-flash"}
+        for token in tokens:
+            yield {"type": "token", "data": token}
+        yield {"type": "done", "data": {"text": "".join(tokens), "model": "gemini-2.0-flash"}}
+
+    llm_gateway = MagicMock()
+    llm_gateway.send_message_stream = MagicMock(side_effect=send_message_stream)
+    return llm_gateway
+
+
 class TestUncertaintyStreaming:
     """Test suite for uncertainty logic in streaming mode"""
 
@@ -494,10 +521,7 @@ class TestUncertaintyStreaming:
         state = AgentState(query="test query", max_steps=1)
         state.context_gathered = []  # No context
 
-        llm_gateway = AsyncMock()
-        llm_gateway.send_message = AsyncMock(
-            return_value=("Thought: No info", "gemini-2.0-flash", None)
-        )
+        llm_gateway = _gateway_streaming(["Thought: No info"])
         chat = MagicMock()
 
         events = []
@@ -521,7 +545,9 @@ class TestUncertaintyStreaming:
         assert evidence_events[0]["data"]["score"] < 0.3
 
         # Should have ABSTAIN message in final answer
-        assert "Mi dispiace, non ho trovato informazioni verificate sufficienti" in state.final_answer
+        assert (
+            "Mi dispiace, non ho trovato informazioni verificate sufficienti" in state.final_answer
+        )
 
     @pytest.mark.asyncio
     async def test_stream_warning_for_weak_evidence(self):
@@ -537,13 +563,7 @@ class TestUncertaintyStreaming:
             "KITAS visa application process."
         ]
 
-        llm_gateway = AsyncMock()
-        llm_gateway.send_message = AsyncMock(
-            side_effect=[
-                ("Thought: Found info", "gemini-2.0-flash", None),
-                ("Cautious answer", "gemini-2.0-flash", None),
-            ]
-        )
+        llm_gateway = _gateway_streaming(["Thought: Found info"], ["Cautious answer"])
         chat = MagicMock()
 
         events = []
@@ -567,12 +587,15 @@ class TestUncertaintyStreaming:
 
         # Verify warning was injected if score is in warning range
         if state.evidence_score >= 0.3 and state.evidence_score < 0.6:
-            assert llm_gateway.send_message.call_count == 2
-            final_prompt = llm_gateway.send_message.call_args_list[1][0][0]
+            assert llm_gateway.send_message_stream.call_count == 2
+            final_prompt = llm_gateway.send_message_stream.call_args_list[1][0][1]
             assert "WARNING: Evidence is weak" in final_prompt
         elif state.evidence_score < 0.3:
             # If score is too low, ABSTAIN should be triggered
-            assert "Mi dispiace, non ho trovato informazioni verificate sufficienti" in state.final_answer
+            assert (
+                "Mi dispiace, non ho trovato informazioni verificate sufficienti"
+                in state.final_answer
+            )
 
 
 # ============================================================================
@@ -691,4 +714,3 @@ class TestUncertaintyEdgeCases:
         # Should calculate score based on context keywords
         assert hasattr(result_state, "evidence_score")
         assert result_state.evidence_score >= 0.0
-
@@ -47,11 +47,47 @@ def mock_db_pool():
     # Mock async methods
     conn.fetchrow = AsyncMock(return_value=None)
     conn.fetchval = AsyncMock(return_value=None)
+    conn.fetch = AsyncMock(return_value=[])
     conn.execute = AsyncMock()
+    conn.executemany = AsyncMock()
+
+    # Mock conn.transaction() context manager
+    transaction_cm = MagicMock()
+    transaction_cm.__aenter__ = AsyncMock(return_value=None)
+    transaction_cm.__aexit__ = AsyncMock(return_value=False)
+    conn.transaction = MagicMock(return_value=transaction_cm)
 
     return pool, conn
 
 
+def _new_conversation(conn, conversation_id):
+    """No stored conversation for the session; INSERT returns conversation_id"""
+    conn.fetchrow.side_effect = [None, {"id": conversation_id, "message_count": 0}]
+
+
+def _history_rows(messages, conversation_id=1, session_id="session-123", total=None):
+    """Rows of fetch_recent_messages' conversation + messages join"""
+    created_at = datetime(2025, 1, 1)
+    base = {
+        "id": conversation_id,
+        "session_id": session_id,
+        "created_at": created_at,
+        "message_count": len(messages) if total is None else total,
+    }
+    if not messages:
+        return [{**base, "seq": None, "role": None, "content": None, "extra": None}]
+    return [
+        {
+            **base,
+            "seq": seq,
+            "role": message["role"],
+            "content": message["content"],
+            "extra": {k: v for k, v in message.items() if k not in ("role", "content")},
+        }
+        for seq, message in enumerate(messages, start=1)
+    ]
+
+
 @pytest.fixture
 def mock_memory_cache():
     """Mock InMemoryConversationCache"""
@@ -128,7 +164,9 @@ def test_init_without_pool():
 def test_get_auto_crm_success(conversation_service, mock_auto_crm_service):
     """Test lazy loading of Auto-CRM service successfully"""
     # Mock the import at the module level
-    with patch("services.auto_crm_service.get_auto_crm_service", return_value=mock_auto_crm_service):
+    with patch(
+        "services.auto_crm_service.get_auto_crm_service", return_value=mock_auto_crm_service
+    ):
         result = conversation_service._get_auto_crm()
 
         assert result == mock_auto_crm_service
@@ -138,7 +176,9 @@ def test_get_auto_crm_success(conversation_service, mock_auto_crm_service):
 def test_get_auto_crm_cached(conversation_service, mock_auto_crm_service):
     """Test that Auto-CRM service is cached after first load"""
     # Mock the import at the module level
-    with patch("services.auto_crm_service.get_auto_crm_service", return_value=mock_auto_crm_service) as mock_get_service:
+    with patch(
+        "services.auto_crm_service.get_auto_crm_service", return_value=mock_auto_crm_service
+    ) as mock_get_service:
         # First call
         result1 = conversation_service._get_auto_crm()
         # Second call
@@ -162,7 +202,9 @@ def test_get_auto_crm_import_error(conversation_service):
 def test_get_auto_crm_general_exception(conversation_service):
     """Test handling of general exception when loading Auto-CRM"""
     # Mock the import to raise an exception
-    with patch("services.auto_crm_service.get_auto_crm_service", side_effect=Exception("Unexpected error")):
+    with patch(
+        "services.auto_crm_service.get_auto_crm_service", side_effect=Exception("Unexpected error")
+    ):
         result = conversation_service._get_auto_crm()
 
         assert result is None
@@ -193,11 +235,9 @@ async def test_save_conversation_success_db_and_cache(
     session_id = "test-session-123"
 
     # Mock DB insert returning conversation_id
-    conn.fetchrow.return_value = {"id": 42}
+    _new_conversation(conn, 42)
 
-    with patch(
-        "services.conversation_service.get_memory_cache", return_value=mock_memory_cache
-    ):
+    with patch("services.conversation_service.get_memory_cache", return_value=mock_memory_cache):
         result = await conversation_service.save_conversation(
             user_email=user_email,
             messages=sample_messages,
@@ -218,13 +258,16 @@ async def test_save_conversation_success_db_and_cache(
         session_id, "user", "Hello, I need help with my business"
     )
 
-    # Verify DB was called
-    conn.fetchrow.assert_called_once()
-    call_args = conn.fetchrow.call_args[0]
+    # Verify conversation row was created and messages appended as rows
+    call_args = conn.fetchrow.call_args_list[1][0]  # Lookup, then INSERT
     assert "INSERT INTO conversations" in call_args[0]
     assert call_args[1] == user_email
     assert call_args[2] == session_id
-    assert call_args[3] == sample_messages
+    rows = conn.executemany.call_args[0][1]
+    assert [(r[1], r[2], r[3]) for r in rows] == [
+        (i, m["role"], m["content"]) for i, m in enumerate(sample_messages, start=1)
+    ]
+    assert all(r[0] == 42 for r in rows)
 
 
 @pytest.mark.asyncio
@@ -233,11 +276,9 @@ async def test_save_conversation_auto_generated_session_id(
 ):
     """Test that session_id is auto-generated if not provided"""
     pool, conn = mock_db_pool
-    conn.fetchrow.return_value = {"id": 10}
+    _new_conversation(conn, 10)
 
-    with patch(
-        "services.conversation_service.get_memory_cache", return_value=mock_memory_cache
-    ):
+    with patch("services.conversation_service.get_memory_cache", return_value=mock_memory_cache):
         result = await conversation_service.save_conversation(
             user_email="test@example.com",
             messages=sample_messages,
@@ -254,7 +295,7 @@ async def test_save_conversation_with_metadata(
 ):
     """Test saving conversation with metadata"""
     pool, conn = mock_db_pool
-    conn.fetchrow.return_value = {"id": 15}
+    _new_conversation(conn, 15)
 
     metadata = {
         "team_member": "john@example.com",
@@ -262,9 +303,7 @@ async def test_save_conversation_with_metadata(
         "language": "en",
     }
 
-    with patch(
-        "services.conversation_service.get_memory_cache", return_value=mock_memory_cache
-    ):
+    with patch("services.conversation_service.get_memory_cache", return_value=mock_memory_cache):
         result = await conversation_service.save_conversation(
             user_email="test@example.com",
             messages=sample_messages,
@@ -272,8 +311,8 @@ async def test_save_conversation_with_metadata(
         )
 
     # Verify metadata was passed to DB
-    call_args = conn.fetchrow.call_args[0]
-    assert call_args[4] == metadata
+    call_args = conn.fetchrow.call_args_list[1][0]  # Lookup, then INSERT
+    assert call_args[3] == metadata
 
 
 @pytest.mark.asyncio
@@ -286,7 +325,7 @@ async def test_save_conversation_with_auto_crm(
 ):
     """Test that Auto-CRM is triggered on successful DB save"""
     pool, conn = mock_db_pool
-    conn.fetchrow.return_value = {"id": 50}
+    _new_conversation(conn, 50)
 
     crm_result = {
         "processed": True,
@@ -295,9 +334,7 @@ async def test_save_conversation_with_auto_crm(
     }
     mock_auto_crm_service.process_conversation.return_value = crm_result
 
-    with patch(
-        "services.conversation_service.get_memory_cache", return_value=mock_memory_cache
-    ):
+    with patch("services.conversation_service.get_memory_cache", return_value=mock_memory_cache):
         with patch.object(
             conversation_service, "_get_auto_crm", return_value=mock_auto_crm_service
         ):
@@ -330,13 +367,11 @@ async def test_save_conversation_with_auto_crm_team_member(
 ):
     """Test that team_member from metadata is passed to Auto-CRM"""
     pool, conn = mock_db_pool
-    conn.fetchrow.return_value = {"id": 60}
+    _new_conversation(conn, 60)
 
     metadata = {"team_member": "jane@example.com"}
 
-    with patch(
-        "services.conversation_service.get_memory_cache", return_value=mock_memory_cache
-    ):
+    with patch("services.conversation_service.get_memory_cache", return_value=mock_memory_cache):
         with patch.object(
             conversation_service, "_get_auto_crm", return_value=mock_auto_crm_service
         ):
@@ -364,9 +399,7 @@ async def test_save_conversation_db_error_falls_back_to_memory(
     pool, conn = mock_db_pool
     conn.fetchrow.side_effect = Exception("Database connection failed")
 
-    with patch(
-        "services.conversation_service.get_memory_cache", return_value=mock_memory_cache
-    ):
+    with patch("services.conversation_service.get_memory_cache", return_value=mock_memory_cache):
         result = await conversation_service.save_conversation(
             user_email="test@example.com",
             messages=sample_messages,
@@ -389,9 +422,7 @@ async def test_save_conversation_no_db_pool(
     conversation_service_no_pool, mock_memory_cache, sample_messages
 ):
     """Test save when no DB pool is available"""
-    with patch(
-        "services.conversation_service.get_memory_cache", return_value=mock_memory_cache
-    ):
+    with patch("services.conversation_service.get_memory_cache", return_value=mock_memory_cache):
         result = await conversation_service_no_pool.save_conversation(
             user_email="test@example.com",
             messages=sample_messages,
@@ -413,14 +444,12 @@ async def test_save_conversation_memory_cache_error(
 ):
     """Test that memory cache errors are handled gracefully"""
     pool, conn = mock_db_pool
-    conn.fetchrow.return_value = {"id": 25}
+    _new_conversation(conn, 25)
 
     mock_cache = MagicMock()
     mock_cache.add_message.side_effect = Exception("Cache error")
 
-    with patch(
-        "services.conversation_service.get_memory_cache", return_value=mock_cache
-    ):
+    with patch("services.conversation_service.get_memory_cache", return_value=mock_cache):
         result = await conversation_service.save_conversation(
             user_email="test@example.com",
             messages=sample_messages,
@@ -441,14 +470,12 @@ async def test_save_conversation_auto_crm_error(
 ):
     """Test that Auto-CRM errors don't break the save operation"""
     pool, conn = mock_db_pool
-    conn.fetchrow.return_value = {"id": 30}
+    _new_conversation(conn, 30)
 
     mock_crm = MagicMock()
     mock_crm.process_conversation = AsyncMock(side_effect=Exception("CRM error"))
 
-    with patch(
-        "services.conversation_service.get_memory_cache", return_value=mock_memory_cache
-    ):
+    with patch("services.conversation_service.get_memory_cache", return_value=mock_memory_cache):
         with patch.object(conversation_service, "_get_auto_crm", return_value=mock_crm):
             result = await conversation_service.save_conversation(
                 user_email="test@example.com",
@@ -470,11 +497,9 @@ async def test_save_conversation_no_auto_crm_available(
 ):
     """Test behavior when Auto-CRM is not available"""
     pool, conn = mock_db_pool
-    conn.fetchrow.return_value = {"id": 35}
+    _new_conversation(conn, 35)
 
-    with patch(
-        "services.conversation_service.get_memory_cache", return_value=mock_memory_cache
-    ):
+    with patch("services.conversation_service.get_memory_cache", return_value=mock_memory_cache):
         with patch.object(conversation_service, "_get_auto_crm", return_value=None):
             result = await conversation_service.save_conversation(
                 user_email="test@example.com",
@@ -493,11 +518,9 @@ async def test_save_conversation_empty_messages(
 ):
     """Test saving conversation with empty messages list"""
     pool, conn = mock_db_pool
-    conn.fetchrow.return_value = {"id": 40}
+    _new_conversation(conn, 40)
 
-    with patch(
-        "services.conversation_service.get_memory_cache", return_value=mock_memory_cache
-    ):
+    with patch("services.conversation_service.get_memory_cache", return_value=mock_memory_cache):
         with patch.object(conversation_service, "_get_auto_crm", return_value=None):
             result = await conversation_service.save_conversation(
                 user_email="test@example.com",
@@ -525,7 +548,7 @@ async def test_get_history_from_db_with_session_id(conversation_service, mock_db
         {"role": "assistant", "content": "Hi there!"},
     ]
 
-    conn.fetchrow.return_value = {"messages": stored_messages}
+    conn.fetch.return_value = _history_rows(stored_messages)
 
     result = await conversation_service.get_history(
         user_email="test@example.com",
@@ -538,17 +561,17 @@ async def test_get_history_from_db_with_session_id(conversation_service, mock_db
     assert result["total"] == 2
 
     # Verify DB query
-    conn.fetchrow.assert_called_once()
-    call_args = conn.fetchrow.call_args[0]
-    assert "WHERE user_id = $1 AND session_id = $2" in call_args[0]
+    conn.fetch.assert_called_once()
+    call_args = conn.fetch.call_args[0]
+    assert "WHERE user_id = $1 AND session_id = $4" in call_args[0]
+    assert "FROM conversation_messages" in call_args[0]
     assert call_args[1] == "test@example.com"
-    assert call_args[2] == "session-123"
+    assert call_args[2] == 20  # Page size pushed into the query
+    assert call_args[4] == "session-123"
 
 
 @pytest.mark.asyncio
-async def test_get_history_from_db_without_session_id(
-    conversation_service, mock_db_pool
-):
+async def test_get_history_from_db_without_session_id(conversation_service, mock_db_pool):
     """Test retrieving history from DB without session_id"""
     pool, conn = mock_db_pool
 
@@ -556,17 +579,18 @@ async def test_get_history_from_db_without_session_id(
         {"role": "user", "content": "Previous message"},
     ]
 
-    conn.fetchrow.return_value = {"messages": stored_messages}
+    conn.fetch.return_value = _history_rows(stored_messages)
 
     result = await conversation_service.get_history(
         user_email="test@example.com",
     )
 
     # Verify query without session_id filter
-    call_args = conn.fetchrow.call_args[0]
+    call_args = conn.fetch.call_args[0]
     assert "WHERE user_id = $1" in call_args[0]
-    assert "session_id" not in call_args[0]
+    assert "session_id = $4" not in call_args[0]
     assert call_args[1] == "test@example.com"
+    assert len(call_args) == 4
 
 
 @pytest.mark.asyncio
@@ -580,7 +604,7 @@ async def test_get_history_from_db_with_limit(conversation_service, mock_db_pool
         for i in range(30)
     ]
 
-    conn.fetchrow.return_value = {"messages": stored_messages}
+    conn.fetch.return_value = _history_rows(stored_messages[-10:], total=30)
 
     result = await conversation_service.get_history(
         user_email="test@example.com",
@@ -599,26 +623,27 @@ async def test_get_history_from_db_no_limit(conversation_service, mock_db_pool):
     pool, conn = mock_db_pool
 
     stored_messages = [{"role": "user", "content": f"Msg {i}"} for i in range(5)]
-    conn.fetchrow.return_value = {"messages": stored_messages}
+    conn.fetch.return_value = _history_rows(stored_messages)
 
     result = await conversation_service.get_history(
         user_email="test@example.com",
         limit=0,
     )
 
-    # Should return all messages
+    # Should return all messages (no LIMIT)
     assert len(result["messages"]) == 5
+    assert conn.fetch.call_args[0][2] is None
 
 
 @pytest.mark.asyncio
 async def test_get_history_from_db_json_string(conversation_service, mock_db_pool):
-    """Test parsing messages when stored as JSON string"""
+    """Test parsing extra message keys when returned as JSON string"""
     pool, conn = mock_db_pool
 
-    messages_list = [{"role": "user", "content": "Test"}]
-    messages_json = json.dumps(messages_list)
-
-    conn.fetchrow.return_value = {"messages": messages_json}
+    messages_list = [{"role": "assistant", "content": "Test", "sources": [{"title": "KITAS"}]}]
+    rows = _history_rows(messages_list)
+    rows[0]["extra"] = json.dumps(rows[0]["extra"])
+    conn.fetch.return_value = rows
 
     result = await conversation_service.get_history(
         user_email="test@example.com",
@@ -629,15 +654,111 @@ async def test_get_history_from_db_json_string(conversation_service, mock_db_poo
     assert isinstance(result["messages"], list)
 
 
+@pytest.mark.asyncio
+async def test_get_history_keyset_cursor(conversation_service, mock_db_pool):
+    """Test fetch_recent_messages returns a cursor for the older page"""
+    from services.conversation_service import fetch_recent_messages
+
+    pool, conn = mock_db_pool
+    messages = [{"role": "user", "content": f"Msg {i}"} for i in range(1, 31)]
+    rows = _history_rows(messages)[20:]  # Page of seq 21..30
+    conn.fetch.return_value = rows
+
+    page = await fetch_recent_messages(conn, "test@example.com", limit=10, before_seq=31)
+
+    assert page["next_before_seq"] == 21
+    assert page["total"] == 30
+    assert page["messages"][0]["content"] == "Msg 21"
+    assert conn.fetch.call_args[0][3] == 31
+
+
 # ============================================================================
-# Tests for get_history - Memory cache fallback
+# Tests for append-only storage
 # ============================================================================
 
 
 @pytest.mark.asyncio
-async def test_get_history_fallback_to_cache(
-    conversation_service, mock_db_pool, mock_memory_cache
+async def test_save_appends_only_new_messages(
+    conversation_service, mock_db_pool, mock_memory_cache, sample_messages
 ):
+    """Test a transcript extending the stored one only inserts the new tail"""
+    pool, conn = mock_db_pool
+    conn.fetchrow.side_effect = [
+        {"id": 7, "message_count": 2},  # Existing conversation for the session
+        {"role": "assistant", "content": sample_messages[1]["content"]},  # Stored seq 2
+    ]
+
+    with patch("services.conversation_service.get_memory_cache", return_value=mock_memory_cache):
+        with patch.object(conversation_service, "_get_auto_crm", return_value=None):
+            result = await conversation_service.save_conversation(
+                user_email="test@example.com",
+                messages=sample_messages,
+                session_id="session-123",
+            )
+
+    assert result["conversation_id"] == 7
+    rows = conn.executemany.call_args[0][1]
+    assert rows == [(7, 3, "user", "I want to register a company in Bali", {})]
+    update_args = conn.execute.call_args[0]
+    assert "UPDATE conversations" in update_args[0]
+    assert update_args[2] == 3  # message_count
+    assert update_args[3] == "I want to register a company in Bali"[:50]
+
+
+@pytest.mark.asyncio
+async def test_save_resent_transcript_appends_nothing(
+    conversation_service, mock_db_pool, mock_memory_cache, sample_messages
+):
+    """Test saving the same transcript twice does not duplicate messages"""
+    pool, conn = mock_db_pool
+    conn.fetchrow.side_effect = [
+        {"id": 7, "message_count": 3},
+        {"role": "user", "content": sample_messages[2]["content"]},
+    ]
+
+    with patch("services.conversation_service.get_memory_cache", return_value=mock_memory_cache):
+        with patch.object(conversation_service, "_get_auto_crm", return_value=None):
+            await conversation_service.save_conversation(
+                user_email="test@example.com",
+                messages=sample_messages,
+                session_id="session-123",
+            )
+
+    conn.executemany.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_save_rewritten_transcript_starts_new_conversation(
+    conversation_service, mock_db_pool, mock_memory_cache, sample_messages
+):
+    """Test a transcript that does not extend the stored one gets a new conversation"""
+    pool, conn = mock_db_pool
+    conn.fetchrow.side_effect = [
+        {"id": 7, "message_count": 2},
+        {"role": "assistant", "content": "A different answer"},
+        {"id": 8, "message_count": 0},
+    ]
+
+    with patch("services.conversation_service.get_memory_cache", return_value=mock_memory_cache):
+        with patch.object(conversation_service, "_get_auto_crm", return_value=None):
+            result = await conversation_service.save_conversation(
+                user_email="test@example.com",
+                messages=sample_messages,
+                session_id="session-123",
+            )
+
+    assert result["conversation_id"] == 8
+    rows = conn.executemany.call_args[0][1]
+    assert [r[1] for r in rows] == [1, 2, 3]
+
+
+# ============================================================================
+# Tests for get_history - Memory cache fallback
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_get_history_fallback_to_cache(conversation_service, mock_db_pool, mock_memory_cache):
     """Test falling back to memory cache when DB returns no results"""
     pool, conn = mock_db_pool
     conn.fetchrow.return_value = None
@@ -647,9 +768,7 @@ async def test_get_history_fallback_to_cache(
     ]
     mock_memory_cache.get_conversation.return_value = cached_messages
 
-    with patch(
-        "services.conversation_service.get_memory_cache", return_value=mock_memory_cache
-    ):
+    with patch("services.conversation_service.get_memory_cache", return_value=mock_memory_cache):
         result = await conversation_service.get_history(
             user_email="test@example.com",
             session_id="session-123",
@@ -672,9 +791,7 @@ async def test_get_history_cache_no_session_id(
     pool, conn = mock_db_pool
     conn.fetchrow.return_value = None
 
-    with patch(
-        "services.conversation_service.get_memory_cache", return_value=mock_memory_cache
-    ):
+    with patch("services.conversation_service.get_memory_cache", return_value=mock_memory_cache):
         result = await conversation_service.get_history(
             user_email="test@example.com",
         )
@@ -698,9 +815,7 @@ async def test_get_history_db_error_fallback_to_cache(
     cached_messages = [{"role": "user", "content": "From cache"}]
     mock_memory_cache.get_conversation.return_value = cached_messages
 
-    with patch(
-        "services.conversation_service.get_memory_cache", return_value=mock_memory_cache
-    ):
+    with patch("services.conversation_service.get_memory_cache", return_value=mock_memory_cache):
         result = await conversation_service.get_history(
             user_email="test@example.com",
             session_id="session-456",
@@ -712,18 +827,14 @@ async def test_get_history_db_error_fallback_to_cache(
 
 
 @pytest.mark.asyncio
-async def test_get_history_cache_error(
-    conversation_service, mock_db_pool, mock_memory_cache
-):
+async def test_get_history_cache_error(conversation_service, mock_db_pool, mock_memory_cache):
     """Test handling of cache errors"""
     pool, conn = mock_db_pool
     conn.fetchrow.return_value = None
 
     mock_memory_cache.get_conversation.side_effect = Exception("Cache error")
 
-    with patch(
-        "services.conversation_service.get_memory_cache", return_value=mock_memory_cache
-    ):
+    with patch("services.conversation_service.get_memory_cache", return_value=mock_memory_cache):
         result = await conversation_service.get_history(
             user_email="test@example.com",
             session_id="session-789",
@@ -740,9 +851,7 @@ async def test_get_history_no_db_pool(conversation_service_no_pool, mock_memory_
     cached_messages = [{"role": "user", "content": "Only cache"}]
     mock_memory_cache.get_conversation.return_value = cached_messages
 
-    with patch(
-        "services.conversation_service.get_memory_cache", return_value=mock_memory_cache
-    ):
+    with patch("services.conversation_service.get_memory_cache", return_value=mock_memory_cache):
         result = await conversation_service_no_pool.get_history(
             user_email="test@example.com",
             session_id="session-999",
@@ -757,7 +866,7 @@ async def test_get_history_no_db_pool(conversation_service_no_pool, mock_memory_
 async def test_get_history_empty_db_result(conversation_service, mock_db_pool):
     """Test handling when DB returns row with empty messages"""
     pool, conn = mock_db_pool
-    conn.fetchrow.return_value = {"messages": None}
+    conn.fetch.return_value = _history_rows([])
 
     result = await conversation_service.get_history(
         user_email="test@example.com",
@@ -776,14 +885,10 @@ async def test_get_history_cache_limit_applied(
     pool, conn = mock_db_pool
     conn.fetchrow.return_value = None
 
-    cached_messages = [
-        {"role": "user", "content": f"Msg {i}"} for i in range(25)
-    ]
+    cached_messages = [{"role": "user", "content": f"Msg {i}"} for i in range(25)]
     mock_memory_cache.get_conversation.return_value = cached_messages
 
-    with patch(
-        "services.conversation_service.get_memory_cache", return_value=mock_memory_cache
-    ):
+    with patch("services.conversation_service.get_memory_cache", return_value=mock_memory_cache):
         result = await conversation_service.get_history(
             user_email="test@example.com",
             session_id="session-limit",
@@ -809,11 +914,9 @@ async def test_save_and_get_conversation_flow(
     pool, conn = mock_db_pool
 
     # Mock save operation
-    conn.fetchrow.return_value = {"id": 100}
+    _new_conversation(conn, 100)
 
-    with patch(
-        "services.conversation_service.get_memory_cache", return_value=mock_memory_cache
-    ):
+    with patch("services.conversation_service.get_memory_cache", return_value=mock_memory_cache):
         # Save conversation
         save_result = await conversation_service.save_conversation(
             user_email="test@example.com",
@@ -822,7 +925,7 @@ async def test_save_and_get_conversation_flow(
         )
 
         # Mock get operation
-        conn.fetchrow.return_value = {"messages": sample_messages}
+        conn.fetch.return_value = _history_rows(sample_messages, conversation_id=100)
 
         # Get conversation
         get_result = await conversation_service.get_history(
@@ -843,16 +946,14 @@ async def test_save_conversation_special_characters(
 ):
     """Test saving messages with special characters"""
     pool, conn = mock_db_pool
-    conn.fetchrow.return_value = {"id": 200}
+    _new_conversation(conn, 200)
 
     special_messages = [
         {"role": "user", "content": "Test with émojis 🎉 and spëcial chars"},
         {"role": "assistant", "content": "Response with\nnewlines\tand\ttabs"},
     ]
 
-    with patch(
-        "services.conversation_service.get_memory_cache", return_value=mock_memory_cache
-    ):
+    with patch("services.conversation_service.get_memory_cache", return_value=mock_memory_cache):
         result = await conversation_service.save_conversation(
             user_email="tëst@example.com",
             messages=special_messages,
@@ -869,10 +970,9 @@ async def test_get_history_default_limit(conversation_service, mock_db_pool):
 
     # Create 100 messages
     many_messages = [
-        {"role": "user" if i % 2 == 0 else "assistant", "content": f"Msg {i}"}
-        for i in range(100)
+        {"role": "user" if i % 2 == 0 else "assistant", "content": f"Msg {i}"} for i in range(100)
     ]
-    conn.fetchrow.return_value = {"messages": many_messages}
+    conn.fetch.return_value = _history_rows(many_messages[-20:], total=100)
 
     result = await conversation_service.get_history(
         user_email="test@example.com",
@@ -890,19 +990,17 @@ async def test_save_conversation_metadata_defaults_to_empty_dict(
 ):
     """Test that metadata defaults to empty dict when not provided"""
     pool, conn = mock_db_pool
-    conn.fetchrow.return_value = {"id": 300}
+    _new_conversation(conn, 300)
 
-    with patch(
-        "services.conversation_service.get_memory_cache", return_value=mock_memory_cache
-    ):
+    with patch("services.conversation_service.get_memory_cache", return_value=mock_memory_cache):
         await conversation_service.save_conversation(
             user_email="test@example.com",
             messages=sample_messages,
         )
 
     # Verify empty dict was passed
-    call_args = conn.fetchrow.call_args[0]
-    assert call_args[4] == {}
+    call_args = conn.fetchrow.call_args_list[1][0]  # Lookup, then INSERT
+    assert call_args[3] == {}
 
 
 @pytest.mark.asyncio
@@ -911,17 +1009,15 @@ async def test_save_conversation_timestamp_generated(
 ):
     """Test that timestamp is generated for DB save"""
     pool, conn = mock_db_pool
-    conn.fetchrow.return_value = {"id": 400}
+    _new_conversation(conn, 400)
 
-    with patch(
-        "services.conversation_service.get_memory_cache", return_value=mock_memory_cache
-    ):
+    with patch("services.conversation_service.get_memory_cache", return_value=mock_memory_cache):
         await conversation_service.save_conversation(
             user_email="test@example.com",
             messages=sample_messages,
         )
 
     # Verify timestamp argument
-    call_args = conn.fetchrow.call_args[0]
-    timestamp = call_args[5]
+    call_args = conn.fetchrow.call_args_list[1][0]  # Lookup, then INSERT
+    timestamp = call_args[4]
     assert isinstance(timestamp, datetime)
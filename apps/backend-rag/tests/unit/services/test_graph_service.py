@@ -0,0 +1,249 @@
+"""
+Unit tests for backend/services/graph_service.py
+
+Tests cover:
+- Frontier BFS (one query per depth level)
+- Direction, strength and fan-out parameters
+- Edge de-duplication and the max_nodes cap
+- Subgraph cache hits and invalidation on writes
+- Entity lookup through the name gazetteer
+"""
+
+import sys
+from pathlib import Path
+
+# Add backend to path
+backend_path = Path(__file__).resolve().parents[3] / "backend"
+sys.path.insert(0, str(backend_path))
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.graph_service import (
+    TRAVERSE_MAX_FANOUT,
+    GraphEntity,
+    GraphRelation,
+    GraphService,
+)
+
+
+def _edge(source, target, rel_type="requires", strength=1.0, node_id=None):
+    node_id = node_id or target
+    return {
+        "source_entity_id": source,
+        "target_entity_id": target,
+        "relationship_type": rel_type,
+        "strength": strength,
+        "node_id": node_id,
+        "node_type": "visa",
+        "node_name": node_id.upper(),
+        "node_desc": None,
+    }
+
+
+@pytest.fixture
+def conn():
+    conn = MagicMock()
+    conn.fetchrow = AsyncMock(
+        return_value={"id": "a", "type": "visa", "name": "A", "description": None}
+    )
+    conn.fetch = AsyncMock(return_value=[])
+    conn.fetchval = AsyncMock(return_value=1)
+    return conn
+
+
+@pytest.fixture
+def service(conn):
+    pool = MagicMock()
+
+    @asynccontextmanager
+    async def acquire():
+        yield conn
+
+    pool.acquire = acquire
+    return GraphService(pool)
+
+
+class TestTraverse:
+    """Tests for GraphService.traverse"""
+
+    @pytest.mark.asyncio
+    async def test_one_query_per_level(self, service, conn):
+        """Each depth level is fetched with a single query over the frontier"""
+        conn.fetch.side_effect = [
+            [_edge("a", "b"), _edge("a", "c")],
+            [_edge("b", "d"), _edge("c", "d")],
+        ]
+
+        result = await service.traverse("a", max_depth=2)
+
+        assert conn.fetchrow.await_count == 1
+        assert conn.fetch.await_count == 2
+        frontiers = [call.args[1] for call in conn.fetch.await_args_list]
+        assert frontiers == [["a"], ["b", "c"]]
+        assert conn.fetch.await_args_list[0].args[2:] == (0.0, None, TRAVERSE_MAX_FANOUT)
+
+        depths = {node["id"]: node["depth"] for node in result["nodes"]}
+        assert depths == {"a": 0, "b": 1, "c": 1, "d": 2}
+        assert len(result["edges"]) == 4
+        assert result["truncated"] is False
+
+    @pytest.mark.asyncio
+    async def test_stops_when_frontier_empty(self, service, conn):
+        """No query is issued once a level finds no new nodes"""
+        conn.fetch.side_effect = [[_edge("a", "b")], [_edge("b", "a", node_id="a")]]
+
+        result = await service.traverse("a", max_depth=5)
+
+        assert conn.fetch.await_count == 2
+        assert [node["id"] for node in result["nodes"]] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_filters_are_passed_to_query(self, service, conn):
+        """Strength, relation types and fan-out are bound as query parameters"""
+        await service.traverse(
+            "a",
+            max_depth=1,
+            direction="in",
+            min_strength=0.5,
+            relation_types=["requires", "costs", "requires"],
+            max_fanout=10,
+        )
+
+        query, frontier, strength, types, fanout = conn.fetch.await_args.args
+        assert "target_entity_id = f.id" in query
+        assert (frontier, strength, types, fanout) == (["a"], 0.5, ["costs", "requires"], 10)
+
+    @pytest.mark.asyncio
+    async def test_both_directions_dedupe_edges(self, service, conn):
+        """An edge seen from both ends is returned once"""
+        conn.fetch.side_effect = [
+            [_edge("a", "b"), _edge("c", "a", node_id="c")],
+            [_edge("a", "b", node_id="a"), _edge("c", "a", node_id="a")],
+        ]
+
+        result = await service.traverse("a", max_depth=2, direction="both")
+
+        assert "UNION ALL" in conn.fetch.await_args_list[0].args[0]
+        assert len(result["nodes"]) == 3
+        assert [(e["source"], e["target"]) for e in result["edges"]] == [("a", "b"), ("c", "a")]
+
+    @pytest.mark.asyncio
+    async def test_max_nodes_truncates(self, service, conn):
+        """Nodes past max_nodes are dropped along with their edges"""
+        conn.fetch.return_value = [_edge("a", "b"), _edge("a", "c"), _edge("a", "d")]
+
+        result = await service.traverse("a", max_depth=1, max_nodes=2)
+
+        assert [node["id"] for node in result["nodes"]] == ["a", "b"]
+        assert len(result["edges"]) == 1
+        assert result["truncated"] is True
+
+    @pytest.mark.asyncio
+    async def test_no_edges_to_dropped_nodes_at_later_depth(self, service, conn):
+        """An edge reaching a node dropped at an earlier level is not returned"""
+        conn.fetch.side_effect = [
+            [_edge("a", "b"), _edge("a", "c")],
+            [_edge("b", "c"), _edge("b", "a", node_id="a")],
+        ]
+
+        result = await service.traverse("a", max_depth=2, max_nodes=2)
+
+        node_ids = {node["id"] for node in result["nodes"]}
+        assert node_ids == {"a", "b"}
+        assert all(
+            edge["source"] in node_ids and edge["target"] in node_ids for edge in result["edges"]
+        )
+        assert len(result["edges"]) == 2
+        assert result["truncated"] is True
+
+    @pytest.mark.asyncio
+    async def test_invalid_direction(self, service, conn):
+        """Unknown directions are rejected before querying"""
+        with pytest.raises(ValueError):
+            await service.traverse("a", direction="sideways")
+        conn.fetchrow.assert_not_awaited()
+
+
+class TestSubgraphCache:
+    """Tests for the traversal cache"""
+
+    @pytest.mark.asyncio
+    async def test_repeated_traversal_is_cached(self, service, conn):
+        conn.fetch.return_value = [_edge("a", "b")]
+
+        first = await service.traverse("a", max_depth=1)
+        second = await service.traverse("a", max_depth=1)
+
+        assert first == second
+        assert conn.fetch.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_different_parameters_miss(self, service, conn):
+        await service.traverse("a", max_depth=1)
+        await service.traverse("a", max_depth=1, direction="both")
+        await service.traverse("a", max_depth=1, use_cache=False)
+
+        assert conn.fetch.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_cache(self, service, conn):
+        await service.traverse("a", max_depth=1)
+        await service.add_relation(GraphRelation(source_id="a", target_id="b", type="requires"))
+        await service.traverse("a", max_depth=1)
+
+        assert conn.fetch.await_count == 2
+
+
+class TestFindEntityByName:
+    """Tests for gazetteer-backed entity lookup"""
+
+    @staticmethod
+    def _entity_row(entity_id, name):
+        return {
+            "id": entity_id,
+            "type": "visa",
+            "name": name,
+            "description": None,
+            "properties": "{}",
+        }
+
+    @pytest.mark.asyncio
+    async def test_known_name_fetched_by_id(self, service, conn):
+        conn.fetch.side_effect = [
+            [
+                {"id": "kitas", "name": "KITAS", "canonical_name": "kitas"},
+                {"id": "pt_pma", "name": "PT PMA", "canonical_name": None},
+            ],
+            [self._entity_row("kitas", "KITAS")],
+        ]
+
+        entities = await service.find_entity_by_name("Investor kitas", limit=1)
+
+        assert [e.id for e in entities] == ["kitas"]
+        query, ids, limit = conn.fetch.await_args.args
+        assert "id = ANY($1::text[])" in query
+        assert (ids, limit) == (["kitas"], 1)
+
+    @pytest.mark.asyncio
+    async def test_unknown_name_falls_back_to_ilike(self, service, conn):
+        conn.fetch.side_effect = [[], [self._entity_row("kitas", "KITAS")]]
+
+        entities = await service.find_entity_by_name("kit")
+
+        assert [e.id for e in entities] == ["kitas"]
+        assert conn.fetch.await_args.args[1:] == ("%kit%", 5)
+
+    @pytest.mark.asyncio
+    async def test_names_loaded_once_and_updated_by_add_entity(self, service, conn):
+        conn.fetch.side_effect = [[], [], [self._entity_row("golden", "Golden Visa")]]
+        conn.fetchval.return_value = "golden"
+
+        await service.find_entity_by_name("golden visa")
+        await service.add_entity(GraphEntity(id="golden", type="visa", name="Golden Visa"))
+        await service.find_entity_by_name("golden visa")
+
+        assert conn.fetch.await_count == 3
+        assert conn.fetch.await_args.args[1] == ["golden"]
@@ -4,7 +4,7 @@ Target: 95%+ coverage
 """
 
 import json
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import numpy as np
 import pytest
@@ -100,8 +100,11 @@ class TestSemanticCache:
         """Test _enforce_cache_size"""
         mock_redis.zcard = AsyncMock(return_value=10001)  # Over limit
         mock_redis.zrange = AsyncMock(return_value=["embedding:key1"])
+        pipe = MagicMock()
+        pipe.execute = AsyncMock()
+        mock_redis.pipeline = MagicMock(return_value=pipe)
         await cache._enforce_cache_size()
-        mock_redis.delete.assert_called()
+        pipe.delete.assert_called_once_with("embedding:key1", "semantic_cache:key1")
 
     @pytest.mark.asyncio
     async def test_get_cache_stats(self, cache, mock_redis):
@@ -10,6 +10,7 @@ from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from redis import exceptions as redis_exceptions
 
 # Ensure backend is in path
 backend_path = Path(__file__).parent.parent.parent.parent / "backend"
@@ -33,6 +34,10 @@ def mock_redis():
     mock.expire = AsyncMock(return_value=True)
     mock.ttl = AsyncMock(return_value=86400)
     mock.close = AsyncMock()
+    # Commands are queued synchronously on the pipeline; execute() returns their results
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    mock.pipeline = MagicMock(return_value=pipe)
     return mock
 
 
@@ -129,12 +134,14 @@ class TestCreateSession:
 
         assert session_id is not None
         assert len(session_id) == 36  # UUID format
-        mock_redis.setex.assert_called_once()
+        pipe = mock_redis.pipeline.return_value
+        pipe.hset.assert_any_call(f"session_meta:{session_id}", "message_count", 0)
+        pipe.execute.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_create_session_failure(self, session_service, mock_redis):
         """Test session creation failure"""
-        mock_redis.setex = AsyncMock(side_effect=Exception("Redis error"))
+        mock_redis.pipeline.return_value.execute = AsyncMock(side_effect=Exception("Redis error"))
 
         with pytest.raises(Exception) as exc_info:
             await session_service.create_session()
@@ -157,17 +164,39 @@ class TestGetHistory:
             {"role": "user", "content": "Hello"},
             {"role": "assistant", "content": "Hi there!"},
         ]
-        mock_redis.get = AsyncMock(return_value=json.dumps(history))
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute = AsyncMock(return_value=[1, [json.dumps(m) for m in history]])
 
         result = await session_service.get_history("session_123")
 
         assert result == history
         assert len(result) == 2
+        pipe.lrange.assert_called_once_with("session:session_123", 0, -1)
+
+    @pytest.mark.asyncio
+    async def test_get_history_last_n(self, session_service, mock_redis):
+        """Test range read of the last N messages"""
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute = AsyncMock(return_value=[1, [json.dumps({"role": "user", "content": "Hi"})]])
+
+        result = await session_service.get_history("session_123", limit=1)
+
+        assert result == [{"role": "user", "content": "Hi"}]
+        pipe.lrange.assert_called_once_with("session:session_123", -1, -1)
+
+    @pytest.mark.asyncio
+    async def test_get_history_empty_session(self, session_service, mock_redis):
+        """Test a created session without messages returns an empty history"""
+        mock_redis.pipeline.return_value.execute = AsyncMock(return_value=[1, []])
+
+        result = await session_service.get_history("session_123")
+
+        assert result == []
 
     @pytest.mark.asyncio
     async def test_get_history_not_found(self, session_service, mock_redis):
         """Test history retrieval for non-existent session"""
-        mock_redis.get = AsyncMock(return_value=None)
+        mock_redis.pipeline.return_value.execute = AsyncMock(return_value=[0, []])
 
         result = await session_service.get_history("nonexistent_session")
 
@@ -176,16 +205,37 @@ class TestGetHistory:
     @pytest.mark.asyncio
     async def test_get_history_json_decode_error(self, session_service, mock_redis):
         """Test history retrieval with invalid JSON"""
-        mock_redis.get = AsyncMock(return_value="invalid json {{{")
+        mock_redis.pipeline.return_value.execute = AsyncMock(return_value=[1, ["invalid json {{{"]])
 
         result = await session_service.get_history("session_123")
 
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_get_history_legacy_string_value(self, session_service, mock_redis):
+        """Test a session stored in the old JSON string format is converted on read"""
+        history = [
+            {"role": "user", "content": "Hello"},
+            {"role": "assistant", "content": "Hi there!"},
+        ]
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute = AsyncMock(
+            side_effect=[redis_exceptions.ResponseError("WRONGTYPE"), [1, 2, 1, 1, 1, 1, 1]]
+        )
+        mock_redis.get = AsyncMock(return_value=json.dumps(history))
+
+        result = await session_service.get_history("session_123", limit=1)
+
+        assert result == history[-1:]
+        pipe.delete.assert_called_once_with("session:session_123")
+        pipe.rpush.assert_called_once_with("session:session_123", *(json.dumps(m) for m in history))
+
     @pytest.mark.asyncio
     async def test_get_history_redis_error(self, session_service, mock_redis):
         """Test history retrieval with Redis error"""
-        mock_redis.get = AsyncMock(side_effect=Exception("Redis connection lost"))
+        mock_redis.pipeline.return_value.execute = AsyncMock(
+            side_effect=Exception("Redis connection lost")
+        )
 
         result = await session_service.get_history("session_123")
 
@@ -204,11 +254,49 @@ class TestUpdateHistory:
     async def test_update_history_success(self, session_service, mock_redis):
         """Test successful history update"""
         history = [{"role": "user", "content": "Hello"}]
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute = AsyncMock(side_effect=[[0, None], []])
+
+        result = await session_service.update_history("session_123", history)
+
+        assert result is True
+        pipe.delete.assert_called_once_with("session:session_123")
+        pipe.rpush.assert_called_once_with("session:session_123", json.dumps(history[0]))
+        pipe.hset.assert_any_call("session_meta:session_123", "message_count", 1)
+
+    @pytest.mark.asyncio
+    async def test_update_history_appends_new_messages(self, session_service, mock_redis):
+        """Test only messages past the stored ones are pushed, with trim and TTL refresh"""
+        stored = {"role": "user", "content": "Hello"}
+        new = [{"role": "assistant", "content": "Hi!"}, {"role": "user", "content": "Visa?"}]
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute = AsyncMock(side_effect=[[1, json.dumps(stored)], []])
+
+        result = await session_service.update_history("session_123", [stored, *new])
+
+        assert result is True
+        pipe.delete.assert_not_called()
+        pipe.rpush.assert_called_once_with("session:session_123", *(json.dumps(m) for m in new))
+        pipe.ltrim.assert_called_once_with("session:session_123", -500, -1)
+        pipe.hincrby.assert_called_once_with("session_meta:session_123", "message_count", 2)
+        pipe.expire.assert_any_call("session:session_123", timedelta(hours=24))
+        pipe.expire.assert_any_call("session_meta:session_123", timedelta(hours=24))
+
+    @pytest.mark.asyncio
+    async def test_update_history_rewritten_history_replaces(self, session_service, mock_redis):
+        """Test a history that no longer ends in the stored message replaces the list"""
+        history = [{"role": "user", "content": "Edited"}, {"role": "assistant", "content": "Ok"}]
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute = AsyncMock(
+            side_effect=[[1, json.dumps({"role": "user", "content": "Original"})], []]
+        )
 
         result = await session_service.update_history("session_123", history)
 
         assert result is True
-        mock_redis.setex.assert_called()
+        pipe.delete.assert_called_once_with("session:session_123")
+        pipe.hincrby.assert_not_called()
+        pipe.hset.assert_any_call("session_meta:session_123", "message_count", 2)
 
     @pytest.mark.asyncio
     async def test_update_history_invalid_format(self, session_service, mock_redis):
@@ -220,7 +308,7 @@ class TestUpdateHistory:
     @pytest.mark.asyncio
     async def test_update_history_redis_error(self, session_service, mock_redis):
         """Test history update with Redis error"""
-        mock_redis.setex = AsyncMock(side_effect=Exception("Redis error"))
+        mock_redis.pipeline.return_value.execute = AsyncMock(side_effect=Exception("Redis error"))
         history = [{"role": "user", "content": "Hello"}]
 
         result = await session_service.update_history("session_123", history)
@@ -228,6 +316,61 @@ class TestUpdateHistory:
         assert result is False
 
 
+# ============================================================================
+# APPEND MESSAGES TESTS
+# ============================================================================
+
+
+class TestAppendMessages:
+    """Tests for append_messages method"""
+
+    @pytest.mark.asyncio
+    async def test_append_messages_success(self, session_service, mock_redis):
+        """Test messages are pushed without reading the stored history"""
+        messages = [{"role": "user", "content": "Hello"}]
+        pipe = mock_redis.pipeline.return_value
+
+        result = await session_service.append_messages("session_123", messages)
+
+        assert result is True
+        mock_redis.pipeline.assert_called_once_with(transaction=True)
+        pipe.rpush.assert_called_once_with("session:session_123", json.dumps(messages[0]))
+        pipe.ltrim.assert_called_once_with("session:session_123", -500, -1)
+        pipe.hincrby.assert_called_once_with("session_meta:session_123", "message_count", 1)
+        pipe.lrange.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_append_messages_invalid_format(self, session_service, mock_redis):
+        """Test append with invalid format"""
+        result = await session_service.append_messages("session_123", "not a list")
+
+        assert result is False
+
+    @pytest.mark.asyncio
+    async def test_append_messages_legacy_string_value(self, session_service, mock_redis):
+        """Test appending to a session in the old JSON string format converts it first"""
+        stored = [{"role": "user", "content": "Hello"}]
+        new = [{"role": "assistant", "content": "Hi!"}]
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute = AsyncMock(side_effect=[redis_exceptions.ResponseError("WRONGTYPE"), [], []])
+        mock_redis.get = AsyncMock(return_value=json.dumps(stored))
+
+        result = await session_service.append_messages("session_123", new)
+
+        assert result is True
+        pipe.delete.assert_called_once_with("session:session_123")
+        pipe.rpush.assert_called_with("session:session_123", json.dumps(new[0]))
+
+    @pytest.mark.asyncio
+    async def test_append_messages_redis_error(self, session_service, mock_redis):
+        """Test append with Redis error"""
+        mock_redis.pipeline.return_value.execute = AsyncMock(side_effect=Exception("Redis error"))
+
+        result = await session_service.append_messages("session_123", [{"role": "user"}])
+
+        assert result is False
+
+
 # ============================================================================
 # DELETE SESSION TESTS
 # ============================================================================
@@ -244,7 +387,7 @@ class TestDeleteSession:
         result = await session_service.delete_session("session_123")
 
         assert result is True
-        mock_redis.delete.assert_called_with("session:session_123")
+        mock_redis.delete.assert_called_with("session:session_123", "session_meta:session_123")
 
     @pytest.mark.asyncio
     async def test_delete_session_not_found(self, session_service, mock_redis):
@@ -276,17 +419,18 @@ class TestExtendTtl:
     @pytest.mark.asyncio
     async def test_extend_ttl_success(self, session_service, mock_redis):
         """Test successful TTL extension"""
-        mock_redis.expire = AsyncMock(return_value=True)
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute = AsyncMock(return_value=[False, True])
 
         result = await session_service.extend_ttl("session_123")
 
         assert result is True
-        mock_redis.expire.assert_called_once()
+        assert pipe.expire.call_count == 2
 
     @pytest.mark.asyncio
     async def test_extend_ttl_session_not_found(self, session_service, mock_redis):
         """Test TTL extension for non-existent session"""
-        mock_redis.expire = AsyncMock(return_value=False)
+        mock_redis.pipeline.return_value.execute = AsyncMock(return_value=[False, False])
 
         result = await session_service.extend_ttl("nonexistent")
 
@@ -295,7 +439,7 @@ class TestExtendTtl:
     @pytest.mark.asyncio
     async def test_extend_ttl_redis_error(self, session_service, mock_redis):
         """Test TTL extension with Redis error"""
-        mock_redis.expire = AsyncMock(side_effect=Exception("Redis error"))
+        mock_redis.pipeline.return_value.execute = AsyncMock(side_effect=Exception("Redis error"))
 
         result = await session_service.extend_ttl("session_123")
 
@@ -313,9 +457,8 @@ class TestGetSessionInfo:
     @pytest.mark.asyncio
     async def test_get_session_info_success(self, session_service, mock_redis):
         """Test successful session info retrieval"""
-        history = [{"role": "user", "content": "Hello"}]
-        mock_redis.ttl = AsyncMock(return_value=3600)
-        mock_redis.get = AsyncMock(return_value=json.dumps(history))
+        meta = {"message_count": "1", "created_at": "2026-01-01T00:00:00+00:00"}
+        mock_redis.pipeline.return_value.execute = AsyncMock(return_value=[3600, meta])
 
         result = await session_service.get_session_info("session_123")
 
@@ -324,11 +467,14 @@ class TestGetSessionInfo:
         assert result["message_count"] == 1
         assert result["ttl_seconds"] == 3600
         assert result["ttl_hours"] == 1.0
+        assert result["created_at"] == "2026-01-01T00:00:00+00:00"
+        mock_redis.get.assert_not_called()  # History is never decoded
 
     @pytest.mark.asyncio
     async def test_get_session_info_key_not_exists(self, session_service, mock_redis):
         """Test session info for non-existent key"""
-        mock_redis.ttl = AsyncMock(return_value=-2)
+        mock_redis.pipeline.return_value.execute = AsyncMock(return_value=[-2, {}])
+        mock_redis.get = AsyncMock(return_value=None)
 
         result = await session_service.get_session_info("nonexistent")
 
@@ -337,7 +483,7 @@ class TestGetSessionInfo:
     @pytest.mark.asyncio
     async def test_get_session_info_no_data(self, session_service, mock_redis):
         """Test session info when data is missing"""
-        mock_redis.ttl = AsyncMock(return_value=3600)
+        mock_redis.pipeline.return_value.execute = AsyncMock(return_value=[3600, {}])
         mock_redis.get = AsyncMock(return_value=None)
 
         result = await session_service.get_session_info("session_123")
@@ -347,7 +493,7 @@ class TestGetSessionInfo:
     @pytest.mark.asyncio
     async def test_get_session_info_redis_error(self, session_service, mock_redis):
         """Test session info with Redis error"""
-        mock_redis.ttl = AsyncMock(side_effect=Exception("Redis error"))
+        mock_redis.pipeline.return_value.execute = AsyncMock(side_effect=Exception("Redis error"))
 
         result = await session_service.get_session_info("session_123")
 
@@ -398,46 +544,41 @@ class TestGetAnalytics:
     @pytest.mark.asyncio
     async def test_get_analytics_with_sessions(self, session_service, mock_redis):
         """Test analytics with sessions"""
-        sessions = {
-            "session:sess1": json.dumps([{"role": "user", "content": "Hello"}]),
-            "session:sess2": json.dumps(
-                [
-                    {"role": "user", "content": "Hi"},
-                    {"role": "assistant", "content": "Hello!"},
-                ]
-            ),
-        }
+        counts = {"session_meta:sess1": "1", "session_meta:sess2": "2"}
 
         async def mock_scan_iter(*args, **kwargs):
-            for key in sessions.keys():
+            for key in counts.keys():
                 yield key
 
         mock_redis.scan_iter = mock_scan_iter
-        mock_redis.get = AsyncMock(side_effect=lambda k: sessions.get(k))
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute = AsyncMock(return_value=list(counts.values()))
 
         result = await session_service.get_analytics()
 
         assert result["total_sessions"] == 2
         assert result["active_sessions"] == 2
         assert result["avg_messages_per_session"] == 1.5
-        assert result["top_session"]["messages"] == 2
+        assert result["top_session"] == {"id": "sess2", "messages": 2}
+        pipe.hget.assert_any_call("session_meta:sess1", "message_count")
+        mock_redis.get.assert_not_called()  # Histories are never decoded
 
     @pytest.mark.asyncio
     async def test_get_analytics_with_ranges(self, session_service, mock_redis):
         """Test analytics message count ranges"""
-        sessions = {
-            "session:small": json.dumps([{"role": "user", "content": "x"}] * 5),
-            "session:medium": json.dumps([{"role": "user", "content": "x"}] * 15),
-            "session:large": json.dumps([{"role": "user", "content": "x"}] * 35),
-            "session:xlarge": json.dumps([{"role": "user", "content": "x"}] * 60),
+        counts = {
+            "session_meta:small": "5",
+            "session_meta:medium": "15",
+            "session_meta:large": "35",
+            "session_meta:xlarge": "60",
         }
 
         async def mock_scan_iter(*args, **kwargs):
-            for key in sessions.keys():
+            for key in counts.keys():
                 yield key
 
         mock_redis.scan_iter = mock_scan_iter
-        mock_redis.get = AsyncMock(side_effect=lambda k: sessions.get(k))
+        mock_redis.pipeline.return_value.execute = AsyncMock(return_value=list(counts.values()))
 
         result = await session_service.get_analytics()
 
@@ -447,26 +588,43 @@ class TestGetAnalytics:
         assert result["sessions_by_range"]["51+"] == 1
 
     @pytest.mark.asyncio
-    async def test_get_analytics_json_decode_error(self, session_service, mock_redis):
-        """Test analytics with invalid JSON in session"""
-        sessions = {
-            "session:valid": json.dumps([{"role": "user", "content": "Hi"}]),
-            "session:invalid": "not valid json {{",
-        }
+    async def test_get_analytics_session_expired_during_scan(self, session_service, mock_redis):
+        """Test analytics skips sessions that expire between SCAN and HGET"""
+        keys = ["session_meta:active", "session_meta:empty", "session_meta:expired"]
 
         async def mock_scan_iter(*args, **kwargs):
-            for key in sessions.keys():
+            for key in keys:
                 yield key
 
         mock_redis.scan_iter = mock_scan_iter
-        mock_redis.get = AsyncMock(side_effect=lambda k: sessions.get(k))
+        mock_redis.pipeline.return_value.execute = AsyncMock(return_value=["3", "0", None])
 
         result = await session_service.get_analytics()
 
-        # Should handle gracefully, only count valid session
         assert result["total_sessions"] == 2
         assert result["active_sessions"] == 1
 
+    @pytest.mark.asyncio
+    async def test_get_analytics_batches_counter_reads(self, session_service, mock_redis):
+        """Test counter reads are pipelined in batches"""
+        from services.session_service import ANALYTICS_BATCH_SIZE
+
+        total = ANALYTICS_BATCH_SIZE + 1
+
+        async def mock_scan_iter(*args, **kwargs):
+            for i in range(total):
+                yield f"session_meta:s{i}"
+
+        mock_redis.scan_iter = mock_scan_iter
+        mock_redis.pipeline.return_value.execute = AsyncMock(
+            side_effect=[["2"] * ANALYTICS_BATCH_SIZE, ["2"]]
+        )
+
+        result = await session_service.get_analytics()
+
+        assert result["total_sessions"] == total
+        assert mock_redis.pipeline.return_value.execute.await_count == 2
+
     @pytest.mark.asyncio
     async def test_get_analytics_redis_error(self, session_service, mock_redis):
         """Test analytics with Redis error"""
@@ -495,20 +653,21 @@ class TestUpdateHistoryWithTtl:
     async def test_update_history_with_custom_ttl(self, session_service, mock_redis):
         """Test history update with custom TTL"""
         history = [{"role": "user", "content": "Hello"}]
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute = AsyncMock(side_effect=[[0, None], []])
 
-        result = await session_service.update_history_with_ttl(
-            "session_123", history, ttl_hours=48
-        )
+        result = await session_service.update_history_with_ttl("session_123", history, ttl_hours=48)
 
         assert result is True
-        # Verify setex was called with custom TTL
-        call_args = mock_redis.setex.call_args
-        assert call_args[0][1] == timedelta(hours=48)
+        # Verify both keys got the custom TTL
+        pipe.expire.assert_any_call("session:session_123", timedelta(hours=48))
+        pipe.expire.assert_any_call("session_meta:session_123", timedelta(hours=48))
 
     @pytest.mark.asyncio
     async def test_update_history_with_default_ttl(self, session_service, mock_redis):
         """Test history update with default TTL"""
         history = [{"role": "user", "content": "Hello"}]
+        mock_redis.pipeline.return_value.execute = AsyncMock(side_effect=[[0, None], []])
 
         result = await session_service.update_history_with_ttl(
             "session_123", history, ttl_hours=None
@@ -517,9 +676,7 @@ class TestUpdateHistoryWithTtl:
         assert result is True
 
     @pytest.mark.asyncio
-    async def test_update_history_with_ttl_invalid_format(
-        self, session_service, mock_redis
-    ):
+    async def test_update_history_with_ttl_invalid_format(self, session_service, mock_redis):
         """Test history update with invalid format"""
         result = await session_service.update_history_with_ttl(
             "session_123", "not a list", ttl_hours=24
@@ -528,16 +685,12 @@ class TestUpdateHistoryWithTtl:
         assert result is False
 
     @pytest.mark.asyncio
-    async def test_update_history_with_ttl_redis_error(
-        self, session_service, mock_redis
-    ):
+    async def test_update_history_with_ttl_redis_error(self, session_service, mock_redis):
         """Test history update with Redis error"""
-        mock_redis.setex = AsyncMock(side_effect=Exception("Redis error"))
+        mock_redis.pipeline.return_value.execute = AsyncMock(side_effect=Exception("Redis error"))
         history = [{"role": "user", "content": "Hello"}]
 
-        result = await session_service.update_history_with_ttl(
-            "session_123", history, ttl_hours=24
-        )
+        result = await session_service.update_history_with_ttl("session_123", history, ttl_hours=24)
 
         assert result is False
 
@@ -553,20 +706,19 @@ class TestExtendTtlCustom:
     @pytest.mark.asyncio
     async def test_extend_ttl_custom_success(self, session_service, mock_redis):
         """Test successful custom TTL extension"""
-        mock_redis.expire = AsyncMock(return_value=True)
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute = AsyncMock(return_value=[True, True])
 
         result = await session_service.extend_ttl_custom("session_123", 72)
 
         assert result is True
-        call_args = mock_redis.expire.call_args
-        assert call_args[0][1] == timedelta(hours=72)
+        pipe.expire.assert_any_call("session:session_123", timedelta(hours=72))
+        pipe.expire.assert_any_call("session_meta:session_123", timedelta(hours=72))
 
     @pytest.mark.asyncio
-    async def test_extend_ttl_custom_session_not_found(
-        self, session_service, mock_redis
-    ):
+    async def test_extend_ttl_custom_session_not_found(self, session_service, mock_redis):
         """Test custom TTL extension for non-existent session"""
-        mock_redis.expire = AsyncMock(return_value=False)
+        mock_redis.pipeline.return_value.execute = AsyncMock(return_value=[False, False])
 
         result = await session_service.extend_ttl_custom("nonexistent", 48)
 
@@ -575,7 +727,7 @@ class TestExtendTtlCustom:
     @pytest.mark.asyncio
     async def test_extend_ttl_custom_redis_error(self, session_service, mock_redis):
         """Test custom TTL extension with Redis error"""
-        mock_redis.expire = AsyncMock(side_effect=Exception("Redis error"))
+        mock_redis.pipeline.return_value.execute = AsyncMock(side_effect=Exception("Redis error"))
 
         result = await session_service.extend_ttl_custom("session_123", 48)
 
@@ -597,7 +749,9 @@ class TestExportSession:
             {"role": "user", "content": "Hello"},
             {"role": "assistant", "content": "Hi there!"},
         ]
-        mock_redis.get = AsyncMock(return_value=json.dumps(history))
+        mock_redis.pipeline.return_value.execute = AsyncMock(
+            return_value=[1, [json.dumps(m) for m in history]]
+        )
 
         result = await session_service.export_session("session_123", format="json")
 
@@ -614,7 +768,9 @@ class TestExportSession:
             {"role": "user", "content": "Hello"},
             {"role": "assistant", "content": "Hi there!"},
         ]
-        mock_redis.get = AsyncMock(return_value=json.dumps(history))
+        mock_redis.pipeline.return_value.execute = AsyncMock(
+            return_value=[1, [json.dumps(m) for m in history]]
+        )
 
         result = await session_service.export_session("session_123", format="markdown")
 
@@ -629,7 +785,7 @@ class TestExportSession:
     @pytest.mark.asyncio
     async def test_export_session_not_found(self, session_service, mock_redis):
         """Test export of non-existent session"""
-        mock_redis.get = AsyncMock(return_value=None)
+        mock_redis.pipeline.return_value.execute = AsyncMock(return_value=[0, []])
 
         result = await session_service.export_session("nonexistent")
 
@@ -638,7 +794,7 @@ class TestExportSession:
     @pytest.mark.asyncio
     async def test_export_session_error(self, session_service, mock_redis):
         """Test export with error"""
-        mock_redis.get = AsyncMock(side_effect=Exception("Redis error"))
+        mock_redis.pipeline.return_value.execute = AsyncMock(side_effect=Exception("Redis error"))
 
         result = await session_service.export_session("session_123")
 
@@ -4,7 +4,7 @@ Target: 99%+ coverage
 """
 
 import json
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -24,6 +24,9 @@ class TestSessionService:
         redis_mock.expire = AsyncMock()
         redis_mock.keys = AsyncMock(return_value=[])
         redis_mock.close = AsyncMock()
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[])
+        redis_mock.pipeline = MagicMock(return_value=pipe)
         return redis_mock
 
     @pytest.fixture
@@ -78,12 +81,12 @@ class TestSessionService:
         session_id = await session_service.create_session()
         assert session_id is not None
         assert isinstance(session_id, str)
-        mock_redis.setex.assert_called_once()
+        mock_redis.pipeline.return_value.execute.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_create_session_error(self, session_service, mock_redis):
         """Test create_session with error"""
-        mock_redis.setex = AsyncMock(side_effect=Exception("Error"))
+        mock_redis.pipeline.return_value.execute = AsyncMock(side_effect=Exception("Error"))
         with pytest.raises(Exception):
             await session_service.create_session()
 
@@ -91,28 +94,30 @@ class TestSessionService:
     async def test_get_history_success(self, session_service, mock_redis):
         """Test get_history success"""
         history = [{"role": "user", "content": "Hello"}]
-        mock_redis.get = AsyncMock(return_value=json.dumps(history))
+        mock_redis.pipeline.return_value.execute = AsyncMock(
+            return_value=[1, [json.dumps(history[0])]]
+        )
         result = await session_service.get_history("session123")
         assert result == history
 
     @pytest.mark.asyncio
     async def test_get_history_not_found(self, session_service, mock_redis):
         """Test get_history when session not found"""
-        mock_redis.get = AsyncMock(return_value=None)
+        mock_redis.pipeline.return_value.execute = AsyncMock(return_value=[0, []])
         result = await session_service.get_history("session123")
         assert result is None
 
     @pytest.mark.asyncio
     async def test_get_history_invalid_json(self, session_service, mock_redis):
         """Test get_history with invalid JSON"""
-        mock_redis.get = AsyncMock(return_value="invalid json")
+        mock_redis.pipeline.return_value.execute = AsyncMock(return_value=[1, ["invalid json"]])
         result = await session_service.get_history("session123")
         assert result is None
 
     @pytest.mark.asyncio
     async def test_get_history_error(self, session_service, mock_redis):
         """Test get_history with error"""
-        mock_redis.get = AsyncMock(side_effect=Exception("Error"))
+        mock_redis.pipeline.return_value.execute = AsyncMock(side_effect=Exception("Error"))
         result = await session_service.get_history("session123")
         assert result is None
 
@@ -120,14 +125,16 @@ class TestSessionService:
     async def test_update_history_success(self, session_service, mock_redis):
         """Test update_history success"""
         history = [{"role": "user", "content": "Hello"}]
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute = AsyncMock(side_effect=[[0, None], []])
         result = await session_service.update_history("session123", history)
         assert result is True
-        mock_redis.set.assert_called_once()
+        pipe.rpush.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_update_history_error(self, session_service, mock_redis):
         """Test update_history with error"""
-        mock_redis.set = AsyncMock(side_effect=Exception("Error"))
+        mock_redis.pipeline.return_value.execute = AsyncMock(side_effect=Exception("Error"))
         history = [{"role": "user", "content": "Hello"}]
         result = await session_service.update_history("session123", history)
         assert result is False
@@ -15,13 +15,15 @@ import json
 import os
 import sys
 from dataclasses import dataclass
-from unittest.mock import AsyncMock, MagicMock, Mock, patch, mock_open
+from unittest.mock import AsyncMock, MagicMock, Mock, mock_open, patch
 
 import pytest
 
 # Add backend directory to path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../backend")))
 
+from core.document_cache import CachedDocument
+
 from services.smart_oracle import (
     download_pdf_from_drive,
     get_drive_service,
@@ -33,6 +35,7 @@ from services.smart_oracle import (
 @dataclass
 class MockGeminiFile:
     """Mock Gemini file upload response"""
+
     uri: str = "https://generativelanguage.googleapis.com/v1/files/test-file"
     mime_type: str = "application/pdf"
     name: str = "test.pdf"
@@ -41,11 +44,19 @@ class MockGeminiFile:
 @dataclass
 class MockDriveFile:
     """Mock Google Drive file metadata"""
+
     id: str
     name: str
     mimeType: str = "application/pdf"
 
 
+def _cached_document(pdf_path):
+    """Document cache entry for pdf_path (None: document not found)"""
+    if pdf_path is None:
+        return None
+    return CachedDocument(file_id="file123", name="test.pdf", sha256="0" * 64, pdf_path=pdf_path)
+
+
 class TestGetDriveService:
     """Test suite for get_drive_service function"""
 
@@ -53,7 +64,9 @@ class TestGetDriveService:
     @patch("services.smart_oracle.json.loads")
     @patch("services.smart_oracle.service_account.Credentials.from_service_account_info")
     @patch("services.smart_oracle.build")
-    def test_get_drive_service_success(self, mock_build, mock_from_account_info, mock_json_loads, mock_settings):
+    def test_get_drive_service_success(
+        self, mock_build, mock_from_account_info, mock_json_loads, mock_settings
+    ):
         """Test successful Drive service initialization"""
         # Setup mocks
         mock_settings.google_credentials_json = '{"type": "service_account"}'
@@ -159,11 +172,7 @@ class TestDownloadPdfFromDrive:
         # Mock file search results
         mock_files_list = MagicMock()
         mock_execute = MagicMock()
-        mock_execute.return_value = {
-            "files": [
-                {"id": "file123", "name": "test_document.pdf"}
-            ]
-        }
+        mock_execute.return_value = {"files": [{"id": "file123", "name": "test_document.pdf"}]}
         mock_files_list.execute = mock_execute
         mock_service.files().list.return_value = mock_files_list
 
@@ -299,9 +308,7 @@ class TestDownloadPdfFromDrive:
 
         # Mock successful file search
         mock_files_list = MagicMock()
-        mock_files_list.execute.return_value = {
-            "files": [{"id": "file999", "name": "test.pdf"}]
-        }
+        mock_files_list.execute.return_value = {"files": [{"id": "file999", "name": "test.pdf"}]}
         mock_service.files().list.return_value = mock_files_list
 
         # Mock download failure
@@ -317,17 +324,17 @@ class TestSmartOracle:
     """Test suite for smart_oracle async function"""
 
     @pytest.mark.asyncio
-    @patch("services.smart_oracle.download_pdf_from_drive")
+    @patch("services.smart_oracle.get_document_cache")
     @patch("services.smart_oracle._genai_client")
     @patch("services.smart_oracle.genai")
     @patch("services.smart_oracle.settings")
     @patch("services.smart_oracle.os.remove")
     async def test_smart_oracle_success(
-        self, mock_remove, mock_settings, mock_genai_module, mock_genai_client, mock_download
+        self, mock_remove, mock_settings, mock_genai_module, mock_genai_client, mock_cache
     ):
         """Test successful smart oracle analysis"""
         # Setup mocks
-        mock_download.return_value = "/tmp/test.pdf"
+        mock_cache.return_value.get = AsyncMock(return_value=_cached_document("/tmp/test.pdf"))
         mock_settings.google_api_key = "test_api_key"
 
         # Mock GenAI client
@@ -347,26 +354,30 @@ class TestSmartOracle:
 
         # Verify
         assert result == "Detailed analysis of the document."
-        mock_download.assert_called_once_with("test_document.pdf")
+        mock_cache.return_value.get.assert_awaited_once_with("test_document.pdf")
         mock_genai_client_instance.files.upload.assert_called_once_with(file="/tmp/test.pdf")
-        mock_remove.assert_called_once_with("/tmp/test.pdf")
+        # The PDF lives in the document cache and must be kept
+        mock_remove.assert_not_called()
 
     @pytest.mark.asyncio
-    @patch("services.smart_oracle.download_pdf_from_drive")
-    async def test_smart_oracle_pdf_not_found(self, mock_download):
+    @patch("services.smart_oracle.get_document_cache")
+    async def test_smart_oracle_pdf_not_found(self, mock_cache):
         """Test smart oracle when PDF cannot be downloaded"""
-        mock_download.return_value = None
+        mock_cache.return_value.get = AsyncMock(return_value=_cached_document(None))
 
         result = await smart_oracle("What is this document about?", "missing.pdf")
 
-        assert result == "Original document not found in Drive storage. Unable to perform deep analysis."
+        assert (
+            result
+            == "Original document not found in Drive storage. Unable to perform deep analysis."
+        )
 
     @pytest.mark.asyncio
-    @patch("services.smart_oracle.download_pdf_from_drive")
+    @patch("services.smart_oracle.get_document_cache")
     @patch("services.smart_oracle._genai_client")
-    async def test_smart_oracle_genai_unavailable(self, mock_genai_client, mock_download):
+    async def test_smart_oracle_genai_unavailable(self, mock_genai_client, mock_cache):
         """Test smart oracle when GenAI client is unavailable"""
-        mock_download.return_value = "/tmp/test.pdf"
+        mock_cache.return_value.get = AsyncMock(return_value=_cached_document("/tmp/test.pdf"))
         mock_genai_client.is_available = False
 
         result = await smart_oracle("What is this document about?", "test.pdf")
@@ -374,11 +385,11 @@ class TestSmartOracle:
         assert result == "AI service not available. Please check configuration."
 
     @pytest.mark.asyncio
-    @patch("services.smart_oracle.download_pdf_from_drive")
+    @patch("services.smart_oracle.get_document_cache")
     @patch("services.smart_oracle._genai_client")
-    async def test_smart_oracle_genai_client_none(self, mock_genai_client, mock_download):
+    async def test_smart_oracle_genai_client_none(self, mock_genai_client, mock_cache):
         """Test smart oracle when GenAI client is None"""
-        mock_download.return_value = "/tmp/test.pdf"
+        mock_cache.return_value.get = AsyncMock(return_value=_cached_document("/tmp/test.pdf"))
 
         # Patch the module-level _genai_client to None
         with patch("services.smart_oracle._genai_client", None):
@@ -387,15 +398,15 @@ class TestSmartOracle:
             assert result == "AI service not available. Please check configuration."
 
     @pytest.mark.asyncio
-    @patch("services.smart_oracle.download_pdf_from_drive")
+    @patch("services.smart_oracle.get_document_cache")
     @patch("services.smart_oracle._genai_client")
     @patch("services.smart_oracle.genai")
     @patch("services.smart_oracle.settings")
     async def test_smart_oracle_ai_processing_error(
-        self, mock_settings, mock_genai_module, mock_genai_client, mock_download
+        self, mock_settings, mock_genai_module, mock_genai_client, mock_cache
     ):
         """Test smart oracle when AI processing fails"""
-        mock_download.return_value = "/tmp/test.pdf"
+        mock_cache.return_value.get = AsyncMock(return_value=_cached_document("/tmp/test.pdf"))
         mock_settings.google_api_key = "test_api_key"
         mock_genai_client.is_available = True
 
@@ -409,12 +420,14 @@ class TestSmartOracle:
         assert result == "Error processing the document with AI."
 
     @pytest.mark.asyncio
-    @patch("services.smart_oracle.download_pdf_from_drive")
+    @patch("services.smart_oracle.get_document_cache")
     @patch("services.smart_oracle._genai_client")
     @patch("services.smart_oracle.genai")
-    async def test_smart_oracle_genai_module_none(self, mock_genai_module, mock_genai_client, mock_download):
+    async def test_smart_oracle_genai_module_none(
+        self, mock_genai_module, mock_genai_client, mock_cache
+    ):
         """Test smart oracle when genai module is None"""
-        mock_download.return_value = "/tmp/test.pdf"
+        mock_cache.return_value.get = AsyncMock(return_value=_cached_document("/tmp/test.pdf"))
         mock_genai_client.is_available = True
 
         # Patch genai module to None
@@ -424,16 +437,16 @@ class TestSmartOracle:
             assert result == "GenAI SDK not available."
 
     @pytest.mark.asyncio
-    @patch("services.smart_oracle.download_pdf_from_drive")
+    @patch("services.smart_oracle.get_document_cache")
     @patch("services.smart_oracle._genai_client")
     @patch("services.smart_oracle.genai")
     @patch("services.smart_oracle.settings")
     @patch("services.smart_oracle.os.remove")
     async def test_smart_oracle_generate_content_error(
-        self, mock_remove, mock_settings, mock_genai_module, mock_genai_client, mock_download
+        self, mock_remove, mock_settings, mock_genai_module, mock_genai_client, mock_cache
     ):
         """Test smart oracle when generate_content fails"""
-        mock_download.return_value = "/tmp/test.pdf"
+        mock_cache.return_value.get = AsyncMock(return_value=_cached_document("/tmp/test.pdf"))
         mock_settings.google_api_key = "test_api_key"
         mock_genai_client.is_available = True
 
@@ -443,25 +456,23 @@ class TestSmartOracle:
         mock_genai_client_instance.files.upload.return_value = mock_gemini_file
         mock_genai_module.Client.return_value = mock_genai_client_instance
 
-        mock_genai_client.generate_content = AsyncMock(
-            side_effect=Exception("Generation failed")
-        )
+        mock_genai_client.generate_content = AsyncMock(side_effect=Exception("Generation failed"))
 
         result = await smart_oracle("What is this document about?", "test.pdf")
 
         assert result == "Error processing the document with AI."
 
     @pytest.mark.asyncio
-    @patch("services.smart_oracle.download_pdf_from_drive")
+    @patch("services.smart_oracle.get_document_cache")
     @patch("services.smart_oracle._genai_client")
     @patch("services.smart_oracle.genai")
     @patch("services.smart_oracle.settings")
     @patch("services.smart_oracle.os.remove")
     async def test_smart_oracle_empty_response(
-        self, mock_remove, mock_settings, mock_genai_module, mock_genai_client, mock_download
+        self, mock_remove, mock_settings, mock_genai_module, mock_genai_client, mock_cache
     ):
         """Test smart oracle when AI returns empty response"""
-        mock_download.return_value = "/tmp/test.pdf"
+        mock_cache.return_value.get = AsyncMock(return_value=_cached_document("/tmp/test.pdf"))
         mock_settings.google_api_key = "test_api_key"
         mock_genai_client.is_available = True
 
@@ -479,16 +490,16 @@ class TestSmartOracle:
         assert result == "No response generated."
 
     @pytest.mark.asyncio
-    @patch("services.smart_oracle.download_pdf_from_drive")
+    @patch("services.smart_oracle.get_document_cache")
     @patch("services.smart_oracle._genai_client")
     @patch("services.smart_oracle.genai")
     @patch("services.smart_oracle.settings")
     @patch("services.smart_oracle.os.remove")
     async def test_smart_oracle_file_cleanup_on_error(
-        self, mock_remove, mock_settings, mock_genai_module, mock_genai_client, mock_download
+        self, mock_remove, mock_settings, mock_genai_module, mock_genai_client, mock_cache
     ):
         """Test that temp file cleanup doesn't happen on error"""
-        mock_download.return_value = "/tmp/test.pdf"
+        mock_cache.return_value.get = AsyncMock(return_value=_cached_document("/tmp/test.pdf"))
         mock_settings.google_api_key = "test_api_key"
         mock_genai_client.is_available = True
 
@@ -536,8 +547,7 @@ class TestDriveConnection:
 
         assert result is True
         mock_service.files().list.assert_called_once_with(
-            pageSize=5,
-            fields="files(id, name, mimeType)"
+            pageSize=5, fields="files(id, name, mimeType)"
         )
 
     @patch("services.smart_oracle.get_drive_service")
@@ -602,6 +612,7 @@ class TestModuleLevelInitialization:
         # Import would trigger initialization, but we're testing the logic
         # In real scenario, this happens at module import time
         from llm.genai_client import GenAIClient
+
         client = GenAIClient(api_key="test_key")
 
         assert client is not None
@@ -617,6 +628,7 @@ class TestModuleLevelInitialization:
         # Should not raise, just log warning
         try:
             from llm.genai_client import GenAIClient
+
             client = GenAIClient(api_key="test_key")
             # If we get here, exception was caught
             assert True
@@ -662,9 +674,7 @@ class TestEdgeCases:
 
         long_name = "a" * 200 + ".pdf"
         mock_files_list = MagicMock()
-        mock_files_list.execute.return_value = {
-            "files": [{"id": "long_file", "name": long_name}]
-        }
+        mock_files_list.execute.return_value = {"files": [{"id": "long_file", "name": long_name}]}
         mock_service.files().list.return_value = mock_files_list
 
         pdf_content = b"fake pdf content"
@@ -710,16 +720,18 @@ class TestEdgeCases:
                     assert result is not None
 
     @pytest.mark.asyncio
-    @patch("services.smart_oracle.download_pdf_from_drive")
+    @patch("services.smart_oracle.get_document_cache")
     @patch("services.smart_oracle._genai_client")
     @patch("services.smart_oracle.genai")
     @patch("services.smart_oracle.settings")
     @patch("services.smart_oracle.os.remove")
     async def test_smart_oracle_large_pdf(
-        self, mock_remove, mock_settings, mock_genai_module, mock_genai_client, mock_download
+        self, mock_remove, mock_settings, mock_genai_module, mock_genai_client, mock_cache
     ):
         """Test smart oracle with large PDF file"""
-        mock_download.return_value = "/tmp/large_document.pdf"
+        mock_cache.return_value.get = AsyncMock(
+            return_value=_cached_document("/tmp/large_document.pdf")
+        )
         mock_settings.google_api_key = "test_api_key"
         mock_genai_client.is_available = True
 
@@ -730,9 +742,7 @@ class TestEdgeCases:
 
         # Simulate large response
         large_response = "A" * 10000
-        mock_genai_client.generate_content = AsyncMock(
-            return_value={"text": large_response}
-        )
+        mock_genai_client.generate_content = AsyncMock(return_value={"text": large_response})
 
         result = await smart_oracle("Summarize this document", "large_document.pdf")
 
@@ -740,16 +750,16 @@ class TestEdgeCases:
         assert result == large_response
 
     @pytest.mark.asyncio
-    @patch("services.smart_oracle.download_pdf_from_drive")
+    @patch("services.smart_oracle.get_document_cache")
     @patch("services.smart_oracle._genai_client")
     @patch("services.smart_oracle.genai")
     @patch("services.smart_oracle.settings")
     @patch("services.smart_oracle.os.remove")
     async def test_smart_oracle_complex_query(
-        self, mock_remove, mock_settings, mock_genai_module, mock_genai_client, mock_download
+        self, mock_remove, mock_settings, mock_genai_module, mock_genai_client, mock_cache
     ):
         """Test smart oracle with complex multi-part query"""
-        mock_download.return_value = "/tmp/test.pdf"
+        mock_cache.return_value.get = AsyncMock(return_value=_cached_document("/tmp/test.pdf"))
         mock_settings.google_api_key = "test_api_key"
         mock_genai_client.is_available = True
 
@@ -776,4 +786,7 @@ class TestEdgeCases:
         # Verify the query was passed correctly (check normalized version without extra whitespace)
         call_args = mock_genai_client.generate_content.call_args
         normalized_query = complex_query.strip()
-        assert any(part in str(call_args) for part in ["analyze this document", "Summarize the main points"])
+        assert any(
+            part in str(call_args)
+            for part in ["analyze this document", "Summarize the main points"]
+        )
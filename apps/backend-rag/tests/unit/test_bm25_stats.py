@@ -0,0 +1,75 @@
+"""
+Unit tests for BM25CorpusStats (document frequencies, avgdl, persistence)
+"""
+
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure backend is in path
+backend_path = Path(__file__).parent.parent.parent / "backend"
+if str(backend_path) not in sys.path:
+    sys.path.insert(0, str(backend_path))
+
+from core.bm25_stats import BM25CorpusStats
+
+
+@pytest.fixture
+def stats():
+    corpus_stats = BM25CorpusStats()
+    corpus_stats.add_documents("legal", [([1, 2], 10), ([2, 3], 20), ([2], 30)])
+    return corpus_stats
+
+
+class TestCorpusStats:
+    def test_counts_and_avg_doc_length(self, stats):
+        assert stats.has_collection("legal")
+        assert stats.doc_count("legal") == 3
+        assert stats.avg_doc_length("legal") == 20.0
+
+    def test_idf_prefers_rare_tokens(self, stats):
+        # df(1) = 1, df(2) = 3, unseen token df = 0
+        assert stats.idf("legal", 1) == pytest.approx(math.log(1 + 2.5 / 1.5))
+        assert stats.idf("legal", 99) > stats.idf("legal", 1) > stats.idf("legal", 2) > 0
+
+    def test_unknown_collection_is_neutral(self, stats):
+        assert not stats.has_collection("other")
+        assert stats.avg_doc_length("other") is None
+        assert stats.idf("other", 1) == 1.0
+
+    def test_remove_documents(self, stats):
+        stats.remove_documents("legal", [([1, 2], 10)])
+
+        assert stats.doc_count("legal") == 2
+        assert stats.avg_doc_length("legal") == 25.0
+        assert stats.get_stats()["collections"]["legal"]["unique_tokens"] == 2
+
+    def test_reset(self, stats):
+        stats.reset("legal")
+        assert not stats.has_collection("legal")
+
+
+class TestPersistence:
+    def test_reload_after_restart(self, tmp_path):
+        first = BM25CorpusStats(path=str(tmp_path))
+        first.add_documents("legal", [([1, 2], 10), ([2], 30)])
+        first.remove_documents("legal", [([1, 2], 10)])
+
+        restarted = BM25CorpusStats(path=str(tmp_path))
+
+        assert restarted.persistent
+        assert restarted.doc_count("legal") == 1
+        assert restarted.avg_doc_length("legal") == 30.0
+        assert restarted.get_stats()["collections"]["legal"]["unique_tokens"] == 1
+
+    def test_picks_up_writes_from_other_process(self, tmp_path):
+        reader = BM25CorpusStats(path=str(tmp_path), reload_interval=0)
+        writer = BM25CorpusStats(path=str(tmp_path))
+
+        writer.add_documents("legal", [([1], 10)])
+        reader.add_documents("legal", [([2], 30)])
+
+        assert reader.doc_count("legal") == 2
+        assert BM25CorpusStats(path=str(tmp_path)).doc_count("legal") == 2
@@ -0,0 +1,116 @@
+"""
+Unit tests for BM25Vectorizer tokenizer, stable hashing and batch vectorization
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure backend is in path
+backend_path = Path(__file__).parent.parent.parent / "backend"
+if str(backend_path) not in sys.path:
+    sys.path.insert(0, str(backend_path))
+
+from core.bm25_vectorizer import BM25Vectorizer, stable_token_hash
+
+
+@pytest.fixture
+def vectorizer():
+    return BM25Vectorizer()
+
+
+class TestTokenize:
+    def test_legal_references_kept_as_single_tokens(self, vectorizer):
+        tokens = vectorizer.tokenize("KBLI 56101 menurut UU No. 6 dan PP No.28 tahun 2021")
+        assert "kbli_56101" in tokens
+        assert "uu_6" in tokens
+        assert "pp_28" in tokens
+        assert "2021" in tokens
+
+    def test_filters_stopwords_punctuation_and_short_numbers(self, vectorizer):
+        tokens = vectorizer.tokenize("Izin usaha, dan restoran! (di 12 provinsi) pajak")
+        assert tokens == ["izin", "usaha", "restoran", "pajak"]
+
+    def test_empty_text(self, vectorizer):
+        assert vectorizer.tokenize("") == []
+
+
+class TestStableHashing:
+    def test_hash_is_stable_across_processes(self, vectorizer):
+        """Indices must not depend on PYTHONHASHSEED"""
+        code = (
+            "from core.bm25_vectorizer import BM25Vectorizer;"
+            "print(BM25Vectorizer()._hash_token('restoran'))"
+        )
+        outputs = set()
+        for seed in ("1", "2"):
+            env = {**os.environ, "PYTHONHASHSEED": seed, "PYTHONPATH": str(backend_path)}
+            result = subprocess.run(
+                [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+            )
+            outputs.add(int(result.stdout.strip()))
+
+        assert outputs == {vectorizer._hash_token("restoran")}
+
+    def test_hash_folds_into_vocab_space(self):
+        small = BM25Vectorizer(vocab_size=1000)
+        assert small._hash_token("restoran") == stable_token_hash("restoran") % 1000
+
+
+class TestBatchSparseVectors:
+    def test_small_batch_matches_single(self, vectorizer):
+        texts = ["izin usaha restoran", "KBLI 56101 restoran"]
+        assert vectorizer.generate_batch_sparse_vectors(texts) == [
+            vectorizer.generate_sparse_vector(text) for text in texts
+        ]
+
+    def test_process_pool_matches_in_process(self, vectorizer, monkeypatch):
+        monkeypatch.setattr("core.bm25_vectorizer.PROCESS_POOL_MIN_TEXTS", 4)
+        texts = [f"izin usaha restoran nomor {i} KBLI 5610{i % 10}" for i in range(12)]
+
+        pooled = vectorizer.generate_batch_sparse_vectors(texts, max_workers=2)
+
+        assert pooled == vectorizer.generate_batch_sparse_vectors(texts, max_workers=1)
+
+
+class TestCorpusStatistics:
+    @pytest.fixture
+    def stats_vectorizer(self):
+        from core.bm25_stats import BM25CorpusStats
+
+        corpus_stats = BM25CorpusStats()
+        vectorizer = BM25Vectorizer(corpus_stats=corpus_stats)
+        docs = ["izin usaha restoran", "izin usaha hotel", "izin tinggal"]
+        corpus_stats.add_documents(
+            "legal",
+            [
+                (vectorizer.generate_sparse_vector(doc)["indices"], len(vectorizer.tokenize(doc)))
+                for doc in docs
+            ],
+        )
+        return vectorizer
+
+    def test_query_terms_weighted_by_idf(self, stats_vectorizer):
+        sparse = stats_vectorizer.generate_query_sparse_vector("izin restoran", collection="legal")
+        weights = dict(zip(sparse["indices"], sparse["values"]))
+
+        # "restoran" appears in one document, "izin" in all three
+        assert (
+            weights[stats_vectorizer._hash_token("restoran")]
+            > weights[stats_vectorizer._hash_token("izin")]
+        )
+
+    def test_untracked_collection_falls_back_to_plain_tf(self, stats_vectorizer):
+        assert stats_vectorizer.generate_query_sparse_vector(
+            "izin restoran", collection="other"
+        ) == stats_vectorizer.generate_query_sparse_vector("izin restoran")
+
+    def test_document_vector_uses_collection_avgdl(self, stats_vectorizer):
+        assert stats_vectorizer._avg_doc_length_for("legal") == pytest.approx(8 / 3)
+        assert stats_vectorizer._avg_doc_length_for(None) == 500
+        assert stats_vectorizer.generate_sparse_vector(
+            "izin usaha restoran", collection="legal"
+        ) != stats_vectorizer.generate_sparse_vector("izin usaha restoran")
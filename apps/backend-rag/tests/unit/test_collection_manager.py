@@ -152,6 +152,15 @@ class TestCollectionManagerInfo:
         assert info is not None
         assert info["actual_name"] == "kbli_unified"  # Alias resolved
 
+    def test_get_collection_info_profile(self):
+        """Test profile comes from QDRANT_COLLECTION_PROFILES via the resolved alias"""
+        with patch("services.collection_manager.settings") as mock_settings:
+            mock_settings.qdrant_collection_profiles = {"legal_unified": "scalar_int8"}
+            manager = CollectionManager(qdrant_url="http://localhost:6333")
+
+            assert manager.get_collection_info("legal_architect")["profile"] == "scalar_int8"
+            assert manager.get_collection_info("visa_oracle")["profile"] == "float32"
+
     def test_get_collection_info_nonexistent(self):
         """Test getting info for nonexistent collection"""
         manager = CollectionManager()
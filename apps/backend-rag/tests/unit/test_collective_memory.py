@@ -260,6 +260,41 @@ class TestCollectiveMemoryService:
         assert result["status"] == "removed"
         assert result["reason"] == "low_confidence"
 
+    @pytest.mark.asyncio
+    async def test_search_similar(self, service, mock_pool):
+        """Test full-text search over promoted facts"""
+        from datetime import datetime
+
+        now = datetime.now()
+        mock_conn = AsyncMock()
+        mock_conn.fetch = AsyncMock(
+            return_value=[
+                {
+                    "id": 1,
+                    "content": "KITAS renewal takes 2 weeks",
+                    "category": "process",
+                    "confidence": 0.9,
+                    "source_count": 4,
+                    "is_promoted": True,
+                    "first_learned_at": now,
+                    "last_confirmed_at": now,
+                    "metadata": None,
+                }
+            ]
+        )
+
+        mock_pool.acquire.return_value.__aenter__ = AsyncMock(return_value=mock_conn)
+        mock_pool.acquire.return_value.__aexit__ = AsyncMock(return_value=None)
+
+        result = await service.search_similar("kitas_renewal", limit=3)
+
+        assert [memory.id for memory in result] == [1]
+        assert result[0].metadata == {}
+        query, *params = mock_conn.fetch.call_args.args
+        assert "search_vector @@" in query
+        assert "is_promoted = TRUE" in query
+        assert params == ["kitas_renewal", "%kitas\\_renewal%", 3]
+
     @pytest.mark.asyncio
     async def test_get_stats_no_pool(self, service_no_pool):
         """Test get_stats without database"""
@@ -17,6 +17,7 @@ from backend.core.cache import (
     CacheService,
     LRUCache,
     cached,
+    estimate_size,
     get_cache_service,
     invalidate_cache,
 )
@@ -212,6 +213,113 @@ class TestLRUCache:
         assert cache.get("key1") == "value1"
         assert cache.get("key2") == "value2"
 
+    def test_byte_bound_evicts_least_recently_used(self):
+        """Test eviction when approximate byte size exceeds max_bytes"""
+        cache = LRUCache(max_size=100, max_bytes=3000, sizeof=len)
+        cache.set("a", "x" * 1000)
+        cache.set("b", "x" * 1000)
+        cache.get("a")  # b becomes least recently used
+
+        cache.set("c", "x" * 1500)
+
+        assert "b" not in cache
+        assert "a" in cache and "c" in cache
+        assert cache.total_bytes == 2500
+        assert cache.stats["evictions"] == 1
+
+    def test_on_evict_called_for_evicted_entry(self):
+        """Test on_evict receives entries dropped to make room, not deletes"""
+        evicted = []
+        cache = LRUCache(max_size=2, on_evict=lambda key, value: evicted.append((key, value)))
+        cache.set("key1", "value1")
+        cache.set("key2", "value2")
+        cache.delete("key2")
+        cache.set("key2", "value2")
+
+        cache.set("key3", "value3")
+
+        assert evicted == [("key1", "value1")]
+
+    def test_value_larger_than_max_bytes_not_stored(self):
+        """Test oversized values are rejected without flushing the cache"""
+        cache = LRUCache(max_bytes=100, sizeof=len)
+        cache.set("small", "x" * 10)
+
+        cache.set("huge", "x" * 1000)
+
+        assert cache.get("huge") is None
+        assert cache.get("small") == "x" * 10
+        assert cache.total_bytes == 10
+
+    def test_byte_accounting_on_replace_and_delete(self):
+        """Test accounted bytes follow updates, deletes and clear"""
+        cache = LRUCache(sizeof=len)
+        cache.set("key1", "x" * 100)
+        cache.set("key1", "x" * 40)
+        cache.set("key2", "x" * 60)
+        assert cache.total_bytes == 100
+
+        cache.delete("key1")
+        assert cache.total_bytes == 60
+
+        cache.clear()
+        assert cache.total_bytes == 0
+
+    def test_hit_miss_stats(self):
+        """Test get() records hits and misses"""
+        cache = LRUCache()
+        cache.set("key1", "value1")
+        cache.get("key1")
+        cache.get("missing")
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+
+    def test_invalidate_by_predicate(self):
+        """Test invalidate() drops matching tuple keys"""
+        cache = LRUCache()
+        cache.set(("user-1", "en"), "prompt1")
+        cache.set(("user-1", "id"), "prompt2")
+        cache.set(("user-2", "en"), "prompt3")
+
+        count = cache.invalidate(lambda key: key[0] == "user-1")
+
+        assert count == 2
+        assert len(cache) == 1
+        assert cache.get(("user-2", "en")) == "prompt3"
+
+    def test_no_ttl_and_default_sentinel(self):
+        """Test entries without TTL and get() with a default for stored None"""
+        cache = LRUCache(default_ttl=None)
+        cache.set("key1", None)
+        missing = object()
+
+        assert cache.get("key1", missing) is None
+        assert cache.get("key2", missing) is missing
+
+    def test_dict_style_access(self):
+        """Test mapping protocol used by callers migrated from plain dicts"""
+        cache = LRUCache()
+        cache["key1"] = "value1"
+
+        assert "key1" in cache
+        assert cache["key1"] == "value1"
+        assert cache.items() == [("key1", "value1")]
+        del cache["key1"]
+        with pytest.raises(KeyError):
+            cache["key1"]
+
+    def test_estimate_size_counts_nested_values(self):
+        """Test estimate_size grows with nested content"""
+        small = estimate_size({"facts": ["a"]})
+        large = estimate_size({"facts": ["a" * 10_000]})
+        vector = estimate_size([0.1] * 1024)
+
+        assert large - small >= 9_000
+        assert vector >= 1024 * 8
+
     def test_set_various_types(self):
         """Test caching various data types"""
         cache = LRUCache()
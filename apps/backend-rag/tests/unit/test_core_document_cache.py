@@ -0,0 +1,253 @@
+"""
+Unit tests for Core Document Cache Module - local cache of Drive PDFs and extracted text
+"""
+
+import asyncio
+import hashlib
+import re
+import threading
+
+import fitz  # PyMuPDF
+import httplib2
+import pytest
+from core.document_cache import DocumentCache, normalize_document_name
+
+
+def make_pdf(text: str | None) -> bytes:
+    """One-page PDF with text (or a blank page without a text layer)"""
+    doc = fitz.open()
+    page = doc.new_page()
+    if text:
+        page.insert_text((72, 72), text)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+class FakeDrive:
+    """In-memory stand-in for the Drive v3 service used by DocumentCache"""
+
+    def __init__(self):
+        self.files_by_id: dict[str, dict] = {}
+        self.list_calls: list[str] = []
+        self.downloads: list[str] = []
+        self.gate = threading.Event()  # Downloads block until set
+        self.gate.set()
+
+    def put(self, file_id: str, name: str, content: bytes) -> None:
+        self.files_by_id[file_id] = {
+            "id": file_id,
+            "name": name,
+            "content": content,
+            "md5Checksum": hashlib.md5(content).hexdigest(),
+        }
+
+    def __call__(self):
+        return self
+
+    def files(self):
+        return self
+
+    def list(self, q, fields, pageSize):
+        name = re.match(r"name contains '(.*?)' and", q).group(1).replace("\\'", "'")
+        self.list_calls.append(name)
+        matches = [
+            {k: v for k, v in f.items() if k != "content"}
+            for f in self.files_by_id.values()
+            if name.casefold() in f["name"].casefold()
+        ]
+        return _Executable({"files": matches[:pageSize]})
+
+    def get_media(self, fileId):
+        return _MediaRequest(self, fileId)
+
+
+class _Executable:
+    def __init__(self, result):
+        self.result = result
+
+    def execute(self):
+        return self.result
+
+
+class _MediaRequest:
+    """Request object shaped the way MediaIoBaseDownload consumes it"""
+
+    def __init__(self, drive: FakeDrive, file_id: str):
+        self.drive = drive
+        self.file_id = file_id
+        self.uri = f"https://drive.test/{file_id}?alt=media"
+        self.headers = {}
+        self.http = self
+
+    def request(self, uri, method, headers=None):
+        self.drive.gate.wait(5)
+        self.drive.downloads.append(self.file_id)
+        content = self.drive.files_by_id[self.file_id]["content"]
+        return httplib2.Response({"status": 200, "content-length": str(len(content))}), content
+
+
+@pytest.fixture
+def drive():
+    fake = FakeDrive()
+    fake.put("id-1", "PP_28_2025.pdf", make_pdf("Peraturan Pemerintah 28 tahun 2025"))
+    return fake
+
+
+@pytest.fixture
+def cache(tmp_path, drive):
+    return DocumentCache(cache_dir=str(tmp_path), drive_service=drive)
+
+
+class TestNormalizeDocumentName:
+    """Test suite for normalize_document_name"""
+
+    def test_strips_path_extension_and_case(self):
+        assert normalize_document_name(" folder/PP_28_2025.PDF ") == "pp_28_2025"
+        assert normalize_document_name("PP_28_2025") == "pp_28_2025"
+
+    def test_empty(self):
+        assert normalize_document_name("  ") == ""
+
+
+class TestDocumentCache:
+    """Test suite for DocumentCache"""
+
+    @pytest.mark.asyncio
+    async def test_cold_then_warm(self, cache, drive):
+        """First get downloads and extracts; the next one makes no Drive calls"""
+        document = await cache.get("folder/PP_28_2025.pdf")
+
+        assert document.file_id == "id-1"
+        assert "Peraturan Pemerintah" in document.text
+        assert open(document.pdf_path, "rb").read() == drive.files_by_id["id-1"]["content"]
+        assert drive.downloads == ["id-1"]
+
+        list_calls = len(drive.list_calls)
+        again = await cache.get("PP_28_2025.pdf")
+
+        assert again.pdf_path == document.pdf_path
+        assert again.text == document.text
+        assert len(drive.list_calls) == list_calls
+        assert drive.downloads == ["id-1"]
+
+    @pytest.mark.asyncio
+    async def test_survives_restart(self, tmp_path, cache, drive):
+        await cache.get("PP_28_2025.pdf")
+
+        restarted = DocumentCache(cache_dir=str(tmp_path), drive_service=drive)
+        document = await restarted.get("PP_28_2025.pdf")
+
+        assert document.text
+        assert drive.downloads == ["id-1"]
+
+    @pytest.mark.asyncio
+    async def test_resolves_separator_variants(self, cache, drive):
+        drive.put("id-2", "Visa Guide 2025.pdf", make_pdf("Visa guide"))
+
+        document = await cache.get("visa_guide_2025.pdf")
+
+        assert document.file_id == "id-2"
+        assert drive.list_calls == ["visa_guide_2025", "visa guide 2025"]
+
+    @pytest.mark.asyncio
+    async def test_not_found(self, cache, drive):
+        assert await cache.get("missing.pdf") is None
+        assert drive.downloads == []
+
+    @pytest.mark.asyncio
+    async def test_no_drive_service(self, tmp_path):
+        cache = DocumentCache(cache_dir=str(tmp_path), drive_service=lambda: None)
+
+        assert await cache.get("PP_28_2025.pdf") is None
+
+    @pytest.mark.asyncio
+    async def test_expired_name_only_redownloads_changed_content(self, tmp_path, drive):
+        cache = DocumentCache(cache_dir=str(tmp_path), name_ttl=0, drive_service=drive)
+
+        first = await cache.get("PP_28_2025.pdf")
+        second = await cache.get("PP_28_2025.pdf")
+
+        assert second.sha256 == first.sha256
+        assert drive.downloads == ["id-1"]  # Re-resolved, md5 unchanged
+
+        drive.put("id-1", "PP_28_2025.pdf", make_pdf("Amended regulation"))
+        third = await cache.get("PP_28_2025.pdf")
+
+        assert third.sha256 != first.sha256
+        assert "Amended" in third.text
+        assert drive.downloads == ["id-1", "id-1"]
+
+    @pytest.mark.asyncio
+    async def test_same_content_stored_once(self, cache, drive):
+        drive.put("id-2", "PP_28_2025_copy.pdf", drive.files_by_id["id-1"]["content"])
+
+        original = await cache.get("PP_28_2025.pdf")
+        copy = await cache.get("PP_28_2025_copy.pdf")
+
+        assert copy.file_id == "id-2"
+        assert copy.pdf_path == original.pdf_path
+        assert cache.stats()["documents"] == 1
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self, tmp_path, drive):
+        for i in range(3):
+            drive.put(f"doc-{i}", f"doc_{i}.pdf", make_pdf(f"Document number {i}"))
+        size = len(drive.files_by_id["doc-0"]["content"]) + 100
+        cache = DocumentCache(cache_dir=str(tmp_path), max_bytes=2 * size, drive_service=drive)
+
+        await cache.get("doc_0.pdf")
+        await cache.get("doc_1.pdf")
+        await cache.get("doc_0.pdf")  # doc_1 is now least recently used
+        await cache.get("doc_2.pdf")
+
+        assert cache.stats()["documents"] == 2
+        assert cache.stats()["bytes"] <= cache.max_bytes
+        await cache.get("doc_0.pdf")
+        assert drive.downloads.count("doc-0") == 1
+        await cache.get("doc_1.pdf")
+        assert drive.downloads.count("doc-1") == 2
+
+    @pytest.mark.asyncio
+    async def test_pdf_without_text_layer(self, cache, drive):
+        drive.put("id-2", "scan.pdf", make_pdf(None))
+
+        document = await cache.get("scan.pdf")
+        again = await cache.get("scan.pdf")
+
+        assert document.pdf_path
+        assert document.text is None
+        assert again.text is None
+
+    @pytest.mark.asyncio
+    async def test_timeout_keeps_fetching_in_background(self, tmp_path, drive):
+        cache = DocumentCache(cache_dir=str(tmp_path), request_timeout=0.05, drive_service=drive)
+        drive.gate.clear()
+
+        assert await cache.get("PP_28_2025.pdf") is None
+
+        drive.gate.set()
+        cache.request_timeout = 5
+        document = await cache.get("PP_28_2025.pdf")
+
+        assert document.text
+        assert drive.downloads == ["id-1"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_fetch(self, cache, drive):
+        drive.gate.clear()
+        tasks = [asyncio.create_task(cache.get("PP_28_2025.pdf")) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        drive.gate.set()
+
+        documents = await asyncio.gather(*tasks)
+
+        assert all(document.text for document in documents)
+        assert drive.downloads == ["id-1"]
+
+    def test_get_pdf_path_sync(self, cache, drive):
+        path = cache.get_pdf_path("PP_28_2025.pdf")
+
+        assert open(path, "rb").read() == drive.files_by_id["id-1"]["content"]
+        assert cache.get_pdf_path("PP_28_2025.pdf") == path
+        assert drive.downloads == ["id-1"]
@@ -3,14 +3,19 @@ Unit tests for Core Embeddings Module - Multi-provider embedding generation
 Comprehensive coverage for OpenAI and Sentence Transformers
 """
 
+import asyncio
 from unittest.mock import Mock, patch
 
 import pytest
 
 from backend.core.embeddings import (
+    AsyncEmbeddingService,
+    EmbeddingCache,
     EmbeddingsGenerator,
     create_embeddings_generator,
     generate_embeddings,
+    pack_vector,
+    unpack_vector,
 )
 
 
@@ -431,3 +436,184 @@ class TestProviderFallback:
         # Verify encode called with show_progress_bar=True for >10 texts
         call_kwargs = mock_model.encode.call_args[1]
         assert call_kwargs["show_progress_bar"] is True
+
+
+class TestAsyncEmbeddingService:
+    """Test suite for the async, coalescing embedding front-end"""
+
+    @staticmethod
+    def _make_embedder():
+        embedder = Mock()
+        embedder.provider = "openai"
+        embedder.dimensions = 3
+        embedder.generate_query_embedding.side_effect = lambda text: [float(len(text)), 0.0, 1.0]
+        embedder.generate_embeddings.side_effect = lambda texts: [
+            [float(len(t)), 0.0, 1.0] for t in texts
+        ]
+        return embedder
+
+    @pytest.mark.asyncio
+    async def test_single_query_uses_query_path(self):
+        """A lone query is embedded via generate_query_embedding"""
+        embedder = self._make_embedder()
+        service = AsyncEmbeddingService(embedder, batch_window_ms=1, max_batch_size=8)
+
+        result = await service.embed_query("hello")
+
+        assert result == [5.0, 0.0, 1.0]
+        embedder.generate_query_embedding.assert_called_once_with("hello")
+        embedder.generate_embeddings.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_queries_coalesced_and_deduplicated(self):
+        """Concurrent queries share one provider call and duplicates are embedded once"""
+        embedder = self._make_embedder()
+        service = AsyncEmbeddingService(embedder, batch_window_ms=20, max_batch_size=64)
+
+        results = await asyncio.gather(
+            service.embed_query("a"),
+            service.embed_query("bb"),
+            service.embed_query("a"),
+            service.embed_query("ccc"),
+        )
+
+        assert [r[0] for r in results] == [1.0, 2.0, 1.0, 3.0]
+        embedder.generate_embeddings.assert_called_once_with(["a", "bb", "ccc"])
+        stats = service.get_stats()
+        assert stats["batches"] == 1
+        assert stats["deduplicated"] == 1
+        assert stats["requests"] == 4
+
+    @pytest.mark.asyncio
+    async def test_max_batch_size_flushes_early(self):
+        """Reaching max_batch_size dispatches without waiting for the window"""
+        embedder = self._make_embedder()
+        service = AsyncEmbeddingService(embedder, batch_window_ms=10_000, max_batch_size=2)
+
+        results = await asyncio.wait_for(service.embed_texts(["x", "yy"]), timeout=2)
+
+        assert results == [[1.0, 0.0, 1.0], [2.0, 0.0, 1.0]]
+        assert service.get_stats()["batches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_provider_error_propagates_to_all_waiters(self):
+        """A provider failure is raised to every caller in the batch"""
+        embedder = self._make_embedder()
+        embedder.generate_embeddings.side_effect = RuntimeError("API down")
+        service = AsyncEmbeddingService(embedder, batch_window_ms=20, max_batch_size=64)
+
+        results = await asyncio.gather(
+            service.embed_query("one"), service.embed_query("two"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_embed_texts_empty(self):
+        """Empty input returns empty list without calling the provider"""
+        embedder = self._make_embedder()
+        service = AsyncEmbeddingService(embedder)
+
+        assert await service.embed_texts([]) == []
+        embedder.generate_embeddings.assert_not_called()
+
+
+class TestEmbeddingCache:
+    """Test suite for the two-tier content-addressed embedding cache"""
+
+    def test_pack_unpack_roundtrip_float32(self):
+        """Vectors are stored as 4 bytes per dimension"""
+        packed = pack_vector([0.5, -1.25, 3.0])
+
+        assert len(packed) == 12
+        assert unpack_vector(packed) == [0.5, -1.25, 3.0]
+
+    def test_key_depends_on_model_and_normalized_text(self):
+        """Keys normalize whitespace but separate providers/models/dimensions"""
+        cache = EmbeddingCache()
+
+        key = cache.make_key("openai", "text-embedding-3-small", 1536, "  visa   KITAS ")
+        assert key == cache.make_key("openai", "text-embedding-3-small", 1536, "visa KITAS")
+        assert key != cache.make_key("openai", "text-embedding-3-large", 1536, "visa KITAS")
+        assert key != cache.make_key("openai", "text-embedding-3-small", 384, "visa KITAS")
+        assert key.startswith("zantara:emb:openai:")
+
+    def test_memory_tier_hit_and_stats(self):
+        """Second lookup is served from the in-process tier"""
+        cache = EmbeddingCache(max_size=10)
+        cache.set_many({"k1": [1.0, 2.0]})
+
+        assert cache.get_many(["k1", "k2"]) == {"k1": [1.0, 2.0]}
+        stats = cache.get_stats()
+        assert stats["memory_hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == "50.0%"
+
+    def test_redis_tier_uses_packed_bytes(self):
+        """L2 writes are pipelined float32 bytes and L2 reads use a single MGET"""
+        redis_client = Mock()
+        pipe = redis_client.pipeline.return_value
+        cache = EmbeddingCache(max_size=10, ttl=60, redis_client=redis_client)
+
+        cache.set_many({"k1": [1.0, 2.0]})
+        pipe.setex.assert_called_once_with("k1", 60, pack_vector([1.0, 2.0]))
+        pipe.execute.assert_called_once()
+
+        fresh = EmbeddingCache(max_size=10, ttl=60, redis_client=redis_client)
+        redis_client.mget.return_value = [pack_vector([3.0, 4.0]), None]
+        assert fresh.get_many(["k1", "k2"]) == {"k1": [3.0, 4.0]}
+        redis_client.mget.assert_called_once_with(["k1", "k2"])
+        assert fresh.stats["l2_hits"] == 1
+
+    def test_redis_errors_degrade_to_miss(self):
+        """Redis failures never propagate to callers"""
+        redis_client = Mock()
+        redis_client.mget.side_effect = ConnectionError("down")
+        cache = EmbeddingCache(redis_client=redis_client)
+
+        assert cache.get_many(["k1"]) == {}
+        assert cache.stats["errors"] == 1
+
+    def test_redis_checked_on_first_use_not_construction(self, tmp_path):
+        """Unreachable Redis is detected on first L2 access and replaced by the disk tier"""
+        redis_client = Mock()
+        redis_client.ping.side_effect = ConnectionError("down")
+        cache = EmbeddingCache(redis_client=redis_client, disk_path=str(tmp_path))
+
+        redis_client.ping.assert_not_called()
+        assert cache.backend == "memory+redis"
+
+        cache.set_many({"k1": [0.25, 0.5]})
+
+        redis_client.ping.assert_called_once()
+        redis_client.pipeline.assert_not_called()
+        assert cache.backend == "memory+disk"
+        assert EmbeddingCache(disk_path=str(tmp_path)).get_many(["k1"]) == {"k1": [0.25, 0.5]}
+
+    def test_disk_tier_persists_across_instances(self, tmp_path):
+        """On-disk tier survives a new process-level cache"""
+        EmbeddingCache(disk_path=str(tmp_path)).set_many({"k1": [0.25, 0.5]})
+
+        cache = EmbeddingCache(disk_path=str(tmp_path))
+        assert cache.get_many(["k1"]) == {"k1": [0.25, 0.5]}
+        assert cache.stats["l2_hits"] == 1
+
+    @patch("openai.OpenAI")
+    def test_generator_only_embeds_misses(self, mock_openai):
+        """Cached generator calls the provider once per distinct unseen text"""
+        mock_client = Mock()
+        mock_client.embeddings.create.side_effect = lambda model, input: Mock(
+            data=[Mock(embedding=[float(len(t)), 1.0]) for t in input]
+        )
+        mock_openai.return_value = mock_client
+        generator = EmbeddingsGenerator(
+            api_key="test-key", provider="openai", settings=None, cache=EmbeddingCache()
+        )
+
+        first = generator.generate_embeddings(["aa", "bbb", "aa"])
+        second = generator.generate_embeddings(["bbb", "c"])
+
+        assert first == [[2.0, 1.0], [3.0, 1.0], [2.0, 1.0]]
+        assert second == [[3.0, 1.0], [1.0, 1.0]]
+        inputs = [call.kwargs["input"] for call in mock_client.embeddings.create.call_args_list]
+        assert inputs == [["aa", "bbb"], ["c"]]
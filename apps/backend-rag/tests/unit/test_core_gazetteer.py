@@ -0,0 +1,104 @@
+"""
+Unit tests for Core Gazetteer Module - token-level Aho-Corasick phrase matching
+"""
+
+import random
+
+from core.gazetteer import Gazetteer, normalize_tokens
+
+
+class TestNormalizeTokens:
+    """Test suite for normalize_tokens"""
+
+    def test_case_accents_and_separators(self):
+        """Tokens are case-folded, accent-stripped and split on underscores/punctuation"""
+        assert normalize_tokens("Software_Development") == ("software", "development")
+        assert normalize_tokens("Café, PT-PMA!") == ("cafe", "pt", "pma")
+        assert normalize_tokens("KBLI 62010") == ("kbli", "62010")
+
+    def test_empty(self):
+        assert normalize_tokens("") == ()
+        assert normalize_tokens("?!") == ()
+
+
+class TestGazetteer:
+    """Test suite for Gazetteer"""
+
+    def test_finds_all_mentioned_phrases(self):
+        gazetteer = Gazetteer()
+        gazetteer.add("pt_pma", ["PT PMA"])
+        gazetteer.add("pma", ["PMA"])
+        gazetteer.add("kitas", ["Investor KITAS", "investor_kitas"])
+        gazetteer.compile()
+
+        found = gazetteer.find("How do I open a pt pma and get an investor kitas?")
+
+        assert set(found) == {"pt_pma", "pma", "kitas"}
+        assert gazetteer.pending == 0
+
+    def test_matches_whole_tokens_only(self):
+        gazetteer = Gazetteer()
+        gazetteer.add("pt", ["PT"])
+        gazetteer.compile()
+
+        assert gazetteer.find("optimal setup") == []
+        assert gazetteer.find("PT setup") == ["pt"]
+
+    def test_pending_phrases_match_before_compile(self):
+        """Phrases added after compile() match immediately"""
+        gazetteer = Gazetteer()
+        gazetteer.add("a", ["golden visa"])
+        gazetteer.compile()
+        gazetteer.add("b", ["second home visa"])
+
+        assert gazetteer.pending == 1
+        assert set(gazetteer.find("golden visa or second home visa")) == {"a", "b"}
+
+        gazetteer.compile()
+        assert gazetteer.pending == 0
+        assert set(gazetteer.find("golden visa or second home visa")) == {"a", "b"}
+
+    def test_shared_phrase_returns_every_key(self):
+        gazetteer = Gazetteer()
+        gazetteer.add(1, ["KITAS"])
+        gazetteer.add(2, ["kitas"])
+
+        assert sorted(gazetteer.find("kitas renewal")) == [1, 2]
+        assert len(gazetteer) == 1
+
+    def test_short_and_empty_phrases_ignored(self):
+        gazetteer = Gazetteer()
+        gazetteer.add("x", ["a", "", None, "--"])
+
+        assert len(gazetteer) == 0
+        assert gazetteer.find("a b c") == []
+
+    def test_clear(self):
+        gazetteer = Gazetteer()
+        gazetteer.add("a", ["tax id"])
+        gazetteer.compile()
+        gazetteer.clear()
+
+        assert gazetteer.find("tax id") == []
+
+    def test_matches_brute_force(self):
+        """Overlapping and nested phrases match exactly as a naive scan would"""
+        rng = random.Random(7)
+        vocab = [f"w{i}" for i in range(12)]
+        for _ in range(50):
+            gazetteer = Gazetteer()
+            phrases = {}
+            for key in range(30):
+                phrase = tuple(rng.choice(vocab) for _ in range(rng.randint(1, 4)))
+                phrases[key] = phrase
+                gazetteer.add(key, [" ".join(phrase)])
+                if key == 15:
+                    gazetteer.compile()
+            text = [rng.choice(vocab) for _ in range(40)]
+
+            expected = {
+                key
+                for key, phrase in phrases.items()
+                if any(tuple(text[i : i + len(phrase)]) == phrase for i in range(len(text)))
+            }
+            assert set(gazetteer.find(" ".join(text))) == expected
@@ -0,0 +1,42 @@
+"""
+Unit tests for Core Text Search Module - SQL fragments for indexed search
+"""
+
+from pathlib import Path
+
+from core.text_search import TEXT_SEARCH_CONFIGS, like_pattern, tsquery_sql
+
+
+class TestLikePattern:
+    """Test suite for like_pattern"""
+
+    def test_wraps_term_in_wildcards(self):
+        assert like_pattern("wijaya") == "%wijaya%"
+
+    def test_escapes_like_wildcards(self):
+        """%, _ and backslash in the term are matched literally"""
+        assert like_pattern("50%") == "%50\\%%"
+        assert like_pattern("pt_pma") == "%pt\\_pma%"
+        assert like_pattern("a\\b") == "%a\\\\b%"
+
+
+class TestTsquerySql:
+    """Test suite for tsquery_sql"""
+
+    def test_combines_every_configuration(self):
+        sql = tsquery_sql("$1")
+
+        for config in TEXT_SEARCH_CONFIGS:
+            assert f"websearch_to_tsquery('{config}', $1)" in sql
+        assert sql.count(" || ") == len(TEXT_SEARCH_CONFIGS) - 1
+        assert sql.startswith("(") and sql.endswith(")")
+
+    def test_configurations_match_migration(self):
+        """The generated search_vector columns use the same configurations"""
+        migration = (
+            Path(__file__).resolve().parents[2]
+            / "backend/db/migrations/029_text_search_indexes.sql"
+        ).read_text()
+
+        for config in TEXT_SEARCH_CONFIGS:
+            assert f"to_tsvector('{config}'::regconfig, content)" in migration
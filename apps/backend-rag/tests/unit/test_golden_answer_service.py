@@ -198,86 +198,204 @@ class TestGoldenAnswerService:
 
         assert result is None
 
-    @pytest.mark.asyncio
-    async def test_semantic_lookup_no_golden_answers(self, service):
-        """Test semantic lookup with no golden answers"""
+    @staticmethod
+    def _index_conn(service, rows, answer_row=None, total=None):
+        """Wire service.pool to a connection serving index rows and the answer row"""
+        from datetime import datetime
+
+        status = {"total": len(rows) if total is None else total, "now": datetime(2026, 1, 1)}
         service.pool = MagicMock()
         mock_conn = AsyncMock()
-        mock_conn.fetch = AsyncMock(return_value=[])
+        mock_conn.fetch = AsyncMock(return_value=rows)
+        mock_conn.fetchrow = AsyncMock(
+            side_effect=lambda query, *args: status if "COUNT(*)" in query else answer_row
+        )
         service.pool.acquire.return_value.__aenter__ = AsyncMock(return_value=mock_conn)
         service.pool.acquire.return_value.__aexit__ = AsyncMock()
+        return mock_conn
+
+    @staticmethod
+    def _index_row(cluster_id, embedding, model="all-MiniLM-L6-v2"):
+        return {
+            "cluster_id": cluster_id,
+            "canonical_question": f"Question for {cluster_id}",
+            "question_embedding": embedding,
+            "embedding_model": model,
+        }
+
+    @pytest.mark.asyncio
+    async def test_semantic_lookup_no_golden_answers(self, service):
+        """Test semantic lookup with no golden answers"""
+        self._index_conn(service, [])
+        service.model = MagicMock()
 
         result = await service._semantic_lookup("test query")
 
         assert result is None
+        service.model.encode.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_semantic_lookup_success(self, service):
-        """Test successful semantic lookup"""
+        """Test successful semantic lookup against stored embeddings"""
         import numpy as np
 
-        service.pool = MagicMock()
-        mock_conn = AsyncMock()
-        mock_conn.fetch = AsyncMock(
-            return_value=[
-                {
-                    "cluster_id": "cluster_1",
-                    "canonical_question": "What is PT PMA?",
-                    "answer": "A foreign company.",
-                    "sources": [],
-                    "confidence": 0.9,
-                    "usage_count": 5,
-                }
-            ]
+        mock_conn = self._index_conn(
+            service,
+            [
+                self._index_row("cluster_0", [0.0, 1.0, 0.0]),
+                self._index_row("cluster_1", [2.0, 0.0, 0.0]),
+            ],
+            answer_row={
+                "cluster_id": "cluster_1",
+                "canonical_question": "What is PT PMA?",
+                "answer": "A foreign company.",
+                "sources": [],
+                "confidence": 0.9,
+            },
         )
-        service.pool.acquire.return_value.__aenter__ = AsyncMock(return_value=mock_conn)
-        service.pool.acquire.return_value.__aexit__ = AsyncMock()
 
-        # Mock embedding model
         mock_model = MagicMock()
-        mock_model.encode.return_value = np.array([[0.1, 0.2, 0.3]])
+        mock_model.encode.return_value = np.array([[0.9, 0.1, 0.0]])
         service.model = mock_model
 
-        with patch("services.golden_answer_service.cosine_similarity") as mock_cos:
-            mock_cos.return_value = np.array([[0.95]])
-
-            result = await service._semantic_lookup("What is a PT PMA company?")
+        result = await service._semantic_lookup("What is a PT PMA company?")
 
         assert result is not None
         assert result["cluster_id"] == "cluster_1"
+        assert result["similarity"] > 0.8
+        # Only the query is encoded; stored question embeddings are reused
+        mock_model.encode.assert_called_once_with(["What is a PT PMA company?"])
+        assert mock_conn.fetchrow.call_args[0][1] == "cluster_1"
 
     @pytest.mark.asyncio
     async def test_semantic_lookup_below_threshold(self, service):
         """Test semantic lookup below threshold"""
         import numpy as np
 
-        service.pool = MagicMock()
-        mock_conn = AsyncMock()
-        mock_conn.fetch = AsyncMock(
-            return_value=[
-                {
-                    "cluster_id": "cluster_1",
-                    "canonical_question": "What is PT PMA?",
-                    "answer": "A foreign company.",
-                    "sources": [],
-                    "confidence": 0.9,
-                    "usage_count": 5,
-                }
-            ]
-        )
-        service.pool.acquire.return_value.__aenter__ = AsyncMock(return_value=mock_conn)
-        service.pool.acquire.return_value.__aexit__ = AsyncMock()
+        mock_conn = self._index_conn(service, [self._index_row("cluster_1", [0.0, 1.0, 0.0])])
 
         mock_model = MagicMock()
-        mock_model.encode.return_value = np.array([[0.1, 0.2, 0.3]])
+        mock_model.encode.return_value = np.array([[1.0, 0.0, 0.0]])
         service.model = mock_model
 
-        with patch("services.golden_answer_service.cosine_similarity") as mock_cos:
-            mock_cos.return_value = np.array([[0.5]])  # Below threshold
-
-            result = await service._semantic_lookup("Random query")
+        result = await service._semantic_lookup("Random query")
 
         assert result is None
+        # Only the index status query; the answer row is never fetched
+        assert mock_conn.fetchrow.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_semantic_lookup_index_is_reused(self, service):
+        """Test repeated lookups do not reload the index"""
+        import numpy as np
+
+        mock_conn = self._index_conn(service, [self._index_row("cluster_1", [0.0, 1.0, 0.0])])
+        service.model = MagicMock()
+        service.model.encode.return_value = np.array([[1.0, 0.0, 0.0]])
+
+        await service._semantic_lookup("first")
+        await service._semantic_lookup("second")
+
+        assert mock_conn.fetch.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_refresh_index_incremental(self, service):
+        """Test refresh merges changed rows and reloads fully after deletes"""
+        from datetime import datetime
+
+        from services.golden_answer_service import INDEX_REFRESH_OVERLAP
+
+        self._index_conn(
+            service, [self._index_row("c1", [1.0, 0.0]), self._index_row("c2", [0.0, 1.0])]
+        )
+        await service._refresh_index(force=True)
+        assert service._index_ids == ["c1", "c2"]
+
+        # Only c2 changed
+        mock_conn = self._index_conn(service, [self._index_row("c2", [1.0, 1.0])], total=2)
+        await service._refresh_index(force=True)
+        assert mock_conn.fetch.call_count == 1
+        # Watermark is the DB clock of the previous refresh, minus the overlap
+        assert mock_conn.fetch.call_args[0][1] == datetime(2026, 1, 1) - INDEX_REFRESH_OVERLAP
+        assert service._index_matrix.shape == (2, 2)
+        assert service._index_matrix[1].tolist() == [1.0, 1.0]
+
+        # c1 deleted: count mismatch triggers a full reload
+        mock_conn = self._index_conn(service, [self._index_row("c2", [1.0, 1.0])], total=1)
+        await service._refresh_index(force=True)
+        assert mock_conn.fetch.call_count == 2
+        assert mock_conn.fetch.call_args[0][1] is None
+        assert service._index_ids == ["c2"]
+
+    @pytest.mark.asyncio
+    async def test_refresh_index_embeds_missing_in_background(self, service):
+        """Test rows without a stored embedding are encoded off the lookup and written back"""
+        import numpy as np
+
+        mock_conn = self._index_conn(
+            service,
+            [self._index_row("c1", [1.0, 0.0]), self._index_row("c2", None, model=None)],
+        )
+        service.model = MagicMock()
+        service.model.encode.return_value = np.array([[3.0, 4.0]])
+
+        await service._refresh_index(force=True)
+
+        # The refresh itself only loads stored embeddings
+        assert service._index_ids == ["c1"]
+        assert service._index_pending == {"c2": "Question for c2"}
+
+        await service._embed_task
+
+        service.model.encode.assert_called_once_with(["Question for c2"])
+        assert service._index_ids == ["c1", "c2"]
+        assert np.allclose(service._index_matrix[1], [0.6, 0.8])
+        assert service._index_pending == {}
+        sql, stored = mock_conn.executemany.call_args[0]
+        assert "embedding_updated_at = NOW()" in sql
+        assert stored[0][0] == "c2"
+        assert stored[0][2] == "all-MiniLM-L6-v2"
+
+    @pytest.mark.asyncio
+    async def test_refresh_index_changed_question_leaves_index(self, service):
+        """Test a row whose embedding was cleared is dropped until it is re-embedded"""
+        import numpy as np
+
+        self._index_conn(
+            service, [self._index_row("c1", [1.0, 0.0]), self._index_row("c2", [0.0, 1.0])]
+        )
+        await service._refresh_index(force=True)
+
+        service.model = MagicMock()
+        service.model.encode.side_effect = RuntimeError("model unavailable")
+        self._index_conn(service, [self._index_row("c2", None, model=None)], total=2)
+        await service._refresh_index(force=True)
+        await service._embed_task
+
+        assert service._index_ids == ["c1"]
+        assert service._index_pending == {"c2": "Question for c2"}
+
+        # Still pending: an incremental refresh must not mistake it for a delete
+        mock_conn = self._index_conn(service, [], total=2)
+        service.model.encode.side_effect = None
+        service.model.encode.return_value = np.array([[0.0, 2.0]])
+        await service._refresh_index(force=True)
+        await service._embed_task
+
+        assert mock_conn.fetch.call_count == 1
+        assert service._index_ids == ["c1", "c2"]
+
+    @pytest.mark.asyncio
+    async def test_backfill_embeddings_waits_for_encoding(self, service):
+        """Test backfill_embeddings embeds every missing row before returning"""
+        import numpy as np
+
+        self._index_conn(service, [self._index_row("c1", None, model=None)])
+        service.model = MagicMock()
+        service.model.encode.return_value = np.array([[1.0, 0.0]])
+
+        assert await service.backfill_embeddings() == 1
+        assert service._index_ids == ["c1"]
 
     @pytest.mark.asyncio
     async def test_semantic_lookup_exception(self, service):
@@ -419,71 +537,44 @@ class TestGoldenAnswerService:
         """Test semantic lookup loads model if not already loaded"""
         import numpy as np
 
-        service.pool = MagicMock()
         service.model = None  # Model not loaded
-        mock_conn = AsyncMock()
-        mock_conn.fetch = AsyncMock(
-            return_value=[
-                {
-                    "cluster_id": "cluster_1",
-                    "canonical_question": "What is PT PMA?",
-                    "answer": "A foreign company.",
-                    "sources": [],
-                    "confidence": 0.9,
-                    "usage_count": 5,
-                }
-            ]
+        self._index_conn(
+            service,
+            [self._index_row("cluster_1", [1.0, 0.0, 0.0])],
+            answer_row={
+                "cluster_id": "cluster_1",
+                "canonical_question": "What is PT PMA?",
+                "answer": "A foreign company.",
+                "sources": [],
+                "confidence": 0.9,
+            },
         )
-        service.pool.acquire.return_value.__aenter__ = AsyncMock(return_value=mock_conn)
-        service.pool.acquire.return_value.__aexit__ = AsyncMock()
 
         # Mock model loading
         mock_model = MagicMock()
-        mock_model.encode.return_value = np.array([[0.1, 0.2, 0.3]])
+        mock_model.encode.return_value = np.array([[0.1, 0.0, 0.0]])
 
         with patch.object(service, "_load_model") as mock_load:
             mock_load.side_effect = lambda: setattr(service, "model", mock_model)
 
-            with patch("services.golden_answer_service.cosine_similarity") as mock_cos:
-                mock_cos.return_value = np.array([[0.95]])
-
-                result = await service._semantic_lookup("What is PT PMA?")
+            result = await service._semantic_lookup("What is PT PMA?")
 
         assert result is not None
-        mock_load.assert_called_once()
+        mock_load.assert_called()
 
     @pytest.mark.asyncio
-    async def test_semantic_lookup_below_threshold_returns_none(self, service):
-        """Test semantic lookup returns None when similarity below threshold"""
+    async def test_semantic_lookup_stale_model_embeddings_recomputed(self, service):
+        """Test embeddings from another model are not used as-is"""
         import numpy as np
 
-        service.pool = MagicMock()
-        mock_conn = AsyncMock()
-        mock_conn.fetch = AsyncMock(
-            return_value=[
-                {
-                    "cluster_id": "cluster_1",
-                    "canonical_question": "What is PT PMA?",
-                    "answer": "A foreign company.",
-                    "sources": [],
-                    "confidence": 0.9,
-                    "usage_count": 5,
-                }
-            ]
-        )
-        service.pool.acquire.return_value.__aenter__ = AsyncMock(return_value=mock_conn)
-        service.pool.acquire.return_value.__aexit__ = AsyncMock()
-
-        mock_model = MagicMock()
-        mock_model.encode.return_value = np.array([[0.1, 0.2, 0.3]])
-        service.model = mock_model
-
-        with patch("services.golden_answer_service.cosine_similarity") as mock_cos:
-            mock_cos.return_value = np.array([[0.5]])  # Below 0.8 threshold
+        self._index_conn(service, [self._index_row("cluster_1", [0.0, 1.0], model="old-model")])
+        service.model = MagicMock()
+        service.model.encode.return_value = np.array([[1.0, 0.0]])
 
-            result = await service._semantic_lookup("Random query")
+        await service._refresh_index(force=True)
+        await service._embed_task
 
-        assert result is None
+        assert service._index_matrix[0].tolist() == [1.0, 0.0]
 
     @pytest.mark.asyncio
     async def test_get_golden_answer_stats_with_last_used_none(self, service):
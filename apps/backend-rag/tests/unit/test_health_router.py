@@ -136,6 +136,17 @@ class TestHealthCheck:
         data = response.json()
         assert data["status"] == "initializing"
 
+    def test_health_check_includes_startup_timeline(self, client, app):
+        """Test health check reports the service startup timeline"""
+        timeline = {"total_seconds": 1.5, "steps": [{"name": "search", "status": "ok"}]}
+        app.state.search_service = None
+        app.state.startup_graph = MagicMock()
+        app.state.startup_graph.timeline.return_value = timeline
+
+        response = client.get("/health")
+
+        assert response.json()["startup"] == timeline
+
     def test_health_check_healthy(self, client, app):
         """Test health check when service is healthy"""
         mock_search_service = MagicMock()
@@ -371,4 +382,3 @@ class TestQdrantMetrics:
 
 
 # TestDebugConfig removed - endpoint no longer exists
-
@@ -105,33 +105,87 @@ class TestKnowledgeGraphRepositoryMethods:
 
     @pytest.mark.asyncio
     async def test_get_entity_context_for_query(self, mock_pool):
-        """Test get_entity_context_for_query finds relevant entities"""
+        """Test get_entity_context_for_query finds entities mentioned in the query"""
         from agents.services.kg_repository import KnowledgeGraphRepository
 
         pool, conn = mock_pool
         conn.fetch = AsyncMock(
-            return_value=[
-                {
-                    "id": "kbli-62010",  # VARCHAR(64)
-                    "type": "kbli",
-                    "name": "Software Development",
-                    "canonical_name": "software_development",
-                    "metadata": {"code": "62010"},
-                    "mention_count": 10,
-                    "relationship_types": ["requires", "related_to"],
-                },
+            side_effect=[
+                [
+                    {
+                        "id": "kbli-62010",  # VARCHAR(64)
+                        "type": "kbli",
+                        "name": "Software Development",
+                        "canonical_name": "software_development",
+                        "metadata": {"code": "62010"},
+                        "mention_count": 10,
+                        "last_seen_at": datetime(2026, 1, 1),
+                    },
+                    {
+                        "id": "visa-kitas",
+                        "type": "visa",
+                        "name": "KITAS",
+                        "canonical_name": "kitas",
+                        "metadata": {},
+                        "mention_count": 3,
+                        "last_seen_at": datetime(2026, 1, 1),
+                    },
+                ],
+                [
+                    {
+                        "entity_id": "kbli-62010",
+                        "relationship_types": ["requires", "related_to"],
+                        "updated_at": datetime(2026, 1, 1),
+                    },
+                ],
             ]
         )
 
         repo = KnowledgeGraphRepository(db_pool=pool)
-        entities = await repo.get_entity_context_for_query(query="software kbli", limit=5)
+        entities = await repo.get_entity_context_for_query(
+            query="KBLI for software development?", limit=5
+        )
 
         assert len(entities) == 1
         assert entities[0]["type"] == "kbli"
         assert entities[0]["name"] == "Software Development"
-        assert entities[0]["relationships"] == ["requires", "related_to"]
+        assert entities[0]["relationships"] == ["related_to", "requires"]
         assert entities[0]["entity_id"] == "kbli-62010"  # VARCHAR(64)
 
+        # Later queries are served from memory
+        entities = await repo.get_entity_context_for_query(query="kitas and software_development")
+        assert [e["name"] for e in entities] == ["Software Development", "KITAS"]
+        assert conn.fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_entity_context_for_query_sees_upserts(self, mock_pool):
+        """Test entities upserted through any repository on the pool are matched"""
+        from agents.services.kg_repository import KnowledgeGraphRepository
+
+        pool, conn = mock_pool
+        conn.fetch = AsyncMock(return_value=[])
+        reader = KnowledgeGraphRepository(db_pool=pool)
+        assert await reader.get_entity_context_for_query(query="omnibus law") == []
+
+        writer = KnowledgeGraphRepository(db_pool=pool)
+        write_conn = AsyncMock()
+        write_conn.fetchrow = AsyncMock(
+            side_effect=[
+                {"id": 7, "mention_count": 1, "metadata": {}},
+                {"id": 8, "mention_count": 4, "metadata": {}},
+            ]
+        )
+        await writer.upsert_entity("law", "Omnibus Law", "omnibus_law", {}, write_conn)
+        await writer.upsert_entity("law", "Job Creation Law", "job_creation_law", {}, write_conn)
+        await writer.upsert_relationship(7, 8, "amends", 0.9, "", {}, write_conn)
+
+        entities = await reader.get_entity_context_for_query(
+            query="Omnibus law vs job creation law"
+        )
+
+        assert [e["entity_id"] for e in entities] == [8, 7]
+        assert entities[1]["relationships"] == ["amends"]
+
     @pytest.mark.asyncio
     async def test_get_entity_context_for_query_empty(self, mock_pool):
         """Test get_entity_context_for_query returns empty on error"""
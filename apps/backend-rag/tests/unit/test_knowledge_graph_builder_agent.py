@@ -258,8 +258,9 @@ class TestProcessConversation:
 
         await builder.process_conversation("conv123")
 
-        # Verify DB query was made
+        # Verify DB query was made, reading the transcript from conversation_messages
         mock_conn.fetchrow.assert_called_once()
+        assert "conversation_messages_json(id) AS messages" in mock_conn.fetchrow.call_args.args[0]
 
         # Verify entities were extracted
         builder.entity_extractor.extract_entities.assert_called_once()
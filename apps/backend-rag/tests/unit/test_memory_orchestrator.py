@@ -540,3 +540,110 @@ class TestMemoryOrchestratorEdgeCases:
         # All should succeed
         for result in results:
             assert isinstance(result, MemoryContext)
+
+
+class TestMemoryOrchestratorContextFanOut:
+    """Test concurrent, cached, deadline-bounded context assembly"""
+
+    @pytest.fixture
+    def orchestrator(self):
+        from services.memory.orchestrator import MemoryOrchestrator
+        from services.memory_service_postgres import UserMemory
+
+        orchestrator = MemoryOrchestrator()
+        orchestrator._memory_service = AsyncMock()
+        orchestrator._memory_service.pool = True
+        orchestrator._memory_service.get_memory = AsyncMock(
+            return_value=UserMemory(
+                user_id="user@test.com",
+                profile_facts=["Name: Roberto"],
+                summary="",
+                counters={"conversations": 1, "searches": 0, "tasks": 0},
+                updated_at=datetime.now(),
+            )
+        )
+        orchestrator._episodic_memory = AsyncMock()
+        orchestrator._episodic_memory.get_context_summary = AsyncMock(return_value="")
+        orchestrator._is_initialized = True
+        return orchestrator
+
+    @pytest.mark.asyncio
+    async def test_sources_fetched_concurrently(self, orchestrator):
+        """Latency is the slowest source, not the sum"""
+        import asyncio
+        import time
+
+        def slow(value):
+            async def fetch(**kwargs):
+                await asyncio.sleep(0.2)
+                return value
+
+            return AsyncMock(side_effect=fetch)
+
+        orchestrator._episodic_memory.get_context_summary = slow("### Recent Timeline")
+        orchestrator._collective_memory = AsyncMock()
+        orchestrator._collective_memory.get_relevant_context = slow(["Fact"])
+        orchestrator._kg_repository = AsyncMock()
+        orchestrator._kg_repository.get_entity_context_for_query = slow([{"type": "kbli"}])
+
+        start = time.perf_counter()
+        context = await orchestrator.get_user_context("user@test.com", query="kbli")
+
+        assert time.perf_counter() - start < 0.5
+        assert context.timeline_summary == "### Recent Timeline"
+        assert context.collective_facts == ["Fact"]
+        assert context.kg_entities == [{"type": "kbli"}]
+
+    @pytest.mark.asyncio
+    async def test_slow_source_returns_partial_context(self, orchestrator):
+        """A source missing its deadline is dropped; the rest is still returned"""
+        import asyncio
+
+        async def never(**kwargs):
+            await asyncio.sleep(10)
+
+        orchestrator._source_timeout = 0.05
+        orchestrator._episodic_memory.get_context_summary = AsyncMock(side_effect=never)
+
+        context = await orchestrator.get_user_context("user@test.com")
+
+        assert context.profile_facts == ["Name: Roberto"]
+        assert context.timeline_summary == ""
+        await orchestrator.close()
+
+    @pytest.mark.asyncio
+    async def test_sources_cached_until_facts_change(self, orchestrator):
+        """Repeated turns hit the cache; saving facts invalidates the user's entries"""
+        await orchestrator.get_user_context("user@test.com")
+        await orchestrator.get_user_context("user@test.com")
+        assert orchestrator._memory_service.get_memory.await_count == 1
+
+        orchestrator.invalidate_user_context("user@test.com")
+        await orchestrator.get_user_context("user@test.com")
+        assert orchestrator._memory_service.get_memory.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_fact_versions_bounded(self, orchestrator):
+        """Evicting a user's fact version also drops their cached context"""
+        from core.cache import LRUCache
+
+        orchestrator._fact_versions = LRUCache(
+            max_size=2,
+            default_ttl=None,
+            on_evict=lambda user_email, _version: orchestrator._drop_user_context(user_email),
+        )
+        orchestrator.invalidate_user_context("user@test.com")
+        await orchestrator.get_user_context("user@test.com")
+        assert ("memory", "user@test.com", 1) in orchestrator._context_cache
+
+        orchestrator.invalidate_user_context("other@test.com")
+        orchestrator.invalidate_user_context("third@test.com")
+
+        assert len(orchestrator._fact_versions) == 2
+        assert "user@test.com" not in orchestrator._fact_versions
+        assert ("memory", "user@test.com", 1) not in orchestrator._context_cache
+
+        # Missing version reads as fresh and refetches
+        await orchestrator.get_user_context("user@test.com")
+        assert ("memory", "user@test.com", 0) in orchestrator._context_cache
+        assert orchestrator._memory_service.get_memory.await_count == 2
@@ -15,6 +15,8 @@ backend_path = Path(__file__).parent.parent.parent / "backend"
 if str(backend_path) not in sys.path:
     sys.path.insert(0, str(backend_path))
 
+from core.cache import LRUCache
+
 from services.memory_service_postgres import MemoryServicePostgres, UserMemory
 
 # ============================================================================
@@ -82,7 +84,7 @@ def test_init_with_database_url():
 
         assert service.database_url == "postgresql://test"
         assert service.use_postgres is True
-        assert isinstance(service.memory_cache, dict)
+        assert isinstance(service.memory_cache, LRUCache)
 
 
 def test_init_without_database_url():
@@ -376,6 +378,22 @@ async def test_add_fact_success(memory_service):
     assert "New fact" in memory.profile_facts
 
 
+@pytest.mark.asyncio
+async def test_add_fact_runs_invalidation_hooks(memory_service):
+    """Test add_fact notifies registered invalidation hooks"""
+    service, conn = memory_service
+    conn.fetch.return_value = []
+    conn.fetchrow.return_value = None
+    invalidated = []
+    service.add_invalidation_hook(invalidated.append)
+    service.add_invalidation_hook(MagicMock(side_effect=RuntimeError("boom")))
+
+    assert await service.add_fact("user-123", "New fact") is True
+    assert await service.add_fact("user-123", "New fact") is False  # Duplicate
+
+    assert invalidated == ["user-123"]
+
+
 @pytest.mark.asyncio
 async def test_add_fact_duplicate(memory_service):
     """Test add_fact with duplicate fact"""
@@ -668,6 +686,12 @@ async def test_search_postgres_success(memory_service):
     assert "coffee" in results[0]["fact"].lower()
     assert results[0]["confidence"] == 1.0
 
+    # Index-backed full-text or substring match, ranked by ts_rank
+    query, *params = conn.fetch.call_args.args
+    assert "search_vector @@" in query
+    assert "ts_rank(search_vector" in query
+    assert params == ["coffee", "%coffee%", 5]
+
 
 @pytest.mark.asyncio
 async def test_search_empty_query(memory_service):
@@ -18,12 +18,32 @@ if str(backend_path) not in sys.path:
 from middleware.rate_limiter import RateLimiter, RateLimitMiddleware, get_rate_limit_stats
 
 
+class FakeRedisScript:
+    """Python emulation of SLIDING_WINDOW_LUA over an in-memory ZSET."""
+
+    def __init__(self):
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.calls = 0
+
+    async def __call__(self, keys, args):
+        self.calls += 1
+        now, window, limit, requested, prefix = args
+        zset = self.zsets.setdefault(keys[0], {})
+        for member, score in list(zset.items()):
+            if score <= now - window:
+                del zset[member]
+        granted = max(0, min(requested, limit - len(zset)))
+        for i in range(1, granted + 1):
+            zset[f"{prefix}:{i}"] = now
+        oldest = min(zset.values(), default=now)
+        return [granted, len(zset), oldest]
+
+
 @pytest.fixture
 def mock_redis_client():
-    """Mock Redis client"""
+    """Mock async Redis client whose registered script is FakeRedisScript"""
     redis_client = MagicMock()
-    redis_client.ping = MagicMock()
-    redis_client.pipeline = MagicMock(return_value=MagicMock())
+    redis_client.register_script = MagicMock(return_value=FakeRedisScript())
     return redis_client
 
 
@@ -33,6 +53,13 @@ def rate_limiter():
     return RateLimiter()
 
 
+def _redis_limiter(redis_client, **kwargs) -> RateLimiter:
+    with patch("app.core.config.settings") as mock_settings:
+        mock_settings.redis_url = "redis://localhost:6379"
+        with patch("redis.asyncio.from_url", return_value=redis_client):
+            return RateLimiter(**kwargs)
+
+
 # ============================================================================
 # Tests for RateLimiter
 # ============================================================================
@@ -50,19 +77,17 @@ def test_init_without_redis():
 
 def test_init_with_redis(mock_redis_client):
     """Test RateLimiter initialization with Redis"""
-    with patch("app.core.config.settings") as mock_settings:
-        mock_settings.redis_url = "redis://localhost:6379"
-        # redis is imported inside __init__, so we patch it at the import location
-        with patch("redis.from_url", return_value=mock_redis_client):
-            limiter = RateLimiter()
-            assert limiter.redis_available is True
+    limiter = _redis_limiter(mock_redis_client)
+    assert limiter.redis_available is True
+    mock_redis_client.register_script.assert_called_once()
 
 
-def test_is_allowed_memory_fallback(rate_limiter):
+@pytest.mark.asyncio
+async def test_is_allowed_memory_fallback(rate_limiter):
     """Test rate limit check with memory fallback"""
     rate_limiter.redis_available = False
 
-    allowed, info = rate_limiter.is_allowed("test-key", limit=5, window=60)
+    allowed, info = await rate_limiter.is_allowed("test-key", limit=5, window=60)
 
     assert allowed is True
     assert info["limit"] == 5
@@ -70,7 +95,8 @@ def test_is_allowed_memory_fallback(rate_limiter):
     assert "reset" in info
 
 
-def test_is_allowed_rate_limit_exceeded(rate_limiter):
+@pytest.mark.asyncio
+async def test_is_allowed_rate_limit_exceeded(rate_limiter):
     """Test rate limit exceeded"""
     rate_limiter.redis_available = False
     # Use a unique key to avoid conflicts with other tests
@@ -78,45 +104,107 @@ def test_is_allowed_rate_limit_exceeded(rate_limiter):
 
     # Make 5 requests (limit is 5)
     for i in range(5):
-        allowed, _ = rate_limiter.is_allowed(unique_key, limit=5, window=60)
+        allowed, _ = await rate_limiter.is_allowed(unique_key, limit=5, window=60)
         assert allowed is True
 
     # 6th request should be blocked
-    allowed, info = rate_limiter.is_allowed(unique_key, limit=5, window=60)
+    allowed, info = await rate_limiter.is_allowed(unique_key, limit=5, window=60)
     assert allowed is False
     assert info["remaining"] == 0
 
 
-def test_is_allowed_redis_backend(mock_redis_client):
+@pytest.mark.asyncio
+async def test_memory_window_slides(rate_limiter):
+    """Test in-memory window frees slots as old entries expire"""
+    rate_limiter.redis_available = False
+    unique_key = f"slide-key-{id(rate_limiter)}"
+
+    with patch("middleware.rate_limiter.time.time", return_value=1000.0):
+        for _ in range(3):
+            await rate_limiter.is_allowed(unique_key, limit=3, window=10)
+        allowed, info = await rate_limiter.is_allowed(unique_key, limit=3, window=10)
+        assert allowed is False
+        assert info["reset"] == 1010
+
+    with patch("middleware.rate_limiter.time.time", return_value=1010.5):
+        allowed, _ = await rate_limiter.is_allowed(unique_key, limit=3, window=10)
+        assert allowed is True
+
+
+@pytest.mark.asyncio
+async def test_is_allowed_redis_backend(mock_redis_client):
     """Test rate limit check with Redis backend"""
-    mock_pipeline = MagicMock()
-    mock_pipeline.zremrangebyscore = MagicMock(return_value=mock_pipeline)
-    mock_pipeline.zcard = MagicMock(return_value=mock_pipeline)
-    mock_pipeline.zadd = MagicMock(return_value=mock_pipeline)
-    mock_pipeline.expire = MagicMock(return_value=mock_pipeline)
-    mock_pipeline.execute = MagicMock(return_value=[None, 3, None, None])  # count = 3
+    limiter = _redis_limiter(mock_redis_client, local_batch_size=1)
 
-    mock_redis_client.pipeline = MagicMock(return_value=mock_pipeline)
+    allowed, info = await limiter.is_allowed("test-key", limit=5, window=60)
+
+    assert allowed is True
+    assert info["limit"] == 5
+    assert info["remaining"] == 4
+
+
+@pytest.mark.asyncio
+async def test_redis_burst_within_one_second_counts_every_request(mock_redis_client):
+    """Test same-second requests are distinct window entries"""
+    limiter = _redis_limiter(mock_redis_client, local_batch_size=1)
+    script = mock_redis_client.register_script.return_value
+
+    with patch("middleware.rate_limiter.time.time", return_value=1000.0):
+        results = [(await limiter.is_allowed("burst", limit=5, window=60))[0] for _ in range(7)]
+
+    assert results == [True] * 5 + [False] * 2
+    assert len(script.zsets["burst"]) == 5
 
-    with patch("app.core.config.settings") as mock_settings:
-        mock_settings.redis_url = "redis://localhost:6379"
-        with patch("redis.from_url", return_value=mock_redis_client):
-            limiter = RateLimiter()
-            allowed, info = limiter.is_allowed("test-key", limit=5, window=60)
 
-            assert allowed is True
-            assert info["limit"] == 5
+@pytest.mark.asyncio
+async def test_redis_local_bucket_batches_round_trips(mock_redis_client):
+    """Test slots are reserved in batches and denials are served locally"""
+    limiter = _redis_limiter(mock_redis_client, local_batch_size=10)
+    script = mock_redis_client.register_script.return_value
+
+    with patch("middleware.rate_limiter.time.time", return_value=1000.0):
+        results = [
+            (await limiter.is_allowed("batched", limit=100, window=60))[0] for _ in range(105)
+        ]
+
+    assert results == [True] * 100 + [False] * 5
+    # 10 reservations of 10 slots, then one call that finds the window full
+    assert script.calls == 11
+    assert limiter.get_stats()["local_denials"] == 4
+
+    with patch("middleware.rate_limiter.time.time", return_value=1060.5):
+        allowed, _ = await limiter.is_allowed("batched", limit=100, window=60)
+    assert allowed is True
+
+
+@pytest.mark.asyncio
+async def test_redis_batch_shared_across_replicas(mock_redis_client):
+    """Test two limiters sharing Redis never admit more than the limit"""
+    first = _redis_limiter(mock_redis_client, local_batch_size=10)
+    second = _redis_limiter(mock_redis_client, local_batch_size=10)
 
+    with patch("middleware.rate_limiter.time.time", return_value=1000.0):
+        admitted = 0
+        for i in range(60):
+            limiter = first if i % 2 else second
+            admitted += (await limiter.is_allowed("shared", limit=50, window=60))[0]
 
-def test_is_allowed_error_handling(rate_limiter):
-    """Test rate limit check handles errors gracefully"""
-    rate_limiter.redis_available = True
-    rate_limiter.redis_client = MagicMock()
-    rate_limiter.redis_client.pipeline = MagicMock(side_effect=Exception("Redis error"))
+    assert admitted == 50
 
-    # Should fail open (allow request)
-    allowed, info = rate_limiter.is_allowed("test-key", limit=5, window=60)
+
+@pytest.mark.asyncio
+async def test_is_allowed_error_handling(mock_redis_client):
+    """Test Redis errors fall back to the in-memory window"""
+    limiter = _redis_limiter(mock_redis_client)
+    limiter._script = AsyncMock(side_effect=Exception("Redis error"))
+
+    allowed, info = await limiter.is_allowed("test-key-error", limit=5, window=60)
     assert allowed is True
+    assert limiter.get_stats()["redis_errors"] == 1
+
+    # Redis is not retried until the backoff expires
+    await limiter.is_allowed("test-key-error", limit=5, window=60)
+    assert limiter._script.await_count == 1
 
 
 # ============================================================================
@@ -149,7 +237,7 @@ async def test_dispatch_rate_limit_exceeded():
 
     # Mock rate limiter to return exceeded
     with patch("middleware.rate_limiter.rate_limiter") as mock_limiter:
-        mock_limiter.is_allowed = MagicMock(
+        mock_limiter.is_allowed = AsyncMock(
             return_value=(False, {"limit": 10, "remaining": 0, "reset": int(time.time()) + 60})
         )
 
@@ -172,7 +260,7 @@ async def test_dispatch_success_with_headers():
     call_next = AsyncMock(return_value=response)
 
     with patch("middleware.rate_limiter.rate_limiter") as mock_limiter:
-        mock_limiter.is_allowed = MagicMock(
+        mock_limiter.is_allowed = AsyncMock(
             return_value=(True, {"limit": 10, "remaining": 9, "reset": int(time.time()) + 60})
         )
 
@@ -0,0 +1,96 @@
+"""
+Unit tests for Migration 030 - quantized collection profiles
+"""
+
+import importlib.util
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import core.qdrant_db as qdrant_db
+import pytest
+from core.qdrant_db import QdrantClient
+
+migration_path = (
+    Path(__file__).parent.parent.parent
+    / "backend"
+    / "migrations"
+    / "migration_030_collection_profiles.py"
+)
+spec = importlib.util.spec_from_file_location("migration_030_collection_profiles", migration_path)
+migration = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(migration)
+
+
+def _response(status_code=200, json_data=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = json_data or {}
+    response.raise_for_status = MagicMock()
+    return response
+
+
+class TestBuildProfileCollection:
+    """Test suite for build_profile_collection"""
+
+    @pytest.mark.asyncio
+    async def test_copies_hybrid_points_with_integer_sparse_indices(self):
+        """Dense + bm25 points are copied in offloaded batches without corrupting indices"""
+        points = [
+            {
+                "id": i,
+                "vector": {
+                    "dense": [0.1 * i, 0.2, 0.3],
+                    "bm25": {"indices": [4294967295, 123456789 + i], "values": [1.5, 0.5]},
+                },
+                "payload": {"text": f"doc{i}"},
+            }
+            for i in range(3)
+        ]
+        config = {
+            "params": {
+                "vectors": {"dense": {"size": 3, "distance": "Cosine"}},
+                "sparse_vectors": {"bm25": {}},
+            }
+        }
+
+        source_http = MagicMock()
+        source_http.get = AsyncMock(
+            side_effect=lambda url: (
+                _response(json_data={"result": {"config": config}})
+                if url == "/collections/legal"
+                else _response(status_code=404)
+            )
+        )
+        source_http.post = AsyncMock(
+            return_value=_response(
+                json_data={"result": {"points": points, "next_page_offset": None}}
+            )
+        )
+        source_client = MagicMock()
+        source_client.qdrant_url = "http://localhost:6333"
+        source_client.api_key = None
+        source_client._get_client = AsyncMock(return_value=source_http)
+
+        target_http = MagicMock()
+        target_http.put = AsyncMock(return_value=_response())
+
+        with (
+            patch.object(qdrant_db, "JSON_OFFLOAD_MIN_FLOATS", 4),
+            patch.object(QdrantClient, "_get_client", AsyncMock(return_value=target_http)),
+            patch.object(
+                QdrantClient, "create_collection", AsyncMock(return_value=True)
+            ) as create_collection,
+            patch.object(migration, "_wait_green", AsyncMock()),
+        ):
+            target = await migration.build_profile_collection(
+                source_client, "legal", "legal", "scalar_int8"
+            )
+
+        assert target == "legal__scalar_int8"
+        assert create_collection.call_args.kwargs["enable_sparse"] is True
+        content = target_http.put.call_args.kwargs["content"]
+        assert b'"indices":[4294967295,123456789]' in content
+        copied = json.loads(content)["points"]
+        assert [p["vector"]["bm25"] for p in copied] == [p["vector"]["bm25"] for p in points]
+        assert copied[1]["vector"]["dense"] == pytest.approx([0.1, 0.2, 0.3])
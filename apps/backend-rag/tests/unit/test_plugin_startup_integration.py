@@ -29,6 +29,7 @@ def mock_env(monkeypatch):
         mock_settings.API_V1_STR = "/api/v1"
         mock_settings.PROJECT_NAME = "Test Project"
         mock_settings.log_level = "INFO"
+        mock_settings.embedding_cache_dir = None
         yield mock_settings
 
 
@@ -8,6 +8,8 @@ import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 os.environ.setdefault("JWT_SECRET_KEY", "test_jwt_secret_key_for_testing_only_min_32_chars")
 os.environ.setdefault("REDIS_URL", "redis://localhost:6379/0")
 
@@ -29,7 +31,8 @@ class TestRateLimiter:
             limiter = RateLimiter()
             assert limiter is not None
 
-    def test_is_allowed_under_limit(self):
+    @pytest.mark.asyncio
+    async def test_is_allowed_under_limit(self):
         """Test rate limit check when under limit"""
         with patch("app.core.config.settings") as mock_settings:
             mock_settings.redis_url = None  # Use in-memory fallback
@@ -37,11 +40,12 @@ class TestRateLimiter:
             from backend.middleware.rate_limiter import RateLimiter
 
             limiter = RateLimiter()
-            allowed, info = limiter.is_allowed("user123", limit=10, window=60)
+            allowed, info = await limiter.is_allowed("user123", limit=10, window=60)
             assert isinstance(allowed, bool)
             assert isinstance(info, dict)
 
-    def test_is_allowed_over_limit(self):
+    @pytest.mark.asyncio
+    async def test_is_allowed_over_limit(self):
         """Test rate limit check when over limit"""
         with patch("app.core.config.settings") as mock_settings:
             mock_settings.redis_url = None  # Use in-memory fallback
@@ -51,12 +55,13 @@ class TestRateLimiter:
             limiter = RateLimiter()
             # Make many requests to exceed limit
             for i in range(11):
-                allowed, info = limiter.is_allowed("user123", limit=10, window=60)
+                allowed, info = await limiter.is_allowed("user123", limit=10, window=60)
 
             # Should be denied after exceeding limit
             assert isinstance(allowed, bool)
 
-    def test_is_allowed_at_limit(self):
+    @pytest.mark.asyncio
+    async def test_is_allowed_at_limit(self):
         """Test rate limit check at exact limit"""
         with patch("app.core.config.settings") as mock_settings:
             mock_settings.redis_url = None  # Use in-memory fallback
@@ -66,13 +71,14 @@ class TestRateLimiter:
             limiter = RateLimiter()
             # Make exactly limit requests
             for i in range(10):
-                allowed, info = limiter.is_allowed("user123", limit=10, window=60)
+                allowed, info = await limiter.is_allowed("user123", limit=10, window=60)
 
             # May allow or deny depending on implementation
             assert isinstance(allowed, bool)
             assert isinstance(info, dict)
 
-    def test_is_allowed_redis_error(self):
+    @pytest.mark.asyncio
+    async def test_is_allowed_redis_error(self):
         """Test rate limit check when Redis fails"""
         with patch("app.core.config.settings") as mock_settings:
             mock_settings.redis_url = "redis://localhost:6379"
@@ -90,7 +96,7 @@ class TestRateLimiter:
 
                 limiter = RateLimiter()
                 # Should fallback to in-memory
-                allowed, info = limiter.is_allowed("user123", limit=10, window=60)
+                allowed, info = await limiter.is_allowed("user123", limit=10, window=60)
                 assert isinstance(allowed, bool)
                 assert isinstance(info, dict)
             finally:
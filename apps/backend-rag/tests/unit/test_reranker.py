@@ -13,7 +13,12 @@ backend_path = Path(__file__).parent.parent.parent / "backend"
 if str(backend_path) not in sys.path:
     sys.path.insert(0, str(backend_path))
 
-from core.reranker import ReRanker
+from core.reranker import (
+    LocalCrossEncoderReranker,
+    PassThroughReranker,
+    ReRanker,
+    create_reranker,
+)
 
 
 @pytest.fixture
@@ -29,6 +34,8 @@ async def test_reranker_init_success():
     # Mock settings
     with patch("core.reranker.settings") as mock_settings:
         mock_settings.zerank_api_key = "test_key"
+        mock_settings.reranker_cache_enabled = True
+        mock_settings.reranker_cache_size = 100
         mock_settings.zerank_api_url = "https://api.test.com"
 
         reranker = ReRanker()
@@ -42,6 +49,7 @@ async def test_reranker_disabled_without_key():
     """Test ReRanker disabled if key missing"""
     with patch("core.reranker.settings") as mock_settings:
         mock_settings.zerank_api_key = None
+        mock_settings.reranker_cache_enabled = False
 
         reranker = ReRanker()
         assert reranker.enabled is False
@@ -52,6 +60,8 @@ async def test_rerank_logic():
     """Test re-ranking logic with mocked API response"""
     with patch("core.reranker.settings") as mock_settings:
         mock_settings.zerank_api_key = "test_key"
+        mock_settings.reranker_cache_enabled = True
+        mock_settings.reranker_cache_size = 100
         mock_settings.zerank_api_url = "https://api.test.com"
 
         reranker = ReRanker()
@@ -74,12 +84,9 @@ async def test_rerank_logic():
             ]
         }
 
-        with patch("httpx.AsyncClient") as MockClient:
-            mock_client_instance = AsyncMock()
-            mock_client_instance.post.return_value = mock_response
-            # Support async context manager
-            MockClient.return_value.__aenter__.return_value = mock_client_instance
-
+        mock_client_instance = AsyncMock()
+        mock_client_instance.post.return_value = mock_response
+        with patch("core.reranker.get_reranker_http_client", return_value=mock_client_instance):
             reranked = await reranker.rerank(query, docs, top_k=3)
 
             assert len(reranked) == 3
@@ -99,6 +106,8 @@ async def test_rerank_api_error():
     """Test fallback when API fails"""
     with patch("core.reranker.settings") as mock_settings:
         mock_settings.zerank_api_key = "test_key"
+        mock_settings.reranker_cache_enabled = True
+        mock_settings.reranker_cache_size = 100
 
         reranker = ReRanker()
         docs = [{"text": "doc1", "score": 0.5}, {"text": "doc2", "score": 0.4}]
@@ -107,11 +116,9 @@ async def test_rerank_api_error():
         mock_response = MagicMock()
         mock_response.status_code = 500
 
-        with patch("httpx.AsyncClient") as MockClient:
-            mock_client_instance = AsyncMock()
-            mock_client_instance.post.return_value = mock_response
-            MockClient.return_value.__aenter__.return_value = mock_client_instance
-
+        mock_client_instance = AsyncMock()
+        mock_client_instance.post.return_value = mock_response
+        with patch("core.reranker.get_reranker_http_client", return_value=mock_client_instance):
             # Should return original docs
             result = await reranker.rerank("query", docs)
             assert len(result) == 2
@@ -123,6 +130,8 @@ async def test_rerank_empty_results():
     """Test handling of empty API results"""
     with patch("core.reranker.settings") as mock_settings:
         mock_settings.zerank_api_key = "test_key"
+        mock_settings.reranker_cache_enabled = True
+        mock_settings.reranker_cache_size = 100
 
         reranker = ReRanker()
         docs = [{"text": "doc1", "score": 0.5}]
@@ -131,10 +140,259 @@ async def test_rerank_empty_results():
         mock_response.status_code = 200
         mock_response.json.return_value = {"results": []}
 
-        with patch("httpx.AsyncClient") as MockClient:
-            mock_client_instance = AsyncMock()
-            mock_client_instance.post.return_value = mock_response
-            MockClient.return_value.__aenter__.return_value = mock_client_instance
-
+        mock_client_instance = AsyncMock()
+        mock_client_instance.post.return_value = mock_response
+        with patch("core.reranker.get_reranker_http_client", return_value=mock_client_instance):
             result = await reranker.rerank("query", docs)
             assert result == docs
+
+
+def _scores_response(scores: list[float]) -> MagicMock:
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = {
+        "results": [{"index": i, "relevance_score": s} for i, s in enumerate(scores)]
+    }
+    return response
+
+
+@pytest.mark.asyncio
+async def test_rerank_uses_score_cache():
+    """Test cached (query, doc-id) scores skip the API call"""
+    with patch("core.reranker.settings") as mock_settings:
+        mock_settings.zerank_api_key = "test_key"
+        mock_settings.reranker_cache_enabled = True
+        mock_settings.reranker_cache_size = 100
+
+        reranker = ReRanker()
+        mock_client_instance = AsyncMock()
+        mock_client_instance.post.return_value = _scores_response([0.2, 0.8])
+
+        with patch("core.reranker.get_reranker_http_client", return_value=mock_client_instance):
+            first = await reranker.rerank(
+                "query", [{"id": "a", "text": "doc a"}, {"id": "b", "text": "doc b"}], top_k=2
+            )
+            second = await reranker.rerank(
+                "query", [{"id": "a", "text": "doc a"}, {"id": "b", "text": "doc b"}], top_k=2
+            )
+
+        assert mock_client_instance.post.await_count == 1
+        assert [d["id"] for d in first] == ["b", "a"]
+        assert [d["id"] for d in second] == ["b", "a"]
+        assert second[0]["rerank_score"] == 0.8
+        assert reranker.get_stats()["cache_hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_rerank_only_sends_uncached_documents():
+    """Test partially cached groups only send the missing documents"""
+    with patch("core.reranker.settings") as mock_settings:
+        mock_settings.zerank_api_key = "test_key"
+        mock_settings.reranker_cache_enabled = True
+        mock_settings.reranker_cache_size = 100
+
+        reranker = ReRanker()
+        mock_client_instance = AsyncMock()
+        mock_client_instance.post.side_effect = [
+            _scores_response([0.4]),
+            _scores_response([0.9]),
+        ]
+
+        with patch("core.reranker.get_reranker_http_client", return_value=mock_client_instance):
+            await reranker.rerank("query", [{"id": "a", "text": "doc a"}])
+            result = await reranker.rerank(
+                "query", [{"id": "a", "text": "doc a"}, {"id": "c", "text": "doc c"}]
+            )
+
+        second_payload = mock_client_instance.post.await_args_list[1].kwargs["json"]
+        assert second_payload["documents"] == ["doc c"]
+        assert [d["id"] for d in result] == ["c", "a"]
+
+
+@pytest.mark.asyncio
+async def test_rerank_many_groups():
+    """Test batch re-ranking returns one result list per group, in order"""
+    with patch("core.reranker.settings") as mock_settings:
+        mock_settings.zerank_api_key = "test_key"
+        mock_settings.reranker_cache_enabled = False
+
+        reranker = ReRanker()
+        mock_client_instance = AsyncMock()
+        mock_client_instance.post.side_effect = [
+            _scores_response([0.1, 0.7]),
+            _scores_response([0.6]),
+        ]
+
+        with patch("core.reranker.get_reranker_http_client", return_value=mock_client_instance):
+            results = await reranker.rerank_many(
+                [
+                    ("q1", [{"id": 1, "text": "one"}, {"id": 2, "text": "two"}]),
+                    ("q2", [{"id": 3, "text": "three"}]),
+                ],
+                top_k=5,
+            )
+
+        assert [[d["id"] for d in group] for group in results] == [[2, 1], [3]]
+
+
+@pytest.mark.asyncio
+async def test_rerank_many_disabled_passthrough():
+    """Test batch re-ranking is a pass-through when disabled"""
+    with patch("core.reranker.settings") as mock_settings:
+        mock_settings.zerank_api_key = None
+        mock_settings.reranker_cache_enabled = False
+
+        reranker = ReRanker()
+        docs = [{"text": "a"}, {"text": "b"}, {"text": "c"}]
+        results = await reranker.rerank_many([("q", docs)], top_k=2)
+
+        assert results == [docs[:2]]
+
+
+class _FakeEncoding:
+    def __init__(self, ids):
+        self.ids = ids
+        self.attention_mask = [1 if i else 0 for i in ids]
+        self.type_ids = [0] * len(ids)
+
+
+class _FakeTokenizer:
+    """Whitespace tokenizer: token id = word length, padded to the longest pair"""
+
+    def __init__(self):
+        self.max_length = None
+
+    def enable_truncation(self, max_length, strategy):
+        self.max_length = max_length
+
+    def enable_padding(self, pad_id):
+        self.pad_id = pad_id
+
+    def token_to_id(self, token):
+        return 0
+
+    def encode_batch(self, pairs):
+        encoded = [[len(w) for w in f"{q} {d}".split()][: self.max_length] for q, d in pairs]
+        width = max(len(ids) for ids in encoded)
+        return [_FakeEncoding(ids + [0] * (width - len(ids))) for ids in encoded]
+
+
+def _local_reranker(**kwargs):
+    session = MagicMock()
+    session.get_inputs.return_value = [MagicMock(), MagicMock()]
+    session.get_inputs.return_value[0].name = "input_ids"
+    session.get_inputs.return_value[1].name = "attention_mask"
+    session.run.side_effect = lambda _, inputs: [
+        # Logit = sum of token ids, so longer documents score higher
+        inputs["input_ids"].sum(axis=1, keepdims=True).astype("float32") / 10.0 - 2.0
+    ]
+    params = {
+        "max_tokens": 64,
+        "max_batch_size": 8,
+        "batch_window_ms": 1.0,
+        "num_threads": 1,
+        "session": session,
+        "tokenizer": _FakeTokenizer(),
+    }
+    params.update(kwargs)
+    return LocalCrossEncoderReranker(**params), session
+
+
+@pytest.mark.asyncio
+async def test_local_reranker_scores_and_sorts():
+    """Test local cross-encoder re-ranks with sigmoid scores"""
+    reranker, _ = _local_reranker()
+    docs = [
+        {"id": "short", "text": "visa", "score": 0.9},
+        {"id": "long", "text": "investor visa requirements explained", "score": 0.4},
+    ]
+
+    result = await reranker.rerank("visa", docs, top_k=2)
+
+    assert reranker.enabled is True
+    assert [d["id"] for d in result] == ["long", "short"]
+    assert 0.0 < result[1]["score"] < result[0]["score"] < 1.0
+    assert result[0]["vector_score"] == 0.4
+
+
+@pytest.mark.asyncio
+async def test_local_reranker_truncates_to_token_budget():
+    """Test pairs are truncated to the configured token budget"""
+    reranker, session = _local_reranker(max_tokens=8)
+    docs = [{"text": " ".join(["word"] * 100)}]
+
+    await reranker.rerank("query", docs)
+
+    input_ids = session.run.call_args.args[1]["input_ids"]
+    assert input_ids.shape == (1, 8)
+
+
+@pytest.mark.asyncio
+async def test_local_reranker_coalesces_concurrent_calls():
+    """Test concurrent rerank calls share one inference batch"""
+    import asyncio
+
+    reranker, session = _local_reranker()
+
+    await asyncio.gather(
+        reranker.rerank("q1", [{"text": "a"}, {"text": "b"}]),
+        reranker.rerank("q2", [{"text": "c"}]),
+    )
+
+    assert session.run.call_count == 1
+    assert reranker.get_stats()["pairs_scored"] == 3
+
+
+@pytest.mark.asyncio
+async def test_local_reranker_inference_error_falls_back():
+    """Test inference failures return the original order"""
+    reranker, session = _local_reranker()
+    session.run.side_effect = RuntimeError("onnx failure")
+    docs = [{"text": "a", "score": 0.5}, {"text": "b", "score": 0.4}]
+
+    result = await reranker.rerank("q", docs)
+
+    assert result == docs
+
+
+def test_local_reranker_disabled_without_model():
+    """Test local backend is disabled when no model is configured"""
+    with patch("core.reranker.settings") as mock_settings:
+        mock_settings.reranker_onnx_model_path = None
+        mock_settings.reranker_onnx_model_file = "model_quantized.onnx"
+        mock_settings.reranker_max_tokens = 256
+        mock_settings.reranker_max_batch_size = 32
+        mock_settings.reranker_batch_window_ms = 2.0
+        mock_settings.reranker_num_threads = 1
+
+        reranker = LocalCrossEncoderReranker()
+
+        assert reranker.enabled is False
+
+
+def test_create_reranker_backend_selection():
+    """Test factory picks the configured backend"""
+    with patch("core.reranker.settings") as mock_settings:
+        mock_settings.zerank_api_key = "test_key"
+        mock_settings.reranker_cache_enabled = False
+
+        assert isinstance(create_reranker("none"), PassThroughReranker)
+        assert isinstance(create_reranker("zerank"), ReRanker)
+
+        mock_settings.reranker_backend = "auto"
+        assert isinstance(create_reranker(), ReRanker)
+
+
+def test_create_reranker_auto_prefers_local_without_api_key():
+    """Test auto mode uses the local model when Ze-Rank is not configured"""
+    local = MagicMock()
+    local.enabled = True
+    with (
+        patch("core.reranker.settings") as mock_settings,
+        patch("core.reranker.LocalCrossEncoderReranker", return_value=local),
+    ):
+        mock_settings.zerank_api_key = None
+        mock_settings.reranker_backend = "auto"
+        mock_settings.reranker_onnx_model_path = "/models/ms-marco-int8"
+
+        assert create_reranker() is local
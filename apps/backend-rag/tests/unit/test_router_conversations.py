@@ -75,9 +75,26 @@ def mock_asyncpg_pool():
     conn = AsyncMock()
     pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
     pool.acquire.return_value.__aexit__ = AsyncMock(return_value=False)
+    conn.transaction = MagicMock()
+    conn.transaction.return_value.__aenter__ = AsyncMock(return_value=None)
+    conn.transaction.return_value.__aexit__ = AsyncMock(return_value=False)
     return pool, conn
 
 
+def history_rows(messages, session_id=None):
+    """Rows of the latest-conversation + conversation_messages page query"""
+    base = {
+        "id": 1,
+        "session_id": session_id,
+        "created_at": datetime.now(),
+        "message_count": len(messages),
+    }
+    return [
+        {**base, "seq": seq, "role": m["role"], "content": m["content"], "extra": {}}
+        for seq, m in enumerate(messages, start=1)
+    ]
+
+
 @pytest.fixture
 def mock_auto_crm():
     """Mock Auto-CRM service"""
@@ -165,7 +182,7 @@ class TestSaveConversation:
     async def test_save_conversation_success(self, mock_settings, mock_asyncpg_pool, mock_auto_crm):
         """Test successful conversation save"""
         pool, conn = mock_asyncpg_pool
-        conn.fetchrow = AsyncMock(return_value={"id": 123})
+        conn.fetchrow = AsyncMock(side_effect=[None, {"id": 123, "message_count": 0}])
         conn.execute = AsyncMock()
 
         with patch("app.routers.conversations.get_auto_crm", return_value=mock_auto_crm):
@@ -195,7 +212,7 @@ class TestSaveConversation:
     async def test_save_uses_jwt_email_not_request(self, mock_settings, mock_asyncpg_pool):
         """Test that user email comes from JWT, not request body (security)"""
         pool, conn = mock_asyncpg_pool
-        conn.fetchrow = AsyncMock(return_value={"id": 456})
+        conn.fetchrow = AsyncMock(side_effect=[None, {"id": 456, "message_count": 0}])
         conn.execute = AsyncMock()
 
         with patch("app.routers.conversations.get_auto_crm", return_value=None):
@@ -245,14 +262,13 @@ class TestGetConversationHistory:
     async def test_get_history_success(self, mock_settings, mock_asyncpg_pool):
         """Test successful history retrieval"""
         pool, conn = mock_asyncpg_pool
-        conn.fetchrow = AsyncMock(
-            return_value={
-                "messages": [
+        conn.fetch = AsyncMock(
+            return_value=history_rows(
+                [
                     {"role": "user", "content": "Hello"},
                     {"role": "assistant", "content": "Hi!"},
-                ],
-                "created_at": datetime.now(),
-            }
+                ]
+            )
         )
 
         from app.routers.conversations import get_conversation_history
@@ -260,7 +276,11 @@ class TestGetConversationHistory:
         current_user = {"email": "test@example.com", "user_id": "test"}
 
         result = await get_conversation_history(
-            limit=20, session_id=None, current_user=current_user, db_pool=pool
+            limit=20,
+            session_id=None,
+            before_seq=None,
+            current_user=current_user,
+            db_pool=pool,
         )
 
         assert result.success is True
@@ -271,14 +291,18 @@ class TestGetConversationHistory:
     async def test_get_history_empty(self, mock_settings, mock_asyncpg_pool):
         """Test empty history returns success with empty list"""
         pool, conn = mock_asyncpg_pool
-        conn.fetchrow = AsyncMock(return_value=None)
+        conn.fetch = AsyncMock(return_value=[])
 
         from app.routers.conversations import get_conversation_history
 
         current_user = {"email": "test@example.com", "user_id": "test"}
 
         result = await get_conversation_history(
-            limit=20, session_id=None, current_user=current_user, db_pool=pool
+            limit=20,
+            session_id=None,
+            before_seq=None,
+            current_user=current_user,
+            db_pool=pool,
         )
 
         assert result.success is True
@@ -346,6 +370,42 @@ class TestGetConversationStats:
         assert result["last_conversation"] is not None
 
 
+class TestListConversations:
+    """Tests for GET /api/bali-zero/conversations/list endpoint"""
+
+    @pytest.mark.asyncio
+    async def test_list_ordered_by_latest_activity(self, mock_asyncpg_pool):
+        """Test conversations are listed by last append, not creation time"""
+        pool, conn = mock_asyncpg_pool
+        conn.fetchrow = AsyncMock(return_value={"total": 1})
+        conn.fetch = AsyncMock(
+            return_value=[
+                {
+                    "id": 7,
+                    "session_id": "s1",
+                    "title": "KITAS renewal",
+                    "last_message_preview": "You need a sponsor letter",
+                    "message_count": 4,
+                    "created_at": datetime(2024, 1, 1),
+                    "updated_at": datetime(2024, 3, 1),
+                }
+            ]
+        )
+
+        from app.routers.conversations import list_conversations
+
+        result = await list_conversations(
+            limit=20,
+            offset=0,
+            current_user={"email": "test@example.com", "user_id": "test"},
+            db_pool=pool,
+        )
+
+        assert "ORDER BY COALESCE(updated_at, created_at) DESC" in conn.fetch.call_args.args[0]
+        assert result.total == 1
+        assert result.conversations[0].updated_at == "2024-03-01T00:00:00"
+
+
 # ============================================================================
 # Additional Edge Cases and Validation Tests
 # ============================================================================
@@ -358,7 +418,7 @@ class TestSaveConversationEdgeCases:
     async def test_save_conversation_empty_messages(self, mock_settings, mock_asyncpg_pool):
         """Test saving conversation with empty messages list"""
         pool, conn = mock_asyncpg_pool
-        conn.fetchrow = AsyncMock(return_value={"id": 789})
+        conn.fetchrow = AsyncMock(side_effect=[None, {"id": 789, "message_count": 0}])
 
         from app.routers.conversations import SaveConversationRequest, save_conversation
 
@@ -375,7 +435,7 @@ class TestSaveConversationEdgeCases:
     async def test_save_conversation_very_long_messages(self, mock_settings, mock_asyncpg_pool):
         """Test saving conversation with very long messages"""
         pool, conn = mock_asyncpg_pool
-        conn.fetchrow = AsyncMock(return_value={"id": 999})
+        conn.fetchrow = AsyncMock(side_effect=[None, {"id": 999, "message_count": 0}])
 
         from app.routers.conversations import SaveConversationRequest, save_conversation
 
@@ -393,7 +453,7 @@ class TestSaveConversationEdgeCases:
     async def test_save_conversation_auto_crm_unavailable(self, mock_settings, mock_asyncpg_pool):
         """Test saving conversation when auto-CRM is unavailable"""
         pool, conn = mock_asyncpg_pool
-        conn.fetchrow = AsyncMock(return_value={"id": 111})
+        conn.fetchrow = AsyncMock(side_effect=[None, {"id": 111, "message_count": 0}])
 
         with patch("app.routers.conversations.get_auto_crm", return_value=None):
             from app.routers.conversations import SaveConversationRequest, save_conversation
@@ -418,7 +478,7 @@ class TestSaveConversationEdgeCases:
     ):
         """Test saving conversation when auto-CRM raises error"""
         pool, conn = mock_asyncpg_pool
-        conn.fetchrow = AsyncMock(return_value={"id": 222})
+        conn.fetchrow = AsyncMock(side_effect=[None, {"id": 222, "message_count": 0}])
 
         mock_auto_crm.process_conversation = AsyncMock(side_effect=Exception("CRM error"))
 
@@ -442,7 +502,7 @@ class TestSaveConversationEdgeCases:
     async def test_save_conversation_with_session_id(self, mock_settings, mock_asyncpg_pool):
         """Test saving conversation with explicit session_id"""
         pool, conn = mock_asyncpg_pool
-        conn.fetchrow = AsyncMock(return_value={"id": 333})
+        conn.fetchrow = AsyncMock(side_effect=[None, {"id": 333, "message_count": 0}])
 
         with patch("app.routers.conversations.get_auto_crm", return_value=None):
             from app.routers.conversations import SaveConversationRequest, save_conversation
@@ -461,13 +521,14 @@ class TestSaveConversationEdgeCases:
             assert result["success"] is True
             # Verify session_id was used (check call args - $2 is session_id)
             call_args = conn.fetchrow.call_args[0]
+            assert "INSERT INTO conversations" in call_args[0]
             assert call_args[2] == "custom-session-123"
 
     @pytest.mark.asyncio
     async def test_save_conversation_with_metadata(self, mock_settings, mock_asyncpg_pool):
         """Test saving conversation with metadata"""
         pool, conn = mock_asyncpg_pool
-        conn.fetchrow = AsyncMock(return_value={"id": 444})
+        conn.fetchrow = AsyncMock(side_effect=[None, {"id": 444, "message_count": 0}])
 
         with patch("app.routers.conversations.get_auto_crm", return_value=None):
             from app.routers.conversations import SaveConversationRequest, save_conversation
@@ -504,7 +565,11 @@ class TestGetConversationHistoryEdgeCases:
         current_user = {"email": "test@example.com", "user_id": "test"}
 
         result = await get_conversation_history(
-            limit=20, session_id=None, current_user=current_user, db_pool=pool
+            limit=20,
+            session_id=None,
+            before_seq=None,
+            current_user=current_user,
+            db_pool=pool,
         )
 
         assert result.success is True
@@ -515,11 +580,10 @@ class TestGetConversationHistoryEdgeCases:
     async def test_get_history_with_session_id(self, mock_settings, mock_asyncpg_pool):
         """Test getting history filtered by session_id"""
         pool, conn = mock_asyncpg_pool
-        conn.fetchrow = AsyncMock(
-            return_value={
-                "messages": [{"role": "user", "content": "Session message"}],
-                "created_at": datetime.now(),
-            }
+        conn.fetch = AsyncMock(
+            return_value=history_rows(
+                [{"role": "user", "content": "Session message"}], session_id="session-123"
+            )
         )
 
         from app.routers.conversations import get_conversation_history
@@ -527,31 +591,35 @@ class TestGetConversationHistoryEdgeCases:
         current_user = {"email": "test@example.com", "user_id": "test"}
 
         result = await get_conversation_history(
-            limit=20, session_id="session-123", current_user=current_user, db_pool=pool
+            limit=20,
+            session_id="session-123",
+            before_seq=None,
+            current_user=current_user,
+            db_pool=pool,
         )
 
         assert result.success is True
-        # Verify session_id was used in query ($2 is session_id)
-        call_args = conn.fetchrow.call_args[0]
-        assert call_args[2] == "session-123"
+        # Verify session_id was used in query ($4 is session_id, $2 the page size)
+        call_args = conn.fetch.call_args[0]
+        assert call_args[2] == 20
+        assert call_args[4] == "session-123"
 
     @pytest.mark.asyncio
     async def test_get_history_max_limit(self, mock_settings, mock_asyncpg_pool):
         """Test getting history with maximum limit"""
         pool, conn = mock_asyncpg_pool
-        conn.fetchrow = AsyncMock(
-            return_value={
-                "messages": [{"role": "user", "content": "Test"}],
-                "created_at": datetime.now(),
-            }
-        )
+        conn.fetch = AsyncMock(return_value=history_rows([{"role": "user", "content": "Test"}]))
 
         from app.routers.conversations import get_conversation_history
 
         current_user = {"email": "test@example.com", "user_id": "test"}
 
         result = await get_conversation_history(
-            limit=1000, session_id=None, current_user=current_user, db_pool=pool
+            limit=1000,
+            session_id=None,
+            before_seq=None,
+            current_user=current_user,
+            db_pool=pool,
         )
 
         assert result.success is True
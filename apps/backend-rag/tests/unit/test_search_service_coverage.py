@@ -35,13 +35,18 @@ class TestSearchServiceCoverage:
         """Create mock collection manager"""
         mock_manager = MagicMock()
         mock_collection = MagicMock()
-        mock_collection.search = AsyncMock(
-            return_value={
-                "documents": ["Doc 1"],
-                "metadatas": [{}],
-                "distances": [0.2],
-                "ids": ["doc1"],
-            }
+        search_result = {
+            "documents": ["Doc 1"],
+            "metadatas": [{}],
+            "distances": [0.2],
+            "ids": ["doc1"],
+        }
+        mock_collection.search = AsyncMock(return_value=search_result)
+        mock_collection.search_batch = AsyncMock(
+            side_effect=lambda searches: [search_result for _ in searches]
+        )
+        mock_collection.hybrid_search_batch = AsyncMock(
+            side_effect=lambda searches: [search_result for _ in searches]
         )
         mock_manager.get_collection = MagicMock(return_value=mock_collection)
         return mock_manager, mock_collection
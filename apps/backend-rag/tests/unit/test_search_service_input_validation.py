@@ -53,33 +53,37 @@ class TestSearchServiceInputValidation:
         service.embedder = mock_embedder
         return service
 
-    def test_prepare_search_context_empty_query(self, search_service):
+    @pytest.mark.asyncio
+    async def test_prepare_search_context_empty_query(self, search_service):
         """Test that empty query raises ValueError"""
         with pytest.raises(ValueError, match="Query cannot be empty"):
-            search_service._prepare_search_context(
+            await search_service._prepare_search_context(
                 "", user_level=1, tier_filter=None, collection_override=None, apply_filters=None
             )
 
-    def test_prepare_search_context_whitespace_only_query(self, search_service):
+    @pytest.mark.asyncio
+    async def test_prepare_search_context_whitespace_only_query(self, search_service):
         """Test that whitespace-only query raises ValueError"""
         with pytest.raises(ValueError, match="Query cannot be empty"):
-            search_service._prepare_search_context(
+            await search_service._prepare_search_context(
                 "   ", user_level=1, tier_filter=None, collection_override=None, apply_filters=None
             )
 
-    def test_prepare_search_context_none_query(self, search_service):
+    @pytest.mark.asyncio
+    async def test_prepare_search_context_none_query(self, search_service):
         """Test that None query raises ValueError"""
         with pytest.raises(
             (ValueError, AttributeError)
         ):  # AttributeError if None.strip() is called
-            search_service._prepare_search_context(
+            await search_service._prepare_search_context(
                 None, user_level=1, tier_filter=None, collection_override=None, apply_filters=None
             )
 
-    def test_prepare_search_context_user_level_negative(self, search_service):
+    @pytest.mark.asyncio
+    async def test_prepare_search_context_user_level_negative(self, search_service):
         """Test that negative user_level raises ValueError"""
         with pytest.raises(ValueError, match="User level must be between 0 and 3"):
-            search_service._prepare_search_context(
+            await search_service._prepare_search_context(
                 "test query",
                 user_level=-1,
                 tier_filter=None,
@@ -87,10 +91,11 @@ class TestSearchServiceInputValidation:
                 apply_filters=None,
             )
 
-    def test_prepare_search_context_user_level_too_high(self, search_service):
+    @pytest.mark.asyncio
+    async def test_prepare_search_context_user_level_too_high(self, search_service):
         """Test that user_level > 3 raises ValueError"""
         with pytest.raises(ValueError, match="User level must be between 0 and 3"):
-            search_service._prepare_search_context(
+            await search_service._prepare_search_context(
                 "test query",
                 user_level=4,
                 tier_filter=None,
@@ -98,11 +103,12 @@ class TestSearchServiceInputValidation:
                 apply_filters=None,
             )
 
-    def test_prepare_search_context_empty_embedding(self, search_service, mock_embedder):
+    @pytest.mark.asyncio
+    async def test_prepare_search_context_empty_embedding(self, search_service, mock_embedder):
         """Test that empty embedding raises ValueError"""
         mock_embedder.generate_query_embedding.return_value = []
         with pytest.raises(ValueError, match="Failed to generate query embedding"):
-            search_service._prepare_search_context(
+            await search_service._prepare_search_context(
                 "test query",
                 user_level=1,
                 tier_filter=None,
@@ -110,11 +116,12 @@ class TestSearchServiceInputValidation:
                 apply_filters=None,
             )
 
-    def test_prepare_search_context_none_embedding(self, search_service, mock_embedder):
+    @pytest.mark.asyncio
+    async def test_prepare_search_context_none_embedding(self, search_service, mock_embedder):
         """Test that None embedding raises ValueError"""
         mock_embedder.generate_query_embedding.return_value = None
         with pytest.raises(ValueError, match="Failed to generate query embedding"):
-            search_service._prepare_search_context(
+            await search_service._prepare_search_context(
                 "test query",
                 user_level=1,
                 tier_filter=None,
@@ -122,9 +129,10 @@ class TestSearchServiceInputValidation:
                 apply_filters=None,
             )
 
-    def test_prepare_search_context_valid_inputs(self, search_service):
+    @pytest.mark.asyncio
+    async def test_prepare_search_context_valid_inputs(self, search_service):
         """Test that valid inputs work correctly"""
-        result = search_service._prepare_search_context(
+        result = await search_service._prepare_search_context(
             "test query",
             user_level=1,
             tier_filter=None,
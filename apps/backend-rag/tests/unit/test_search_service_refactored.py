@@ -23,13 +23,19 @@ class TestSearchServiceRefactored:
         """Mock CollectionManager"""
         manager = Mock(spec=CollectionManager)
         mock_client = AsyncMock()
-        mock_client.search = AsyncMock(
-            return_value={
-                "documents": ["Test document"],
-                "metadatas": [{"tier": "A"}],
-                "distances": [0.3],
-                "ids": ["doc_1"],
-            }
+        search_result = {
+            "documents": ["Test document"],
+            "metadatas": [{"tier": "A"}],
+            "distances": [0.3],
+            "ids": ["doc_1"],
+        }
+        mock_client.collection_name = "visa_oracle"
+        mock_client.search = AsyncMock(return_value=search_result)
+        mock_client.search_batch = AsyncMock(
+            side_effect=lambda searches: [search_result for _ in searches]
+        )
+        mock_client.hybrid_search_batch = AsyncMock(
+            side_effect=lambda searches: [search_result for _ in searches]
         )
         manager.get_collection.return_value = mock_client
         return manager
@@ -216,6 +222,120 @@ class TestSearchServiceRefactored:
         assert "conflicts_detected" in result
         mock_conflict_resolver.detect_conflicts.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_search_with_conflict_resolution_single_batch_request(
+        self, search_service, mock_collection_manager, mock_query_router
+    ):
+        """Test fallback collections are searched with one hybrid_search_batch call"""
+        mock_query_router.route_query.return_value = {
+            "collection_name": "visa_oracle",
+            "collections": ["visa_oracle", "legal_unified", "tax_genius"],
+            "confidence": 0.5,
+            "is_pricing": False,
+        }
+        mock_client = mock_collection_manager.get_collection.return_value
+
+        result = await search_service.search_with_conflict_resolution(
+            query="batched fallback test", user_level=3, enable_fallbacks=True
+        )
+
+        mock_client.hybrid_search_batch.assert_awaited_once()
+        searches = mock_client.hybrid_search_batch.await_args.args[0]
+        assert len(searches) == 3
+        assert all(search["query_sparse"]["indices"] for search in searches)
+        assert all(search["prefetch_limit"] == 15 for search in searches)
+        mock_client.search_batch.assert_not_called()
+        mock_client.search.assert_not_called()
+        assert result["collections_searched"] == ["visa_oracle", "legal_unified", "tax_genius"]
+
+    @pytest.mark.asyncio
+    async def test_search_with_conflict_resolution_dense_batch_without_bm25(
+        self, search_service, mock_collection_manager, mock_query_router
+    ):
+        """Test conflict resolution uses the dense search_batch when BM25 is disabled"""
+        search_service._bm25_vectorizer = None
+        mock_query_router.route_query.return_value = {
+            "collection_name": "visa_oracle",
+            "collections": ["visa_oracle", "tax_genius"],
+            "confidence": 0.5,
+            "is_pricing": False,
+        }
+        mock_client = mock_collection_manager.get_collection.return_value
+
+        await search_service.search_with_conflict_resolution(
+            query="dense fallback test", user_level=3, enable_fallbacks=True
+        )
+
+        mock_client.search_batch.assert_awaited_once()
+        searches = mock_client.search_batch.await_args.args[0]
+        assert all("query_sparse" not in search for search in searches)
+        mock_client.hybrid_search_batch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_search_with_conflict_resolution_batch_reranks(
+        self, search_service, mock_conflict_resolver
+    ):
+        """Test conflict resolution re-ranks all collections with one rerank_many call"""
+        reranker = Mock()
+        reranker.enabled = True
+        reranker.rerank_many = AsyncMock(
+            side_effect=lambda groups, top_k: [
+                [{**doc, "score": 0.42} for doc in docs] for _, docs in groups
+            ]
+        )
+        search_service._reranker = reranker
+
+        result = await search_service.search_with_conflict_resolution(
+            query="batch rerank test", user_level=3, enable_fallbacks=True
+        )
+
+        reranker.rerank_many.assert_awaited_once()
+        groups = reranker.rerank_many.await_args.args[0]
+        assert all(query == "batch rerank test" for query, _ in groups)
+        assert all(r["score"] == 0.42 for r in result["results"])
+
+    @pytest.mark.asyncio
+    async def test_hybrid_search_uses_idf_of_aliased_collection(
+        self, search_service, mock_collection_manager, mock_query_router
+    ):
+        """Test IDF weights are looked up under the physical collection an alias resolves to"""
+        from core.bm25_stats import BM25CorpusStats
+        from core.bm25_vectorizer import BM25Vectorizer
+
+        corpus_stats = BM25CorpusStats()
+        vectorizer = BM25Vectorizer(corpus_stats=corpus_stats)
+        docs = ["izin usaha restoran", "izin usaha hotel", "izin tinggal"]
+        corpus_stats.add_documents(
+            "legal_unified",
+            [
+                (vectorizer.generate_sparse_vector(doc)["indices"], len(vectorizer.tokenize(doc)))
+                for doc in docs
+            ],
+        )
+        search_service._bm25_vectorizer = vectorizer
+
+        mock_query_router.route_query.return_value = {
+            "collection_name": "legal_updates",
+            "collections": ["legal_updates"],
+            "confidence": 1.0,
+            "is_pricing": False,
+        }
+        mock_client = mock_collection_manager.get_collection.return_value
+        mock_client.collection_name = "legal_unified"
+        mock_client.hybrid_search = AsyncMock(
+            return_value={"documents": [], "metadatas": [], "distances": [], "ids": []}
+        )
+
+        await search_service.hybrid_search(query="izin restoran", user_level=3, limit=5)
+
+        mock_collection_manager.get_collection.assert_called_with("legal_updates")
+        kwargs = mock_client.hybrid_search.await_args.kwargs
+        assert kwargs["query_sparse"] == vectorizer.generate_query_sparse_vector(
+            "izin restoran", collection="legal_unified"
+        )
+        assert kwargs["query_sparse"] != vectorizer.generate_query_sparse_vector("izin restoran")
+        assert kwargs["prefetch_limit"] == 10
+
     def test_cultural_insights_property(self, search_service, mock_cultural_insights):
         """Test that cultural_insights property exposes CulturalInsightsService"""
         assert search_service.cultural_insights is mock_cultural_insights
@@ -4,7 +4,7 @@ Target: 100% coverage
 """
 
 import json
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import numpy as np
 import pytest
@@ -164,13 +164,66 @@ class TestSemanticCache:
 
         mock_redis.zrange.return_value = [b"embedding:abc123"]
         mock_redis.get.side_effect = [
-            cached_embedding.tobytes(),  # First call: embedding
-            json.dumps({"result": "cached result"}),  # Second call: data
+            b"1",  # Index version (local index is stale)
+            json.dumps({"result": "cached result"}),  # Cached data for best match
         ]
+        mock_redis.mget = AsyncMock(return_value=[cached_embedding.tobytes()])
 
         result = await cache._find_similar_query(query_embedding)
 
         assert result is not None
+        # Embeddings are fetched in one MGET, never one GET per key
+        mock_redis.mget.assert_called_once_with(["embedding:abc123"])
+        mock_redis.get.assert_any_call("semantic_cache:abc123")
+
+    @pytest.mark.asyncio
+    async def test_find_similar_query_fresh_index_single_round_trip(self, cache, mock_redis):
+        """Test a lookup against an up-to-date local index costs one Redis call"""
+        cached_embedding = np.array([0.1, 0.2, 0.3], dtype=np.float32)
+        mock_redis.zrange.return_value = [b"embedding:abc123"]
+        mock_redis.mget = AsyncMock(return_value=[cached_embedding.tobytes()])
+        mock_redis.get.return_value = b"3"
+        await cache._refresh_index()
+        mock_redis.reset_mock()
+
+        # Hit: version + data in a single MGET
+        mock_redis.mget = AsyncMock(return_value=[b"3", json.dumps({"result": "cached"})])
+        result = await cache._find_similar_query(cached_embedding)
+        assert result["data"] == {"result": "cached"}
+        mock_redis.mget.assert_called_once_with(
+            ["semantic_cache:index_version", "semantic_cache:abc123"]
+        )
+        mock_redis.get.assert_not_called()
+        mock_redis.zrange.assert_not_called()
+
+        # Miss: only the version GET
+        mock_redis.reset_mock()
+        mock_redis.get.return_value = b"3"
+        result = await cache._find_similar_query(np.array([-0.3, 0.0, 0.1], dtype=np.float32))
+        assert result is None
+        mock_redis.get.assert_called_once_with("semantic_cache:index_version")
+        mock_redis.zrange.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cache_result_updates_local_index(self, cache, mock_redis):
+        """Test own writes are appended locally without reloading the index"""
+        mock_redis.zrange.return_value = []
+        mock_redis.get.return_value = b"3"
+        await cache._refresh_index()
+        mock_redis.incr = AsyncMock(return_value=4)  # No other writer in between
+        mock_redis.zcard.return_value = 1
+
+        embedding = np.array([0.0, 1.0, 0.0], dtype=np.float32)
+        assert await cache.cache_result("new query", embedding, {"answer": "x"})
+
+        assert cache._index_version == 4
+        keys, matrix = cache._index[3]
+        assert keys == [cache._get_embedding_key("new query")]
+        assert matrix.shape == (1, 3)
+
+        mock_redis.incr = AsyncMock(return_value=6)  # Another worker wrote meanwhile
+        await cache.cache_result("other query", embedding, {"answer": "y"})
+        assert cache._index_version is None  # Forces reload on next lookup
 
     @pytest.mark.asyncio
     async def test_find_similar_query_no_embeddings(self, cache, mock_redis):
@@ -189,7 +242,8 @@ class TestSemanticCache:
         query_embedding = np.array([0.1, 0.2, 0.3], dtype=np.float32)  # Different
 
         mock_redis.zrange.return_value = [b"embedding:abc123"]
-        mock_redis.get.return_value = cached_embedding.tobytes()
+        mock_redis.get.return_value = b"1"
+        mock_redis.mget = AsyncMock(return_value=[cached_embedding.tobytes()])
 
         result = await cache._find_similar_query(query_embedding)
 
@@ -199,7 +253,8 @@ class TestSemanticCache:
     async def test_find_similar_query_missing_embedding(self, cache, mock_redis):
         """Test handling missing cached embedding"""
         mock_redis.zrange.return_value = [b"embedding:abc123"]
-        mock_redis.get.return_value = None  # Embedding not found
+        mock_redis.get.return_value = b"1"
+        mock_redis.mget = AsyncMock(return_value=[None])  # Embedding expired
 
         query_embedding = np.array([0.1, 0.2, 0.3], dtype=np.float32)
         result = await cache._find_similar_query(query_embedding)
@@ -209,7 +264,7 @@ class TestSemanticCache:
     @pytest.mark.asyncio
     async def test_find_similar_query_exception(self, cache, mock_redis):
         """Test exception handling in find_similar"""
-        mock_redis.zrange.side_effect = Exception("Redis error")
+        mock_redis.get.side_effect = Exception("Redis error")
 
         query_embedding = np.array([0.1, 0.2, 0.3], dtype=np.float32)
         result = await cache._find_similar_query(query_embedding)
@@ -263,7 +318,7 @@ class TestSemanticCache:
 
     @pytest.mark.asyncio
     async def test_enforce_cache_size_over_limit(self, cache, mock_redis):
-        """Test cache size over limit - LRU eviction"""
+        """Test cache size over limit - LRU eviction in one pipelined batch"""
         mock_redis.zcard.return_value = 10005  # Over limit
         mock_redis.zrange.return_value = [
             b"embedding:old1",
@@ -272,11 +327,52 @@ class TestSemanticCache:
             b"embedding:old4",
             b"embedding:old5",
         ]
+        pipe = MagicMock()
+        pipe.execute = AsyncMock()
+        mock_redis.pipeline = MagicMock(return_value=pipe)
+
+        await cache._enforce_cache_size()
+
+        # Should delete oldest entries (embedding + result keys) in a single command
+        pipe.delete.assert_called_once()
+        assert len(pipe.delete.call_args.args) == 10
+        pipe.zrem.assert_called_once()
+        pipe.incr.assert_called_once_with("semantic_cache:index_version")
+        pipe.execute.assert_awaited_once()
+        mock_redis.delete.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_enforce_cache_size_updates_local_index(self, cache, mock_redis):
+        """Test evicted rows are dropped locally without reloading the index"""
+        mock_redis.zrange.return_value = [b"embedding:old", b"embedding:keep"]
+        mock_redis.mget.return_value = [
+            np.array([1.0, 0.0], dtype=np.float32).tobytes(),
+            np.array([0.0, 1.0], dtype=np.float32).tobytes(),
+        ]
+        mock_redis.get.return_value = b"7"
+        await cache._refresh_index()
+
+        cache.max_cache_size = 1
+        mock_redis.zcard.return_value = 2
+        mock_redis.zrange.reset_mock()
+        mock_redis.zrange.return_value = [b"embedding:old"]
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[2, 1, 8])  # No other writer in between
+        mock_redis.pipeline = MagicMock(return_value=pipe)
 
         await cache._enforce_cache_size()
 
-        # Should delete oldest entries
-        assert mock_redis.delete.call_count >= 5
+        assert cache._index_version == 8
+        keys, matrix = cache._index[2]
+        assert keys == ["embedding:keep"]
+        np.testing.assert_allclose(matrix, [[0.0, 1.0]])
+        mock_redis.zrange.assert_awaited_once()  # Only the eviction lookup, no reload
+
+        mock_redis.zcard.return_value = 2
+        mock_redis.zrange.return_value = [b"embedding:keep"]
+        pipe.execute = AsyncMock(return_value=[2, 1, 10])  # Another worker wrote meanwhile
+        await cache._enforce_cache_size()
+        assert cache._index_version is None  # Forces reload on next lookup
 
     @pytest.mark.asyncio
     async def test_enforce_cache_size_exception(self, cache, mock_redis):
@@ -293,9 +389,19 @@ class TestSemanticCache:
             "embedding:str_key",  # String key
             b"embedding:bytes_key",  # Bytes key
         ]
+        pipe = MagicMock()
+        pipe.execute = AsyncMock()
+        mock_redis.pipeline = MagicMock(return_value=pipe)
 
         await cache._enforce_cache_size()
 
+        pipe.delete.assert_called_once_with(
+            "embedding:str_key",
+            "embedding:bytes_key",
+            "semantic_cache:str_key",
+            "semantic_cache:bytes_key",
+        )
+
     @pytest.mark.asyncio
     async def test_get_cache_stats(self, cache, mock_redis):
         """Test getting cache statistics"""
@@ -5,7 +5,7 @@ Tests all methods and edge cases in semantic_cache.py.
 """
 
 import json
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import numpy as np
 import pytest
@@ -185,8 +185,9 @@ class TestFindSimilarQuery:
 
         # Create similar embedding
         cached_embedding = np.array([1.0, 2.0, 3.0], dtype=np.float32)
+        mock_redis.mget.return_value = [cached_embedding.tobytes()]
         mock_redis.get.side_effect = [
-            cached_embedding.tobytes(),
+            b"1",  # Index version
             json.dumps({"query": "similar", "result": {"data": "test"}}),
         ]
 
@@ -203,7 +204,8 @@ class TestFindSimilarQuery:
 
         # Create very different embedding
         cached_embedding = np.array([-1.0, -2.0, -3.0], dtype=np.float32)
-        mock_redis.get.return_value = cached_embedding.tobytes()
+        mock_redis.get.return_value = b"1"
+        mock_redis.mget.return_value = [cached_embedding.tobytes()]
 
         query_embedding = np.array([1.0, 2.0, 3.0], dtype=np.float32)
         result = await cache_service._find_similar_query(query_embedding)
@@ -214,7 +216,8 @@ class TestFindSimilarQuery:
     async def test_missing_embedding_skipped(self, cache_service, mock_redis):
         """Test missing embeddings are skipped"""
         mock_redis.zrange.return_value = [b"embedding:test1", b"embedding:test2"]
-        mock_redis.get.return_value = None  # Missing embedding
+        mock_redis.get.return_value = b"1"
+        mock_redis.mget.return_value = [None, None]  # Missing embeddings
 
         query_embedding = np.array([1.0, 2.0, 3.0], dtype=np.float32)
         result = await cache_service._find_similar_query(query_embedding)
@@ -302,14 +305,20 @@ class TestEnforceCacheSize:
         cache_service.max_cache_size = 100
         mock_redis.zcard.return_value = 110
         mock_redis.zrange.return_value = [b"embedding:key1", b"embedding:key2"]
-        mock_redis.delete = AsyncMock()
-        mock_redis.zrem = AsyncMock()
+        pipe = MagicMock()
+        pipe.execute = AsyncMock()
+        mock_redis.pipeline = MagicMock(return_value=pipe)
 
         await cache_service._enforce_cache_size()
 
         mock_redis.zrange.assert_called_once()
-        assert mock_redis.delete.call_count >= 2
-        assert mock_redis.zrem.call_count >= 1
+        pipe.delete.assert_called_once_with(
+            "embedding:key1", "embedding:key2", "semantic_cache:key1", "semantic_cache:key2"
+        )
+        pipe.zrem.assert_called_once_with(
+            "semantic_cache:index", "embedding:key1", "embedding:key2"
+        )
+        pipe.execute.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_eviction_error_handling(self, cache_service, mock_redis):
@@ -123,11 +123,25 @@ class TestGetSession:
 
         from app.routers.session import get_session
 
-        result = await get_session(session_id="session_123", service=mock_service)
+        result = await get_session(session_id="session_123", limit=None, service=mock_service)
 
         assert result["success"] is True
         assert result["session_id"] == "session_123"
         assert len(result["history"]) == 2
+        mock_service.get_history.assert_called_once_with("session_123", limit=None)
+
+    @pytest.mark.asyncio
+    async def test_get_session_last_n(self):
+        """Test the limit query parameter is passed as a range read"""
+        mock_service = MagicMock()
+        mock_service.get_history = AsyncMock(return_value=[{"role": "assistant", "content": "Hi!"}])
+
+        from app.routers.session import get_session
+
+        result = await get_session(session_id="session_123", limit=1, service=mock_service)
+
+        assert result["history"] == [{"role": "assistant", "content": "Hi!"}]
+        mock_service.get_history.assert_called_once_with("session_123", limit=1)
 
     @pytest.mark.asyncio
     async def test_get_session_not_found(self):
@@ -221,6 +235,71 @@ class TestUpdateSession:
         assert exc_info.value.status_code == 500
 
 
+# ============================================================================
+# Test Append Session Messages Endpoint
+# ============================================================================
+
+
+class TestAppendSessionMessages:
+    """Test suite for POST /api/sessions/{session_id}/messages"""
+
+    @pytest.mark.asyncio
+    async def test_append_messages_success(self):
+        """Test successful append"""
+        mock_service = MagicMock()
+        mock_service.append_messages = AsyncMock(return_value=True)
+
+        from app.routers.session import SessionAppendRequest, append_session_messages
+
+        request = SessionAppendRequest(messages=[{"role": "user", "content": "Test"}])
+        result = await append_session_messages(
+            session_id="session_123", request=request, service=mock_service
+        )
+
+        assert result["success"] is True
+        mock_service.append_messages.assert_called_once_with(
+            "session_123", [{"role": "user", "content": "Test"}]
+        )
+
+    @pytest.mark.asyncio
+    async def test_append_messages_failed(self):
+        """Test append failure"""
+        mock_service = MagicMock()
+        mock_service.append_messages = AsyncMock(return_value=False)
+
+        from fastapi import HTTPException
+
+        from app.routers.session import SessionAppendRequest, append_session_messages
+
+        request = SessionAppendRequest(messages=[])
+
+        with pytest.raises(HTTPException) as exc_info:
+            await append_session_messages(
+                session_id="session_123", request=request, service=mock_service
+            )
+
+        assert exc_info.value.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_append_messages_error(self):
+        """Test append error handling"""
+        mock_service = MagicMock()
+        mock_service.append_messages = AsyncMock(side_effect=Exception("Append error"))
+
+        from fastapi import HTTPException
+
+        from app.routers.session import SessionAppendRequest, append_session_messages
+
+        request = SessionAppendRequest(messages=[])
+
+        with pytest.raises(HTTPException) as exc_info:
+            await append_session_messages(
+                session_id="session_123", request=request, service=mock_service
+            )
+
+        assert exc_info.value.status_code == 500
+
+
 # ============================================================================
 # Test Update Session with TTL Endpoint
 # ============================================================================
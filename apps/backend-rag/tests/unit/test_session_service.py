@@ -4,7 +4,7 @@ Target: 100% coverage
 """
 
 import json
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -24,6 +24,7 @@ class TestSessionService:
         mock.ttl = AsyncMock()
         mock.scan_iter = AsyncMock()
         mock.close = AsyncMock()
+        mock.pipeline = MagicMock(return_value=MagicMock(execute=AsyncMock(return_value=[])))
         return mock
 
     @pytest.fixture
@@ -81,12 +82,12 @@ class TestSessionService:
 
         assert session_id is not None
         assert len(session_id) == 36  # UUID format
-        mock_redis.setex.assert_called_once()
+        mock_redis.pipeline.return_value.execute.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_create_session_failure(self, service, mock_redis):
         """Test session creation failure"""
-        mock_redis.setex.side_effect = Exception("Redis error")
+        mock_redis.pipeline.return_value.execute.side_effect = Exception("Redis error")
 
         with pytest.raises(Exception):
             await service.create_session()
@@ -94,9 +95,16 @@ class TestSessionService:
     @pytest.mark.asyncio
     async def test_get_history_success(self, service, mock_redis):
         """Test getting session history"""
-        mock_redis.get.return_value = json.dumps(
-            [{"role": "user", "content": "Hello"}, {"role": "assistant", "content": "Hi!"}]
-        )
+        mock_redis.pipeline.return_value.execute.return_value = [
+            1,
+            [
+                json.dumps(msg)
+                for msg in (
+                    {"role": "user", "content": "Hello"},
+                    {"role": "assistant", "content": "Hi!"},
+                )
+            ],
+        ]
 
         history = await service.get_history("session123")
 
@@ -107,7 +115,7 @@ class TestSessionService:
     @pytest.mark.asyncio
     async def test_get_history_not_found(self, service, mock_redis):
         """Test getting non-existent session history"""
-        mock_redis.get.return_value = None
+        mock_redis.pipeline.return_value.execute.return_value = [0, []]
 
         history = await service.get_history("nonexistent")
 
@@ -116,7 +124,7 @@ class TestSessionService:
     @pytest.mark.asyncio
     async def test_get_history_invalid_json(self, service, mock_redis):
         """Test getting history with invalid JSON"""
-        mock_redis.get.return_value = "invalid json {"
+        mock_redis.pipeline.return_value.execute.return_value = [1, ["invalid json {"]]
 
         history = await service.get_history("session123")
 
@@ -125,7 +133,7 @@ class TestSessionService:
     @pytest.mark.asyncio
     async def test_get_history_exception(self, service, mock_redis):
         """Test getting history with exception"""
-        mock_redis.get.side_effect = Exception("Redis error")
+        mock_redis.pipeline.return_value.execute.side_effect = Exception("Redis error")
 
         history = await service.get_history("session123")
 
@@ -135,11 +143,13 @@ class TestSessionService:
     async def test_update_history_success(self, service, mock_redis):
         """Test updating session history"""
         history = [{"role": "user", "content": "Test"}]
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute.side_effect = [[0, None], []]
 
         result = await service.update_history("session123", history)
 
         assert result is True
-        mock_redis.setex.assert_called_once()
+        pipe.rpush.assert_called_once_with("session:session123", json.dumps(history[0]))
 
     @pytest.mark.asyncio
     async def test_update_history_invalid_format(self, service, mock_redis):
@@ -151,7 +161,7 @@ class TestSessionService:
     @pytest.mark.asyncio
     async def test_update_history_exception(self, service, mock_redis):
         """Test updating history with exception"""
-        mock_redis.setex.side_effect = Exception("Redis error")
+        mock_redis.pipeline.return_value.execute.side_effect = Exception("Redis error")
 
         result = await service.update_history("session123", [])
 
@@ -187,7 +197,7 @@ class TestSessionService:
     @pytest.mark.asyncio
     async def test_extend_ttl_success(self, service, mock_redis):
         """Test extending session TTL"""
-        mock_redis.expire.return_value = True
+        mock_redis.pipeline.return_value.execute.return_value = [True, True]
 
         result = await service.extend_ttl("session123")
 
@@ -196,7 +206,7 @@ class TestSessionService:
     @pytest.mark.asyncio
     async def test_extend_ttl_failure(self, service, mock_redis):
         """Test extending TTL for non-existent session"""
-        mock_redis.expire.return_value = False
+        mock_redis.pipeline.return_value.execute.return_value = [False, False]
 
         result = await service.extend_ttl("nonexistent")
 
@@ -205,7 +215,7 @@ class TestSessionService:
     @pytest.mark.asyncio
     async def test_extend_ttl_exception(self, service, mock_redis):
         """Test extending TTL with exception"""
-        mock_redis.expire.side_effect = Exception("Redis error")
+        mock_redis.pipeline.return_value.execute.side_effect = Exception("Redis error")
 
         result = await service.extend_ttl("session123")
 
@@ -214,8 +224,7 @@ class TestSessionService:
     @pytest.mark.asyncio
     async def test_get_session_info_success(self, service, mock_redis):
         """Test getting session info"""
-        mock_redis.ttl.return_value = 3600
-        mock_redis.get.return_value = json.dumps([{"role": "user", "content": "Test"}])
+        mock_redis.pipeline.return_value.execute.return_value = [3600, {"message_count": "1"}]
 
         info = await service.get_session_info("session123")
 
@@ -228,7 +237,8 @@ class TestSessionService:
     @pytest.mark.asyncio
     async def test_get_session_info_not_found(self, service, mock_redis):
         """Test getting info for non-existent session"""
-        mock_redis.ttl.return_value = -2  # Key doesn't exist
+        mock_redis.pipeline.return_value.execute.return_value = [-2, {}]  # Key doesn't exist
+        mock_redis.get.return_value = None
 
         info = await service.get_session_info("nonexistent")
 
@@ -237,7 +247,7 @@ class TestSessionService:
     @pytest.mark.asyncio
     async def test_get_session_info_no_data(self, service, mock_redis):
         """Test getting info when data is missing"""
-        mock_redis.ttl.return_value = 3600
+        mock_redis.pipeline.return_value.execute.return_value = [3600, {}]
         mock_redis.get.return_value = None
 
         info = await service.get_session_info("session123")
@@ -247,7 +257,7 @@ class TestSessionService:
     @pytest.mark.asyncio
     async def test_get_session_info_exception(self, service, mock_redis):
         """Test getting info with exception"""
-        mock_redis.ttl.side_effect = Exception("Redis error")
+        mock_redis.pipeline.return_value.execute.side_effect = Exception("Redis error")
 
         info = await service.get_session_info("session123")
 
@@ -264,15 +274,15 @@ class TestSessionService:
     async def test_get_analytics_success(self, service, mock_redis):
         """Test getting session analytics"""
 
-        async def mock_scan_iter(pattern):
-            for key in ["session:1", "session:2", "session:3"]:
+        async def mock_scan_iter(*args, **kwargs):
+            for key in ["session_meta:1", "session_meta:2", "session_meta:3"]:
                 yield key
 
         mock_redis.scan_iter = mock_scan_iter
-        mock_redis.get.side_effect = [
-            json.dumps([{"role": "user"}] * 5),  # 5 messages
-            json.dumps([{"role": "user"}] * 15),  # 15 messages
-            json.dumps([{"role": "user"}] * 55),  # 55 messages
+        mock_redis.pipeline.return_value.execute.return_value = [
+            "5",  # 5 messages
+            "15",  # 15 messages
+            "55",  # 55 messages
         ]
 
         analytics = await service.get_analytics()
@@ -286,7 +296,7 @@ class TestSessionService:
     async def test_get_analytics_empty(self, service, mock_redis):
         """Test getting analytics with no sessions"""
 
-        async def mock_scan_iter(pattern):
+        async def mock_scan_iter(*args, **kwargs):
             return
             yield  # Empty async generator
 
@@ -300,7 +310,7 @@ class TestSessionService:
     async def test_get_analytics_exception(self, service, mock_redis):
         """Test getting analytics with exception"""
 
-        async def mock_scan_iter(pattern):
+        async def mock_scan_iter(*args, **kwargs):
             raise Exception("Redis error")
             yield
 
@@ -311,37 +321,37 @@ class TestSessionService:
         assert "error" in analytics
 
     @pytest.mark.asyncio
-    async def test_get_analytics_invalid_json(self, service, mock_redis):
-        """Test analytics with invalid JSON in some sessions"""
+    async def test_get_analytics_expired_session(self, service, mock_redis):
+        """Test analytics skips sessions that expired after the scan"""
 
-        async def mock_scan_iter(pattern):
-            for key in ["session:1", "session:2"]:
+        async def mock_scan_iter(*args, **kwargs):
+            for key in ["session_meta:1", "session_meta:2"]:
                 yield key
 
         mock_redis.scan_iter = mock_scan_iter
-        mock_redis.get.side_effect = [
-            "invalid json",  # Invalid
-            json.dumps([{"role": "user"}] * 5),  # Valid
+        mock_redis.pipeline.return_value.execute.return_value = [
+            None,  # Expired
+            "5",
         ]
 
         analytics = await service.get_analytics()
 
-        # Should handle invalid JSON gracefully
-        assert analytics["total_sessions"] == 2
+        assert analytics["total_sessions"] == 1
+        assert analytics["top_session"] == {"id": "2", "messages": 5}
 
     @pytest.mark.asyncio
     async def test_get_analytics_with_top_session(self, service, mock_redis):
         """Test analytics correctly identifies top session"""
 
-        async def mock_scan_iter(pattern):
-            for key in ["session:1", "session:2", "session:3"]:
+        async def mock_scan_iter(*args, **kwargs):
+            for key in ["session_meta:1", "session_meta:2", "session_meta:3"]:
                 yield key
 
         mock_redis.scan_iter = mock_scan_iter
-        mock_redis.get.side_effect = [
-            json.dumps([{"role": "user"}] * 5),  # 5 messages
-            json.dumps([{"role": "user"}] * 25),  # 25 messages (top)
-            json.dumps([{"role": "user"}] * 10),  # 10 messages
+        mock_redis.pipeline.return_value.execute.return_value = [
+            "5",  # 5 messages
+            "25",  # 25 messages (top)
+            "10",  # 10 messages
         ]
 
         analytics = await service.get_analytics()
@@ -354,17 +364,17 @@ class TestSessionService:
     async def test_get_analytics_sessions_by_range(self, service, mock_redis):
         """Test analytics categorizes sessions by message count ranges"""
 
-        async def mock_scan_iter(pattern):
-            for key in ["session:1", "session:2", "session:3", "session:4", "session:5"]:
+        async def mock_scan_iter(*args, **kwargs):
+            for key in [f"session_meta:{i}" for i in range(1, 6)]:
                 yield key
 
         mock_redis.scan_iter = mock_scan_iter
-        mock_redis.get.side_effect = [
-            json.dumps([{"role": "user"}] * 5),  # 0-10 range
-            json.dumps([{"role": "user"}] * 15),  # 11-20 range
-            json.dumps([{"role": "user"}] * 30),  # 21-50 range
-            json.dumps([{"role": "user"}] * 60),  # 51+ range
-            json.dumps([{"role": "user"}] * 8),  # 0-10 range
+        mock_redis.pipeline.return_value.execute.return_value = [
+            "5",  # 0-10 range
+            "15",  # 11-20 range
+            "30",  # 21-50 range
+            "60",  # 51+ range
+            "8",  # 0-10 range
         ]
 
         analytics = await service.get_analytics()
@@ -378,14 +388,14 @@ class TestSessionService:
     async def test_get_analytics_top_session_none(self, service, mock_redis):
         """Test analytics when no sessions have messages (top_session is None)"""
 
-        async def mock_scan_iter(pattern):
-            for key in ["session:1", "session:2"]:
+        async def mock_scan_iter(*args, **kwargs):
+            for key in ["session_meta:1", "session_meta:2"]:
                 yield key
 
         mock_redis.scan_iter = mock_scan_iter
-        mock_redis.get.side_effect = [
-            json.dumps([]),  # Empty session
-            json.dumps([]),  # Empty session
+        mock_redis.pipeline.return_value.execute.return_value = [
+            "0",  # Empty session
+            "0",  # Empty session
         ]
 
         analytics = await service.get_analytics()
@@ -398,7 +408,7 @@ class TestSessionService:
     async def test_get_analytics_empty_message_counts(self, service, mock_redis):
         """Test analytics with empty message_counts list"""
 
-        async def mock_scan_iter(pattern):
+        async def mock_scan_iter(*args, **kwargs):
             return
             yield  # Empty generator
 
@@ -413,6 +423,7 @@ class TestSessionService:
     async def test_update_history_with_ttl_success(self, service, mock_redis):
         """Test updating history with custom TTL"""
         history = [{"role": "user", "content": "Test"}]
+        mock_redis.pipeline.return_value.execute.side_effect = [[0, None], []]
 
         result = await service.update_history_with_ttl("session123", history, ttl_hours=48)
 
@@ -422,6 +433,7 @@ class TestSessionService:
     async def test_update_history_with_ttl_default(self, service, mock_redis):
         """Test updating history with default TTL"""
         history = [{"role": "user", "content": "Test"}]
+        mock_redis.pipeline.return_value.execute.side_effect = [[0, None], []]
 
         result = await service.update_history_with_ttl("session123", history)
 
@@ -437,7 +449,7 @@ class TestSessionService:
     @pytest.mark.asyncio
     async def test_update_history_with_ttl_exception(self, service, mock_redis):
         """Test updating with exception"""
-        mock_redis.setex.side_effect = Exception("Redis error")
+        mock_redis.pipeline.return_value.execute.side_effect = Exception("Redis error")
 
         result = await service.update_history_with_ttl("session123", [])
 
@@ -446,7 +458,7 @@ class TestSessionService:
     @pytest.mark.asyncio
     async def test_extend_ttl_custom_success(self, service, mock_redis):
         """Test extending TTL with custom duration"""
-        mock_redis.expire.return_value = True
+        mock_redis.pipeline.return_value.execute.return_value = [True, True]
 
         result = await service.extend_ttl_custom("session123", 72)
 
@@ -455,7 +467,7 @@ class TestSessionService:
     @pytest.mark.asyncio
     async def test_extend_ttl_custom_exception(self, service, mock_redis):
         """Test extending custom TTL with exception"""
-        mock_redis.expire.side_effect = Exception("Redis error")
+        mock_redis.pipeline.return_value.execute.side_effect = Exception("Redis error")
 
         result = await service.extend_ttl_custom("session123", 72)
 
@@ -464,9 +476,16 @@ class TestSessionService:
     @pytest.mark.asyncio
     async def test_export_session_json(self, service, mock_redis):
         """Test exporting session as JSON"""
-        mock_redis.get.return_value = json.dumps(
-            [{"role": "user", "content": "Hello"}, {"role": "assistant", "content": "Hi!"}]
-        )
+        mock_redis.pipeline.return_value.execute.return_value = [
+            1,
+            [
+                json.dumps(msg)
+                for msg in (
+                    {"role": "user", "content": "Hello"},
+                    {"role": "assistant", "content": "Hi!"},
+                )
+            ],
+        ]
 
         export = await service.export_session("session123", format="json")
 
@@ -478,9 +497,16 @@ class TestSessionService:
     @pytest.mark.asyncio
     async def test_export_session_markdown(self, service, mock_redis):
         """Test exporting session as Markdown"""
-        mock_redis.get.return_value = json.dumps(
-            [{"role": "user", "content": "Hello"}, {"role": "assistant", "content": "Hi!"}]
-        )
+        mock_redis.pipeline.return_value.execute.return_value = [
+            1,
+            [
+                json.dumps(msg)
+                for msg in (
+                    {"role": "user", "content": "Hello"},
+                    {"role": "assistant", "content": "Hi!"},
+                )
+            ],
+        ]
 
         export = await service.export_session("session123", format="markdown")
 
@@ -492,7 +518,7 @@ class TestSessionService:
     @pytest.mark.asyncio
     async def test_export_session_not_found(self, service, mock_redis):
         """Test exporting non-existent session"""
-        mock_redis.get.return_value = None
+        mock_redis.pipeline.return_value.execute.return_value = [0, []]
 
         export = await service.export_session("nonexistent")
 
@@ -501,7 +527,7 @@ class TestSessionService:
     @pytest.mark.asyncio
     async def test_export_session_exception(self, service, mock_redis):
         """Test exporting with exception"""
-        mock_redis.get.side_effect = Exception("Redis error")
+        mock_redis.pipeline.return_value.execute.side_effect = Exception("Redis error")
 
         export = await service.export_session("session123")
 
@@ -510,9 +536,16 @@ class TestSessionService:
     @pytest.mark.asyncio
     async def test_export_session_unknown_role(self, service, mock_redis):
         """Test exporting session with unknown role"""
-        mock_redis.get.return_value = json.dumps(
-            [{"role": "unknown", "content": "Test"}, {"role": "user", "content": "Hello"}]
-        )
+        mock_redis.pipeline.return_value.execute.return_value = [
+            1,
+            [
+                json.dumps(msg)
+                for msg in (
+                    {"role": "unknown", "content": "Test"},
+                    {"role": "user", "content": "Hello"},
+                )
+            ],
+        ]
 
         export = await service.export_session("session123", format="markdown")
 
@@ -6,7 +6,7 @@ Tests all methods and edge cases in session_service.py.
 
 import json
 from datetime import timedelta
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -23,6 +23,7 @@ def session_service():
     """Create SessionService instance with mocked Redis"""
     with patch("services.session_service.redis") as mock_redis_module:
         mock_client = AsyncMock()
+        mock_client.pipeline = MagicMock(return_value=MagicMock(execute=AsyncMock(return_value=[])))
         mock_redis_module.from_url.return_value = mock_client
 
         from services.session_service import SessionService
@@ -87,18 +88,16 @@ class TestCreateSession:
     @pytest.mark.asyncio
     async def test_create_session_success(self, session_service):
         """Test successful session creation"""
-        session_service.redis.setex = AsyncMock()
-
         session_id = await session_service.create_session()
 
         assert session_id is not None
         assert len(session_id) == 36  # UUID format
-        session_service.redis.setex.assert_called_once()
+        session_service.redis.pipeline.return_value.execute.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_create_session_failure(self, session_service):
         """Test session creation failure"""
-        session_service.redis.setex.side_effect = Exception("Redis error")
+        session_service.redis.pipeline.return_value.execute.side_effect = Exception("Redis error")
 
         with pytest.raises(Exception, match="Redis error"):
             await session_service.create_session()
@@ -111,7 +110,10 @@ class TestGetHistory:
     async def test_get_history_success(self, session_service):
         """Test successful history retrieval"""
         history = [{"role": "user", "content": "Hello"}, {"role": "assistant", "content": "Hi!"}]
-        session_service.redis.get.return_value = json.dumps(history)
+        session_service.redis.pipeline.return_value.execute.return_value = [
+            1,
+            [json.dumps(msg) for msg in history],
+        ]
 
         result = await session_service.get_history("test-session-id")
 
@@ -121,7 +123,7 @@ class TestGetHistory:
     @pytest.mark.asyncio
     async def test_get_history_not_found(self, session_service):
         """Test history not found"""
-        session_service.redis.get.return_value = None
+        session_service.redis.pipeline.return_value.execute.return_value = [0, []]
 
         result = await session_service.get_history("nonexistent-session")
 
@@ -130,7 +132,7 @@ class TestGetHistory:
     @pytest.mark.asyncio
     async def test_get_history_json_error(self, session_service):
         """Test history with invalid JSON"""
-        session_service.redis.get.return_value = "invalid json {"
+        session_service.redis.pipeline.return_value.execute.return_value = [1, ["invalid json {"]]
 
         result = await session_service.get_history("test-session")
 
@@ -139,7 +141,7 @@ class TestGetHistory:
     @pytest.mark.asyncio
     async def test_get_history_redis_error(self, session_service):
         """Test history retrieval with Redis error"""
-        session_service.redis.get.side_effect = Exception("Redis error")
+        session_service.redis.pipeline.return_value.execute.side_effect = Exception("Redis error")
 
         result = await session_service.get_history("test-session")
 
@@ -152,13 +154,15 @@ class TestUpdateHistory:
     @pytest.mark.asyncio
     async def test_update_history_success(self, session_service):
         """Test successful history update"""
-        session_service.redis.setex = AsyncMock()
+        session_service.redis.pipeline.return_value.execute.side_effect = [[0, None], []]
         history = [{"role": "user", "content": "Test"}]
 
         result = await session_service.update_history("test-session", history)
 
         assert result is True
-        session_service.redis.setex.assert_called_once()
+        session_service.redis.pipeline.return_value.rpush.assert_called_once_with(
+            "session:test-session", json.dumps(history[0])
+        )
 
     @pytest.mark.asyncio
     async def test_update_history_invalid_format(self, session_service):
@@ -170,7 +174,7 @@ class TestUpdateHistory:
     @pytest.mark.asyncio
     async def test_update_history_redis_error(self, session_service):
         """Test update with Redis error"""
-        session_service.redis.setex.side_effect = Exception("Redis error")
+        session_service.redis.pipeline.return_value.execute.side_effect = Exception("Redis error")
 
         result = await session_service.update_history("test-session", [])
 
@@ -214,7 +218,7 @@ class TestExtendTTL:
     @pytest.mark.asyncio
     async def test_extend_ttl_success(self, session_service):
         """Test successful TTL extension"""
-        session_service.redis.expire.return_value = True
+        session_service.redis.pipeline.return_value.execute.return_value = [True, True]
 
         result = await session_service.extend_ttl("test-session")
 
@@ -223,7 +227,7 @@ class TestExtendTTL:
     @pytest.mark.asyncio
     async def test_extend_ttl_not_found(self, session_service):
         """Test TTL extension for nonexistent session"""
-        session_service.redis.expire.return_value = False
+        session_service.redis.pipeline.return_value.execute.return_value = [False, False]
 
         result = await session_service.extend_ttl("nonexistent")
 
@@ -232,7 +236,7 @@ class TestExtendTTL:
     @pytest.mark.asyncio
     async def test_extend_ttl_error(self, session_service):
         """Test TTL extension with error"""
-        session_service.redis.expire.side_effect = Exception("Redis error")
+        session_service.redis.pipeline.return_value.execute.side_effect = Exception("Redis error")
 
         result = await session_service.extend_ttl("test-session")
 
@@ -245,8 +249,10 @@ class TestGetSessionInfo:
     @pytest.mark.asyncio
     async def test_get_session_info_success(self, session_service):
         """Test successful session info retrieval"""
-        session_service.redis.ttl.return_value = 3600
-        session_service.redis.get.return_value = json.dumps([{"role": "user", "content": "Hello"}])
+        session_service.redis.pipeline.return_value.execute.return_value = [
+            3600,
+            {"message_count": "1"},
+        ]
 
         result = await session_service.get_session_info("test-session")
 
@@ -258,7 +264,11 @@ class TestGetSessionInfo:
     @pytest.mark.asyncio
     async def test_get_session_info_not_found(self, session_service):
         """Test session info for nonexistent session"""
-        session_service.redis.ttl.return_value = -2  # Key doesn't exist
+        session_service.redis.pipeline.return_value.execute.return_value = [
+            -2,
+            {},
+        ]  # Key doesn't exist
+        session_service.redis.get.return_value = None
 
         result = await session_service.get_session_info("nonexistent")
 
@@ -267,7 +277,7 @@ class TestGetSessionInfo:
     @pytest.mark.asyncio
     async def test_get_session_info_no_data(self, session_service):
         """Test session info with no data"""
-        session_service.redis.ttl.return_value = 3600
+        session_service.redis.pipeline.return_value.execute.return_value = [3600, {}]
         session_service.redis.get.return_value = None
 
         result = await session_service.get_session_info("test-session")
@@ -277,7 +287,7 @@ class TestGetSessionInfo:
     @pytest.mark.asyncio
     async def test_get_session_info_error(self, session_service):
         """Test session info with error"""
-        session_service.redis.ttl.side_effect = Exception("Redis error")
+        session_service.redis.pipeline.return_value.execute.side_effect = Exception("Redis error")
 
         result = await session_service.get_session_info("test-session")
 
@@ -302,16 +312,16 @@ class TestGetAnalytics:
     async def test_get_analytics_success(self, session_service):
         """Test successful analytics retrieval"""
 
-        async def mock_scan_iter(pattern):
-            for key in ["session:1", "session:2", "session:3"]:
+        async def mock_scan_iter(*args, **kwargs):
+            for key in ["session_meta:1", "session_meta:2", "session_meta:3"]:
                 yield key
 
         session_service.redis.scan_iter = mock_scan_iter
-        session_service.redis.get.side_effect = [
-            json.dumps([{"role": "user", "content": "Hi"}] * 5),  # 5 messages
-            json.dumps([{"role": "user", "content": "Hi"}] * 15),  # 15 messages
-            json.dumps([{"role": "user", "content": "Hi"}] * 55),  # 55 messages
-        ]
+        session_service.redis.pipeline.return_value.execute.return_value = [
+            "5",
+            "15",
+            "55",
+        ]  # message_count counters
 
         result = await session_service.get_analytics()
 
@@ -325,7 +335,7 @@ class TestGetAnalytics:
     async def test_get_analytics_empty(self, session_service):
         """Test analytics with no sessions"""
 
-        async def mock_scan_iter(pattern):
+        async def mock_scan_iter(*args, **kwargs):
             return
             yield  # Empty generator
 
@@ -337,25 +347,27 @@ class TestGetAnalytics:
         assert result["active_sessions"] == 0
 
     @pytest.mark.asyncio
-    async def test_get_analytics_json_error(self, session_service):
-        """Test analytics with JSON parse error"""
+    async def test_get_analytics_never_decodes_history(self, session_service):
+        """Test analytics reads only the counters hash"""
 
-        async def mock_scan_iter(pattern):
-            yield "session:1"
+        async def mock_scan_iter(*args, **kwargs):
+            yield "session_meta:1"
 
         session_service.redis.scan_iter = mock_scan_iter
-        session_service.redis.get.return_value = "invalid json"
+        session_service.redis.pipeline.return_value.execute.return_value = ["0"]
 
         result = await session_service.get_analytics()
 
-        # Should handle gracefully
         assert result["total_sessions"] == 1
+        assert result["active_sessions"] == 0
+        session_service.redis.get.assert_not_called()
+        session_service.redis.lrange.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_get_analytics_error(self, session_service):
         """Test analytics with error"""
 
-        async def mock_scan_iter(pattern):
+        async def mock_scan_iter(*args, **kwargs):
             raise Exception("Redis error")
             yield
 
@@ -372,20 +384,21 @@ class TestUpdateHistoryWithTTL:
     @pytest.mark.asyncio
     async def test_update_with_custom_ttl(self, session_service):
         """Test update with custom TTL"""
-        session_service.redis.setex = AsyncMock()
+        session_service.redis.pipeline.return_value.execute.side_effect = [[0, None], []]
 
         result = await session_service.update_history_with_ttl(
             "test-session", [{"role": "user", "content": "Hi"}], ttl_hours=48
         )
 
         assert result is True
-        call_args = session_service.redis.setex.call_args
-        assert call_args[0][1] == timedelta(hours=48)
+        session_service.redis.pipeline.return_value.expire.assert_any_call(
+            "session:test-session", timedelta(hours=48)
+        )
 
     @pytest.mark.asyncio
     async def test_update_with_default_ttl(self, session_service):
         """Test update with default TTL"""
-        session_service.redis.setex = AsyncMock()
+        session_service.redis.pipeline.return_value.execute.side_effect = [[0, None], []]
 
         result = await session_service.update_history_with_ttl(
             "test-session", [{"role": "user", "content": "Hi"}]
@@ -403,7 +416,7 @@ class TestUpdateHistoryWithTTL:
     @pytest.mark.asyncio
     async def test_update_with_ttl_error(self, session_service):
         """Test update with error"""
-        session_service.redis.setex.side_effect = Exception("Redis error")
+        session_service.redis.pipeline.return_value.execute.side_effect = Exception("Redis error")
 
         result = await session_service.update_history_with_ttl("test-session", [])
 
@@ -416,7 +429,7 @@ class TestExtendTTLCustom:
     @pytest.mark.asyncio
     async def test_extend_custom_success(self, session_service):
         """Test successful custom TTL extension"""
-        session_service.redis.expire.return_value = True
+        session_service.redis.pipeline.return_value.execute.return_value = [True, True]
 
         result = await session_service.extend_ttl_custom("test-session", 48)
 
@@ -425,7 +438,7 @@ class TestExtendTTLCustom:
     @pytest.mark.asyncio
     async def test_extend_custom_failure(self, session_service):
         """Test custom TTL extension failure"""
-        session_service.redis.expire.side_effect = Exception("Redis error")
+        session_service.redis.pipeline.return_value.execute.side_effect = Exception("Redis error")
 
         result = await session_service.extend_ttl_custom("test-session", 48)
 